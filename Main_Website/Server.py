@@ -1,12 +1,16 @@
 import sys
-sys.path.append("C:/Code/Provably_Audited/Stake_Plinko")
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Stake_Plinko"))
 from flask import Flask, request, jsonify, send_file, Response
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
-import os
 import json
 import tempfile
-from Plinko_Simulation import seeds_to_results, sha256_encrypt
+from Provably_Fair import sha256_encrypt
+from Provably_Fair.Outcome_Stream import iterate_outcomes,stream_outcomes
+from Provably_Fair.Plinko_Engine import Plinko_Engine
+from Plinko_Simulation import BLOCK_SIZE
 from Multipliers import plinko_multipliers
 from numpy import mean,median,quantile
 
@@ -53,9 +57,14 @@ def run_plinko_simulation():
             "losing_streak_sizes":[]
         }
         
-        # Process each nonce
-        for nonce in nonces:
-            prize_index, multiplier = seeds_to_results(server, client, nonce, risk, rows)
+        # Decode a block of nonces at a time, leaving only lookups by prize index for each game
+        engine = Plinko_Engine(plinko_multipliers[f"{risk}{rows}"])
+        games = []
+        for low in range(nonces.start, nonces.stop, BLOCK_SIZE):
+            high = min(low + BLOCK_SIZE, nonces.stop) - 1
+            prize_indexes, multipliers = engine.play(server, client, low, high)
+            games.extend(zip(range(low, high + 1), prize_indexes.tolist(), multipliers.tolist()))
+        for nonce, prize_index, multiplier in games:
             results.append({
                 "nonce": nonce,
                 "prize index": prize_index,
@@ -156,55 +165,46 @@ def run_plinko_simulation_progress():
                 "losing_streak_sizes":[]
             }
             
-            last_update = 0
-            # Process each nonce
-            for i, nonce in enumerate(range(nonce_start, nonce_end + 1)):
-                prize_index, multiplier = seeds_to_results(server_seed, client_seed, nonce, risk, rows)
-                results.append({
-                    "nonce": nonce,
-                    "prize index": prize_index,
-                    "multiplier": multiplier,
-                    "payout": f"${bet_size*multiplier:,.2f}"
-                })
-                stats["money_won"] += bet_size * multiplier
-                
-                if multiplier >= 1:
-                    stats["total_wins"] += 1
-                    stats["current_win_streak"] += 1
-                    if(stats["current_loss_streak"] > 0):
-                        stats['losing_streak_sizes'].append(stats["current_loss_streak"])
-                    stats["current_loss_streak"] = 0
-                    if stats["current_win_streak"] > stats["biggest_win_streak"]:
-                        stats["biggest_win_streak"] = stats["current_win_streak"]
-                else:
-                    stats["total_losses"] += 1
-                    stats["current_loss_streak"] += 1
-                    if(stats["current_win_streak"] > 0):
-                        stats['winning_streak_sizes'].append(stats["current_win_streak"])
-                    stats["current_win_streak"] = 0
-                    if stats["current_loss_streak"] > stats["biggest_loss_streak"]:
-                        stats["biggest_loss_streak"] = stats["current_loss_streak"]
-                
-                # Track top multipliers
-                if prize_index in [0, rows + 1]:
-                    stats["top_multipliers"].append(str(nonce))
-                elif prize_index in [1, rows]:
-                    stats["second_multipliers"].append(str(nonce))
-                elif prize_index in [2, rows - 1]:
-                    stats["third_multipliers"].append(str(nonce))
-                
-                # Calculate current progress percentage
-                current_progress = (i + 1) / total_nonces * 100
+            # One block per progress update: hashing runs on the stream's executor while this
+            # generator only walks decoded prize indexes, and the stream never runs far ahead of the client
+            block_size = 1 if total_nonces < 1000 else point_one_percent
+            engine = Plinko_Engine(plinko_multipliers[f"{risk}{rows}"])
+            for block in iterate_outcomes(stream_outcomes("Plinko", server_seed, client_seed, nonce_start, nonce_end, block_size=block_size, rows=rows)):
+                for nonce, prize_index, multiplier in zip(block["nonces"].tolist(), block["outcomes"].tolist(), engine.multipliers[block["outcomes"]].tolist()):
+                    results.append({
+                        "nonce": nonce,
+                        "prize index": prize_index,
+                        "multiplier": multiplier,
+                        "payout": f"${bet_size*multiplier:,.2f}"
+                    })
+                    stats["money_won"] += bet_size * multiplier
+                    
+                    if multiplier >= 1:
+                        stats["total_wins"] += 1
+                        stats["current_win_streak"] += 1
+                        if(stats["current_loss_streak"] > 0):
+                            stats['losing_streak_sizes'].append(stats["current_loss_streak"])
+                        stats["current_loss_streak"] = 0
+                        if stats["current_win_streak"] > stats["biggest_win_streak"]:
+                            stats["biggest_win_streak"] = stats["current_win_streak"]
+                    else:
+                        stats["total_losses"] += 1
+                        stats["current_loss_streak"] += 1
+                        if(stats["current_win_streak"] > 0):
+                            stats['winning_streak_sizes'].append(stats["current_win_streak"])
+                        stats["current_win_streak"] = 0
+                        if stats["current_loss_streak"] > stats["biggest_loss_streak"]:
+                            stats["biggest_loss_streak"] = stats["current_loss_streak"]
+                    
+                    # Track top multipliers
+                    if prize_index in [0, rows + 1]:
+                        stats["top_multipliers"].append(str(nonce))
+                    elif prize_index in [1, rows]:
+                        stats["second_multipliers"].append(str(nonce))
+                    elif prize_index in [2, rows - 1]:
+                        stats["third_multipliers"].append(str(nonce))
                 
-                # Send progress update if:
-                # 1. We've completed at least 0.1% more since last update OR
-                # 2. This is the last nonce OR
-                # 3. We're processing a small number of nonces (<1000)
-                if (current_progress - last_update >= 0.1 or 
-                    i == total_nonces - 1 or 
-                    total_nonces < 1000):
-                    yield f"data: {json.dumps({'progress': {'current': i + 1, 'total': total_nonces}})}\n\n"
-                    last_update = current_progress
+                yield f"data: {json.dumps({'progress': block['progress']})}\n\n"
             
             # Prepare final response
             response = {
@@ -0,0 +1,61 @@
+import numpy as np
+from .Byte_Cursor import DIGEST_SIZE,TWO_POW_32,WORDS_PER_ROUND
+from .Seed_Hasher import get_seed_hasher
+
+def seeds_to_digest_matrix(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,rounds:int=1) -> np.ndarray:
+    """
+    Hashes a block of nonces into one digest row per nonce.
+
+    Args:
+        server_seed: Unhashed server seed.
+        client_seed: Client seed.
+        minimum_nonce: First nonce of the block (inclusive).
+        maximum_nonce: Last nonce of the block (inclusive).
+        rounds: Digests per nonce.
+
+    Returns:
+        np.ndarray: uint8 array of shape (nonces, 32*rounds).
+    """
+    hasher = get_seed_hasher(server_seed=server_seed,client_seed=client_seed)
+    digests:bytes = b"".join([hasher.digests(nonce,rounds) for nonce in range(minimum_nonce,maximum_nonce+1)])
+    return np.frombuffer(digests,dtype=np.uint8).reshape(-1,DIGEST_SIZE*rounds)
+
+def digests_to_words(digests:np.ndarray,words:int|None=None) -> np.ndarray:
+    """
+    Reinterprets an (N, 32*rounds) digest matrix as big-endian 32 bit words.
+
+    Returns:
+        np.ndarray: uint32 array of shape (N, words), words defaulting to 8*rounds.
+    """
+    digests = np.ascontiguousarray(digests,dtype=np.uint8)
+    all_words:np.ndarray = digests.view(">u4").astype(np.uint32)
+    if words is None:
+        return all_words
+    if words > all_words.shape[1]:
+        raise ValueError(f"Requested {words} words but the digests only hold {all_words.shape[1]} ({all_words.shape[1]//WORDS_PER_ROUND} rounds)")
+    return all_words[:,:words]
+
+def words_to_floats(words:np.ndarray) -> np.ndarray:
+    # word/2^32 is exactly b0/256 + b1/256^2 + b2/256^3 + b3/256^4, the float every game starts from
+    return words.astype(np.float64)/TWO_POW_32
+
+def words_to_numbers(words:np.ndarray,modulus:int) -> np.ndarray:
+    # Same float multiply and floor as bytes_to_number, done on the whole block
+    return np.floor(words_to_floats(words)*modulus).astype(np.int64)
+
+def digests_to_floats(digests:np.ndarray,words:int|None=None) -> np.ndarray:
+    return words_to_floats(digests_to_words(digests,words))
+
+def digests_to_numbers(digests:np.ndarray,modulus:int,words:int|None=None) -> np.ndarray:
+    """
+    Decodes every word of every digest into floor(float*modulus), matching bytes_to_number.
+
+    Args:
+        digests: (N, 32*rounds) uint8 digest matrix.
+        modulus: 37 for Roulette, 10001 for Dice, the segment count for Wheel, 52 for Blackjack, etc.
+        words: Number of leading words to decode per nonce. Defaults to all of them.
+
+    Returns:
+        np.ndarray: int64 array of shape (N, words).
+    """
+    return words_to_numbers(digests_to_words(digests,words),modulus)
@@ -0,0 +1,226 @@
+import os
+import hmac
+import json
+import hashlib
+import tempfile
+import importlib.util
+from time import perf_counter
+from .Seed_Hasher import Seed_Hasher
+from .Batch_Decoder import seeds_to_digest_matrix
+from .Lane_SHA256 import lane_digest_matrix
+from .Digest_Cache import Digest_Cache
+from .Buffered_Log import Buffered_Log
+import numpy as np
+from pandas import DataFrame
+from .Result_Writer import write_result_frames
+from .Run_Fingerprint import Run_Fingerprint
+from .Byte_Cursor import Byte_Cursor
+from .Outcome_Stream import decode_block
+from .Plinko_Engine import Plinko_Engine
+from .Rare_Outcomes import Rare_Outcome_Index,dice_roll_words,limbo_multiplier_words
+
+BASE_DIR:str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_game_configuration(game_folder:str) -> dict[str,str|int]:
+    with open(os.path.join(BASE_DIR,game_folder,"Configuration.json"),"rb") as file:
+        return json.load(file)
+
+def benchmark_seed_hasher(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,rounds:int=3) -> dict[str,float]:
+    """
+    Times the old per-call hmac.new path against Seed_Hasher over a nonce range.
+
+    Returns:
+        dict: Seconds taken by each path.
+    """
+    timings:dict[str,float] = {}
+
+    start:float = perf_counter()
+    for nonce in range(minimum_nonce,maximum_nonce+1):
+        messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(rounds)]
+        [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256).hexdigest() for message in messages]
+    timings["hmac.new per round"] = perf_counter()-start
+
+    start = perf_counter()
+    hasher:Seed_Hasher = Seed_Hasher(server_seed=server_seed,client_seed=client_seed)
+    for nonce in range(minimum_nonce,maximum_nonce+1):
+        hasher.digests(nonce,rounds)
+    timings["Seed_Hasher"] = perf_counter()-start
+    return timings
+
+def benchmark_lane_hmac(server_seed:str,client_seed:str,block_sizes:list[int],rounds:int=1) -> dict[str,float]:
+    """
+    Times hmac.new, Seed_Hasher and Lane_HMAC over blocks of nonces starting at 1.
+
+    Returns:
+        dict: Seconds taken by each path for each block size.
+    """
+    timings:dict[str,float] = {}
+    for block_size in block_sizes:
+        start:float = perf_counter()
+        for nonce in range(1,block_size+1):
+            [hmac.new(server_seed.encode(),f"{client_seed}:{nonce}:{x}".encode(),hashlib.sha256).hexdigest() for x in range(rounds)]
+        timings[f"{block_size:,} nonces, hmac.new per round"] = perf_counter()-start
+
+        start = perf_counter()
+        seeds_to_digest_matrix(server_seed,client_seed,1,block_size,rounds)
+        timings[f"{block_size:,} nonces, Seed_Hasher"] = perf_counter()-start
+
+        start = perf_counter()
+        lane_digest_matrix(server_seed,client_seed,1,block_size,rounds)
+        timings[f"{block_size:,} nonces, Lane_HMAC"] = perf_counter()-start
+    return timings
+
+def benchmark_digest_cache(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,rounds:int=3) -> dict[str,float]:
+    """
+    Times a cold Digest_Cache fill, a warm reread and a range extended by 10%.
+
+    Returns:
+        dict: Seconds taken by each pass.
+    """
+    timings:dict[str,float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cache:Digest_Cache = Digest_Cache(directory=directory)
+        start:float = perf_counter()
+        cache.digest_matrix(server_seed,client_seed,minimum_nonce,maximum_nonce,rounds)
+        timings["Cold fill"] = perf_counter()-start
+
+        start = perf_counter()
+        cache.digest_matrix(server_seed,client_seed,minimum_nonce,maximum_nonce,rounds)
+        timings["Warm reread"] = perf_counter()-start
+
+        start = perf_counter()
+        cache.digest_matrix(server_seed,client_seed,minimum_nonce,maximum_nonce+(maximum_nonce-minimum_nonce+1)//10,rounds)
+        timings["Extended by 10%"] = perf_counter()-start
+    return timings
+
+def benchmark_rare_outcomes(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int) -> dict[str,float]:
+    """
+    Times the first scan for perfect Dice rolls and 1,000,000x Limbo results, then the same lookup from the index.
+
+    Returns:
+        dict: Seconds taken by each pass.
+    """
+    word_ranges:list[tuple[int,int]] = [dice_roll_words(0),dice_roll_words(100),limbo_multiplier_words(1_000_000)]
+    timings:dict[str,float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        index:Rare_Outcome_Index = Rare_Outcome_Index(directory=directory,use_digest_cache=False)
+        start:float = perf_counter()
+        index.nonces(server_seed,client_seed,minimum_nonce,maximum_nonce,word_ranges)
+        timings["First scan"] = perf_counter()-start
+
+        start = perf_counter()
+        index.nonces(server_seed,client_seed,minimum_nonce,maximum_nonce,word_ranges)
+        timings["Indexed lookup"] = perf_counter()-start
+    return timings
+
+def benchmark_buffered_log(messages:int=100_000) -> dict[str,float]:
+    """
+    Times queueing messages on a Buffered_Log and the close that writes the rest of them out.
+
+    Returns:
+        dict: Seconds taken by each step.
+    """
+    timings:dict[str,float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        log:Buffered_Log = Buffered_Log(directory,"Benchmark_Log.xml")
+        start:float = perf_counter()
+        for index in range(messages):
+            log.log(f"Message {index}")
+        timings["Queue"] = perf_counter()-start
+
+        start = perf_counter()
+        log.close()
+        timings["Close"] = perf_counter()-start
+    return timings
+
+def benchmark_run_fingerprint(rows:int=1_000_000,block_size:int=100_000) -> dict[str,float]:
+    """
+    Times writing result blocks to CSV and JSON with and without a Run_Fingerprint hashing them.
+
+    Returns:
+        dict: Seconds taken by each step.
+    """
+    generator:np.random.Generator = np.random.default_rng(1)
+    frames:list[DataFrame] = [
+        DataFrame({"Nonce":np.arange(low,low+block_size),"Result":generator.random(block_size)*100},index=range(low,low+block_size))
+        for low in range(0,rows,block_size)
+    ]
+    timings:dict[str,float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        paths:tuple[str,str] = (os.path.join(directory,"Results.csv"),os.path.join(directory,"Results.json"))
+        start:float = perf_counter()
+        write_result_frames(frames,*paths,["Nonce","Result"])
+        timings["Plain"] = perf_counter()-start
+
+        start = perf_counter()
+        write_result_frames(frames,*paths,["Nonce","Result"],fingerprint=Run_Fingerprint({},[]))
+        timings["Fingerprinted"] = perf_counter()-start
+    return timings
+
+def benchmark_plinko_engine(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,multipliers:list[int|float]) -> dict[str,float]:
+    """
+    Times Plinko games drawn one row at a time from Byte_Cursor against the engine popcounting a block of digests.
+
+    Returns:
+        dict: Seconds taken by each step.
+    """
+    rows:int = len(multipliers)-1
+    timings:dict[str,float] = {}
+    start:float = perf_counter()
+    for nonce in range(minimum_nonce,maximum_nonce+1):
+        cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+        multipliers[sum([cursor.next_number(2) for _ in range(rows)])]
+    timings["Byte_Cursor"] = perf_counter()-start
+
+    start = perf_counter()
+    Plinko_Engine(multipliers).play(server_seed,client_seed,minimum_nonce,maximum_nonce)
+    timings["Plinko engine"] = perf_counter()-start
+    return timings
+
+def benchmark_layout_comparison(minimum_nonce:int,maximum_nonce:int,layout_count:int=20) -> dict[str,float]:
+    """
+    Times comparing Roulette layouts in one pass over spins decoded once against decoding the spins again for every layout.
+
+    Returns:
+        dict: Seconds taken by each step.
+    """
+    specification = importlib.util.spec_from_file_location("Roulette_Layout",os.path.join(BASE_DIR,"Stake_Roulette","Roulette_Layout.py"))
+    layouts = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(layouts)
+    configuration:dict[str,str|int] = load_game_configuration("Stake_Roulette")
+    server,client = configuration["ServerSeed"],configuration["ClientSeed"]
+    _,compiled = layouts.compile_layouts(configuration,[{"SingleNumberBets":{str(number):1},"DozenBets":{"1-12":number%5+1}} for number in range(layout_count)])
+
+    timings:dict[str,float] = {}
+    start:float = perf_counter()
+    for layout in compiled:
+        layouts.compare_layouts([layout],decode_block("Roulette",server,client,minimum_nonce,maximum_nonce),minimum_nonce)
+    timings["Decoded per layout"] = perf_counter()-start
+
+    start = perf_counter()
+    layouts.compare_layouts(compiled,decode_block("Roulette",server,client,minimum_nonce,maximum_nonce),minimum_nonce)
+    timings["Decoded once"] = perf_counter()-start
+    return timings
+
+def print_timings(title:str,timings:dict[str,float]) -> None:
+    print(title)
+    for name,seconds in timings.items():
+        print(f"\t{name}: {seconds:,.3f}s")
+
+if __name__ == "__main__":
+    # Plinko hashes 3 rounds per nonce, the most common shape in this repository
+    plinko_configuration:dict[str,str|int] = load_game_configuration("Stake_Plinko")
+    print_timings("HMAC keying, 1,000,000 Plinko nonces",benchmark_seed_hasher(plinko_configuration["ServerSeed"],plinko_configuration["ClientSeed"],1,1_000_000))
+    print_timings("Lane HMAC, 1 round per nonce",benchmark_lane_hmac(plinko_configuration["ServerSeed"],plinko_configuration["ClientSeed"],[1_000,10_000,100_000,1_000_000]))
+    print_timings("Digest cache, 1,000,000 Plinko nonces",benchmark_digest_cache(plinko_configuration["ServerSeed"],plinko_configuration["ClientSeed"],1,1_000_000))
+    specification = importlib.util.spec_from_file_location("Plinko_Multipliers",os.path.join(BASE_DIR,"Stake_Plinko","Multipliers.py"))
+    plinko_tables = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(plinko_tables)
+    print_timings("Plinko engine, 100,000 nonces",benchmark_plinko_engine(
+        plinko_configuration["ServerSeed"],plinko_configuration["ClientSeed"],1,100_000,
+        plinko_tables.plinko_multipliers[f"{plinko_configuration['Risk']}{plinko_configuration['Rows']}"]
+    ))
+    print_timings("Rare outcome index, 1,000,000 nonces",benchmark_rare_outcomes(plinko_configuration["ServerSeed"],plinko_configuration["ClientSeed"],1,1_000_000))
+    print_timings("Buffered log, 100,000 messages",benchmark_buffered_log())
+    print_timings("Run fingerprint, 1,000,000 result rows",benchmark_run_fingerprint())
+    print_timings("Roulette layout comparison, 20 layouts, 1,000,000 spins",benchmark_layout_comparison(1,1_000_000))
@@ -0,0 +1,73 @@
+import numpy as np
+from typing import Callable
+
+BLOCK_SIZE:int = 1_000_000
+
+def running_total(start:float,increments:np.ndarray) -> np.ndarray:
+    # cumsum adds one element at a time, so every total matches adding the games in a loop
+    return np.cumsum(np.concatenate(([start],increments)))[1:]
+
+def losing_streak_lengths(wins:np.ndarray,initial_streak:int=0) -> np.ndarray:
+    """
+    Length of the losing streak in progress before each game, 0 straight after a win.
+
+    Args:
+        wins: Win flag of every game.
+        initial_streak: Losing streak already in progress before wins[0].
+    """
+    if(len(wins) == 0):
+        return np.zeros(0,dtype=np.int64)
+    positions:np.ndarray = np.arange(len(wins))
+    last_wins:np.ndarray = np.maximum.accumulate(np.where(wins,positions,-1))
+    # Losses since the last win, counting each game itself
+    streaks_after:np.ndarray = positions-last_wins+np.where(last_wins < 0,initial_streak,0)
+    return np.concatenate(([initial_streak],streaks_after[:-1])).astype(np.int64)
+
+def compile_streak_stakes(maximum_streak:int,initial_stake:float,next_stake:Callable[[int,float],float]) -> np.ndarray:
+    """
+    Stake of a game for every losing streak length from 0 to maximum_streak.
+
+    The progression is walked once, applying next_stake the same way a simulation loop applies it after
+    each loss, so every stake is the exact float the loop would bet.
+
+    Args:
+        maximum_streak: Longest losing streak that needs a stake.
+        initial_stake: Stake after a win.
+        next_stake: Takes the losing streak length just reached and the current stake, returns the next stake.
+    """
+    stakes:list[float] = [initial_stake]
+    for streak in range(1,maximum_streak+1):
+        stakes.append(next_stake(streak,stakes[-1]))
+    return np.array(stakes,dtype=np.float64)
+
+def play_balance(stakes:np.ndarray,payouts:np.ndarray,wins:np.ndarray,balance:float) -> tuple[int,float,float]:
+    """
+    Plays the games in order from balance, stopping at the first bet that takes the balance below zero.
+
+    Args:
+        stakes: Amount bet on every game.
+        payouts: Amount paid back on every game, 0 on a loss.
+        wins: Win flag of every game.
+        balance: Starting balance.
+
+    Returns:
+        tuple[int,float,float]: Games played, counting the one that went below zero, ending balance
+            and the biggest balance reached after a win.
+    """
+    biggest_balance:float = balance
+    for low in range(0,len(wins),BLOCK_SIZE):
+        high:int = min(low+BLOCK_SIZE,len(wins))
+        # Each game first takes the bet, then pays out on a win
+        steps:np.ndarray = np.empty(2*(high-low))
+        steps[0::2] = -stakes[low:high]
+        steps[1::2] = payouts[low:high]
+        balances:np.ndarray = running_total(balance,steps)
+        broke:np.ndarray = np.flatnonzero(balances[0::2] < 0)
+        played:int = int(broke[0]) if len(broke) else high-low
+        won:np.ndarray = balances[1::2][:played][wins[low:low+played]]
+        if(len(won)):
+            biggest_balance = max(biggest_balance,float(won.max()))
+        if(len(broke)):
+            return low+played+1,float(balances[2*played]),biggest_balance
+        balance = float(balances[-1])
+    return len(wins),balance,biggest_balance
@@ -0,0 +1,157 @@
+import os
+import atexit
+import threading
+import xml.etree.ElementTree as ET
+from datetime import datetime,timedelta
+
+FLUSH_INTERVAL:float = 1.0
+LOG_RETENTION_DAYS:int = 30
+ARCHIVE_FOLDER:str = "archive"
+
+def to_fragments(text:str) -> str:
+    """
+    The <log> entries of a day's log as appended fragments, unwrapping a joined <logs> document if needed.
+    """
+    if(not text.lstrip().startswith("<logs")):
+        return text
+    return "".join(ET.tostring(entry,encoding="unicode").strip()+"\n" for entry in ET.fromstring(text).iter("log"))
+
+def read_log_entries(path:str) -> list[dict[str,str]]:
+    """
+    Reads a day's log, either still as appended fragments or already joined into one <logs> document.
+
+    Returns:
+        list[dict]: "timestamp", "status" and "message" of every entry in order.
+    """
+    with open(path,"r",encoding="utf-8") as file:
+        root:ET.Element = ET.fromstring(f"<logs>{to_fragments(file.read())}</logs>")
+    return [{"timestamp":entry.get("timestamp"),"status":entry.get("status"),"message":entry.findtext("message")} for entry in root.iter("log")]
+
+class Buffered_Log:
+    """
+    Daily XML log that never rereads what it has already written.
+
+    Entries are buffered in memory and a background thread appends them to today's file as <log>
+    fragments once per flush_interval. Rotation and retention are checked once per flush: files from
+    earlier days are joined into a <logs> document, moved to the archive folder, and archives older
+    than retention_days are deleted. Call close(), or let the interpreter exit, to flush what is left.
+    """
+    def __init__(self,directory:str,name:str,flush_interval:float=FLUSH_INTERVAL,retention_days:int=LOG_RETENTION_DAYS):
+        self.directory:str = directory
+        self.name:str = name
+        self.archive_directory:str = os.path.join(directory,ARCHIVE_FOLDER)
+        self.flush_interval:float = flush_interval
+        self.retention_days:int = retention_days
+        self.closed:bool = False
+        self._reset()
+        # A forked worker inherits the buffer and locks but not the thread, so it starts over with its own
+        os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.close)
+
+    def _reset(self) -> None:
+        self.lock:threading.Lock = threading.Lock()
+        self.flush_lock:threading.Lock = threading.Lock()
+        self.wake:threading.Event = threading.Event()
+        self.entries:list[tuple[datetime,str,str]] = []
+        self.thread:threading.Thread|None = None
+
+    def _run(self) -> None:
+        while(not self.closed):
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+
+    def path(self,day:str) -> str:
+        return os.path.join(self.directory,f"{self.name}_{day}.xml")
+
+    def log(self,message:str,status:str="INFO") -> None:
+        with self.lock:
+            self.entries.append((datetime.now(),status,message))
+            if((self.thread is None) and (not self.closed)):
+                self.thread = threading.Thread(target=self._run,daemon=True)
+                self.thread.start()
+        if(self.closed):
+            self.flush()
+
+    def _day(self,filename:str) -> str|None:
+        # Days are zero padded, so comparing them as strings compares the dates
+        prefix:str = f"{self.name}_"
+        day:str = filename[len(prefix):-len(".xml")]
+        if(filename.startswith(prefix) and filename.endswith(".xml") and day.isdigit() and (len(day) == 8)):
+            return day
+        return None
+
+    def _rotate(self,today:str) -> None:
+        for filename in os.listdir(self.directory):
+            day:str|None = self._day(filename)
+            if((day is None) or (day >= today)):
+                continue
+            with open(os.path.join(self.directory,filename),"r",encoding="utf-8") as file:
+                text:str = file.read()
+            os.makedirs(self.archive_directory,exist_ok=True)
+            archive_path:str = os.path.join(self.archive_directory,filename)
+            if(os.path.exists(archive_path)):
+                # Entries flushed after their day was archived join the end of that archive
+                with open(archive_path,"r",encoding="utf-8") as file:
+                    text = to_fragments(file.read())+text
+            with open(archive_path,"w",encoding="utf-8") as file:
+                file.write(f"<logs>\n{to_fragments(text)}</logs>\n")
+            os.remove(os.path.join(self.directory,filename))
+        if(not os.path.exists(self.archive_directory)):
+            return
+        cutoff_day:str = (datetime.now()-timedelta(days=self.retention_days)).strftime("%Y%m%d")
+        for filename in os.listdir(self.archive_directory):
+            day:str|None = self._day(filename)
+            if((day is not None) and (day < cutoff_day)):
+                os.remove(os.path.join(self.archive_directory,filename))
+
+    def _unwrap(self,path:str) -> None:
+        # A file written as one <logs> document is turned into fragments once, so it can be appended to
+        if(not os.path.exists(path)):
+            return
+        with open(path,"r",encoding="utf-8") as file:
+            if(not file.read(16).lstrip().startswith("<logs")):
+                return
+            file.seek(0)
+            text:str = file.read()
+        with open(path,"w",encoding="utf-8") as file:
+            file.write(to_fragments(text))
+
+    def flush(self) -> None:
+        """
+        Appends every buffered entry to the file of the day it was logged on.
+        """
+        with self.flush_lock:
+            with self.lock:
+                entries,self.entries = self.entries,[]
+            if(not entries):
+                return
+            fragments:dict[str,list[str]] = {}
+            for timestamp,status,message in entries:
+                entry:ET.Element = ET.Element("log",{"timestamp":timestamp.strftime("%Y-%m-%d %H:%M:%S"),"status":status})
+                ET.SubElement(entry,"message").text = message
+                fragments.setdefault(timestamp.strftime("%Y%m%d"),[]).append(ET.tostring(entry,encoding="unicode"))
+            for day,lines in fragments.items():
+                self._unwrap(self.path(day))
+                with open(self.path(day),"a",encoding="utf-8") as file:
+                    file.write("\n".join(lines)+"\n")
+            # Entries from before midnight are written first, so their day is archived with them
+            self._rotate(datetime.now().strftime("%Y%m%d"))
+
+    def close(self) -> None:
+        if(self.closed):
+            return
+        self.closed = True
+        self.wake.set()
+        if(self.thread is not None):
+            self.thread.join()
+        self.flush()
+
+_logs:dict[tuple[str,str],Buffered_Log] = {}
+
+def get_buffered_log(directory:str,name:str) -> Buffered_Log:
+    # One log per file name per process, so every caller shares the same buffer and thread
+    key:tuple[str,str] = (os.path.realpath(directory),name)
+    if(key not in _logs):
+        _logs[key] = Buffered_Log(directory,name)
+    return _logs[key]
@@ -0,0 +1,85 @@
+import hashlib
+from math import floor
+from struct import Struct
+from .Seed_Hasher import Seed_Hasher,get_seed_hasher
+
+WORD:Struct = Struct(">I")
+BYTES_PER_WORD:int = 4
+DIGEST_SIZE:int = 32
+WORDS_PER_ROUND:int = 8
+TWO_POW_32:float = float(256**4)
+
+def sha256_encrypt(input_string: str) -> str:
+    # Create a sha256 hash object
+    sha256_hash = hashlib.sha256()
+    
+    # Update the hash object with the bytes of the input string
+    sha256_hash.update(input_string.encode('utf-8'))
+    
+    # Return the hexadecimal representation of the hash
+    return sha256_hash.hexdigest()
+
+def seeds_to_digests(server_seed:str,client_seed:str,nonce:int,rounds:int=1) -> bytes:
+    """
+    Concatenates the raw HMAC-SHA256 digests of rounds 0..rounds-1 for a single nonce.
+
+    Args:
+        server_seed: Unhashed server seed used as the HMAC key.
+        client_seed: Client seed placed at the front of every message.
+        nonce: Bet number.
+        rounds: Number of 32 byte digests (8 words each) to compute.
+
+    Returns:
+        bytes: 32*rounds bytes of digest output.
+    """
+    return get_seed_hasher(server_seed=server_seed,client_seed=client_seed).digests(nonce=nonce,rounds=rounds)
+
+def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int,rounds:int=1) -> list[str]:
+    digests:bytes = seeds_to_digests(server_seed=server_seed,client_seed=client_seed,nonce=nonce,rounds=rounds)
+    return [digests[index:index+32].hex() for index in range(0,len(digests),32)]
+
+def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
+    # Reference implementation every decoder in this package must agree with
+    number:float =  (
+                        (float(bytes_list[0]) / float(256**1)) +
+                        (float(bytes_list[1]) / float(256**2)) +
+                        (float(bytes_list[2]) / float(256**3)) +
+                        (float(bytes_list[3]) / float(256**4))
+                    )
+    number = number*multiplier
+    return floor(number)
+
+class Byte_Cursor:
+    """
+    Reads the digest bytes of one nonce four bytes at a time, hashing rounds only as they are reached.
+
+    The four byte float used by every game, b0/256 + b1/256^2 + b2/256^3 + b3/256^4, is exactly
+    the big-endian 32 bit word divided by 2^32 (every partial sum fits in a double), so the cursor
+    unpacks each word straight out of a memoryview instead of going through hex strings and lists.
+    Round k is only hashed when word 8k is requested, so an 8 row Plinko drop or a 6 flip prediction
+    costs one HMAC instead of three.
+    """
+    def __init__(self,server_seed:str,client_seed:str,nonce:int):
+        self.hasher:Seed_Hasher = get_seed_hasher(server_seed=server_seed,client_seed=client_seed)
+        self.nonce_prefix:bytes = self.hasher.nonce_prefix(nonce)
+        self.rounds:int = 0
+        self.view:memoryview = memoryview(b"")
+        self.position:int = DIGEST_SIZE
+
+    def _next_round(self) -> None:
+        self.view = memoryview(self.hasher.digest_message(self.nonce_prefix + b"%d" % self.rounds))
+        self.rounds += 1
+        self.position = 0
+
+    def next_word(self) -> int:
+        if(self.position == DIGEST_SIZE):
+            self._next_round()
+        word:int = WORD.unpack_from(self.view,self.position)[0]
+        self.position += BYTES_PER_WORD
+        return word
+
+    def next_float(self) -> float:
+        return self.next_word()/TWO_POW_32
+
+    def next_number(self,multiplier:int) -> int:
+        return floor((self.next_word()/TWO_POW_32)*multiplier)
@@ -0,0 +1,71 @@
+import numpy as np
+
+class Category_Table:
+    """
+    Lookup table from each outcome of a game to the betting categories it belongs to, with running counts and streaks.
+
+    Categories come in groups whose members never share an outcome, such as Red and Black. An outcome
+    outside every category of a group, such as 0 for Red and Black, is skipped by that group: it neither
+    extends nor ends a streak there. A streak only counts as finished once another category of its group
+    comes up, the same as in the per-game loops, so the run still open at the end is never counted.
+    """
+    def __init__(self,groups:dict[str,dict[str,list[int]]],outcomes:int):
+        self.names:list[str] = [name for categories in groups.values() for name in categories]
+        if(len(set(self.names)) != len(self.names)):
+            raise ValueError("Category names must be unique across groups")
+        self.membership:np.ndarray = np.zeros((outcomes,len(self.names)),dtype=bool)
+        # Category index of every outcome in each group, -1 when the group skips the outcome
+        self.group_codes:np.ndarray = np.full((len(groups),outcomes),-1,dtype=np.int64)
+        for group,categories in enumerate(groups.values()):
+            for name,members in categories.items():
+                index:int = self.names.index(name)
+                if((self.group_codes[group,members] != -1).any()):
+                    raise ValueError(f"{name} shares an outcome with another category of its group")
+                self.membership[members,index] = True
+                self.group_codes[group,members] = index
+
+        self.outcome_counts:np.ndarray = np.zeros(outcomes,dtype=np.int64)
+        self.biggest_streaks:np.ndarray = np.zeros(len(self.names),dtype=np.int64)
+        # Category and length of the run still open in each group
+        self.open_runs:list[tuple[int,int]] = [(-1,0)]*len(groups)
+
+    def counts(self) -> np.ndarray:
+        return self.outcome_counts@self.membership.astype(np.int64)
+
+    def count(self,name:str) -> int:
+        return int(self.counts()[self.names.index(name)])
+
+    def biggest_streak(self,name:str) -> int:
+        return int(self.biggest_streaks[self.names.index(name)])
+
+    def _add_runs(self,group:int,codes:np.ndarray) -> None:
+        codes = codes[codes >= 0]
+        if(len(codes) == 0):
+            return
+        starts:np.ndarray = np.flatnonzero(np.concatenate(([True],codes[1:] != codes[:-1])))
+        lengths:np.ndarray = np.diff(np.append(starts,len(codes)))
+        run_codes:np.ndarray = codes[starts]
+        open_code,open_length = self.open_runs[group]
+        if(run_codes[0] == open_code):
+            lengths[0] += open_length
+        elif(open_length > 0):
+            self.biggest_streaks[open_code] = max(self.biggest_streaks[open_code],open_length)
+        # Every run but the last is ended by the next one
+        np.maximum.at(self.biggest_streaks,run_codes[:-1],lengths[:-1])
+        self.open_runs[group] = (int(run_codes[-1]),int(lengths[-1]))
+
+    def add(self,outcomes:np.ndarray) -> np.ndarray:
+        """
+        Tallies the next block of outcomes.
+
+        Args:
+            outcomes: Outcome index of every game in the block, in order.
+
+        Returns:
+            np.ndarray: Running count of every category after each game, one column per category in the order of names.
+        """
+        before:np.ndarray = self.counts()
+        self.outcome_counts += np.bincount(outcomes,minlength=len(self.outcome_counts))
+        for group,codes in enumerate(self.group_codes):
+            self._add_runs(group,codes[outcomes])
+        return before+np.cumsum(self.membership[outcomes],axis=0)
@@ -0,0 +1,124 @@
+import os
+import time
+import pickle
+import argparse
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any,BinaryIO,Callable
+from .Shard_Runner import SHARDS_PER_WORKER,Shard_Summary,run_sharded
+
+CHECKPOINT_NONCES:int = 1_000_000
+CHECKPOINT_SECONDS:float = 300
+STEP_NONCES:int = 100_000
+
+class Checkpoint:
+    """
+    Snapshot of a simulation part way through its nonce range, saved so an interrupted run can carry on.
+
+    It holds the next nonce to play, the unfinished Shard_Summary of every nonce before it (counters,
+    open streaks, biggest streaks and their start nonces), whatever the game carries from one block to
+    the next, and how many bytes of the output file are complete. Saves go through a temporary file and
+    os.replace, so a crash mid-save leaves the previous checkpoint intact.
+    """
+    def __init__(self,path:str,configuration:dict[str,Any],every_nonces:int=CHECKPOINT_NONCES,every_seconds:float=CHECKPOINT_SECONDS):
+        self.path:str = path
+        self.configuration:dict[str,Any] = configuration
+        self.every_nonces:int = every_nonces
+        self.every_seconds:float = every_seconds
+        self.saved_nonce:int|None = None
+        self.saved_time:float = time.monotonic()
+
+    def load(self) -> dict[str,Any]|None:
+        """
+        Returns:
+            dict|None: The saved state, or None when there is no checkpoint to resume from.
+
+        Raises:
+            ValueError: When the checkpoint was written for a different configuration.
+        """
+        if(not os.path.exists(self.path)):
+            return None
+        with open(self.path,"rb") as file:
+            state:dict[str,Any] = pickle.load(file)
+        if(state["configuration"] != self.configuration):
+            raise ValueError(f"{self.path} was written for a different configuration, remove it to start over")
+        self.saved_nonce = state["next_nonce"]
+        return state
+
+    def due(self,next_nonce:int) -> bool:
+        if(self.saved_nonce is None):
+            self.saved_nonce = next_nonce
+        return (next_nonce-self.saved_nonce >= self.every_nonces) or (time.monotonic()-self.saved_time >= self.every_seconds)
+
+    def save(self,next_nonce:int,summary:Shard_Summary,carry:Any,output_offset:int) -> None:
+        temporary_path:str = f"{self.path}.tmp"
+        with open(temporary_path,"wb") as file:
+            pickle.dump({"configuration":self.configuration,"next_nonce":next_nonce,"summary":summary,"carry":carry,"output_offset":output_offset},file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path,self.path)
+        self.saved_nonce = next_nonce
+        self.saved_time = time.monotonic()
+
+    def remove(self) -> None:
+        if(os.path.exists(self.path)):
+            os.remove(self.path)
+
+def run_checkpointed(
+        shard_function:Callable[...,Shard_Summary],minimum_nonce:int,maximum_nonce:int,checkpoint:Checkpoint,
+        output_path:str,write_rows:Callable[[BinaryIO,list[list[Any]],Any],Any],carry:Any=None,
+        resume:bool=False,workers:int=1,step_nonces:int=STEP_NONCES,**arguments) -> tuple[Shard_Summary,Any]:
+    """
+    run_sharded in steps of step_nonces, writing each step's rows to output_path and checkpointing as it goes.
+
+    Args:
+        shard_function: Top-level function taking minimum_nonce, maximum_nonce and **arguments, as for run_sharded.
+        minimum_nonce: First nonce of the range (inclusive).
+        maximum_nonce: Last nonce of the range (inclusive).
+        checkpoint: Where to save and load the state.
+        output_path: File the rows are written to, opened in binary mode.
+        write_rows: Takes the open output file, one step's rows and the carry, writes the rows and returns the new carry.
+        carry: Starting value of whatever write_rows carries between steps, such as running totals.
+        resume: Continue from the saved checkpoint when there is one, instead of starting over.
+        workers: Number of processes.
+        step_nonces: Nonces played between writes, raised so every worker gets SHARDS_PER_WORKER shards.
+
+    Returns:
+        tuple[Shard_Summary,Any]: Finished summary of the whole range, with its rows already written, and the final carry.
+
+    Raises:
+        ValueError: When resuming and output_path is missing or shorter than it was at the checkpoint.
+    """
+    state:dict[str,Any]|None = checkpoint.load() if resume else None
+    if(state is None):
+        next_nonce:int = minimum_nonce
+        summary:Shard_Summary = Shard_Summary(minimum_nonce)
+        output_offset:int = 0
+    else:
+        next_nonce,summary,carry,output_offset = state["next_nonce"],state["summary"],state["carry"],state["output_offset"]
+        # The rows before the checkpoint are not played again, so they have to still be on disk
+        if((not os.path.exists(output_path)) or (os.path.getsize(output_path) < output_offset)):
+            raise ValueError(f"{output_path} is missing rows saved before {checkpoint.path}, rerun without --resume to start over")
+
+    with open(output_path,"r+b" if state is not None else "wb") as output,ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+        # Anything written after the checkpoint was saved is played again
+        output.truncate(output_offset)
+        output.seek(output_offset)
+        while(next_nonce <= maximum_nonce):
+            high:int = min(next_nonce+max(step_nonces,workers*SHARDS_PER_WORKER)-1,maximum_nonce)
+            step:Shard_Summary = run_sharded(shard_function,next_nonce,high,workers=workers,executor=executor,finish=False,**arguments)
+            carry = write_rows(output,step.rows,carry)
+            step.rows = []
+            summary = summary.merge(step)
+            next_nonce = high+1
+            if((next_nonce <= maximum_nonce) and checkpoint.due(next_nonce)):
+                output.flush()
+                os.fsync(output.fileno())
+                checkpoint.save(next_nonce,summary,carry,output.tell())
+    checkpoint.remove()
+    return summary.finish(),carry
+
+def parse_resume() -> bool:
+    parser:argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--resume",action="store_true",help="Carry on from the last checkpoint of an interrupted run with the same configuration")
+    return parser.parse_known_args()[0].resume
@@ -0,0 +1,104 @@
+import numpy as np
+from math import floor
+from bisect import bisect_left,bisect_right
+from functools import lru_cache
+from .Byte_Cursor import TWO_POW_32
+
+WORD_LIMIT:int = 256**4
+DICE_MODULUS:int = 10001
+LIMBO_MODULUS:int = 16777216
+
+def word_to_number(word:int,modulus:int) -> int:
+    # The float path of bytes_to_number applied to one 32 bit word
+    return floor((word/TWO_POW_32)*modulus)
+
+def dice_number_to_result(number:int) -> float:
+    return round(number/100,2)
+
+@lru_cache(maxsize=1)
+def dice_results() -> list[float]:
+    # Every possible roll in number order, which is also sorted order
+    return [dice_number_to_result(number) for number in range(DICE_MODULUS)]
+
+def limbo_number_to_result(number:int) -> float:
+    return floor(((16777216)/(number+1)*(1-0.01))*100)/100
+
+def first_word_with_number(modulus:int,number:int) -> int:
+    """
+    Smallest 32 bit word whose floor(float*modulus) is at least number.
+
+    Starts from the exact rational answer and then steps against the float path, so the cutoff
+    agrees with bytes_to_number even where float rounding lands on the other side of an integer.
+
+    Returns:
+        int: Word cutoff in [0, 2^32]. 2^32 means no word reaches number.
+    """
+    if(number <= 0):
+        return 0
+    if(number >= modulus):
+        return WORD_LIMIT
+    cutoff:int = -((-number*WORD_LIMIT)//modulus)
+    while((cutoff > 0) and (word_to_number(cutoff-1,modulus) >= number)):
+        cutoff -= 1
+    while((cutoff < WORD_LIMIT) and (word_to_number(cutoff,modulus) < number)):
+        cutoff += 1
+    return cutoff
+
+def compile_bucket_cutoffs(modulus:int) -> np.ndarray:
+    """
+    Word cutoffs for every bucket of floor(float*modulus), e.g. 37 for Roulette or the segment count for Wheel.
+
+    Returns:
+        np.ndarray: uint32 array where bucket k holds the words in [cutoffs[k], cutoffs[k+1]).
+    """
+    return np.array([first_word_with_number(modulus,number) for number in range(modulus)],dtype=np.uint32)
+
+def words_to_buckets(words:np.ndarray,cutoffs:np.ndarray) -> np.ndarray:
+    return np.searchsorted(cutoffs,words,side='right')-1
+
+def compile_dice_cutoff(over_under:str,threshold:float) -> int:
+    """
+    Word cutoff deciding a Dice bet without building the roll.
+
+    Over wins when the roll is above the threshold, so it wins for words >= cutoff.
+    Under wins when the roll is below the threshold, so it wins for words < cutoff.
+    """
+    results:list[float] = dice_results()
+    if(over_under == "Over"):
+        # First roll above the threshold
+        boundary_number:int = bisect_right(results,threshold)
+    else:
+        # First roll at or above the threshold
+        boundary_number:int = bisect_left(results,threshold)
+    return first_word_with_number(DICE_MODULUS,boundary_number)
+
+def dice_wins(words:np.ndarray,over_under:str,cutoff:int) -> np.ndarray:
+    if(over_under == "Over"):
+        return words >= np.uint64(cutoff)
+    return words < np.uint64(cutoff)
+
+def compile_limbo_cutoff(target_multiplier:float,strictly_above:bool=False) -> int:
+    """
+    Word cutoff below which the Limbo result reaches target_multiplier (or exceeds it when strictly_above).
+
+    The Limbo result only falls as the word grows, so the cutoff is found by bisecting the
+    24 bit number against the float formula.
+
+    Returns:
+        int: Words below the cutoff win.
+    """
+    def reaches(number:int) -> bool:
+        result:float = limbo_number_to_result(number)
+        return (result > target_multiplier) if strictly_above else (result >= target_multiplier)
+    low:int = 0
+    high:int = LIMBO_MODULUS
+    while(low < high):
+        middle:int = (low+high)//2
+        if(reaches(middle)):
+            low = middle+1
+        else:
+            high = middle
+    return first_word_with_number(LIMBO_MODULUS,low)
+
+def limbo_wins(words:np.ndarray,cutoff:int) -> np.ndarray:
+    return words < np.uint64(cutoff)
@@ -0,0 +1,245 @@
+import os
+import json
+import time
+import hashlib
+import numpy as np
+from contextlib import contextmanager
+from typing import Iterator
+try:
+    import fcntl
+except ImportError:
+    # Windows locks through msvcrt instead
+    fcntl = None
+    import msvcrt
+from .Byte_Cursor import DIGEST_SIZE,sha256_encrypt
+from .Seed_Hasher import get_seed_hasher
+from .Lane_SHA256 import Lane_HMAC
+
+DEFAULT_CACHE_DIRECTORY:str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Digest_Cache")
+DEFAULT_MAX_BYTES:int = 2*1024**3
+LANE_MINIMUM_NONCES:int = 100_000
+INDEX_FILE:str = "index.json"
+LOCK_FILE:str = "index.lock"
+
+def compute_digests(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,round:int=0,lane:bool=False) -> np.ndarray:
+    """
+    Hashes one round of a nonce range.
+
+    Args:
+        lane: Use the lane kernel for ranges of at least LANE_MINIMUM_NONCES nonces, below which it is slower than Seed_Hasher.
+
+    Returns:
+        np.ndarray: uint8 array of shape (nonces, 32).
+    """
+    if(lane and (maximum_nonce-minimum_nonce+1 >= LANE_MINIMUM_NONCES)):
+        return Lane_HMAC(server_seed=server_seed,client_seed=client_seed).digests(minimum_nonce,maximum_nonce,round)
+    hasher = get_seed_hasher(server_seed=server_seed,client_seed=client_seed)
+    digests:bytes = b"".join([hasher.digest(nonce,round) for nonce in range(minimum_nonce,maximum_nonce+1)])
+    return np.frombuffer(digests,dtype=np.uint8).reshape(-1,DIGEST_SIZE)
+
+@contextmanager
+def locked_file(path:str) -> Iterator[None]:
+    # Held by one process at a time, across every process on the machine
+    with open(path,"a+b") as file:
+        if(fcntl is not None):
+            fcntl.flock(file.fileno(),fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(),msvcrt.LK_LOCK,1)
+        try:
+            yield
+        finally:
+            if(fcntl is not None):
+                fcntl.flock(file.fileno(),fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(),msvcrt.LK_UNLCK,1)
+
+class Digest_Cache:
+    """
+    On-disk store of raw 32 byte digests, shared by every game simulation.
+
+    Each seed pair gets one folder keyed by the hashed server seed and the client seed. Every round keeps
+    a sorted list of disjoint nonce ranges, one file each, so shards of one run can fill their own parts
+    of a range side by side. Requests only hash the nonces no range holds yet, ranges that meet or
+    overlap a request are joined into one file, and reads come back as memory-mapped views. Once the
+    folder is over max_bytes, whole seed pairs are evicted least recently used first.
+
+    Several runs can share the folder at once. The index and round files only change while a lock file
+    is held, and each change starts by rereading the index, so no process overwrites another's entries.
+    Hashing happens outside the lock: the missing nonces are hashed, then merged once the index has been
+    read again. Views handed out earlier stay valid when a file is later replaced or evicted.
+    """
+    def __init__(self,directory:str=DEFAULT_CACHE_DIRECTORY,max_bytes:int=DEFAULT_MAX_BYTES):
+        self.directory:str = directory
+        self.max_bytes:int = max_bytes
+        os.makedirs(self.directory,exist_ok=True)
+        self.index_path:str = os.path.join(self.directory,INDEX_FILE)
+        self.lock_path:str = os.path.join(self.directory,LOCK_FILE)
+        with locked_file(self.lock_path):
+            self.index:dict[str,dict] = self._load_index()
+
+    def _load_index(self) -> dict[str,dict]:
+        if(not os.path.exists(self.index_path)):
+            return {}
+        with open(self.index_path,"rb") as file:
+            index:dict[str,dict] = json.load(file)
+        for key,segment in index.items():
+            for round,ranges in segment["Rounds"].items():
+                # Folders from before rounds held several ranges keep one range per round in round_<round>.bin
+                if(ranges and isinstance(ranges[0],int)):
+                    old_path:str = os.path.join(self.directory,key,f"round_{round}.bin")
+                    if(os.path.exists(old_path)):
+                        os.replace(old_path,self._round_path(key,int(round),ranges[0]))
+                    segment["Rounds"][round] = [ranges]
+        return index
+
+    def _save_index(self) -> None:
+        temporary_path:str = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temporary_path,"w") as file:
+            json.dump(self.index,file,indent=4)
+        os.replace(temporary_path,self.index_path)
+
+    def _segment_key(self,server_seed_hashed:str,client_seed:str) -> str:
+        # Client seeds are free text, so the folder name is a hash of the pair rather than the pair itself
+        return hashlib.sha256(f"{server_seed_hashed}:{client_seed}".encode()).hexdigest()[:32]
+
+    def _round_path(self,key:str,round:int,minimum_nonce:int) -> str:
+        return os.path.join(self.directory,key,f"round_{round}_{minimum_nonce}.bin")
+
+    def _segment_bytes(self,key:str) -> int:
+        return sum((maximum-minimum+1)*DIGEST_SIZE for ranges in self.index[key]["Rounds"].values() for minimum,maximum in ranges)
+
+    def _missing(self,ranges:list[list[int]],minimum_nonce:int,maximum_nonce:int) -> list[tuple[int,int]]:
+        # Parts of the request that no cached range holds
+        missing:list[tuple[int,int]] = []
+        position:int = minimum_nonce
+        for cached_minimum,cached_maximum in ranges:
+            if(cached_maximum < position):
+                continue
+            if(cached_minimum > maximum_nonce):
+                break
+            if(cached_minimum > position):
+                missing.append((position,cached_minimum-1))
+            position = cached_maximum+1
+        if(position <= maximum_nonce):
+            missing.append((position,maximum_nonce))
+        return missing
+
+    def _join(self,key:str,round:int,minimum_nonce:int,maximum_nonce:int,hashed:dict[tuple[int,int],np.ndarray]) -> list[int]:
+        """
+        Joins the request and every cached range it meets into one file, filling the gaps from hashed.
+
+        Returns:
+            list[int]: The joined range.
+        """
+        ranges:list[list[int]] = self.index[key]["Rounds"][str(round)]
+        joined:list[list[int]] = [covered for covered in ranges if (covered[0] <= maximum_nonce+1) and (covered[1] >= minimum_nonce-1)]
+        if((len(joined) == 1) and (joined[0][0] <= minimum_nonce) and (joined[0][1] >= maximum_nonce)):
+            return joined[0]
+        low:int = min([minimum_nonce]+[covered[0] for covered in joined])
+        high:int = max([maximum_nonce]+[covered[1] for covered in joined])
+
+        # The joined range in nonce order, as cached files and hashed gaps
+        parts:list[tuple[bool,int,int]] = []
+        position:int = low
+        for cached_minimum,cached_maximum in joined:
+            if(cached_minimum > position):
+                parts.append((False,position,cached_minimum-1))
+            parts.append((True,cached_minimum,cached_maximum))
+            position = cached_maximum+1
+        if(position <= high):
+            parts.append((False,position,high))
+
+        path:str = self._round_path(key,round,low)
+        # A file that already starts the range only needs the rest appended, which keeps earlier views valid
+        appending:bool = parts[0][0]
+        output_path:str = path if appending else f"{path}.{os.getpid()}.tmp"
+        with open(output_path,"ab" if appending else "wb") as file:
+            for cached,part_minimum,part_maximum in parts[1:] if appending else parts:
+                if(cached):
+                    with open(self._round_path(key,round,part_minimum),"rb") as cached_file:
+                        while(chunk := cached_file.read(DIGEST_SIZE*65536)):
+                            file.write(chunk)
+                    continue
+                hashed_minimum,hashed_maximum = next(bounds for bounds in hashed if (bounds[0] <= part_minimum) and (part_maximum <= bounds[1]))
+                hashed[(hashed_minimum,hashed_maximum)][part_minimum-hashed_minimum:part_maximum-hashed_minimum+1].tofile(file)
+        if(not appending):
+            os.replace(output_path,path)
+        for cached_minimum,_ in joined[1:] if appending else joined:
+            os.remove(self._round_path(key,round,cached_minimum))
+
+        ranges[:] = sorted([covered for covered in ranges if covered not in joined]+[[low,high]])
+        return [low,high]
+
+    def _evict(self,keep_key:str) -> None:
+        total_bytes:int = sum(self._segment_bytes(key) for key in self.index)
+        for key in sorted(self.index,key=lambda key: self.index[key]["LastUsed"]):
+            if(total_bytes <= self.max_bytes):
+                break
+            if(key == keep_key):
+                continue
+            total_bytes -= self._segment_bytes(key)
+            for round,ranges in self.index[key]["Rounds"].items():
+                for minimum_nonce,_ in ranges:
+                    os.remove(self._round_path(key,int(round),minimum_nonce))
+            os.rmdir(os.path.join(self.directory,key))
+            del self.index[key]
+
+    def digests(self,server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,round:int=0,lane:bool=False) -> np.ndarray:
+        """
+        Returns one round of digests for a nonce range, hashing only what the cache does not hold yet.
+
+        Args:
+            server_seed: Unhashed server seed.
+            client_seed: Client seed.
+            minimum_nonce: First nonce of the range (inclusive).
+            maximum_nonce: Last nonce of the range (inclusive).
+            round: HMAC round, the ":round" suffix of the message.
+            lane: Hash what is missing with the lane kernel, as for compute_digests.
+
+        Returns:
+            np.ndarray: Read-only memory-mapped uint8 array of shape (nonces, 32).
+        """
+        server_seed_hashed:str = sha256_encrypt(server_seed)
+        key:str = self._segment_key(server_seed_hashed,client_seed)
+        hashed:dict[tuple[int,int],np.ndarray] = {}
+        while(True):
+            with locked_file(self.lock_path):
+                # Another run may have grown, added or evicted seed pairs since the index was last read
+                self.index = self._load_index()
+                if(key not in self.index):
+                    os.makedirs(os.path.join(self.directory,key),exist_ok=True)
+                    self.index[key] = {"ServerSeedHashed":server_seed_hashed,"ClientSeed":client_seed,"Rounds":{},"LastUsed":0}
+                ranges:list[list[int]] = self.index[key]["Rounds"].setdefault(str(round),[])
+                missing:list[tuple[int,int]] = [
+                    (low,high) for low,high in self._missing(ranges,minimum_nonce,maximum_nonce)
+                    if not any((bounds[0] <= low) and (high <= bounds[1]) for bounds in hashed)
+                ]
+                if(not missing):
+                    cached_minimum,cached_maximum = self._join(key,round,minimum_nonce,maximum_nonce,hashed)
+                    self.index[key]["LastUsed"] = time.time()
+                    self._evict(keep_key=key)
+                    self._save_index()
+                    digests:np.memmap = np.memmap(self._round_path(key,round,cached_minimum),dtype=np.uint8,mode="r",shape=(cached_maximum-cached_minimum+1,DIGEST_SIZE))
+                    return digests[minimum_nonce-cached_minimum:maximum_nonce-cached_minimum+1]
+            # Hashed without the lock, so runs over other seeds or nonces carry on meanwhile
+            for low,high in missing:
+                hashed[(low,high)] = compute_digests(server_seed,client_seed,low,high,round,lane)
+
+    def digest_matrix(self,server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,rounds:int=1,lane:bool=False) -> np.ndarray:
+        """
+        Cached counterpart of seeds_to_digest_matrix with the same (nonces, 32*rounds) uint8 layout.
+        """
+        if(rounds == 1):
+            return self.digests(server_seed,client_seed,minimum_nonce,maximum_nonce,lane=lane)
+        return np.hstack([self.digests(server_seed,client_seed,minimum_nonce,maximum_nonce,round,lane) for round in range(rounds)])
+
+_digest_cache:Digest_Cache|None = None
+
+def get_digest_cache() -> Digest_Cache:
+    # One cache per process so every game in a run shares the same index
+    global _digest_cache
+    if(_digest_cache is None):
+        _digest_cache = Digest_Cache()
+    return _digest_cache
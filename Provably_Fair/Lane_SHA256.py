@@ -0,0 +1,141 @@
+import hashlib
+import numpy as np
+from .Seed_Hasher import INNER_PAD,OUTER_PAD,SHA256_BLOCK_SIZE
+
+ROUND_CONSTANTS:np.ndarray = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+],dtype=np.uint32)
+INITIAL_STATE:np.ndarray = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+],dtype=np.uint32)
+DIGEST_SIZE:int = 32
+LANE_CHUNK_SIZE:int = 16384
+
+def _rotate_right(x:np.ndarray,bits:int) -> np.ndarray:
+    return (x >> np.uint32(bits)) | (x << np.uint32(32-bits))
+
+def compress(state:np.ndarray,block:np.ndarray) -> np.ndarray:
+    """
+    Runs one SHA-256 compression for every lane at once.
+
+    Args:
+        state: (8, N) uint32 chaining values, or (8, 1) to broadcast one midstate over every lane.
+        block: (16, N) uint32 big-endian message words.
+
+    Returns:
+        np.ndarray: (8, N) uint32 chaining values after the block.
+    """
+    schedule:list[np.ndarray] = list(block)
+    for index in range(16,64):
+        w15:np.ndarray = schedule[index-15]
+        w2:np.ndarray = schedule[index-2]
+        s0:np.ndarray = _rotate_right(w15,7) ^ _rotate_right(w15,18) ^ (w15 >> np.uint32(3))
+        s1:np.ndarray = _rotate_right(w2,17) ^ _rotate_right(w2,19) ^ (w2 >> np.uint32(10))
+        schedule.append(schedule[index-16] + s0 + schedule[index-7] + s1)
+
+    # Lanes that share a midstate and constant message words stay broadcast until they diverge
+    a,b,c,d,e,f,g,h = list(state)
+    for index in range(64):
+        s1 = _rotate_right(e,6) ^ _rotate_right(e,11) ^ _rotate_right(e,25)
+        choice:np.ndarray = g ^ (e & (f ^ g))
+        temp1:np.ndarray = h + s1 + choice + ROUND_CONSTANTS[index] + schedule[index]
+        s0 = _rotate_right(a,2) ^ _rotate_right(a,13) ^ _rotate_right(a,22)
+        majority:np.ndarray = (a & b) | (c & (a | b))
+        temp2:np.ndarray = s0 + majority
+        h = g
+        g = f
+        f = e
+        e = d + temp1
+        d = c
+        c = b
+        b = a
+        a = temp1 + temp2
+    return np.stack([a,b,c,d,e,f,g,h]) + state
+
+def _midstate(block:bytes) -> np.ndarray:
+    words:np.ndarray = np.frombuffer(block,dtype=">u4").astype(np.uint32).reshape(16,1)
+    return compress(INITIAL_STATE.reshape(8,1),words)
+
+def _padded_length(message_length:int) -> int:
+    # Message, the 0x80 marker and the 8 byte bit length, rounded up to whole blocks
+    return -(-(message_length+9)//SHA256_BLOCK_SIZE)*SHA256_BLOCK_SIZE
+
+class Lane_HMAC:
+    """
+    HMAC-SHA256 over many "client_seed:nonce:round" messages at once, one uint32 lane per nonce.
+
+    The server seed's inner and outer pad blocks are compressed once into midstates. Nonces are then
+    grouped by digit count so every group shares one fixed message layout, and the remaining inner
+    and outer blocks run as whole-array NumPy operations. Digests match hmac.new(...).digest().
+    """
+    def __init__(self,server_seed:str,client_seed:str):
+        key:bytes = server_seed.encode()
+        if(len(key) > SHA256_BLOCK_SIZE):
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(SHA256_BLOCK_SIZE,b"\x00")
+        self.inner_midstate:np.ndarray = _midstate(key.translate(INNER_PAD))
+        self.outer_midstate:np.ndarray = _midstate(key.translate(OUTER_PAD))
+        self.prefix:bytes = f"{client_seed}:".encode()
+
+    def _message_blocks(self,nonces:np.ndarray,digits:int,round:int) -> np.ndarray:
+        suffix:bytes = b":%d" % round
+        message_length:int = len(self.prefix)+digits+len(suffix)
+        padded_length:int = _padded_length(message_length)
+        template:bytearray = bytearray(padded_length)
+        template[:len(self.prefix)] = self.prefix
+        template[len(self.prefix)+digits:message_length] = suffix
+        template[message_length] = 0x80
+        template[-8:] = ((SHA256_BLOCK_SIZE+message_length)*8).to_bytes(8,"big")
+
+        messages:np.ndarray = np.tile(np.frombuffer(bytes(template),dtype=np.uint8),(len(nonces),1))
+        remaining:np.ndarray = nonces.copy()
+        for position in range(len(self.prefix)+digits-1,len(self.prefix)-1,-1):
+            messages[:,position] = (remaining % 10) + 48
+            remaining //= 10
+        return messages.view(">u4").astype(np.uint32).T
+
+    def _outer_blocks(self,inner_state:np.ndarray) -> np.ndarray:
+        block:np.ndarray = np.zeros((16,inner_state.shape[1]),dtype=np.uint32)
+        block[:8] = inner_state
+        block[8] = 0x80000000
+        block[15] = (SHA256_BLOCK_SIZE+DIGEST_SIZE)*8
+        return block
+
+    def _chunk_digests(self,nonces:np.ndarray,round:int) -> np.ndarray:
+        states:np.ndarray = np.empty((8,len(nonces)),dtype=np.uint32)
+        for digits in range(len(str(nonces[0])),len(str(nonces[-1]))+1):
+            group:np.ndarray = np.flatnonzero((nonces >= (10**(digits-1) if digits > 1 else 0)) & (nonces < 10**digits))
+            if(len(group) == 0):
+                continue
+            blocks:np.ndarray = self._message_blocks(nonces[group],digits,round)
+            inner_state:np.ndarray = self.inner_midstate
+            for index in range(0,blocks.shape[0],16):
+                inner_state = compress(inner_state,blocks[index:index+16])
+            states[:,group] = compress(self.outer_midstate,self._outer_blocks(inner_state))
+        return np.ascontiguousarray(states.T,dtype=">u4").view(np.uint8).reshape(len(nonces),DIGEST_SIZE)
+
+    def digests(self,minimum_nonce:int,maximum_nonce:int,round:int=0) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: uint8 array of shape (nonces, 32), one HMAC digest per nonce in order.
+        """
+        nonces:np.ndarray = np.arange(minimum_nonce,maximum_nonce+1,dtype=np.int64)
+        digests:np.ndarray = np.empty((len(nonces),DIGEST_SIZE),dtype=np.uint8)
+        # Lanes are run in chunks so the 64 round temporaries stay cache sized
+        for start in range(0,len(nonces),LANE_CHUNK_SIZE):
+            digests[start:start+LANE_CHUNK_SIZE] = self._chunk_digests(nonces[start:start+LANE_CHUNK_SIZE],round)
+        return digests
+
+def lane_digest_matrix(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,rounds:int=1) -> np.ndarray:
+    """
+    Lane-parallel counterpart of seeds_to_digest_matrix with the same (nonces, 32*rounds) uint8 layout.
+    """
+    lanes:Lane_HMAC = Lane_HMAC(server_seed=server_seed,client_seed=client_seed)
+    return np.hstack([lanes.digests(minimum_nonce,maximum_nonce,round) for round in range(rounds)])
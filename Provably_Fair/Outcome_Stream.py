@@ -0,0 +1,186 @@
+import asyncio
+import argparse
+import numpy as np
+from concurrent.futures import Executor
+from typing import AsyncIterator,Callable,Iterator
+from .Byte_Cursor import WORDS_PER_ROUND
+from .Batch_Decoder import digests_to_numbers
+from .Digest_Cache import compute_digests,get_digest_cache
+
+DEFAULT_BLOCK_SIZE:int = 10_000
+DEFAULT_QUEUE_SIZE:int = 4
+
+def decode_plinko(digests:np.ndarray,rows:int=16) -> np.ndarray:
+    """
+    Prize index of every nonce, the number of rows where the ball falls right.
+
+    next_number(2) of a word is its top bit, which is the top bit of the word's first byte, so the words
+    are never assembled: those bytes are masked, packed 8 rows to a 64 bit integer and popcounted.
+    """
+    digests = np.ascontiguousarray(digests,dtype=np.uint8)
+    if(4*rows > digests.shape[1]):
+        raise ValueError(f"Requested {rows} rows but the digests only hold {digests.shape[1]//4} words")
+    top_bytes:np.ndarray = np.zeros((len(digests),-(-rows//8)*8),dtype=np.uint8)
+    top_bytes[:,:rows] = digests[:,0:4*rows:4] & np.uint8(0x80)
+    if(not hasattr(np,"bitwise_count")):
+        # NumPy before 2.0 has no popcount, so the masked bits are unpacked and summed instead
+        return np.unpackbits(top_bytes,axis=1).sum(axis=1,dtype=np.int64)
+    return np.bitwise_count(top_bytes.view(np.uint64)).sum(axis=1,dtype=np.int64)
+
+def decode_dice(digests:np.ndarray) -> np.ndarray:
+    return np.round(digests_to_numbers(digests,10001,1)[:,0]/100,2)
+
+def decode_limbo(digests:np.ndarray) -> np.ndarray:
+    numbers:np.ndarray = digests_to_numbers(digests,16777216,1)[:,0]
+    return np.floor(((16777216)/(numbers+1)*(1-0.01))*100)/100
+
+def decode_roulette(digests:np.ndarray) -> np.ndarray:
+    return digests_to_numbers(digests,37,1)[:,0]
+
+def decode_wheel(digests:np.ndarray,segments:int=10) -> np.ndarray:
+    return digests_to_numbers(digests,segments,1)[:,0]
+
+GAME_DECODERS:dict[str,tuple[Callable[...,np.ndarray],Callable[...,int]]] = {
+    # Game: (decoder, words needed per nonce for the game options)
+    "Plinko": (decode_plinko,lambda rows=16: rows),
+    "Dice": (decode_dice,lambda: 1),
+    "Limbo": (decode_limbo,lambda: 1),
+    "Roulette": (decode_roulette,lambda: 1),
+    "Wheel": (decode_wheel,lambda segments=10: 1),
+}
+
+def decode_block(game:str,server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,cache:bool=False,lane:bool=False,**game_options) -> np.ndarray:
+    """
+    Hashes and decodes one block of nonces into the raw game outcome of each nonce.
+
+    Args:
+        cache: Read the digests from the shared Digest_Cache, hashing only nonces it does not hold yet.
+        lane: Hash large blocks with the lane kernel, see compute_digests.
+
+    Returns:
+        np.ndarray: Prize index for Plinko, roll for Dice, multiplier for Limbo, pocket for Roulette
+            and segment index for Wheel, one per nonce.
+    """
+    decoder,words_needed = GAME_DECODERS[game]
+    rounds:int = -(-words_needed(**game_options)//WORDS_PER_ROUND)
+    if(cache):
+        digests:np.ndarray = get_digest_cache().digest_matrix(server_seed,client_seed,minimum_nonce,maximum_nonce,rounds,lane)
+    else:
+        digests:np.ndarray = np.hstack([compute_digests(server_seed,client_seed,minimum_nonce,maximum_nonce,round,lane) for round in range(rounds)])
+    return decoder(digests,**game_options)
+
+def parse_digest_options() -> dict[str,bool]:
+    """
+    Returns:
+        dict: cache and lane arguments for decode_block, both off unless asked for on the command line.
+    """
+    parser:argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--cache",action="store_true",help="Keep digests in the shared Digest_Cache folder, so later runs over the same seeds skip hashing them")
+    parser.add_argument("--lane",action="store_true",help="Hash blocks of 100,000 nonces or more with the lane-parallel NumPy kernel")
+    arguments:argparse.Namespace = parser.parse_known_args()[0]
+    return {"cache":arguments.cache,"lane":arguments.lane}
+
+class Outcome_Aggregate:
+    """
+    Running totals over every outcome streamed so far, sent along with each block.
+    """
+    def __init__(self,total:int):
+        self.current:int = 0
+        self.total:int = total
+        self.outcome_sum:float = 0
+        self.minimum:float|None = None
+        self.maximum:float|None = None
+        self.counts:np.ndarray = np.zeros(0,dtype=np.int64)
+
+    def add_block(self,outcomes:np.ndarray) -> None:
+        self.current += len(outcomes)
+        self.outcome_sum += float(outcomes.sum())
+        self.minimum = float(outcomes.min()) if self.minimum is None else min(self.minimum,float(outcomes.min()))
+        self.maximum = float(outcomes.max()) if self.maximum is None else max(self.maximum,float(outcomes.max()))
+        if(outcomes.dtype.kind == "i"):
+            block_counts:np.ndarray = np.bincount(outcomes)
+            if(len(block_counts) > len(self.counts)):
+                self.counts = np.pad(self.counts,(0,len(block_counts)-len(self.counts)))
+            self.counts[:len(block_counts)] += block_counts
+
+    def to_dict(self) -> dict[str,int|float|list[int]|None]:
+        return {
+            "current": self.current,
+            "total": self.total,
+            "mean": self.outcome_sum/self.current if self.current else None,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "counts": self.counts.tolist(),
+        }
+
+async def stream_outcomes(game:str,server_seed:str,client_seed:str,start:int,end:int,block_size:int=DEFAULT_BLOCK_SIZE,queue_size:int=DEFAULT_QUEUE_SIZE,executor:Executor|None=None,**game_options) -> AsyncIterator[dict]:
+    """
+    Streams decoded outcomes for nonces start..end in blocks, hashing on an executor.
+
+    A producer task decodes the next block while the consumer handles the current one, but never
+    more than queue_size blocks ahead: the bounded queue makes the consumer set the pace.
+
+    Args:
+        game: A GAME_DECODERS key.
+        server_seed: Unhashed server seed.
+        client_seed: Client seed.
+        start: First nonce (inclusive).
+        end: Last nonce (inclusive).
+        block_size: Nonces per block.
+        queue_size: Decoded blocks allowed to wait for the consumer.
+        executor: Where blocks are hashed and decoded, the loop's default thread pool when None.
+        **game_options: rows for Plinko, segments for Wheel, and cache and lane as for decode_block.
+
+    Yields:
+        dict: {"nonces", "outcomes"} NumPy arrays for the block, "progress" with the nonces done so far
+            and "aggregate" with Outcome_Aggregate totals over every block up to this one.
+    """
+    if(game not in GAME_DECODERS):
+        raise ValueError(f"Unknown game {game}. Expected one of {', '.join(GAME_DECODERS)}")
+    loop:asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    queue:asyncio.Queue = asyncio.Queue(maxsize=max(1,queue_size))
+    finished:object = object()
+
+    async def produce() -> None:
+        try:
+            for low in range(start,end+1,block_size):
+                high:int = min(low+block_size-1,end)
+                outcomes:np.ndarray = await loop.run_in_executor(executor,lambda: decode_block(game,server_seed,client_seed,low,high,**game_options))
+                await queue.put((low,high,outcomes))
+            await queue.put(finished)
+        except Exception as error:
+            await queue.put(error)
+
+    producer:asyncio.Task = asyncio.create_task(produce())
+    aggregate:Outcome_Aggregate = Outcome_Aggregate(total=end-start+1)
+    try:
+        while((item := await queue.get()) is not finished):
+            if(isinstance(item,Exception)):
+                raise item
+            low,high,outcomes = item
+            aggregate.add_block(outcomes)
+            yield {
+                "nonces": np.arange(low,high+1),
+                "outcomes": outcomes,
+                "progress": {"current": aggregate.current,"total": aggregate.total},
+                "aggregate": aggregate.to_dict(),
+            }
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer,return_exceptions=True)
+
+def iterate_outcomes(stream:AsyncIterator[dict]) -> Iterator[dict]:
+    """
+    Drives an outcome stream from synchronous code such as a WSGI response generator, on a private event loop.
+    """
+    loop:asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        while(True):
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(stream.aclose())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
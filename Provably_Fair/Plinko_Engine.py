@@ -0,0 +1,42 @@
+import numpy as np
+from .Outcome_Stream import decode_block
+
+# Nonce lists kept for the biggest prizes, from the outside buckets inwards
+PRIZE_TIERS:list[str] = ["largest_prize","second_largest_prize","third_largest_prize"]
+
+class Plinko_Engine:
+    """
+    Plinko for one risk and row count, with the multiplier of every bucket resolved once.
+
+    A block of nonces is hashed and decoded into prize indexes in one go, and everything else about a
+    game is a lookup by prize index: the multiplier, whether it wins and which prize tier it lands in.
+    Multipliers are also kept as the Python numbers of the table, so rows built from them print the
+    same as rows built one game at a time.
+    """
+    def __init__(self,multipliers:list[int|float]):
+        self.rows:int = len(multipliers)-1
+        self.multipliers:np.ndarray = np.array(multipliers,dtype=object)
+        self.multiplier_vector:np.ndarray = np.array(multipliers,dtype=np.float64)
+        self.wins:np.ndarray = self.multiplier_vector >= 1
+        # Index into PRIZE_TIERS of every prize index, -1 outside them, checked in the same order as the game loops
+        self.prize_tiers:np.ndarray = np.full(self.rows+1,-1,dtype=np.int64)
+        for prize_index in range(self.rows+1):
+            for tier,indexes in enumerate(([0,self.rows+1],[1,self.rows],[2,self.rows-1])):
+                if(prize_index in indexes):
+                    self.prize_tiers[prize_index] = tier
+                    break
+
+    def prize_indexes(self,server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,cache:bool=False,lane:bool=False) -> np.ndarray:
+        return decode_block("Plinko",server_seed,client_seed,minimum_nonce,maximum_nonce,cache=cache,lane=lane,rows=self.rows)
+
+    def play(self,server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,cache:bool=False,lane:bool=False) -> tuple[np.ndarray,np.ndarray]:
+        """
+        Args:
+            cache: Read the digests from the shared Digest_Cache, as for decode_block.
+            lane: Hash large blocks with the lane kernel, as for decode_block.
+
+        Returns:
+            tuple[np.ndarray,np.ndarray]: Prize index and multiplier of every nonce from minimum_nonce to maximum_nonce.
+        """
+        prize_indexes:np.ndarray = self.prize_indexes(server_seed,client_seed,minimum_nonce,maximum_nonce,cache,lane)
+        return prize_indexes,self.multipliers[prize_indexes]
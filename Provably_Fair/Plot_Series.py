@@ -0,0 +1,58 @@
+import numpy as np
+
+PLOT_BUCKETS:int = 4_000
+
+class Plot_Series:
+    """
+    Fixed-size stand-in for a cumulative series that is only ever plotted, fed one block at a time.
+
+    The x range is cut into at most `buckets` equal buckets and each bucket keeps its first, lowest, highest
+    and last point in order. A line through the kept points draws the same as the full series once a
+    bucket is narrower than a pixel, and the first highest and first lowest points of the whole series
+    are always kept. A series with no more points than buckets is kept whole. y may also hold several
+    series as columns sharing the same x, in which case every bucket keeps the extremes of each column.
+    """
+    def __init__(self,total:int,buckets:int=PLOT_BUCKETS):
+        self.width:int = max(1,-(-total//buckets))
+        self.pending_x:np.ndarray = np.zeros(0,dtype=np.int64)
+        self.pending_y:np.ndarray|None = None
+        self.kept_x:list[np.ndarray] = []
+        self.kept_y:list[np.ndarray] = []
+
+    def _keep(self,x:np.ndarray,y:np.ndarray,width:int) -> None:
+        # x and y hold whole buckets of width points each
+        buckets:np.ndarray = y.reshape(len(y)//width,width,-1)
+        columns:np.ndarray = np.concatenate((
+            np.zeros((len(buckets),1),dtype=np.int64),
+            np.argmin(buckets,axis=1),
+            np.argmax(buckets,axis=1),
+            np.full((len(buckets),1),width-1),
+        ),axis=1)
+        columns.sort(axis=1)
+        # A point that is both the first and the lowest of its bucket is only kept once
+        distinct:np.ndarray = np.ones(columns.shape,dtype=bool)
+        distinct[:,1:] = columns[:,1:] != columns[:,:-1]
+        positions:np.ndarray = (columns+np.arange(len(buckets))[:,None]*width)[distinct]
+        self.kept_x.append(x[positions])
+        self.kept_y.append(y[positions])
+
+    def add(self,x:np.ndarray,y:np.ndarray) -> None:
+        x = np.concatenate((self.pending_x,x))
+        y = y if self.pending_y is None else np.concatenate((self.pending_y,y))
+        complete:int = (len(y)//self.width)*self.width
+        if(complete):
+            self._keep(x[:complete],y[:complete],self.width)
+        self.pending_x,self.pending_y = x[complete:],y[complete:]
+
+    def points(self) -> tuple[np.ndarray,np.ndarray]:
+        """
+        Returns:
+            tuple[np.ndarray,np.ndarray]: The kept x and y values in order, including the last partial bucket.
+            y has one column per series when several were added.
+        """
+        if((self.pending_y is not None) and len(self.pending_y)):
+            self._keep(self.pending_x,self.pending_y,len(self.pending_y))
+            self.pending_x,self.pending_y = self.pending_x[:0],self.pending_y[:0]
+        if(not self.kept_y):
+            return np.zeros(0,dtype=np.int64),np.zeros(0,dtype=np.float64)
+        return np.concatenate(self.kept_x),np.concatenate(self.kept_y)
@@ -0,0 +1,167 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import numpy as np
+from .Byte_Cursor import sha256_encrypt
+from .Batch_Decoder import digests_to_words
+from .Cutoffs import DICE_MODULUS,compile_limbo_cutoff,first_word_with_number
+from .Digest_Cache import compute_digests,get_digest_cache
+
+DEFAULT_INDEX_DIRECTORY:str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Rare_Outcome_Index")
+SCAN_BLOCK_SIZE:int = 1_000_000
+INDEX_FILE:str = "index.json"
+
+# An outcome is every nonce whose first word falls in [low, high)
+Word_Range = tuple[int,int]
+
+def dice_roll_words(roll:float) -> Word_Range:
+    """
+    Words that roll exactly roll on Dice, e.g. 100.00 or 0.00.
+    """
+    number:int = round(roll*100)
+    return first_word_with_number(DICE_MODULUS,number),first_word_with_number(DICE_MODULUS,number+1)
+
+def limbo_multiplier_words(target_multiplier:float,strictly_above:bool=False) -> Word_Range:
+    """
+    Words whose Limbo result reaches target_multiplier, or exceeds it when strictly_above.
+    """
+    return 0,compile_limbo_cutoff(target_multiplier,strictly_above)
+
+def scan_words(words:np.ndarray,word_ranges:list[Word_Range],minimum_nonce:int) -> list[np.ndarray]:
+    # Comparing raw words against integer cutoffs skips building the game result for every nonce
+    return [np.flatnonzero((words >= np.uint64(low)) & (words < np.uint64(high)))+minimum_nonce for low,high in word_ranges]
+
+class Rare_Outcome_Index:
+    """
+    On-disk index of the nonces that land on a rare outcome, such as a perfect Dice roll or a 1,000,000x Limbo result.
+
+    Each seed pair gets one folder keyed like the digest cache, holding one sorted array of nonces per word
+    range. The index records the nonce range it has scanned for every word range, so a query inside that
+    range is a binary search over the saved hits, and a query outside it only scans the missing nonces.
+    """
+    def __init__(self,directory:str=DEFAULT_INDEX_DIRECTORY,use_digest_cache:bool=True,lane:bool=False):
+        self.directory:str = directory
+        self.use_digest_cache:bool = use_digest_cache
+        self.lane:bool = lane
+        os.makedirs(self.directory,exist_ok=True)
+        self.index_path:str = os.path.join(self.directory,INDEX_FILE)
+        self.index:dict[str,dict] = self._load_index()
+
+    def _load_index(self) -> dict[str,dict]:
+        if(not os.path.exists(self.index_path)):
+            return {}
+        with open(self.index_path,"rb") as file:
+            return json.load(file)
+
+    def _save_index(self) -> None:
+        temporary_path:str = f"{self.index_path}.tmp"
+        with open(temporary_path,"w") as file:
+            json.dump(self.index,file,indent=4)
+        os.replace(temporary_path,self.index_path)
+
+    def _segment_key(self,server_seed_hashed:str,client_seed:str) -> str:
+        return hashlib.sha256(f"{server_seed_hashed}:{client_seed}".encode()).hexdigest()[:32]
+
+    def _hits_path(self,key:str,word_range:Word_Range) -> str:
+        return os.path.join(self.directory,key,f"words_{word_range[0]}_{word_range[1]}.npy")
+
+    def _first_words(self,server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int) -> np.ndarray:
+        if(self.use_digest_cache):
+            digests:np.ndarray = get_digest_cache().digests(server_seed,client_seed,minimum_nonce,maximum_nonce,lane=self.lane)
+        else:
+            digests:np.ndarray = compute_digests(server_seed,client_seed,minimum_nonce,maximum_nonce,lane=self.lane)
+        return digests_to_words(digests,1)[:,0]
+
+    def _scan(self,server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,word_ranges:list[Word_Range]) -> list[np.ndarray]:
+        hits:list[list[np.ndarray]] = [[] for _ in word_ranges]
+        for low in range(minimum_nonce,maximum_nonce+1,SCAN_BLOCK_SIZE):
+            high:int = min(low+SCAN_BLOCK_SIZE-1,maximum_nonce)
+            words:np.ndarray = self._first_words(server_seed,client_seed,low,high)
+            for found,block_hits in zip(hits,scan_words(words,word_ranges,low)):
+                found.append(block_hits)
+        return [np.concatenate(found) if found else np.zeros(0,dtype=np.int64) for found in hits]
+
+    def _fill(self,server_seed:str,client_seed:str,key:str,minimum_nonce:int,maximum_nonce:int,word_ranges:list[Word_Range]) -> None:
+        # Word ranges that need the same nonces scanned share one pass over the digests
+        missing:dict[tuple[int,int],list[Word_Range]] = {}
+        for word_range in dict.fromkeys(word_ranges):
+            covered:list[int]|None = self.index[key]["Outcomes"].get(f"{word_range[0]}_{word_range[1]}")
+            if(covered is None):
+                missing.setdefault((minimum_nonce,maximum_nonce),[]).append(word_range)
+                continue
+            # Gaps between the scanned range and the request are scanned too so every range stays contiguous
+            if(maximum_nonce > covered[1]):
+                missing.setdefault((covered[1]+1,maximum_nonce),[]).append(word_range)
+            if(minimum_nonce < covered[0]):
+                missing.setdefault((minimum_nonce,covered[0]-1),[]).append(word_range)
+
+        for (low,high),scanned_ranges in sorted(missing.items()):
+            for word_range,found in zip(scanned_ranges,self._scan(server_seed,client_seed,low,high,scanned_ranges)):
+                name:str = f"{word_range[0]}_{word_range[1]}"
+                path:str = self._hits_path(key,word_range)
+                covered:list[int]|None = self.index[key]["Outcomes"].get(name)
+                if(covered is None):
+                    hits:np.ndarray = found
+                    covered = [low,high]
+                elif(low > covered[1]):
+                    hits:np.ndarray = np.concatenate((np.load(path),found))
+                    covered = [covered[0],high]
+                else:
+                    hits:np.ndarray = np.concatenate((found,np.load(path)))
+                    covered = [low,covered[1]]
+                np.save(path,hits.astype(np.int64))
+                self.index[key]["Outcomes"][name] = covered
+
+    def nonces(self,server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,word_ranges:list[Word_Range]) -> list[np.ndarray]:
+        """
+        Nonces in a range whose first word falls in each word range, scanning only what the index does not hold yet.
+
+        Args:
+            server_seed: Unhashed server seed.
+            client_seed: Client seed.
+            minimum_nonce: First nonce of the range (inclusive).
+            maximum_nonce: Last nonce of the range (inclusive).
+            word_ranges: Word ranges from dice_roll_words or limbo_multiplier_words.
+
+        Returns:
+            list[np.ndarray]: Sorted int64 nonces, one array per word range.
+        """
+        server_seed_hashed:str = sha256_encrypt(server_seed)
+        key:str = self._segment_key(server_seed_hashed,client_seed)
+        if(key not in self.index):
+            os.makedirs(os.path.join(self.directory,key),exist_ok=True)
+            self.index[key] = {"ServerSeedHashed":server_seed_hashed,"ClientSeed":client_seed,"Outcomes":{},"LastUsed":0}
+        self._fill(server_seed,client_seed,key,minimum_nonce,maximum_nonce,word_ranges)
+        self.index[key]["LastUsed"] = time.time()
+        self._save_index()
+
+        found:list[np.ndarray] = []
+        for word_range in word_ranges:
+            hits:np.ndarray = np.load(self._hits_path(key,word_range),mmap_mode="r")
+            found.append(np.array(hits[np.searchsorted(hits,minimum_nonce,side="left"):np.searchsorted(hits,maximum_nonce,side="right")]))
+        return found
+
+def parse_rare_outcome_arguments(arguments:list[str]|None=None) -> argparse.Namespace:
+    parser:argparse.ArgumentParser = argparse.ArgumentParser(description="List the nonces of a seed pair that land on rare outcomes")
+    parser.add_argument("server_seed")
+    parser.add_argument("client_seed")
+    parser.add_argument("minimum_nonce",type=int)
+    parser.add_argument("maximum_nonce",type=int)
+    parser.add_argument("--dice",nargs="*",type=float,default=[],help="Dice rolls to find, e.g. 0 100")
+    parser.add_argument("--limbo",nargs="*",type=float,default=[],help="Limbo multipliers to find results at or above, e.g. 1000000")
+    parser.add_argument("--lane",action="store_true",help="Hash the scan with the lane-parallel NumPy kernel")
+    return parser.parse_args(arguments)
+
+if __name__ == "__main__":
+    arguments:argparse.Namespace = parse_rare_outcome_arguments()
+    labels:list[str] = [f"Dice {roll:.2f}" for roll in arguments.dice]+[f"Limbo {target:,.2f}x or more" for target in arguments.limbo]
+    word_ranges:list[Word_Range] = [dice_roll_words(roll) for roll in arguments.dice]+[limbo_multiplier_words(target) for target in arguments.limbo]
+    if(not word_ranges):
+        sys.exit("Pass at least one --dice roll or --limbo multiplier")
+    index:Rare_Outcome_Index = Rare_Outcome_Index(lane=arguments.lane)
+    for label,found in zip(labels,index.nonces(arguments.server_seed,arguments.client_seed,arguments.minimum_nonce,arguments.maximum_nonce,word_ranges)):
+        print(f"{label}: {len(found):,} nonces")
+        print(", ".join(str(nonce) for nonce in found.tolist()))
@@ -0,0 +1,36 @@
+from pandas import DataFrame
+from typing import Iterable
+from .Run_Fingerprint import Run_Fingerprint
+
+JSON_END:str = "\n    ]\n}"
+
+def write_result_frames(frames:Iterable[DataFrame],csv_path:str,json_path:str,columns:list[str],csv_index:bool=True,fingerprint:Run_Fingerprint|None=None) -> None:
+    """
+    Writes result blocks to one CSV and one table-orient JSON file, the same as writing a single DataFrame.
+
+    Each block is written as soon as it is produced, so only one block is held at a time. Blocks must
+    carry the index they would have in the whole table.
+
+    Args:
+        frames: Result blocks in nonce order.
+        csv_path: Path of the CSV file.
+        json_path: Path of the JSON file.
+        columns: Column names, used for the header when there are no blocks.
+        csv_index: Whether the CSV has an index column.
+        fingerprint: Hashes both files as they are written, when given.
+    """
+    open_file = open if fingerprint is None else fingerprint.open
+    with open_file(csv_path,"w",newline="") as csv_file,open_file(json_path,"w") as json_file:
+        first:bool = True
+        for frame in frames:
+            frame.to_csv(csv_file,header=first,index=csv_index)
+            head,separator,records = frame.to_json(orient='table',indent=4).partition('"data":[\n')
+            json_file.write(head+separator if first else ",\n")
+            json_file.write(records[:-len(JSON_END)])
+            first = False
+        if(first):
+            empty_frame:DataFrame = DataFrame([],columns=columns)
+            empty_frame.to_csv(csv_file,index=csv_index)
+            json_file.write(empty_frame.to_json(orient='table',indent=4))
+        else:
+            json_file.write(JSON_END)
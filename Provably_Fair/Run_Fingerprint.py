@@ -0,0 +1,102 @@
+import os
+import sys
+import json
+import hashlib
+import io
+from typing import Any,BinaryIO,TextIO
+
+REPOSITORY_DIRECTORY:str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def file_sha256(path:str) -> str:
+    digest = hashlib.sha256()
+    with open(path,"rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20),b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def loaded_source_paths(script_path:str,package:str="Provably_Fair") -> list[str]:
+    """
+    The simulation script and every module of package it has imported, which together decide what a run produces.
+    """
+    paths:set[str] = {os.path.abspath(script_path)}
+    for name,module in list(sys.modules.items()):
+        if((name == package or name.startswith(f"{package}.")) and getattr(module,"__file__",None)):
+            paths.add(os.path.abspath(module.__file__))
+    return sorted(paths)
+
+WRITE_BUFFER_SIZE:int = 1 << 20
+
+class Hashing_Stream(io.RawIOBase):
+    """
+    Binary file stand-in that hashes everything written through it on the way to the real file.
+    """
+    def __init__(self,file:BinaryIO,fingerprint:"Run_Fingerprint",name:str):
+        self.file:BinaryIO = file
+        self.fingerprint:Run_Fingerprint = fingerprint
+        self.name:str = name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self,data:bytes) -> int:
+        self.fingerprint.update(self.name,data)
+        return self.file.write(data)
+
+    def close(self) -> None:
+        if(not self.closed):
+            self.file.close()
+        super().close()
+
+class Run_Fingerprint:
+    """
+    Running SHA-256 of every output file of a run, with the configuration and source code that produced it.
+
+    Output is fed in as it is written, so the cost is one hash pass over bytes that are being written
+    anyway and nothing is kept in memory. Each output digest equals the SHA-256 of the finished file,
+    so a single file can be checked with any sha256 tool. Two runs produced identical output when their
+    "Outputs" match, and ran the same code on the same configuration too when their "Fingerprint" matches.
+    """
+    def __init__(self,configuration:dict[str,Any],source_paths:list[str]):
+        self.configuration_hash:str = hashlib.sha256(json.dumps(configuration,sort_keys=True).encode("utf-8")).hexdigest()
+        self.code_hashes:dict[str,str] = {
+            os.path.relpath(path,REPOSITORY_DIRECTORY).replace(os.sep,"/"):file_sha256(path) for path in source_paths
+        }
+        self.outputs:dict[str,Any] = {}
+        self.sizes:dict[str,int] = {}
+
+    def update(self,name:str,data:bytes) -> None:
+        if(name not in self.outputs):
+            self.outputs[name] = hashlib.sha256()
+            self.sizes[name] = 0
+        self.outputs[name].update(data)
+        self.sizes[name] += len(data)
+
+    def open(self,path:str,mode:str="w",newline:str|None=None) -> TextIO:
+        """
+        Opens path for writing text, like the built-in open, hashing the encoded bytes under the file's name.
+        """
+        if(mode != "w"):
+            raise ValueError(f"Fingerprinted files can only be opened with mode 'w', not {mode!r}")
+        # The text layer buffers in C, so the hash sees a few large writes instead of one per row
+        stream:io.BufferedWriter = io.BufferedWriter(Hashing_Stream(open(path,"wb"),self,os.path.basename(path)),buffer_size=WRITE_BUFFER_SIZE)
+        return io.TextIOWrapper(stream,newline=newline,write_through=False)
+
+    def manifest(self) -> dict[str,Any]:
+        """
+        Returns:
+            dict: Configuration hash, source file hashes, SHA-256 and size of every output, and one
+            "Fingerprint" hash over all of them.
+        """
+        manifest:dict[str,Any] = {
+            "Configuration":self.configuration_hash,
+            "Code":dict(sorted(self.code_hashes.items())),
+            "Outputs":{name:{"SHA256":self.outputs[name].hexdigest(),"Bytes":self.sizes[name]} for name in sorted(self.outputs)},
+        }
+        manifest["Fingerprint"] = hashlib.sha256(json.dumps(manifest,sort_keys=True).encode("utf-8")).hexdigest()
+        return manifest
+
+    def save(self,path:str) -> dict[str,Any]:
+        manifest:dict[str,Any] = self.manifest()
+        with open(path,"w") as file:
+            json.dump(manifest,file,indent=4)
+        return manifest
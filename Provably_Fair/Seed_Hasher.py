@@ -0,0 +1,44 @@
+import hashlib
+from functools import lru_cache
+
+SHA256_BLOCK_SIZE:int = 64
+INNER_PAD:bytes = bytes((x ^ 0x36) for x in range(256))
+OUTER_PAD:bytes = bytes((x ^ 0x5C) for x in range(256))
+
+class Seed_Hasher:
+    """
+    HMAC-SHA256 keyed once for a single server/client seed pair.
+
+    hmac.new re-derives the inner and outer key pads from the server seed on every call. This class
+    absorbs both pads into SHA-256 states up front, so each digest costs two state copies and two
+    updates, and every message is built from a cached b"{client_seed}:" prefix.
+    """
+    def __init__(self,server_seed:str,client_seed:str):
+        key:bytes = server_seed.encode()
+        if(len(key) > SHA256_BLOCK_SIZE):
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(SHA256_BLOCK_SIZE,b"\x00")
+        self.inner = hashlib.sha256(key.translate(INNER_PAD))
+        self.outer = hashlib.sha256(key.translate(OUTER_PAD))
+        self.prefix:bytes = f"{client_seed}:".encode()
+
+    def nonce_prefix(self,nonce:int) -> bytes:
+        return self.prefix + b"%d:" % nonce
+
+    def digest_message(self,message:bytes) -> bytes:
+        inner = self.inner.copy()
+        inner.update(message)
+        outer = self.outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def digest(self,nonce:int,round:int=0) -> bytes:
+        return self.digest_message(self.nonce_prefix(nonce) + b"%d" % round)
+
+    def digests(self,nonce:int,rounds:int=1) -> bytes:
+        nonce_prefix:bytes = self.nonce_prefix(nonce)
+        return b"".join([self.digest_message(nonce_prefix + b"%d" % x) for x in range(rounds)])
+
+@lru_cache(maxsize=64)
+def get_seed_hasher(server_seed:str,client_seed:str) -> Seed_Hasher:
+    return Seed_Hasher(server_seed=server_seed,client_seed=client_seed)
@@ -0,0 +1,264 @@
+import argparse
+import numpy as np
+from collections import Counter,defaultdict
+from concurrent.futures import Executor,ProcessPoolExecutor
+from contextlib import nullcontext
+from math import floor,fsum
+from typing import Any,Callable
+
+SHARDS_PER_WORKER:int = 4
+
+class Shard_Summary:
+    """
+    Mergeable win/loss totals for one contiguous nonce range.
+
+    A streak is only counted once a game of the other outcome closes it, the same as in every
+    simulation loop. The first run of a shard is kept apart as the leading run, because a shard
+    further left may extend it. The last run stays open as the trailing run. Merging two neighbouring
+    summaries joins the left trailing run to the right leading run, so a merged summary matches one
+    built from a single pass over both ranges.
+    """
+    def __init__(self,minimum_nonce:int):
+        self.minimum_nonce:int = minimum_nonce
+        self.games:int = 0
+        self.wins:int = 0
+        self.losses:int = 0
+        # Exact sum of the payouts as non-overlapping floats, as math.fsum keeps it, so any split adds up the same
+        self.payout_partials:list[float] = []
+        self.nonce_lists:defaultdict[str,list[str]] = defaultdict(list)
+        self.rows:list[list[Any]] = []
+        self.leading:tuple[bool,int]|None = None
+        self.trailing:tuple[bool,int,int]|None = None
+        self.biggest_streaks:dict[bool,tuple[int,int]] = {True:(0,0),False:(0,0)}
+        self.streak_sizes:dict[bool,Counter] = {True:Counter(),False:Counter()}
+
+    def _close_streak(self,win:bool,start_nonce:int,length:int) -> None:
+        if(start_nonce == self.minimum_nonce):
+            self.leading = (win,length)
+            return
+        if(length > self.biggest_streaks[win][1]):
+            self.biggest_streaks[win] = (start_nonce,length)
+        self.streak_sizes[win][length] += 1
+
+    def add(self,nonce:int,win:bool,payout:float=0) -> None:
+        """
+        Records the next game of the range.
+
+        Args:
+            nonce: Nonce of the game, one past the last nonce added.
+            win: Whether the game counts as a win for streaks.
+            payout: Multiplier paid out by the game, 0 when nothing is paid.
+        """
+        self.games += 1
+        if(win):
+            self.wins += 1
+        else:
+            self.losses += 1
+        if(payout != 0):
+            self._add_partial(payout)
+        if(self.trailing is None):
+            self.trailing = (win,nonce,1)
+        elif(self.trailing[0] == win):
+            self.trailing = (win,self.trailing[1],self.trailing[2]+1)
+        else:
+            self._close_streak(*self.trailing)
+            self.trailing = (win,nonce,1)
+
+    def _add_partial(self,payout:float) -> None:
+        # Shewchuk's exact addition: every rounding error is kept as a smaller partial
+        kept:int = 0
+        for partial in self.payout_partials:
+            if(abs(payout) < abs(partial)):
+                payout,partial = partial,payout
+            high:float = payout+partial
+            low:float = partial-(high-payout)
+            if(low != 0):
+                self.payout_partials[kept] = low
+                kept += 1
+            payout = high
+        self.payout_partials[kept:] = [payout]
+
+    def add_payouts(self,payout:float,count:int) -> None:
+        """
+        Adds count games paying the same multiplier, exactly as adding them one by one.
+        """
+        # payout*2**bit is exact, so one addition per set bit of count
+        for bit in range(count.bit_length()):
+            if((count >> bit) & 1):
+                self._add_partial(payout*2**bit)
+
+    @classmethod
+    def from_wins(cls,minimum_nonce:int,wins:np.ndarray) -> "Shard_Summary":
+        """
+        Builds the summary of a whole block of win flags at once, the same as calling add() for each game in turn.
+
+        Args:
+            minimum_nonce: Nonce of wins[0].
+            wins: Boolean win flag of every game in the block.
+        """
+        summary:Shard_Summary = cls(minimum_nonce)
+        summary.games = len(wins)
+        summary.wins = int(np.count_nonzero(wins))
+        summary.losses = summary.games-summary.wins
+        if(summary.games == 0):
+            return summary
+        starts:np.ndarray = np.flatnonzero(np.concatenate(([True],wins[1:] != wins[:-1])))
+        lengths:np.ndarray = np.diff(np.append(starts,len(wins)))
+        outcomes:np.ndarray = wins[starts]
+        summary.trailing = (bool(outcomes[-1]),minimum_nonce+int(starts[-1]),int(lengths[-1]))
+        if(len(starts) > 1):
+            summary.leading = (bool(outcomes[0]),int(lengths[0]))
+        for outcome in (True,False):
+            # Runs between the leading and trailing run are closed on both sides
+            closed:np.ndarray = outcomes[1:-1] == outcome
+            closed_lengths:np.ndarray = lengths[1:-1][closed]
+            if(len(closed_lengths) == 0):
+                continue
+            longest:int = int(np.argmax(closed_lengths))
+            summary.biggest_streaks[outcome] = (minimum_nonce+int(starts[1:-1][closed][longest]),int(closed_lengths[longest]))
+            sizes,counts = np.unique(closed_lengths,return_counts=True)
+            summary.streak_sizes[outcome].update(dict(zip(sizes.tolist(),counts.tolist())))
+        return summary
+
+    def merge(self,other:"Shard_Summary") -> "Shard_Summary":
+        """
+        Appends the summary of the range directly after this one, in place.
+
+        Returns:
+            Shard_Summary: This summary, now covering both ranges.
+        """
+        if(other.games == 0):
+            return self
+        if(self.games == 0):
+            return other
+        self.games += other.games
+        self.wins += other.wins
+        self.losses += other.losses
+        for partial in other.payout_partials:
+            self._add_partial(partial)
+        for name,nonces in other.nonce_lists.items():
+            self.nonce_lists[name].extend(nonces)
+        self.rows.extend(other.rows)
+
+        win,start_nonce,length = self.trailing
+        if(other.leading is None):
+            # The right range is one open run
+            if(other.trailing[0] == win):
+                self.trailing = (win,start_nonce,length+other.trailing[2])
+                return self
+            self._close_streak(win,start_nonce,length)
+        elif(other.leading[0] == win):
+            self._close_streak(win,start_nonce,length+other.leading[1])
+        else:
+            self._close_streak(win,start_nonce,length)
+            self._close_streak(other.leading[0],other.minimum_nonce,other.leading[1])
+        self.trailing = other.trailing
+
+        # Streaks inside the right range start later, so they only replace strictly longer ones
+        for outcome in (True,False):
+            if(other.biggest_streaks[outcome][1] > self.biggest_streaks[outcome][1]):
+                self.biggest_streaks[outcome] = other.biggest_streaks[outcome]
+            self.streak_sizes[outcome].update(other.streak_sizes[outcome])
+        return self
+
+    def finish(self) -> "Shard_Summary":
+        """
+        Counts the leading run as an ordinary streak once no range is left to merge in from the left.
+        """
+        if(self.leading is not None):
+            win,length = self.leading
+            # The leading run is the earliest streak, so it also wins ties
+            if(length >= self.biggest_streaks[win][1]):
+                self.biggest_streaks[win] = (self.minimum_nonce,length)
+            self.streak_sizes[win][length] += 1
+            self.leading = None
+        return self
+
+    def streak_list(self,win:bool) -> list[int]:
+        return [length for length,count in sorted(self.streak_sizes[win].items()) for _ in range(count)]
+
+    def money_won(self,bet_size:float) -> float:
+        # The correctly rounded sum, so it is the same however the range was split and within an ulp of the per-game loops
+        return fsum(self.payout_partials)*bet_size
+
+STREAK_QUANTILES:dict[str,float] = {"25%":0.25,"50%":0.5,"75%":0.75,"95%":0.95,"99%":0.99}
+
+def streak_statistics(streak_sizes:Counter) -> dict[str,float]:
+    """
+    Summary statistics of a list of streaks, read straight off its size counts so the list is never built.
+
+    Each value matches numpy on the expanded list: mean, median and linear quantile. The mean and median
+    of no streaks are NaN like numpy's, while Min, Max and the quantiles fall back to 0 as in the reports.
+
+    Returns:
+        dict: "Mean", "Median", "Min", "25%", "50%", "75%", "95%", "99%" and "Max".
+    """
+    sizes:list[int] = sorted(size for size,count in streak_sizes.items() if count > 0)
+    counts:np.ndarray = np.cumsum([streak_sizes[size] for size in sizes],dtype=np.int64)
+    total:int = int(counts[-1]) if len(sizes) else 0
+    if(total == 0):
+        return {"Mean":float("nan"),"Median":float("nan"),"Min":0,**{name:0 for name in STREAK_QUANTILES},"Max":0}
+
+    def streak_at(position:int) -> int:
+        # The streak at this position of the sorted list
+        return sizes[int(np.searchsorted(counts,position,side="right"))]
+
+    def quantile(fraction:float) -> float:
+        # numpy's linear method, including the way it interpolates from the upper side past halfway
+        virtual_index:float = (total-1)*fraction
+        below:int = floor(virtual_index)
+        gamma:float = virtual_index-below
+        lower,upper = streak_at(below),streak_at(min(below+1,total-1))
+        if(gamma >= 0.5):
+            return upper-(upper-lower)*(1-gamma)
+        return lower+(upper-lower)*gamma
+
+    middle:int = total//2
+    median:float = float(streak_at(middle)) if total % 2 else (streak_at(middle-1)+streak_at(middle))/2
+    return {
+        "Mean":sum(size*streak_sizes[size] for size in sizes)/total,
+        "Median":median,
+        "Min":sizes[0],
+        # numpy's median averages the two middle streaks, which its 50% quantile would also land on
+        **{name:median if fraction == 0.5 else quantile(fraction) for name,fraction in STREAK_QUANTILES.items()},
+        "Max":sizes[-1],
+    }
+
+def split_nonce_range(minimum_nonce:int,maximum_nonce:int,shards:int) -> list[tuple[int,int]]:
+    total_nonces:int = maximum_nonce-minimum_nonce+1
+    shards = max(1,min(shards,total_nonces))
+    bounds:list[int] = [minimum_nonce+(total_nonces*shard)//shards for shard in range(shards+1)]
+    return [(bounds[shard],bounds[shard+1]-1) for shard in range(shards)]
+
+def run_sharded(shard_function:Callable[...,Shard_Summary],minimum_nonce:int,maximum_nonce:int,workers:int=1,executor:Executor|None=None,finish:bool=True,**arguments) -> Shard_Summary:
+    """
+    Runs shard_function over a nonce range, split across a process pool when workers > 1.
+
+    Args:
+        shard_function: Top-level function taking minimum_nonce, maximum_nonce and **arguments.
+        minimum_nonce: First nonce of the range (inclusive).
+        maximum_nonce: Last nonce of the range (inclusive).
+        workers: Number of processes.
+        executor: Pool to reuse across calls, created for this call when None.
+        finish: Whether to finish the summary, or leave it open to merge with the range after it.
+
+    Returns:
+        Shard_Summary: Summary of the whole range.
+    """
+    if(workers <= 1):
+        summary:Shard_Summary = shard_function(minimum_nonce=minimum_nonce,maximum_nonce=maximum_nonce,**arguments)
+        return summary.finish() if finish else summary
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    with (ProcessPoolExecutor(max_workers=workers) if executor is None else nullcontext(executor)) as pool:
+        futures:list = [
+            pool.submit(shard_function,minimum_nonce=low,maximum_nonce=high,**arguments)
+            for low,high in split_nonce_range(minimum_nonce,maximum_nonce,workers*SHARDS_PER_WORKER)
+        ]
+        for future in futures:
+            summary = summary.merge(future.result())
+    return summary.finish() if finish else summary
+
+def parse_workers() -> int:
+    parser:argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--workers",type=int,default=1,help="Processes to split the nonce range across")
+    return max(1,parser.parse_known_args()[0].workers)
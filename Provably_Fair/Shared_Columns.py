@@ -0,0 +1,130 @@
+import numpy as np
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable,Iterator
+from .Shard_Runner import SHARDS_PER_WORKER,Shard_Summary,split_nonce_range
+
+RESULT_COLUMNS:dict[str,np.dtype] = {
+    "nonce": np.dtype(np.int64),
+    "outcome": np.dtype(np.float64),
+    "bet": np.dtype(np.float64),
+    "payout": np.dtype(np.float64),
+    "total_bet": np.dtype(np.float64),
+    "total_won": np.dtype(np.float64),
+    "balance": np.dtype(np.float64),
+}
+
+class Shared_Result_Columns:
+    """
+    Fixed-width per-nonce result columns in multiprocessing.shared_memory, one block per column.
+
+    The parent creates the blocks and maps them as NumPy arrays. Workers attach by name and write
+    their own rows in place, so per-nonce results never pass through pickling. Use it as a context
+    manager: the blocks are unlinked on exit even when a worker crashed part way through.
+
+    The columns default to RESULT_COLUMNS. A game that only needs some of them, or a narrower type,
+    passes its own dtypes, such as one int8 byte per Roulette pocket.
+    """
+    def __init__(self,minimum_nonce:int,maximum_nonce:int,dtypes:dict[str,np.dtype]=RESULT_COLUMNS):
+        self.minimum_nonce:int = minimum_nonce
+        self.length:int = maximum_nonce-minimum_nonce+1
+        self.dtypes:dict[str,np.dtype] = dtypes
+        self.blocks:dict[str,SharedMemory] = {}
+        self.columns:dict[str,np.ndarray] = {}
+        try:
+            for name,dtype in dtypes.items():
+                self.blocks[name] = SharedMemory(create=True,size=max(1,self.length*dtype.itemsize))
+                self.columns[name] = np.ndarray((self.length,),dtype=dtype,buffer=self.blocks[name].buf)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "Shared_Result_Columns":
+        return self
+
+    def __exit__(self,*exception_information) -> None:
+        self.close()
+
+    def __getitem__(self,name:str) -> np.ndarray:
+        return self.columns[name]
+
+    def handle(self) -> tuple[int,dict[str,str],dict[str,str]]:
+        # What a worker needs to find the blocks again
+        return self.minimum_nonce,{name:block.name for name,block in self.blocks.items()},{name:dtype.str for name,dtype in self.dtypes.items()}
+
+    def accumulate(self) -> None:
+        """
+        Fills the running total_bet, total_won and balance columns in place from bet and payout.
+
+        np.cumsum adds strictly in nonce order, so the totals match a loop adding one game at a time.
+        Does nothing when the columns were made without the money columns.
+        """
+        if(not {"bet","payout","total_bet","total_won","balance"} <= self.columns.keys()):
+            return
+        np.cumsum(self.columns["bet"],out=self.columns["total_bet"])
+        np.cumsum(self.columns["payout"],out=self.columns["total_won"])
+        np.subtract(self.columns["total_won"],self.columns["total_bet"],out=self.columns["balance"])
+
+    def close(self) -> None:
+        self.columns = {}
+        for block in self.blocks.values():
+            block.unlink()
+            try:
+                block.close()
+            except BufferError:
+                # Arrays still viewing the block keep its mapping alive until they are dropped
+                pass
+        self.blocks = {}
+
+@contextmanager
+def attached_columns(handle:tuple[int,dict[str,str],dict[str,str]],minimum_nonce:int,maximum_nonce:int) -> Iterator[dict[str,np.ndarray]]:
+    """
+    Maps the rows for minimum_nonce..maximum_nonce of every column inside a worker.
+    """
+    first_nonce,names,dtypes = handle
+    # Workers share the parent's resource tracker, so attaching here does not change who unlinks the blocks
+    blocks:dict[str,SharedMemory] = {name:SharedMemory(name=block_name) for name,block_name in names.items()}
+    try:
+        yield {
+            name:np.ndarray((block.size//np.dtype(dtypes[name]).itemsize,),dtype=dtypes[name],buffer=block.buf)[minimum_nonce-first_nonce:maximum_nonce-first_nonce+1]
+            for name,block in blocks.items()
+        }
+    finally:
+        for block in blocks.values():
+            block.close()
+
+def _run_shard_into_columns(shard_function:Callable[...,Shard_Summary],handle:tuple[int,dict[str,str],dict[str,str]],minimum_nonce:int,maximum_nonce:int,arguments:dict) -> Shard_Summary:
+    with attached_columns(handle,minimum_nonce,maximum_nonce) as columns:
+        summary:Shard_Summary = shard_function(columns=columns,minimum_nonce=minimum_nonce,maximum_nonce=maximum_nonce,**arguments)
+        del columns
+    return summary
+
+def run_sharded_columns(shard_function:Callable[...,Shard_Summary],result_columns:Shared_Result_Columns,workers:int=1,**arguments) -> Shard_Summary:
+    """
+    run_sharded for shard functions that also write per-nonce rows into result_columns.
+
+    Args:
+        shard_function: Top-level function taking columns, minimum_nonce, maximum_nonce and **arguments,
+            where columns maps each column name to the rows of its own nonces.
+        result_columns: Shared columns covering the whole nonce range.
+        workers: Number of processes.
+
+    Returns:
+        Shard_Summary: Finished summary of the whole range, with accumulate() already applied.
+    """
+    minimum_nonce:int = result_columns.minimum_nonce
+    maximum_nonce:int = minimum_nonce+result_columns.length-1
+    if(workers <= 1):
+        summary:Shard_Summary = shard_function(columns=result_columns.columns,minimum_nonce=minimum_nonce,maximum_nonce=maximum_nonce,**arguments)
+    else:
+        summary = Shard_Summary(minimum_nonce)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures:list = [
+                executor.submit(_run_shard_into_columns,shard_function,result_columns.handle(),low,high,arguments)
+                for low,high in split_nonce_range(minimum_nonce,maximum_nonce,workers*SHARDS_PER_WORKER)
+            ]
+            for future in futures:
+                summary = summary.merge(future.result())
+    result_columns.accumulate()
+    return summary.finish()
@@ -0,0 +1,104 @@
+import numpy as np
+from .Shard_Runner import Shard_Summary
+
+def nearest_greater_before(levels:np.ndarray) -> np.ndarray:
+    """
+    Index of the nearest earlier level strictly greater than each level, -1 when there is none.
+
+    Every index starts pointing at its left neighbour and jumps along its neighbours' pointers until it
+    reaches a greater level. Everything jumped over is no greater, so each round is one array operation
+    and the pointers settle in about log2(len(levels)) rounds.
+    """
+    levels = np.asarray(levels,dtype=np.int64)
+    pointers:np.ndarray = np.arange(-1,len(levels)-1)
+    # Index -1 lands on a sentinel above every level
+    padded:np.ndarray = np.append(levels,np.iinfo(np.int64).max)
+    pending:np.ndarray = np.arange(len(levels))
+    while(len(pending)):
+        settled:np.ndarray = padded[pointers[pending]] > levels[pending]
+        pending = pending[~settled]
+        pointers[pending] = pointers[pointers[pending]]
+    return pointers
+
+def longest_closed_runs(levels:np.ndarray,level_count:int) -> np.ndarray:
+    """
+    For every cutoff from 0 to level_count-1, the longest run of consecutive levels at or below the cutoff
+    that a later level above the cutoff closes.
+
+    This is the biggest losing streak of every cutoff at once, where a game loses when its level is at or
+    below the cutoff. As in the simulation loops, the run still open at the end of the range is not counted.
+    Each index is the highest level of the run it sits in for a range of cutoffs, so the runs come from
+    the nearest greater level on either side of every index.
+
+    Args:
+        levels: Integer level of every game, from 0 to level_count-1.
+        level_count: Number of possible levels.
+
+    Returns:
+        np.ndarray: Longest closed run for each cutoff.
+    """
+    levels = np.asarray(levels,dtype=np.int64)
+    total:int = len(levels)
+    longest:np.ndarray = np.zeros(level_count,dtype=np.int64)
+    if(total == 0):
+        return longest
+    left:np.ndarray = nearest_greater_before(levels)
+    right:np.ndarray = total-1-nearest_greater_before(levels[::-1])[::-1]
+    closed:np.ndarray = right < total
+    lengths:np.ndarray = (right-left-1)[closed]
+    starts:np.ndarray = levels[closed]
+    # A run stays closed for every cutoff below the highest level from its right edge onwards
+    suffix_maximums:np.ndarray = np.maximum.accumulate(levels[::-1])[::-1]
+    ends:np.ndarray = suffix_maximums[right[closed]]-1
+    valid:np.ndarray = ends >= starts
+    starts,ends,lengths = starts[valid],ends[valid],lengths[valid]
+
+    # Walk the cutoffs downwards, adding each run once its last cutoff is reached
+    order:np.ndarray = np.argsort(ends,kind="stable")
+    starts,ends,lengths = starts[order],ends[order],lengths[order]
+    boundaries:np.ndarray = np.searchsorted(ends,np.arange(level_count+1),side="left")
+    best_by_start:np.ndarray = np.zeros(level_count,dtype=np.int64)
+    for cutoff in range(level_count-1,-1,-1):
+        adding:slice = slice(boundaries[cutoff],boundaries[cutoff+1])
+        if(adding.start != adding.stop):
+            np.maximum.at(best_by_start,starts[adding],lengths[adding])
+        longest[cutoff] = best_by_start[:cutoff+1].max()
+    return longest
+
+def dice_threshold_sweep(numbers:np.ndarray) -> dict[str,dict[str,np.ndarray]]:
+    """
+    Win counts and biggest losing streaks for every Dice threshold, from one pass over the rolls.
+
+    Args:
+        numbers: Roll of every game times 100, from 0 to 10000.
+
+    Returns:
+        dict: For "Over" and "Under", "wins" and "biggest_losing_streaks" indexed by threshold*100.
+    """
+    numbers = np.asarray(numbers,dtype=np.int64)
+    at_or_below:np.ndarray = np.cumsum(np.bincount(numbers,minlength=10_001))
+    return {
+        # Over wins strictly above the threshold and Under strictly below it
+        "Over": {
+            "wins": len(numbers)-at_or_below,
+            "biggest_losing_streaks": longest_closed_runs(numbers,10_001),
+        },
+        "Under": {
+            "wins": np.concatenate(([0],at_or_below[:-1])),
+            "biggest_losing_streaks": longest_closed_runs(10_000-numbers,10_001)[::-1],
+        },
+    }
+
+def target_sweep(results:np.ndarray,targets:list[float]) -> dict[str,np.ndarray]:
+    """
+    Win counts and biggest losing streaks for a list of targets, where a game wins when its result reaches the target.
+
+    Returns:
+        dict: "wins" and "biggest_losing_streaks", one entry per target.
+    """
+    ordered:np.ndarray = np.sort(results)
+    targets_array:np.ndarray = np.asarray(targets,dtype=np.float64)
+    return {
+        "wins": len(ordered)-np.searchsorted(ordered,targets_array,side="left"),
+        "biggest_losing_streaks": np.array([Shard_Summary.from_wins(0,results >= target).finish().biggest_streaks[False][1] for target in targets_array],dtype=np.int64),
+    }
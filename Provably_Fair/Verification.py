@@ -0,0 +1,753 @@
+import os
+import json
+import math
+import random
+import asyncio
+import hashlib
+import tempfile
+import importlib.util
+from collections import Counter
+from datetime import datetime,timedelta
+from typing import Any
+import numpy as np
+from .Byte_Cursor import Byte_Cursor,bytes_to_number
+from .Cutoffs import (
+    DICE_MODULUS,
+    WORD_LIMIT,
+    compile_bucket_cutoffs,
+    compile_dice_cutoff,
+    compile_limbo_cutoff,
+    dice_number_to_result,
+    dice_wins,
+    limbo_number_to_result,
+    limbo_wins,
+    words_to_buckets,
+)
+from .Batch_Decoder import digests_to_floats,digests_to_numbers,seeds_to_digest_matrix
+from .Digest_Cache import LANE_MINIMUM_NONCES,Digest_Cache
+from multiprocessing.shared_memory import SharedMemory
+from .Shard_Runner import Shard_Summary,split_nonce_range,streak_statistics
+from .Shared_Columns import Shared_Result_Columns,run_sharded_columns
+from .Outcome_Stream import decode_block,stream_outcomes
+from .Plinko_Engine import Plinko_Engine
+from .Lane_SHA256 import LANE_CHUNK_SIZE,lane_digest_matrix
+from .Bet_Progression import compile_streak_stakes,losing_streak_lengths,play_balance
+from .Sweep import dice_threshold_sweep,longest_closed_runs,target_sweep
+from .Plot_Series import Plot_Series
+from .Category_Table import Category_Table
+from pandas import DataFrame
+from .Result_Writer import write_result_frames
+from .Run_Fingerprint import Run_Fingerprint,file_sha256
+from .Checkpoint import Checkpoint,run_checkpointed
+from .Buffered_Log import ARCHIVE_FOLDER,Buffered_Log,read_log_entries
+from .Rare_Outcomes import Rare_Outcome_Index,dice_roll_words,limbo_multiplier_words
+
+VERIFICATION_SERVER_SEED:str = "fa18081cb423686caad04b12efc0151ecc746857c2105f7d82d042d7df1c70d5"
+VERIFICATION_CLIENT_SEED:str = "k2lOa3_GLY"
+GAME_MODULI:list[int] = [2,10,20,25,30,37,40,50,52,10001,16777216]
+BUCKET_MODULI:list[int] = list(range(2,26))+[30,37,40,50,52,10001]
+# sha256 of [over_under, threshold*100, repr(multiplier)] for every entry of the dict literal Stake_Dice/Mulitpliers.py used to hold
+DICE_MULTIPLIER_TABLE_SHA256:str = "8284eebc6ad39f145f149af1cb93dbfb9b816c86064a2b5da9fee974cd9c2b0d"
+LIMBO_TARGETS:list[float] = [1.01,1.02,1.5,1.98,2,2.5,3,5,10,25,50,100,250,500,1_000,2_500,5_000,10_000,25_000,50_000,100_000,250_000,500_000,1_000_000]
+
+def bytes_to_float(bytes_list:list[int]) -> float:
+    # The unfloored float from bytes_to_number, as Flip uses it
+    return ((float(bytes_list[0]) / float(256**1)) +
+            (float(bytes_list[1]) / float(256**2)) +
+            (float(bytes_list[2]) / float(256**3)) +
+            (float(bytes_list[3]) / float(256**4)))
+
+def verify_batch_decoder(minimum_nonce:int=1,maximum_nonce:int=2_000,rounds:int=3) -> None:
+    """
+    Checks digests_to_numbers and digests_to_floats against bytes_to_number for every word of a nonce block.
+    """
+    digests:np.ndarray = seeds_to_digest_matrix(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,minimum_nonce,maximum_nonce,rounds)
+    floats:np.ndarray = digests_to_floats(digests)
+    for modulus in GAME_MODULI:
+        numbers:np.ndarray = digests_to_numbers(digests,modulus)
+        for row,digest in enumerate(digests.tolist()):
+            for word in range(numbers.shape[1]):
+                bytes_list:list[int] = digest[word*4:word*4+4]
+                assert numbers[row,word] == bytes_to_number(bytes_list,modulus), (row,word,modulus)
+                assert floats[row,word] == bytes_to_float(bytes_list), (row,word)
+    # Hand-picked words at the edges of the float range
+    edges:np.ndarray = np.array([[0,0,0,0,0,0,0,1,127,255,255,255,128,0,0,0,255,255,255,255,255,255,255,254,1,2,3,4,254,255,255,255]],dtype=np.uint8)
+    for modulus in GAME_MODULI:
+        numbers = digests_to_numbers(edges,modulus)
+        for word in range(8):
+            assert numbers[0,word] == bytes_to_number(edges[0,word*4:word*4+4].tolist(),modulus), (word,modulus)
+
+def word_number(word:int,modulus:int) -> int:
+    return bytes_to_number(list(word.to_bytes(4,"big")),modulus)
+
+def boundary_words(cutoff:int) -> list[int]:
+    return [word for word in (0,cutoff-1,cutoff,cutoff+1,WORD_LIMIT-1) if 0 <= word < WORD_LIMIT]
+
+def verify_cutoffs() -> None:
+    """
+    Checks every integer cutoff against the float path on both sides of every boundary.
+    """
+    for modulus in BUCKET_MODULI:
+        cutoffs:np.ndarray = compile_bucket_cutoffs(modulus)
+        words:list[int] = sorted({word for cutoff in cutoffs.tolist() for word in boundary_words(cutoff)})
+        buckets:np.ndarray = words_to_buckets(np.array(words,dtype=np.uint32),cutoffs)
+        for word,bucket in zip(words,buckets.tolist()):
+            assert bucket == word_number(word,modulus), (modulus,word)
+
+    for over_under in ("Over","Under"):
+        for hundredths in range(1,10000):
+            threshold:float = round(hundredths/100,2)
+            cutoff:int = compile_dice_cutoff(over_under,threshold)
+            words:list[int] = boundary_words(cutoff)
+            wins:np.ndarray = dice_wins(np.array(words,dtype=np.uint32),over_under,cutoff)
+            for word,win in zip(words,wins.tolist()):
+                result:float = dice_number_to_result(word_number(word,DICE_MODULUS))
+                assert win == ((result > threshold) if over_under == "Over" else (result < threshold)), (over_under,threshold,word)
+
+    for target_multiplier in LIMBO_TARGETS:
+        for strictly_above in (False,True):
+            cutoff:int = compile_limbo_cutoff(target_multiplier,strictly_above)
+            words:list[int] = boundary_words(cutoff)
+            wins:np.ndarray = limbo_wins(np.array(words,dtype=np.uint32),cutoff)
+            for word,win in zip(words,wins.tolist()):
+                result:float = limbo_number_to_result(word_number(word,16777216))
+                assert win == ((result > target_multiplier) if strictly_above else (result >= target_multiplier)), (target_multiplier,word)
+
+def verify_lane_hmac() -> None:
+    """
+    Checks lane_digest_matrix against hmac digests, across digit counts, chunk edges and long seeds,
+    and that decode_block decodes the same outcomes with the lane kernel switched on.
+    """
+    cases:list[tuple[str,str,int,int]] = [
+        (VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,0,2_000),
+        (VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,99_990,100_000+LANE_CHUNK_SIZE),
+        (VERIFICATION_SERVER_SEED*2,VERIFICATION_CLIENT_SEED*8,995,1_005),
+    ]
+    for server_seed,client_seed,minimum_nonce,maximum_nonce in cases:
+        expected:np.ndarray = seeds_to_digest_matrix(server_seed,client_seed,minimum_nonce,maximum_nonce,3)
+        assert np.array_equal(lane_digest_matrix(server_seed,client_seed,minimum_nonce,maximum_nonce,3),expected), (len(server_seed),minimum_nonce)
+    lane_pockets:np.ndarray = decode_block("Roulette",VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,1,LANE_MINIMUM_NONCES,lane=True)
+    assert np.array_equal(lane_pockets,decode_block("Roulette",VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,1,LANE_MINIMUM_NONCES))
+
+def verify_digest_cache() -> None:
+    """
+    Checks cached digests against fresh ones while separate ranges fill in and join, then checks LRU
+    eviction and that runs sharing the folder keep each other's seed pairs.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        cache:Digest_Cache = Digest_Cache(directory=directory,max_bytes=3_000*32*2)
+        for minimum_nonce,maximum_nonce in [(500,1_000),(1_500,2_000),(1,10),(700,800),(900,1_600)]:
+            expected:np.ndarray = seeds_to_digest_matrix(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,minimum_nonce,maximum_nonce,3)
+            assert np.array_equal(cache.digest_matrix(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,minimum_nonce,maximum_nonce,3),expected), (minimum_nonce,maximum_nonce)
+        assert [segment["Rounds"] for segment in cache.index.values()] == [{str(round):[[1,10],[500,2_000]] for round in range(3)}]
+
+        cache.digests(VERIFICATION_SERVER_SEED,"second_client_seed",1,1_000)
+        assert len(Digest_Cache(directory=directory,max_bytes=cache.max_bytes).index) == 2
+        cache.digests(VERIFICATION_SERVER_SEED,"third_client_seed",1,3_000)
+        assert [segment["ClientSeed"] for segment in cache.index.values()] == ["second_client_seed","third_client_seed"]
+
+        # A second run sharing the folder keeps what the first one saved after it was opened
+        other:Digest_Cache = Digest_Cache(directory=directory,max_bytes=cache.max_bytes*2)
+        cache.digests(VERIFICATION_SERVER_SEED,"fourth_client_seed",1,1_000)
+        other.digests(VERIFICATION_SERVER_SEED,"fifth_client_seed",1,1_000)
+        assert [segment["ClientSeed"] for segment in Digest_Cache(directory=directory).index.values()] == ["second_client_seed","third_client_seed","fourth_client_seed","fifth_client_seed"]
+
+def single_pass_streaks(outcomes:list[bool],minimum_nonce:int) -> tuple[dict[bool,tuple[int,int]],dict[bool,list[int]]]:
+    # The streak bookkeeping every simulation loop does, one nonce at a time
+    biggest_streaks:dict[bool,tuple[int,int]] = {True:(0,0),False:(0,0)}
+    streak_lists:dict[bool,list[int]] = {True:[],False:[]}
+    current_streaks:dict[bool,int] = {True:0,False:0}
+    for nonce,win in enumerate(outcomes,start=minimum_nonce):
+        if(current_streaks[not win] > biggest_streaks[not win][1]):
+            biggest_streaks[not win] = (nonce-current_streaks[not win],current_streaks[not win])
+        if(current_streaks[not win] > 0):
+            streak_lists[not win].append(current_streaks[not win])
+        current_streaks[not win] = 0
+        current_streaks[win] += 1
+    return biggest_streaks,streak_lists
+
+def verify_shard_runner(trials:int=300) -> None:
+    """
+    Checks merged shard summaries against one pass over the same outcomes, for random splits,
+    and summaries built from a block of win flags against ones built game by game.
+    """
+    generator:random.Random = random.Random(8)
+    for _ in range(trials):
+        minimum_nonce:int = generator.randint(0,50)
+        win_chance:float = generator.choice([0.02,0.5,0.98])
+        outcomes:list[bool] = [generator.random() < win_chance for _ in range(generator.randint(1,400))]
+        payouts:list[float] = [generator.choice([0.2,1.5,3.3]) if win else 0 for win in outcomes]
+        biggest_streaks,streak_lists = single_pass_streaks(outcomes,minimum_nonce)
+
+        summary:Shard_Summary = Shard_Summary(minimum_nonce)
+        maximum_nonce:int = minimum_nonce+len(outcomes)-1
+        for low,high in split_nonce_range(minimum_nonce,maximum_nonce,generator.randint(1,40)):
+            shard:Shard_Summary = Shard_Summary(low)
+            for nonce in range(low,high+1):
+                shard.add(nonce=nonce,win=outcomes[nonce-minimum_nonce],payout=payouts[nonce-minimum_nonce])
+            block:Shard_Summary = Shard_Summary.from_wins(low,np.array(outcomes[low-minimum_nonce:high-minimum_nonce+1]))
+            assert (block.games,block.wins,block.leading,block.trailing,block.biggest_streaks,block.streak_sizes) == (shard.games,shard.wins,shard.leading,shard.trailing,shard.biggest_streaks,shard.streak_sizes)
+            summary = summary.merge(shard)
+        summary.finish()
+
+        assert summary.biggest_streaks == biggest_streaks, (summary.biggest_streaks,biggest_streaks)
+        for win in (True,False):
+            assert summary.streak_list(win) == sorted(streak_lists[win])
+        assert (summary.games,summary.wins) == (len(outcomes),sum(outcomes))
+        # Every split carries the exact sum, and it prints the same as the running total of the game loops
+        assert summary.money_won(0.7) == math.fsum(payouts)*0.7
+        money_won:float = 0
+        for payout in payouts:
+            if(payout != 0):
+                money_won += 0.7*payout
+        assert abs(summary.money_won(0.7)-money_won) < 0.005 and f"{summary.money_won(0.7):,.2f}" == f"{money_won:,.2f}"
+        counted:Shard_Summary = Shard_Summary(minimum_nonce)
+        for payout,count in Counter(payouts).items():
+            counted.add_payouts(payout,count)
+        assert counted.money_won(0.7) == summary.money_won(0.7)
+
+def _parity_shard(columns:dict[str,np.ndarray],minimum_nonce:int,maximum_nonce:int,crash_nonce:int|None=None) -> Shard_Summary:
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    for row,nonce in enumerate(range(minimum_nonce,maximum_nonce+1)):
+        if(nonce == crash_nonce):
+            raise RuntimeError(f"Worker stopped at nonce {nonce}")
+        columns["nonce"][row] = nonce
+        columns["outcome"][row] = nonce % 7
+        columns["bet"][row] = 0.1
+        columns["payout"][row] = 0.35 if nonce % 3 else 0
+        summary.add(nonce=nonce,win=nonce % 3 != 0)
+    return summary
+
+def _pocket_shard(columns:dict[str,np.ndarray],minimum_nonce:int,maximum_nonce:int) -> Shard_Summary:
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    columns["outcome"][:] = np.arange(minimum_nonce,maximum_nonce+1) % 37
+    for nonce in range(minimum_nonce,maximum_nonce+1):
+        summary.add(nonce=nonce,win=nonce % 37 == 0)
+    return summary
+
+def verify_shared_columns(minimum_nonce:int=10,maximum_nonce:int=5_009) -> None:
+    """
+    Checks rows written by worker processes into shared memory, and that a crashed run still unlinks its blocks.
+    """
+    with Shared_Result_Columns(minimum_nonce,maximum_nonce) as columns:
+        summary:Shard_Summary = run_sharded_columns(_parity_shard,columns,workers=3)
+        assert np.array_equal(columns["nonce"],np.arange(minimum_nonce,maximum_nonce+1))
+        total_won:float = 0
+        for row,nonce in enumerate(range(minimum_nonce,maximum_nonce+1)):
+            total_won += 0.35 if nonce % 3 else 0
+            assert columns["total_won"][row] == total_won, nonce
+        assert summary.games == maximum_nonce-minimum_nonce+1
+
+    # One int8 column, as Roulette keeps its pockets
+    with Shared_Result_Columns(minimum_nonce,maximum_nonce,dtypes={"outcome":np.dtype(np.int8)}) as columns:
+        summary = run_sharded_columns(_pocket_shard,columns,workers=3)
+        assert np.array_equal(columns["outcome"],np.arange(minimum_nonce,maximum_nonce+1) % 37)
+        assert list(columns.columns) == ["outcome"] and summary.wins == np.count_nonzero(np.arange(minimum_nonce,maximum_nonce+1) % 37 == 0)
+
+    columns = Shared_Result_Columns(minimum_nonce,maximum_nonce)
+    block_names:list[str] = list(columns.handle()[1].values())
+    try:
+        with columns:
+            run_sharded_columns(_parity_shard,columns,workers=3,crash_nonce=maximum_nonce-5)
+        raise AssertionError("The crashing worker did not raise")
+    except RuntimeError:
+        pass
+    for block_name in block_names:
+        try:
+            SharedMemory(name=block_name).close()
+            raise AssertionError(f"Shared memory block {block_name} was not unlinked")
+        except FileNotFoundError:
+            pass
+
+STREAM_REFERENCES:dict[str,tuple[dict,object]] = {
+    # Game: (options, the scalar Byte_Cursor decode each game script uses)
+    "Plinko": ({"rows":16},lambda cursor: sum(cursor.next_number(2) for _ in range(16))),
+    "Dice": ({},lambda cursor: round(cursor.next_number(10001)/100,2)),
+    "Limbo": ({},lambda cursor: limbo_number_to_result(cursor.next_number(16777216))),
+    "Roulette": ({},lambda cursor: cursor.next_number(37)),
+    "Wheel": ({"segments":30},lambda cursor: cursor.next_number(30)),
+}
+
+def verify_outcome_stream(minimum_nonce:int=1,maximum_nonce:int=1_500) -> None:
+    """
+    Checks every streamed game outcome against the scalar decode, with a block size that leaves a short last block.
+    """
+    async def collect(game:str,options:dict) -> list[dict]:
+        return [block async for block in stream_outcomes(game,VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,minimum_nonce,maximum_nonce,block_size=400,queue_size=1,**options)]
+
+    for game,(options,reference) in STREAM_REFERENCES.items():
+        blocks:list[dict] = asyncio.run(collect(game,options))
+        assert blocks[-1]["progress"] == {"current":maximum_nonce-minimum_nonce+1,"total":maximum_nonce-minimum_nonce+1}
+        for block in blocks:
+            for nonce,outcome in zip(block["nonces"].tolist(),block["outcomes"].tolist()):
+                assert outcome == reference(Byte_Cursor(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,nonce)), (game,nonce)
+
+def verify_plinko_engine(minimum_nonce:int=1,maximum_nonce:int=600) -> None:
+    """
+    Checks the Plinko engine for every risk and row count against Byte_Cursor and the multiplier table,
+    with each prize tier assigned as in the game loops.
+    """
+    path:str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Stake_Plinko","Multipliers.py")
+    specification = importlib.util.spec_from_file_location("Plinko_Multipliers",path)
+    multipliers = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(multipliers)
+    for name,table in multipliers.plinko_multipliers.items():
+        engine:Plinko_Engine = Plinko_Engine(table)
+        rows:int = engine.rows
+        prize_indexes,played = engine.play(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,minimum_nonce,maximum_nonce)
+        for nonce,prize_index,multiplier in zip(range(minimum_nonce,maximum_nonce+1),prize_indexes.tolist(),played.tolist()):
+            cursor:Byte_Cursor = Byte_Cursor(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,nonce)
+            assert prize_index == sum(cursor.next_number(2) for _ in range(rows)), (name,nonce)
+            assert (multiplier == table[prize_index]) and (type(multiplier) is type(table[prize_index])), (name,nonce)
+        for prize_index,tier in enumerate(engine.prize_tiers.tolist()):
+            expected:int = 0 if prize_index in [0,rows+1] else 1 if prize_index in [1,rows] else 2 if prize_index in [2,rows-1] else -1
+            assert tier == expected, (name,prize_index)
+
+def verify_dice_multipliers() -> None:
+    """
+    Checks the computed Dice multiplier tables against every entry of the table they replaced.
+    """
+    path:str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Stake_Dice","Mulitpliers.py")
+    specification = importlib.util.spec_from_file_location("Dice_Multipliers",path)
+    multipliers = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(multipliers)
+    entries:list[list[str|int]] = [
+        [over_under,index,repr(float(multiplier))]
+        for over_under,table in multipliers.dice_multiplier_tables.items()
+        for index,multiplier in enumerate(table)
+        if(not np.isnan(multiplier))
+    ]
+    assert len(entries) == 19_600
+    assert hashlib.sha256(json.dumps(entries).encode()).hexdigest() == DICE_MULTIPLIER_TABLE_SHA256
+    assert multipliers.dice_multiplier("Over",50.5) == multipliers.dice_multiplier("Under",49.5) == 2.0
+    for over_under,threshold in (("Over",1.99),("Under",98.01),("Sideways",50)):
+        try:
+            multipliers.dice_multiplier(over_under,threshold)
+        except KeyError:
+            continue
+        raise AssertionError(f"{over_under} {threshold} should have no multiplier")
+
+def verify_bet_progression(trials:int=300) -> None:
+    """
+    Checks stakes, the stopping game and balances of the array progression against a loop betting one game at a time.
+    """
+    generator:random.Random = random.Random(14)
+    next_stake = lambda losing_streak,stake: 0.2 if losing_streak == 3 else stake*3 if losing_streak > 3 and (losing_streak-3) % 2 == 0 else stake
+    for _ in range(trials):
+        wins:np.ndarray = np.array([generator.random() < generator.choice([0.1,0.5,0.9]) for _ in range(generator.randint(1,300))])
+        initial_streak:int = generator.choice([0,0,5])
+        starting_balance:float = generator.choice([1.5,20,1_000])
+
+        balance:float = starting_balance
+        biggest_balance:float = balance
+        losing_streak:int = initial_streak
+        stake:float = compile_streak_stakes(initial_streak,0,next_stake)[-1]
+        games_played:int = 0
+        stakes:list[float] = []
+        for win in wins.tolist():
+            games_played += 1
+            stakes.append(stake)
+            balance -= stake
+            if(balance < 0):
+                break
+            if(win):
+                balance += stake*1.98
+                biggest_balance = max(biggest_balance,balance)
+                losing_streak,stake = 0,0
+            else:
+                losing_streak += 1
+                stake = next_stake(losing_streak,stake)
+
+        losing_streaks:np.ndarray = losing_streak_lengths(wins,initial_streak)
+        stake_table:np.ndarray = compile_streak_stakes(int(losing_streaks.max())+1,0,next_stake)
+        array_stakes:np.ndarray = stake_table[losing_streaks]
+        assert array_stakes[:games_played].tolist() == stakes
+        assert play_balance(array_stakes,np.where(wins,array_stakes*1.98,0),wins,starting_balance) == (games_played,balance,biggest_balance)
+
+def verify_sweep(trials:int=200) -> None:
+    """
+    Checks every cutoff of a sweep against a summary built from that cutoff's own win flags.
+    """
+    generator:np.random.Generator = np.random.default_rng(15)
+    for _ in range(trials):
+        level_count:int = int(generator.integers(2,40))
+        levels:np.ndarray = generator.integers(0,level_count,int(generator.integers(1,300)))
+        longest:np.ndarray = longest_closed_runs(levels,level_count)
+        for cutoff in range(level_count):
+            assert longest[cutoff] == Shard_Summary.from_wins(0,levels > cutoff).finish().biggest_streaks[False][1]
+
+    numbers:np.ndarray = generator.integers(0,10_001,3_000)
+    sweep:dict[str,dict[str,np.ndarray]] = dice_threshold_sweep(numbers)
+    for threshold in generator.integers(0,10_001,100).tolist():
+        for over_under,wins in (("Over",numbers > threshold),("Under",numbers < threshold)):
+            assert sweep[over_under]["wins"][threshold] == np.count_nonzero(wins)
+            assert sweep[over_under]["biggest_losing_streaks"][threshold] == Shard_Summary.from_wins(0,wins).finish().biggest_streaks[False][1]
+
+    results:np.ndarray = np.floor(generator.uniform(1,50,3_000)*100)/100
+    targets:list[float] = [1.01,2,2.5,10,49.99]
+    assert target_sweep(results,targets)["wins"].tolist() == [np.count_nonzero(results >= target) for target in targets]
+
+def verify_rare_outcomes(minimum_nonce:int=1,maximum_nonce:int=20_000) -> None:
+    """
+    Checks indexed rare outcomes against Byte_Cursor results while the scanned range grows both ways.
+    """
+    dice_rolls:np.ndarray = np.array([STREAM_REFERENCES["Dice"][1](Byte_Cursor(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,nonce)) for nonce in range(minimum_nonce,maximum_nonce+1)])
+    limbo_results:np.ndarray = np.array([STREAM_REFERENCES["Limbo"][1](Byte_Cursor(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,nonce)) for nonce in range(minimum_nonce,maximum_nonce+1)])
+    nonces:np.ndarray = np.arange(minimum_nonce,maximum_nonce+1)
+    # Common rolls and low targets give enough hits in a short range to exercise the merging
+    outcomes:list[tuple[tuple[int,int],np.ndarray]] = [
+        (dice_roll_words(100),nonces[dice_rolls == 100]),
+        (dice_roll_words(0),nonces[dice_rolls == 0]),
+        (dice_roll_words(50.5),nonces[dice_rolls == 50.5]),
+        (limbo_multiplier_words(1_000),nonces[limbo_results >= 1_000]),
+        (limbo_multiplier_words(2,strictly_above=True),nonces[limbo_results > 2]),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        index:Rare_Outcome_Index = Rare_Outcome_Index(directory=directory,use_digest_cache=False)
+        for low,high in [(8_000,12_000),(15_000,maximum_nonce),(minimum_nonce,5_000),(9_000,9_999),(minimum_nonce,maximum_nonce)]:
+            found:list[np.ndarray] = index.nonces(VERIFICATION_SERVER_SEED,VERIFICATION_CLIENT_SEED,low,high,[word_range for word_range,_ in outcomes])
+            for hits,(word_range,expected) in zip(found,outcomes):
+                assert np.array_equal(hits,expected[(expected >= low) & (expected <= high)]), (word_range,low,high)
+        assert Rare_Outcome_Index(directory=directory).index == index.index
+
+def verify_streak_statistics(trials:int=500) -> None:
+    """
+    Checks statistics read off streak size counts against numpy on the expanded streak list.
+    """
+    generator:np.random.Generator = np.random.default_rng(18)
+    for _ in range(trials):
+        streaks:list[int] = generator.geometric(generator.uniform(0.01,0.9),int(generator.integers(1,400))).tolist()
+        statistics:dict[str,float] = streak_statistics(Counter(streaks))
+        expected:dict[str,float] = {"Mean":np.mean(streaks),"Median":np.median(streaks),"Min":min(streaks),"Max":max(streaks)}
+        expected.update({name:np.quantile(streaks,fraction) for name,fraction in {"25%":0.25,"50%":0.5,"75%":0.75,"95%":0.95,"99%":0.99}.items()})
+        assert statistics == expected, (streaks,statistics,expected)
+    empty:dict[str,float] = streak_statistics(Counter())
+    assert np.isnan(empty["Mean"]) and np.isnan(empty["Median"]) and empty["Max"] == 0
+
+def verify_plot_series(trials:int=200) -> None:
+    """
+    Checks a series fed in uneven blocks keeps its extremes and ends, and stays whole when it is short.
+    """
+    generator:np.random.Generator = np.random.default_rng(18)
+    for _ in range(trials):
+        total:int = int(generator.integers(1,5_000))
+        buckets:int = int(generator.integers(1,300))
+        games:np.ndarray = np.arange(1,total+1)
+        profits:np.ndarray = np.cumsum(generator.choice([-1.0,1.5],total))
+        series:Plot_Series = Plot_Series(total,buckets)
+        low:int = 0
+        while(low < total):
+            high:int = low+int(generator.integers(1,700))
+            series.add(games[low:high],profits[low:high])
+            low = high
+        kept_games,kept_profits = series.points()
+        assert np.array_equal(kept_profits,profits[kept_games-1]) and np.all(np.diff(kept_games) > 0)
+        assert (kept_games[0],kept_games[-1]) == (1,total) and len(kept_games) <= 4*(buckets+1)
+        assert kept_games[np.argmax(kept_profits)] == games[np.argmax(profits)]
+        assert kept_games[np.argmin(kept_profits)] == games[np.argmin(profits)]
+        if(total <= buckets):
+            assert np.array_equal(kept_games,games)
+
+    # Several series sharing x keep the extremes of every column
+    profits:np.ndarray = np.cumsum(generator.choice([-1.0,1.5],(3_000,3)),axis=0)
+    series:Plot_Series = Plot_Series(len(profits),100)
+    for low in range(0,len(profits),512):
+        series.add(np.arange(low+1,min(low+512,len(profits))+1),profits[low:low+512])
+    kept_games,kept_profits = series.points()
+    assert np.array_equal(kept_profits,profits[kept_games-1])
+    for column in range(3):
+        assert kept_games[np.argmax(kept_profits[:,column])] == np.argmax(profits[:,column])+1
+        assert kept_games[np.argmin(kept_profits[:,column])] == np.argmin(profits[:,column])+1
+
+def verify_category_table(trials:int=100) -> None:
+    """
+    Checks category counts and biggest streaks from blocks of outcomes against a loop playing one game at a time.
+    """
+    generator:random.Random = random.Random(22)
+    for _ in range(trials):
+        outcomes:int = generator.randint(2,37)
+        groups:dict[str,dict[str,list[int]]] = {}
+        for group in range(generator.randint(1,4)):
+            shuffled:list[int] = generator.sample(range(outcomes),outcomes)
+            cuts:list[int] = sorted(generator.sample(range(1,outcomes+1),min(outcomes,generator.randint(1,3))))
+            members:list[list[int]] = [shuffled[low:high] for low,high in zip([0]+cuts,cuts)]
+            # Leaving the last cut off means some outcomes belong to no category of the group
+            groups[f"Group {group}"] = {f"{group}.{index}":category for index,category in enumerate(members)}
+        games:np.ndarray = np.array([generator.randrange(outcomes) for _ in range(generator.randint(1,2_000))])
+
+        table:Category_Table = Category_Table(groups,outcomes)
+        cumulative:list[np.ndarray] = []
+        low:int = 0
+        while(low < len(games)):
+            high:int = low+generator.randint(1,300)
+            cumulative.append(table.add(games[low:high]))
+            low = high
+
+        counts:dict[str,int] = {name:0 for name in table.names}
+        current:dict[str,int] = {name:0 for name in table.names}
+        biggest:dict[str,int] = {name:0 for name in table.names}
+        expected_cumulative:list[list[int]] = []
+        for outcome in games.tolist():
+            for categories in groups.values():
+                hit:list[str] = [name for name,members in categories.items() if outcome in members]
+                if(not hit):
+                    continue
+                for name in categories:
+                    if(name == hit[0]):
+                        counts[name] += 1
+                        current[name] += 1
+                    else:
+                        biggest[name] = max(biggest[name],current[name])
+                        current[name] = 0
+            expected_cumulative.append([counts[name] for name in table.names])
+        assert np.array_equal(np.concatenate(cumulative),np.array(expected_cumulative).reshape(len(games),-1))
+        assert all(table.count(name) == counts[name] and table.biggest_streak(name) == biggest[name] for name in table.names)
+
+def _load_roulette_layout() -> tuple[Any,dict]:
+    # Roulette_Layout lives next to the Roulette script rather than in this package
+    directory:str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Stake_Roulette")
+    specification = importlib.util.spec_from_file_location("Roulette_Layout",os.path.join(directory,"Roulette_Layout.py"))
+    layouts = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(layouts)
+    with open(os.path.join(directory,"Configuration.json"),"rb") as file:
+        configuration:dict = json.load(file)
+    return layouts,configuration
+
+def verify_roulette_layout(trials:int=200) -> None:
+    """
+    Checks compiled Roulette layouts against the table: every placement pays 36 times its stake over the
+    pockets it covers, illegal placements are refused, and random layouts pay what their bets add up to.
+    """
+    layouts,configuration = _load_roulette_layout()
+
+    assert {size:len(placements) for size,placements in layouts.LEGAL_INSIDE_BETS.items()} == {2:60,3:14,4:23,6:11}
+    for key,size in (("1/3",2),("3/4",2),("2/3/4",3),("3/4/6/7",4),("1/2/3/5/6/7",6),("1/2",3)):
+        try:
+            layouts.parse_inside_bet(key,size)
+            raise AssertionError(f"{key} was accepted")
+        except ValueError:
+            pass
+
+    generator:random.Random = random.Random(23)
+    groups:dict[str,int] = {"SingleNumberBets":1,**layouts.INSIDE_BET_SIZES}
+    for _ in range(trials):
+        layout_configuration:dict = {**configuration}
+        expected:list[float] = [0]*37
+        for group,size in groups.items():
+            placements:list[frozenset[int]] = [frozenset([number]) for number in range(37)] if size == 1 else sorted(layouts.LEGAL_INSIDE_BETS[size],key=sorted)
+            chosen:list[frozenset[int]] = generator.sample(placements,generator.randint(0,4))
+            layout_configuration[group] = {"/".join(str(number) for number in sorted(numbers)):generator.randint(1,5) for numbers in chosen}
+            for numbers in chosen:
+                for number in numbers:
+                    expected[number] += layout_configuration[group]["/".join(str(number) for number in sorted(numbers))]*(36//size)
+        layout_configuration["SingleNumberBets"] = {str(number):layout_configuration["SingleNumberBets"].get(str(number),0) for number in range(37)}
+        for group,names in (("VerticalColumnBets",["1","2","0"]),("DozenBets",["1-12","13-24","25-36"]),("OnetoOneBets",["1-18","19-36","Even","Odd","Red","Black"])):
+            layout_configuration[group] = {name:generator.choice([0,0,1,2.5]) for name in names}
+        for number in range(1,37):
+            color:str = configuration["RouletteColors"][str(number)]
+            expected[number] += layout_configuration["VerticalColumnBets"][str(number%3)]*3
+            expected[number] += layout_configuration["DozenBets"][["1-12","13-24","25-36"][(number-1)//12]]*3
+            expected[number] += layout_configuration["OnetoOneBets"]["1-18" if number <= 18 else "19-36"]*2
+            expected[number] += layout_configuration["OnetoOneBets"]["Even" if number%2 == 0 else "Odd"]*2
+            expected[number] += layout_configuration["OnetoOneBets"][color]*2
+
+        layout = layouts.compile_layout(layout_configuration)
+        assert np.allclose(layout.payouts,expected)
+        if(layout.round_bettings > 0):
+            assert abs(layout.return_to_player()-36/37) < 1e-12
+
+def verify_layout_comparison(spins:int=3_000,minimum_nonce:int=11) -> None:
+    """
+    Checks layouts compared in one pass, in blocks small enough to carry totals and streaks across them,
+    against each layout played on its own one spin at a time.
+    """
+    layouts,configuration = _load_roulette_layout()
+    names,compiled = layouts.compile_layouts(configuration,[
+        {"OnetoOneBets":{"Red":10}},
+        {"Name":"Dozens","DozenBets":{"1-12":2.5,"25-36":1}},
+        {"SingleNumberBets":{"0":1,"17":2},"SplitBets":{"17/20":1},"OnetoOneBets":{"Black":3},"VerticalColumnBets":{"2":0.5}},
+    ])
+    assert names == ["Layout 1","Dozens","Layout 3"]
+    try:
+        layouts.compile_layouts(configuration,[{"DozenBets":{"1-12":0}}])
+        raise AssertionError("A layout without bets was accepted")
+    except ValueError:
+        pass
+    assert (layouts.payout_matrix(compiled) == np.column_stack([layout.payouts for layout in compiled])).all()
+
+    pockets:np.ndarray = np.random.default_rng(24).integers(0,37,spins).astype(np.int8)
+    cells:int = layouts.COMPARISON_CELLS
+    layouts.COMPARISON_CELLS = 3*97
+    try:
+        comparison:dict[str,np.ndarray] = layouts.compare_layouts(compiled,pockets,minimum_nonce)
+    finally:
+        layouts.COMPARISON_CELLS = cells
+    for index,layout in enumerate(compiled):
+        won:float = 0
+        peak:float = 0
+        max_drawdown:float = 0
+        outcomes:list[int] = [0,0,0]
+        for game,pocket in enumerate(pockets.tolist(),start=1):
+            won += layout.payouts[pocket]
+            net_result:float = won-game*layout.round_bettings
+            peak = max(peak,net_result)
+            max_drawdown = max(max_drawdown,peak-net_result)
+            outcomes[0 if layout.wins[pocket] else 1 if layout.partial_losses[pocket] else 2] += 1
+        summary = Shard_Summary.from_wins(minimum_nonce,layout.wins[pockets]).finish()
+        assert comparison["won"][index] == won
+        assert abs(comparison["max_drawdowns"][index]-max_drawdown) < 1e-9
+        assert [comparison["wins"][index],comparison["partial_losses"][index],comparison["total_losses"][index]] == outcomes
+        assert comparison["biggest_winning_streaks"][index] == summary.biggest_streaks[True][1]
+        assert comparison["biggest_losing_streaks"][index] == summary.biggest_streaks[False][1]
+        assert comparison["wagered"][index] == spins*layout.round_bettings
+
+def verify_buffered_log(messages:int=2_000) -> None:
+    """
+    Checks buffered entries all land in order, earlier days are archived as one document and old archives are dropped.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        name:str = "Verification_Log.xml"
+        today:datetime = datetime.now()
+        yesterday:str = (today-timedelta(days=1)).strftime("%Y%m%d")
+        expired:str = (today-timedelta(days=45)).strftime("%Y%m%d")
+        os.makedirs(os.path.join(directory,ARCHIVE_FOLDER))
+        # A joined document from the old logger for today, fragments left from yesterday and an expired archive
+        with open(os.path.join(directory,f"{name}_{today.strftime('%Y%m%d')}.xml"),"w") as file:
+            file.write('<logs><log timestamp="earlier" status="INFO"><message>before</message></log></logs>')
+        with open(os.path.join(directory,f"{name}_{yesterday}.xml"),"w") as file:
+            file.write('<log timestamp="yesterday" status="ERROR"><message>&lt;kept&gt;</message></log>\n')
+        with open(os.path.join(directory,ARCHIVE_FOLDER,f"{name}_{expired}.xml"),"w") as file:
+            file.write("<logs />")
+
+        log:Buffered_Log = Buffered_Log(directory,name,flush_interval=0.01)
+        for index in range(messages):
+            log.log(f"message {index} <&>",status="CRITICAL" if index % 7 == 0 else "INFO")
+        log.close()
+        entries:list[dict[str,str]] = read_log_entries(log.path(today.strftime("%Y%m%d")))
+        assert [entry["message"] for entry in entries] == ["before"]+[f"message {index} <&>" for index in range(messages)]
+        assert [entry["status"] for entry in entries[1:8]] == ["CRITICAL"]+["INFO"]*6
+        archived:list[str] = sorted(os.listdir(os.path.join(directory,ARCHIVE_FOLDER)))
+        assert archived == [f"{name}_{yesterday}.xml"]
+        assert read_log_entries(os.path.join(directory,ARCHIVE_FOLDER,archived[0])) == [{"timestamp":"yesterday","status":"ERROR","message":"<kept>"}]
+
+def _checkpoint_shard(minimum_nonce:int,maximum_nonce:int,crash_nonce:int|None=None) -> Shard_Summary:
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    for nonce in range(minimum_nonce,maximum_nonce+1):
+        if(nonce == crash_nonce):
+            raise RuntimeError(f"Run stopped at nonce {nonce}")
+        win:bool = hashlib.sha256(str(nonce).encode()).digest()[0] < 100
+        summary.add(nonce=nonce,win=win,payout=2.5 if win else 0)
+        summary.rows.append([nonce,win])
+    return summary
+
+def _write_checkpoint_rows(output,rows:list[list],carry:float) -> float:
+    for nonce,win in rows:
+        carry += 2.5 if win else -1
+        output.write(f"{nonce},{win},{carry}\n".encode("utf-8"))
+    return carry
+
+def verify_checkpoint(minimum_nonce:int=3,maximum_nonce:int=5_002) -> None:
+    """
+    Checks that a run stopped part way and resumed from its checkpoint matches a run that was never stopped.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        def run(name:str,resume:bool=False,crash_nonce:int|None=None,workers:int=1) -> tuple[Shard_Summary,float,bytes]:
+            checkpoint:Checkpoint = Checkpoint(os.path.join(directory,f"{name}.pkl"),{"Run":name},every_nonces=1_000)
+            output_path:str = os.path.join(directory,f"{name}.csv")
+            summary,carry = run_checkpointed(
+                _checkpoint_shard,minimum_nonce,maximum_nonce,checkpoint,output_path,_write_checkpoint_rows,
+                carry=0.0,resume=resume,workers=workers,step_nonces=300,crash_nonce=crash_nonce
+            )
+            with open(output_path,"rb") as file:
+                return summary,carry,file.read()
+
+        summary,carry,output = run("straight")
+        for crash_nonce,workers in ((2_345,1),(4_999,2)):
+            try:
+                run("stopped",crash_nonce=crash_nonce)
+                raise AssertionError("The stopped run did not stop")
+            except RuntimeError:
+                pass
+            assert os.path.exists(os.path.join(directory,"stopped.pkl"))
+            resumed_summary,resumed_carry,resumed_output = run("stopped",resume=True,workers=workers)
+            assert resumed_output == output
+            assert resumed_carry == carry
+            assert (resumed_summary.games,resumed_summary.wins,resumed_summary.biggest_streaks,resumed_summary.streak_sizes) == (summary.games,summary.wins,summary.biggest_streaks,summary.streak_sizes)
+            assert not os.path.exists(os.path.join(directory,"stopped.pkl"))
+
+        try:
+            run("stopped",crash_nonce=2_345)
+        except RuntimeError:
+            pass
+        try:
+            Checkpoint(os.path.join(directory,"stopped.pkl"),{"Run":"other"}).load()
+            raise AssertionError("A checkpoint for another configuration was loaded")
+        except ValueError:
+            pass
+        os.remove(os.path.join(directory,"stopped.csv"))
+        try:
+            run("stopped",resume=True)
+            raise AssertionError("A run resumed without the rows written before its checkpoint")
+        except ValueError:
+            pass
+
+def verify_run_fingerprint(rows:int=5_000) -> None:
+    """
+    Checks that fingerprinted output hashes to the files written, however it is split into blocks.
+    """
+    generator:np.random.Generator = np.random.default_rng(4)
+    frame:DataFrame = DataFrame({"Nonce":np.arange(rows),"Result":generator.random(rows)*100,"Win":np.where(generator.random(rows) < 0.5,"YES","NO")})
+    manifests:list[dict] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for block_size in (rows,1_000,333):
+            fingerprint:Run_Fingerprint = Run_Fingerprint({"Block Size":rows},[os.path.abspath(__file__)])
+            paths:tuple[str,str] = (os.path.join(directory,"Results.csv"),os.path.join(directory,"Results.json"))
+            write_result_frames([frame.iloc[low:low+block_size] for low in range(0,rows,block_size)],*paths,list(frame.columns),fingerprint=fingerprint)
+            manifest:dict = fingerprint.manifest()
+            for path in paths:
+                assert manifest["Outputs"][os.path.basename(path)] == {"SHA256":file_sha256(path),"Bytes":os.path.getsize(path)}
+            manifests.append(manifest)
+    assert all(manifest == manifests[0] for manifest in manifests)
+    assert Run_Fingerprint({"Block Size":rows+1},[os.path.abspath(__file__)]).manifest()["Configuration"] != manifests[0]["Configuration"]
+
+if __name__ == "__main__":
+    verify_batch_decoder()
+    print("Batch decoder matches bytes_to_number")
+    verify_cutoffs()
+    print("Integer cutoffs match the float path at every boundary")
+    verify_lane_hmac()
+    print("Lane HMAC digests match hmac")
+    verify_digest_cache()
+    print("Digest cache matches hmac and evicts least recently used seed pairs")
+    verify_shard_runner()
+    print("Merged shard summaries match a single pass")
+    verify_shared_columns()
+    print("Shared result columns match and are unlinked after a worker crash")
+    verify_outcome_stream()
+    print("Streamed outcomes match Byte_Cursor for every game")
+    verify_plinko_engine()
+    print("Plinko engine matches Byte_Cursor and the multiplier table for every risk and row count")
+    verify_dice_multipliers()
+    print("Computed Dice multipliers match every entry of the old table")
+    verify_bet_progression()
+    print("Array bet progressions match a loop betting one game at a time")
+    verify_sweep()
+    print("Threshold and target sweeps match each cutoff simulated on its own")
+    verify_rare_outcomes()
+    print("Indexed rare outcomes match Byte_Cursor as the scanned range grows")
+    verify_streak_statistics()
+    print("Streak statistics from size counts match numpy on the full streak list")
+    verify_plot_series()
+    print("Plot series keep their extremes at a fixed size")
+    verify_category_table()
+    print("Category counts and streaks from the lookup table match a loop over every game")
+    verify_roulette_layout()
+    print("Compiled Roulette layouts pay what their bets add up to on every pocket")
+    verify_layout_comparison()
+    print("Layouts compared in one pass match each layout played on its own")
+    verify_buffered_log()
+    print("Buffered log appends every entry in order and rotates earlier days")
+    verify_checkpoint()
+    print("Runs resumed from a checkpoint match runs that were never stopped")
+    verify_run_fingerprint()
+    print("Run fingerprints match the SHA-256 of the files written")
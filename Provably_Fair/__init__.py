@@ -0,0 +1,35 @@
+from .Byte_Cursor import (
+    Byte_Cursor,
+    bytes_to_number,
+    seeds_to_digests,
+    seeds_to_hexadecimals,
+    sha256_encrypt,
+)
+from .Seed_Hasher import (
+    Seed_Hasher,
+    get_seed_hasher,
+)
+from .Batch_Decoder import (
+    digests_to_floats,
+    digests_to_numbers,
+    digests_to_words,
+    seeds_to_digest_matrix,
+    words_to_floats,
+    words_to_numbers,
+)
+from .Cutoffs import (
+    compile_bucket_cutoffs,
+    compile_dice_cutoff,
+    compile_limbo_cutoff,
+    dice_wins,
+    limbo_wins,
+    words_to_buckets,
+)
+from .Lane_SHA256 import (
+    Lane_HMAC,
+    lane_digest_matrix,
+)
+from .Digest_Cache import (
+    Digest_Cache,
+    get_digest_cache,
+)
@@ -1,9 +1,9 @@
-import hmac
-import hashlib
+import os
+import sys
 import random
 import string
 from io import BytesIO
-from math import floor
+from typing import Iterator
 import json
 from pandas import DataFrame
 from fpdf import FPDF,XPos,YPos
@@ -12,6 +12,8 @@ from Cards import cards
 from matplotlib.container import BarContainer
 from matplotlib.ticker import FuncFormatter
 from numpy import mean,median,quantile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Provably_Fair import Byte_Cursor,sha256_encrypt
 
 def generate_server_seed():
     possible_characters:str = string.hexdigits
@@ -23,52 +25,14 @@ def generate_client_seed():
     seed:str = "".join([random.choice(possible_characters) for _ in range(20)])
     return seed
 
-def sha256_encrypt(input_string: str) -> str:
-    # Create a sha256 hash object
-    sha256_hash = hashlib.sha256()
-    
-    # Update the hash object with the bytes of the input string
-    sha256_hash.update(input_string.encode('utf-8'))
-    
-    # Return the hexadecimal representation of the hash
-    return sha256_hash.hexdigest()
-
-def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(7)]
-    hmac_objs:list[hmac.HMAC] = [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256) for message in messages]
-    return [hmac_obj.hexdigest() for hmac_obj in hmac_objs]
-
-def hexadecimal_to_bytes(hexadecimal:str) -> list[int]:
-    return list(bytes.fromhex(hexadecimal))
-
-def bytes_to_basic_number(bytes_list: list[int]) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float = ((float(bytes_list[0]) / float(256**1)) +
-              (float(bytes_list[1]) / float(256**2)) +
-              (float(bytes_list[2]) / float(256**3)) +
-              (float(bytes_list[3]) / float(256**4)))
-    return number
-
-def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float =  (
-                        (float(bytes_list[0]) / float(256**1)) +
-                        (float(bytes_list[1]) / float(256**2)) +
-                        (float(bytes_list[2]) / float(256**3)) +
-                        (float(bytes_list[3]) / float(256**4))
-                    )
-    number = number*multiplier
-    return floor(number)
+def deal_cards(server_seed:str,client_seed:str,nonce:int) -> Iterator[str]:
+    # Each round is hashed when the hand takes its first card, so a hand over after 8 cards costs one HMAC instead of seven
+    cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+    for _ in range(52):
+        yield cards[cursor.next_number(52)]
 
 def seeds_to_results(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    hexs = seeds_to_hexadecimals(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
-    bytes_lists:list[list[int]] = [hexadecimal_to_bytes(current_hex) for current_hex in hexs]
-    row:list[list[int]] = []
-    for bytes_list in bytes_lists:
-        for index in range(0,len(bytes_list),4):
-            row.append(cards[bytes_to_number(bytes_list[index:index+4],52)])
-            if(len(row)==52):
-                return row
+    return list(deal_cards(server_seed=server_seed,client_seed=client_seed,nonce=nonce))
 
 def thousands_formatter(x, pos):
     return f"{x:,.0f}"
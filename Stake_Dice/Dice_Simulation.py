@@ -1,18 +1,28 @@
 import os
-import hmac
-import hashlib
+import sys
 import random
 import string
+import argparse
 from io import BytesIO
-from math import floor
 import json
-from pandas import DataFrame
+from pandas import DataFrame,concat
 from fpdf import FPDF,XPos,YPos
 import matplotlib.pyplot as plt
 from matplotlib.container import BarContainer
 from matplotlib.ticker import FuncFormatter
-from numpy import mean,median,quantile
-from Mulitpliers import dice_multipliers
+from numpy import array,count_nonzero,flatnonzero,full,int64,isnan,mean,median,ndarray,quantile,rint,sqrt,where
+from Mulitpliers import dice_multiplier,dice_multiplier_tables
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Provably_Fair import Byte_Cursor,sha256_encrypt
+from Provably_Fair.Bet_Progression import play_balance,running_total
+from Provably_Fair.Outcome_Stream import decode_block,parse_digest_options
+from Provably_Fair.Result_Writer import write_result_frames
+from Provably_Fair.Shard_Runner import Shard_Summary,parse_workers
+from Provably_Fair.Shared_Columns import RESULT_COLUMNS as SHARED_COLUMNS,Shared_Result_Columns,run_sharded_columns
+from Provably_Fair.Sweep import dice_threshold_sweep
+
+BLOCK_SIZE:int = 1_000_000
+RESULT_COLUMNS:list[str] = ["Server Seed","Client Seed","Nonce","Over Under","Threshold","Result","Win","Bet Size","Gross Winnings (Round)","Total Money Wagered","Gross Total Winnings"]
 
 def generate_server_seed():
     possible_characters:str = string.hexdigits
@@ -24,52 +34,104 @@ def generate_client_seed():
     seed:str = "".join([random.choice(possible_characters) for _ in range(20)])
     return seed
 
-def sha256_encrypt(input_string: str) -> str:
-    # Create a sha256 hash object
-    sha256_hash = hashlib.sha256()
-    
-    # Update the hash object with the bytes of the input string
-    sha256_hash.update(input_string.encode('utf-8'))
-    
-    # Return the hexadecimal representation of the hash
-    return sha256_hash.hexdigest()
-
-def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(1)]
-    hmac_objs:list[hmac.HMAC] = [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256) for message in messages]
-    return [hmac_obj.hexdigest() for hmac_obj in hmac_objs]
-
-def hexadecimal_to_bytes(hexadecimal:str) -> list[int]:
-    return list(bytes.fromhex(hexadecimal))
-
-def bytes_to_basic_number(bytes_list: list[int]) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float = ((float(bytes_list[0]) / float(256**1)) +
-              (float(bytes_list[1]) / float(256**2)) +
-              (float(bytes_list[2]) / float(256**3)) +
-              (float(bytes_list[3]) / float(256**4)))
-    return number
-
-def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float =  (
-                        (float(bytes_list[0]) / float(256**1)) +
-                        (float(bytes_list[1]) / float(256**2)) +
-                        (float(bytes_list[2]) / float(256**3)) +
-                        (float(bytes_list[3]) / float(256**4))
-                    )
-    number = number*multiplier
-    return floor(number)
-
 def seeds_to_results(server_seed:str,client_seed:str,nonce:int) -> float:
-    hexs = seeds_to_hexadecimals(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
-    bytes_lists:list[list[int]] = [hexadecimal_to_bytes(current_hex) for current_hex in hexs]
-    row:list[list[int]] = []
-    for bytes_list in bytes_lists:
-        for index in range(0,len(bytes_list),4):
-            row.append(bytes_to_number(bytes_list[index:index+4],10001))
-            if(len(row)==1):
-                return round(sum(row)/100,2)
+    cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+    return round(cursor.next_number(10001)/100,2)
+
+def seeds_to_results_block(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,cache:bool=False,lane:bool=False) -> ndarray:
+    """
+    Rolls for every nonce of minimum_nonce..maximum_nonce, equal to seeds_to_results for each one.
+    """
+    return decode_block("Dice",server_seed,client_seed,minimum_nonce,maximum_nonce,cache=cache,lane=lane)
+
+def roll_wins(rolls:ndarray,over_under:str,threshold:float) -> ndarray:
+    # A roll on the threshold loses both ways
+    losses:ndarray = ((rolls <= threshold) & (over_under == "Over")) | ((rolls >= threshold) & (over_under == "Under"))
+    return ~losses
+
+def simulate_nonce_range(columns:dict[str,ndarray],server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,over_under:str,threshold:float,cache:bool=False,lane:bool=False) -> Shard_Summary:
+    """
+    Rolls minimum_nonce..maximum_nonce into columns["outcome"] one block at a time.
+
+    Returns:
+        Shard_Summary: Wins and streaks of the range, as if every game is played.
+    """
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    for low in range(minimum_nonce,maximum_nonce+1,BLOCK_SIZE):
+        high:int = min(low+BLOCK_SIZE-1,maximum_nonce)
+        rolls:ndarray = seeds_to_results_block(server_seed,client_seed,low,high,cache=cache,lane=lane)
+        columns["outcome"][low-minimum_nonce:high-minimum_nonce+1] = rolls
+        summary = summary.merge(Shard_Summary.from_wins(low,roll_wins(rolls,over_under,threshold)))
+    return summary
+
+def round_cents(values:ndarray) -> ndarray:
+    if(values.dtype.kind in "iu"):
+        return values
+    # np.round scales by 100 first and can land on the other side of a half cent, round() cannot
+    return array([round(value,2) for value in values.tolist()],dtype=values.dtype)
+
+def result_frames(server:str,client:str,minimum_nonce:int,over_under:str,threshold:float,rolls:ndarray,wins:ndarray,bet_size:float,payout:float):
+    """
+    Yields the rows of the results table one block at a time, with the values and column types of a row per game.
+    """
+    money_bet:float = 0
+    money_won:float = 0
+    any_wins:bool = bool(wins.any())
+    for low in range(0,len(rolls),BLOCK_SIZE):
+        block_wins:ndarray = wins[low:low+BLOCK_SIZE]
+        games:int = len(block_wins)
+        # Losing rounds pay an integer 0, so the payout columns only turn float once there is a win
+        payouts:ndarray = where(block_wins,payout,0) if any_wins else full(games,0)
+        total_bets:ndarray = running_total(money_bet,full(games,bet_size))
+        total_winnings:ndarray = running_total(money_won,payouts)
+        money_bet,money_won = total_bets[-1],total_winnings[-1]
+        frame:DataFrame = DataFrame({
+            "Server Seed": server,
+            "Client Seed": client,
+            "Nonce": range(minimum_nonce+low,minimum_nonce+low+games),
+            "Over Under": over_under.upper(),
+            "Threshold": full(games,threshold),
+            "Result": rolls[low:low+games],
+            "Win": where(block_wins,"YES","NO").astype(object),
+            "Bet Size": full(games,bet_size),
+            "Gross Winnings (Round)": payouts,
+            # Winning rows are rounded to the cent, losing rows are not
+            "Total Money Wagered": where(block_wins,round_cents(total_bets),total_bets),
+            "Gross Total Winnings": where(block_wins,round_cents(total_winnings),total_winnings),
+        },index=range(low,low+games))
+        yield frame
+
+def threshold_sweep_table(rolls:ndarray) -> DataFrame:
+    """
+    Wins, RTP and biggest losing streak for every Over and Under threshold on offer, from one pass over the rolls.
+    """
+    games:int = len(rolls)
+    sweep:dict[str,dict[str,ndarray]] = dice_threshold_sweep(rint(rolls*100).astype(int64))
+    tables:list[DataFrame] = []
+    for over_under,multipliers in dice_multiplier_tables.items():
+        indexes:ndarray = flatnonzero(~isnan(multipliers))
+        thresholds:ndarray = indexes/100
+        win_chances:ndarray = (100-thresholds if over_under == "Over" else thresholds).round(2)
+        theoretical_wins:ndarray = games*(win_chances/100)
+        wins:ndarray = sweep[over_under]["wins"][indexes]
+        tables.append(DataFrame({
+            "Over Under": over_under.upper(),
+            "Threshold": thresholds,
+            "Win Chance": win_chances,
+            "Winning Multiplier": multipliers[indexes],
+            "Theoretical Number of Wins": theoretical_wins,
+            "Actual Number of Wins": wins,
+            "Deviation": wins-theoretical_wins,
+            "Deviation (Standard Deviations)": (wins-theoretical_wins)/sqrt(theoretical_wins*(1-win_chances/100)),
+            "Return to Player (RTP)": (wins*multipliers[indexes]/games)*100,
+            "Biggest Losing Streak": sweep[over_under]["biggest_losing_streaks"][indexes],
+        }))
+    return concat(tables,ignore_index=True)
+
+def parse_sweep() -> bool:
+    parser:argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--sweep",action="store_true",help="Tabulate every Over and Under threshold instead of playing Threshold")
+    return parser.parse_known_args()[0].sweep
 
 def confirm_threshold_with_win_chance(over_under:str, threshold:float, win_chance:float) -> bool:
     if(
@@ -193,88 +255,56 @@ if __name__ == "__main__":
         server:str = configuration["ServerSeed"]
         server_hashed:str = sha256_encrypt(server)
         client:str = configuration["ClientSeed"]
-        nonces:list[int] = list(range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1))
+        nonces:range = range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1)
         over_under:str = configuration["OverUnder"]
         threshold:float = round(configuration["Threshold"],2)
         bet_size:float = configuration["BetSize"]
         largest_bet_size:float = bet_size
 
-        results:list[list[float|int]] = []
-        current_result:list[int] = []
-
-        biggest_winning_streak:tuple[int,int] = (0,0)
-        biggest_losing_streak:tuple[int,int] = (0,0)
-
-        current_winning_streak:int = 0
-        current_losing_streak:int = 0
-        losing_streak_sizes:list[int] = []
-        winning_streak_sizes:list[int] = []
-
-        total_number_of_wins:int = 0
-        total_number_of_losses:int = 0
-        total_games_played:int = 0
+        winning_multiplier:float = dice_multiplier(over_under,threshold)
+        payout:float = bet_size*winning_multiplier
 
         balance:float = 10_000_000
         starting_balance:float = balance
-        biggest_balance:float = balance
-
-        money_spent_over_current_losing_streak:float = 0
-        most_money_spent_over_current_losing_streak:float = 0
-
-        money_won:float = 0
-        money_bet:float = 0
-        perfect_rolls:dict[int,int] = {0:0,100:0}
-
-    for nonce in nonces:
-        total_games_played += 1
-        current_result = [server,client,nonce]
-        seed_result = seeds_to_results(server_seed=server,client_seed=client,nonce=nonce)
-        balance -= bet_size
-        money_bet += bet_size
-        if(balance < 0):
-            break
-        if(
-            (
-                (seed_result <= threshold)and
-                (over_under == "Over")
-            )
-            or
-            (
-                (seed_result >= threshold)and
-                (over_under == "Under")
-            )
-          ):
-            if(current_winning_streak > biggest_winning_streak[1]):
-                biggest_winning_streak = (nonce-current_winning_streak,current_winning_streak)
-            if(current_winning_streak>0):
-                winning_streak_sizes.append(current_winning_streak)
-            current_winning_streak = 0
-            current_losing_streak += 1
-            total_number_of_losses += 1
-            money_spent_over_current_losing_streak += bet_size
-            current_result.extend([over_under.upper(),threshold,seed_result,"NO",bet_size,0,money_bet,money_won])
-        else:
-            if(current_losing_streak > biggest_losing_streak[1]):
-                biggest_losing_streak = (nonce-current_losing_streak,current_losing_streak)
-            if(money_spent_over_current_losing_streak > most_money_spent_over_current_losing_streak):
-                most_money_spent_over_current_losing_streak = money_spent_over_current_losing_streak
-            if(current_losing_streak>0):
-                losing_streak_sizes.append(current_losing_streak)
-            current_losing_streak = 0
-            money_spent_over_current_losing_streak = 0
-            current_winning_streak += 1
-            total_number_of_wins += 1
-            money_won += (bet_size*dice_multipliers[over_under][float(f"{threshold:.2f}")])
-            balance += bet_size*dice_multipliers[over_under][float(f"{threshold:.2f}")]
-            if(balance > biggest_balance):
-                biggest_balance = balance
-            current_result.extend([over_under.upper(),threshold,seed_result,"YES",bet_size,bet_size*dice_multipliers[over_under][float(f"{threshold:.2f}")],round(money_bet,2),round(money_won,2)])
-        if((seed_result > 99.99) or (seed_result < 0.01)):
-            perfect_rolls[int(seed_result)] += 1
-        results.append(current_result)
-    df:DataFrame = DataFrame(results,columns=["Server Seed","Client Seed","Nonce","Over Under","Threshold","Result","Win","Bet Size","Gross Winnings (Round)","Total Money Wagered","Gross Total Winnings"])
-    df.to_csv(os.path.join(BASE_DIR,f"DICE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv"),index=True)
-    df.to_json(os.path.join(BASE_DIR,f"DICE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.json"),orient='table',indent=4)
+
+    # Rolls are the only column the shards write, the money columns are worked out once the balance is known
+    with Shared_Result_Columns(nonces[0],nonces[-1],dtypes={"outcome":SHARED_COLUMNS["outcome"]}) as result_columns:
+        summary:Shard_Summary = run_sharded_columns(
+            simulate_nonce_range,result_columns,workers=parse_workers(),
+            server_seed=server,client_seed=client,over_under=over_under,threshold=threshold,**parse_digest_options()
+        )
+        rolls:ndarray = result_columns["outcome"].copy()
+    if(parse_sweep()):
+        threshold_sweep_table(rolls).to_csv(os.path.join(BASE_DIR,f"DICE_SWEEP_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv"),index=False)
+        sys.exit(0)
+    wins:ndarray = roll_wins(rolls,over_under,threshold)
+
+    total_games_played,balance,biggest_balance = play_balance(full(len(wins),bet_size),where(wins,payout,0),wins,balance)
+    # A game that takes the balance below zero is bet on, but never rolled
+    games_rolled:int = total_games_played if balance >= 0 else total_games_played-1
+    if(games_rolled < len(nonces)):
+        # The streaks stop where the balance ran out
+        rolls,wins = rolls[:games_rolled],wins[:games_rolled]
+        summary = Shard_Summary.from_wins(nonces[0],wins).finish()
+    total_number_of_wins:int = summary.wins
+    total_number_of_losses:int = summary.losses
+    biggest_winning_streak:tuple[int,int] = summary.biggest_streaks[True]
+    biggest_losing_streak:tuple[int,int] = summary.biggest_streaks[False]
+    winning_streak_sizes:list[int] = summary.streak_list(True)
+    losing_streak_sizes:list[int] = summary.streak_list(False)
+    # Money spent over a losing streak only grows with its length, so the most spent is over the biggest one
+    most_money_spent_over_current_losing_streak:float = running_total(0,full(biggest_losing_streak[1],bet_size))[-1] if biggest_losing_streak[1] else 0
+
+    money_bet:float = running_total(0,full(total_games_played,bet_size))[-1]
+    money_won:float = running_total(0,full(total_number_of_wins,payout))[-1] if total_number_of_wins else 0
+    perfect_rolls:dict[int,int] = {0:int(count_nonzero(rolls < 0.01)),100:int(count_nonzero(rolls > 99.99))}
+
+    write_result_frames(
+        result_frames(server,client,nonces[0],over_under,threshold,rolls,wins,bet_size,payout),
+        os.path.join(BASE_DIR,f"DICE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv"),
+        os.path.join(BASE_DIR,f"DICE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.json"),
+        RESULT_COLUMNS
+    )
 
     analysis_data:dict[str,int|float|str] = {
         "summary":f"""Server Seed: {server}
@@ -333,8 +363,8 @@ Largest Balance Ever: ${biggest_balance:,.2f}
 Bet Size: ${bet_size:,.2f}
 Largest Bet Made: ${largest_bet_size:,.2f}
 Most Money Spent Over Losing Streak: ${most_money_spent_over_current_losing_streak:,.2f}
-Winning Multiplier: {dice_multipliers[over_under][float(f"{threshold:.2f}")]:,.4f}
-Net Profit per Win: ${bet_size*dice_multipliers[over_under][float(f"{threshold:.2f}")] - bet_size:,.2f}
+Winning Multiplier: {winning_multiplier:,.4f}
+Net Profit per Win: ${bet_size*winning_multiplier - bet_size:,.2f}
 Number of games simulated: {total_games_played:,.0f}
 Number of wins: {total_number_of_wins:,.0f}
 Number of Losses: {total_number_of_losses:,.0f}
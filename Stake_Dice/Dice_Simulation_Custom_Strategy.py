@@ -1,12 +1,33 @@
-import hmac
-import hashlib
+import os
+import sys
 import random
 import string
-from math import floor
-from numpy import mean,median,quantile
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from numpy import count_nonzero,mean,median,ndarray,quantile,where
 import json
 from pandas import DataFrame
-from Mulitpliers import dice_multipliers
+from Mulitpliers import dice_multiplier
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Provably_Fair import Byte_Cursor,sha256_encrypt
+from Provably_Fair.Bet_Progression import compile_streak_stakes,losing_streak_lengths,play_balance,running_total
+from Provably_Fair.Outcome_Stream import decode_block
+from Provably_Fair.Shard_Runner import Shard_Summary,parse_workers
+
+SEED_PAIRS:int = 100_000
+NONCES_PER_PAIR:int = 1_000_000
+BLOCK_SIZE:int = 100_000
+PAIRS_PER_TASK:int = 4
+
+STARTING_BALANCE:float = 1_000_000_000
+MINIMUM_LOSING_STREAK_TO_START_BETS:int = 35
+INTERVAL_LOSING_STREAK:int = 37
+INITIAL_BET_SIZE:float = 0.2
+INCREMENT_BET_INCREASE:float = 3
+# Losing streak lengths after which the bet is multiplied again
+BET_INCREASE_STREAKS:frozenset[int] = frozenset(MINIMUM_LOSING_STREAK_TO_START_BETS+(INTERVAL_LOSING_STREAK*increment) for increment in range(1,100))
 
 def generate_server_seed():
     possible_characters:str = string.hexdigits
@@ -18,52 +39,15 @@ def generate_client_seed():
     seed:str = "".join([random.choice(possible_characters) for _ in range(20)])
     return seed
 
-def sha256_encrypt(input_string: str) -> str:
-    # Create a sha256 hash object
-    sha256_hash = hashlib.sha256()
-    
-    # Update the hash object with the bytes of the input string
-    sha256_hash.update(input_string.encode('utf-8'))
-    
-    # Return the hexadecimal representation of the hash
-    return sha256_hash.hexdigest()
-
-def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(1)]
-    hmac_objs:list[hmac.HMAC] = [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256) for message in messages]
-    return [hmac_obj.hexdigest() for hmac_obj in hmac_objs]
-
-def hexadecimal_to_bytes(hexadecimal:str) -> list[int]:
-    return list(bytes.fromhex(hexadecimal))
-
-def bytes_to_basic_number(bytes_list: list[int]) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float = ((float(bytes_list[0]) / float(256**1)) +
-              (float(bytes_list[1]) / float(256**2)) +
-              (float(bytes_list[2]) / float(256**3)) +
-              (float(bytes_list[3]) / float(256**4)))
-    return number
-
-def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float =  (
-                        (float(bytes_list[0]) / float(256**1)) +
-                        (float(bytes_list[1]) / float(256**2)) +
-                        (float(bytes_list[2]) / float(256**3)) +
-                        (float(bytes_list[3]) / float(256**4))
-                    )
-    number = number*multiplier
-    return floor(number)
-
 def seeds_to_results(server_seed:str,client_seed:str,nonce:int) -> float:
-    hexs = seeds_to_hexadecimals(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
-    bytes_lists:list[list[int]] = [hexadecimal_to_bytes(current_hex) for current_hex in hexs]
-    row:list[list[int]] = []
-    for bytes_list in bytes_lists:
-        for index in range(0,len(bytes_list),4):
-            row.append(bytes_to_number(bytes_list[index:index+4],10001))
-            if(len(row)==1):
-                return round(sum(row)/100,2)
+    cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+    return round(cursor.next_number(10001)/100,2)
+
+def seeds_to_results_block(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int) -> ndarray:
+    """
+    Rolls for every nonce of minimum_nonce..maximum_nonce, equal to seeds_to_results for each one.
+    """
+    return decode_block("Dice",server_seed,client_seed,minimum_nonce,maximum_nonce)
 
 def confirm_threshold_with_win_chance(over_under:str, threshold:float, win_chance:float) -> bool:
     if(
@@ -80,18 +64,159 @@ def confirm_threshold_with_win_chance(over_under:str, threshold:float, win_chanc
     
     return False
 
+def roll_wins(rolls:ndarray,over_under:str,threshold:float) -> ndarray:
+    # A roll on the threshold loses both ways
+    losses:ndarray = ((rolls <= threshold) & (over_under == "Over")) | ((rolls >= threshold) & (over_under == "Under"))
+    return ~losses
+
+def next_strategy_stake(losing_streak:int,stake:float) -> float:
+    if(losing_streak == MINIMUM_LOSING_STREAK_TO_START_BETS):
+        return INITIAL_BET_SIZE
+    if(losing_streak in BET_INCREASE_STREAKS):
+        return stake*INCREMENT_BET_INCREASE
+    return stake
+
+def simulate_seed_pair(server:str,client:str,over_under:str,threshold:float,winning_multiplier:float) -> dict[str,str|int|float|bool]:
+    """
+    Plays the losing streak strategy over nonces 1..NONCES_PER_PAIR of one seed pair.
+
+    The stake only depends on the length of the losing streak in progress, so each block of rolls is
+    played with array operations: losing streak lengths index a stake table, and the balance is a running
+    total. Rolls are hashed a block at a time, and no further blocks are hashed once the balance goes negative.
+
+    Returns:
+        dict: One row of the Monte Carlo results table.
+    """
+    balance:float = STARTING_BALANCE
+    biggest_balance:float = balance
+    bet_size:float = 0
+    largest_bet_size:float = 0
+    current_losing_streak:int = 0
+    total_games_played:int = 0
+    money_won:float = 0
+    money_bet:float = 0
+    most_money_spent_over_current_losing_streak:float = 0
+    perfect_rolls:int = 0
+    went_broke:bool = False
+    summary:Shard_Summary = Shard_Summary(1)
+
+    for low in range(1,NONCES_PER_PAIR+1,BLOCK_SIZE):
+        high:int = min(low+BLOCK_SIZE-1,NONCES_PER_PAIR)
+        rolls:ndarray = seeds_to_results_block(server,client,low,high)
+        wins:ndarray = roll_wins(rolls,over_under,threshold)
+        losing_streaks:ndarray = losing_streak_lengths(wins,current_losing_streak)
+        stake_table:ndarray = compile_streak_stakes(int(losing_streaks.max())+1,0,next_strategy_stake)
+        stakes:ndarray = stake_table[losing_streaks]
+        payouts:ndarray = where(wins,stakes*winning_multiplier,0)
+
+        played,balance,block_biggest_balance = play_balance(stakes,payouts,wins,balance)
+        biggest_balance = max(biggest_balance,block_biggest_balance)
+        went_broke = balance < 0
+        # The game that goes below zero is bet on and closes the streak before it, but pays nothing
+        rolled:int = played-1 if went_broke else played
+        total_games_played += played
+        summary = summary.merge(Shard_Summary.from_wins(low,wins[:played]))
+        money_bet = running_total(money_bet,stakes[:played])[-1]
+        money_won = running_total(money_won,payouts[:rolled])[-1] if rolled else money_won
+
+        # Money spent over a losing streak only grows with its length, and is counted when a win ends it
+        closed_streaks:ndarray = losing_streaks[:played][wins[:played]]
+        if(len(closed_streaks) and closed_streaks.max() > 0):
+            most_money_spent_over_current_losing_streak = max(most_money_spent_over_current_losing_streak,running_total(0,stake_table)[closed_streaks.max()-1])
+        # Only a loss that reaches an increase point raises the largest bet
+        reached_streaks:ndarray = losing_streaks[:rolled][~wins[:rolled]]+1
+        if(len(reached_streaks)):
+            largest_bet_size = max([largest_bet_size]+[stake_table[streak] for streak in BET_INCREASE_STREAKS if streak <= reached_streaks.max()])
+        if(over_under == "Over"):
+            perfect_rolls += int(count_nonzero(rolls[:rolled] > 99.99))
+        elif(over_under == "Under"):
+            perfect_rolls += int(count_nonzero(rolls[:rolled] < 0.01))
+
+        if(went_broke):
+            bet_size = stakes[played-1]
+            break
+        current_losing_streak = 0 if wins[-1] else int(losing_streaks[-1])+1
+        bet_size = stake_table[current_losing_streak]
+
+    summary.finish()
+    losing_streak_sizes:list[int] = summary.streak_list(False)
+    return {
+        "Server Seed": server,
+        "Server Seed (Hashed)": sha256_encrypt(server),
+        "Client Seed": client,
+        "Games Played": total_games_played,
+        "Wins": summary.wins,
+        "Losses": summary.losses,
+        "Went Broke": went_broke,
+        "Ending Balance": balance if balance>0 else 0,
+        "Largest Balance": biggest_balance,
+        "Final Bet Size": float(bet_size),
+        "Largest Bet Made": float(largest_bet_size),
+        "Most Money Spent Over Losing Streak": float(most_money_spent_over_current_losing_streak),
+        "Total Money Wagered": float(money_bet),
+        "Gross Winnings": float(money_won),
+        "Net Result": float(money_won-money_bet),
+        "Biggest Winning Streak": summary.biggest_streaks[True][1],
+        "Starting Nonce of Biggest Winning Streak": summary.biggest_streaks[True][0],
+        "Biggest Losing Streak": summary.biggest_streaks[False][1],
+        "Starting Nonce of Biggest Losing Streak": summary.biggest_streaks[False][0],
+        "Mean Losing Streak": float(mean(losing_streak_sizes)) if len(losing_streak_sizes)>0 else 0,
+        "Median Losing Streak": float(median(losing_streak_sizes)) if len(losing_streak_sizes)>0 else 0,
+        f"Perfect {100 if over_under=='Over' else 0} Rolls": perfect_rolls,
+    }
+
+def simulate_seed_pairs(seed_pairs:list[tuple[str,str]],over_under:str,threshold:float,winning_multiplier:float) -> list[dict[str,str|int|float|bool]]:
+    return [simulate_seed_pair(server,client,over_under,threshold,winning_multiplier) for server,client in seed_pairs]
+
+def run_monte_carlo(seed_pairs:list[tuple[str,str]],over_under:str,threshold:float,winning_multiplier:float,workers:int=1) -> DataFrame:
+    """
+    Plays the strategy over every seed pair, spread across a process pool when workers > 1.
+
+    Returns:
+        DataFrame: One row per seed pair, in the order of seed_pairs.
+    """
+    results:defaultdict[str,list] = defaultdict(list)
+    tasks:list[list[tuple[str,str]]] = [seed_pairs[index:index+PAIRS_PER_TASK] for index in range(0,len(seed_pairs),PAIRS_PER_TASK)]
+    play:partial = partial(simulate_seed_pairs,over_under=over_under,threshold=threshold,winning_multiplier=winning_multiplier)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for task_result in (executor.map(play,tasks) if workers > 1 else map(play,tasks)):
+            for summary in task_result:
+                print(f"{summary['Server Seed']}\n{summary['Client Seed']}\n")
+                for name,value in summary.items():
+                    results[name].append(value)
+    return DataFrame(results)
+
+def distribution_summary(results:DataFrame) -> str:
+    """
+    Statistics across every seed pair for the numeric columns of the results table.
+    """
+    lines:list[str] = [
+        f"Seed pairs simulated: {len(results):,.0f}",
+        f"Seed pairs that went broke: {results['Went Broke'].sum():,.0f} ({results['Went Broke'].mean()*100:,.2f}%)",
+        f"Return to Player (RTP): {(results['Gross Winnings'].sum()/results['Total Money Wagered'].sum())*100 if results['Total Money Wagered'].sum()>0 else 0:,.2f}%",
+        "Statistical Summary Across Seed Pairs:",
+        "\t\tMean\t\t|\t\tMin\t\t|\t\t25%\t\t|\t\t50%\t\t|\t\t75%\t\t|\t\t95%\t\t|\t\t99%\t\t|\t\tMax",
+    ]
+    for name in results.columns:
+        if(results[name].dtype.kind not in "iuf"):
+            continue
+        values:ndarray = results[name].to_numpy()
+        lines.append(f"{name}:")
+        lines.append("\t\t"+"\t\t|\t\t".join(f"{statistic:,.2f}" for statistic in [mean(values),values.min(),*quantile(values,[0.25,0.5,0.75,0.95,0.99]),values.max()]))
+    return "\n".join(lines)+"\n"
+
 if __name__ == "__main__":
+    parser:argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--pairs",type=int,default=SEED_PAIRS,help="Freshly generated seed pairs to simulate")
+    seed_pair_count:int = parser.parse_known_args()[0].pairs
+    workers:int = parse_workers()
+
     with open("Configuration.json","rb") as file:
         configuration:dict[str,str|int] = json.load(file)
 
-    server:str = generate_server_seed()#configuration["ServerSeed"]
-    server_hashed:str = sha256_encrypt(server)
-    client:str = generate_client_seed()#configuration["ClientSeed"]
-    nonces:list[int] = list(range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1))
     over_under:str = configuration["OverUnder"]
     threshold:float = round(configuration["Threshold"],2)
-    win_chance:float = round(configuration["WinChance"],2)
-    bet_size:float = 0
+    win_chance:float = round(configuration.get("WinChance",threshold if over_under=="Under" else 100-threshold),2)
 
     if(confirm_threshold_with_win_chance(over_under=over_under, threshold=threshold, win_chance=win_chance)):
         pass
@@ -100,154 +225,19 @@ if __name__ == "__main__":
             threshold = 100-win_chance
         else:
             threshold = win_chance
-
-    results:list[list[float|int]] = []
-    current_result:list[int] = []
-
-    biggest_winning_streak:tuple[int,int] = (0,0)
-    biggest_losing_streak:tuple[int,int] = (0,0)
-
-    minimum_losing_streak_to_start_bets:int = 35
-    interval_losing_streak:int = 37
-    initial_bet_size:float = 0.2
-    increment_bet_increase:float = 3
-    balance:float = 1_000_000_000
-    biggest_balance:float = balance
-    starting_balance:float = balance
-
-    current_winning_streak:int = 0
-    current_losing_streak:int = 0
-    losing_streak_sizes:list[int] = []
-    total_number_of_wins:int = 0
-    total_number_of_losses:int = 0
-    total_games_played:int = 0
-    money_won:float = 0
-    money_bet:float = 0
-    nonces_with_perfect_rolls:list[int] = []
-    money_spent_over_current_losing_streak:float = 0
-    most_money_spent_over_current_losing_streak:float = 0
-
-    for _ in range(100000):
-        server:str = generate_server_seed()#configuration["ServerSeed"]
-        server_hashed:str = sha256_encrypt(server)
-        client:str = generate_client_seed()#configuration["ClientSeed"]
-        print(f"{server}\n{client}\n")
-        balance:float = starting_balance
-        biggest_balance:float = balance
-        nonces:int = list(range(1,1000001))
-        current_losing_streak:int = 0
-        bet_size:float = 0
-        largest_bet_size:float = 0
-        current_winning_streak:int = 0
-        current_losing_streak:int = 0
-        losing_streak_sizes:list[int] = []
-        total_number_of_wins:int = 0
-        total_number_of_losses:int = 0
-        total_games_played:int = 0
-        money_won:float = 0
-        money_bet:float = 0
-        most_money_spent_over_current_losing_streak:float = 0
-        money_spent_over_current_losing_streak:float = 0
-        nonces_with_perfect_rolls:list[int] = []
-        biggest_winning_streak:tuple[int,int] = (0,0)
-        biggest_losing_streak:tuple[int,int] = (0,0)
-
-        for nonce in nonces:
-            total_games_played += 1
-            current_result = [server,client,nonce]
-            seed_result = seeds_to_results(server_seed=server,client_seed=client,nonce=nonce)
-            if(
-                (
-                    (seed_result <= threshold)and
-                    (over_under == "Over")
-                )
-                or
-                (
-                    (seed_result >= threshold)and
-                    (over_under == "Under")
-                )
-            ):
-                if(current_winning_streak > biggest_winning_streak[1]):
-                    biggest_winning_streak = (nonce-current_winning_streak,current_winning_streak)
-                current_winning_streak = 0
-                current_losing_streak += 1
-                total_number_of_losses += 1
-                money_bet += bet_size
-                money_spent_over_current_losing_streak += bet_size
-                balance -= bet_size
-                if(balance < 0):
-                    break
-                current_result.extend([seed_result,"NO",f"{bet_size:,.2f}"])
-                if(current_losing_streak==minimum_losing_streak_to_start_bets):
-                    bet_size = initial_bet_size
-                elif(current_losing_streak in [minimum_losing_streak_to_start_bets+(interval_losing_streak*increment) for increment in range(100)]):
-                    bet_size *= 3
-                    if(bet_size > largest_bet_size):
-                        largest_bet_size = bet_size
-            else:
-                if(current_losing_streak > biggest_losing_streak[1]):
-                    biggest_losing_streak = (nonce-current_losing_streak,current_losing_streak)
-                if(current_losing_streak>0):
-                    losing_streak_sizes.append(current_losing_streak)
-                if(money_spent_over_current_losing_streak > most_money_spent_over_current_losing_streak):
-                    most_money_spent_over_current_losing_streak = money_spent_over_current_losing_streak
-                current_losing_streak = 0
-                current_winning_streak += 1
-                total_number_of_wins += 1
-                money_bet += bet_size
-                balance -= bet_size
-                if(balance < 0):
-                    break
-                balance += (bet_size*dice_multipliers[over_under][float(f"{threshold:.2f}")])
-                if(balance > biggest_balance):
-                    biggest_balance = balance
-                money_won += (bet_size*dice_multipliers[over_under][float(f"{threshold:.2f}")])
-                current_result.extend([seed_result,"YES",f"{bet_size:,.2f}"])
-                bet_size = 0
-                money_spent_over_current_losing_streak = 0
-            if(
-                (
-                    (seed_result > 99.99)and
-                    (over_under == "Over")
-                )
-                or
-                (
-                    (seed_result < 0.01)and
-                    (over_under == "Under")
-                )
-            ):
-                nonces_with_perfect_rolls.append(f"{nonce:,.0f}")
-            #results.append(current_result)
-        # DataFrame(results,columns=["Server Seed","Client Seed","Nonce","Result","Win","Bet Size"]).to_csv(f"DICE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv",index=False)
-        #f"DICE_RESULTS_ANALYSIS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.txt"
-        with open("DICE_RESULTS_ANALYSIS.txt","a") as file:
-            file.write(f"""DICE {over_under.upper()} {threshold} ANALYSIS
-Server Seed: {server}
-Server Seed (Hashed): {server_hashed}
-Client Seed: {client}
-Nonces: {nonces[0]:,.0f} - {nonces[-1]:,.0f}
-Initial Balance: ${starting_balance:,.2f}
-Ending Balance: ${balance if balance>0 else 0:,.2f}
-Largest Balance Ever: ${biggest_balance:,.2f}
-Bet Size: ${bet_size:,.2f}
-Largest Bet Made: ${largest_bet_size:,.2f}
-Most Money Spent Over Losing Streak: ${most_money_spent_over_current_losing_streak:,.2f}
-Winning Multiplier: {dice_multipliers[over_under][float(f"{threshold:.2f}")]:,.4f}
-Net Profit per Win: ${bet_size*dice_multipliers[over_under][float(f"{threshold:.2f}")] - bet_size:,.2f}
-Number of games simulated: {total_games_played:,.0f}
-Number of wins: {total_number_of_wins:,.0f}
-Number of Losses: {total_number_of_losses:,.0f}
-Mean Losing Streak: {mean(losing_streak_sizes):,.3f}
-Median Losing Streak: {median(losing_streak_sizes):,.1f}
-Statistical Summary of Losing Streaks:
-\tMin\t\t|\t\t25%\t\t|\t\t50%\t\t|\t\t75%\t\t|\t\t95%\t\t|\t\t99%\t\t|\t\tMax
-\t{min(losing_streak_sizes):,.0f}\t\t|\t\t{quantile(losing_streak_sizes,0.25):,.0f}\t\t|\t\t{median(losing_streak_sizes):,.0f}\t\t|\t\t{quantile(losing_streak_sizes,0.75):,.0f}\t\t|\t\t{quantile(losing_streak_sizes,0.95):,.0f}\t\t|\t\t{quantile(losing_streak_sizes,0.99):,.0f}\t\t|\t\t{max(losing_streak_sizes):,.0f}
-Biggest Winning Streak: {biggest_winning_streak[1]:,.0f}
-Starting Nonce of Biggest Winning Streak: {biggest_winning_streak[0]:,.0f}
-Biggest Losing Streak: {biggest_losing_streak[1]:,.0f}
-Starting Nonce of Biggest Losing Streak: {biggest_losing_streak[0]:,.0f}
-With various bet sizes, gross winnings: ${money_won:,.2f}
-With various bet sizes, net result: ${abs(money_won-money_bet):,.2f} {"won" if money_won-money_bet>0 else "lost"}.
-Number of perfect {100 if over_under=="Over" else 0} rolls: {len(nonces_with_perfect_rolls):,.0f}
-
-""")
\ No newline at end of file
+    winning_multiplier:float = dice_multiplier(over_under,threshold)
+
+    seed_pairs:list[tuple[str,str]] = [(generate_server_seed(),generate_client_seed()) for _ in range(seed_pair_count)]
+    results:DataFrame = run_monte_carlo(seed_pairs,over_under,threshold,winning_multiplier,workers)
+    results.to_csv(f"DICE_STRATEGY_RESULTS_{over_under.upper()}_{threshold}.csv",index=False)
+
+    with open(f"DICE_STRATEGY_ANALYSIS_{over_under.upper()}_{threshold}.txt","w") as file:
+        file.write(f"""DICE {over_under.upper()} {threshold} STRATEGY ANALYSIS
+Nonces per Seed Pair: 1 - {NONCES_PER_PAIR:,.0f}
+Initial Balance: ${STARTING_BALANCE:,.2f}
+Winning Multiplier: {winning_multiplier:,.4f}
+Bets Start After Losing Streak: {MINIMUM_LOSING_STREAK_TO_START_BETS:,.0f}
+Initial Bet Size: ${INITIAL_BET_SIZE:,.2f}
+Bet Multiplied by {INCREMENT_BET_INCREASE:,.0f} Every {INTERVAL_LOSING_STREAK:,.0f} Losses
+{'-'*130}
+{distribution_summary(results)}""")
@@ -1 +1,48 @@
-dice_multipliers:dict[str,dict[str,float]] = {"Over": {99.99: 9900.0, 99.98: 4950.0, 99.97: 3300.0, 99.96: 2475.0, 99.95: 1980.0, 99.94: 1650.0, 99.93: 1414.2857, 99.92: 1237.5, 99.91: 1100.0, 99.9: 990.0, 99.89: 900.0, 99.88: 825.0, 99.87: 761.5385, 99.86: 707.1429, 99.85: 660.0, 99.84: 618.75, 99.83: 582.3529, 99.82: 550.0, 99.81: 521.0526, 99.8: 495.0, 99.79: 471.4286, 99.78: 450.0, 99.77: 430.4348, 99.76: 412.5, 99.75: 396.0, 99.74: 380.7692, 99.73: 366.6667, 99.72: 353.5714, 99.71: 341.3793, 99.7: 330.0, 99.69: 319.3548, 99.68: 309.375, 99.67: 300.0, 99.66: 291.1765, 99.65: 282.8571, 99.64: 275.0, 99.63: 267.5676, 99.62: 260.5263, 99.61: 253.8462, 99.6: 247.5, 99.59: 241.4634, 99.58: 235.7143, 99.57: 230.2326, 99.56: 225.0, 99.55: 220.0, 99.54: 215.2174, 99.53: 210.6383, 99.52: 206.25, 99.51: 202.0408, 99.5: 198.0, 99.49: 194.1176, 99.48: 190.3846, 99.47: 186.7925, 99.46: 183.3333, 99.45: 180.0, 99.44: 176.7857, 99.43: 173.6842, 99.42: 170.6897, 99.41: 167.7966, 99.4: 165.0, 99.39: 162.2951, 99.38: 159.6774, 99.37: 157.1429, 99.36: 154.6875, 99.35: 152.3077, 99.34: 150.0, 99.33: 147.7612, 99.32: 145.5882, 99.31: 143.4783, 99.3: 141.4286, 99.29: 139.4366, 99.28: 137.5, 99.27: 135.6164, 99.26: 133.7838, 99.25: 132.0, 99.24: 130.2632, 99.23: 128.5714, 99.22: 126.9231, 99.21: 125.3165, 99.2: 123.75, 99.19: 122.2222, 99.18: 120.7317, 99.17: 119.2771, 99.16: 117.8571, 99.15: 116.4706, 99.14: 115.1163, 99.13: 113.7931, 99.12: 112.5, 99.11: 111.236, 99.1: 110.0, 99.09: 108.7912, 99.08: 107.6087, 99.07: 106.4516, 99.06: 105.3191, 99.05: 104.2105, 99.04: 103.125, 99.03: 102.0619, 99.02: 101.0204, 99.01: 100.0, 99.00: 99.0, 98.99: 98.0198, 98.98: 97.0588, 98.97: 96.1165, 98.96: 95.1923, 98.95: 94.2857, 98.94: 93.3962, 98.93: 92.5234, 98.92: 91.6667, 98.91: 90.8257, 98.9: 90.0, 98.89: 89.1892, 98.88: 88.3929, 98.87: 87.6106, 98.86: 86.8421, 98.85: 86.087, 98.84: 85.3448, 98.83: 84.6154, 98.82: 83.8983, 98.81: 83.1933, 98.8: 82.5, 98.79: 81.8182, 98.78: 81.1475, 98.77: 80.4878, 98.76: 79.8387, 98.75: 79.2, 98.74: 78.5714, 98.73: 77.9528, 98.72: 77.3438, 98.71: 76.7442, 98.7: 76.1538, 98.69: 75.5725, 98.68: 75.0, 98.67: 74.4361, 98.66: 73.8806, 98.65: 73.3333, 98.64: 72.7941, 98.63: 72.2628, 98.62: 71.7391, 98.61: 71.223, 98.6: 70.7143, 98.59: 70.2128, 98.58: 69.7183, 98.57: 69.2308, 98.56: 68.75, 98.55: 68.2759, 98.54: 67.8082, 98.53: 67.3469, 98.52: 66.8919, 98.51: 66.443, 98.5: 66.0, 98.49: 65.5629, 98.48: 65.1316, 98.47: 64.7059, 98.46: 64.2857, 98.45: 63.871, 98.44: 63.4615, 98.43: 63.0573, 98.42: 62.6582, 98.41: 62.2642, 98.4: 61.875, 98.39: 61.4907, 98.38: 61.1111, 98.37: 60.7362, 98.36: 60.3659, 98.35: 60.0, 98.34: 59.6386, 98.33: 59.2814, 98.32: 58.9286, 98.31: 58.5799, 98.3: 58.2353, 98.29: 57.8947, 98.28: 57.5581, 98.27: 57.2254, 98.26: 56.8966, 98.25: 56.5714, 98.24: 56.25, 98.23: 55.9322, 98.22: 55.618, 98.21: 55.3073, 98.2: 55.0, 98.19: 54.6961, 98.18: 54.3956, 98.17: 54.0984, 98.16: 53.8043, 98.15: 53.5135, 98.14: 53.2258, 98.13: 52.9412, 98.12: 52.6596, 98.11: 52.381, 98.1: 52.1053, 98.09: 51.8325, 98.08: 51.5625, 98.07: 51.2953, 98.06: 51.0309, 98.05: 50.7692, 98.04: 50.5102, 98.03: 50.2538, 98.02: 50.0, 98.01: 49.7487, 98.00: 49.5, 97.99: 49.2537, 97.98: 49.0099, 97.97: 48.7685, 97.96: 48.5294, 97.95: 48.2927, 97.94: 48.0583, 97.93: 47.8261, 97.92: 47.5962, 97.91: 47.3684, 97.9: 47.1429, 97.89: 46.9194, 97.88: 46.6981, 97.87: 46.4789, 97.86: 46.2617, 97.85: 46.0465, 97.84: 45.8333, 97.83: 45.6221, 97.82: 45.4128, 97.81: 45.2055, 97.8: 45.0, 97.79: 44.7964, 97.78: 44.5946, 97.77: 44.3946, 97.76: 44.1964, 97.75: 44.0, 97.74: 43.8053, 97.73: 43.6123, 97.72: 43.4211, 97.71: 43.2314, 97.7: 43.0435, 97.69: 42.8571, 97.68: 42.6724, 97.67: 42.4893, 97.66: 42.3077, 97.65: 42.1277, 97.64: 41.9492, 97.63: 41.7722, 97.62: 41.5966, 97.61: 41.4226, 97.6: 41.25, 97.59: 41.0788, 97.58: 40.9091, 97.57: 40.7407, 97.56: 40.5738, 97.55: 40.4082, 97.54: 40.2439, 97.53: 40.081, 97.52: 39.9194, 97.51: 39.759, 97.5: 39.6, 97.49: 39.4422, 97.48: 39.2857, 97.47: 39.1304, 97.46: 38.9764, 97.45: 38.8235, 97.44: 38.6719, 97.43: 38.5214, 97.42: 38.3721, 97.41: 38.2239, 97.4: 38.0769, 97.39: 37.931, 97.38: 37.7863, 97.37: 37.6426, 97.36: 37.5, 97.35: 37.3585, 97.34: 37.218, 97.33: 37.0787, 97.32: 36.9403, 97.31: 36.803, 97.3: 36.6667, 97.29: 36.5314, 97.28: 36.3971, 97.27: 36.2637, 97.26: 36.1314, 97.25: 36.0, 97.24: 35.8696, 97.23: 35.7401, 97.22: 35.6115, 97.21: 35.4839, 97.2: 35.3571, 97.19: 35.2313, 97.18: 35.1064, 97.17: 34.9823, 97.16: 34.8592, 97.15: 34.7368, 97.14: 34.6154, 97.13: 34.4948, 97.12: 34.375, 97.11: 34.2561, 97.1: 34.1379, 97.09: 34.0206, 97.08: 33.9041, 97.07: 33.7884, 97.06: 33.6735, 97.05: 33.5593, 97.04: 33.4459, 97.03: 33.3333, 97.02: 33.2215, 97.01: 33.1104, 97.00: 33.0, 96.99: 32.8904, 96.98: 32.7815, 96.97: 32.6733, 96.96: 32.5658, 96.95: 32.459, 96.94: 32.3529, 96.93: 32.2476, 96.92: 32.1429, 96.91: 32.0388, 96.9: 31.9355, 96.89: 31.8328, 96.88: 31.7308, 96.87: 31.6294, 96.86: 31.5287, 96.85: 31.4286, 96.84: 31.3291, 96.83: 31.2303, 96.82: 31.1321, 96.81: 31.0345, 96.8: 30.9375, 96.79: 30.8411, 96.78: 30.7453, 96.77: 30.6502, 96.76: 30.5556, 96.75: 30.4615, 96.74: 30.3681, 96.73: 30.2752, 96.72: 30.1829, 96.71: 30.0912, 96.7: 30.0, 96.69: 29.9094, 96.68: 29.8193, 96.67: 29.7297, 96.66: 29.6407, 96.65: 29.5522, 96.64: 29.4643, 96.63: 29.3769, 96.62: 29.2899, 96.61: 29.2035, 96.6: 29.1176, 96.59: 29.0323, 96.58: 28.9474, 96.57: 28.863, 96.56: 28.7791, 96.55: 28.6957, 96.54: 28.6127, 96.53: 28.5303, 96.52: 28.4483, 96.51: 28.3668, 96.5: 28.2857, 96.49: 28.2051, 96.48: 28.125, 96.47: 28.0453, 96.46: 27.9661, 96.45: 27.8873, 96.44: 27.809, 96.43: 27.7311, 96.42: 27.6536, 96.41: 27.5766, 96.4: 27.5, 96.39: 27.4238, 96.38: 27.3481, 96.37: 27.2727, 96.36: 27.1978, 96.35: 27.1233, 96.34: 27.0492, 96.33: 26.9755, 96.32: 26.9022, 96.31: 26.8293, 96.3: 26.7568, 96.29: 26.6846, 96.28: 26.6129, 96.27: 26.5416, 96.26: 26.4706, 96.25: 26.4, 96.24: 26.3298, 96.23: 26.2599, 96.22: 26.1905, 96.21: 26.1214, 96.2: 26.0526, 96.19: 25.9843, 96.18: 25.9162, 96.17: 25.8486, 96.16: 25.7812, 96.15: 25.7143, 96.14: 25.6477, 96.13: 25.5814, 96.12: 25.5155, 96.11: 25.4499, 96.1: 25.3846, 96.09: 25.3197, 96.08: 25.2551, 96.07: 25.1908, 96.06: 25.1269, 96.05: 25.0633, 96.04: 25.0, 96.03: 24.937, 96.02: 24.8744, 96.01: 24.812, 96.00: 24.75, 95.99: 24.6883, 95.98: 24.6269, 95.97: 24.5658, 95.96: 24.505, 95.95: 24.4444, 95.94: 24.3842, 95.93: 24.3243, 95.92: 24.2647, 95.91: 24.2054, 95.9: 24.1463, 95.89: 24.0876, 95.88: 24.0291, 95.87: 23.9709, 95.86: 23.913, 95.85: 23.8554, 95.84: 23.7981, 95.83: 23.741, 95.82: 23.6842, 95.81: 23.6277, 95.8: 23.5714, 95.79: 23.5154, 95.78: 23.4597, 95.77: 23.4043, 95.76: 23.3491, 95.75: 23.2941, 95.74: 23.2394, 95.73: 23.185, 95.72: 23.1308, 95.71: 23.0769, 95.7: 23.0233, 95.69: 22.9698, 95.68: 22.9167, 95.67: 22.8637, 95.66: 22.8111, 95.65: 22.7586, 95.64: 22.7064, 95.63: 22.6545, 95.62: 22.6027, 95.61: 22.5513, 95.6: 22.5, 95.59: 22.449, 95.58: 22.3982, 95.57: 22.3476, 95.56: 22.2973, 95.55: 22.2472, 95.54: 22.1973, 95.53: 22.1477, 95.52: 22.0982, 95.51: 22.049, 95.5: 22.0, 95.49: 21.9512, 95.48: 21.9027, 95.47: 21.8543, 95.46: 21.8062, 95.45: 21.7582, 95.44: 21.7105, 95.43: 21.663, 95.42: 21.6157, 95.41: 21.5686, 95.4: 21.5217, 95.39: 21.4751, 95.38: 21.4286, 95.37: 21.3823, 95.36: 21.3362, 95.35: 21.2903, 95.34: 21.2446, 95.33: 21.1991, 95.32: 21.1538, 95.31: 21.1087, 95.3: 21.0638, 95.29: 21.0191, 95.28: 20.9746, 95.27: 20.9302, 95.26: 20.8861, 95.25: 20.8421, 95.24: 20.7983, 95.23: 20.7547, 95.22: 20.7113, 95.21: 20.6681, 95.2: 20.625, 95.19: 20.5821, 95.18: 20.5394, 95.17: 20.4969, 95.16: 20.4545, 95.15: 20.4124, 95.14: 20.3704, 95.13: 20.3285, 95.12: 20.2869, 95.11: 20.2454, 95.1: 20.2041, 95.09: 20.1629, 95.08: 20.122, 95.07: 20.0811, 95.06: 20.0405, 95.05: 20.0, 95.04: 19.9597, 95.03: 19.9195, 95.02: 19.8795, 95.01: 19.8397, 95.00: 19.8, 94.99: 19.7605, 94.98: 19.7211, 94.97: 19.6819, 94.96: 19.6429, 94.95: 19.604, 94.94: 19.5652, 94.93: 19.5266, 94.92: 19.4882, 94.91: 19.4499, 94.9: 19.4118, 94.89: 19.3738, 94.88: 19.3359, 94.87: 19.2982, 94.86: 19.2607, 94.85: 19.2233, 94.84: 19.186, 94.83: 19.1489, 94.82: 19.112, 94.81: 19.0751, 94.8: 19.0385, 94.79: 19.0019, 94.78: 18.9655, 94.77: 18.9293, 94.76: 18.8931, 94.75: 18.8571, 94.74: 18.8213, 94.73: 18.7856, 94.72: 18.75, 94.71: 18.7146, 94.7: 18.6792, 94.69: 18.6441, 94.68: 18.609, 94.67: 18.5741, 94.66: 18.5393, 94.65: 18.5047, 94.64: 18.4701, 94.63: 18.4358, 94.62: 18.4015, 94.61: 18.3673, 94.6: 18.3333, 94.59: 18.2994, 94.58: 18.2657, 94.57: 18.232, 94.56: 18.1985, 94.55: 18.1651, 94.54: 18.1319, 94.53: 18.0987, 94.52: 18.0657, 94.51: 18.0328, 94.5: 18.0, 94.49: 17.9673, 94.48: 17.9348, 94.47: 17.9024, 94.46: 17.87, 94.45: 17.8378, 94.44: 17.8058, 94.43: 17.7738, 94.42: 17.7419, 94.41: 17.7102, 94.4: 17.6786, 94.39: 17.6471, 94.38: 17.6157, 94.37: 17.5844, 94.36: 17.5532, 94.35: 17.5221, 94.34: 17.4912, 94.33: 17.4603, 94.32: 17.4296, 94.31: 17.3989, 94.3: 17.3684, 94.29: 17.338, 94.28: 17.3077, 94.27: 17.2775, 94.26: 17.2474, 94.25: 17.2174, 94.24: 17.1875, 94.23: 17.1577, 94.22: 17.128, 94.21: 17.0984, 94.2: 17.069, 94.19: 17.0396, 94.18: 17.0103, 94.17: 16.9811, 94.16: 16.9521, 94.15: 16.9231, 94.14: 16.8942, 94.13: 16.8654, 94.12: 16.8367, 94.11: 16.8081, 94.1: 16.7797, 94.09: 16.7513, 94.08: 16.723, 94.07: 16.6948, 94.06: 16.6667, 94.05: 16.6387, 94.04: 16.6107, 94.03: 16.5829, 94.02: 16.5552, 94.01: 16.5275, 94.00: 16.5, 93.99: 16.4725, 93.98: 16.4452, 93.97: 16.4179, 93.96: 16.3907, 93.95: 16.3636, 93.94: 16.3366, 93.93: 16.3097, 93.92: 16.2829, 93.91: 16.2562, 93.9: 16.2295, 93.89: 16.2029, 93.88: 16.1765, 93.87: 16.1501, 93.86: 16.1238, 93.85: 16.0976, 93.84: 16.0714, 93.83: 16.0454, 93.82: 16.0194, 93.81: 15.9935, 93.8: 15.9677, 93.79: 15.942, 93.78: 15.9164, 93.77: 15.8909, 93.76: 15.8654, 93.75: 15.84, 93.74: 15.8147, 93.73: 15.7895, 93.72: 15.7643, 93.71: 15.7393, 93.7: 15.7143, 93.69: 15.6894, 93.68: 15.6646, 93.67: 15.6398, 93.66: 15.6151, 93.65: 15.5906, 93.64: 15.566, 93.63: 15.5416, 93.62: 15.5172, 93.61: 15.493, 93.6: 15.4688, 93.59: 15.4446, 93.58: 15.4206, 93.57: 15.3966, 93.56: 15.3727, 93.55: 15.3488, 93.54: 15.3251, 93.53: 15.3014, 93.52: 15.2778, 93.51: 15.2542, 93.5: 15.2308, 93.49: 15.2074, 93.48: 15.184, 93.47: 15.1608, 93.46: 15.1376, 93.45: 15.1145, 93.44: 15.0915, 93.43: 15.0685, 93.42: 15.0456, 93.41: 15.0228, 93.4: 15.0, 93.39: 14.9773, 93.38: 14.9547, 93.37: 14.9321, 93.36: 14.9096, 93.35: 14.8872, 93.34: 14.8649, 93.33: 14.8426, 93.32: 14.8204, 93.31: 14.7982, 93.3: 14.7761, 93.29: 14.7541, 93.28: 14.7321, 93.27: 14.7103, 93.26: 14.6884, 93.25: 14.6667, 93.24: 14.645, 93.23: 14.6233, 93.22: 14.6018, 93.21: 14.5803, 93.2: 14.5588, 93.19: 14.5374, 93.18: 14.5161, 93.17: 14.4949, 93.16: 14.4737, 93.15: 14.4526, 93.14: 14.4315, 93.13: 14.4105, 93.12: 14.3895, 93.11: 14.3687, 93.1: 14.3478, 93.09: 14.3271, 93.08: 14.3064, 93.07: 14.2857, 93.06: 14.2651, 93.05: 14.2446, 93.04: 14.2241, 93.03: 14.2037, 93.02: 14.1834, 93.01: 14.1631, 93.00: 14.1429, 92.99: 14.1227, 92.98: 14.1026, 92.97: 14.0825, 92.96: 14.0625, 92.95: 14.0426, 92.94: 14.0227, 92.93: 14.0028, 92.92: 13.9831, 92.91: 13.9633, 92.9: 13.9437, 92.89: 13.9241, 92.88: 13.9045, 92.87: 13.885, 92.86: 13.8655, 92.85: 13.8462, 92.84: 13.8268, 92.83: 13.8075, 92.82: 13.7883, 92.81: 13.7691, 92.8: 13.75, 92.79: 13.7309, 92.78: 13.7119, 92.77: 13.6929, 92.76: 13.674, 92.75: 13.6552, 92.74: 13.6364, 92.73: 13.6176, 92.72: 13.5989, 92.71: 13.5802, 92.7: 13.5616, 92.69: 13.5431, 92.68: 13.5246, 92.67: 13.5061, 92.66: 13.4877, 92.65: 13.4694, 92.64: 13.4511, 92.63: 13.4328, 92.62: 13.4146, 92.61: 13.3965, 92.6: 13.3784, 92.59: 13.3603, 92.58: 13.3423, 92.57: 13.3244, 92.56: 13.3065, 92.55: 13.2886, 92.54: 13.2708, 92.53: 13.253, 92.52: 13.2353, 92.51: 13.2176, 92.5: 13.2, 92.49: 13.1824, 92.48: 13.1649, 92.47: 13.1474, 92.46: 13.13, 92.45: 13.1126, 92.44: 13.0952, 92.43: 13.0779, 92.42: 13.0607, 92.41: 13.0435, 92.4: 13.0263, 92.39: 13.0092, 92.38: 12.9921, 92.37: 12.9751, 92.36: 12.9581, 92.35: 12.9412, 92.34: 12.9243, 92.33: 12.9074, 92.32: 12.8906, 92.31: 12.8739, 92.3: 12.8571, 92.29: 12.8405, 92.28: 12.8238, 92.27: 12.8072, 92.26: 12.7907, 92.25: 12.7742, 92.24: 12.7577, 92.23: 12.7413, 92.22: 12.7249, 92.21: 12.7086, 92.2: 12.6923, 92.19: 12.6761, 92.18: 12.6598, 92.17: 12.6437, 92.16: 12.6276, 92.15: 12.6115, 92.14: 12.5954, 92.13: 12.5794, 92.12: 12.5635, 92.11: 12.5475, 92.1: 12.5316, 92.09: 12.5158, 92.08: 12.5, 92.07: 12.4842, 92.06: 12.4685, 92.05: 12.4528, 92.04: 12.4372, 92.03: 12.4216, 92.02: 12.406, 92.01: 12.3905, 92.00: 12.375, 91.99: 12.3596, 91.98: 12.3441, 91.97: 12.3288, 91.96: 12.3134, 91.95: 12.2981, 91.94: 12.2829, 91.93: 12.2677, 91.92: 12.2525, 91.91: 12.2373, 91.9: 12.2222, 91.89: 12.2072, 91.88: 12.1921, 91.87: 12.1771, 91.86: 12.1622, 91.85: 12.1472, 91.84: 12.1324, 91.83: 12.1175, 91.82: 12.1027, 91.81: 12.0879, 91.8: 12.0732, 91.79: 12.0585, 91.78: 12.0438, 91.77: 12.0292, 91.76: 12.0146, 91.75: 12.0, 91.74: 11.9855, 91.73: 11.971, 91.72: 11.9565, 91.71: 11.9421, 91.7: 11.9277, 91.69: 11.9134, 91.68: 11.899, 91.67: 11.8848, 91.66: 11.8705, 91.65: 11.8563, 91.64: 11.8421, 91.63: 11.828, 91.62: 11.8138, 91.61: 11.7998, 91.6: 11.7857, 91.59: 11.7717, 91.58: 11.7577, 91.57: 11.7438, 91.56: 11.7299, 91.55: 11.716, 91.54: 11.7021, 91.53: 11.6883, 91.52: 11.6745, 91.51: 11.6608, 91.5: 11.6471, 91.49: 11.6334, 91.48: 11.6197, 91.47: 11.6061, 91.46: 11.5925, 91.45: 11.5789, 91.44: 11.5654, 91.43: 11.5519, 91.42: 11.5385, 91.41: 11.525, 91.4: 11.5116, 91.39: 11.4983, 91.38: 11.4849, 91.37: 11.4716, 91.36: 11.4583, 91.35: 11.4451, 91.34: 11.4319, 91.33: 11.4187, 91.32: 11.4055, 91.31: 11.3924, 91.3: 11.3793, 91.29: 11.3662, 91.28: 11.3532, 91.27: 11.3402, 91.26: 11.3272, 91.25: 11.3143, 91.24: 11.3014, 91.23: 11.2885, 91.22: 11.2756, 91.21: 11.2628, 91.2: 11.25, 91.19: 11.2372, 91.18: 11.2245, 91.17: 11.2118, 91.16: 11.1991, 91.15: 11.1864, 91.14: 11.1738, 91.13: 11.1612, 91.12: 11.1486, 91.11: 11.1361, 91.1: 11.1236, 91.09: 11.1111, 91.08: 11.0987, 91.07: 11.0862, 91.06: 11.0738, 91.05: 11.0615, 91.04: 11.0491, 91.03: 11.0368, 91.02: 11.0245, 91.01: 11.0122, 91.00: 11.0, 90.99: 10.9878, 90.98: 10.9756, 90.97: 10.9635, 90.96: 10.9513, 90.95: 10.9392, 90.94: 10.9272, 90.93: 10.9151, 90.92: 10.9031, 90.91: 10.8911, 90.9: 10.8791, 90.89: 10.8672, 90.88: 10.8553, 90.87: 10.8434, 90.86: 10.8315, 90.85: 10.8197, 90.84: 10.8079, 90.83: 10.7961, 90.82: 10.7843, 90.81: 10.7726, 90.8: 10.7609, 90.79: 10.7492, 90.78: 10.7375, 90.77: 10.7259, 90.76: 10.7143, 90.75: 10.7027, 90.74: 10.6911, 90.73: 10.6796, 90.72: 10.6681, 90.71: 10.6566, 90.7: 10.6452, 90.69: 10.6337, 90.68: 10.6223, 90.67: 10.6109, 90.66: 10.5996, 90.65: 10.5882, 90.64: 10.5769, 90.63: 10.5656, 90.62: 10.5544, 90.61: 10.5431, 90.6: 10.5319, 90.59: 10.5207, 90.58: 10.5096, 90.57: 10.4984, 90.56: 10.4873, 90.55: 10.4762, 90.54: 10.4651, 90.53: 10.4541, 90.52: 10.443, 90.51: 10.432, 90.5: 10.4211, 90.49: 10.4101, 90.48: 10.3992, 90.47: 10.3882, 90.46: 10.3774, 90.45: 10.3665, 90.44: 10.3556, 90.43: 10.3448, 90.42: 10.334, 90.41: 10.3233, 90.4: 10.3125, 90.39: 10.3018, 90.38: 10.2911, 90.37: 10.2804, 90.36: 10.2697, 90.35: 10.2591, 90.34: 10.2484, 90.33: 10.2378, 90.32: 10.2273, 90.31: 10.2167, 90.3: 10.2062, 90.29: 10.1957, 90.28: 10.1852, 90.27: 10.1747, 90.26: 10.1643, 90.25: 10.1538, 90.24: 10.1434, 90.23: 10.1331, 90.22: 10.1227, 90.21: 10.1124, 90.2: 10.102, 90.19: 10.0917, 90.18: 10.0815, 90.17: 10.0712, 90.16: 10.061, 90.15: 10.0508, 90.14: 10.0406, 90.13: 10.0304, 90.12: 10.0202, 90.11: 10.0101, 90.1: 10.0, 90.09: 9.9899, 90.08: 9.9798, 90.07: 9.9698, 90.06: 9.9598, 90.05: 9.9497, 90.04: 9.9398, 90.03: 9.9298, 90.02: 9.9198, 90.01: 9.9099, 90.00: 9.9, 89.99: 9.8901, 89.98: 9.8802, 89.97: 9.8704, 89.96: 9.8606, 89.95: 9.8507, 89.94: 9.841, 89.93: 9.8312, 89.92: 9.8214, 89.91: 9.8117, 89.9: 9.802, 89.89: 9.7923, 89.88: 9.7826, 89.87: 9.773, 89.86: 9.7633, 89.85: 9.7537, 89.84: 9.7441, 89.83: 9.7345, 89.82: 9.725, 89.81: 9.7154, 89.8: 9.7059, 89.79: 9.6964, 89.78: 9.6869, 89.77: 9.6774, 89.76: 9.668, 89.75: 9.6585, 89.74: 9.6491, 89.73: 9.6397, 89.72: 9.6304, 89.71: 9.621, 89.7: 9.6117, 89.69: 9.6023, 89.68: 9.593, 89.67: 9.5837, 89.66: 9.5745, 89.65: 9.5652, 89.64: 9.556, 89.63: 9.5468, 89.62: 9.5376, 89.61: 9.5284, 89.6: 9.5192, 89.59: 9.5101, 89.58: 9.501, 89.57: 9.4919, 89.56: 9.4828, 89.55: 9.4737, 89.54: 9.4646, 89.53: 9.4556, 89.52: 9.4466, 89.51: 9.4376, 89.5: 9.4286, 89.49: 9.4196, 89.48: 9.4106, 89.47: 9.4017, 89.46: 9.3928, 89.45: 9.3839, 89.44: 9.375, 89.43: 9.3661, 89.42: 9.3573, 89.41: 9.3484, 89.4: 9.3396, 89.39: 9.3308, 89.38: 9.322, 89.37: 9.3133, 89.36: 9.3045, 89.35: 9.2958, 89.34: 9.2871, 89.33: 9.2784, 89.32: 9.2697, 89.31: 9.261, 89.3: 9.2523, 89.29: 9.2437, 89.28: 9.2351, 89.27: 9.2265, 89.26: 9.2179, 89.25: 9.2093, 89.24: 9.2007, 89.23: 9.1922, 89.22: 9.1837, 89.21: 9.1752, 89.2: 9.1667, 89.19: 9.1582, 89.18: 9.1497, 89.17: 9.1413, 89.16: 9.1328, 89.15: 9.1244, 89.14: 9.116, 89.13: 9.1076, 89.12: 9.0993, 89.11: 9.0909, 89.1: 9.0826, 89.09: 9.0742, 89.08: 9.0659, 89.07: 9.0576, 89.06: 9.0494, 89.05: 9.0411, 89.04: 9.0328, 89.03: 9.0246, 89.02: 9.0164, 89.01: 9.0082, 89.00: 9.0, 88.99: 8.9918, 88.98: 8.9837, 88.97: 8.9755, 88.96: 8.9674, 88.95: 8.9593, 88.94: 8.9512, 88.93: 8.9431, 88.92: 8.935, 88.91: 8.927, 88.9: 8.9189, 88.89: 8.9109, 88.88: 8.9029, 88.87: 8.8949, 88.86: 8.8869, 88.85: 8.8789, 88.84: 8.871, 88.83: 8.863, 88.82: 8.8551, 88.81: 8.8472, 88.8: 8.8393, 88.79: 8.8314, 88.78: 8.8235, 88.77: 8.8157, 88.76: 8.8078, 88.75: 8.8, 88.74: 8.7922, 88.73: 8.7844, 88.72: 8.7766, 88.71: 8.7688, 88.7: 8.7611, 88.69: 8.7533, 88.68: 8.7456, 88.67: 8.7379, 88.66: 8.7302, 88.65: 8.7225, 88.64: 8.7148, 88.63: 8.7071, 88.62: 8.6995, 88.61: 8.6918, 88.6: 8.6842, 88.59: 8.6766, 88.58: 8.669, 88.57: 8.6614, 88.56: 8.6538, 88.55: 8.6463, 88.54: 8.6387, 88.53: 8.6312, 88.52: 8.6237, 88.51: 8.6162, 88.5: 8.6087, 88.49: 8.6012, 88.48: 8.5938, 88.47: 8.5863, 88.46: 8.5789, 88.45: 8.5714, 88.44: 8.564, 88.43: 8.5566, 88.42: 8.5492, 88.41: 8.5418, 88.4: 8.5345, 88.39: 8.5271, 88.38: 8.5198, 88.37: 8.5125, 88.36: 8.5052, 88.35: 8.4979, 88.34: 8.4906, 88.33: 8.4833, 88.32: 8.476, 88.31: 8.4688, 88.3: 8.4615, 88.29: 8.4543, 88.28: 8.4471, 88.27: 8.4399, 88.26: 8.4327, 88.25: 8.4255, 88.24: 8.4184, 88.23: 8.4112, 88.22: 8.4041, 88.21: 8.3969, 88.2: 8.3898, 88.19: 8.3827, 88.18: 8.3756, 88.17: 8.3686, 88.16: 8.3615, 88.15: 8.3544, 88.14: 8.3474, 88.13: 8.3404, 88.12: 8.3333, 88.11: 8.3263, 88.1: 8.3193, 88.09: 8.3123, 88.08: 8.3054, 88.07: 8.2984, 88.06: 8.2915, 88.05: 8.2845, 88.04: 8.2776, 88.03: 8.2707, 88.02: 8.2638, 88.01: 8.2569, 88.00: 8.25, 87.99: 8.2431, 87.98: 8.2363, 87.97: 8.2294, 87.96: 8.2226, 87.95: 8.2158, 87.94: 8.209, 87.93: 8.2022, 87.92: 8.1954, 87.91: 8.1886, 87.9: 8.1818, 87.89: 8.1751, 87.88: 8.1683, 87.87: 8.1616, 87.86: 8.1549, 87.85: 8.1481, 87.84: 8.1414, 87.83: 8.1348, 87.82: 8.1281, 87.81: 8.1214, 87.8: 8.1148, 87.79: 8.1081, 87.78: 8.1015, 87.77: 8.0948, 87.76: 8.0882, 87.75: 8.0816, 87.74: 8.075, 87.73: 8.0685, 87.72: 8.0619, 87.71: 8.0553, 87.7: 8.0488, 87.69: 8.0422, 87.68: 8.0357, 87.67: 8.0292, 87.66: 8.0227, 87.65: 8.0162, 87.64: 8.0097, 87.63: 8.0032, 87.62: 7.9968, 87.61: 7.9903, 87.6: 7.9839, 87.59: 7.9774, 87.58: 7.971, 87.57: 7.9646, 87.56: 7.9582, 87.55: 7.9518, 87.54: 7.9454, 87.53: 7.9391, 87.52: 7.9327, 87.51: 7.9263, 87.5: 7.92, 87.49: 7.9137, 87.48: 7.9073, 87.47: 7.901, 87.46: 7.8947, 87.45: 7.8884, 87.44: 7.8822, 87.43: 7.8759, 87.42: 7.8696, 87.41: 7.8634, 87.4: 7.8571, 87.39: 7.8509, 87.38: 7.8447, 87.37: 7.8385, 87.36: 7.8323, 87.35: 7.8261, 87.34: 7.8199, 87.33: 7.8137, 87.32: 7.8076, 87.31: 7.8014, 87.3: 7.7953, 87.29: 7.7891, 87.28: 7.783, 87.27: 7.7769, 87.26: 7.7708, 87.25: 7.7647, 87.24: 7.7586, 87.23: 7.7525, 87.22: 7.7465, 87.21: 7.7404, 87.2: 7.7344, 87.19: 7.7283, 87.18: 7.7223, 87.17: 7.7163, 87.16: 7.7103, 87.15: 7.7043, 87.14: 7.6983, 87.13: 7.6923, 87.12: 7.6863, 87.11: 7.6804, 87.1: 7.6744, 87.09: 7.6685, 87.08: 7.6625, 87.07: 7.6566, 87.06: 7.6507, 87.05: 7.6448, 87.04: 7.6389, 87.03: 7.633, 87.02: 7.6271, 87.01: 7.6212, 87.00: 7.6154, 86.99: 7.6095, 86.98: 7.6037, 86.97: 7.5979, 86.96: 7.592, 86.95: 7.5862, 86.94: 7.5804, 86.93: 7.5746, 86.92: 7.5688, 86.91: 7.563, 86.9: 7.5573, 86.89: 7.5515, 86.88: 7.5457, 86.87: 7.54, 86.86: 7.5342, 86.85: 7.5285, 86.84: 7.5228, 86.83: 7.5171, 86.82: 7.5114, 86.81: 7.5057, 86.8: 7.5, 86.79: 7.4943, 86.78: 7.4887, 86.77: 7.483, 86.76: 7.4773, 86.75: 7.4717, 86.74: 7.4661, 86.73: 7.4604, 86.72: 7.4548, 86.71: 7.4492, 86.7: 7.4436, 86.69: 7.438, 86.68: 7.4324, 86.67: 7.4269, 86.66: 7.4213, 86.65: 7.4157, 86.64: 7.4102, 86.63: 7.4046, 86.62: 7.3991, 86.61: 7.3936, 86.6: 7.3881, 86.59: 7.3826, 86.58: 7.377, 86.57: 7.3716, 86.56: 7.3661, 86.55: 7.3606, 86.54: 7.3551, 86.53: 7.3497, 86.52: 7.3442, 86.51: 7.3388, 86.5: 7.3333, 86.49: 7.3279, 86.48: 7.3225, 86.47: 7.3171, 86.46: 7.3117, 86.45: 7.3063, 86.44: 7.3009, 86.43: 7.2955, 86.42: 7.2901, 86.41: 7.2848, 86.4: 7.2794, 86.39: 7.2741, 86.38: 7.2687, 86.37: 7.2634, 86.36: 7.2581, 86.35: 7.2527, 86.34: 7.2474, 86.33: 7.2421, 86.32: 7.2368, 86.31: 7.2316, 86.3: 7.2263, 86.29: 7.221, 86.28: 7.2157, 86.27: 7.2105, 86.26: 7.2052, 86.25: 7.2, 86.24: 7.1948, 86.23: 7.1895, 86.22: 7.1843, 86.21: 7.1791, 86.2: 7.1739, 86.19: 7.1687, 86.18: 7.1635, 86.17: 7.1584, 86.16: 7.1532, 86.15: 7.148, 86.14: 7.1429, 86.13: 7.1377, 86.12: 7.1326, 86.11: 7.1274, 86.1: 7.1223, 86.09: 7.1172, 86.08: 7.1121, 86.07: 7.107, 86.06: 7.1019, 86.05: 7.0968, 86.04: 7.0917, 86.03: 7.0866, 86.02: 7.0815, 86.01: 7.0765, 86.00: 7.0714, 85.99: 7.0664, 85.98: 7.0613, 85.97: 7.0563, 85.96: 7.0513, 85.95: 7.0463, 85.94: 7.0413, 85.93: 7.0362, 85.92: 7.0312, 85.91: 7.0263, 85.9: 7.0213, 85.89: 7.0163, 85.88: 7.0113, 85.87: 7.0064, 85.86: 7.0014, 85.85: 6.9965, 85.84: 6.9915, 85.83: 6.9866, 85.82: 6.9817, 85.81: 6.9767, 85.8: 6.9718, 85.79: 6.9669, 85.78: 6.962, 85.77: 6.9571, 85.76: 6.9522, 85.75: 6.9474, 85.74: 6.9425, 85.73: 6.9376, 85.72: 6.9328, 85.71: 6.9279, 85.7: 6.9231, 85.69: 6.9182, 85.68: 6.9134, 85.67: 6.9086, 85.66: 6.9038, 85.65: 6.899, 85.64: 6.8942, 85.63: 6.8894, 85.62: 6.8846, 85.61: 6.8798, 85.6: 6.875, 85.59: 6.8702, 85.58: 6.8655, 85.57: 6.8607, 85.56: 6.856, 85.55: 6.8512, 85.54: 6.8465, 85.53: 6.8417, 85.52: 6.837, 85.51: 6.8323, 85.5: 6.8276, 85.49: 6.8229, 85.48: 6.8182, 85.47: 6.8135, 85.46: 6.8088, 85.45: 6.8041, 85.44: 6.7995, 85.43: 6.7948, 85.42: 6.7901, 85.41: 6.7855, 85.4: 6.7808, 85.39: 6.7762, 85.38: 6.7715, 85.37: 6.7669, 85.36: 6.7623, 85.35: 6.7577, 85.34: 6.7531, 85.33: 6.7485, 85.32: 6.7439, 85.31: 6.7393, 85.3: 6.7347, 85.29: 6.7301, 85.28: 6.7255, 85.27: 6.721, 85.26: 6.7164, 85.25: 6.7119, 85.24: 6.7073, 85.23: 6.7028, 85.22: 6.6982, 85.21: 6.6937, 85.2: 6.6892, 85.19: 6.6847, 85.18: 6.6802, 85.17: 6.6757, 85.16: 6.6712, 85.15: 6.6667, 85.14: 6.6622, 85.13: 6.6577, 85.12: 6.6532, 85.11: 6.6488, 85.1: 6.6443, 85.09: 6.6398, 85.08: 6.6354, 85.07: 6.6309, 85.06: 6.6265, 85.05: 6.6221, 85.04: 6.6176, 85.03: 6.6132, 85.02: 6.6088, 85.01: 6.6044, 85.00: 6.6, 84.99: 6.5956, 84.98: 6.5912, 84.97: 6.5868, 84.96: 6.5824, 84.95: 6.5781, 84.94: 6.5737, 84.93: 6.5693, 84.92: 6.565, 84.91: 6.5606, 84.9: 6.5563, 84.89: 6.552, 84.88: 6.5476, 84.87: 6.5433, 84.86: 6.539, 84.85: 6.5347, 84.84: 6.5303, 84.83: 6.526, 84.82: 6.5217, 84.81: 6.5174, 84.8: 6.5132, 84.79: 6.5089, 84.78: 6.5046, 84.77: 6.5003, 84.76: 6.4961, 84.75: 6.4918, 84.74: 6.4875, 84.73: 6.4833, 84.72: 6.4791, 84.71: 6.4748, 84.7: 6.4706, 84.69: 6.4664, 84.68: 6.4621, 84.67: 6.4579, 84.66: 6.4537, 84.65: 6.4495, 84.64: 6.4453, 84.63: 6.4411, 84.62: 6.4369, 84.61: 6.4327, 84.6: 6.4286, 84.59: 6.4244, 84.58: 6.4202, 84.57: 6.4161, 84.56: 6.4119, 84.55: 6.4078, 84.54: 6.4036, 84.53: 6.3995, 84.52: 6.3953, 84.51: 6.3912, 84.5: 6.3871, 84.49: 6.383, 84.48: 6.3789, 84.47: 6.3748, 84.46: 6.3707, 84.45: 6.3666, 84.44: 6.3625, 84.43: 6.3584, 84.42: 6.3543, 84.41: 6.3502, 84.4: 6.3462, 84.39: 6.3421, 84.38: 6.338, 84.37: 6.334, 84.36: 6.3299, 84.35: 6.3259, 84.34: 6.3218, 84.33: 6.3178, 84.32: 6.3138, 84.31: 6.3098, 84.3: 6.3057, 84.29: 6.3017, 84.28: 6.2977, 84.27: 6.2937, 84.26: 6.2897, 84.25: 6.2857, 84.24: 6.2817, 84.23: 6.2777, 84.22: 6.2738, 84.21: 6.2698, 84.2: 6.2658, 84.19: 6.2619, 84.18: 6.2579, 84.17: 6.2539, 84.16: 6.25, 84.15: 6.2461, 84.14: 6.2421, 84.13: 6.2382, 84.12: 6.2343, 84.11: 6.2303, 84.1: 6.2264, 84.09: 6.2225, 84.08: 6.2186, 84.07: 6.2147, 84.06: 6.2108, 84.05: 6.2069, 84.04: 6.203, 84.03: 6.1991, 84.02: 6.1952, 84.01: 6.1914, 84.00: 6.1875, 83.99: 6.1836, 83.98: 6.1798, 83.97: 6.1759, 83.96: 6.1721, 83.95: 6.1682, 83.94: 6.1644, 83.93: 6.1605, 83.92: 6.1567, 83.91: 6.1529, 83.9: 6.1491, 83.89: 6.1453, 83.88: 6.1414, 83.87: 6.1376, 83.86: 6.1338, 83.85: 6.13, 83.84: 6.1262, 83.83: 6.1224, 83.82: 6.1187, 83.81: 6.1149, 83.8: 6.1111, 83.79: 6.1073, 83.78: 6.1036, 83.77: 6.0998, 83.76: 6.0961, 83.75: 6.0923, 83.74: 6.0886, 83.73: 6.0848, 83.72: 6.0811, 83.71: 6.0773, 83.7: 6.0736, 83.69: 6.0699, 83.68: 6.0662, 83.67: 6.0625, 83.66: 6.0588, 83.65: 6.055, 83.64: 6.0513, 83.63: 6.0476, 83.62: 6.044, 83.61: 6.0403, 83.6: 6.0366, 83.59: 6.0329, 83.58: 6.0292, 83.57: 6.0256, 83.56: 6.0219, 83.55: 6.0182, 83.54: 6.0146, 83.53: 6.0109, 83.52: 6.0073, 83.51: 6.0036, 83.5: 6.0, 83.49: 5.9964, 83.48: 5.9927, 83.47: 5.9891, 83.46: 5.9855, 83.45: 5.9819, 83.44: 5.9783, 83.43: 5.9747, 83.42: 5.971, 83.41: 5.9675, 83.4: 5.9639, 83.39: 5.9603, 83.38: 5.9567, 83.37: 5.9531, 83.36: 5.9495, 83.35: 5.9459, 83.34: 5.9424, 83.33: 5.9388, 83.32: 5.9353, 83.31: 5.9317, 83.3: 5.9281, 83.29: 5.9246, 83.28: 5.9211, 83.27: 5.9175, 83.26: 5.914, 83.25: 5.9104, 83.24: 5.9069, 83.23: 5.9034, 83.22: 5.8999, 83.21: 5.8964, 83.2: 5.8929, 83.19: 5.8894, 83.18: 5.8859, 83.17: 5.8824, 83.16: 5.8789, 83.15: 5.8754, 83.14: 5.8719, 83.13: 5.8684, 83.12: 5.8649, 83.11: 5.8615, 83.1: 5.858, 83.09: 5.8545, 83.08: 5.8511, 83.07: 5.8476, 83.06: 5.8442, 83.05: 5.8407, 83.04: 5.8373, 83.03: 5.8338, 83.02: 5.8304, 83.01: 5.827, 83.00: 5.8235, 82.99: 5.8201, 82.98: 5.8167, 82.97: 5.8133, 82.96: 5.8099, 82.95: 5.8065, 82.94: 5.803, 82.93: 5.7996, 82.92: 5.7963, 82.91: 5.7929, 82.9: 5.7895, 82.89: 5.7861, 82.88: 5.7827, 82.87: 5.7793, 82.86: 5.776, 82.85: 5.7726, 82.84: 5.7692, 82.83: 5.7659, 82.82: 5.7625, 82.81: 5.7592, 82.8: 5.7558, 82.79: 5.7525, 82.78: 5.7491, 82.77: 5.7458, 82.76: 5.7425, 82.75: 5.7391, 82.74: 5.7358, 82.73: 5.7325, 82.72: 5.7292, 82.71: 5.7259, 82.7: 5.7225, 82.69: 5.7192, 82.68: 5.7159, 82.67: 5.7126, 82.66: 5.7093, 82.65: 5.7061, 82.64: 5.7028, 82.63: 5.6995, 82.62: 5.6962, 82.61: 5.6929, 82.6: 5.6897, 82.59: 5.6864, 82.58: 5.6831, 82.57: 5.6799, 82.56: 5.6766, 82.55: 5.6734, 82.54: 5.6701, 82.53: 5.6669, 82.52: 5.6636, 82.51: 5.6604, 82.5: 5.6571, 82.49: 5.6539, 82.48: 5.6507, 82.47: 5.6475, 82.46: 5.6442, 82.45: 5.641, 82.44: 5.6378, 82.43: 5.6346, 82.42: 5.6314, 82.41: 5.6282, 82.4: 5.625, 82.39: 5.6218, 82.38: 5.6186, 82.37: 5.6154, 82.36: 5.6122, 82.35: 5.6091, 82.34: 5.6059, 82.33: 5.6027, 82.32: 5.5995, 82.31: 5.5964, 82.3: 5.5932, 82.29: 5.5901, 82.28: 5.5869, 82.27: 5.5838, 82.26: 5.5806, 82.25: 5.5775, 82.24: 5.5743, 82.23: 5.5712, 82.22: 5.5681, 82.21: 5.5649, 82.2: 5.5618, 82.19: 5.5587, 82.18: 5.5556, 82.17: 5.5524, 82.16: 5.5493, 82.15: 5.5462, 82.14: 5.5431, 82.13: 5.54, 82.12: 5.5369, 82.11: 5.5338, 82.1: 5.5307, 82.09: 5.5276, 82.08: 5.5246, 82.07: 5.5215, 82.06: 5.5184, 82.05: 5.5153, 82.04: 5.5122, 82.03: 5.5092, 82.02: 5.5061, 82.01: 5.5031, 82.00: 5.5, 81.99: 5.4969, 81.98: 5.4939, 81.97: 5.4908, 81.96: 5.4878, 81.95: 5.4848, 81.94: 5.4817, 81.93: 5.4787, 81.92: 5.4757, 81.91: 5.4726, 81.9: 5.4696, 81.89: 5.4666, 81.88: 5.4636, 81.87: 5.4606, 81.86: 5.4576, 81.85: 5.4545, 81.84: 5.4515, 81.83: 5.4485, 81.82: 5.4455, 81.81: 5.4426, 81.8: 5.4396, 81.79: 5.4366, 81.78: 5.4336, 81.77: 5.4306, 81.76: 5.4276, 81.75: 5.4247, 81.74: 5.4217, 81.73: 5.4187, 81.72: 5.4158, 81.71: 5.4128, 81.7: 5.4098, 81.69: 5.4069, 81.68: 5.4039, 81.67: 5.401, 81.66: 5.398, 81.65: 5.3951, 81.64: 5.3922, 81.63: 5.3892, 81.62: 5.3863, 81.61: 5.3834, 81.6: 5.3804, 81.59: 5.3775, 81.58: 5.3746, 81.57: 5.3717, 81.56: 5.3688, 81.55: 5.3659, 81.54: 5.3629, 81.53: 5.36, 81.52: 5.3571, 81.51: 5.3542, 81.5: 5.3514, 81.49: 5.3485, 81.48: 5.3456, 81.47: 5.3427, 81.46: 5.3398, 81.45: 5.3369, 81.44: 5.3341, 81.43: 5.3312, 81.42: 5.3283, 81.41: 5.3254, 81.4: 5.3226, 81.39: 5.3197, 81.38: 5.3169, 81.37: 5.314, 81.36: 5.3112, 81.35: 5.3083, 81.34: 5.3055, 81.33: 5.3026, 81.32: 5.2998, 81.31: 5.297, 81.3: 5.2941, 81.29: 5.2913, 81.28: 5.2885, 81.27: 5.2856, 81.26: 5.2828, 81.25: 5.28, 81.24: 5.2772, 81.23: 5.2744, 81.22: 5.2716, 81.21: 5.2688, 81.2: 5.266, 81.19: 5.2632, 81.18: 5.2604, 81.17: 5.2576, 81.16: 5.2548, 81.15: 5.252, 81.14: 5.2492, 81.13: 5.2464, 81.12: 5.2436, 81.11: 5.2409, 81.1: 5.2381, 81.09: 5.2353, 81.08: 5.2326, 81.07: 5.2298, 81.06: 5.227, 81.05: 5.2243, 81.04: 5.2215, 81.03: 5.2188, 81.02: 5.216, 81.01: 5.2133, 81.00: 5.2105, 80.99: 5.2078, 80.98: 5.205, 80.97: 5.2023, 80.96: 5.1996, 80.95: 5.1969, 80.94: 5.1941, 80.93: 5.1914, 80.92: 5.1887, 80.91: 5.186, 80.9: 5.1832, 80.89: 5.1805, 80.88: 5.1778, 80.87: 5.1751, 80.86: 5.1724, 80.85: 5.1697, 80.84: 5.167, 80.83: 5.1643, 80.82: 5.1616, 80.81: 5.1589, 80.8: 5.1562, 80.79: 5.1536, 80.78: 5.1509, 80.77: 5.1482, 80.76: 5.1455, 80.75: 5.1429, 80.74: 5.1402, 80.73: 5.1375, 80.72: 5.1349, 80.71: 5.1322, 80.7: 5.1295, 80.69: 5.1269, 80.68: 5.1242, 80.67: 5.1216, 80.66: 5.1189, 80.65: 5.1163, 80.64: 5.1136, 80.63: 5.111, 80.62: 5.1084, 80.61: 5.1057, 80.6: 5.1031, 80.59: 5.1005, 80.58: 5.0978, 80.57: 5.0952, 80.56: 5.0926, 80.55: 5.09, 80.54: 5.0874, 80.53: 5.0847, 80.52: 5.0821, 80.51: 5.0795, 80.5: 5.0769, 80.49: 5.0743, 80.48: 5.0717, 80.47: 5.0691, 80.46: 5.0665, 80.45: 5.0639, 80.44: 5.0613, 80.43: 5.0588, 80.42: 5.0562, 80.41: 5.0536, 80.4: 5.051, 80.39: 5.0484, 80.38: 5.0459, 80.37: 5.0433, 80.36: 5.0407, 80.35: 5.0382, 80.34: 5.0356, 80.33: 5.033, 80.32: 5.0305, 80.31: 5.0279, 80.3: 5.0254, 80.29: 5.0228, 80.28: 5.0203, 80.27: 5.0177, 80.26: 5.0152, 80.25: 5.0127, 80.24: 5.0101, 80.23: 5.0076, 80.22: 5.0051, 80.21: 5.0025, 80.2: 5.0, 80.19: 4.9975, 80.18: 4.995, 80.17: 4.9924, 80.16: 4.9899, 80.15: 4.9874, 80.14: 4.9849, 80.13: 4.9824, 80.12: 4.9799, 80.11: 4.9774, 80.1: 4.9749, 80.09: 4.9724, 80.08: 4.9699, 80.07: 4.9674, 80.06: 4.9649, 80.05: 4.9624, 80.04: 4.9599, 80.03: 4.9574, 80.02: 4.955, 80.01: 4.9525, 80.00: 4.95, 79.99: 4.9475, 79.98: 4.9451, 79.97: 4.9426, 79.96: 4.9401, 79.95: 4.9377, 79.94: 4.9352, 79.93: 4.9327, 79.92: 4.9303, 79.91: 4.9278, 79.9: 4.9254, 79.89: 4.9229, 79.88: 4.9205, 79.87: 4.918, 79.86: 4.9156, 79.85: 4.9132, 79.84: 4.9107, 79.83: 4.9083, 79.82: 4.9058, 79.81: 4.9034, 79.8: 4.901, 79.79: 4.8986, 79.78: 4.8961, 79.77: 4.8937, 79.76: 4.8913, 79.75: 4.8889, 79.74: 4.8865, 79.73: 4.8841, 79.72: 4.8817, 79.71: 4.8793, 79.7: 4.8768, 79.69: 4.8744, 79.68: 4.872, 79.67: 4.8697, 79.66: 4.8673, 79.65: 4.8649, 79.64: 4.8625, 79.63: 4.8601, 79.62: 4.8577, 79.61: 4.8553, 79.6: 4.8529, 79.59: 4.8506, 79.58: 4.8482, 79.57: 4.8458, 79.56: 4.8434, 79.55: 4.8411, 79.54: 4.8387, 79.53: 4.8363, 79.52: 4.834, 79.51: 4.8316, 79.5: 4.8293, 79.49: 4.8269, 79.48: 4.8246, 79.47: 4.8222, 79.46: 4.8199, 79.45: 4.8175, 79.44: 4.8152, 79.43: 4.8128, 79.42: 4.8105, 79.41: 4.8082, 79.4: 4.8058, 79.39: 4.8035, 79.38: 4.8012, 79.37: 4.7988, 79.36: 4.7965, 79.35: 4.7942, 79.34: 4.7919, 79.33: 4.7896, 79.32: 4.7872, 79.31: 4.7849, 79.3: 4.7826, 79.29: 4.7803, 79.28: 4.778, 79.27: 4.7757, 79.26: 4.7734, 79.25: 4.7711, 79.24: 4.7688, 79.23: 4.7665, 79.22: 4.7642, 79.21: 4.7619, 79.2: 4.7596, 79.19: 4.7573, 79.18: 4.755, 79.17: 4.7528, 79.16: 4.7505, 79.15: 4.7482, 79.14: 4.7459, 79.13: 4.7437, 79.12: 4.7414, 79.11: 4.7391, 79.1: 4.7368, 79.09: 4.7346, 79.08: 4.7323, 79.07: 4.7301, 79.06: 4.7278, 79.05: 4.7255, 79.04: 4.7233, 79.03: 4.721, 79.02: 4.7188, 79.01: 4.7165, 79.00: 4.7143, 78.99: 4.712, 78.98: 4.7098, 78.97: 4.7076, 78.96: 4.7053, 78.95: 4.7031, 78.94: 4.7009, 78.93: 4.6986, 78.92: 4.6964, 78.91: 4.6942, 78.9: 4.6919, 78.89: 4.6897, 78.88: 4.6875, 78.87: 4.6853, 78.86: 4.6831, 78.85: 4.6809, 78.84: 4.6786, 78.83: 4.6764, 78.82: 4.6742, 78.81: 4.672, 78.8: 4.6698, 78.79: 4.6676, 78.78: 4.6654, 78.77: 4.6632, 78.76: 4.661, 78.75: 4.6588, 78.74: 4.6566, 78.73: 4.6544, 78.72: 4.6523, 78.71: 4.6501, 78.7: 4.6479, 78.69: 4.6457, 78.68: 4.6435, 78.67: 4.6414, 78.66: 4.6392, 78.65: 4.637, 78.64: 4.6348, 78.63: 4.6327, 78.62: 4.6305, 78.61: 4.6283, 78.6: 4.6262, 78.59: 4.624, 78.58: 4.6218, 78.57: 4.6197, 78.56: 4.6175, 78.55: 4.6154, 78.54: 4.6132, 78.53: 4.6111, 78.52: 4.6089, 78.51: 4.6068, 78.5: 4.6047, 78.49: 4.6025, 78.48: 4.6004, 78.47: 4.5982, 78.46: 4.5961, 78.45: 4.594, 78.44: 4.5918, 78.43: 4.5897, 78.42: 4.5876, 78.41: 4.5855, 78.4: 4.5833, 78.39: 4.5812, 78.38: 4.5791, 78.37: 4.577, 78.36: 4.5749, 78.35: 4.5727, 78.34: 4.5706, 78.33: 4.5685, 78.32: 4.5664, 78.31: 4.5643, 78.3: 4.5622, 78.29: 4.5601, 78.28: 4.558, 78.27: 4.5559, 78.26: 4.5538, 78.25: 4.5517, 78.24: 4.5496, 78.23: 4.5475, 78.22: 4.5455, 78.21: 4.5434, 78.2: 4.5413, 78.19: 4.5392, 78.18: 4.5371, 78.17: 4.535, 78.16: 4.533, 78.15: 4.5309, 78.14: 4.5288, 78.13: 4.5267, 78.12: 4.5247, 78.11: 4.5226, 78.1: 4.5205, 78.09: 4.5185, 78.08: 4.5164, 78.07: 4.5144, 78.06: 4.5123, 78.05: 4.5103, 78.04: 4.5082, 78.03: 4.5061, 78.02: 4.5041, 78.01: 4.502, 78.00: 4.5, 77.99: 4.498, 77.98: 4.4959, 77.97: 4.4939, 77.96: 4.4918, 77.95: 4.4898, 77.94: 4.4878, 77.93: 4.4857, 77.92: 4.4837, 77.91: 4.4817, 77.9: 4.4796, 77.89: 4.4776, 77.88: 4.4756, 77.87: 4.4736, 77.86: 4.4715, 77.85: 4.4695, 77.84: 4.4675, 77.83: 4.4655, 77.82: 4.4635, 77.81: 4.4615, 77.8: 4.4595, 77.79: 4.4575, 77.78: 4.4554, 77.77: 4.4534, 77.76: 4.4514, 77.75: 4.4494, 77.74: 4.4474, 77.73: 4.4454, 77.72: 4.4434, 77.71: 4.4415, 77.7: 4.4395, 77.69: 4.4375, 77.68: 4.4355, 77.67: 4.4335, 77.66: 4.4315, 77.65: 4.4295, 77.64: 4.4275, 77.63: 4.4256, 77.62: 4.4236, 77.61: 4.4216, 77.6: 4.4196, 77.59: 4.4177, 77.58: 4.4157, 77.57: 4.4137, 77.56: 4.4118, 77.55: 4.4098, 77.54: 4.4078, 77.53: 4.4059, 77.52: 4.4039, 77.51: 4.402, 77.5: 4.4, 77.49: 4.398, 77.48: 4.3961, 77.47: 4.3941, 77.46: 4.3922, 77.45: 4.3902, 77.44: 4.3883, 77.43: 4.3864, 77.42: 4.3844, 77.41: 4.3825, 77.4: 4.3805, 77.39: 4.3786, 77.38: 4.3767, 77.37: 4.3747, 77.36: 4.3728, 77.35: 4.3709, 77.34: 4.3689, 77.33: 4.367, 77.32: 4.3651, 77.31: 4.3632, 77.3: 4.3612, 77.29: 4.3593, 77.28: 4.3574, 77.27: 4.3555, 77.26: 4.3536, 77.25: 4.3516, 77.24: 4.3497, 77.23: 4.3478, 77.22: 4.3459, 77.21: 4.344, 77.2: 4.3421, 77.19: 4.3402, 77.18: 4.3383, 77.17: 4.3364, 77.16: 4.3345, 77.15: 4.3326, 77.14: 4.3307, 77.13: 4.3288, 77.12: 4.3269, 77.11: 4.325, 77.1: 4.3231, 77.09: 4.3213, 77.08: 4.3194, 77.07: 4.3175, 77.06: 4.3156, 77.05: 4.3137, 77.04: 4.3118, 77.03: 4.31, 77.02: 4.3081, 77.01: 4.3062, 77.00: 4.3043, 76.99: 4.3025, 76.98: 4.3006, 76.97: 4.2987, 76.96: 4.2969, 76.95: 4.295, 76.94: 4.2931, 76.93: 4.2913, 76.92: 4.2894, 76.91: 4.2876, 76.9: 4.2857, 76.89: 4.2839, 76.88: 4.282, 76.87: 4.2802, 76.86: 4.2783, 76.85: 4.2765, 76.84: 4.2746, 76.83: 4.2728, 76.82: 4.2709, 76.81: 4.2691, 76.8: 4.2672, 76.79: 4.2654, 76.78: 4.2636, 76.77: 4.2617, 76.76: 4.2599, 76.75: 4.2581, 76.74: 4.2562, 76.73: 4.2544, 76.72: 4.2526, 76.71: 4.2508, 76.7: 4.2489, 76.69: 4.2471, 76.68: 4.2453, 76.67: 4.2435, 76.66: 4.2416, 76.65: 4.2398, 76.64: 4.238, 76.63: 4.2362, 76.62: 4.2344, 76.61: 4.2326, 76.6: 4.2308, 76.59: 4.229, 76.58: 4.2272, 76.57: 4.2254, 76.56: 4.2235, 76.55: 4.2217, 76.54: 4.2199, 76.53: 4.2182, 76.52: 4.2164, 76.51: 4.2146, 76.5: 4.2128, 76.49: 4.211, 76.48: 4.2092, 76.47: 4.2074, 76.46: 4.2056, 76.45: 4.2038, 76.44: 4.202, 76.43: 4.2003, 76.42: 4.1985, 76.41: 4.1967, 76.4: 4.1949, 76.39: 4.1931, 76.38: 4.1914, 76.37: 4.1896, 76.36: 4.1878, 76.35: 4.186, 76.34: 4.1843, 76.33: 4.1825, 76.32: 4.1807, 76.31: 4.179, 76.3: 4.1772, 76.29: 4.1755, 76.28: 4.1737, 76.27: 4.1719, 76.26: 4.1702, 76.25: 4.1684, 76.24: 4.1667, 76.23: 4.1649, 76.22: 4.1632, 76.21: 4.1614, 76.2: 4.1597, 76.19: 4.1579, 76.18: 4.1562, 76.17: 4.1544, 76.16: 4.1527, 76.15: 4.1509, 76.14: 4.1492, 76.13: 4.1475, 76.12: 4.1457, 76.11: 4.144, 76.1: 4.1423, 76.09: 4.1405, 76.08: 4.1388, 76.07: 4.1371, 76.06: 4.1353, 76.05: 4.1336, 76.04: 4.1319, 76.03: 4.1302, 76.02: 4.1284, 76.01: 4.1267, 76.00: 4.125, 75.99: 4.1233, 75.98: 4.1216, 75.97: 4.1199, 75.96: 4.1181, 75.95: 4.1164, 75.94: 4.1147, 75.93: 4.113, 75.92: 4.1113, 75.91: 4.1096, 75.9: 4.1079, 75.89: 4.1062, 75.88: 4.1045, 75.87: 4.1028, 75.86: 4.1011, 75.85: 4.0994, 75.84: 4.0977, 75.83: 4.096, 75.82: 4.0943, 75.81: 4.0926, 75.8: 4.0909, 75.79: 4.0892, 75.78: 4.0875, 75.77: 4.0858, 75.76: 4.0842, 75.75: 4.0825, 75.74: 4.0808, 75.73: 4.0791, 75.72: 4.0774, 75.71: 4.0758, 75.7: 4.0741, 75.69: 4.0724, 75.68: 4.0707, 75.67: 4.0691, 75.66: 4.0674, 75.65: 4.0657, 75.64: 4.064, 75.63: 4.0624, 75.62: 4.0607, 75.61: 4.059, 75.6: 4.0574, 75.59: 4.0557, 75.58: 4.0541, 75.57: 4.0524, 75.56: 4.0507, 75.55: 4.0491, 75.54: 4.0474, 75.53: 4.0458, 75.52: 4.0441, 75.51: 4.0425, 75.5: 4.0408, 75.49: 4.0392, 75.48: 4.0375, 75.47: 4.0359, 75.46: 4.0342, 75.45: 4.0326, 75.44: 4.0309, 75.43: 4.0293, 75.42: 4.0277, 75.41: 4.026, 75.4: 4.0244, 75.39: 4.0228, 75.38: 4.0211, 75.37: 4.0195, 75.36: 4.0179, 75.35: 4.0162, 75.34: 4.0146, 75.33: 4.013, 75.32: 4.0113, 75.31: 4.0097, 75.3: 4.0081, 75.29: 4.0065, 75.28: 4.0049, 75.27: 4.0032, 75.26: 4.0016, 75.25: 4.0, 75.24: 3.9984, 75.23: 3.9968, 75.22: 3.9952, 75.21: 3.9935, 75.2: 3.9919, 75.19: 3.9903, 75.18: 3.9887, 75.17: 3.9871, 75.16: 3.9855, 75.15: 3.9839, 75.14: 3.9823, 75.13: 3.9807, 75.12: 3.9791, 75.11: 3.9775, 75.1: 3.9759, 75.09: 3.9743, 75.08: 3.9727, 75.07: 3.9711, 75.06: 3.9695, 75.05: 3.9679, 75.04: 3.9663, 75.03: 3.9648, 75.02: 3.9632, 75.01: 3.9616, 75.00: 3.96, 74.99: 3.9584, 74.98: 3.9568, 74.97: 3.9553, 74.96: 3.9537, 74.95: 3.9521, 74.94: 3.9505, 74.93: 3.9489, 74.92: 3.9474, 74.91: 3.9458, 74.9: 3.9442, 74.89: 3.9427, 74.88: 3.9411, 74.87: 3.9395, 74.86: 3.9379, 74.85: 3.9364, 74.84: 3.9348, 74.83: 3.9333, 74.82: 3.9317, 74.81: 3.9301, 74.8: 3.9286, 74.79: 3.927, 74.78: 3.9255, 74.77: 3.9239, 74.76: 3.9223, 74.75: 3.9208, 74.74: 3.9192, 74.73: 3.9177, 74.72: 3.9161, 74.71: 3.9146, 74.7: 3.913, 74.69: 3.9115, 74.68: 3.91, 74.67: 3.9084, 74.66: 3.9069, 74.65: 3.9053, 74.64: 3.9038, 74.63: 3.9022, 74.62: 3.9007, 74.61: 3.8992, 74.6: 3.8976, 74.59: 3.8961, 74.58: 3.8946, 74.57: 3.893, 74.56: 3.8915, 74.55: 3.89, 74.54: 3.8885, 74.53: 3.8869, 74.52: 3.8854, 74.51: 3.8839, 74.5: 3.8824, 74.49: 3.8808, 74.48: 3.8793, 74.47: 3.8778, 74.46: 3.8763, 74.45: 3.8748, 74.44: 3.8732, 74.43: 3.8717, 74.42: 3.8702, 74.41: 3.8687, 74.4: 3.8672, 74.39: 3.8657, 74.38: 3.8642, 74.37: 3.8627, 74.36: 3.8612, 74.35: 3.8596, 74.34: 3.8581, 74.33: 3.8566, 74.32: 3.8551, 74.31: 3.8536, 74.3: 3.8521, 74.29: 3.8506, 74.28: 3.8491, 74.27: 3.8476, 74.26: 3.8462, 74.25: 3.8447, 74.24: 3.8432, 74.23: 3.8417, 74.22: 3.8402, 74.21: 3.8387, 74.2: 3.8372, 74.19: 3.8357, 74.18: 3.8342, 74.17: 3.8328, 74.16: 3.8313, 74.15: 3.8298, 74.14: 3.8283, 74.13: 3.8268, 74.12: 3.8253, 74.11: 3.8239, 74.1: 3.8224, 74.09: 3.8209, 74.08: 3.8194, 74.07: 3.818, 74.06: 3.8165, 74.05: 3.815, 74.04: 3.8136, 74.03: 3.8121, 74.02: 3.8106, 74.01: 3.8092, 74.00: 3.8077, 73.99: 3.8062, 73.98: 3.8048, 73.97: 3.8033, 73.96: 3.8018, 73.95: 3.8004, 73.94: 3.7989, 73.93: 3.7975, 73.92: 3.796, 73.91: 3.7946, 73.9: 3.7931, 73.89: 3.7917, 73.88: 3.7902, 73.87: 3.7887, 73.86: 3.7873, 73.85: 3.7859, 73.84: 3.7844, 73.83: 3.783, 73.82: 3.7815, 73.81: 3.7801, 73.8: 3.7786, 73.79: 3.7772, 73.78: 3.7757, 73.77: 3.7743, 73.76: 3.7729, 73.75: 3.7714, 73.74: 3.77, 73.73: 3.7686, 73.72: 3.7671, 73.71: 3.7657, 73.7: 3.7643, 73.69: 3.7628, 73.68: 3.7614, 73.67: 3.76, 73.66: 3.7585, 73.65: 3.7571, 73.64: 3.7557, 73.63: 3.7543, 73.62: 3.7528, 73.61: 3.7514, 73.6: 3.75, 73.59: 3.7486, 73.58: 3.7472, 73.57: 3.7457, 73.56: 3.7443, 73.55: 3.7429, 73.54: 3.7415, 73.53: 3.7401, 73.52: 3.7387, 73.51: 3.7373, 73.5: 3.7358, 73.49: 3.7344, 73.48: 3.733, 73.47: 3.7316, 73.46: 3.7302, 73.45: 3.7288, 73.44: 3.7274, 73.43: 3.726, 73.42: 3.7246, 73.41: 3.7232, 73.4: 3.7218, 73.39: 3.7204, 73.38: 3.719, 73.37: 3.7176, 73.36: 3.7162, 73.35: 3.7148, 73.34: 3.7134, 73.33: 3.712, 73.32: 3.7106, 73.31: 3.7093, 73.3: 3.7079, 73.29: 3.7065, 73.28: 3.7051, 73.27: 3.7037, 73.26: 3.7023, 73.25: 3.7009, 73.24: 3.6996, 73.23: 3.6982, 73.22: 3.6968, 73.21: 3.6954, 73.2: 3.694, 73.19: 3.6927, 73.18: 3.6913, 73.17: 3.6899, 73.16: 3.6885, 73.15: 3.6872, 73.14: 3.6858, 73.13: 3.6844, 73.12: 3.683, 73.11: 3.6817, 73.1: 3.6803, 73.09: 3.6789, 73.08: 3.6776, 73.07: 3.6762, 73.06: 3.6748, 73.05: 3.6735, 73.04: 3.6721, 73.03: 3.6707, 73.02: 3.6694, 73.01: 3.668, 73.00: 3.6667, 72.99: 3.6653, 72.98: 3.664, 72.97: 3.6626, 72.96: 3.6612, 72.95: 3.6599, 72.94: 3.6585, 72.93: 3.6572, 72.92: 3.6558, 72.91: 3.6545, 72.9: 3.6531, 72.89: 3.6518, 72.88: 3.6504, 72.87: 3.6491, 72.86: 3.6478, 72.85: 3.6464, 72.84: 3.6451, 72.83: 3.6437, 72.82: 3.6424, 72.81: 3.641, 72.8: 3.6397, 72.79: 3.6384, 72.78: 3.637, 72.77: 3.6357, 72.76: 3.6344, 72.75: 3.633, 72.74: 3.6317, 72.73: 3.6304, 72.72: 3.629, 72.71: 3.6277, 72.7: 3.6264, 72.69: 3.625, 72.68: 3.6237, 72.67: 3.6224, 72.66: 3.6211, 72.65: 3.6197, 72.64: 3.6184, 72.63: 3.6171, 72.62: 3.6158, 72.61: 3.6145, 72.6: 3.6131, 72.59: 3.6118, 72.58: 3.6105, 72.57: 3.6092, 72.56: 3.6079, 72.55: 3.6066, 72.54: 3.6052, 72.53: 3.6039, 72.52: 3.6026, 72.51: 3.6013, 72.5: 3.6, 72.49: 3.5987, 72.48: 3.5974, 72.47: 3.5961, 72.46: 3.5948, 72.45: 3.5935, 72.44: 3.5922, 72.43: 3.5909, 72.42: 3.5896, 72.41: 3.5883, 72.4: 3.587, 72.39: 3.5857, 72.38: 3.5844, 72.37: 3.5831, 72.36: 3.5818, 72.35: 3.5805, 72.34: 3.5792, 72.33: 3.5779, 72.32: 3.5766, 72.31: 3.5753, 72.3: 3.574, 72.29: 3.5727, 72.28: 3.5714, 72.27: 3.5701, 72.26: 3.5689, 72.25: 3.5676, 72.24: 3.5663, 72.23: 3.565, 72.22: 3.5637, 72.21: 3.5624, 72.2: 3.5612, 72.19: 3.5599, 72.18: 3.5586, 72.17: 3.5573, 72.16: 3.556, 72.15: 3.5548, 72.14: 3.5535, 72.13: 3.5522, 72.12: 3.5509, 72.11: 3.5497, 72.1: 3.5484, 72.09: 3.5471, 72.08: 3.5458, 72.07: 3.5446, 72.06: 3.5433, 72.05: 3.542, 72.04: 3.5408, 72.03: 3.5395, 72.02: 3.5382, 72.01: 3.537, 72.00: 3.5357, 71.99: 3.5345, 71.98: 3.5332, 71.97: 3.5319, 71.96: 3.5307, 71.95: 3.5294, 71.94: 3.5282, 71.93: 3.5269, 71.92: 3.5256, 71.91: 3.5244, 71.9: 3.5231, 71.89: 3.5219, 71.88: 3.5206, 71.87: 3.5194, 71.86: 3.5181, 71.85: 3.5169, 71.84: 3.5156, 71.83: 3.5144, 71.82: 3.5131, 71.81: 3.5119, 71.8: 3.5106, 71.79: 3.5094, 71.78: 3.5082, 71.77: 3.5069, 71.76: 3.5057, 71.75: 3.5044, 71.74: 3.5032, 71.73: 3.5019, 71.72: 3.5007, 71.71: 3.4995, 71.7: 3.4982, 71.69: 3.497, 71.68: 3.4958, 71.67: 3.4945, 71.66: 3.4933, 71.65: 3.4921, 71.64: 3.4908, 71.63: 3.4896, 71.62: 3.4884, 71.61: 3.4871, 71.6: 3.4859, 71.59: 3.4847, 71.58: 3.4835, 71.57: 3.4822, 71.56: 3.481, 71.55: 3.4798, 71.54: 3.4786, 71.53: 3.4773, 71.52: 3.4761, 71.51: 3.4749, 71.5: 3.4737, 71.49: 3.4725, 71.48: 3.4712, 71.47: 3.47, 71.46: 3.4688, 71.45: 3.4676, 71.44: 3.4664, 71.43: 3.4652, 71.42: 3.464, 71.41: 3.4627, 71.4: 3.4615, 71.39: 3.4603, 71.38: 3.4591, 71.37: 3.4579, 71.36: 3.4567, 71.35: 3.4555, 71.34: 3.4543, 71.33: 3.4531, 71.32: 3.4519, 71.31: 3.4507, 71.3: 3.4495, 71.29: 3.4483, 71.28: 3.4471, 71.27: 3.4459, 71.26: 3.4447, 71.25: 3.4435, 71.24: 3.4423, 71.23: 3.4411, 71.22: 3.4399, 71.21: 3.4387, 71.2: 3.4375, 71.19: 3.4363, 71.18: 3.4351, 71.17: 3.4339, 71.16: 3.4327, 71.15: 3.4315, 71.14: 3.4304, 71.13: 3.4292, 71.12: 3.428, 71.11: 3.4268, 71.1: 3.4256, 71.09: 3.4244, 71.08: 3.4232, 71.07: 3.4221, 71.06: 3.4209, 71.05: 3.4197, 71.04: 3.4185, 71.03: 3.4173, 71.02: 3.4161, 71.01: 3.415, 71.00: 3.4138, 70.99: 3.4126, 70.98: 3.4114, 70.97: 3.4103, 70.96: 3.4091, 70.95: 3.4079, 70.94: 3.4067, 70.93: 3.4056, 70.92: 3.4044, 70.91: 3.4032, 70.9: 3.4021, 70.89: 3.4009, 70.88: 3.3997, 70.87: 3.3986, 70.86: 3.3974, 70.85: 3.3962, 70.84: 3.3951, 70.83: 3.3939, 70.82: 3.3927, 70.81: 3.3916, 70.8: 3.3904, 70.79: 3.3893, 70.78: 3.3881, 70.77: 3.3869, 70.76: 3.3858, 70.75: 3.3846, 70.74: 3.3835, 70.73: 3.3823, 70.72: 3.3811, 70.71: 3.38, 70.7: 3.3788, 70.69: 3.3777, 70.68: 3.3765, 70.67: 3.3754, 70.66: 3.3742, 70.65: 3.3731, 70.64: 3.3719, 70.63: 3.3708, 70.62: 3.3696, 70.61: 3.3685, 70.6: 3.3673, 70.59: 3.3662, 70.58: 3.3651, 70.57: 3.3639, 70.56: 3.3628, 70.55: 3.3616, 70.54: 3.3605, 70.53: 3.3593, 70.52: 3.3582, 70.51: 3.3571, 70.5: 3.3559, 70.49: 3.3548, 70.48: 3.3537, 70.47: 3.3525, 70.46: 3.3514, 70.45: 3.3503, 70.44: 3.3491, 70.43: 3.348, 70.42: 3.3469, 70.41: 3.3457, 70.4: 3.3446, 70.39: 3.3435, 70.38: 3.3423, 70.37: 3.3412, 70.36: 3.3401, 70.35: 3.339, 70.34: 3.3378, 70.33: 3.3367, 70.32: 3.3356, 70.31: 3.3345, 70.3: 3.3333, 70.29: 3.3322, 70.28: 3.3311, 70.27: 3.33, 70.26: 3.3289, 70.25: 3.3277, 70.24: 3.3266, 70.23: 3.3255, 70.22: 3.3244, 70.21: 3.3233, 70.2: 3.3221, 70.19: 3.321, 70.18: 3.3199, 70.17: 3.3188, 70.16: 3.3177, 70.15: 3.3166, 70.14: 3.3155, 70.13: 3.3144, 70.12: 3.3133, 70.11: 3.3121, 70.1: 3.311, 70.09: 3.3099, 70.08: 3.3088, 70.07: 3.3077, 70.06: 3.3066, 70.05: 3.3055, 70.04: 3.3044, 70.03: 3.3033, 70.02: 3.3022, 70.01: 3.3011, 70.00: 3.3, 69.99: 3.2989, 69.98: 3.2978, 69.97: 3.2967, 69.96: 3.2956, 69.95: 3.2945, 69.94: 3.2934, 69.93: 3.2923, 69.92: 3.2912, 69.91: 3.2901, 69.9: 3.289, 69.89: 3.2879, 69.88: 3.2869, 69.87: 3.2858, 69.86: 3.2847, 69.85: 3.2836, 69.84: 3.2825, 69.83: 3.2814, 69.82: 3.2803, 69.81: 3.2792, 69.8: 3.2781, 69.79: 3.2771, 69.78: 3.276, 69.77: 3.2749, 69.76: 3.2738, 69.75: 3.2727, 69.74: 3.2716, 69.73: 3.2706, 69.72: 3.2695, 69.71: 3.2684, 69.7: 3.2673, 69.69: 3.2662, 69.68: 3.2652, 69.67: 3.2641, 69.66: 3.263, 69.65: 3.2619, 69.64: 3.2609, 69.63: 3.2598, 69.62: 3.2587, 69.61: 3.2577, 69.6: 3.2566, 69.59: 3.2555, 69.58: 3.2544, 69.57: 3.2534, 69.56: 3.2523, 69.55: 3.2512, 69.54: 3.2502, 69.53: 3.2491, 69.52: 3.248, 69.51: 3.247, 69.5: 3.2459, 69.49: 3.2448, 69.48: 3.2438, 69.47: 3.2427, 69.46: 3.2417, 69.45: 3.2406, 69.44: 3.2395, 69.43: 3.2385, 69.42: 3.2374, 69.41: 3.2364, 69.4: 3.2353, 69.39: 3.2342, 69.38: 3.2332, 69.37: 3.2321, 69.36: 3.2311, 69.35: 3.23, 69.34: 3.229, 69.33: 3.2279, 69.32: 3.2269, 69.31: 3.2258, 69.3: 3.2248, 69.29: 3.2237, 69.28: 3.2227, 69.27: 3.2216, 69.26: 3.2206, 69.25: 3.2195, 69.24: 3.2185, 69.23: 3.2174, 69.22: 3.2164, 69.21: 3.2153, 69.2: 3.2143, 69.19: 3.2132, 69.18: 3.2122, 69.17: 3.2112, 69.16: 3.2101, 69.15: 3.2091, 69.14: 3.208, 69.13: 3.207, 69.12: 3.206, 69.11: 3.2049, 69.1: 3.2039, 69.09: 3.2028, 69.08: 3.2018, 69.07: 3.2008, 69.06: 3.1997, 69.05: 3.1987, 69.04: 3.1977, 69.03: 3.1966, 69.02: 3.1956, 69.01: 3.1946, 69.00: 3.1935, 68.99: 3.1925, 68.98: 3.1915, 68.97: 3.1905, 68.96: 3.1894, 68.95: 3.1884, 68.94: 3.1874, 68.93: 3.1864, 68.92: 3.1853, 68.91: 3.1843, 68.9: 3.1833, 68.89: 3.1823, 68.88: 3.1812, 68.87: 3.1802, 68.86: 3.1792, 68.85: 3.1782, 68.84: 3.1772, 68.83: 3.1761, 68.82: 3.1751, 68.81: 3.1741, 68.8: 3.1731, 68.79: 3.1721, 68.78: 3.171, 68.77: 3.17, 68.76: 3.169, 68.75: 3.168, 68.74: 3.167, 68.73: 3.166, 68.72: 3.165, 68.71: 3.164, 68.7: 3.1629, 68.69: 3.1619, 68.68: 3.1609, 68.67: 3.1599, 68.66: 3.1589, 68.65: 3.1579, 68.64: 3.1569, 68.63: 3.1559, 68.62: 3.1549, 68.61: 3.1539, 68.6: 3.1529, 68.59: 3.1519, 68.58: 3.1509, 68.57: 3.1499, 68.56: 3.1489, 68.55: 3.1479, 68.54: 3.1469, 68.53: 3.1459, 68.52: 3.1449, 68.51: 3.1439, 68.5: 3.1429, 68.49: 3.1419, 68.48: 3.1409, 68.47: 3.1399, 68.46: 3.1389, 68.45: 3.1379, 68.44: 3.1369, 68.43: 3.1359, 68.42: 3.1349, 68.41: 3.1339, 68.4: 3.1329, 68.39: 3.1319, 68.38: 3.1309, 68.37: 3.1299, 68.36: 3.129, 68.35: 3.128, 68.34: 3.127, 68.33: 3.126, 68.32: 3.125, 68.31: 3.124, 68.3: 3.123, 68.29: 3.122, 68.28: 3.1211, 68.27: 3.1201, 68.26: 3.1191, 68.25: 3.1181, 68.24: 3.1171, 68.23: 3.1161, 68.22: 3.1152, 68.21: 3.1142, 68.2: 3.1132, 68.19: 3.1122, 68.18: 3.1113, 68.17: 3.1103, 68.16: 3.1093, 68.15: 3.1083, 68.14: 3.1073, 68.13: 3.1064, 68.12: 3.1054, 68.11: 3.1044, 68.1: 3.1034, 68.09: 3.1025, 68.08: 3.1015, 68.07: 3.1005, 68.06: 3.0996, 68.05: 3.0986, 68.04: 3.0976, 68.03: 3.0967, 68.02: 3.0957, 68.01: 3.0947, 68.00: 3.0938, 67.99: 3.0928, 67.98: 3.0918, 67.97: 3.0909, 67.96: 3.0899, 67.95: 3.0889, 67.94: 3.088, 67.93: 3.087, 67.92: 3.086, 67.91: 3.0851, 67.9: 3.0841, 67.89: 3.0832, 67.88: 3.0822, 67.87: 3.0812, 67.86: 3.0803, 67.85: 3.0793, 67.84: 3.0784, 67.83: 3.0774, 67.82: 3.0764, 67.81: 3.0755, 67.8: 3.0745, 67.79: 3.0736, 67.78: 3.0726, 67.77: 3.0717, 67.76: 3.0707, 67.75: 3.0698, 67.74: 3.0688, 67.73: 3.0679, 67.72: 3.0669, 67.71: 3.066, 67.7: 3.065, 67.69: 3.0641, 67.68: 3.0631, 67.67: 3.0622, 67.66: 3.0612, 67.65: 3.0603, 67.64: 3.0593, 67.63: 3.0584, 67.62: 3.0574, 67.61: 3.0565, 67.6: 3.0556, 67.59: 3.0546, 67.58: 3.0537, 67.57: 3.0527, 67.56: 3.0518, 67.55: 3.0508, 67.54: 3.0499, 67.53: 3.049, 67.52: 3.048, 67.51: 3.0471, 67.5: 3.0462, 67.49: 3.0452, 67.48: 3.0443, 67.47: 3.0433, 67.46: 3.0424, 67.45: 3.0415, 67.44: 3.0405, 67.43: 3.0396, 67.42: 3.0387, 67.41: 3.0377, 67.4: 3.0368, 67.39: 3.0359, 67.38: 3.0349, 67.37: 3.034, 67.36: 3.0331, 67.35: 3.0322, 67.34: 3.0312, 67.33: 3.0303, 67.32: 3.0294, 67.31: 3.0284, 67.3: 3.0275, 67.29: 3.0266, 67.28: 3.0257, 67.27: 3.0247, 67.26: 3.0238, 67.25: 3.0229, 67.24: 3.022, 67.23: 3.0211, 67.22: 3.0201, 67.21: 3.0192, 67.2: 3.0183, 67.19: 3.0174, 67.18: 3.0165, 67.17: 3.0155, 67.16: 3.0146, 67.15: 3.0137, 67.14: 3.0128, 67.13: 3.0119, 67.12: 3.0109, 67.11: 3.01, 67.1: 3.0091, 67.09: 3.0082, 67.08: 3.0073, 67.07: 3.0064, 67.06: 3.0055, 67.05: 3.0046, 67.04: 3.0036, 67.03: 3.0027, 67.02: 3.0018, 67.01: 3.0009, 67.00: 3.0, 66.99: 2.9991, 66.98: 2.9982, 66.97: 2.9973, 66.96: 2.9964, 66.95: 2.9955, 66.94: 2.9946, 66.93: 2.9936, 66.92: 2.9927, 66.91: 2.9918, 66.9: 2.9909, 66.89: 2.99, 66.88: 2.9891, 66.87: 2.9882, 66.86: 2.9873, 66.85: 2.9864, 66.84: 2.9855, 66.83: 2.9846, 66.82: 2.9837, 66.81: 2.9828, 66.8: 2.9819, 66.79: 2.981, 66.78: 2.9801, 66.77: 2.9792, 66.76: 2.9783, 66.75: 2.9774, 66.74: 2.9765, 66.73: 2.9757, 66.72: 2.9748, 66.71: 2.9739, 66.7: 2.973, 66.69: 2.9721, 66.68: 2.9712, 66.67: 2.9703, 66.66: 2.9694, 66.65: 2.9685, 66.64: 2.9676, 66.63: 2.9667, 66.62: 2.9658, 66.61: 2.965, 66.6: 2.9641, 66.59: 2.9632, 66.58: 2.9623, 66.57: 2.9614, 66.56: 2.9605, 66.55: 2.9596, 66.54: 2.9588, 66.53: 2.9579, 66.52: 2.957, 66.51: 2.9561, 66.5: 2.9552, 66.49: 2.9543, 66.48: 2.9535, 66.47: 2.9526, 66.46: 2.9517, 66.45: 2.9508, 66.44: 2.9499, 66.43: 2.9491, 66.42: 2.9482, 66.41: 2.9473, 66.4: 2.9464, 66.39: 2.9456, 66.38: 2.9447, 66.37: 2.9438, 66.36: 2.9429, 66.35: 2.9421, 66.34: 2.9412, 66.33: 2.9403, 66.32: 2.9394, 66.31: 2.9386, 66.3: 2.9377, 66.29: 2.9368, 66.28: 2.9359, 66.27: 2.9351, 66.26: 2.9342, 66.25: 2.9333, 66.24: 2.9325, 66.23: 2.9316, 66.22: 2.9307, 66.21: 2.9299, 66.2: 2.929, 66.19: 2.9281, 66.18: 2.9273, 66.17: 2.9264, 66.16: 2.9255, 66.15: 2.9247, 66.14: 2.9238, 66.13: 2.9229, 66.12: 2.9221, 66.11: 2.9212, 66.1: 2.9204, 66.09: 2.9195, 66.08: 2.9186, 66.07: 2.9178, 66.06: 2.9169, 66.05: 2.9161, 66.04: 2.9152, 66.03: 2.9143, 66.02: 2.9135, 66.01: 2.9126, 66.00: 2.9118, 65.99: 2.9109, 65.98: 2.9101, 65.97: 2.9092, 65.96: 2.9083, 65.95: 2.9075, 65.94: 2.9066, 65.93: 2.9058, 65.92: 2.9049, 65.91: 2.9041, 65.9: 2.9032, 65.89: 2.9024, 65.88: 2.9015, 65.87: 2.9007, 65.86: 2.8998, 65.85: 2.899, 65.84: 2.8981, 65.83: 2.8973, 65.82: 2.8964, 65.81: 2.8956, 65.8: 2.8947, 65.79: 2.8939, 65.78: 2.893, 65.77: 2.8922, 65.76: 2.8914, 65.75: 2.8905, 65.74: 2.8897, 65.73: 2.8888, 65.72: 2.888, 65.71: 2.8871, 65.7: 2.8863, 65.69: 2.8855, 65.68: 2.8846, 65.67: 2.8838, 65.66: 2.8829, 65.65: 2.8821, 65.64: 2.8813, 65.63: 2.8804, 65.62: 2.8796, 65.61: 2.8787, 65.6: 2.8779, 65.59: 2.8771, 65.58: 2.8762, 65.57: 2.8754, 65.56: 2.8746, 65.55: 2.8737, 65.54: 2.8729, 65.53: 2.8721, 65.52: 2.8712, 65.51: 2.8704, 65.5: 2.8696, 65.49: 2.8687, 65.48: 2.8679, 65.47: 2.8671, 65.46: 2.8662, 65.45: 2.8654, 65.44: 2.8646, 65.43: 2.8638, 65.42: 2.8629, 65.41: 2.8621, 65.4: 2.8613, 65.39: 2.8604, 65.38: 2.8596, 65.37: 2.8588, 65.36: 2.858, 65.35: 2.8571, 65.34: 2.8563, 65.33: 2.8555, 65.32: 2.8547, 65.31: 2.8538, 65.3: 2.853, 65.29: 2.8522, 65.28: 2.8514, 65.27: 2.8506, 65.26: 2.8497, 65.25: 2.8489, 65.24: 2.8481, 65.23: 2.8473, 65.22: 2.8465, 65.21: 2.8456, 65.2: 2.8448, 65.19: 2.844, 65.18: 2.8432, 65.17: 2.8424, 65.16: 2.8416, 65.15: 2.8407, 65.14: 2.8399, 65.13: 2.8391, 65.12: 2.8383, 65.11: 2.8375, 65.1: 2.8367, 65.09: 2.8359, 65.08: 2.8351, 65.07: 2.8342, 65.06: 2.8334, 65.05: 2.8326, 65.04: 2.8318, 65.03: 2.831, 65.02: 2.8302, 65.01: 2.8294, 65.00: 2.8286, 64.99: 2.8278, 64.98: 2.827, 64.97: 2.8261, 64.96: 2.8253, 64.95: 2.8245, 64.94: 2.8237, 64.93: 2.8229, 64.92: 2.8221, 64.91: 2.8213, 64.9: 2.8205, 64.89: 2.8197, 64.88: 2.8189, 64.87: 2.8181, 64.86: 2.8173, 64.85: 2.8165, 64.84: 2.8157, 64.83: 2.8149, 64.82: 2.8141, 64.81: 2.8133, 64.8: 2.8125, 64.79: 2.8117, 64.78: 2.8109, 64.77: 2.8101, 64.76: 2.8093, 64.75: 2.8085, 64.74: 2.8077, 64.73: 2.8069, 64.72: 2.8061, 64.71: 2.8053, 64.7: 2.8045, 64.69: 2.8037, 64.68: 2.8029, 64.67: 2.8022, 64.66: 2.8014, 64.65: 2.8006, 64.64: 2.7998, 64.63: 2.799, 64.62: 2.7982, 64.61: 2.7974, 64.6: 2.7966, 64.59: 2.7958, 64.58: 2.795, 64.57: 2.7942, 64.56: 2.7935, 64.55: 2.7927, 64.54: 2.7919, 64.53: 2.7911, 64.52: 2.7903, 64.51: 2.7895, 64.5: 2.7887, 64.49: 2.7879, 64.48: 2.7872, 64.47: 2.7864, 64.46: 2.7856, 64.45: 2.7848, 64.44: 2.784, 64.43: 2.7832, 64.42: 2.7825, 64.41: 2.7817, 64.4: 2.7809, 64.39: 2.7801, 64.38: 2.7793, 64.37: 2.7786, 64.36: 2.7778, 64.35: 2.777, 64.34: 2.7762, 64.33: 2.7754, 64.32: 2.7747, 64.31: 2.7739, 64.3: 2.7731, 64.29: 2.7723, 64.28: 2.7716, 64.27: 2.7708, 64.26: 2.77, 64.25: 2.7692, 64.24: 2.7685, 64.23: 2.7677, 64.22: 2.7669, 64.21: 2.7661, 64.2: 2.7654, 64.19: 2.7646, 64.18: 2.7638, 64.17: 2.763, 64.16: 2.7623, 64.15: 2.7615, 64.14: 2.7607, 64.13: 2.76, 64.12: 2.7592, 64.11: 2.7584, 64.1: 2.7577, 64.09: 2.7569, 64.08: 2.7561, 64.07: 2.7554, 64.06: 2.7546, 64.05: 2.7538, 64.04: 2.7531, 64.03: 2.7523, 64.02: 2.7515, 64.01: 2.7508, 64.00: 2.75, 63.99: 2.7492, 63.98: 2.7485, 63.97: 2.7477, 63.96: 2.7469, 63.95: 2.7462, 63.94: 2.7454, 63.93: 2.7447, 63.92: 2.7439, 63.91: 2.7431, 63.9: 2.7424, 63.89: 2.7416, 63.88: 2.7409, 63.87: 2.7401, 63.86: 2.7393, 63.85: 2.7386, 63.84: 2.7378, 63.83: 2.7371, 63.82: 2.7363, 63.81: 2.7356, 63.8: 2.7348, 63.79: 2.7341, 63.78: 2.7333, 63.77: 2.7325, 63.76: 2.7318, 63.75: 2.731, 63.74: 2.7303, 63.73: 2.7295, 63.72: 2.7288, 63.71: 2.728, 63.7: 2.7273, 63.69: 2.7265, 63.68: 2.7258, 63.67: 2.725, 63.66: 2.7243, 63.65: 2.7235, 63.64: 2.7228, 63.63: 2.722, 63.62: 2.7213, 63.61: 2.7205, 63.6: 2.7198, 63.59: 2.719, 63.58: 2.7183, 63.57: 2.7175, 63.56: 2.7168, 63.55: 2.716, 63.54: 2.7153, 63.53: 2.7146, 63.52: 2.7138, 63.51: 2.7131, 63.5: 2.7123, 63.49: 2.7116, 63.48: 2.7108, 63.47: 2.7101, 63.46: 2.7094, 63.45: 2.7086, 63.44: 2.7079, 63.43: 2.7071, 63.42: 2.7064, 63.41: 2.7057, 63.4: 2.7049, 63.39: 2.7042, 63.38: 2.7034, 63.37: 2.7027, 63.36: 2.702, 63.35: 2.7012, 63.34: 2.7005, 63.33: 2.6998, 63.32: 2.699, 63.31: 2.6983, 63.3: 2.6975, 63.29: 2.6968, 63.28: 2.6961, 63.27: 2.6953, 63.26: 2.6946, 63.25: 2.6939, 63.24: 2.6931, 63.23: 2.6924, 63.22: 2.6917, 63.21: 2.6909, 63.2: 2.6902, 63.19: 2.6895, 63.18: 2.6888, 63.17: 2.688, 63.16: 2.6873, 63.15: 2.6866, 63.14: 2.6858, 63.13: 2.6851, 63.12: 2.6844, 63.11: 2.6837, 63.1: 2.6829, 63.09: 2.6822, 63.08: 2.6815, 63.07: 2.6807, 63.06: 2.68, 63.05: 2.6793, 63.04: 2.6786, 63.03: 2.6778, 63.02: 2.6771, 63.01: 2.6764, 63.00: 2.6757, 62.99: 2.675, 62.98: 2.6742, 62.97: 2.6735, 62.96: 2.6728, 62.95: 2.6721, 62.94: 2.6713, 62.93: 2.6706, 62.92: 2.6699, 62.91: 2.6692, 62.9: 2.6685, 62.89: 2.6677, 62.88: 2.667, 62.87: 2.6663, 62.86: 2.6656, 62.85: 2.6649, 62.84: 2.6642, 62.83: 2.6634, 62.82: 2.6627, 62.81: 2.662, 62.8: 2.6613, 62.79: 2.6606, 62.78: 2.6599, 62.77: 2.6591, 62.76: 2.6584, 62.75: 2.6577, 62.74: 2.657, 62.73: 2.6563, 62.72: 2.6556, 62.71: 2.6549, 62.7: 2.6542, 62.69: 2.6534, 62.68: 2.6527, 62.67: 2.652, 62.66: 2.6513, 62.65: 2.6506, 62.64: 2.6499, 62.63: 2.6492, 62.62: 2.6485, 62.61: 2.6478, 62.6: 2.6471, 62.59: 2.6464, 62.58: 2.6456, 62.57: 2.6449, 62.56: 2.6442, 62.55: 2.6435, 62.54: 2.6428, 62.53: 2.6421, 62.52: 2.6414, 62.51: 2.6407, 62.5: 2.64, 62.49: 2.6393, 62.48: 2.6386, 62.47: 2.6379, 62.46: 2.6372, 62.45: 2.6365, 62.44: 2.6358, 62.43: 2.6351, 62.42: 2.6344, 62.41: 2.6337, 62.4: 2.633, 62.39: 2.6323, 62.38: 2.6316, 62.37: 2.6309, 62.36: 2.6302, 62.35: 2.6295, 62.34: 2.6288, 62.33: 2.6281, 62.32: 2.6274, 62.31: 2.6267, 62.3: 2.626, 62.29: 2.6253, 62.28: 2.6246, 62.27: 2.6239, 62.26: 2.6232, 62.25: 2.6225, 62.24: 2.6218, 62.23: 2.6211, 62.22: 2.6204, 62.21: 2.6197, 62.2: 2.619, 62.19: 2.6184, 62.18: 2.6177, 62.17: 2.617, 62.16: 2.6163, 62.15: 2.6156, 62.14: 2.6149, 62.13: 2.6142, 62.12: 2.6135, 62.11: 2.6128, 62.1: 2.6121, 62.09: 2.6114, 62.08: 2.6108, 62.07: 2.6101, 62.06: 2.6094, 62.05: 2.6087, 62.04: 2.608, 62.03: 2.6073, 62.02: 2.6066, 62.01: 2.6059, 62.00: 2.6053, 61.99: 2.6046, 61.98: 2.6039, 61.97: 2.6032, 61.96: 2.6025, 61.95: 2.6018, 61.94: 2.6012, 61.93: 2.6005, 61.92: 2.5998, 61.91: 2.5991, 61.9: 2.5984, 61.89: 2.5977, 61.88: 2.5971, 61.87: 2.5964, 61.86: 2.5957, 61.85: 2.595, 61.84: 2.5943, 61.83: 2.5937, 61.82: 2.593, 61.81: 2.5923, 61.8: 2.5916, 61.79: 2.5909, 61.78: 2.5903, 61.77: 2.5896, 61.76: 2.5889, 61.75: 2.5882, 61.74: 2.5876, 61.73: 2.5869, 61.72: 2.5862, 61.71: 2.5855, 61.7: 2.5849, 61.69: 2.5842, 61.68: 2.5835, 61.67: 2.5828, 61.66: 2.5822, 61.65: 2.5815, 61.64: 2.5808, 61.63: 2.5801, 61.62: 2.5795, 61.61: 2.5788, 61.6: 2.5781, 61.59: 2.5775, 61.58: 2.5768, 61.57: 2.5761, 61.56: 2.5754, 61.55: 2.5748, 61.54: 2.5741, 61.53: 2.5734, 61.52: 2.5728, 61.51: 2.5721, 61.5: 2.5714, 61.49: 2.5708, 61.48: 2.5701, 61.47: 2.5694, 61.46: 2.5688, 61.45: 2.5681, 61.44: 2.5674, 61.43: 2.5668, 61.42: 2.5661, 61.41: 2.5654, 61.4: 2.5648, 61.39: 2.5641, 61.38: 2.5634, 61.37: 2.5628, 61.36: 2.5621, 61.35: 2.5614, 61.34: 2.5608, 61.33: 2.5601, 61.32: 2.5595, 61.31: 2.5588, 61.3: 2.5581, 61.29: 2.5575, 61.28: 2.5568, 61.27: 2.5562, 61.26: 2.5555, 61.25: 2.5548, 61.24: 2.5542, 61.23: 2.5535, 61.22: 2.5529, 61.21: 2.5522, 61.2: 2.5515, 61.19: 2.5509, 61.18: 2.5502, 61.17: 2.5496, 61.16: 2.5489, 61.15: 2.5483, 61.14: 2.5476, 61.13: 2.547, 61.12: 2.5463, 61.11: 2.5456, 61.1: 2.545, 61.09: 2.5443, 61.08: 2.5437, 61.07: 2.543, 61.06: 2.5424, 61.05: 2.5417, 61.04: 2.5411, 61.03: 2.5404, 61.02: 2.5398, 61.01: 2.5391, 61.00: 2.5385, 60.99: 2.5378, 60.98: 2.5372, 60.97: 2.5365, 60.96: 2.5359, 60.95: 2.5352, 60.94: 2.5346, 60.93: 2.5339, 60.92: 2.5333, 60.91: 2.5326, 60.9: 2.532, 60.89: 2.5313, 60.88: 2.5307, 60.87: 2.53, 60.86: 2.5294, 60.85: 2.5287, 60.84: 2.5281, 60.83: 2.5274, 60.82: 2.5268, 60.81: 2.5262, 60.8: 2.5255, 60.79: 2.5249, 60.78: 2.5242, 60.77: 2.5236, 60.76: 2.5229, 60.75: 2.5223, 60.74: 2.5217, 60.73: 2.521, 60.72: 2.5204, 60.71: 2.5197, 60.7: 2.5191, 60.69: 2.5184, 60.68: 2.5178, 60.67: 2.5172, 60.66: 2.5165, 60.65: 2.5159, 60.64: 2.5152, 60.63: 2.5146, 60.62: 2.514, 60.61: 2.5133, 60.6: 2.5127, 60.59: 2.5121, 60.58: 2.5114, 60.57: 2.5108, 60.56: 2.5101, 60.55: 2.5095, 60.54: 2.5089, 60.53: 2.5082, 60.52: 2.5076, 60.51: 2.507, 60.5: 2.5063, 60.49: 2.5057, 60.48: 2.5051, 60.47: 2.5044, 60.46: 2.5038, 60.45: 2.5032, 60.44: 2.5025, 60.43: 2.5019, 60.42: 2.5013, 60.41: 2.5006, 60.4: 2.5, 60.39: 2.4994, 60.38: 2.4987, 60.37: 2.4981, 60.36: 2.4975, 60.35: 2.4968, 60.34: 2.4962, 60.33: 2.4956, 60.32: 2.495, 60.31: 2.4943, 60.3: 2.4937, 60.29: 2.4931, 60.28: 2.4924, 60.27: 2.4918, 60.26: 2.4912, 60.25: 2.4906, 60.24: 2.4899, 60.23: 2.4893, 60.22: 2.4887, 60.21: 2.4881, 60.2: 2.4874, 60.19: 2.4868, 60.18: 2.4862, 60.17: 2.4856, 60.16: 2.4849, 60.15: 2.4843, 60.14: 2.4837, 60.13: 2.4831, 60.12: 2.4824, 60.11: 2.4818, 60.1: 2.4812, 60.09: 2.4806, 60.08: 2.48, 60.07: 2.4793, 60.06: 2.4787, 60.05: 2.4781, 60.04: 2.4775, 60.03: 2.4769, 60.02: 2.4762, 60.01: 2.4756, 60.00: 2.475, 59.99: 2.4744, 59.98: 2.4738, 59.97: 2.4731, 59.96: 2.4725, 59.95: 2.4719, 59.94: 2.4713, 59.93: 2.4707, 59.92: 2.4701, 59.91: 2.4694, 59.9: 2.4688, 59.89: 2.4682, 59.88: 2.4676, 59.87: 2.467, 59.86: 2.4664, 59.85: 2.4658, 59.84: 2.4651, 59.83: 2.4645, 59.82: 2.4639, 59.81: 2.4633, 59.8: 2.4627, 59.79: 2.4621, 59.78: 2.4615, 59.77: 2.4609, 59.76: 2.4602, 59.75: 2.4596, 59.74: 2.459, 59.73: 2.4584, 59.72: 2.4578, 59.71: 2.4572, 59.7: 2.4566, 59.69: 2.456, 59.68: 2.4554, 59.67: 2.4547, 59.66: 2.4541, 59.65: 2.4535, 59.64: 2.4529, 59.63: 2.4523, 59.62: 2.4517, 59.61: 2.4511, 59.6: 2.4505, 59.59: 2.4499, 59.58: 2.4493, 59.57: 2.4487, 59.56: 2.4481, 59.55: 2.4475, 59.54: 2.4469, 59.53: 2.4463, 59.52: 2.4457, 59.51: 2.445, 59.5: 2.4444, 59.49: 2.4438, 59.48: 2.4432, 59.47: 2.4426, 59.46: 2.442, 59.45: 2.4414, 59.44: 2.4408, 59.43: 2.4402, 59.42: 2.4396, 59.41: 2.439, 59.4: 2.4384, 59.39: 2.4378, 59.38: 2.4372, 59.37: 2.4366, 59.36: 2.436, 59.35: 2.4354, 59.34: 2.4348, 59.33: 2.4342, 59.32: 2.4336, 59.31: 2.433, 59.3: 2.4324, 59.29: 2.4318, 59.28: 2.4312, 59.27: 2.4306, 59.26: 2.43, 59.25: 2.4294, 59.24: 2.4289, 59.23: 2.4283, 59.22: 2.4277, 59.21: 2.4271, 59.2: 2.4265, 59.19: 2.4259, 59.18: 2.4253, 59.17: 2.4247, 59.16: 2.4241, 59.15: 2.4235, 59.14: 2.4229, 59.13: 2.4223, 59.12: 2.4217, 59.11: 2.4211, 59.1: 2.4205, 59.09: 2.4199, 59.08: 2.4194, 59.07: 2.4188, 59.06: 2.4182, 59.05: 2.4176, 59.04: 2.417, 59.03: 2.4164, 59.02: 2.4158, 59.01: 2.4152, 59.00: 2.4146, 58.99: 2.414, 58.98: 2.4135, 58.97: 2.4129, 58.96: 2.4123, 58.95: 2.4117, 58.94: 2.4111, 58.93: 2.4105, 58.92: 2.4099, 58.91: 2.4093, 58.9: 2.4088, 58.89: 2.4082, 58.88: 2.4076, 58.87: 2.407, 58.86: 2.4064, 58.85: 2.4058, 58.84: 2.4052, 58.83: 2.4047, 58.82: 2.4041, 58.81: 2.4035, 58.8: 2.4029, 58.79: 2.4023, 58.78: 2.4017, 58.77: 2.4012, 58.76: 2.4006, 58.75: 2.4, 58.74: 2.3994, 58.73: 2.3988, 58.72: 2.3983, 58.71: 2.3977, 58.7: 2.3971, 58.69: 2.3965, 58.68: 2.3959, 58.67: 2.3954, 58.66: 2.3948, 58.65: 2.3942, 58.64: 2.3936, 58.63: 2.393, 58.62: 2.3925, 58.61: 2.3919, 58.6: 2.3913, 58.59: 2.3907, 58.58: 2.3901, 58.57: 2.3896, 58.56: 2.389, 58.55: 2.3884, 58.54: 2.3878, 58.53: 2.3873, 58.52: 2.3867, 58.51: 2.3861, 58.5: 2.3855, 58.49: 2.385, 58.48: 2.3844, 58.47: 2.3838, 58.46: 2.3832, 58.45: 2.3827, 58.44: 2.3821, 58.43: 2.3815, 58.42: 2.381, 58.41: 2.3804, 58.4: 2.3798, 58.39: 2.3792, 58.38: 2.3787, 58.37: 2.3781, 58.36: 2.3775, 58.35: 2.377, 58.34: 2.3764, 58.33: 2.3758, 58.32: 2.3752, 58.31: 2.3747, 58.3: 2.3741, 58.29: 2.3735, 58.28: 2.373, 58.27: 2.3724, 58.26: 2.3718, 58.25: 2.3713, 58.24: 2.3707, 58.23: 2.3701, 58.22: 2.3696, 58.21: 2.369, 58.2: 2.3684, 58.19: 2.3679, 58.18: 2.3673, 58.17: 2.3667, 58.16: 2.3662, 58.15: 2.3656, 58.14: 2.365, 58.13: 2.3645, 58.12: 2.3639, 58.11: 2.3633, 58.1: 2.3628, 58.09: 2.3622, 58.08: 2.3616, 58.07: 2.3611, 58.06: 2.3605, 58.05: 2.36, 58.04: 2.3594, 58.03: 2.3588, 58.02: 2.3583, 58.01: 2.3577, 58.00: 2.3571, 57.99: 2.3566, 57.98: 2.356, 57.97: 2.3555, 57.96: 2.3549, 57.95: 2.3543, 57.94: 2.3538, 57.93: 2.3532, 57.92: 2.3527, 57.91: 2.3521, 57.9: 2.3515, 57.89: 2.351, 57.88: 2.3504, 57.87: 2.3499, 57.86: 2.3493, 57.85: 2.3488, 57.84: 2.3482, 57.83: 2.3476, 57.82: 2.3471, 57.81: 2.3465, 57.8: 2.346, 57.79: 2.3454, 57.78: 2.3449, 57.77: 2.3443, 57.76: 2.3438, 57.75: 2.3432, 57.74: 2.3426, 57.73: 2.3421, 57.72: 2.3415, 57.71: 2.341, 57.7: 2.3404, 57.69: 2.3399, 57.68: 2.3393, 57.67: 2.3388, 57.66: 2.3382, 57.65: 2.3377, 57.64: 2.3371, 57.63: 2.3366, 57.62: 2.336, 57.61: 2.3355, 57.6: 2.3349, 57.59: 2.3344, 57.58: 2.3338, 57.57: 2.3333, 57.56: 2.3327, 57.55: 2.3322, 57.54: 2.3316, 57.53: 2.3311, 57.52: 2.3305, 57.51: 2.33, 57.5: 2.3294, 57.49: 2.3289, 57.48: 2.3283, 57.47: 2.3278, 57.46: 2.3272, 57.45: 2.3267, 57.44: 2.3261, 57.43: 2.3256, 57.42: 2.325, 57.41: 2.3245, 57.4: 2.3239, 57.39: 2.3234, 57.38: 2.3229, 57.37: 2.3223, 57.36: 2.3218, 57.35: 2.3212, 57.34: 2.3207, 57.33: 2.3201, 57.32: 2.3196, 57.31: 2.319, 57.3: 2.3185, 57.29: 2.318, 57.28: 2.3174, 57.27: 2.3169, 57.26: 2.3163, 57.25: 2.3158, 57.24: 2.3152, 57.23: 2.3147, 57.22: 2.3142, 57.21: 2.3136, 57.2: 2.3131, 57.19: 2.3125, 57.18: 2.312, 57.17: 2.3115, 57.16: 2.3109, 57.15: 2.3104, 57.14: 2.3098, 57.13: 2.3093, 57.12: 2.3088, 57.11: 2.3082, 57.1: 2.3077, 57.09: 2.3072, 57.08: 2.3066, 57.07: 2.3061, 57.06: 2.3055, 57.05: 2.305, 57.04: 2.3045, 57.03: 2.3039, 57.02: 2.3034, 57.01: 2.3029, 57.00: 2.3023, 56.99: 2.3018, 56.98: 2.3013, 56.97: 2.3007, 56.96: 2.3002, 56.95: 2.2997, 56.94: 2.2991, 56.93: 2.2986, 56.92: 2.2981, 56.91: 2.2975, 56.9: 2.297, 56.89: 2.2965, 56.88: 2.2959, 56.87: 2.2954, 56.86: 2.2949, 56.85: 2.2943, 56.84: 2.2938, 56.83: 2.2933, 56.82: 2.2927, 56.81: 2.2922, 56.8: 2.2917, 56.79: 2.2911, 56.78: 2.2906, 56.77: 2.2901, 56.76: 2.2895, 56.75: 2.289, 56.74: 2.2885, 56.73: 2.288, 56.72: 2.2874, 56.71: 2.2869, 56.7: 2.2864, 56.69: 2.2858, 56.68: 2.2853, 56.67: 2.2848, 56.66: 2.2843, 56.65: 2.2837, 56.64: 2.2832, 56.63: 2.2827, 56.62: 2.2822, 56.61: 2.2816, 56.6: 2.2811, 56.59: 2.2806, 56.58: 2.2801, 56.57: 2.2795, 56.56: 2.279, 56.55: 2.2785, 56.54: 2.278, 56.53: 2.2774, 56.52: 2.2769, 56.51: 2.2764, 56.5: 2.2759, 56.49: 2.2753, 56.48: 2.2748, 56.47: 2.2743, 56.46: 2.2738, 56.45: 2.2732, 56.44: 2.2727, 56.43: 2.2722, 56.42: 2.2717, 56.41: 2.2712, 56.4: 2.2706, 56.39: 2.2701, 56.38: 2.2696, 56.37: 2.2691, 56.36: 2.2686, 56.35: 2.268, 56.34: 2.2675, 56.33: 2.267, 56.32: 2.2665, 56.31: 2.266, 56.3: 2.2654, 56.29: 2.2649, 56.28: 2.2644, 56.27: 2.2639, 56.26: 2.2634, 56.25: 2.2629, 56.24: 2.2623, 56.23: 2.2618, 56.22: 2.2613, 56.21: 2.2608, 56.2: 2.2603, 56.19: 2.2598, 56.18: 2.2592, 56.17: 2.2587, 56.16: 2.2582, 56.15: 2.2577, 56.14: 2.2572, 56.13: 2.2567, 56.12: 2.2562, 56.11: 2.2556, 56.1: 2.2551, 56.09: 2.2546, 56.08: 2.2541, 56.07: 2.2536, 56.06: 2.2531, 56.05: 2.2526, 56.04: 2.252, 56.03: 2.2515, 56.02: 2.251, 56.01: 2.2505, 56.00: 2.25, 55.99: 2.2495, 55.98: 2.249, 55.97: 2.2485, 55.96: 2.248, 55.95: 2.2474, 55.94: 2.2469, 55.93: 2.2464, 55.92: 2.2459, 55.91: 2.2454, 55.9: 2.2449, 55.89: 2.2444, 55.88: 2.2439, 55.87: 2.2434, 55.86: 2.2429, 55.85: 2.2424, 55.84: 2.2418, 55.83: 2.2413, 55.82: 2.2408, 55.81: 2.2403, 55.8: 2.2398, 55.79: 2.2393, 55.78: 2.2388, 55.77: 2.2383, 55.76: 2.2378, 55.75: 2.2373, 55.74: 2.2368, 55.73: 2.2363, 55.72: 2.2358, 55.71: 2.2353, 55.7: 2.2348, 55.69: 2.2343, 55.68: 2.2338, 55.67: 2.2333, 55.66: 2.2327, 55.65: 2.2322, 55.64: 2.2317, 55.63: 2.2312, 55.62: 2.2307, 55.61: 2.2302, 55.6: 2.2297, 55.59: 2.2292, 55.58: 2.2287, 55.57: 2.2282, 55.56: 2.2277, 55.55: 2.2272, 55.54: 2.2267, 55.53: 2.2262, 55.52: 2.2257, 55.51: 2.2252, 55.5: 2.2247, 55.49: 2.2242, 55.48: 2.2237, 55.47: 2.2232, 55.46: 2.2227, 55.45: 2.2222, 55.44: 2.2217, 55.43: 2.2212, 55.42: 2.2207, 55.41: 2.2202, 55.4: 2.2197, 55.39: 2.2192, 55.38: 2.2187, 55.37: 2.2182, 55.36: 2.2177, 55.35: 2.2172, 55.34: 2.2167, 55.33: 2.2163, 55.32: 2.2158, 55.31: 2.2153, 55.3: 2.2148, 55.29: 2.2143, 55.28: 2.2138, 55.27: 2.2133, 55.26: 2.2128, 55.25: 2.2123, 55.24: 2.2118, 55.23: 2.2113, 55.22: 2.2108, 55.21: 2.2103, 55.2: 2.2098, 55.19: 2.2093, 55.18: 2.2088, 55.17: 2.2083, 55.16: 2.2079, 55.15: 2.2074, 55.14: 2.2069, 55.13: 2.2064, 55.12: 2.2059, 55.11: 2.2054, 55.1: 2.2049, 55.09: 2.2044, 55.08: 2.2039, 55.07: 2.2034, 55.06: 2.2029, 55.05: 2.2024, 55.04: 2.202, 55.03: 2.2015, 55.02: 2.201, 55.01: 2.2005, 55.00: 2.2, 54.99: 2.1995, 54.98: 2.199, 54.97: 2.1985, 54.96: 2.198, 54.95: 2.1976, 54.94: 2.1971, 54.93: 2.1966, 54.92: 2.1961, 54.91: 2.1956, 54.9: 2.1951, 54.89: 2.1946, 54.88: 2.1941, 54.87: 2.1937, 54.86: 2.1932, 54.85: 2.1927, 54.84: 2.1922, 54.83: 2.1917, 54.82: 2.1912, 54.81: 2.1908, 54.8: 2.1903, 54.79: 2.1898, 54.78: 2.1893, 54.77: 2.1888, 54.76: 2.1883, 54.75: 2.1878, 54.74: 2.1874, 54.73: 2.1869, 54.72: 2.1864, 54.71: 2.1859, 54.7: 2.1854, 54.69: 2.1849, 54.68: 2.1845, 54.67: 2.184, 54.66: 2.1835, 54.65: 2.183, 54.64: 2.1825, 54.63: 2.1821, 54.62: 2.1816, 54.61: 2.1811, 54.6: 2.1806, 54.59: 2.1801, 54.58: 2.1797, 54.57: 2.1792, 54.56: 2.1787, 54.55: 2.1782, 54.54: 2.1777, 54.53: 2.1773, 54.52: 2.1768, 54.51: 2.1763, 54.5: 2.1758, 54.49: 2.1753, 54.48: 2.1749, 54.47: 2.1744, 54.46: 2.1739, 54.45: 2.1734, 54.44: 2.173, 54.43: 2.1725, 54.42: 2.172, 54.41: 2.1715, 54.4: 2.1711, 54.39: 2.1706, 54.38: 2.1701, 54.37: 2.1696, 54.36: 2.1691, 54.35: 2.1687, 54.34: 2.1682, 54.33: 2.1677, 54.32: 2.1673, 54.31: 2.1668, 54.3: 2.1663, 54.29: 2.1658, 54.28: 2.1654, 54.27: 2.1649, 54.26: 2.1644, 54.25: 2.1639, 54.24: 2.1635, 54.23: 2.163, 54.22: 2.1625, 54.21: 2.162, 54.2: 2.1616, 54.19: 2.1611, 54.18: 2.1606, 54.17: 2.1602, 54.16: 2.1597, 54.15: 2.1592, 54.14: 2.1587, 54.13: 2.1583, 54.12: 2.1578, 54.11: 2.1573, 54.1: 2.1569, 54.09: 2.1564, 54.08: 2.1559, 54.07: 2.1555, 54.06: 2.155, 54.05: 2.1545, 54.04: 2.154, 54.03: 2.1536, 54.02: 2.1531, 54.01: 2.1526, 54.00: 2.1522, 53.99: 2.1517, 53.98: 2.1512, 53.97: 2.1508, 53.96: 2.1503, 53.95: 2.1498, 53.94: 2.1494, 53.93: 2.1489, 53.92: 2.1484, 53.91: 2.148, 53.9: 2.1475, 53.89: 2.147, 53.88: 2.1466, 53.87: 2.1461, 53.86: 2.1456, 53.85: 2.1452, 53.84: 2.1447, 53.83: 2.1442, 53.82: 2.1438, 53.81: 2.1433, 53.8: 2.1429, 53.79: 2.1424, 53.78: 2.1419, 53.77: 2.1415, 53.76: 2.141, 53.75: 2.1405, 53.74: 2.1401, 53.73: 2.1396, 53.72: 2.1392, 53.71: 2.1387, 53.7: 2.1382, 53.69: 2.1378, 53.68: 2.1373, 53.67: 2.1368, 53.66: 2.1364, 53.65: 2.1359, 53.64: 2.1355, 53.63: 2.135, 53.62: 2.1345, 53.61: 2.1341, 53.6: 2.1336, 53.59: 2.1332, 53.58: 2.1327, 53.57: 2.1322, 53.56: 2.1318, 53.55: 2.1313, 53.54: 2.1309, 53.53: 2.1304, 53.52: 2.1299, 53.51: 2.1295, 53.5: 2.129, 53.49: 2.1286, 53.48: 2.1281, 53.47: 2.1277, 53.46: 2.1272, 53.45: 2.1267, 53.44: 2.1263, 53.43: 2.1258, 53.42: 2.1254, 53.41: 2.1249, 53.4: 2.1245, 53.39: 2.124, 53.38: 2.1236, 53.37: 2.1231, 53.36: 2.1226, 53.35: 2.1222, 53.34: 2.1217, 53.33: 2.1213, 53.32: 2.1208, 53.31: 2.1204, 53.3: 2.1199, 53.29: 2.1195, 53.28: 2.119, 53.27: 2.1186, 53.26: 2.1181, 53.25: 2.1176, 53.24: 2.1172, 53.23: 2.1167, 53.22: 2.1163, 53.21: 2.1158, 53.2: 2.1154, 53.19: 2.1149, 53.18: 2.1145, 53.17: 2.114, 53.16: 2.1136, 53.15: 2.1131, 53.14: 2.1127, 53.13: 2.1122, 53.12: 2.1118, 53.11: 2.1113, 53.1: 2.1109, 53.09: 2.1104, 53.08: 2.11, 53.07: 2.1095, 53.06: 2.1091, 53.05: 2.1086, 53.04: 2.1082, 53.03: 2.1077, 53.02: 2.1073, 53.01: 2.1068, 53.00: 2.1064, 52.99: 2.1059, 52.98: 2.1055, 52.97: 2.105, 52.96: 2.1046, 52.95: 2.1041, 52.94: 2.1037, 52.93: 2.1033, 52.92: 2.1028, 52.91: 2.1024, 52.9: 2.1019, 52.89: 2.1015, 52.88: 2.101, 52.87: 2.1006, 52.86: 2.1001, 52.85: 2.0997, 52.84: 2.0992, 52.83: 2.0988, 52.82: 2.0983, 52.81: 2.0979, 52.8: 2.0975, 52.79: 2.097, 52.78: 2.0966, 52.77: 2.0961, 52.76: 2.0957, 52.75: 2.0952, 52.74: 2.0948, 52.73: 2.0944, 52.72: 2.0939, 52.71: 2.0935, 52.7: 2.093, 52.69: 2.0926, 52.68: 2.0921, 52.67: 2.0917, 52.66: 2.0913, 52.65: 2.0908, 52.64: 2.0904, 52.63: 2.0899, 52.62: 2.0895, 52.61: 2.089, 52.6: 2.0886, 52.59: 2.0882, 52.58: 2.0877, 52.57: 2.0873, 52.56: 2.0868, 52.55: 2.0864, 52.54: 2.086, 52.53: 2.0855, 52.52: 2.0851, 52.51: 2.0846, 52.5: 2.0842, 52.49: 2.0838, 52.48: 2.0833, 52.47: 2.0829, 52.46: 2.0825, 52.45: 2.082, 52.44: 2.0816, 52.43: 2.0811, 52.42: 2.0807, 52.41: 2.0803, 52.4: 2.0798, 52.39: 2.0794, 52.38: 2.079, 52.37: 2.0785, 52.36: 2.0781, 52.35: 2.0776, 52.34: 2.0772, 52.33: 2.0768, 52.32: 2.0763, 52.31: 2.0759, 52.3: 2.0755, 52.29: 2.075, 52.28: 2.0746, 52.27: 2.0742, 52.26: 2.0737, 52.25: 2.0733, 52.24: 2.0729, 52.23: 2.0724, 52.22: 2.072, 52.21: 2.0716, 52.2: 2.0711, 52.19: 2.0707, 52.18: 2.0703, 52.17: 2.0698, 52.16: 2.0694, 52.15: 2.069, 52.14: 2.0685, 52.13: 2.0681, 52.12: 2.0677, 52.11: 2.0672, 52.1: 2.0668, 52.09: 2.0664, 52.08: 2.0659, 52.07: 2.0655, 52.06: 2.0651, 52.05: 2.0647, 52.04: 2.0642, 52.03: 2.0638, 52.02: 2.0634, 52.01: 2.0629, 52.00: 2.0625, 51.99: 2.0621, 51.98: 2.0616, 51.97: 2.0612, 51.96: 2.0608, 51.95: 2.0604, 51.94: 2.0599, 51.93: 2.0595, 51.92: 2.0591, 51.91: 2.0586, 51.9: 2.0582, 51.89: 2.0578, 51.88: 2.0574, 51.87: 2.0569, 51.86: 2.0565, 51.85: 2.0561, 51.84: 2.0556, 51.83: 2.0552, 51.82: 2.0548, 51.81: 2.0544, 51.8: 2.0539, 51.79: 2.0535, 51.78: 2.0531, 51.77: 2.0527, 51.76: 2.0522, 51.75: 2.0518, 51.74: 2.0514, 51.73: 2.051, 51.72: 2.0505, 51.71: 2.0501, 51.7: 2.0497, 51.69: 2.0493, 51.68: 2.0488, 51.67: 2.0484, 51.66: 2.048, 51.65: 2.0476, 51.64: 2.0471, 51.63: 2.0467, 51.62: 2.0463, 51.61: 2.0459, 51.6: 2.0455, 51.59: 2.045, 51.58: 2.0446, 51.57: 2.0442, 51.56: 2.0438, 51.55: 2.0433, 51.54: 2.0429, 51.53: 2.0425, 51.52: 2.0421, 51.51: 2.0417, 51.5: 2.0412, 51.49: 2.0408, 51.48: 2.0404, 51.47: 2.04, 51.46: 2.0396, 51.45: 2.0391, 51.44: 2.0387, 51.43: 2.0383, 51.42: 2.0379, 51.41: 2.0375, 51.4: 2.037, 51.39: 2.0366, 51.38: 2.0362, 51.37: 2.0358, 51.36: 2.0354, 51.35: 2.0349, 51.34: 2.0345, 51.33: 2.0341, 51.32: 2.0337, 51.31: 2.0333, 51.3: 2.0329, 51.29: 2.0324, 51.28: 2.032, 51.27: 2.0316, 51.26: 2.0312, 51.25: 2.0308, 51.24: 2.0304, 51.23: 2.0299, 51.22: 2.0295, 51.21: 2.0291, 51.2: 2.0287, 51.19: 2.0283, 51.18: 2.0279, 51.17: 2.0274, 51.16: 2.027, 51.15: 2.0266, 51.14: 2.0262, 51.13: 2.0258, 51.12: 2.0254, 51.11: 2.025, 51.1: 2.0245, 51.09: 2.0241, 51.08: 2.0237, 51.07: 2.0233, 51.06: 2.0229, 51.05: 2.0225, 51.04: 2.0221, 51.03: 2.0216, 51.02: 2.0212, 51.01: 2.0208, 51.00: 2.0204, 50.99: 2.02, 50.98: 2.0196, 50.97: 2.0192, 50.96: 2.0188, 50.95: 2.0183, 50.94: 2.0179, 50.93: 2.0175, 50.92: 2.0171, 50.91: 2.0167, 50.9: 2.0163, 50.89: 2.0159, 50.88: 2.0155, 50.87: 2.0151, 50.86: 2.0147, 50.85: 2.0142, 50.84: 2.0138, 50.83: 2.0134, 50.82: 2.013, 50.81: 2.0126, 50.8: 2.0122, 50.79: 2.0118, 50.78: 2.0114, 50.77: 2.011, 50.76: 2.0106, 50.75: 2.0102, 50.74: 2.0097, 50.73: 2.0093, 50.72: 2.0089, 50.71: 2.0085, 50.7: 2.0081, 50.69: 2.0077, 50.68: 2.0073, 50.67: 2.0069, 50.66: 2.0065, 50.65: 2.0061, 50.64: 2.0057, 50.63: 2.0053, 50.62: 2.0049, 50.61: 2.0045, 50.6: 2.004, 50.59: 2.0036, 50.58: 2.0032, 50.57: 2.0028, 50.56: 2.0024, 50.55: 2.002, 50.54: 2.0016, 50.53: 2.0012, 50.52: 2.0008, 50.51: 2.0004, 50.5: 2.0, 50.49: 1.9996, 50.48: 1.9992, 50.47: 1.9988, 50.46: 1.9984, 50.45: 1.998, 50.44: 1.9976, 50.43: 1.9972, 50.42: 1.9968, 50.41: 1.9964, 50.4: 1.996, 50.39: 1.9956, 50.38: 1.9952, 50.37: 1.9948, 50.36: 1.9944, 50.35: 1.994, 50.34: 1.9936, 50.33: 1.9932, 50.32: 1.9928, 50.31: 1.9924, 50.3: 1.992, 50.29: 1.9916, 50.28: 1.9912, 50.27: 1.9908, 50.26: 1.9903, 50.25: 1.9899, 50.24: 1.9895, 50.23: 1.9892, 50.22: 1.9888, 50.21: 1.9884, 50.2: 1.988, 50.19: 1.9876, 50.18: 1.9872, 50.17: 1.9868, 50.16: 1.9864, 50.15: 1.986, 50.14: 1.9856, 50.13: 1.9852, 50.12: 1.9848, 50.11: 1.9844, 50.1: 1.984, 50.09: 1.9836, 50.08: 1.9832, 50.07: 1.9828, 50.06: 1.9824, 50.05: 1.982, 50.04: 1.9816, 50.03: 1.9812, 50.02: 1.9808, 50.01: 1.9804, 50.00: 1.98, 49.99: 1.9796, 49.98: 1.9792, 49.97: 1.9788, 49.96: 1.9784, 49.95: 1.978, 49.94: 1.9776, 49.93: 1.9772, 49.92: 1.9768, 49.91: 1.9764, 49.9: 1.976, 49.89: 1.9757, 49.88: 1.9753, 49.87: 1.9749, 49.86: 1.9745, 49.85: 1.9741, 49.84: 1.9737, 49.83: 1.9733, 49.82: 1.9729, 49.81: 1.9725, 49.8: 1.9721, 49.79: 1.9717, 49.78: 1.9713, 49.77: 1.9709, 49.76: 1.9705, 49.75: 1.9701, 49.74: 1.9698, 49.73: 1.9694, 49.72: 1.969, 49.71: 1.9686, 49.7: 1.9682, 49.69: 1.9678, 49.68: 1.9674, 49.67: 1.967, 49.66: 1.9666, 49.65: 1.9662, 49.64: 1.9658, 49.63: 1.9655, 49.62: 1.9651, 49.61: 1.9647, 49.6: 1.9643, 49.59: 1.9639, 49.58: 1.9635, 49.57: 1.9631, 49.56: 1.9627, 49.55: 1.9623, 49.54: 1.962, 49.53: 1.9616, 49.52: 1.9612, 49.51: 1.9608, 49.5: 1.9604, 49.49: 1.96, 49.48: 1.9596, 49.47: 1.9592, 49.46: 1.9588, 49.45: 1.9585, 49.44: 1.9581, 49.43: 1.9577, 49.42: 1.9573, 49.41: 1.9569, 49.4: 1.9565, 49.39: 1.9561, 49.38: 1.9557, 49.37: 1.9554, 49.36: 1.955, 49.35: 1.9546, 49.34: 1.9542, 49.33: 1.9538, 49.32: 1.9534, 49.31: 1.953, 49.3: 1.9527, 49.29: 1.9523, 49.28: 1.9519, 49.27: 1.9515, 49.26: 1.9511, 49.25: 1.9507, 49.24: 1.9504, 49.23: 1.95, 49.22: 1.9496, 49.21: 1.9492, 49.2: 1.9488, 49.19: 1.9484, 49.18: 1.9481, 49.17: 1.9477, 49.16: 1.9473, 49.15: 1.9469, 49.14: 1.9465, 49.13: 1.9461, 49.12: 1.9458, 49.11: 1.9454, 49.1: 1.945, 49.09: 1.9446, 49.08: 1.9442, 49.07: 1.9438, 49.06: 1.9435, 49.05: 1.9431, 49.04: 1.9427, 49.03: 1.9423, 49.02: 1.9419, 49.01: 1.9416, 49.00: 1.9412, 48.99: 1.9408, 48.98: 1.9404, 48.97: 1.94, 48.96: 1.9397, 48.95: 1.9393, 48.94: 1.9389, 48.93: 1.9385, 48.92: 1.9381, 48.91: 1.9378, 48.9: 1.9374, 48.89: 1.937, 48.88: 1.9366, 48.87: 1.9362, 48.86: 1.9359, 48.85: 1.9355, 48.84: 1.9351, 48.83: 1.9347, 48.82: 1.9343, 48.81: 1.934, 48.8: 1.9336, 48.79: 1.9332, 48.78: 1.9328, 48.77: 1.9325, 48.76: 1.9321, 48.75: 1.9317, 48.74: 1.9313, 48.73: 1.931, 48.72: 1.9306, 48.71: 1.9302, 48.7: 1.9298, 48.69: 1.9294, 48.68: 1.9291, 48.67: 1.9287, 48.66: 1.9283, 48.65: 1.9279, 48.64: 1.9276, 48.63: 1.9272, 48.62: 1.9268, 48.61: 1.9264, 48.6: 1.9261, 48.59: 1.9257, 48.58: 1.9253, 48.57: 1.9249, 48.56: 1.9246, 48.55: 1.9242, 48.54: 1.9238, 48.53: 1.9235, 48.52: 1.9231, 48.51: 1.9227, 48.5: 1.9223, 48.49: 1.922, 48.48: 1.9216, 48.47: 1.9212, 48.46: 1.9208, 48.45: 1.9205, 48.44: 1.9201, 48.43: 1.9197, 48.42: 1.9193, 48.41: 1.919, 48.4: 1.9186, 48.39: 1.9182, 48.38: 1.9179, 48.37: 1.9175, 48.36: 1.9171, 48.35: 1.9167, 48.34: 1.9164, 48.33: 1.916, 48.32: 1.9156, 48.31: 1.9153, 48.3: 1.9149, 48.29: 1.9145, 48.28: 1.9142, 48.27: 1.9138, 48.26: 1.9134, 48.25: 1.913, 48.24: 1.9127, 48.23: 1.9123, 48.22: 1.9119, 48.21: 1.9116, 48.2: 1.9112, 48.19: 1.9108, 48.18: 1.9105, 48.17: 1.9101, 48.16: 1.9097, 48.15: 1.9094, 48.14: 1.909, 48.13: 1.9086, 48.12: 1.9082, 48.11: 1.9079, 48.1: 1.9075, 48.09: 1.9071, 48.08: 1.9068, 48.07: 1.9064, 48.06: 1.906, 48.05: 1.9057, 48.04: 1.9053, 48.03: 1.9049, 48.02: 1.9046, 48.01: 1.9042, 48.00: 1.9038, 47.99: 1.9035, 47.98: 1.9031, 47.97: 1.9027, 47.96: 1.9024, 47.95: 1.902, 47.94: 1.9017, 47.93: 1.9013, 47.92: 1.9009, 47.91: 1.9006, 47.9: 1.9002, 47.89: 1.8998, 47.88: 1.8995, 47.87: 1.8991, 47.86: 1.8987, 47.85: 1.8984, 47.84: 1.898, 47.83: 1.8976, 47.82: 1.8973, 47.81: 1.8969, 47.8: 1.8966, 47.79: 1.8962, 47.78: 1.8958, 47.77: 1.8955, 47.76: 1.8951, 47.75: 1.8947, 47.74: 1.8944, 47.73: 1.894, 47.72: 1.8936, 47.71: 1.8933, 47.7: 1.8929, 47.69: 1.8926, 47.68: 1.8922, 47.67: 1.8918, 47.66: 1.8915, 47.65: 1.8911, 47.64: 1.8908, 47.63: 1.8904, 47.62: 1.89, 47.61: 1.8897, 47.6: 1.8893, 47.59: 1.889, 47.58: 1.8886, 47.57: 1.8882, 47.56: 1.8879, 47.55: 1.8875, 47.54: 1.8872, 47.53: 1.8868, 47.52: 1.8864, 47.51: 1.8861, 47.5: 1.8857, 47.49: 1.8854, 47.48: 1.885, 47.47: 1.8846, 47.46: 1.8843, 47.45: 1.8839, 47.44: 1.8836, 47.43: 1.8832, 47.42: 1.8828, 47.41: 1.8825, 47.4: 1.8821, 47.39: 1.8818, 47.38: 1.8814, 47.37: 1.8811, 47.36: 1.8807, 47.35: 1.8803, 47.34: 1.88, 47.33: 1.8796, 47.32: 1.8793, 47.31: 1.8789, 47.3: 1.8786, 47.29: 1.8782, 47.28: 1.8778, 47.27: 1.8775, 47.26: 1.8771, 47.25: 1.8768, 47.24: 1.8764, 47.23: 1.8761, 47.22: 1.8757, 47.21: 1.8754, 47.2: 1.875, 47.19: 1.8746, 47.18: 1.8743, 47.17: 1.8739, 47.16: 1.8736, 47.15: 1.8732, 47.14: 1.8729, 47.13: 1.8725, 47.12: 1.8722, 47.11: 1.8718, 47.1: 1.8715, 47.09: 1.8711, 47.08: 1.8707, 47.07: 1.8704, 47.06: 1.87, 47.05: 1.8697, 47.04: 1.8693, 47.03: 1.869, 47.02: 1.8686, 47.01: 1.8683, 47.00: 1.8679, 46.99: 1.8676, 46.98: 1.8672, 46.97: 1.8669, 46.96: 1.8665, 46.95: 1.8662, 46.94: 1.8658, 46.93: 1.8655, 46.92: 1.8651, 46.91: 1.8648, 46.9: 1.8644, 46.89: 1.8641, 46.88: 1.8637, 46.87: 1.8634, 46.86: 1.863, 46.85: 1.8627, 46.84: 1.8623, 46.83: 1.862, 46.82: 1.8616, 46.81: 1.8613, 46.8: 1.8609, 46.79: 1.8606, 46.78: 1.8602, 46.77: 1.8599, 46.76: 1.8595, 46.75: 1.8592, 46.74: 1.8588, 46.73: 1.8585, 46.72: 1.8581, 46.71: 1.8578, 46.7: 1.8574, 46.69: 1.8571, 46.68: 1.8567, 46.67: 1.8564, 46.66: 1.856, 46.65: 1.8557, 46.64: 1.8553, 46.63: 1.855, 46.62: 1.8546, 46.61: 1.8543, 46.6: 1.8539, 46.59: 1.8536, 46.58: 1.8532, 46.57: 1.8529, 46.56: 1.8525, 46.55: 1.8522, 46.54: 1.8519, 46.53: 1.8515, 46.52: 1.8512, 46.51: 1.8508, 46.5: 1.8505, 46.49: 1.8501, 46.48: 1.8498, 46.47: 1.8494, 46.46: 1.8491, 46.45: 1.8487, 46.44: 1.8484, 46.43: 1.848, 46.42: 1.8477, 46.41: 1.8474, 46.4: 1.847, 46.39: 1.8467, 46.38: 1.8463, 46.37: 1.846, 46.36: 1.8456, 46.35: 1.8453, 46.34: 1.8449, 46.33: 1.8446, 46.32: 1.8443, 46.31: 1.8439, 46.3: 1.8436, 46.29: 1.8432, 46.28: 1.8429, 46.27: 1.8425, 46.26: 1.8422, 46.25: 1.8419, 46.24: 1.8415, 46.23: 1.8412, 46.22: 1.8408, 46.21: 1.8405, 46.2: 1.8401, 46.19: 1.8398, 46.18: 1.8395, 46.17: 1.8391, 46.16: 1.8388, 46.15: 1.8384, 46.14: 1.8381, 46.13: 1.8378, 46.12: 1.8374, 46.11: 1.8371, 46.1: 1.8367, 46.09: 1.8364, 46.08: 1.8361, 46.07: 1.8357, 46.06: 1.8354, 46.05: 1.835, 46.04: 1.8347, 46.03: 1.8344, 46.02: 1.834, 46.01: 1.8337, 46.00: 1.8333, 45.99: 1.833, 45.98: 1.8327, 45.97: 1.8323, 45.96: 1.832, 45.95: 1.8316, 45.94: 1.8313, 45.93: 1.831, 45.92: 1.8306, 45.91: 1.8303, 45.9: 1.8299, 45.89: 1.8296, 45.88: 1.8293, 45.87: 1.8289, 45.86: 1.8286, 45.85: 1.8283, 45.84: 1.8279, 45.83: 1.8276, 45.82: 1.8272, 45.81: 1.8269, 45.8: 1.8266, 45.79: 1.8262, 45.78: 1.8259, 45.77: 1.8256, 45.76: 1.8252, 45.75: 1.8249, 45.74: 1.8245, 45.73: 1.8242, 45.72: 1.8239, 45.71: 1.8235, 45.7: 1.8232, 45.69: 1.8229, 45.68: 1.8225, 45.67: 1.8222, 45.66: 1.8219, 45.65: 1.8215, 45.64: 1.8212, 45.63: 1.8209, 45.62: 1.8205, 45.61: 1.8202, 45.6: 1.8199, 45.59: 1.8195, 45.58: 1.8192, 45.57: 1.8188, 45.56: 1.8185, 45.55: 1.8182, 45.54: 1.8178, 45.53: 1.8175, 45.52: 1.8172, 45.51: 1.8168, 45.5: 1.8165, 45.49: 1.8162, 45.48: 1.8158, 45.47: 1.8155, 45.46: 1.8152, 45.45: 1.8148, 45.44: 1.8145, 45.43: 1.8142, 45.42: 1.8139, 45.41: 1.8135, 45.4: 1.8132, 45.39: 1.8129, 45.38: 1.8125, 45.37: 1.8122, 45.36: 1.8119, 45.35: 1.8115, 45.34: 1.8112, 45.33: 1.8109, 45.32: 1.8105, 45.31: 1.8102, 45.3: 1.8099, 45.29: 1.8095, 45.28: 1.8092, 45.27: 1.8089, 45.26: 1.8085, 45.25: 1.8082, 45.24: 1.8079, 45.23: 1.8076, 45.22: 1.8072, 45.21: 1.8069, 45.2: 1.8066, 45.19: 1.8062, 45.18: 1.8059, 45.17: 1.8056, 45.16: 1.8053, 45.15: 1.8049, 45.14: 1.8046, 45.13: 1.8043, 45.12: 1.8039, 45.11: 1.8036, 45.1: 1.8033, 45.09: 1.803, 45.08: 1.8026, 45.07: 1.8023, 45.06: 1.802, 45.05: 1.8016, 45.04: 1.8013, 45.03: 1.801, 45.02: 1.8007, 45.01: 1.8003, 45.00: 1.8, 44.99: 1.7997, 44.98: 1.7993, 44.97: 1.799, 44.96: 1.7987, 44.95: 1.7984, 44.94: 1.798, 44.93: 1.7977, 44.92: 1.7974, 44.91: 1.7971, 44.9: 1.7967, 44.89: 1.7964, 44.88: 1.7961, 44.87: 1.7958, 44.86: 1.7954, 44.85: 1.7951, 44.84: 1.7948, 44.83: 1.7945, 44.82: 1.7941, 44.81: 1.7938, 44.8: 1.7935, 44.79: 1.7932, 44.78: 1.7928, 44.77: 1.7925, 44.76: 1.7922, 44.75: 1.7919, 44.74: 1.7915, 44.73: 1.7912, 44.72: 1.7909, 44.71: 1.7906, 44.7: 1.7902, 44.69: 1.7899, 44.68: 1.7896, 44.67: 1.7893, 44.66: 1.7889, 44.65: 1.7886, 44.64: 1.7883, 44.63: 1.788, 44.62: 1.7876, 44.61: 1.7873, 44.6: 1.787, 44.59: 1.7867, 44.58: 1.7864, 44.57: 1.786, 44.56: 1.7857, 44.55: 1.7854, 44.54: 1.7851, 44.53: 1.7847, 44.52: 1.7844, 44.51: 1.7841, 44.5: 1.7838, 44.49: 1.7835, 44.48: 1.7831, 44.47: 1.7828, 44.46: 1.7825, 44.45: 1.7822, 44.44: 1.7819, 44.43: 1.7815, 44.42: 1.7812, 44.41: 1.7809, 44.4: 1.7806, 44.39: 1.7803, 44.38: 1.7799, 44.37: 1.7796, 44.36: 1.7793, 44.35: 1.779, 44.34: 1.7787, 44.33: 1.7783, 44.32: 1.778, 44.31: 1.7777, 44.3: 1.7774, 44.29: 1.7771, 44.28: 1.7767, 44.27: 1.7764, 44.26: 1.7761, 44.25: 1.7758, 44.24: 1.7755, 44.23: 1.7751, 44.22: 1.7748, 44.21: 1.7745, 44.2: 1.7742, 44.19: 1.7739, 44.18: 1.7736, 44.17: 1.7732, 44.16: 1.7729, 44.15: 1.7726, 44.14: 1.7723, 44.13: 1.772, 44.12: 1.7717, 44.11: 1.7713, 44.1: 1.771, 44.09: 1.7707, 44.08: 1.7704, 44.07: 1.7701, 44.06: 1.7698, 44.05: 1.7694, 44.04: 1.7691, 44.03: 1.7688, 44.02: 1.7685, 44.01: 1.7682, 44.00: 1.7679, 43.99: 1.7675, 43.98: 1.7672, 43.97: 1.7669, 43.96: 1.7666, 43.95: 1.7663, 43.94: 1.766, 43.93: 1.7657, 43.92: 1.7653, 43.91: 1.765, 43.9: 1.7647, 43.89: 1.7644, 43.88: 1.7641, 43.87: 1.7638, 43.86: 1.7634, 43.85: 1.7631, 43.84: 1.7628, 43.83: 1.7625, 43.82: 1.7622, 43.81: 1.7619, 43.8: 1.7616, 43.79: 1.7613, 43.78: 1.7609, 43.77: 1.7606, 43.76: 1.7603, 43.75: 1.76, 43.74: 1.7597, 43.73: 1.7594, 43.72: 1.7591, 43.71: 1.7587, 43.7: 1.7584, 43.69: 1.7581, 43.68: 1.7578, 43.67: 1.7575, 43.66: 1.7572, 43.65: 1.7569, 43.64: 1.7566, 43.63: 1.7563, 43.62: 1.7559, 43.61: 1.7556, 43.6: 1.7553, 43.59: 1.755, 43.58: 1.7547, 43.57: 1.7544, 43.56: 1.7541, 43.55: 1.7538, 43.54: 1.7535, 43.53: 1.7531, 43.52: 1.7528, 43.51: 1.7525, 43.5: 1.7522, 43.49: 1.7519, 43.48: 1.7516, 43.47: 1.7513, 43.46: 1.751, 43.45: 1.7507, 43.44: 1.7504, 43.43: 1.75, 43.42: 1.7497, 43.41: 1.7494, 43.4: 1.7491, 43.39: 1.7488, 43.38: 1.7485, 43.37: 1.7482, 43.36: 1.7479, 43.35: 1.7476, 43.34: 1.7473, 43.33: 1.747, 43.32: 1.7466, 43.31: 1.7463, 43.3: 1.746, 43.29: 1.7457, 43.28: 1.7454, 43.27: 1.7451, 43.26: 1.7448, 43.25: 1.7445, 43.24: 1.7442, 43.23: 1.7439, 43.22: 1.7436, 43.21: 1.7433, 43.2: 1.743, 43.19: 1.7427, 43.18: 1.7423, 43.17: 1.742, 43.16: 1.7417, 43.15: 1.7414, 43.14: 1.7411, 43.13: 1.7408, 43.12: 1.7405, 43.11: 1.7402, 43.1: 1.7399, 43.09: 1.7396, 43.08: 1.7393, 43.07: 1.739, 43.06: 1.7387, 43.05: 1.7384, 43.04: 1.7381, 43.03: 1.7378, 43.02: 1.7375, 43.01: 1.7371, 43.00: 1.7368, 42.99: 1.7365, 42.98: 1.7362, 42.97: 1.7359, 42.96: 1.7356, 42.95: 1.7353, 42.94: 1.735, 42.93: 1.7347, 42.92: 1.7344, 42.91: 1.7341, 42.9: 1.7338, 42.89: 1.7335, 42.88: 1.7332, 42.87: 1.7329, 42.86: 1.7326, 42.85: 1.7323, 42.84: 1.732, 42.83: 1.7317, 42.82: 1.7314, 42.81: 1.7311, 42.8: 1.7308, 42.79: 1.7305, 42.78: 1.7302, 42.77: 1.7299, 42.76: 1.7296, 42.75: 1.7293, 42.74: 1.729, 42.73: 1.7287, 42.72: 1.7284, 42.71: 1.7281, 42.7: 1.7277, 42.69: 1.7274, 42.68: 1.7271, 42.67: 1.7268, 42.66: 1.7265, 42.65: 1.7262, 42.64: 1.7259, 42.63: 1.7256, 42.62: 1.7253, 42.61: 1.725, 42.6: 1.7247, 42.59: 1.7244, 42.58: 1.7241, 42.57: 1.7238, 42.56: 1.7235, 42.55: 1.7232, 42.54: 1.7229, 42.53: 1.7226, 42.52: 1.7223, 42.51: 1.722, 42.5: 1.7217, 42.49: 1.7214, 42.48: 1.7211, 42.47: 1.7208, 42.46: 1.7205, 42.45: 1.7202, 42.44: 1.7199, 42.43: 1.7196, 42.42: 1.7193, 42.41: 1.719, 42.4: 1.7188, 42.39: 1.7185, 42.38: 1.7182, 42.37: 1.7179, 42.36: 1.7176, 42.35: 1.7173, 42.34: 1.717, 42.33: 1.7167, 42.32: 1.7164, 42.31: 1.7161, 42.3: 1.7158, 42.29: 1.7155, 42.28: 1.7152, 42.27: 1.7149, 42.26: 1.7146, 42.25: 1.7143, 42.24: 1.714, 42.23: 1.7137, 42.22: 1.7134, 42.21: 1.7131, 42.2: 1.7128, 42.19: 1.7125, 42.18: 1.7122, 42.17: 1.7119, 42.16: 1.7116, 42.15: 1.7113, 42.14: 1.711, 42.13: 1.7107, 42.12: 1.7104, 42.11: 1.7101, 42.1: 1.7098, 42.09: 1.7095, 42.08: 1.7093, 42.07: 1.709, 42.06: 1.7087, 42.05: 1.7084, 42.04: 1.7081, 42.03: 1.7078, 42.02: 1.7075, 42.01: 1.7072, 42.00: 1.7069, 41.99: 1.7066, 41.98: 1.7063, 41.97: 1.706, 41.96: 1.7057, 41.95: 1.7054, 41.94: 1.7051, 41.93: 1.7048, 41.92: 1.7045, 41.91: 1.7043, 41.9: 1.704, 41.89: 1.7037, 41.88: 1.7034, 41.87: 1.7031, 41.86: 1.7028, 41.85: 1.7025, 41.84: 1.7022, 41.83: 1.7019, 41.82: 1.7016, 41.81: 1.7013, 41.8: 1.701, 41.79: 1.7007, 41.78: 1.7004, 41.77: 1.7002, 41.76: 1.6999, 41.75: 1.6996, 41.74: 1.6993, 41.73: 1.699, 41.72: 1.6987, 41.71: 1.6984, 41.7: 1.6981, 41.69: 1.6978, 41.68: 1.6975, 41.67: 1.6972, 41.66: 1.6969, 41.65: 1.6967, 41.64: 1.6964, 41.63: 1.6961, 41.62: 1.6958, 41.61: 1.6955, 41.6: 1.6952, 41.59: 1.6949, 41.58: 1.6946, 41.57: 1.6943, 41.56: 1.694, 41.55: 1.6938, 41.54: 1.6935, 41.53: 1.6932, 41.52: 1.6929, 41.51: 1.6926, 41.5: 1.6923, 41.49: 1.692, 41.48: 1.6917, 41.47: 1.6914, 41.46: 1.6912, 41.45: 1.6909, 41.44: 1.6906, 41.43: 1.6903, 41.42: 1.69, 41.41: 1.6897, 41.4: 1.6894, 41.39: 1.6891, 41.38: 1.6888, 41.37: 1.6886, 41.36: 1.6883, 41.35: 1.688, 41.34: 1.6877, 41.33: 1.6874, 41.32: 1.6871, 41.31: 1.6868, 41.3: 1.6865, 41.29: 1.6863, 41.28: 1.686, 41.27: 1.6857, 41.26: 1.6854, 41.25: 1.6851, 41.24: 1.6848, 41.23: 1.6845, 41.22: 1.6842, 41.21: 1.684, 41.2: 1.6837, 41.19: 1.6834, 41.18: 1.6831, 41.17: 1.6828, 41.16: 1.6825, 41.15: 1.6822, 41.14: 1.682, 41.13: 1.6817, 41.12: 1.6814, 41.11: 1.6811, 41.1: 1.6808, 41.09: 1.6805, 41.08: 1.6802, 41.07: 1.68, 41.06: 1.6797, 41.05: 1.6794, 41.04: 1.6791, 41.03: 1.6788, 41.02: 1.6785, 41.01: 1.6783, 41.00: 1.678, 40.99: 1.6777, 40.98: 1.6774, 40.97: 1.6771, 40.96: 1.6768, 40.95: 1.6765, 40.94: 1.6763, 40.93: 1.676, 40.92: 1.6757, 40.91: 1.6754, 40.9: 1.6751, 40.89: 1.6748, 40.88: 1.6746, 40.87: 1.6743, 40.86: 1.674, 40.85: 1.6737, 40.84: 1.6734, 40.83: 1.6731, 40.82: 1.6729, 40.81: 1.6726, 40.8: 1.6723, 40.79: 1.672, 40.78: 1.6717, 40.77: 1.6715, 40.76: 1.6712, 40.75: 1.6709, 40.74: 1.6706, 40.73: 1.6703, 40.72: 1.67, 40.71: 1.6698, 40.7: 1.6695, 40.69: 1.6692, 40.68: 1.6689, 40.67: 1.6686, 40.66: 1.6684, 40.65: 1.6681, 40.64: 1.6678, 40.63: 1.6675, 40.62: 1.6672, 40.61: 1.6669, 40.6: 1.6667, 40.59: 1.6664, 40.58: 1.6661, 40.57: 1.6658, 40.56: 1.6655, 40.55: 1.6653, 40.54: 1.665, 40.53: 1.6647, 40.52: 1.6644, 40.51: 1.6641, 40.5: 1.6639, 40.49: 1.6636, 40.48: 1.6633, 40.47: 1.663, 40.46: 1.6627, 40.45: 1.6625, 40.44: 1.6622, 40.43: 1.6619, 40.42: 1.6616, 40.41: 1.6614, 40.4: 1.6611, 40.39: 1.6608, 40.38: 1.6605, 40.37: 1.6602, 40.36: 1.66, 40.35: 1.6597, 40.34: 1.6594, 40.33: 1.6591, 40.32: 1.6588, 40.31: 1.6586, 40.3: 1.6583, 40.29: 1.658, 40.28: 1.6577, 40.27: 1.6575, 40.26: 1.6572, 40.25: 1.6569, 40.24: 1.6566, 40.23: 1.6563, 40.22: 1.6561, 40.21: 1.6558, 40.2: 1.6555, 40.19: 1.6552, 40.18: 1.655, 40.17: 1.6547, 40.16: 1.6544, 40.15: 1.6541, 40.14: 1.6539, 40.13: 1.6536, 40.12: 1.6533, 40.11: 1.653, 40.1: 1.6528, 40.09: 1.6525, 40.08: 1.6522, 40.07: 1.6519, 40.06: 1.6517, 40.05: 1.6514, 40.04: 1.6511, 40.03: 1.6508, 40.02: 1.6506, 40.01: 1.6503, 40.00: 1.65, 39.99: 1.6497, 39.98: 1.6495, 39.97: 1.6492, 39.96: 1.6489, 39.95: 1.6486, 39.94: 1.6484, 39.93: 1.6481, 39.92: 1.6478, 39.91: 1.6475, 39.9: 1.6473, 39.89: 1.647, 39.88: 1.6467, 39.87: 1.6464, 39.86: 1.6462, 39.85: 1.6459, 39.84: 1.6456, 39.83: 1.6453, 39.82: 1.6451, 39.81: 1.6448, 39.8: 1.6445, 39.79: 1.6442, 39.78: 1.644, 39.77: 1.6437, 39.76: 1.6434, 39.75: 1.6432, 39.74: 1.6429, 39.73: 1.6426, 39.72: 1.6423, 39.71: 1.6421, 39.7: 1.6418, 39.69: 1.6415, 39.68: 1.6412, 39.67: 1.641, 39.66: 1.6407, 39.65: 1.6404, 39.64: 1.6402, 39.63: 1.6399, 39.62: 1.6396, 39.61: 1.6393, 39.6: 1.6391, 39.59: 1.6388, 39.58: 1.6385, 39.57: 1.6383, 39.56: 1.638, 39.55: 1.6377, 39.54: 1.6374, 39.53: 1.6372, 39.52: 1.6369, 39.51: 1.6366, 39.5: 1.6364, 39.49: 1.6361, 39.48: 1.6358, 39.47: 1.6356, 39.46: 1.6353, 39.45: 1.635, 39.44: 1.6347, 39.43: 1.6345, 39.42: 1.6342, 39.41: 1.6339, 39.4: 1.6337, 39.39: 1.6334, 39.38: 1.6331, 39.37: 1.6329, 39.36: 1.6326, 39.35: 1.6323, 39.34: 1.632, 39.33: 1.6318, 39.32: 1.6315, 39.31: 1.6312, 39.3: 1.631, 39.29: 1.6307, 39.28: 1.6304, 39.27: 1.6302, 39.26: 1.6299, 39.25: 1.6296, 39.24: 1.6294, 39.23: 1.6291, 39.22: 1.6288, 39.21: 1.6286, 39.2: 1.6283, 39.19: 1.628, 39.18: 1.6278, 39.17: 1.6275, 39.16: 1.6272, 39.15: 1.627, 39.14: 1.6267, 39.13: 1.6264, 39.12: 1.6261, 39.11: 1.6259, 39.1: 1.6256, 39.09: 1.6253, 39.08: 1.6251, 39.07: 1.6248, 39.06: 1.6245, 39.05: 1.6243, 39.04: 1.624, 39.03: 1.6237, 39.02: 1.6235, 39.01: 1.6232, 39.00: 1.623, 38.99: 1.6227, 38.98: 1.6224, 38.97: 1.6222, 38.96: 1.6219, 38.95: 1.6216, 38.94: 1.6214, 38.93: 1.6211, 38.92: 1.6208, 38.91: 1.6206, 38.9: 1.6203, 38.89: 1.62, 38.88: 1.6198, 38.87: 1.6195, 38.86: 1.6192, 38.85: 1.619, 38.84: 1.6187, 38.83: 1.6184, 38.82: 1.6182, 38.81: 1.6179, 38.8: 1.6176, 38.79: 1.6174, 38.78: 1.6171, 38.77: 1.6169, 38.76: 1.6166, 38.75: 1.6163, 38.74: 1.6161, 38.73: 1.6158, 38.72: 1.6155, 38.71: 1.6153, 38.7: 1.615, 38.69: 1.6147, 38.68: 1.6145, 38.67: 1.6142, 38.66: 1.614, 38.65: 1.6137, 38.64: 1.6134, 38.63: 1.6132, 38.62: 1.6129, 38.61: 1.6126, 38.6: 1.6124, 38.59: 1.6121, 38.58: 1.6119, 38.57: 1.6116, 38.56: 1.6113, 38.55: 1.6111, 38.54: 1.6108, 38.53: 1.6105, 38.52: 1.6103, 38.51: 1.61, 38.5: 1.6098, 38.49: 1.6095, 38.48: 1.6092, 38.47: 1.609, 38.46: 1.6087, 38.45: 1.6084, 38.44: 1.6082, 38.43: 1.6079, 38.42: 1.6077, 38.41: 1.6074, 38.4: 1.6071, 38.39: 1.6069, 38.38: 1.6066, 38.37: 1.6064, 38.36: 1.6061, 38.35: 1.6058, 38.34: 1.6056, 38.33: 1.6053, 38.32: 1.6051, 38.31: 1.6048, 38.3: 1.6045, 38.29: 1.6043, 38.28: 1.604, 38.27: 1.6038, 38.26: 1.6035, 38.25: 1.6032, 38.24: 1.603, 38.23: 1.6027, 38.22: 1.6025, 38.21: 1.6022, 38.2: 1.6019, 38.19: 1.6017, 38.18: 1.6014, 38.17: 1.6012, 38.16: 1.6009, 38.15: 1.6006, 38.14: 1.6004, 38.13: 1.6001, 38.12: 1.5999, 38.11: 1.5996, 38.1: 1.5994, 38.09: 1.5991, 38.08: 1.5988, 38.07: 1.5986, 38.06: 1.5983, 38.05: 1.5981, 38.04: 1.5978, 38.03: 1.5975, 38.02: 1.5973, 38.01: 1.597, 38.00: 1.5968, 37.99: 1.5965, 37.98: 1.5963, 37.97: 1.596, 37.96: 1.5957, 37.95: 1.5955, 37.94: 1.5952, 37.93: 1.595, 37.92: 1.5947, 37.91: 1.5945, 37.9: 1.5942, 37.89: 1.5939, 37.88: 1.5937, 37.87: 1.5934, 37.86: 1.5932, 37.85: 1.5929, 37.84: 1.5927, 37.83: 1.5924, 37.82: 1.5922, 37.81: 1.5919, 37.8: 1.5916, 37.79: 1.5914, 37.78: 1.5911, 37.77: 1.5909, 37.76: 1.5906, 37.75: 1.5904, 37.74: 1.5901, 37.73: 1.5899, 37.72: 1.5896, 37.71: 1.5893, 37.7: 1.5891, 37.69: 1.5888, 37.68: 1.5886, 37.67: 1.5883, 37.66: 1.5881, 37.65: 1.5878, 37.64: 1.5876, 37.63: 1.5873, 37.62: 1.587, 37.61: 1.5868, 37.6: 1.5865, 37.59: 1.5863, 37.58: 1.586, 37.57: 1.5858, 37.56: 1.5855, 37.55: 1.5853, 37.54: 1.585, 37.53: 1.5848, 37.52: 1.5845, 37.51: 1.5843, 37.5: 1.584, 37.49: 1.5837, 37.48: 1.5835, 37.47: 1.5832, 37.46: 1.583, 37.45: 1.5827, 37.44: 1.5825, 37.43: 1.5822, 37.42: 1.582, 37.41: 1.5817, 37.4: 1.5815, 37.39: 1.5812, 37.38: 1.581, 37.37: 1.5807, 37.36: 1.5805, 37.35: 1.5802, 37.34: 1.58, 37.33: 1.5797, 37.32: 1.5795, 37.31: 1.5792, 37.3: 1.5789, 37.29: 1.5787, 37.28: 1.5784, 37.27: 1.5782, 37.26: 1.5779, 37.25: 1.5777, 37.24: 1.5774, 37.23: 1.5772, 37.22: 1.5769, 37.21: 1.5767, 37.2: 1.5764, 37.19: 1.5762, 37.18: 1.5759, 37.17: 1.5757, 37.16: 1.5754, 37.15: 1.5752, 37.14: 1.5749, 37.13: 1.5747, 37.12: 1.5744, 37.11: 1.5742, 37.1: 1.5739, 37.09: 1.5737, 37.08: 1.5734, 37.07: 1.5732, 37.06: 1.5729, 37.05: 1.5727, 37.04: 1.5724, 37.03: 1.5722, 37.02: 1.5719, 37.01: 1.5717, 37.00: 1.5714, 36.99: 1.5712, 36.98: 1.5709, 36.97: 1.5707, 36.96: 1.5704, 36.95: 1.5702, 36.94: 1.5699, 36.93: 1.5697, 36.92: 1.5694, 36.91: 1.5692, 36.9: 1.5689, 36.89: 1.5687, 36.88: 1.5684, 36.87: 1.5682, 36.86: 1.5679, 36.85: 1.5677, 36.84: 1.5674, 36.83: 1.5672, 36.82: 1.567, 36.81: 1.5667, 36.8: 1.5665, 36.79: 1.5662, 36.78: 1.566, 36.77: 1.5657, 36.76: 1.5655, 36.75: 1.5652, 36.74: 1.565, 36.73: 1.5647, 36.72: 1.5645, 36.71: 1.5642, 36.7: 1.564, 36.69: 1.5637, 36.68: 1.5635, 36.67: 1.5632, 36.66: 1.563, 36.65: 1.5627, 36.64: 1.5625, 36.63: 1.5623, 36.62: 1.562, 36.61: 1.5618, 36.6: 1.5615, 36.59: 1.5613, 36.58: 1.561, 36.57: 1.5608, 36.56: 1.5605, 36.55: 1.5603, 36.54: 1.56, 36.53: 1.5598, 36.52: 1.5595, 36.51: 1.5593, 36.5: 1.5591, 36.49: 1.5588, 36.48: 1.5586, 36.47: 1.5583, 36.46: 1.5581, 36.45: 1.5578, 36.44: 1.5576, 36.43: 1.5573, 36.42: 1.5571, 36.41: 1.5568, 36.4: 1.5566, 36.39: 1.5564, 36.38: 1.5561, 36.37: 1.5559, 36.36: 1.5556, 36.35: 1.5554, 36.34: 1.5551, 36.33: 1.5549, 36.32: 1.5546, 36.31: 1.5544, 36.3: 1.5542, 36.29: 1.5539, 36.28: 1.5537, 36.27: 1.5534, 36.26: 1.5532, 36.25: 1.5529, 36.24: 1.5527, 36.23: 1.5525, 36.22: 1.5522, 36.21: 1.552, 36.2: 1.5517, 36.19: 1.5515, 36.18: 1.5512, 36.17: 1.551, 36.16: 1.5508, 36.15: 1.5505, 36.14: 1.5503, 36.13: 1.55, 36.12: 1.5498, 36.11: 1.5495, 36.1: 1.5493, 36.09: 1.5491, 36.08: 1.5488, 36.07: 1.5486, 36.06: 1.5483, 36.05: 1.5481, 36.04: 1.5478, 36.03: 1.5476, 36.02: 1.5474, 36.01: 1.5471, 36.00: 1.5469, 35.99: 1.5466, 35.98: 1.5464, 35.97: 1.5462, 35.96: 1.5459, 35.95: 1.5457, 35.94: 1.5454, 35.93: 1.5452, 35.92: 1.5449, 35.91: 1.5447, 35.9: 1.5445, 35.89: 1.5442, 35.88: 1.544, 35.87: 1.5437, 35.86: 1.5435, 35.85: 1.5433, 35.84: 1.543, 35.83: 1.5428, 35.82: 1.5425, 35.81: 1.5423, 35.8: 1.5421, 35.79: 1.5418, 35.78: 1.5416, 35.77: 1.5413, 35.76: 1.5411, 35.75: 1.5409, 35.74: 1.5406, 35.73: 1.5404, 35.72: 1.5401, 35.71: 1.5399, 35.7: 1.5397, 35.69: 1.5394, 35.68: 1.5392, 35.67: 1.5389, 35.66: 1.5387, 35.65: 1.5385, 35.64: 1.5382, 35.63: 1.538, 35.62: 1.5377, 35.61: 1.5375, 35.6: 1.5373, 35.59: 1.537, 35.58: 1.5368, 35.57: 1.5366, 35.56: 1.5363, 35.55: 1.5361, 35.54: 1.5358, 35.53: 1.5356, 35.52: 1.5354, 35.51: 1.5351, 35.5: 1.5349, 35.49: 1.5346, 35.48: 1.5344, 35.47: 1.5342, 35.46: 1.5339, 35.45: 1.5337, 35.44: 1.5335, 35.43: 1.5332, 35.42: 1.533, 35.41: 1.5327, 35.4: 1.5325, 35.39: 1.5323, 35.38: 1.532, 35.37: 1.5318, 35.36: 1.5316, 35.35: 1.5313, 35.34: 1.5311, 35.33: 1.5308, 35.32: 1.5306, 35.31: 1.5304, 35.3: 1.5301, 35.29: 1.5299, 35.28: 1.5297, 35.27: 1.5294, 35.26: 1.5292, 35.25: 1.529, 35.24: 1.5287, 35.23: 1.5285, 35.22: 1.5282, 35.21: 1.528, 35.2: 1.5278, 35.19: 1.5275, 35.18: 1.5273, 35.17: 1.5271, 35.16: 1.5268, 35.15: 1.5266, 35.14: 1.5264, 35.13: 1.5261, 35.12: 1.5259, 35.11: 1.5257, 35.1: 1.5254, 35.09: 1.5252, 35.08: 1.525, 35.07: 1.5247, 35.06: 1.5245, 35.05: 1.5242, 35.04: 1.524, 35.03: 1.5238, 35.02: 1.5235, 35.01: 1.5233, 35.00: 1.5231, 34.99: 1.5228, 34.98: 1.5226, 34.97: 1.5224, 34.96: 1.5221, 34.95: 1.5219, 34.94: 1.5217, 34.93: 1.5214, 34.92: 1.5212, 34.91: 1.521, 34.9: 1.5207, 34.89: 1.5205, 34.88: 1.5203, 34.87: 1.52, 34.86: 1.5198, 34.85: 1.5196, 34.84: 1.5193, 34.83: 1.5191, 34.82: 1.5189, 34.81: 1.5186, 34.8: 1.5184, 34.79: 1.5182, 34.78: 1.5179, 34.77: 1.5177, 34.76: 1.5175, 34.75: 1.5172, 34.74: 1.517, 34.73: 1.5168, 34.72: 1.5165, 34.71: 1.5163, 34.7: 1.5161, 34.69: 1.5158, 34.68: 1.5156, 34.67: 1.5154, 34.66: 1.5152, 34.65: 1.5149, 34.64: 1.5147, 34.63: 1.5145, 34.62: 1.5142, 34.61: 1.514, 34.6: 1.5138, 34.59: 1.5135, 34.58: 1.5133, 34.57: 1.5131, 34.56: 1.5128, 34.55: 1.5126, 34.54: 1.5124, 34.53: 1.5121, 34.52: 1.5119, 34.51: 1.5117, 34.5: 1.5115, 34.49: 1.5112, 34.48: 1.511, 34.47: 1.5108, 34.46: 1.5105, 34.45: 1.5103, 34.44: 1.5101, 34.43: 1.5098, 34.42: 1.5096, 34.41: 1.5094, 34.4: 1.5091, 34.39: 1.5089, 34.38: 1.5087, 34.37: 1.5085, 34.36: 1.5082, 34.35: 1.508, 34.34: 1.5078, 34.33: 1.5075, 34.32: 1.5073, 34.31: 1.5071, 34.3: 1.5068, 34.29: 1.5066, 34.28: 1.5064, 34.27: 1.5062, 34.26: 1.5059, 34.25: 1.5057, 34.24: 1.5055, 34.23: 1.5052, 34.22: 1.505, 34.21: 1.5048, 34.2: 1.5046, 34.19: 1.5043, 34.18: 1.5041, 34.17: 1.5039, 34.16: 1.5036, 34.15: 1.5034, 34.14: 1.5032, 34.13: 1.503, 34.12: 1.5027, 34.11: 1.5025, 34.1: 1.5023, 34.09: 1.502, 34.08: 1.5018, 34.07: 1.5016, 34.06: 1.5014, 34.05: 1.5011, 34.04: 1.5009, 34.03: 1.5007, 34.02: 1.5005, 34.01: 1.5002, 34.00: 1.5, 33.99: 1.4998, 33.98: 1.4995, 33.97: 1.4993, 33.96: 1.4991, 33.95: 1.4989, 33.94: 1.4986, 33.93: 1.4984, 33.92: 1.4982, 33.91: 1.498, 33.9: 1.4977, 33.89: 1.4975, 33.88: 1.4973, 33.87: 1.4971, 33.86: 1.4968, 33.85: 1.4966, 33.84: 1.4964, 33.83: 1.4961, 33.82: 1.4959, 33.81: 1.4957, 33.8: 1.4955, 33.79: 1.4952, 33.78: 1.495, 33.77: 1.4948, 33.76: 1.4946, 33.75: 1.4943, 33.74: 1.4941, 33.73: 1.4939, 33.72: 1.4937, 33.71: 1.4934, 33.7: 1.4932, 33.69: 1.493, 33.68: 1.4928, 33.67: 1.4925, 33.66: 1.4923, 33.65: 1.4921, 33.64: 1.4919, 33.63: 1.4916, 33.62: 1.4914, 33.61: 1.4912, 33.6: 1.491, 33.59: 1.4907, 33.58: 1.4905, 33.57: 1.4903, 33.56: 1.4901, 33.55: 1.4898, 33.54: 1.4896, 33.53: 1.4894, 33.52: 1.4892, 33.51: 1.4889, 33.5: 1.4887, 33.49: 1.4885, 33.48: 1.4883, 33.47: 1.4881, 33.46: 1.4878, 33.45: 1.4876, 33.44: 1.4874, 33.43: 1.4872, 33.42: 1.4869, 33.41: 1.4867, 33.4: 1.4865, 33.39: 1.4863, 33.38: 1.486, 33.37: 1.4858, 33.36: 1.4856, 33.35: 1.4854, 33.34: 1.4851, 33.33: 1.4849, 33.32: 1.4847, 33.31: 1.4845, 33.3: 1.4843, 33.29: 1.484, 33.28: 1.4838, 33.27: 1.4836, 33.26: 1.4834, 33.25: 1.4831, 33.24: 1.4829, 33.23: 1.4827, 33.22: 1.4825, 33.21: 1.4823, 33.2: 1.482, 33.19: 1.4818, 33.18: 1.4816, 33.17: 1.4814, 33.16: 1.4811, 33.15: 1.4809, 33.14: 1.4807, 33.13: 1.4805, 33.12: 1.4803, 33.11: 1.48, 33.1: 1.4798, 33.09: 1.4796, 33.08: 1.4794, 33.07: 1.4792, 33.06: 1.4789, 33.05: 1.4787, 33.04: 1.4785, 33.03: 1.4783, 33.02: 1.4781, 33.01: 1.4778, 33.00: 1.4776, 32.99: 1.4774, 32.98: 1.4772, 32.97: 1.477, 32.96: 1.4767, 32.95: 1.4765, 32.94: 1.4763, 32.93: 1.4761, 32.92: 1.4758, 32.91: 1.4756, 32.9: 1.4754, 32.89: 1.4752, 32.88: 1.475, 32.87: 1.4748, 32.86: 1.4745, 32.85: 1.4743, 32.84: 1.4741, 32.83: 1.4739, 32.82: 1.4737, 32.81: 1.4734, 32.8: 1.4732, 32.79: 1.473, 32.78: 1.4728, 32.77: 1.4726, 32.76: 1.4723, 32.75: 1.4721, 32.74: 1.4719, 32.73: 1.4717, 32.72: 1.4715, 32.71: 1.4712, 32.7: 1.471, 32.69: 1.4708, 32.68: 1.4706, 32.67: 1.4704, 32.66: 1.4702, 32.65: 1.4699, 32.64: 1.4697, 32.63: 1.4695, 32.62: 1.4693, 32.61: 1.4691, 32.6: 1.4688, 32.59: 1.4686, 32.58: 1.4684, 32.57: 1.4682, 32.56: 1.468, 32.55: 1.4678, 32.54: 1.4675, 32.53: 1.4673, 32.52: 1.4671, 32.51: 1.4669, 32.5: 1.4667, 32.49: 1.4664, 32.48: 1.4662, 32.47: 1.466, 32.46: 1.4658, 32.45: 1.4656, 32.44: 1.4654, 32.43: 1.4651, 32.42: 1.4649, 32.41: 1.4647, 32.4: 1.4645, 32.39: 1.4643, 32.38: 1.4641, 32.37: 1.4638, 32.36: 1.4636, 32.35: 1.4634, 32.34: 1.4632, 32.33: 1.463, 32.32: 1.4628, 32.31: 1.4625, 32.3: 1.4623, 32.29: 1.4621, 32.28: 1.4619, 32.27: 1.4617, 32.26: 1.4615, 32.25: 1.4613, 32.24: 1.461, 32.23: 1.4608, 32.22: 1.4606, 32.21: 1.4604, 32.2: 1.4602, 32.19: 1.46, 32.18: 1.4597, 32.17: 1.4595, 32.16: 1.4593, 32.15: 1.4591, 32.14: 1.4589, 32.13: 1.4587, 32.12: 1.4585, 32.11: 1.4582, 32.1: 1.458, 32.09: 1.4578, 32.08: 1.4576, 32.07: 1.4574, 32.06: 1.4572, 32.05: 1.457, 32.04: 1.4567, 32.03: 1.4565, 32.02: 1.4563, 32.01: 1.4561, 32.00: 1.4559, 31.99: 1.4557, 31.98: 1.4555, 31.97: 1.4552, 31.96: 1.455, 31.95: 1.4548, 31.94: 1.4546, 31.93: 1.4544, 31.92: 1.4542, 31.91: 1.454, 31.9: 1.4537, 31.89: 1.4535, 31.88: 1.4533, 31.87: 1.4531, 31.86: 1.4529, 31.85: 1.4527, 31.84: 1.4525, 31.83: 1.4523, 31.82: 1.452, 31.81: 1.4518, 31.8: 1.4516, 31.79: 1.4514, 31.78: 1.4512, 31.77: 1.451, 31.76: 1.4508, 31.75: 1.4505, 31.74: 1.4503, 31.73: 1.4501, 31.72: 1.4499, 31.71: 1.4497, 31.7: 1.4495, 31.69: 1.4493, 31.68: 1.4491, 31.67: 1.4489, 31.66: 1.4486, 31.65: 1.4484, 31.64: 1.4482, 31.63: 1.448, 31.62: 1.4478, 31.61: 1.4476, 31.6: 1.4474, 31.59: 1.4472, 31.58: 1.4469, 31.57: 1.4467, 31.56: 1.4465, 31.55: 1.4463, 31.54: 1.4461, 31.53: 1.4459, 31.52: 1.4457, 31.51: 1.4455, 31.5: 1.4453, 31.49: 1.445, 31.48: 1.4448, 31.47: 1.4446, 31.46: 1.4444, 31.45: 1.4442, 31.44: 1.444, 31.43: 1.4438, 31.42: 1.4436, 31.41: 1.4434, 31.4: 1.4431, 31.39: 1.4429, 31.38: 1.4427, 31.37: 1.4425, 31.36: 1.4423, 31.35: 1.4421, 31.34: 1.4419, 31.33: 1.4417, 31.32: 1.4415, 31.31: 1.4413, 31.3: 1.441, 31.29: 1.4408, 31.28: 1.4406, 31.27: 1.4404, 31.26: 1.4402, 31.25: 1.44, 31.24: 1.4398, 31.23: 1.4396, 31.22: 1.4394, 31.21: 1.4392, 31.2: 1.439, 31.19: 1.4387, 31.18: 1.4385, 31.17: 1.4383, 31.16: 1.4381, 31.15: 1.4379, 31.14: 1.4377, 31.13: 1.4375, 31.12: 1.4373, 31.11: 1.4371, 31.1: 1.4369, 31.09: 1.4367, 31.08: 1.4364, 31.07: 1.4362, 31.06: 1.436, 31.05: 1.4358, 31.04: 1.4356, 31.03: 1.4354, 31.02: 1.4352, 31.01: 1.435, 31.00: 1.4348, 30.99: 1.4346, 30.98: 1.4344, 30.97: 1.4342, 30.96: 1.434, 30.95: 1.4337, 30.94: 1.4335, 30.93: 1.4333, 30.92: 1.4331, 30.91: 1.4329, 30.9: 1.4327, 30.89: 1.4325, 30.88: 1.4323, 30.87: 1.4321, 30.86: 1.4319, 30.85: 1.4317, 30.84: 1.4315, 30.83: 1.4313, 30.82: 1.431, 30.81: 1.4308, 30.8: 1.4306, 30.79: 1.4304, 30.78: 1.4302, 30.77: 1.43, 30.76: 1.4298, 30.75: 1.4296, 30.74: 1.4294, 30.73: 1.4292, 30.72: 1.429, 30.71: 1.4288, 30.7: 1.4286, 30.69: 1.4284, 30.68: 1.4282, 30.67: 1.428, 30.66: 1.4277, 30.65: 1.4275, 30.64: 1.4273, 30.63: 1.4271, 30.62: 1.4269, 30.61: 1.4267, 30.6: 1.4265, 30.59: 1.4263, 30.58: 1.4261, 30.57: 1.4259, 30.56: 1.4257, 30.55: 1.4255, 30.54: 1.4253, 30.53: 1.4251, 30.52: 1.4249, 30.51: 1.4247, 30.5: 1.4245, 30.49: 1.4243, 30.48: 1.4241, 30.47: 1.4238, 30.46: 1.4236, 30.45: 1.4234, 30.44: 1.4232, 30.43: 1.423, 30.42: 1.4228, 30.41: 1.4226, 30.4: 1.4224, 30.39: 1.4222, 30.38: 1.422, 30.37: 1.4218, 30.36: 1.4216, 30.35: 1.4214, 30.34: 1.4212, 30.33: 1.421, 30.32: 1.4208, 30.31: 1.4206, 30.3: 1.4204, 30.29: 1.4202, 30.28: 1.42, 30.27: 1.4198, 30.26: 1.4196, 30.25: 1.4194, 30.24: 1.4192, 30.23: 1.4189, 30.22: 1.4187, 30.21: 1.4185, 30.2: 1.4183, 30.19: 1.4181, 30.18: 1.4179, 30.17: 1.4177, 30.16: 1.4175, 30.15: 1.4173, 30.14: 1.4171, 30.13: 1.4169, 30.12: 1.4167, 30.11: 1.4165, 30.1: 1.4163, 30.09: 1.4161, 30.08: 1.4159, 30.07: 1.4157, 30.06: 1.4155, 30.05: 1.4153, 30.04: 1.4151, 30.03: 1.4149, 30.02: 1.4147, 30.01: 1.4145, 30.00: 1.4143, 29.99: 1.4141, 29.98: 1.4139, 29.97: 1.4137, 29.96: 1.4135, 29.95: 1.4133, 29.94: 1.4131, 29.93: 1.4129, 29.92: 1.4127, 29.91: 1.4125, 29.9: 1.4123, 29.89: 1.4121, 29.88: 1.4119, 29.87: 1.4117, 29.86: 1.4115, 29.85: 1.4113, 29.84: 1.4111, 29.83: 1.4109, 29.82: 1.4107, 29.81: 1.4105, 29.8: 1.4103, 29.79: 1.4101, 29.78: 1.4099, 29.77: 1.4097, 29.76: 1.4095, 29.75: 1.4093, 29.74: 1.4091, 29.73: 1.4089, 29.72: 1.4087, 29.71: 1.4085, 29.7: 1.4083, 29.69: 1.4081, 29.68: 1.4078, 29.67: 1.4076, 29.66: 1.4074, 29.65: 1.4072, 29.64: 1.407, 29.63: 1.4068, 29.62: 1.4066, 29.61: 1.4064, 29.6: 1.4062, 29.59: 1.4061, 29.58: 1.4059, 29.57: 1.4057, 29.56: 1.4055, 29.55: 1.4053, 29.54: 1.4051, 29.53: 1.4049, 29.52: 1.4047, 29.51: 1.4045, 29.5: 1.4043, 29.49: 1.4041, 29.48: 1.4039, 29.47: 1.4037, 29.46: 1.4035, 29.45: 1.4033, 29.44: 1.4031, 29.43: 1.4029, 29.42: 1.4027, 29.41: 1.4025, 29.4: 1.4023, 29.39: 1.4021, 29.38: 1.4019, 29.37: 1.4017, 29.36: 1.4015, 29.35: 1.4013, 29.34: 1.4011, 29.33: 1.4009, 29.32: 1.4007, 29.31: 1.4005, 29.3: 1.4003, 29.29: 1.4001, 29.28: 1.3999, 29.27: 1.3997, 29.26: 1.3995, 29.25: 1.3993, 29.24: 1.3991, 29.23: 1.3989, 29.22: 1.3987, 29.21: 1.3985, 29.2: 1.3983, 29.19: 1.3981, 29.18: 1.3979, 29.17: 1.3977, 29.16: 1.3975, 29.15: 1.3973, 29.14: 1.3971, 29.13: 1.3969, 29.12: 1.3967, 29.11: 1.3965, 29.1: 1.3963, 29.09: 1.3961, 29.08: 1.3959, 29.07: 1.3957, 29.06: 1.3955, 29.05: 1.3953, 29.04: 1.3952, 29.03: 1.395, 29.02: 1.3948, 29.01: 1.3946, 29.00: 1.3944, 28.99: 1.3942, 28.98: 1.394, 28.97: 1.3938, 28.96: 1.3936, 28.95: 1.3934, 28.94: 1.3932, 28.93: 1.393, 28.92: 1.3928, 28.91: 1.3926, 28.9: 1.3924, 28.89: 1.3922, 28.88: 1.392, 28.87: 1.3918, 28.86: 1.3916, 28.85: 1.3914, 28.84: 1.3912, 28.83: 1.391, 28.82: 1.3908, 28.81: 1.3906, 28.8: 1.3904, 28.79: 1.3903, 28.78: 1.3901, 28.77: 1.3899, 28.76: 1.3897, 28.75: 1.3895, 28.74: 1.3893, 28.73: 1.3891, 28.72: 1.3889, 28.71: 1.3887, 28.7: 1.3885, 28.69: 1.3883, 28.68: 1.3881, 28.67: 1.3879, 28.66: 1.3877, 28.65: 1.3875, 28.64: 1.3873, 28.63: 1.3871, 28.62: 1.3869, 28.61: 1.3867, 28.6: 1.3866, 28.59: 1.3864, 28.58: 1.3862, 28.57: 1.386, 28.56: 1.3858, 28.55: 1.3856, 28.54: 1.3854, 28.53: 1.3852, 28.52: 1.385, 28.51: 1.3848, 28.5: 1.3846, 28.49: 1.3844, 28.48: 1.3842, 28.47: 1.384, 28.46: 1.3838, 28.45: 1.3836, 28.44: 1.3835, 28.43: 1.3833, 28.42: 1.3831, 28.41: 1.3829, 28.4: 1.3827, 28.39: 1.3825, 28.38: 1.3823, 28.37: 1.3821, 28.36: 1.3819, 28.35: 1.3817, 28.34: 1.3815, 28.33: 1.3813, 28.32: 1.3811, 28.31: 1.3809, 28.3: 1.3808, 28.29: 1.3806, 28.28: 1.3804, 28.27: 1.3802, 28.26: 1.38, 28.25: 1.3798, 28.24: 1.3796, 28.23: 1.3794, 28.22: 1.3792, 28.21: 1.379, 28.2: 1.3788, 28.19: 1.3786, 28.18: 1.3784, 28.17: 1.3783, 28.16: 1.3781, 28.15: 1.3779, 28.14: 1.3777, 28.13: 1.3775, 28.12: 1.3773, 28.11: 1.3771, 28.1: 1.3769, 28.09: 1.3767, 28.08: 1.3765, 28.07: 1.3763, 28.06: 1.3761, 28.05: 1.376, 28.04: 1.3758, 28.03: 1.3756, 28.02: 1.3754, 28.01: 1.3752, 28.00: 1.375, 27.99: 1.3748, 27.98: 1.3746, 27.97: 1.3744, 27.96: 1.3742, 27.95: 1.374, 27.94: 1.3739, 27.93: 1.3737, 27.92: 1.3735, 27.91: 1.3733, 27.9: 1.3731, 27.89: 1.3729, 27.88: 1.3727, 27.87: 1.3725, 27.86: 1.3723, 27.85: 1.3721, 27.84: 1.372, 27.83: 1.3718, 27.82: 1.3716, 27.81: 1.3714, 27.8: 1.3712, 27.79: 1.371, 27.78: 1.3708, 27.77: 1.3706, 27.76: 1.3704, 27.75: 1.3702, 27.74: 1.3701, 27.73: 1.3699, 27.72: 1.3697, 27.71: 1.3695, 27.7: 1.3693, 27.69: 1.3691, 27.68: 1.3689, 27.67: 1.3687, 27.66: 1.3685, 27.65: 1.3683, 27.64: 1.3682, 27.63: 1.368, 27.62: 1.3678, 27.61: 1.3676, 27.6: 1.3674, 27.59: 1.3672, 27.58: 1.367, 27.57: 1.3668, 27.56: 1.3666, 27.55: 1.3665, 27.54: 1.3663, 27.53: 1.3661, 27.52: 1.3659, 27.51: 1.3657, 27.5: 1.3655, 27.49: 1.3653, 27.48: 1.3651, 27.47: 1.365, 27.46: 1.3648, 27.45: 1.3646, 27.44: 1.3644, 27.43: 1.3642, 27.42: 1.364, 27.41: 1.3638, 27.4: 1.3636, 27.39: 1.3634, 27.38: 1.3633, 27.37: 1.3631, 27.36: 1.3629, 27.35: 1.3627, 27.34: 1.3625, 27.33: 1.3623, 27.32: 1.3621, 27.31: 1.3619, 27.3: 1.3618, 27.29: 1.3616, 27.28: 1.3614, 27.27: 1.3612, 27.26: 1.361, 27.25: 1.3608, 27.24: 1.3606, 27.23: 1.3605, 27.22: 1.3603, 27.21: 1.3601, 27.2: 1.3599, 27.19: 1.3597, 27.18: 1.3595, 27.17: 1.3593, 27.16: 1.3591, 27.15: 1.359, 27.14: 1.3588, 27.13: 1.3586, 27.12: 1.3584, 27.11: 1.3582, 27.1: 1.358, 27.09: 1.3578, 27.08: 1.3577, 27.07: 1.3575, 27.06: 1.3573, 27.05: 1.3571, 27.04: 1.3569, 27.03: 1.3567, 27.02: 1.3565, 27.01: 1.3564, 27.00: 1.3562, 26.99: 1.356, 26.98: 1.3558, 26.97: 1.3556, 26.96: 1.3554, 26.95: 1.3552, 26.94: 1.3551, 26.93: 1.3549, 26.92: 1.3547, 26.91: 1.3545, 26.9: 1.3543, 26.89: 1.3541, 26.88: 1.3539, 26.87: 1.3538, 26.86: 1.3536, 26.85: 1.3534, 26.84: 1.3532, 26.83: 1.353, 26.82: 1.3528, 26.81: 1.3526, 26.8: 1.3525, 26.79: 1.3523, 26.78: 1.3521, 26.77: 1.3519, 26.76: 1.3517, 26.75: 1.3515, 26.74: 1.3514, 26.73: 1.3512, 26.72: 1.351, 26.71: 1.3508, 26.7: 1.3506, 26.69: 1.3504, 26.68: 1.3502, 26.67: 1.3501, 26.66: 1.3499, 26.65: 1.3497, 26.64: 1.3495, 26.63: 1.3493, 26.62: 1.3491, 26.61: 1.349, 26.6: 1.3488, 26.59: 1.3486, 26.58: 1.3484, 26.57: 1.3482, 26.56: 1.348, 26.55: 1.3479, 26.54: 1.3477, 26.53: 1.3475, 26.52: 1.3473, 26.51: 1.3471, 26.5: 1.3469, 26.49: 1.3468, 26.48: 1.3466, 26.47: 1.3464, 26.46: 1.3462, 26.45: 1.346, 26.44: 1.3458, 26.43: 1.3457, 26.42: 1.3455, 26.41: 1.3453, 26.4: 1.3451, 26.39: 1.3449, 26.38: 1.3447, 26.37: 1.3446, 26.36: 1.3444, 26.35: 1.3442, 26.34: 1.344, 26.33: 1.3438, 26.32: 1.3436, 26.31: 1.3435, 26.3: 1.3433, 26.29: 1.3431, 26.28: 1.3429, 26.27: 1.3427, 26.26: 1.3426, 26.25: 1.3424, 26.24: 1.3422, 26.23: 1.342, 26.22: 1.3418, 26.21: 1.3416, 26.2: 1.3415, 26.19: 1.3413, 26.18: 1.3411, 26.17: 1.3409, 26.16: 1.3407, 26.15: 1.3406, 26.14: 1.3404, 26.13: 1.3402, 26.12: 1.34, 26.11: 1.3398, 26.1: 1.3396, 26.09: 1.3395, 26.08: 1.3393, 26.07: 1.3391, 26.06: 1.3389, 26.05: 1.3387, 26.04: 1.3386, 26.03: 1.3384, 26.02: 1.3382, 26.01: 1.338, 26.00: 1.3378, 25.99: 1.3377, 25.98: 1.3375, 25.97: 1.3373, 25.96: 1.3371, 25.95: 1.3369, 25.94: 1.3368, 25.93: 1.3366, 25.92: 1.3364, 25.91: 1.3362, 25.9: 1.336, 25.89: 1.3359, 25.88: 1.3357, 25.87: 1.3355, 25.86: 1.3353, 25.85: 1.3351, 25.84: 1.335, 25.83: 1.3348, 25.82: 1.3346, 25.81: 1.3344, 25.8: 1.3342, 25.79: 1.3341, 25.78: 1.3339, 25.77: 1.3337, 25.76: 1.3335, 25.75: 1.3333, 25.74: 1.3332, 25.73: 1.333, 25.72: 1.3328, 25.71: 1.3326, 25.7: 1.3324, 25.69: 1.3323, 25.68: 1.3321, 25.67: 1.3319, 25.66: 1.3317, 25.65: 1.3315, 25.64: 1.3314, 25.63: 1.3312, 25.62: 1.331, 25.61: 1.3308, 25.6: 1.3306, 25.59: 1.3305, 25.58: 1.3303, 25.57: 1.3301, 25.56: 1.3299, 25.55: 1.3298, 25.54: 1.3296, 25.53: 1.3294, 25.52: 1.3292, 25.51: 1.329, 25.5: 1.3289, 25.49: 1.3287, 25.48: 1.3285, 25.47: 1.3283, 25.46: 1.3281, 25.45: 1.328, 25.44: 1.3278, 25.43: 1.3276, 25.42: 1.3274, 25.41: 1.3273, 25.4: 1.3271, 25.39: 1.3269, 25.38: 1.3267, 25.37: 1.3265, 25.36: 1.3264, 25.35: 1.3262, 25.34: 1.326, 25.33: 1.3258, 25.32: 1.3257, 25.31: 1.3255, 25.3: 1.3253, 25.29: 1.3251, 25.28: 1.3249, 25.27: 1.3248, 25.26: 1.3246, 25.25: 1.3244, 25.24: 1.3242, 25.23: 1.3241, 25.22: 1.3239, 25.21: 1.3237, 25.2: 1.3235, 25.19: 1.3234, 25.18: 1.3232, 25.17: 1.323, 25.16: 1.3228, 25.15: 1.3226, 25.14: 1.3225, 25.13: 1.3223, 25.12: 1.3221, 25.11: 1.3219, 25.1: 1.3218, 25.09: 1.3216, 25.08: 1.3214, 25.07: 1.3212, 25.06: 1.3211, 25.05: 1.3209, 25.04: 1.3207, 25.03: 1.3205, 25.02: 1.3204, 25.01: 1.3202, 25.00: 1.32, 24.99: 1.3198, 24.98: 1.3196, 24.97: 1.3195, 24.96: 1.3193, 24.95: 1.3191, 24.94: 1.3189, 24.93: 1.3188, 24.92: 1.3186, 24.91: 1.3184, 24.9: 1.3182, 24.89: 1.3181, 24.88: 1.3179, 24.87: 1.3177, 24.86: 1.3175, 24.85: 1.3174, 24.84: 1.3172, 24.83: 1.317, 24.82: 1.3168, 24.81: 1.3167, 24.8: 1.3165, 24.79: 1.3163, 24.78: 1.3161, 24.77: 1.316, 24.76: 1.3158, 24.75: 1.3156, 24.74: 1.3154, 24.73: 1.3153, 24.72: 1.3151, 24.71: 1.3149, 24.7: 1.3147, 24.69: 1.3146, 24.68: 1.3144, 24.67: 1.3142, 24.66: 1.314, 24.65: 1.3139, 24.64: 1.3137, 24.63: 1.3135, 24.62: 1.3133, 24.61: 1.3132, 24.6: 1.313, 24.59: 1.3128, 24.58: 1.3126, 24.57: 1.3125, 24.56: 1.3123, 24.55: 1.3121, 24.54: 1.312, 24.53: 1.3118, 24.52: 1.3116, 24.51: 1.3114, 24.5: 1.3113, 24.49: 1.3111, 24.48: 1.3109, 24.47: 1.3107, 24.46: 1.3106, 24.45: 1.3104, 24.44: 1.3102, 24.43: 1.31, 24.42: 1.3099, 24.41: 1.3097, 24.4: 1.3095, 24.39: 1.3094, 24.38: 1.3092, 24.37: 1.309, 24.36: 1.3088, 24.35: 1.3087, 24.34: 1.3085, 24.33: 1.3083, 24.32: 1.3081, 24.31: 1.308, 24.3: 1.3078, 24.29: 1.3076, 24.28: 1.3074, 24.27: 1.3073, 24.26: 1.3071, 24.25: 1.3069, 24.24: 1.3068, 24.23: 1.3066, 24.22: 1.3064, 24.21: 1.3062, 24.2: 1.3061, 24.19: 1.3059, 24.18: 1.3057, 24.17: 1.3056, 24.16: 1.3054, 24.15: 1.3052, 24.14: 1.305, 24.13: 1.3049, 24.12: 1.3047, 24.11: 1.3045, 24.1: 1.3043, 24.09: 1.3042, 24.08: 1.304, 24.07: 1.3038, 24.06: 1.3037, 24.05: 1.3035, 24.04: 1.3033, 24.03: 1.3031, 24.02: 1.303, 24.01: 1.3028, 24.00: 1.3026, 23.99: 1.3025, 23.98: 1.3023, 23.97: 1.3021, 23.96: 1.3019, 23.95: 1.3018, 23.94: 1.3016, 23.93: 1.3014, 23.92: 1.3013, 23.91: 1.3011, 23.9: 1.3009, 23.89: 1.3007, 23.88: 1.3006, 23.87: 1.3004, 23.86: 1.3002, 23.85: 1.3001, 23.84: 1.2999, 23.83: 1.2997, 23.82: 1.2996, 23.81: 1.2994, 23.8: 1.2992, 23.79: 1.299, 23.78: 1.2989, 23.77: 1.2987, 23.76: 1.2985, 23.75: 1.2984, 23.74: 1.2982, 23.73: 1.298, 23.72: 1.2979, 23.71: 1.2977, 23.7: 1.2975, 23.69: 1.2973, 23.68: 1.2972, 23.67: 1.297, 23.66: 1.2968, 23.65: 1.2967, 23.64: 1.2965, 23.63: 1.2963, 23.62: 1.2962, 23.61: 1.296, 23.6: 1.2958, 23.59: 1.2956, 23.58: 1.2955, 23.57: 1.2953, 23.56: 1.2951, 23.55: 1.295, 23.54: 1.2948, 23.53: 1.2946, 23.52: 1.2945, 23.51: 1.2943, 23.5: 1.2941, 23.49: 1.2939, 23.48: 1.2938, 23.47: 1.2936, 23.46: 1.2934, 23.45: 1.2933, 23.44: 1.2931, 23.43: 1.2929, 23.42: 1.2928, 23.41: 1.2926, 23.4: 1.2924, 23.39: 1.2923, 23.38: 1.2921, 23.37: 1.2919, 23.36: 1.2918, 23.35: 1.2916, 23.34: 1.2914, 23.33: 1.2912, 23.32: 1.2911, 23.31: 1.2909, 23.3: 1.2907, 23.29: 1.2906, 23.28: 1.2904, 23.27: 1.2902, 23.26: 1.2901, 23.25: 1.2899, 23.24: 1.2897, 23.23: 1.2896, 23.22: 1.2894, 23.21: 1.2892, 23.2: 1.2891, 23.19: 1.2889, 23.18: 1.2887, 23.17: 1.2886, 23.16: 1.2884, 23.15: 1.2882, 23.14: 1.2881, 23.13: 1.2879, 23.12: 1.2877, 23.11: 1.2876, 23.1: 1.2874, 23.09: 1.2872, 23.08: 1.2871, 23.07: 1.2869, 23.06: 1.2867, 23.05: 1.2865, 23.04: 1.2864, 23.03: 1.2862, 23.02: 1.286, 23.01: 1.2859, 23.00: 1.2857, 22.99: 1.2855, 22.98: 1.2854, 22.97: 1.2852, 22.96: 1.285, 22.95: 1.2849, 22.94: 1.2847, 22.93: 1.2845, 22.92: 1.2844, 22.91: 1.2842, 22.9: 1.284, 22.89: 1.2839, 22.88: 1.2837, 22.87: 1.2835, 22.86: 1.2834, 22.85: 1.2832, 22.84: 1.283, 22.83: 1.2829, 22.82: 1.2827, 22.81: 1.2825, 22.8: 1.2824, 22.79: 1.2822, 22.78: 1.2821, 22.77: 1.2819, 22.76: 1.2817, 22.75: 1.2816, 22.74: 1.2814, 22.73: 1.2812, 22.72: 1.2811, 22.71: 1.2809, 22.7: 1.2807, 22.69: 1.2806, 22.68: 1.2804, 22.67: 1.2802, 22.66: 1.2801, 22.65: 1.2799, 22.64: 1.2797, 22.63: 1.2796, 22.62: 1.2794, 22.61: 1.2792, 22.6: 1.2791, 22.59: 1.2789, 22.58: 1.2787, 22.57: 1.2786, 22.56: 1.2784, 22.55: 1.2782, 22.54: 1.2781, 22.53: 1.2779, 22.52: 1.2777, 22.51: 1.2776, 22.5: 1.2774, 22.49: 1.2773, 22.48: 1.2771, 22.47: 1.2769, 22.46: 1.2768, 22.45: 1.2766, 22.44: 1.2764, 22.43: 1.2763, 22.42: 1.2761, 22.41: 1.2759, 22.4: 1.2758, 22.39: 1.2756, 22.38: 1.2754, 22.37: 1.2753, 22.36: 1.2751, 22.35: 1.275, 22.34: 1.2748, 22.33: 1.2746, 22.32: 1.2745, 22.31: 1.2743, 22.3: 1.2741, 22.29: 1.274, 22.28: 1.2738, 22.27: 1.2736, 22.26: 1.2735, 22.25: 1.2733, 22.24: 1.2731, 22.23: 1.273, 22.22: 1.2728, 22.21: 1.2727, 22.2: 1.2725, 22.19: 1.2723, 22.18: 1.2722, 22.17: 1.272, 22.16: 1.2718, 22.15: 1.2717, 22.14: 1.2715, 22.13: 1.2713, 22.12: 1.2712, 22.11: 1.271, 22.1: 1.2709, 22.09: 1.2707, 22.08: 1.2705, 22.07: 1.2704, 22.06: 1.2702, 22.05: 1.27, 22.04: 1.2699, 22.03: 1.2697, 22.02: 1.2696, 22.01: 1.2694, 22.00: 1.2692, 21.99: 1.2691, 21.98: 1.2689, 21.97: 1.2687, 21.96: 1.2686, 21.95: 1.2684, 21.94: 1.2683, 21.93: 1.2681, 21.92: 1.2679, 21.91: 1.2678, 21.9: 1.2676, 21.89: 1.2674, 21.88: 1.2673, 21.87: 1.2671, 21.86: 1.267, 21.85: 1.2668, 21.84: 1.2666, 21.83: 1.2665, 21.82: 1.2663, 21.81: 1.2661, 21.8: 1.266, 21.79: 1.2658, 21.78: 1.2657, 21.77: 1.2655, 21.76: 1.2653, 21.75: 1.2652, 21.74: 1.265, 21.73: 1.2649, 21.72: 1.2647, 21.71: 1.2645, 21.7: 1.2644, 21.69: 1.2642, 21.68: 1.264, 21.67: 1.2639, 21.66: 1.2637, 21.65: 1.2636, 21.64: 1.2634, 21.63: 1.2632, 21.62: 1.2631, 21.61: 1.2629, 21.6: 1.2628, 21.59: 1.2626, 21.58: 1.2624, 21.57: 1.2623, 21.56: 1.2621, 21.55: 1.262, 21.54: 1.2618, 21.53: 1.2616, 21.52: 1.2615, 21.51: 1.2613, 21.5: 1.2611, 21.49: 1.261, 21.48: 1.2608, 21.47: 1.2607, 21.46: 1.2605, 21.45: 1.2603, 21.44: 1.2602, 21.43: 1.26, 21.42: 1.2599, 21.41: 1.2597, 21.4: 1.2595, 21.39: 1.2594, 21.38: 1.2592, 21.37: 1.2591, 21.36: 1.2589, 21.35: 1.2587, 21.34: 1.2586, 21.33: 1.2584, 21.32: 1.2583, 21.31: 1.2581, 21.3: 1.2579, 21.29: 1.2578, 21.28: 1.2576, 21.27: 1.2575, 21.26: 1.2573, 21.25: 1.2571, 21.24: 1.257, 21.23: 1.2568, 21.22: 1.2567, 21.21: 1.2565, 21.2: 1.2563, 21.19: 1.2562, 21.18: 1.256, 21.17: 1.2559, 21.16: 1.2557, 21.15: 1.2555, 21.14: 1.2554, 21.13: 1.2552, 21.12: 1.2551, 21.11: 1.2549, 21.1: 1.2548, 21.09: 1.2546, 21.08: 1.2544, 21.07: 1.2543, 21.06: 1.2541, 21.05: 1.254, 21.04: 1.2538, 21.03: 1.2536, 21.02: 1.2535, 21.01: 1.2533, 21.00: 1.2532, 20.99: 1.253, 20.98: 1.2528, 20.97: 1.2527, 20.96: 1.2525, 20.95: 1.2524, 20.94: 1.2522, 20.93: 1.2521, 20.92: 1.2519, 20.91: 1.2517, 20.9: 1.2516, 20.89: 1.2514, 20.88: 1.2513, 20.87: 1.2511, 20.86: 1.2509, 20.85: 1.2508, 20.84: 1.2506, 20.83: 1.2505, 20.82: 1.2503, 20.81: 1.2502, 20.8: 1.25, 20.79: 1.2498, 20.78: 1.2497, 20.77: 1.2495, 20.76: 1.2494, 20.75: 1.2492, 20.74: 1.2491, 20.73: 1.2489, 20.72: 1.2487, 20.71: 1.2486, 20.7: 1.2484, 20.69: 1.2483, 20.68: 1.2481, 20.67: 1.248, 20.66: 1.2478, 20.65: 1.2476, 20.64: 1.2475, 20.63: 1.2473, 20.62: 1.2472, 20.61: 1.247, 20.6: 1.2469, 20.59: 1.2467, 20.58: 1.2465, 20.57: 1.2464, 20.56: 1.2462, 20.55: 1.2461, 20.54: 1.2459, 20.53: 1.2458, 20.52: 1.2456, 20.51: 1.2454, 20.5: 1.2453, 20.49: 1.2451, 20.48: 1.245, 20.47: 1.2448, 20.46: 1.2447, 20.45: 1.2445, 20.44: 1.2443, 20.43: 1.2442, 20.42: 1.244, 20.41: 1.2439, 20.4: 1.2437, 20.39: 1.2436, 20.38: 1.2434, 20.37: 1.2433, 20.36: 1.2431, 20.35: 1.2429, 20.34: 1.2428, 20.33: 1.2426, 20.32: 1.2425, 20.31: 1.2423, 20.3: 1.2422, 20.29: 1.242, 20.28: 1.2418, 20.27: 1.2417, 20.26: 1.2415, 20.25: 1.2414, 20.24: 1.2412, 20.23: 1.2411, 20.22: 1.2409, 20.21: 1.2408, 20.2: 1.2406, 20.19: 1.2404, 20.18: 1.2403, 20.17: 1.2401, 20.16: 1.24, 20.15: 1.2398, 20.14: 1.2397, 20.13: 1.2395, 20.12: 1.2394, 20.11: 1.2392, 20.1: 1.239, 20.09: 1.2389, 20.08: 1.2387, 20.07: 1.2386, 20.06: 1.2384, 20.05: 1.2383, 20.04: 1.2381, 20.03: 1.238, 20.02: 1.2378, 20.01: 1.2377, 20.00: 1.2375, 19.99: 1.2373, 19.98: 1.2372, 19.97: 1.237, 19.96: 1.2369, 19.95: 1.2367, 19.94: 1.2366, 19.93: 1.2364, 19.92: 1.2363, 19.91: 1.2361, 19.9: 1.236, 19.89: 1.2358, 19.88: 1.2356, 19.87: 1.2355, 19.86: 1.2353, 19.85: 1.2352, 19.84: 1.235, 19.83: 1.2349, 19.82: 1.2347, 19.81: 1.2346, 19.8: 1.2344, 19.79: 1.2343, 19.78: 1.2341, 19.77: 1.234, 19.76: 1.2338, 19.75: 1.2336, 19.74: 1.2335, 19.73: 1.2333, 19.72: 1.2332, 19.71: 1.233, 19.7: 1.2329, 19.69: 1.2327, 19.68: 1.2326, 19.67: 1.2324, 19.66: 1.2323, 19.65: 1.2321, 19.64: 1.232, 19.63: 1.2318, 19.62: 1.2316, 19.61: 1.2315, 19.6: 1.2313, 19.59: 1.2312, 19.58: 1.231, 19.57: 1.2309, 19.56: 1.2307, 19.55: 1.2306, 19.54: 1.2304, 19.53: 1.2303, 19.52: 1.2301, 19.51: 1.23, 19.5: 1.2298, 19.49: 1.2297, 19.48: 1.2295, 19.47: 1.2294, 19.46: 1.2292, 19.45: 1.2291, 19.44: 1.2289, 19.43: 1.2287, 19.42: 1.2286, 19.41: 1.2284, 19.4: 1.2283, 19.39: 1.2281, 19.38: 1.228, 19.37: 1.2278, 19.36: 1.2277, 19.35: 1.2275, 19.34: 1.2274, 19.33: 1.2272, 19.32: 1.2271, 19.31: 1.2269, 19.3: 1.2268, 19.29: 1.2266, 19.28: 1.2265, 19.27: 1.2263, 19.26: 1.2262, 19.25: 1.226, 19.24: 1.2259, 19.23: 1.2257, 19.22: 1.2256, 19.21: 1.2254, 19.2: 1.2252, 19.19: 1.2251, 19.18: 1.2249, 19.17: 1.2248, 19.16: 1.2246, 19.15: 1.2245, 19.14: 1.2243, 19.13: 1.2242, 19.12: 1.224, 19.11: 1.2239, 19.1: 1.2237, 19.09: 1.2236, 19.08: 1.2234, 19.07: 1.2233, 19.06: 1.2231, 19.05: 1.223, 19.04: 1.2228, 19.03: 1.2227, 19.02: 1.2225, 19.01: 1.2224, 19.00: 1.2222, 18.99: 1.2221, 18.98: 1.2219, 18.97: 1.2218, 18.96: 1.2216, 18.95: 1.2215, 18.94: 1.2213, 18.93: 1.2212, 18.92: 1.221, 18.91: 1.2209, 18.9: 1.2207, 18.89: 1.2206, 18.88: 1.2204, 18.87: 1.2203, 18.86: 1.2201, 18.85: 1.22, 18.84: 1.2198, 18.83: 1.2197, 18.82: 1.2195, 18.81: 1.2194, 18.8: 1.2192, 18.79: 1.2191, 18.78: 1.2189, 18.77: 1.2188, 18.76: 1.2186, 18.75: 1.2185, 18.74: 1.2183, 18.73: 1.2182, 18.72: 1.218, 18.71: 1.2179, 18.7: 1.2177, 18.69: 1.2176, 18.68: 1.2174, 18.67: 1.2173, 18.66: 1.2171, 18.65: 1.217, 18.64: 1.2168, 18.63: 1.2167, 18.62: 1.2165, 18.61: 1.2164, 18.6: 1.2162, 18.59: 1.2161, 18.58: 1.2159, 18.57: 1.2158, 18.56: 1.2156, 18.55: 1.2155, 18.54: 1.2153, 18.53: 1.2152, 18.52: 1.215, 18.51: 1.2149, 18.5: 1.2147, 18.49: 1.2146, 18.48: 1.2144, 18.47: 1.2143, 18.46: 1.2141, 18.45: 1.214, 18.44: 1.2138, 18.43: 1.2137, 18.42: 1.2135, 18.41: 1.2134, 18.4: 1.2132, 18.39: 1.2131, 18.38: 1.2129, 18.37: 1.2128, 18.36: 1.2126, 18.35: 1.2125, 18.34: 1.2123, 18.33: 1.2122, 18.32: 1.212, 18.31: 1.2119, 18.3: 1.2118, 18.29: 1.2116, 18.28: 1.2115, 18.27: 1.2113, 18.26: 1.2112, 18.25: 1.211, 18.24: 1.2109, 18.23: 1.2107, 18.22: 1.2106, 18.21: 1.2104, 18.2: 1.2103, 18.19: 1.2101, 18.18: 1.21, 18.17: 1.2098, 18.16: 1.2097, 18.15: 1.2095, 18.14: 1.2094, 18.13: 1.2092, 18.12: 1.2091, 18.11: 1.2089, 18.1: 1.2088, 18.09: 1.2086, 18.08: 1.2085, 18.07: 1.2083, 18.06: 1.2082, 18.05: 1.2081, 18.04: 1.2079, 18.03: 1.2078, 18.02: 1.2076, 18.01: 1.2075, 18.00: 1.2073, 17.99: 1.2072, 17.98: 1.207, 17.97: 1.2069, 17.96: 1.2067, 17.95: 1.2066, 17.94: 1.2064, 17.93: 1.2063, 17.92: 1.2061, 17.91: 1.206, 17.9: 1.2058, 17.89: 1.2057, 17.88: 1.2056, 17.87: 1.2054, 17.86: 1.2053, 17.85: 1.2051, 17.84: 1.205, 17.83: 1.2048, 17.82: 1.2047, 17.81: 1.2045, 17.8: 1.2044, 17.79: 1.2042, 17.78: 1.2041, 17.77: 1.2039, 17.76: 1.2038, 17.75: 1.2036, 17.74: 1.2035, 17.73: 1.2034, 17.72: 1.2032, 17.71: 1.2031, 17.7: 1.2029, 17.69: 1.2028, 17.68: 1.2026, 17.67: 1.2025, 17.66: 1.2023, 17.65: 1.2022, 17.64: 1.202, 17.63: 1.2019, 17.62: 1.2017, 17.61: 1.2016, 17.6: 1.2015, 17.59: 1.2013, 17.58: 1.2012, 17.57: 1.201, 17.56: 1.2009, 17.55: 1.2007, 17.54: 1.2006, 17.53: 1.2004, 17.52: 1.2003, 17.51: 1.2001, 17.5: 1.2, 17.49: 1.1999, 17.48: 1.1997, 17.47: 1.1996, 17.46: 1.1994, 17.45: 1.1993, 17.44: 1.1991, 17.43: 1.199, 17.42: 1.1988, 17.41: 1.1987, 17.4: 1.1985, 17.39: 1.1984, 17.38: 1.1983, 17.37: 1.1981, 17.36: 1.198, 17.35: 1.1978, 17.34: 1.1977, 17.33: 1.1975, 17.32: 1.1974, 17.31: 1.1972, 17.3: 1.1971, 17.29: 1.197, 17.28: 1.1968, 17.27: 1.1967, 17.26: 1.1965, 17.25: 1.1964, 17.24: 1.1962, 17.23: 1.1961, 17.22: 1.1959, 17.21: 1.1958, 17.2: 1.1957, 17.19: 1.1955, 17.18: 1.1954, 17.17: 1.1952, 17.16: 1.1951, 17.15: 1.1949, 17.14: 1.1948, 17.13: 1.1946, 17.12: 1.1945, 17.11: 1.1944, 17.1: 1.1942, 17.09: 1.1941, 17.08: 1.1939, 17.07: 1.1938, 17.06: 1.1936, 17.05: 1.1935, 17.04: 1.1933, 17.03: 1.1932, 17.02: 1.1931, 17.01: 1.1929, 17.00: 1.1928, 16.99: 1.1926, 16.98: 1.1925, 16.97: 1.1923, 16.96: 1.1922, 16.95: 1.1921, 16.94: 1.1919, 16.93: 1.1918, 16.92: 1.1916, 16.91: 1.1915, 16.9: 1.1913, 16.89: 1.1912, 16.88: 1.191, 16.87: 1.1909, 16.86: 1.1908, 16.85: 1.1906, 16.84: 1.1905, 16.83: 1.1903, 16.82: 1.1902, 16.81: 1.19, 16.8: 1.1899, 16.79: 1.1898, 16.78: 1.1896, 16.77: 1.1895, 16.76: 1.1893, 16.75: 1.1892, 16.74: 1.189, 16.73: 1.1889, 16.72: 1.1888, 16.71: 1.1886, 16.7: 1.1885, 16.69: 1.1883, 16.68: 1.1882, 16.67: 1.188, 16.66: 1.1879, 16.65: 1.1878, 16.64: 1.1876, 16.63: 1.1875, 16.62: 1.1873, 16.61: 1.1872, 16.6: 1.1871, 16.59: 1.1869, 16.58: 1.1868, 16.57: 1.1866, 16.56: 1.1865, 16.55: 1.1863, 16.54: 1.1862, 16.53: 1.1861, 16.52: 1.1859, 16.51: 1.1858, 16.5: 1.1856, 16.49: 1.1855, 16.48: 1.1853, 16.47: 1.1852, 16.46: 1.1851, 16.45: 1.1849, 16.44: 1.1848, 16.43: 1.1846, 16.42: 1.1845, 16.41: 1.1844, 16.4: 1.1842, 16.39: 1.1841, 16.38: 1.1839, 16.37: 1.1838, 16.36: 1.1836, 16.35: 1.1835, 16.34: 1.1834, 16.33: 1.1832, 16.32: 1.1831, 16.31: 1.1829, 16.3: 1.1828, 16.29: 1.1827, 16.28: 1.1825, 16.27: 1.1824, 16.26: 1.1822, 16.25: 1.1821, 16.24: 1.1819, 16.23: 1.1818, 16.22: 1.1817, 16.21: 1.1815, 16.2: 1.1814, 16.19: 1.1812, 16.18: 1.1811, 16.17: 1.181, 16.16: 1.1808, 16.15: 1.1807, 16.14: 1.1805, 16.13: 1.1804, 16.12: 1.1803, 16.11: 1.1801, 16.1: 1.18, 16.09: 1.1798, 16.08: 1.1797, 16.07: 1.1796, 16.06: 1.1794, 16.05: 1.1793, 16.04: 1.1791, 16.03: 1.179, 16.02: 1.1789, 16.01: 1.1787, 16.00: 1.1786, 15.99: 1.1784, 15.98: 1.1783, 15.97: 1.1782, 15.96: 1.178, 15.95: 1.1779, 15.94: 1.1777, 15.93: 1.1776, 15.92: 1.1775, 15.91: 1.1773, 15.9: 1.1772, 15.89: 1.177, 15.88: 1.1769, 15.87: 1.1768, 15.86: 1.1766, 15.85: 1.1765, 15.84: 1.1763, 15.83: 1.1762, 15.82: 1.1761, 15.81: 1.1759, 15.8: 1.1758, 15.79: 1.1756, 15.78: 1.1755, 15.77: 1.1754, 15.76: 1.1752, 15.75: 1.1751, 15.74: 1.1749, 15.73: 1.1748, 15.72: 1.1747, 15.71: 1.1745, 15.7: 1.1744, 15.69: 1.1742, 15.68: 1.1741, 15.67: 1.174, 15.66: 1.1738, 15.65: 1.1737, 15.64: 1.1735, 15.63: 1.1734, 15.62: 1.1733, 15.61: 1.1731, 15.6: 1.173, 15.59: 1.1728, 15.58: 1.1727, 15.57: 1.1726, 15.56: 1.1724, 15.55: 1.1723, 15.54: 1.1722, 15.53: 1.172, 15.52: 1.1719, 15.51: 1.1717, 15.5: 1.1716, 15.49: 1.1715, 15.48: 1.1713, 15.47: 1.1712, 15.46: 1.171, 15.45: 1.1709, 15.44: 1.1708, 15.43: 1.1706, 15.42: 1.1705, 15.41: 1.1704, 15.4: 1.1702, 15.39: 1.1701, 15.38: 1.1699, 15.37: 1.1698, 15.36: 1.1697, 15.35: 1.1695, 15.34: 1.1694, 15.33: 1.1692, 15.32: 1.1691, 15.31: 1.169, 15.3: 1.1688, 15.29: 1.1687, 15.28: 1.1686, 15.27: 1.1684, 15.26: 1.1683, 15.25: 1.1681, 15.24: 1.168, 15.23: 1.1679, 15.22: 1.1677, 15.21: 1.1676, 15.2: 1.1675, 15.19: 1.1673, 15.18: 1.1672, 15.17: 1.167, 15.16: 1.1669, 15.15: 1.1668, 15.14: 1.1666, 15.13: 1.1665, 15.12: 1.1664, 15.11: 1.1662, 15.1: 1.1661, 15.09: 1.1659, 15.08: 1.1658, 15.07: 1.1657, 15.06: 1.1655, 15.05: 1.1654, 15.04: 1.1653, 15.03: 1.1651, 15.02: 1.165, 15.01: 1.1648, 15.00: 1.1647, 14.99: 1.1646, 14.98: 1.1644, 14.97: 1.1643, 14.96: 1.1642, 14.95: 1.164, 14.94: 1.1639, 14.93: 1.1637, 14.92: 1.1636, 14.91: 1.1635, 14.9: 1.1633, 14.89: 1.1632, 14.88: 1.1631, 14.87: 1.1629, 14.86: 1.1628, 14.85: 1.1627, 14.84: 1.1625, 14.83: 1.1624, 14.82: 1.1622, 14.81: 1.1621, 14.8: 1.162, 14.79: 1.1618, 14.78: 1.1617, 14.77: 1.1616, 14.76: 1.1614, 14.75: 1.1613, 14.74: 1.1612, 14.73: 1.161, 14.72: 1.1609, 14.71: 1.1607, 14.7: 1.1606, 14.69: 1.1605, 14.68: 1.1603, 14.67: 1.1602, 14.66: 1.1601, 14.65: 1.1599, 14.64: 1.1598, 14.63: 1.1597, 14.62: 1.1595, 14.61: 1.1594, 14.6: 1.1593, 14.59: 1.1591, 14.58: 1.159, 14.57: 1.1588, 14.56: 1.1587, 14.55: 1.1586, 14.54: 1.1584, 14.53: 1.1583, 14.52: 1.1582, 14.51: 1.158, 14.5: 1.1579, 14.49: 1.1578, 14.48: 1.1576, 14.47: 1.1575, 14.46: 1.1574, 14.45: 1.1572, 14.44: 1.1571, 14.43: 1.1569, 14.42: 1.1568, 14.41: 1.1567, 14.4: 1.1565, 14.39: 1.1564, 14.38: 1.1563, 14.37: 1.1561, 14.36: 1.156, 14.35: 1.1559, 14.34: 1.1557, 14.33: 1.1556, 14.32: 1.1555, 14.31: 1.1553, 14.3: 1.1552, 14.29: 1.1551, 14.28: 1.1549, 14.27: 1.1548, 14.26: 1.1547, 14.25: 1.1545, 14.24: 1.1544, 14.23: 1.1542, 14.22: 1.1541, 14.21: 1.154, 14.2: 1.1538, 14.19: 1.1537, 14.18: 1.1536, 14.17: 1.1534, 14.16: 1.1533, 14.15: 1.1532, 14.14: 1.153, 14.13: 1.1529, 14.12: 1.1528, 14.11: 1.1526, 14.1: 1.1525, 14.09: 1.1524, 14.08: 1.1522, 14.07: 1.1521, 14.06: 1.152, 14.05: 1.1518, 14.04: 1.1517, 14.03: 1.1516, 14.02: 1.1514, 14.01: 1.1513, 14.00: 1.1512, 13.99: 1.151, 13.98: 1.1509, 13.97: 1.1508, 13.96: 1.1506, 13.95: 1.1505, 13.94: 1.1504, 13.93: 1.1502, 13.92: 1.1501, 13.91: 1.15, 13.9: 1.1498, 13.89: 1.1497, 13.88: 1.1496, 13.87: 1.1494, 13.86: 1.1493, 13.85: 1.1492, 13.84: 1.149, 13.83: 1.1489, 13.82: 1.1488, 13.81: 1.1486, 13.8: 1.1485, 13.79: 1.1484, 13.78: 1.1482, 13.77: 1.1481, 13.76: 1.148, 13.75: 1.1478, 13.74: 1.1477, 13.73: 1.1476, 13.72: 1.1474, 13.71: 1.1473, 13.7: 1.1472, 13.69: 1.147, 13.68: 1.1469, 13.67: 1.1468, 13.66: 1.1466, 13.65: 1.1465, 13.64: 1.1464, 13.63: 1.1462, 13.62: 1.1461, 13.61: 1.146, 13.6: 1.1458, 13.59: 1.1457, 13.58: 1.1456, 13.57: 1.1454, 13.56: 1.1453, 13.55: 1.1452, 13.54: 1.145, 13.53: 1.1449, 13.52: 1.1448, 13.51: 1.1446, 13.5: 1.1445, 13.49: 1.1444, 13.48: 1.1442, 13.47: 1.1441, 13.46: 1.144, 13.45: 1.1438, 13.44: 1.1437, 13.43: 1.1436, 13.42: 1.1435, 13.41: 1.1433, 13.4: 1.1432, 13.39: 1.1431, 13.38: 1.1429, 13.37: 1.1428, 13.36: 1.1427, 13.35: 1.1425, 13.34: 1.1424, 13.33: 1.1423, 13.32: 1.1421, 13.31: 1.142, 13.3: 1.1419, 13.29: 1.1417, 13.28: 1.1416, 13.27: 1.1415, 13.26: 1.1413, 13.25: 1.1412, 13.24: 1.1411, 13.23: 1.1409, 13.22: 1.1408, 13.21: 1.1407, 13.2: 1.1406, 13.19: 1.1404, 13.18: 1.1403, 13.17: 1.1402, 13.16: 1.14, 13.15: 1.1399, 13.14: 1.1398, 13.13: 1.1396, 13.12: 1.1395, 13.11: 1.1394, 13.1: 1.1392, 13.09: 1.1391, 13.08: 1.139, 13.07: 1.1388, 13.06: 1.1387, 13.05: 1.1386, 13.04: 1.1385, 13.03: 1.1383, 13.02: 1.1382, 13.01: 1.1381, 13.00: 1.1379, 12.99: 1.1378, 12.98: 1.1377, 12.97: 1.1375, 12.96: 1.1374, 12.95: 1.1373, 12.94: 1.1371, 12.93: 1.137, 12.92: 1.1369, 12.91: 1.1368, 12.9: 1.1366, 12.89: 1.1365, 12.88: 1.1364, 12.87: 1.1362, 12.86: 1.1361, 12.85: 1.136, 12.84: 1.1358, 12.83: 1.1357, 12.82: 1.1356, 12.81: 1.1355, 12.8: 1.1353, 12.79: 1.1352, 12.78: 1.1351, 12.77: 1.1349, 12.76: 1.1348, 12.75: 1.1347, 12.74: 1.1345, 12.73: 1.1344, 12.72: 1.1343, 12.71: 1.1342, 12.7: 1.134, 12.69: 1.1339, 12.68: 1.1338, 12.67: 1.1336, 12.66: 1.1335, 12.65: 1.1334, 12.64: 1.1332, 12.63: 1.1331, 12.62: 1.133, 12.61: 1.1329, 12.6: 1.1327, 12.59: 1.1326, 12.58: 1.1325, 12.57: 1.1323, 12.56: 1.1322, 12.55: 1.1321, 12.54: 1.1319, 12.53: 1.1318, 12.52: 1.1317, 12.51: 1.1316, 12.5: 1.1314, 12.49: 1.1313, 12.48: 1.1312, 12.47: 1.131, 12.46: 1.1309, 12.45: 1.1308, 12.44: 1.1307, 12.43: 1.1305, 12.42: 1.1304, 12.41: 1.1303, 12.4: 1.1301, 12.39: 1.13, 12.38: 1.1299, 12.37: 1.1298, 12.36: 1.1296, 12.35: 1.1295, 12.34: 1.1294, 12.33: 1.1292, 12.32: 1.1291, 12.31: 1.129, 12.3: 1.1288, 12.29: 1.1287, 12.28: 1.1286, 12.27: 1.1285, 12.26: 1.1283, 12.25: 1.1282, 12.24: 1.1281, 12.23: 1.1279, 12.22: 1.1278, 12.21: 1.1277, 12.2: 1.1276, 12.19: 1.1274, 12.18: 1.1273, 12.17: 1.1272, 12.16: 1.127, 12.15: 1.1269, 12.14: 1.1268, 12.13: 1.1267, 12.12: 1.1265, 12.11: 1.1264, 12.1: 1.1263, 12.09: 1.1262, 12.08: 1.126, 12.07: 1.1259, 12.06: 1.1258, 12.05: 1.1256, 12.04: 1.1255, 12.03: 1.1254, 12.02: 1.1253, 12.01: 1.1251, 12.00: 1.125, 11.99: 1.1249, 11.98: 1.1247, 11.97: 1.1246, 11.96: 1.1245, 11.95: 1.1244, 11.94: 1.1242, 11.93: 1.1241, 11.92: 1.124, 11.91: 1.1239, 11.9: 1.1237, 11.89: 1.1236, 11.88: 1.1235, 11.87: 1.1233, 11.86: 1.1232, 11.85: 1.1231, 11.84: 1.123, 11.83: 1.1228, 11.82: 1.1227, 11.81: 1.1226, 11.8: 1.1224, 11.79: 1.1223, 11.78: 1.1222, 11.77: 1.1221, 11.76: 1.1219, 11.75: 1.1218, 11.74: 1.1217, 11.73: 1.1216, 11.72: 1.1214, 11.71: 1.1213, 11.7: 1.1212, 11.69: 1.1211, 11.68: 1.1209, 11.67: 1.1208, 11.66: 1.1207, 11.65: 1.1205, 11.64: 1.1204, 11.63: 1.1203, 11.62: 1.1202, 11.61: 1.12, 11.6: 1.1199, 11.59: 1.1198, 11.58: 1.1197, 11.57: 1.1195, 11.56: 1.1194, 11.55: 1.1193, 11.54: 1.1191, 11.53: 1.119, 11.52: 1.1189, 11.51: 1.1188, 11.5: 1.1186, 11.49: 1.1185, 11.48: 1.1184, 11.47: 1.1183, 11.46: 1.1181, 11.45: 1.118, 11.44: 1.1179, 11.43: 1.1178, 11.42: 1.1176, 11.41: 1.1175, 11.4: 1.1174, 11.39: 1.1173, 11.38: 1.1171, 11.37: 1.117, 11.36: 1.1169, 11.35: 1.1168, 11.34: 1.1166, 11.33: 1.1165, 11.32: 1.1164, 11.31: 1.1162, 11.3: 1.1161, 11.29: 1.116, 11.28: 1.1159, 11.27: 1.1157, 11.26: 1.1156, 11.25: 1.1155, 11.24: 1.1154, 11.23: 1.1152, 11.22: 1.1151, 11.21: 1.115, 11.2: 1.1149, 11.19: 1.1147, 11.18: 1.1146, 11.17: 1.1145, 11.16: 1.1144, 11.15: 1.1142, 11.14: 1.1141, 11.13: 1.114, 11.12: 1.1139, 11.11: 1.1137, 11.1: 1.1136, 11.09: 1.1135, 11.08: 1.1134, 11.07: 1.1132, 11.06: 1.1131, 11.05: 1.113, 11.04: 1.1129, 11.03: 1.1127, 11.02: 1.1126, 11.01: 1.1125, 11.00: 1.1124, 10.99: 1.1122, 10.98: 1.1121, 10.97: 1.112, 10.96: 1.1119, 10.95: 1.1117, 10.94: 1.1116, 10.93: 1.1115, 10.92: 1.1114, 10.91: 1.1112, 10.9: 1.1111, 10.89: 1.111, 10.88: 1.1109, 10.87: 1.1107, 10.86: 1.1106, 10.85: 1.1105, 10.84: 1.1104, 10.83: 1.1102, 10.82: 1.1101, 10.81: 1.11, 10.8: 1.1099, 10.79: 1.1097, 10.78: 1.1096, 10.77: 1.1095, 10.76: 1.1094, 10.75: 1.1092, 10.74: 1.1091, 10.73: 1.109, 10.72: 1.1089, 10.71: 1.1087, 10.7: 1.1086, 10.69: 1.1085, 10.68: 1.1084, 10.67: 1.1083, 10.66: 1.1081, 10.65: 1.108, 10.64: 1.1079, 10.63: 1.1078, 10.62: 1.1076, 10.61: 1.1075, 10.6: 1.1074, 10.59: 1.1073, 10.58: 1.1071, 10.57: 1.107, 10.56: 1.1069, 10.55: 1.1068, 10.54: 1.1066, 10.53: 1.1065, 10.52: 1.1064, 10.51: 1.1063, 10.5: 1.1061, 10.49: 1.106, 10.48: 1.1059, 10.47: 1.1058, 10.46: 1.1057, 10.45: 1.1055, 10.44: 1.1054, 10.43: 1.1053, 10.42: 1.1052, 10.41: 1.105, 10.4: 1.1049, 10.39: 1.1048, 10.38: 1.1047, 10.37: 1.1045, 10.36: 1.1044, 10.35: 1.1043, 10.34: 1.1042, 10.33: 1.104, 10.32: 1.1039, 10.31: 1.1038, 10.3: 1.1037, 10.29: 1.1036, 10.28: 1.1034, 10.27: 1.1033, 10.26: 1.1032, 10.25: 1.1031, 10.24: 1.1029, 10.23: 1.1028, 10.22: 1.1027, 10.21: 1.1026, 10.2: 1.1024, 10.19: 1.1023, 10.18: 1.1022, 10.17: 1.1021, 10.16: 1.102, 10.15: 1.1018, 10.14: 1.1017, 10.13: 1.1016, 10.12: 1.1015, 10.11: 1.1013, 10.1: 1.1012, 10.09: 1.1011, 10.08: 1.101, 10.07: 1.1009, 10.06: 1.1007, 10.05: 1.1006, 10.04: 1.1005, 10.03: 1.1004, 10.02: 1.1002, 10.01: 1.1001, 10.00: 1.1, 9.99: 1.0999, 9.98: 1.0998, 9.97: 1.0996, 9.96: 1.0995, 9.95: 1.0994, 9.94: 1.0993, 9.93: 1.0991, 9.92: 1.099, 9.91: 1.0989, 9.9: 1.0988, 9.89: 1.0987, 9.88: 1.0985, 9.87: 1.0984, 9.86: 1.0983, 9.85: 1.0982, 9.84: 1.098, 9.83: 1.0979, 9.82: 1.0978, 9.81: 1.0977, 9.8: 1.0976, 9.79: 1.0974, 9.78: 1.0973, 9.77: 1.0972, 9.76: 1.0971, 9.75: 1.097, 9.74: 1.0968, 9.73: 1.0967, 9.72: 1.0966, 9.71: 1.0965, 9.7: 1.0963, 9.69: 1.0962, 9.68: 1.0961, 9.67: 1.096, 9.66: 1.0959, 9.65: 1.0957, 9.64: 1.0956, 9.63: 1.0955, 9.62: 1.0954, 9.61: 1.0953, 9.6: 1.0951, 9.59: 1.095, 9.58: 1.0949, 9.57: 1.0948, 9.56: 1.0946, 9.55: 1.0945, 9.54: 1.0944, 9.53: 1.0943, 9.52: 1.0942, 9.51: 1.094, 9.5: 1.0939, 9.49: 1.0938, 9.48: 1.0937, 9.47: 1.0936, 9.46: 1.0934, 9.45: 1.0933, 9.44: 1.0932, 9.43: 1.0931, 9.42: 1.093, 9.41: 1.0928, 9.4: 1.0927, 9.39: 1.0926, 9.38: 1.0925, 9.37: 1.0924, 9.36: 1.0922, 9.35: 1.0921, 9.34: 1.092, 9.33: 1.0919, 9.32: 1.0918, 9.31: 1.0916, 9.3: 1.0915, 9.29: 1.0914, 9.28: 1.0913, 9.27: 1.0911, 9.26: 1.091, 9.25: 1.0909, 9.24: 1.0908, 9.23: 1.0907, 9.22: 1.0905, 9.21: 1.0904, 9.2: 1.0903, 9.19: 1.0902, 9.18: 1.0901, 9.17: 1.0899, 9.16: 1.0898, 9.15: 1.0897, 9.14: 1.0896, 9.13: 1.0895, 9.12: 1.0893, 9.11: 1.0892, 9.1: 1.0891, 9.09: 1.089, 9.08: 1.0889, 9.07: 1.0887, 9.06: 1.0886, 9.05: 1.0885, 9.04: 1.0884, 9.03: 1.0883, 9.02: 1.0882, 9.01: 1.088, 9.00: 1.0879, 8.99: 1.0878, 8.98: 1.0877, 8.97: 1.0876, 8.96: 1.0874, 8.95: 1.0873, 8.94: 1.0872, 8.93: 1.0871, 8.92: 1.087, 8.91: 1.0868, 8.9: 1.0867, 8.89: 1.0866, 8.88: 1.0865, 8.87: 1.0864, 8.86: 1.0862, 8.85: 1.0861, 8.84: 1.086, 8.83: 1.0859, 8.82: 1.0858, 8.81: 1.0856, 8.8: 1.0855, 8.79: 1.0854, 8.78: 1.0853, 8.77: 1.0852, 8.76: 1.0851, 8.75: 1.0849, 8.74: 1.0848, 8.73: 1.0847, 8.72: 1.0846, 8.71: 1.0845, 8.7: 1.0843, 8.69: 1.0842, 8.68: 1.0841, 8.67: 1.084, 8.66: 1.0839, 8.65: 1.0837, 8.64: 1.0836, 8.63: 1.0835, 8.62: 1.0834, 8.61: 1.0833, 8.6: 1.0832, 8.59: 1.083, 8.58: 1.0829, 8.57: 1.0828, 8.56: 1.0827, 8.55: 1.0826, 8.54: 1.0824, 8.53: 1.0823, 8.52: 1.0822, 8.51: 1.0821, 8.5: 1.082, 8.49: 1.0818, 8.48: 1.0817, 8.47: 1.0816, 8.46: 1.0815, 8.45: 1.0814, 8.44: 1.0813, 8.43: 1.0811, 8.42: 1.081, 8.41: 1.0809, 8.4: 1.0808, 8.39: 1.0807, 8.38: 1.0806, 8.37: 1.0804, 8.36: 1.0803, 8.35: 1.0802, 8.34: 1.0801, 8.33: 1.08, 8.32: 1.0798, 8.31: 1.0797, 8.3: 1.0796, 8.29: 1.0795, 8.28: 1.0794, 8.27: 1.0793, 8.26: 1.0791, 8.25: 1.079, 8.24: 1.0789, 8.23: 1.0788, 8.22: 1.0787, 8.21: 1.0785, 8.2: 1.0784, 8.19: 1.0783, 8.18: 1.0782, 8.17: 1.0781, 8.16: 1.078, 8.15: 1.0778, 8.14: 1.0777, 8.13: 1.0776, 8.12: 1.0775, 8.11: 1.0774, 8.1: 1.0773, 8.09: 1.0771, 8.08: 1.077, 8.07: 1.0769, 8.06: 1.0768, 8.05: 1.0767, 8.04: 1.0766, 8.03: 1.0764, 8.02: 1.0763, 8.01: 1.0762, 8.00: 1.0761, 7.99: 1.076, 7.98: 1.0759, 7.97: 1.0757, 7.96: 1.0756, 7.95: 1.0755, 7.94: 1.0754, 7.93: 1.0753, 7.92: 1.0752, 7.91: 1.075, 7.9: 1.0749, 7.89: 1.0748, 7.88: 1.0747, 7.87: 1.0746, 7.86: 1.0745, 7.85: 1.0743, 7.84: 1.0742, 7.83: 1.0741, 7.82: 1.074, 7.81: 1.0739, 7.8: 1.0738, 7.79: 1.0736, 7.78: 1.0735, 7.77: 1.0734, 7.76: 1.0733, 7.75: 1.0732, 7.74: 1.0731, 7.73: 1.0729, 7.72: 1.0728, 7.71: 1.0727, 7.7: 1.0726, 7.69: 1.0725, 7.68: 1.0724, 7.67: 1.0722, 7.66: 1.0721, 7.65: 1.072, 7.64: 1.0719, 7.63: 1.0718, 7.62: 1.0717, 7.61: 1.0715, 7.6: 1.0714, 7.59: 1.0713, 7.58: 1.0712, 7.57: 1.0711, 7.56: 1.071, 7.55: 1.0708, 7.54: 1.0707, 7.53: 1.0706, 7.52: 1.0705, 7.51: 1.0704, 7.5: 1.0703, 7.49: 1.0702, 7.48: 1.07, 7.47: 1.0699, 7.46: 1.0698, 7.45: 1.0697, 7.44: 1.0696, 7.43: 1.0695, 7.42: 1.0693, 7.41: 1.0692, 7.4: 1.0691, 7.39: 1.069, 7.38: 1.0689, 7.37: 1.0688, 7.36: 1.0687, 7.35: 1.0685, 7.34: 1.0684, 7.33: 1.0683, 7.32: 1.0682, 7.31: 1.0681, 7.3: 1.068, 7.29: 1.0678, 7.28: 1.0677, 7.27: 1.0676, 7.26: 1.0675, 7.25: 1.0674, 7.24: 1.0673, 7.23: 1.0672, 7.22: 1.067, 7.21: 1.0669, 7.2: 1.0668, 7.19: 1.0667, 7.18: 1.0666, 7.17: 1.0665, 7.16: 1.0664, 7.15: 1.0662, 7.14: 1.0661, 7.13: 1.066, 7.12: 1.0659, 7.11: 1.0658, 7.1: 1.0657, 7.09: 1.0655, 7.08: 1.0654, 7.07: 1.0653, 7.06: 1.0652, 7.05: 1.0651, 7.04: 1.065, 7.03: 1.0649, 7.02: 1.0647, 7.01: 1.0646, 7.00: 1.0645, 6.99: 1.0644, 6.98: 1.0643, 6.97: 1.0642, 6.96: 1.0641, 6.95: 1.0639, 6.94: 1.0638, 6.93: 1.0637, 6.92: 1.0636, 6.91: 1.0635, 6.9: 1.0634, 6.89: 1.0633, 6.88: 1.0631, 6.87: 1.063, 6.86: 1.0629, 6.85: 1.0628, 6.84: 1.0627, 6.83: 1.0626, 6.82: 1.0625, 6.81: 1.0623, 6.8: 1.0622, 6.79: 1.0621, 6.78: 1.062, 6.77: 1.0619, 6.76: 1.0618, 6.75: 1.0617, 6.74: 1.0615, 6.73: 1.0614, 6.72: 1.0613, 6.71: 1.0612, 6.7: 1.0611, 6.69: 1.061, 6.68: 1.0609, 6.67: 1.0608, 6.66: 1.0606, 6.65: 1.0605, 6.64: 1.0604, 6.63: 1.0603, 6.62: 1.0602, 6.61: 1.0601, 6.6: 1.06, 6.59: 1.0598, 6.58: 1.0597, 6.57: 1.0596, 6.56: 1.0595, 6.55: 1.0594, 6.54: 1.0593, 6.53: 1.0592, 6.52: 1.0591, 6.51: 1.0589, 6.5: 1.0588, 6.49: 1.0587, 6.48: 1.0586, 6.47: 1.0585, 6.46: 1.0584, 6.45: 1.0583, 6.44: 1.0581, 6.43: 1.058, 6.42: 1.0579, 6.41: 1.0578, 6.4: 1.0577, 6.39: 1.0576, 6.38: 1.0575, 6.37: 1.0574, 6.36: 1.0572, 6.35: 1.0571, 6.34: 1.057, 6.33: 1.0569, 6.32: 1.0568, 6.31: 1.0567, 6.3: 1.0566, 6.29: 1.0565, 6.28: 1.0563, 6.27: 1.0562, 6.26: 1.0561, 6.25: 1.056, 6.24: 1.0559, 6.23: 1.0558, 6.22: 1.0557, 6.21: 1.0555, 6.2: 1.0554, 6.19: 1.0553, 6.18: 1.0552, 6.17: 1.0551, 6.16: 1.055, 6.15: 1.0549, 6.14: 1.0548, 6.13: 1.0547, 6.12: 1.0545, 6.11: 1.0544, 6.1: 1.0543, 6.09: 1.0542, 6.08: 1.0541, 6.07: 1.054, 6.06: 1.0539, 6.05: 1.0538, 6.04: 1.0536, 6.03: 1.0535, 6.02: 1.0534, 6.01: 1.0533, 6.00: 1.0532, 5.99: 1.0531, 5.98: 1.053, 5.97: 1.0529, 5.96: 1.0527, 5.95: 1.0526, 5.94: 1.0525, 5.93: 1.0524, 5.92: 1.0523, 5.91: 1.0522, 5.9: 1.0521, 5.89: 1.052, 5.88: 1.0518, 5.87: 1.0517, 5.86: 1.0516, 5.85: 1.0515, 5.84: 1.0514, 5.83: 1.0513, 5.82: 1.0512, 5.81: 1.0511, 5.8: 1.051, 5.79: 1.0508, 5.78: 1.0507, 5.77: 1.0506, 5.76: 1.0505, 5.75: 1.0504, 5.74: 1.0503, 5.73: 1.0502, 5.72: 1.0501, 5.71: 1.05, 5.7: 1.0498, 5.69: 1.0497, 5.68: 1.0496, 5.67: 1.0495, 5.66: 1.0494, 5.65: 1.0493, 5.64: 1.0492, 5.63: 1.0491, 5.62: 1.049, 5.61: 1.0488, 5.6: 1.0487, 5.59: 1.0486, 5.58: 1.0485, 5.57: 1.0484, 5.56: 1.0483, 5.55: 1.0482, 5.54: 1.0481, 5.53: 1.048, 5.52: 1.0478, 5.51: 1.0477, 5.5: 1.0476, 5.49: 1.0475, 5.48: 1.0474, 5.47: 1.0473, 5.46: 1.0472, 5.45: 1.0471, 5.44: 1.047, 5.43: 1.0468, 5.42: 1.0467, 5.41: 1.0466, 5.4: 1.0465, 5.39: 1.0464, 5.38: 1.0463, 5.37: 1.0462, 5.36: 1.0461, 5.35: 1.046, 5.34: 1.0458, 5.33: 1.0457, 5.32: 1.0456, 5.31: 1.0455, 5.3: 1.0454, 5.29: 1.0453, 5.28: 1.0452, 5.27: 1.0451, 5.26: 1.045, 5.25: 1.0449, 5.24: 1.0447, 5.23: 1.0446, 5.22: 1.0445, 5.21: 1.0444, 5.2: 1.0443, 5.19: 1.0442, 5.18: 1.0441, 5.17: 1.044, 5.16: 1.0439, 5.15: 1.0438, 5.14: 1.0436, 5.13: 1.0435, 5.12: 1.0434, 5.11: 1.0433, 5.1: 1.0432, 5.09: 1.0431, 5.08: 1.043, 5.07: 1.0429, 5.06: 1.0428, 5.05: 1.0427, 5.04: 1.0425, 5.03: 1.0424, 5.02: 1.0423, 5.01: 1.0422, 5.00: 1.0421, 4.99: 1.042, 4.98: 1.0419, 4.97: 1.0418, 4.96: 1.0417, 4.95: 1.0416, 4.94: 1.0414, 4.93: 1.0413, 4.92: 1.0412, 4.91: 1.0411, 4.9: 1.041, 4.89: 1.0409, 4.88: 1.0408, 4.87: 1.0407, 4.86: 1.0406, 4.85: 1.0405, 4.84: 1.0404, 4.83: 1.0402, 4.82: 1.0401, 4.81: 1.04, 4.8: 1.0399, 4.79: 1.0398, 4.78: 1.0397, 4.77: 1.0396, 4.76: 1.0395, 4.75: 1.0394, 4.74: 1.0393, 4.73: 1.0392, 4.72: 1.039, 4.71: 1.0389, 4.7: 1.0388, 4.69: 1.0387, 4.68: 1.0386, 4.67: 1.0385, 4.66: 1.0384, 4.65: 1.0383, 4.64: 1.0382, 4.63: 1.0381, 4.62: 1.038, 4.61: 1.0378, 4.6: 1.0377, 4.59: 1.0376, 4.58: 1.0375, 4.57: 1.0374, 4.56: 1.0373, 4.55: 1.0372, 4.54: 1.0371, 4.53: 1.037, 4.52: 1.0369, 4.51: 1.0368, 4.5: 1.0366, 4.49: 1.0365, 4.48: 1.0364, 4.47: 1.0363, 4.46: 1.0362, 4.45: 1.0361, 4.44: 1.036, 4.43: 1.0359, 4.42: 1.0358, 4.41: 1.0357, 4.4: 1.0356, 4.39: 1.0355, 4.38: 1.0353, 4.37: 1.0352, 4.36: 1.0351, 4.35: 1.035, 4.34: 1.0349, 4.33: 1.0348, 4.32: 1.0347, 4.31: 1.0346, 4.3: 1.0345, 4.29: 1.0344, 4.28: 1.0343, 4.27: 1.0342, 4.26: 1.0341, 4.25: 1.0339, 4.24: 1.0338, 4.23: 1.0337, 4.22: 1.0336, 4.21: 1.0335, 4.2: 1.0334, 4.19: 1.0333, 4.18: 1.0332, 4.17: 1.0331, 4.16: 1.033, 4.15: 1.0329, 4.14: 1.0328, 4.13: 1.0326, 4.12: 1.0325, 4.11: 1.0324, 4.1: 1.0323, 4.09: 1.0322, 4.08: 1.0321, 4.07: 1.032, 4.06: 1.0319, 4.05: 1.0318, 4.04: 1.0317, 4.03: 1.0316, 4.02: 1.0315, 4.01: 1.0314, 4.00: 1.0312, 3.99: 1.0311, 3.98: 1.031, 3.97: 1.0309, 3.96: 1.0308, 3.95: 1.0307, 3.94: 1.0306, 3.93: 1.0305, 3.92: 1.0304, 3.91: 1.0303, 3.9: 1.0302, 3.89: 1.0301, 3.88: 1.03, 3.87: 1.0299, 3.86: 1.0297, 3.85: 1.0296, 3.84: 1.0295, 3.83: 1.0294, 3.82: 1.0293, 3.81: 1.0292, 3.8: 1.0291, 3.79: 1.029, 3.78: 1.0289, 3.77: 1.0288, 3.76: 1.0287, 3.75: 1.0286, 3.74: 1.0285, 3.73: 1.0284, 3.72: 1.0283, 3.71: 1.0281, 3.7: 1.028, 3.69: 1.0279, 3.68: 1.0278, 3.67: 1.0277, 3.66: 1.0276, 3.65: 1.0275, 3.64: 1.0274, 3.63: 1.0273, 3.62: 1.0272, 3.61: 1.0271, 3.6: 1.027, 3.59: 1.0269, 3.58: 1.0268, 3.57: 1.0267, 3.56: 1.0265, 3.55: 1.0264, 3.54: 1.0263, 3.53: 1.0262, 3.52: 1.0261, 3.51: 1.026, 3.5: 1.0259, 3.49: 1.0258, 3.48: 1.0257, 3.47: 1.0256, 3.46: 1.0255, 3.45: 1.0254, 3.44: 1.0253, 3.43: 1.0252, 3.42: 1.0251, 3.41: 1.025, 3.4: 1.0248, 3.39: 1.0247, 3.38: 1.0246, 3.37: 1.0245, 3.36: 1.0244, 3.35: 1.0243, 3.34: 1.0242, 3.33: 1.0241, 3.32: 1.024, 3.31: 1.0239, 3.3: 1.0238, 3.29: 1.0237, 3.28: 1.0236, 3.27: 1.0235, 3.26: 1.0234, 3.25: 1.0233, 3.24: 1.0232, 3.23: 1.023, 3.22: 1.0229, 3.21: 1.0228, 3.2: 1.0227, 3.19: 1.0226, 3.18: 1.0225, 3.17: 1.0224, 3.16: 1.0223, 3.15: 1.0222, 3.14: 1.0221, 3.13: 1.022, 3.12: 1.0219, 3.11: 1.0218, 3.1: 1.0217, 3.09: 1.0216, 3.08: 1.0215, 3.07: 1.0214, 3.06: 1.0213, 3.05: 1.0211, 3.04: 1.021, 3.03: 1.0209, 3.02: 1.0208, 3.01: 1.0207, 3.00: 1.0206, 2.99: 1.0205, 2.98: 1.0204, 2.97: 1.0203, 2.96: 1.0202, 2.95: 1.0201, 2.94: 1.02, 2.93: 1.0199, 2.92: 1.0198, 2.91: 1.0197, 2.9: 1.0196, 2.89: 1.0195, 2.88: 1.0194, 2.87: 1.0193, 2.86: 1.0191, 2.85: 1.019, 2.84: 1.0189, 2.83: 1.0188, 2.82: 1.0187, 2.81: 1.0186, 2.8: 1.0185, 2.79: 1.0184, 2.78: 1.0183, 2.77: 1.0182, 2.76: 1.0181, 2.75: 1.018, 2.74: 1.0179, 2.73: 1.0178, 2.72: 1.0177, 2.71: 1.0176, 2.7: 1.0175, 2.69: 1.0174, 2.68: 1.0173, 2.67: 1.0172, 2.66: 1.0171, 2.65: 1.0169, 2.64: 1.0168, 2.63: 1.0167, 2.62: 1.0166, 2.61: 1.0165, 2.6: 1.0164, 2.59: 1.0163, 2.58: 1.0162, 2.57: 1.0161, 2.56: 1.016, 2.55: 1.0159, 2.54: 1.0158, 2.53: 1.0157, 2.52: 1.0156, 2.51: 1.0155, 2.5: 1.0154, 2.49: 1.0153, 2.48: 1.0152, 2.47: 1.0151, 2.46: 1.015, 2.45: 1.0149, 2.44: 1.0148, 2.43: 1.0147, 2.42: 1.0146, 2.41: 1.0144, 2.4: 1.0143, 2.39: 1.0142, 2.38: 1.0141, 2.37: 1.014, 2.36: 1.0139, 2.35: 1.0138, 2.34: 1.0137, 2.33: 1.0136, 2.32: 1.0135, 2.31: 1.0134, 2.3: 1.0133, 2.29: 1.0132, 2.28: 1.0131, 2.27: 1.013, 2.26: 1.0129, 2.25: 1.0128, 2.24: 1.0127, 2.23: 1.0126, 2.22: 1.0125, 2.21: 1.0124, 2.2: 1.0123, 2.19: 1.0122, 2.18: 1.0121, 2.17: 1.012, 2.16: 1.0119, 2.15: 1.0118, 2.14: 1.0116, 2.13: 1.0115, 2.12: 1.0114, 2.11: 1.0113, 2.1: 1.0112, 2.09: 1.0111, 2.08: 1.011, 2.07: 1.0109, 2.06: 1.0108, 2.05: 1.0107, 2.04: 1.0106, 2.03: 1.0105, 2.02: 1.0104, 2.01: 1.0103, 2.00: 1.0102}, "Under": {0.01: 9900.0, 0.02: 4950.0, 0.03: 3300.0, 0.04: 2475.0, 0.05: 1980.0, 0.06: 1650.0, 0.07: 1414.2857, 0.08: 1237.5, 0.09: 1100.0, 0.1: 990.0, 0.11: 900.0, 0.12: 825.0, 0.13: 761.5385, 0.14: 707.1429, 0.15: 660.0, 0.16: 618.75, 0.17: 582.3529, 0.18: 550.0, 0.19: 521.0526, 0.2: 495.0, 0.21: 471.4286, 0.22: 450.0, 0.23: 430.4348, 0.24: 412.5, 0.25: 396.0, 0.26: 380.7692, 0.27: 366.6667, 0.28: 353.5714, 0.29: 341.3793, 0.3: 330.0, 0.31: 319.3548, 0.32: 309.375, 0.33: 300.0, 0.34: 291.1765, 0.35: 282.8571, 0.36: 275.0, 0.37: 267.5676, 0.38: 260.5263, 0.39: 253.8462, 0.4: 247.5, 0.41: 241.4634, 0.42: 235.7143, 0.43: 230.2326, 0.44: 225.0, 0.45: 220.0, 0.46: 215.2174, 0.47: 210.6383, 0.48: 206.25, 0.49: 202.0408, 0.5: 198.0, 0.51: 194.1176, 0.52: 190.3846, 0.53: 186.7925, 0.54: 183.3333, 0.55: 180.0, 0.56: 176.7857, 0.57: 173.6842, 0.58: 170.6897, 0.59: 167.7966, 0.6: 165.0, 0.61: 162.2951, 0.62: 159.6774, 0.63: 157.1429, 0.64: 154.6875, 0.65: 152.3077, 0.66: 150.0, 0.67: 147.7612, 0.68: 145.5882, 0.69: 143.4783, 0.7: 141.4286, 0.71: 139.4366, 0.72: 137.5, 0.73: 135.6164, 0.74: 133.7838, 0.75: 132.0, 0.76: 130.2632, 0.77: 128.5714, 0.78: 126.9231, 0.79: 125.3165, 0.8: 123.75, 0.81: 122.2222, 0.82: 120.7317, 0.83: 119.2771, 0.84: 117.8571, 0.85: 116.4706, 0.86: 115.1163, 0.87: 113.7931, 0.88: 112.5, 0.89: 111.236, 0.9: 110.0, 0.91: 108.7912, 0.92: 107.6087, 0.93: 106.4516, 0.94: 105.3191, 0.95: 104.2105, 0.96: 103.125, 0.97: 102.0619, 0.98: 101.0204, 0.99: 100.0, 1.00: 99.0, 1.01: 98.0198, 1.02: 97.0588, 1.03: 96.1165, 1.04: 95.1923, 1.05: 94.2857, 1.06: 93.3962, 1.07: 92.5234, 1.08: 91.6667, 1.09: 90.8257, 1.1: 90.0, 1.11: 89.1892, 1.12: 88.3929, 1.13: 87.6106, 1.14: 86.8421, 1.15: 86.087, 1.16: 85.3448, 1.17: 84.6154, 1.18: 83.8983, 1.19: 83.1933, 1.2: 82.5, 1.21: 81.8182, 1.22: 81.1475, 1.23: 80.4878, 1.24: 79.8387, 1.25: 79.2, 1.26: 78.5714, 1.27: 77.9528, 1.28: 77.3438, 1.29: 76.7442, 1.3: 76.1538, 1.31: 75.5725, 1.32: 75.0, 1.33: 74.4361, 1.34: 73.8806, 1.35: 73.3333, 1.36: 72.7941, 1.37: 72.2628, 1.38: 71.7391, 1.39: 71.223, 1.4: 70.7143, 1.41: 70.2128, 1.42: 69.7183, 1.43: 69.2308, 1.44: 68.75, 1.45: 68.2759, 1.46: 67.8082, 1.47: 67.3469, 1.48: 66.8919, 1.49: 66.443, 1.5: 66.0, 1.51: 65.5629, 1.52: 65.1316, 1.53: 64.7059, 1.54: 64.2857, 1.55: 63.871, 1.56: 63.4615, 1.57: 63.0573, 1.58: 62.6582, 1.59: 62.2642, 1.6: 61.875, 1.61: 61.4907, 1.62: 61.1111, 1.63: 60.7362, 1.64: 60.3659, 1.65: 60.0, 1.66: 59.6386, 1.67: 59.2814, 1.68: 58.9286, 1.69: 58.5799, 1.7: 58.2353, 1.71: 57.8947, 1.72: 57.5581, 1.73: 57.2254, 1.74: 56.8966, 1.75: 56.5714, 1.76: 56.25, 1.77: 55.9322, 1.78: 55.618, 1.79: 55.3073, 1.8: 55.0, 1.81: 54.6961, 1.82: 54.3956, 1.83: 54.0984, 1.84: 53.8043, 1.85: 53.5135, 1.86: 53.2258, 1.87: 52.9412, 1.88: 52.6596, 1.89: 52.381, 1.9: 52.1053, 1.91: 51.8325, 1.92: 51.5625, 1.93: 51.2953, 1.94: 51.0309, 1.95: 50.7692, 1.96: 50.5102, 1.97: 50.2538, 1.98: 50.0, 1.99: 49.7487, 2.00: 49.5, 2.01: 49.2537, 2.02: 49.0099, 2.03: 48.7685, 2.04: 48.5294, 2.05: 48.2927, 2.06: 48.0583, 2.07: 47.8261, 2.08: 47.5962, 2.09: 47.3684, 2.1: 47.1429, 2.11: 46.9194, 2.12: 46.6981, 2.13: 46.4789, 2.14: 46.2617, 2.15: 46.0465, 2.16: 45.8333, 2.17: 45.6221, 2.18: 45.4128, 2.19: 45.2055, 2.2: 45.0, 2.21: 44.7964, 2.22: 44.5946, 2.23: 44.3946, 2.24: 44.1964, 2.25: 44.0, 2.26: 43.8053, 2.27: 43.6123, 2.28: 43.4211, 2.29: 43.2314, 2.3: 43.0435, 2.31: 42.8571, 2.32: 42.6724, 2.33: 42.4893, 2.34: 42.3077, 2.35: 42.1277, 2.36: 41.9492, 2.37: 41.7722, 2.38: 41.5966, 2.39: 41.4226, 2.4: 41.25, 2.41: 41.0788, 2.42: 40.9091, 2.43: 40.7407, 2.44: 40.5738, 2.45: 40.4082, 2.46: 40.2439, 2.47: 40.081, 2.48: 39.9194, 2.49: 39.759, 2.5: 39.6, 2.51: 39.4422, 2.52: 39.2857, 2.53: 39.1304, 2.54: 38.9764, 2.55: 38.8235, 2.56: 38.6719, 2.57: 38.5214, 2.58: 38.3721, 2.59: 38.2239, 2.6: 38.0769, 2.61: 37.931, 2.62: 37.7863, 2.63: 37.6426, 2.64: 37.5, 2.65: 37.3585, 2.66: 37.218, 2.67: 37.0787, 2.68: 36.9403, 2.69: 36.803, 2.7: 36.6667, 2.71: 36.5314, 2.72: 36.3971, 2.73: 36.2637, 2.74: 36.1314, 2.75: 36.0, 2.76: 35.8696, 2.77: 35.7401, 2.78: 35.6115, 2.79: 35.4839, 2.8: 35.3571, 2.81: 35.2313, 2.82: 35.1064, 2.83: 34.9823, 2.84: 34.8592, 2.85: 34.7368, 2.86: 34.6154, 2.87: 34.4948, 2.88: 34.375, 2.89: 34.2561, 2.9: 34.1379, 2.91: 34.0206, 2.92: 33.9041, 2.93: 33.7884, 2.94: 33.6735, 2.95: 33.5593, 2.96: 33.4459, 2.97: 33.3333, 2.98: 33.2215, 2.99: 33.1104, 3.00: 33.0, 3.01: 32.8904, 3.02: 32.7815, 3.03: 32.6733, 3.04: 32.5658, 3.05: 32.459, 3.06: 32.3529, 3.07: 32.2476, 3.08: 32.1429, 3.09: 32.0388, 3.1: 31.9355, 3.11: 31.8328, 3.12: 31.7308, 3.13: 31.6294, 3.14: 31.5287, 3.15: 31.4286, 3.16: 31.3291, 3.17: 31.2303, 3.18: 31.1321, 3.19: 31.0345, 3.2: 30.9375, 3.21: 30.8411, 3.22: 30.7453, 3.23: 30.6502, 3.24: 30.5556, 3.25: 30.4615, 3.26: 30.3681, 3.27: 30.2752, 3.28: 30.1829, 3.29: 30.0912, 3.3: 30.0, 3.31: 29.9094, 3.32: 29.8193, 3.33: 29.7297, 3.34: 29.6407, 3.35: 29.5522, 3.36: 29.4643, 3.37: 29.3769, 3.38: 29.2899, 3.39: 29.2035, 3.4: 29.1176, 3.41: 29.0323, 3.42: 28.9474, 3.43: 28.863, 3.44: 28.7791, 3.45: 28.6957, 3.46: 28.6127, 3.47: 28.5303, 3.48: 28.4483, 3.49: 28.3668, 3.5: 28.2857, 3.51: 28.2051, 3.52: 28.125, 3.53: 28.0453, 3.54: 27.9661, 3.55: 27.8873, 3.56: 27.809, 3.57: 27.7311, 3.58: 27.6536, 3.59: 27.5766, 3.6: 27.5, 3.61: 27.4238, 3.62: 27.3481, 3.63: 27.2727, 3.64: 27.1978, 3.65: 27.1233, 3.66: 27.0492, 3.67: 26.9755, 3.68: 26.9022, 3.69: 26.8293, 3.7: 26.7568, 3.71: 26.6846, 3.72: 26.6129, 3.73: 26.5416, 3.74: 26.4706, 3.75: 26.4, 3.76: 26.3298, 3.77: 26.2599, 3.78: 26.1905, 3.79: 26.1214, 3.8: 26.0526, 3.81: 25.9843, 3.82: 25.9162, 3.83: 25.8486, 3.84: 25.7812, 3.85: 25.7143, 3.86: 25.6477, 3.87: 25.5814, 3.88: 25.5155, 3.89: 25.4499, 3.9: 25.3846, 3.91: 25.3197, 3.92: 25.2551, 3.93: 25.1908, 3.94: 25.1269, 3.95: 25.0633, 3.96: 25.0, 3.97: 24.937, 3.98: 24.8744, 3.99: 24.812, 4.00: 24.75, 4.01: 24.6883, 4.02: 24.6269, 4.03: 24.5658, 4.04: 24.505, 4.05: 24.4444, 4.06: 24.3842, 4.07: 24.3243, 4.08: 24.2647, 4.09: 24.2054, 4.1: 24.1463, 4.11: 24.0876, 4.12: 24.0291, 4.13: 23.9709, 4.14: 23.913, 4.15: 23.8554, 4.16: 23.7981, 4.17: 23.741, 4.18: 23.6842, 4.19: 23.6277, 4.2: 23.5714, 4.21: 23.5154, 4.22: 23.4597, 4.23: 23.4043, 4.24: 23.3491, 4.25: 23.2941, 4.26: 23.2394, 4.27: 23.185, 4.28: 23.1308, 4.29: 23.0769, 4.3: 23.0233, 4.31: 22.9698, 4.32: 22.9167, 4.33: 22.8637, 4.34: 22.8111, 4.35: 22.7586, 4.36: 22.7064, 4.37: 22.6545, 4.38: 22.6027, 4.39: 22.5513, 4.4: 22.5, 4.41: 22.449, 4.42: 22.3982, 4.43: 22.3476, 4.44: 22.2973, 4.45: 22.2472, 4.46: 22.1973, 4.47: 22.1477, 4.48: 22.0982, 4.49: 22.049, 4.5: 22.0, 4.51: 21.9512, 4.52: 21.9027, 4.53: 21.8543, 4.54: 21.8062, 4.55: 21.7582, 4.56: 21.7105, 4.57: 21.663, 4.58: 21.6157, 4.59: 21.5686, 4.6: 21.5217, 4.61: 21.4751, 4.62: 21.4286, 4.63: 21.3823, 4.64: 21.3362, 4.65: 21.2903, 4.66: 21.2446, 4.67: 21.1991, 4.68: 21.1538, 4.69: 21.1087, 4.7: 21.0638, 4.71: 21.0191, 4.72: 20.9746, 4.73: 20.9302, 4.74: 20.8861, 4.75: 20.8421, 4.76: 20.7983, 4.77: 20.7547, 4.78: 20.7113, 4.79: 20.6681, 4.8: 20.625, 4.81: 20.5821, 4.82: 20.5394, 4.83: 20.4969, 4.84: 20.4545, 4.85: 20.4124, 4.86: 20.3704, 4.87: 20.3285, 4.88: 20.2869, 4.89: 20.2454, 4.9: 20.2041, 4.91: 20.1629, 4.92: 20.122, 4.93: 20.0811, 4.94: 20.0405, 4.95: 20.0, 4.96: 19.9597, 4.97: 19.9195, 4.98: 19.8795, 4.99: 19.8397, 5.00: 19.8, 5.01: 19.7605, 5.02: 19.7211, 5.03: 19.6819, 5.04: 19.6429, 5.05: 19.604, 5.06: 19.5652, 5.07: 19.5266, 5.08: 19.4882, 5.09: 19.4499, 5.1: 19.4118, 5.11: 19.3738, 5.12: 19.3359, 5.13: 19.2982, 5.14: 19.2607, 5.15: 19.2233, 5.16: 19.186, 5.17: 19.1489, 5.18: 19.112, 5.19: 19.0751, 5.2: 19.0385, 5.21: 19.0019, 5.22: 18.9655, 5.23: 18.9293, 5.24: 18.8931, 5.25: 18.8571, 5.26: 18.8213, 5.27: 18.7856, 5.28: 18.75, 5.29: 18.7146, 5.3: 18.6792, 5.31: 18.6441, 5.32: 18.609, 5.33: 18.5741, 5.34: 18.5393, 5.35: 18.5047, 5.36: 18.4701, 5.37: 18.4358, 5.38: 18.4015, 5.39: 18.3673, 5.4: 18.3333, 5.41: 18.2994, 5.42: 18.2657, 5.43: 18.232, 5.44: 18.1985, 5.45: 18.1651, 5.46: 18.1319, 5.47: 18.0987, 5.48: 18.0657, 5.49: 18.0328, 5.5: 18.0, 5.51: 17.9673, 5.52: 17.9348, 5.53: 17.9024, 5.54: 17.87, 5.55: 17.8378, 5.56: 17.8058, 5.57: 17.7738, 5.58: 17.7419, 5.59: 17.7102, 5.6: 17.6786, 5.61: 17.6471, 5.62: 17.6157, 5.63: 17.5844, 5.64: 17.5532, 5.65: 17.5221, 5.66: 17.4912, 5.67: 17.4603, 5.68: 17.4296, 5.69: 17.3989, 5.7: 17.3684, 5.71: 17.338, 5.72: 17.3077, 5.73: 17.2775, 5.74: 17.2474, 5.75: 17.2174, 5.76: 17.1875, 5.77: 17.1577, 5.78: 17.128, 5.79: 17.0984, 5.8: 17.069, 5.81: 17.0396, 5.82: 17.0103, 5.83: 16.9811, 5.84: 16.9521, 5.85: 16.9231, 5.86: 16.8942, 5.87: 16.8654, 5.88: 16.8367, 5.89: 16.8081, 5.9: 16.7797, 5.91: 16.7513, 5.92: 16.723, 5.93: 16.6948, 5.94: 16.6667, 5.95: 16.6387, 5.96: 16.6107, 5.97: 16.5829, 5.98: 16.5552, 5.99: 16.5275, 6.00: 16.5, 6.01: 16.4725, 6.02: 16.4452, 6.03: 16.4179, 6.04: 16.3907, 6.05: 16.3636, 6.06: 16.3366, 6.07: 16.3097, 6.08: 16.2829, 6.09: 16.2562, 6.1: 16.2295, 6.11: 16.2029, 6.12: 16.1765, 6.13: 16.1501, 6.14: 16.1238, 6.15: 16.0976, 6.16: 16.0714, 6.17: 16.0454, 6.18: 16.0194, 6.19: 15.9935, 6.2: 15.9677, 6.21: 15.942, 6.22: 15.9164, 6.23: 15.8909, 6.24: 15.8654, 6.25: 15.84, 6.26: 15.8147, 6.27: 15.7895, 6.28: 15.7643, 6.29: 15.7393, 6.3: 15.7143, 6.31: 15.6894, 6.32: 15.6646, 6.33: 15.6398, 6.34: 15.6151, 6.35: 15.5906, 6.36: 15.566, 6.37: 15.5416, 6.38: 15.5172, 6.39: 15.493, 6.4: 15.4688, 6.41: 15.4446, 6.42: 15.4206, 6.43: 15.3966, 6.44: 15.3727, 6.45: 15.3488, 6.46: 15.3251, 6.47: 15.3014, 6.48: 15.2778, 6.49: 15.2542, 6.5: 15.2308, 6.51: 15.2074, 6.52: 15.184, 6.53: 15.1608, 6.54: 15.1376, 6.55: 15.1145, 6.56: 15.0915, 6.57: 15.0685, 6.58: 15.0456, 6.59: 15.0228, 6.6: 15.0, 6.61: 14.9773, 6.62: 14.9547, 6.63: 14.9321, 6.64: 14.9096, 6.65: 14.8872, 6.66: 14.8649, 6.67: 14.8426, 6.68: 14.8204, 6.69: 14.7982, 6.7: 14.7761, 6.71: 14.7541, 6.72: 14.7321, 6.73: 14.7103, 6.74: 14.6884, 6.75: 14.6667, 6.76: 14.645, 6.77: 14.6233, 6.78: 14.6018, 6.79: 14.5803, 6.8: 14.5588, 6.81: 14.5374, 6.82: 14.5161, 6.83: 14.4949, 6.84: 14.4737, 6.85: 14.4526, 6.86: 14.4315, 6.87: 14.4105, 6.88: 14.3895, 6.89: 14.3687, 6.9: 14.3478, 6.91: 14.3271, 6.92: 14.3064, 6.93: 14.2857, 6.94: 14.2651, 6.95: 14.2446, 6.96: 14.2241, 6.97: 14.2037, 6.98: 14.1834, 6.99: 14.1631, 7.00: 14.1429, 7.01: 14.1227, 7.02: 14.1026, 7.03: 14.0825, 7.04: 14.0625, 7.05: 14.0426, 7.06: 14.0227, 7.07: 14.0028, 7.08: 13.9831, 7.09: 13.9633, 7.1: 13.9437, 7.11: 13.9241, 7.12: 13.9045, 7.13: 13.885, 7.14: 13.8655, 7.15: 13.8462, 7.16: 13.8268, 7.17: 13.8075, 7.18: 13.7883, 7.19: 13.7691, 7.2: 13.75, 7.21: 13.7309, 7.22: 13.7119, 7.23: 13.6929, 7.24: 13.674, 7.25: 13.6552, 7.26: 13.6364, 7.27: 13.6176, 7.28: 13.5989, 7.29: 13.5802, 7.3: 13.5616, 7.31: 13.5431, 7.32: 13.5246, 7.33: 13.5061, 7.34: 13.4877, 7.35: 13.4694, 7.36: 13.4511, 7.37: 13.4328, 7.38: 13.4146, 7.39: 13.3965, 7.4: 13.3784, 7.41: 13.3603, 7.42: 13.3423, 7.43: 13.3244, 7.44: 13.3065, 7.45: 13.2886, 7.46: 13.2708, 7.47: 13.253, 7.48: 13.2353, 7.49: 13.2176, 7.5: 13.2, 7.51: 13.1824, 7.52: 13.1649, 7.53: 13.1474, 7.54: 13.13, 7.55: 13.1126, 7.56: 13.0952, 7.57: 13.0779, 7.58: 13.0607, 7.59: 13.0435, 7.6: 13.0263, 7.61: 13.0092, 7.62: 12.9921, 7.63: 12.9751, 7.64: 12.9581, 7.65: 12.9412, 7.66: 12.9243, 7.67: 12.9074, 7.68: 12.8906, 7.69: 12.8739, 7.7: 12.8571, 7.71: 12.8405, 7.72: 12.8238, 7.73: 12.8072, 7.74: 12.7907, 7.75: 12.7742, 7.76: 12.7577, 7.77: 12.7413, 7.78: 12.7249, 7.79: 12.7086, 7.8: 12.6923, 7.81: 12.6761, 7.82: 12.6598, 7.83: 12.6437, 7.84: 12.6276, 7.85: 12.6115, 7.86: 12.5954, 7.87: 12.5794, 7.88: 12.5635, 7.89: 12.5475, 7.9: 12.5316, 7.91: 12.5158, 7.92: 12.5, 7.93: 12.4842, 7.94: 12.4685, 7.95: 12.4528, 7.96: 12.4372, 7.97: 12.4216, 7.98: 12.406, 7.99: 12.3905, 8.00: 12.375, 8.01: 12.3596, 8.02: 12.3441, 8.03: 12.3288, 8.04: 12.3134, 8.05: 12.2981, 8.06: 12.2829, 8.07: 12.2677, 8.08: 12.2525, 8.09: 12.2373, 8.1: 12.2222, 8.11: 12.2072, 8.12: 12.1921, 8.13: 12.1771, 8.14: 12.1622, 8.15: 12.1472, 8.16: 12.1324, 8.17: 12.1175, 8.18: 12.1027, 8.19: 12.0879, 8.2: 12.0732, 8.21: 12.0585, 8.22: 12.0438, 8.23: 12.0292, 8.24: 12.0146, 8.25: 12.0, 8.26: 11.9855, 8.27: 11.971, 8.28: 11.9565, 8.29: 11.9421, 8.3: 11.9277, 8.31: 11.9134, 8.32: 11.899, 8.33: 11.8848, 8.34: 11.8705, 8.35: 11.8563, 8.36: 11.8421, 8.37: 11.828, 8.38: 11.8138, 8.39: 11.7998, 8.4: 11.7857, 8.41: 11.7717, 8.42: 11.7577, 8.43: 11.7438, 8.44: 11.7299, 8.45: 11.716, 8.46: 11.7021, 8.47: 11.6883, 8.48: 11.6745, 8.49: 11.6608, 8.5: 11.6471, 8.51: 11.6334, 8.52: 11.6197, 8.53: 11.6061, 8.54: 11.5925, 8.55: 11.5789, 8.56: 11.5654, 8.57: 11.5519, 8.58: 11.5385, 8.59: 11.525, 8.6: 11.5116, 8.61: 11.4983, 8.62: 11.4849, 8.63: 11.4716, 8.64: 11.4583, 8.65: 11.4451, 8.66: 11.4319, 8.67: 11.4187, 8.68: 11.4055, 8.69: 11.3924, 8.7: 11.3793, 8.71: 11.3662, 8.72: 11.3532, 8.73: 11.3402, 8.74: 11.3272, 8.75: 11.3143, 8.76: 11.3014, 8.77: 11.2885, 8.78: 11.2756, 8.79: 11.2628, 8.8: 11.25, 8.81: 11.2372, 8.82: 11.2245, 8.83: 11.2118, 8.84: 11.1991, 8.85: 11.1864, 8.86: 11.1738, 8.87: 11.1612, 8.88: 11.1486, 8.89: 11.1361, 8.9: 11.1236, 8.91: 11.1111, 8.92: 11.0987, 8.93: 11.0862, 8.94: 11.0738, 8.95: 11.0615, 8.96: 11.0491, 8.97: 11.0368, 8.98: 11.0245, 8.99: 11.0122, 9.00: 11.0, 9.01: 10.9878, 9.02: 10.9756, 9.03: 10.9635, 9.04: 10.9513, 9.05: 10.9392, 9.06: 10.9272, 9.07: 10.9151, 9.08: 10.9031, 9.09: 10.8911, 9.1: 10.8791, 9.11: 10.8672, 9.12: 10.8553, 9.13: 10.8434, 9.14: 10.8315, 9.15: 10.8197, 9.16: 10.8079, 9.17: 10.7961, 9.18: 10.7843, 9.19: 10.7726, 9.2: 10.7609, 9.21: 10.7492, 9.22: 10.7375, 9.23: 10.7259, 9.24: 10.7143, 9.25: 10.7027, 9.26: 10.6911, 9.27: 10.6796, 9.28: 10.6681, 9.29: 10.6566, 9.3: 10.6452, 9.31: 10.6337, 9.32: 10.6223, 9.33: 10.6109, 9.34: 10.5996, 9.35: 10.5882, 9.36: 10.5769, 9.37: 10.5656, 9.38: 10.5544, 9.39: 10.5431, 9.4: 10.5319, 9.41: 10.5207, 9.42: 10.5096, 9.43: 10.4984, 9.44: 10.4873, 9.45: 10.4762, 9.46: 10.4651, 9.47: 10.4541, 9.48: 10.443, 9.49: 10.432, 9.5: 10.4211, 9.51: 10.4101, 9.52: 10.3992, 9.53: 10.3882, 9.54: 10.3774, 9.55: 10.3665, 9.56: 10.3556, 9.57: 10.3448, 9.58: 10.334, 9.59: 10.3233, 9.6: 10.3125, 9.61: 10.3018, 9.62: 10.2911, 9.63: 10.2804, 9.64: 10.2697, 9.65: 10.2591, 9.66: 10.2484, 9.67: 10.2378, 9.68: 10.2273, 9.69: 10.2167, 9.7: 10.2062, 9.71: 10.1957, 9.72: 10.1852, 9.73: 10.1747, 9.74: 10.1643, 9.75: 10.1538, 9.76: 10.1434, 9.77: 10.1331, 9.78: 10.1227, 9.79: 10.1124, 9.8: 10.102, 9.81: 10.0917, 9.82: 10.0815, 9.83: 10.0712, 9.84: 10.061, 9.85: 10.0508, 9.86: 10.0406, 9.87: 10.0304, 9.88: 10.0202, 9.89: 10.0101, 9.9: 10.0, 9.91: 9.9899, 9.92: 9.9798, 9.93: 9.9698, 9.94: 9.9598, 9.95: 9.9497, 9.96: 9.9398, 9.97: 9.9298, 9.98: 9.9198, 9.99: 9.9099, 10.00: 9.9, 10.01: 9.8901, 10.02: 9.8802, 10.03: 9.8704, 10.04: 9.8606, 10.05: 9.8507, 10.06: 9.841, 10.07: 9.8312, 10.08: 9.8214, 10.09: 9.8117, 10.1: 9.802, 10.11: 9.7923, 10.12: 9.7826, 10.13: 9.773, 10.14: 9.7633, 10.15: 9.7537, 10.16: 9.7441, 10.17: 9.7345, 10.18: 9.725, 10.19: 9.7154, 10.2: 9.7059, 10.21: 9.6964, 10.22: 9.6869, 10.23: 9.6774, 10.24: 9.668, 10.25: 9.6585, 10.26: 9.6491, 10.27: 9.6397, 10.28: 9.6304, 10.29: 9.621, 10.3: 9.6117, 10.31: 9.6023, 10.32: 9.593, 10.33: 9.5837, 10.34: 9.5745, 10.35: 9.5652, 10.36: 9.556, 10.37: 9.5468, 10.38: 9.5376, 10.39: 9.5284, 10.4: 9.5192, 10.41: 9.5101, 10.42: 9.501, 10.43: 9.4919, 10.44: 9.4828, 10.45: 9.4737, 10.46: 9.4646, 10.47: 9.4556, 10.48: 9.4466, 10.49: 9.4376, 10.5: 9.4286, 10.51: 9.4196, 10.52: 9.4106, 10.53: 9.4017, 10.54: 9.3928, 10.55: 9.3839, 10.56: 9.375, 10.57: 9.3661, 10.58: 9.3573, 10.59: 9.3484, 10.6: 9.3396, 10.61: 9.3308, 10.62: 9.322, 10.63: 9.3133, 10.64: 9.3045, 10.65: 9.2958, 10.66: 9.2871, 10.67: 9.2784, 10.68: 9.2697, 10.69: 9.261, 10.7: 9.2523, 10.71: 9.2437, 10.72: 9.2351, 10.73: 9.2265, 10.74: 9.2179, 10.75: 9.2093, 10.76: 9.2007, 10.77: 9.1922, 10.78: 9.1837, 10.79: 9.1752, 10.8: 9.1667, 10.81: 9.1582, 10.82: 9.1497, 10.83: 9.1413, 10.84: 9.1328, 10.85: 9.1244, 10.86: 9.116, 10.87: 9.1076, 10.88: 9.0993, 10.89: 9.0909, 10.9: 9.0826, 10.91: 9.0742, 10.92: 9.0659, 10.93: 9.0576, 10.94: 9.0494, 10.95: 9.0411, 10.96: 9.0328, 10.97: 9.0246, 10.98: 9.0164, 10.99: 9.0082, 11.00: 9.0, 11.01: 8.9918, 11.02: 8.9837, 11.03: 8.9755, 11.04: 8.9674, 11.05: 8.9593, 11.06: 8.9512, 11.07: 8.9431, 11.08: 8.935, 11.09: 8.927, 11.1: 8.9189, 11.11: 8.9109, 11.12: 8.9029, 11.13: 8.8949, 11.14: 8.8869, 11.15: 8.8789, 11.16: 8.871, 11.17: 8.863, 11.18: 8.8551, 11.19: 8.8472, 11.2: 8.8393, 11.21: 8.8314, 11.22: 8.8235, 11.23: 8.8157, 11.24: 8.8078, 11.25: 8.8, 11.26: 8.7922, 11.27: 8.7844, 11.28: 8.7766, 11.29: 8.7688, 11.3: 8.7611, 11.31: 8.7533, 11.32: 8.7456, 11.33: 8.7379, 11.34: 8.7302, 11.35: 8.7225, 11.36: 8.7148, 11.37: 8.7071, 11.38: 8.6995, 11.39: 8.6918, 11.4: 8.6842, 11.41: 8.6766, 11.42: 8.669, 11.43: 8.6614, 11.44: 8.6538, 11.45: 8.6463, 11.46: 8.6387, 11.47: 8.6312, 11.48: 8.6237, 11.49: 8.6162, 11.5: 8.6087, 11.51: 8.6012, 11.52: 8.5938, 11.53: 8.5863, 11.54: 8.5789, 11.55: 8.5714, 11.56: 8.564, 11.57: 8.5566, 11.58: 8.5492, 11.59: 8.5418, 11.6: 8.5345, 11.61: 8.5271, 11.62: 8.5198, 11.63: 8.5125, 11.64: 8.5052, 11.65: 8.4979, 11.66: 8.4906, 11.67: 8.4833, 11.68: 8.476, 11.69: 8.4688, 11.7: 8.4615, 11.71: 8.4543, 11.72: 8.4471, 11.73: 8.4399, 11.74: 8.4327, 11.75: 8.4255, 11.76: 8.4184, 11.77: 8.4112, 11.78: 8.4041, 11.79: 8.3969, 11.8: 8.3898, 11.81: 8.3827, 11.82: 8.3756, 11.83: 8.3686, 11.84: 8.3615, 11.85: 8.3544, 11.86: 8.3474, 11.87: 8.3404, 11.88: 8.3333, 11.89: 8.3263, 11.9: 8.3193, 11.91: 8.3123, 11.92: 8.3054, 11.93: 8.2984, 11.94: 8.2915, 11.95: 8.2845, 11.96: 8.2776, 11.97: 8.2707, 11.98: 8.2638, 11.99: 8.2569, 12.00: 8.25, 12.01: 8.2431, 12.02: 8.2363, 12.03: 8.2294, 12.04: 8.2226, 12.05: 8.2158, 12.06: 8.209, 12.07: 8.2022, 12.08: 8.1954, 12.09: 8.1886, 12.1: 8.1818, 12.11: 8.1751, 12.12: 8.1683, 12.13: 8.1616, 12.14: 8.1549, 12.15: 8.1481, 12.16: 8.1414, 12.17: 8.1348, 12.18: 8.1281, 12.19: 8.1214, 12.2: 8.1148, 12.21: 8.1081, 12.22: 8.1015, 12.23: 8.0948, 12.24: 8.0882, 12.25: 8.0816, 12.26: 8.075, 12.27: 8.0685, 12.28: 8.0619, 12.29: 8.0553, 12.3: 8.0488, 12.31: 8.0422, 12.32: 8.0357, 12.33: 8.0292, 12.34: 8.0227, 12.35: 8.0162, 12.36: 8.0097, 12.37: 8.0032, 12.38: 7.9968, 12.39: 7.9903, 12.4: 7.9839, 12.41: 7.9774, 12.42: 7.971, 12.43: 7.9646, 12.44: 7.9582, 12.45: 7.9518, 12.46: 7.9454, 12.47: 7.9391, 12.48: 7.9327, 12.49: 7.9263, 12.5: 7.92, 12.51: 7.9137, 12.52: 7.9073, 12.53: 7.901, 12.54: 7.8947, 12.55: 7.8884, 12.56: 7.8822, 12.57: 7.8759, 12.58: 7.8696, 12.59: 7.8634, 12.6: 7.8571, 12.61: 7.8509, 12.62: 7.8447, 12.63: 7.8385, 12.64: 7.8323, 12.65: 7.8261, 12.66: 7.8199, 12.67: 7.8137, 12.68: 7.8076, 12.69: 7.8014, 12.7: 7.7953, 12.71: 7.7891, 12.72: 7.783, 12.73: 7.7769, 12.74: 7.7708, 12.75: 7.7647, 12.76: 7.7586, 12.77: 7.7525, 12.78: 7.7465, 12.79: 7.7404, 12.8: 7.7344, 12.81: 7.7283, 12.82: 7.7223, 12.83: 7.7163, 12.84: 7.7103, 12.85: 7.7043, 12.86: 7.6983, 12.87: 7.6923, 12.88: 7.6863, 12.89: 7.6804, 12.9: 7.6744, 12.91: 7.6685, 12.92: 7.6625, 12.93: 7.6566, 12.94: 7.6507, 12.95: 7.6448, 12.96: 7.6389, 12.97: 7.633, 12.98: 7.6271, 12.99: 7.6212, 13.00: 7.6154, 13.01: 7.6095, 13.02: 7.6037, 13.03: 7.5979, 13.04: 7.592, 13.05: 7.5862, 13.06: 7.5804, 13.07: 7.5746, 13.08: 7.5688, 13.09: 7.563, 13.1: 7.5573, 13.11: 7.5515, 13.12: 7.5457, 13.13: 7.54, 13.14: 7.5342, 13.15: 7.5285, 13.16: 7.5228, 13.17: 7.5171, 13.18: 7.5114, 13.19: 7.5057, 13.2: 7.5, 13.21: 7.4943, 13.22: 7.4887, 13.23: 7.483, 13.24: 7.4773, 13.25: 7.4717, 13.26: 7.4661, 13.27: 7.4604, 13.28: 7.4548, 13.29: 7.4492, 13.3: 7.4436, 13.31: 7.438, 13.32: 7.4324, 13.33: 7.4269, 13.34: 7.4213, 13.35: 7.4157, 13.36: 7.4102, 13.37: 7.4046, 13.38: 7.3991, 13.39: 7.3936, 13.4: 7.3881, 13.41: 7.3826, 13.42: 7.377, 13.43: 7.3716, 13.44: 7.3661, 13.45: 7.3606, 13.46: 7.3551, 13.47: 7.3497, 13.48: 7.3442, 13.49: 7.3388, 13.5: 7.3333, 13.51: 7.3279, 13.52: 7.3225, 13.53: 7.3171, 13.54: 7.3117, 13.55: 7.3063, 13.56: 7.3009, 13.57: 7.2955, 13.58: 7.2901, 13.59: 7.2848, 13.6: 7.2794, 13.61: 7.2741, 13.62: 7.2687, 13.63: 7.2634, 13.64: 7.2581, 13.65: 7.2527, 13.66: 7.2474, 13.67: 7.2421, 13.68: 7.2368, 13.69: 7.2316, 13.7: 7.2263, 13.71: 7.221, 13.72: 7.2157, 13.73: 7.2105, 13.74: 7.2052, 13.75: 7.2, 13.76: 7.1948, 13.77: 7.1895, 13.78: 7.1843, 13.79: 7.1791, 13.8: 7.1739, 13.81: 7.1687, 13.82: 7.1635, 13.83: 7.1584, 13.84: 7.1532, 13.85: 7.148, 13.86: 7.1429, 13.87: 7.1377, 13.88: 7.1326, 13.89: 7.1274, 13.9: 7.1223, 13.91: 7.1172, 13.92: 7.1121, 13.93: 7.107, 13.94: 7.1019, 13.95: 7.0968, 13.96: 7.0917, 13.97: 7.0866, 13.98: 7.0815, 13.99: 7.0765, 14.00: 7.0714, 14.01: 7.0664, 14.02: 7.0613, 14.03: 7.0563, 14.04: 7.0513, 14.05: 7.0463, 14.06: 7.0413, 14.07: 7.0362, 14.08: 7.0312, 14.09: 7.0263, 14.1: 7.0213, 14.11: 7.0163, 14.12: 7.0113, 14.13: 7.0064, 14.14: 7.0014, 14.15: 6.9965, 14.16: 6.9915, 14.17: 6.9866, 14.18: 6.9817, 14.19: 6.9767, 14.2: 6.9718, 14.21: 6.9669, 14.22: 6.962, 14.23: 6.9571, 14.24: 6.9522, 14.25: 6.9474, 14.26: 6.9425, 14.27: 6.9376, 14.28: 6.9328, 14.29: 6.9279, 14.3: 6.9231, 14.31: 6.9182, 14.32: 6.9134, 14.33: 6.9086, 14.34: 6.9038, 14.35: 6.899, 14.36: 6.8942, 14.37: 6.8894, 14.38: 6.8846, 14.39: 6.8798, 14.4: 6.875, 14.41: 6.8702, 14.42: 6.8655, 14.43: 6.8607, 14.44: 6.856, 14.45: 6.8512, 14.46: 6.8465, 14.47: 6.8417, 14.48: 6.837, 14.49: 6.8323, 14.5: 6.8276, 14.51: 6.8229, 14.52: 6.8182, 14.53: 6.8135, 14.54: 6.8088, 14.55: 6.8041, 14.56: 6.7995, 14.57: 6.7948, 14.58: 6.7901, 14.59: 6.7855, 14.6: 6.7808, 14.61: 6.7762, 14.62: 6.7715, 14.63: 6.7669, 14.64: 6.7623, 14.65: 6.7577, 14.66: 6.7531, 14.67: 6.7485, 14.68: 6.7439, 14.69: 6.7393, 14.7: 6.7347, 14.71: 6.7301, 14.72: 6.7255, 14.73: 6.721, 14.74: 6.7164, 14.75: 6.7119, 14.76: 6.7073, 14.77: 6.7028, 14.78: 6.6982, 14.79: 6.6937, 14.8: 6.6892, 14.81: 6.6847, 14.82: 6.6802, 14.83: 6.6757, 14.84: 6.6712, 14.85: 6.6667, 14.86: 6.6622, 14.87: 6.6577, 14.88: 6.6532, 14.89: 6.6488, 14.9: 6.6443, 14.91: 6.6398, 14.92: 6.6354, 14.93: 6.6309, 14.94: 6.6265, 14.95: 6.6221, 14.96: 6.6176, 14.97: 6.6132, 14.98: 6.6088, 14.99: 6.6044, 15.00: 6.6, 15.01: 6.5956, 15.02: 6.5912, 15.03: 6.5868, 15.04: 6.5824, 15.05: 6.5781, 15.06: 6.5737, 15.07: 6.5693, 15.08: 6.565, 15.09: 6.5606, 15.1: 6.5563, 15.11: 6.552, 15.12: 6.5476, 15.13: 6.5433, 15.14: 6.539, 15.15: 6.5347, 15.16: 6.5303, 15.17: 6.526, 15.18: 6.5217, 15.19: 6.5174, 15.2: 6.5132, 15.21: 6.5089, 15.22: 6.5046, 15.23: 6.5003, 15.24: 6.4961, 15.25: 6.4918, 15.26: 6.4875, 15.27: 6.4833, 15.28: 6.4791, 15.29: 6.4748, 15.3: 6.4706, 15.31: 6.4664, 15.32: 6.4621, 15.33: 6.4579, 15.34: 6.4537, 15.35: 6.4495, 15.36: 6.4453, 15.37: 6.4411, 15.38: 6.4369, 15.39: 6.4327, 15.4: 6.4286, 15.41: 6.4244, 15.42: 6.4202, 15.43: 6.4161, 15.44: 6.4119, 15.45: 6.4078, 15.46: 6.4036, 15.47: 6.3995, 15.48: 6.3953, 15.49: 6.3912, 15.5: 6.3871, 15.51: 6.383, 15.52: 6.3789, 15.53: 6.3748, 15.54: 6.3707, 15.55: 6.3666, 15.56: 6.3625, 15.57: 6.3584, 15.58: 6.3543, 15.59: 6.3502, 15.6: 6.3462, 15.61: 6.3421, 15.62: 6.338, 15.63: 6.334, 15.64: 6.3299, 15.65: 6.3259, 15.66: 6.3218, 15.67: 6.3178, 15.68: 6.3138, 15.69: 6.3098, 15.7: 6.3057, 15.71: 6.3017, 15.72: 6.2977, 15.73: 6.2937, 15.74: 6.2897, 15.75: 6.2857, 15.76: 6.2817, 15.77: 6.2777, 15.78: 6.2738, 15.79: 6.2698, 15.8: 6.2658, 15.81: 6.2619, 15.82: 6.2579, 15.83: 6.2539, 15.84: 6.25, 15.85: 6.2461, 15.86: 6.2421, 15.87: 6.2382, 15.88: 6.2343, 15.89: 6.2303, 15.9: 6.2264, 15.91: 6.2225, 15.92: 6.2186, 15.93: 6.2147, 15.94: 6.2108, 15.95: 6.2069, 15.96: 6.203, 15.97: 6.1991, 15.98: 6.1952, 15.99: 6.1914, 16.00: 6.1875, 16.01: 6.1836, 16.02: 6.1798, 16.03: 6.1759, 16.04: 6.1721, 16.05: 6.1682, 16.06: 6.1644, 16.07: 6.1605, 16.08: 6.1567, 16.09: 6.1529, 16.1: 6.1491, 16.11: 6.1453, 16.12: 6.1414, 16.13: 6.1376, 16.14: 6.1338, 16.15: 6.13, 16.16: 6.1262, 16.17: 6.1224, 16.18: 6.1187, 16.19: 6.1149, 16.2: 6.1111, 16.21: 6.1073, 16.22: 6.1036, 16.23: 6.0998, 16.24: 6.0961, 16.25: 6.0923, 16.26: 6.0886, 16.27: 6.0848, 16.28: 6.0811, 16.29: 6.0773, 16.3: 6.0736, 16.31: 6.0699, 16.32: 6.0662, 16.33: 6.0625, 16.34: 6.0588, 16.35: 6.055, 16.36: 6.0513, 16.37: 6.0476, 16.38: 6.044, 16.39: 6.0403, 16.4: 6.0366, 16.41: 6.0329, 16.42: 6.0292, 16.43: 6.0256, 16.44: 6.0219, 16.45: 6.0182, 16.46: 6.0146, 16.47: 6.0109, 16.48: 6.0073, 16.49: 6.0036, 16.5: 6.0, 16.51: 5.9964, 16.52: 5.9927, 16.53: 5.9891, 16.54: 5.9855, 16.55: 5.9819, 16.56: 5.9783, 16.57: 5.9747, 16.58: 5.971, 16.59: 5.9675, 16.6: 5.9639, 16.61: 5.9603, 16.62: 5.9567, 16.63: 5.9531, 16.64: 5.9495, 16.65: 5.9459, 16.66: 5.9424, 16.67: 5.9388, 16.68: 5.9353, 16.69: 5.9317, 16.7: 5.9281, 16.71: 5.9246, 16.72: 5.9211, 16.73: 5.9175, 16.74: 5.914, 16.75: 5.9104, 16.76: 5.9069, 16.77: 5.9034, 16.78: 5.8999, 16.79: 5.8964, 16.8: 5.8929, 16.81: 5.8894, 16.82: 5.8859, 16.83: 5.8824, 16.84: 5.8789, 16.85: 5.8754, 16.86: 5.8719, 16.87: 5.8684, 16.88: 5.8649, 16.89: 5.8615, 16.9: 5.858, 16.91: 5.8545, 16.92: 5.8511, 16.93: 5.8476, 16.94: 5.8442, 16.95: 5.8407, 16.96: 5.8373, 16.97: 5.8338, 16.98: 5.8304, 16.99: 5.827, 17.00: 5.8235, 17.01: 5.8201, 17.02: 5.8167, 17.03: 5.8133, 17.04: 5.8099, 17.05: 5.8065, 17.06: 5.803, 17.07: 5.7996, 17.08: 5.7963, 17.09: 5.7929, 17.1: 5.7895, 17.11: 5.7861, 17.12: 5.7827, 17.13: 5.7793, 17.14: 5.776, 17.15: 5.7726, 17.16: 5.7692, 17.17: 5.7659, 17.18: 5.7625, 17.19: 5.7592, 17.2: 5.7558, 17.21: 5.7525, 17.22: 5.7491, 17.23: 5.7458, 17.24: 5.7425, 17.25: 5.7391, 17.26: 5.7358, 17.27: 5.7325, 17.28: 5.7292, 17.29: 5.7259, 17.3: 5.7225, 17.31: 5.7192, 17.32: 5.7159, 17.33: 5.7126, 17.34: 5.7093, 17.35: 5.7061, 17.36: 5.7028, 17.37: 5.6995, 17.38: 5.6962, 17.39: 5.6929, 17.4: 5.6897, 17.41: 5.6864, 17.42: 5.6831, 17.43: 5.6799, 17.44: 5.6766, 17.45: 5.6734, 17.46: 5.6701, 17.47: 5.6669, 17.48: 5.6636, 17.49: 5.6604, 17.5: 5.6571, 17.51: 5.6539, 17.52: 5.6507, 17.53: 5.6475, 17.54: 5.6442, 17.55: 5.641, 17.56: 5.6378, 17.57: 5.6346, 17.58: 5.6314, 17.59: 5.6282, 17.6: 5.625, 17.61: 5.6218, 17.62: 5.6186, 17.63: 5.6154, 17.64: 5.6122, 17.65: 5.6091, 17.66: 5.6059, 17.67: 5.6027, 17.68: 5.5995, 17.69: 5.5964, 17.7: 5.5932, 17.71: 5.5901, 17.72: 5.5869, 17.73: 5.5838, 17.74: 5.5806, 17.75: 5.5775, 17.76: 5.5743, 17.77: 5.5712, 17.78: 5.5681, 17.79: 5.5649, 17.8: 5.5618, 17.81: 5.5587, 17.82: 5.5556, 17.83: 5.5524, 17.84: 5.5493, 17.85: 5.5462, 17.86: 5.5431, 17.87: 5.54, 17.88: 5.5369, 17.89: 5.5338, 17.9: 5.5307, 17.91: 5.5276, 17.92: 5.5246, 17.93: 5.5215, 17.94: 5.5184, 17.95: 5.5153, 17.96: 5.5122, 17.97: 5.5092, 17.98: 5.5061, 17.99: 5.5031, 18.00: 5.5, 18.01: 5.4969, 18.02: 5.4939, 18.03: 5.4908, 18.04: 5.4878, 18.05: 5.4848, 18.06: 5.4817, 18.07: 5.4787, 18.08: 5.4757, 18.09: 5.4726, 18.1: 5.4696, 18.11: 5.4666, 18.12: 5.4636, 18.13: 5.4606, 18.14: 5.4576, 18.15: 5.4545, 18.16: 5.4515, 18.17: 5.4485, 18.18: 5.4455, 18.19: 5.4426, 18.2: 5.4396, 18.21: 5.4366, 18.22: 5.4336, 18.23: 5.4306, 18.24: 5.4276, 18.25: 5.4247, 18.26: 5.4217, 18.27: 5.4187, 18.28: 5.4158, 18.29: 5.4128, 18.3: 5.4098, 18.31: 5.4069, 18.32: 5.4039, 18.33: 5.401, 18.34: 5.398, 18.35: 5.3951, 18.36: 5.3922, 18.37: 5.3892, 18.38: 5.3863, 18.39: 5.3834, 18.4: 5.3804, 18.41: 5.3775, 18.42: 5.3746, 18.43: 5.3717, 18.44: 5.3688, 18.45: 5.3659, 18.46: 5.3629, 18.47: 5.36, 18.48: 5.3571, 18.49: 5.3542, 18.5: 5.3514, 18.51: 5.3485, 18.52: 5.3456, 18.53: 5.3427, 18.54: 5.3398, 18.55: 5.3369, 18.56: 5.3341, 18.57: 5.3312, 18.58: 5.3283, 18.59: 5.3254, 18.6: 5.3226, 18.61: 5.3197, 18.62: 5.3169, 18.63: 5.314, 18.64: 5.3112, 18.65: 5.3083, 18.66: 5.3055, 18.67: 5.3026, 18.68: 5.2998, 18.69: 5.297, 18.7: 5.2941, 18.71: 5.2913, 18.72: 5.2885, 18.73: 5.2856, 18.74: 5.2828, 18.75: 5.28, 18.76: 5.2772, 18.77: 5.2744, 18.78: 5.2716, 18.79: 5.2688, 18.8: 5.266, 18.81: 5.2632, 18.82: 5.2604, 18.83: 5.2576, 18.84: 5.2548, 18.85: 5.252, 18.86: 5.2492, 18.87: 5.2464, 18.88: 5.2436, 18.89: 5.2409, 18.9: 5.2381, 18.91: 5.2353, 18.92: 5.2326, 18.93: 5.2298, 18.94: 5.227, 18.95: 5.2243, 18.96: 5.2215, 18.97: 5.2188, 18.98: 5.216, 18.99: 5.2133, 19.00: 5.2105, 19.01: 5.2078, 19.02: 5.205, 19.03: 5.2023, 19.04: 5.1996, 19.05: 5.1969, 19.06: 5.1941, 19.07: 5.1914, 19.08: 5.1887, 19.09: 5.186, 19.1: 5.1832, 19.11: 5.1805, 19.12: 5.1778, 19.13: 5.1751, 19.14: 5.1724, 19.15: 5.1697, 19.16: 5.167, 19.17: 5.1643, 19.18: 5.1616, 19.19: 5.1589, 19.2: 5.1562, 19.21: 5.1536, 19.22: 5.1509, 19.23: 5.1482, 19.24: 5.1455, 19.25: 5.1429, 19.26: 5.1402, 19.27: 5.1375, 19.28: 5.1349, 19.29: 5.1322, 19.3: 5.1295, 19.31: 5.1269, 19.32: 5.1242, 19.33: 5.1216, 19.34: 5.1189, 19.35: 5.1163, 19.36: 5.1136, 19.37: 5.111, 19.38: 5.1084, 19.39: 5.1057, 19.4: 5.1031, 19.41: 5.1005, 19.42: 5.0978, 19.43: 5.0952, 19.44: 5.0926, 19.45: 5.09, 19.46: 5.0874, 19.47: 5.0847, 19.48: 5.0821, 19.49: 5.0795, 19.5: 5.0769, 19.51: 5.0743, 19.52: 5.0717, 19.53: 5.0691, 19.54: 5.0665, 19.55: 5.0639, 19.56: 5.0613, 19.57: 5.0588, 19.58: 5.0562, 19.59: 5.0536, 19.6: 5.051, 19.61: 5.0484, 19.62: 5.0459, 19.63: 5.0433, 19.64: 5.0407, 19.65: 5.0382, 19.66: 5.0356, 19.67: 5.033, 19.68: 5.0305, 19.69: 5.0279, 19.7: 5.0254, 19.71: 5.0228, 19.72: 5.0203, 19.73: 5.0177, 19.74: 5.0152, 19.75: 5.0127, 19.76: 5.0101, 19.77: 5.0076, 19.78: 5.0051, 19.79: 5.0025, 19.8: 5.0, 19.81: 4.9975, 19.82: 4.995, 19.83: 4.9924, 19.84: 4.9899, 19.85: 4.9874, 19.86: 4.9849, 19.87: 4.9824, 19.88: 4.9799, 19.89: 4.9774, 19.9: 4.9749, 19.91: 4.9724, 19.92: 4.9699, 19.93: 4.9674, 19.94: 4.9649, 19.95: 4.9624, 19.96: 4.9599, 19.97: 4.9574, 19.98: 4.955, 19.99: 4.9525, 20.00: 4.95, 20.01: 4.9475, 20.02: 4.9451, 20.03: 4.9426, 20.04: 4.9401, 20.05: 4.9377, 20.06: 4.9352, 20.07: 4.9327, 20.08: 4.9303, 20.09: 4.9278, 20.1: 4.9254, 20.11: 4.9229, 20.12: 4.9205, 20.13: 4.918, 20.14: 4.9156, 20.15: 4.9132, 20.16: 4.9107, 20.17: 4.9083, 20.18: 4.9058, 20.19: 4.9034, 20.2: 4.901, 20.21: 4.8986, 20.22: 4.8961, 20.23: 4.8937, 20.24: 4.8913, 20.25: 4.8889, 20.26: 4.8865, 20.27: 4.8841, 20.28: 4.8817, 20.29: 4.8793, 20.3: 4.8768, 20.31: 4.8744, 20.32: 4.872, 20.33: 4.8697, 20.34: 4.8673, 20.35: 4.8649, 20.36: 4.8625, 20.37: 4.8601, 20.38: 4.8577, 20.39: 4.8553, 20.4: 4.8529, 20.41: 4.8506, 20.42: 4.8482, 20.43: 4.8458, 20.44: 4.8434, 20.45: 4.8411, 20.46: 4.8387, 20.47: 4.8363, 20.48: 4.834, 20.49: 4.8316, 20.5: 4.8293, 20.51: 4.8269, 20.52: 4.8246, 20.53: 4.8222, 20.54: 4.8199, 20.55: 4.8175, 20.56: 4.8152, 20.57: 4.8128, 20.58: 4.8105, 20.59: 4.8082, 20.6: 4.8058, 20.61: 4.8035, 20.62: 4.8012, 20.63: 4.7988, 20.64: 4.7965, 20.65: 4.7942, 20.66: 4.7919, 20.67: 4.7896, 20.68: 4.7872, 20.69: 4.7849, 20.7: 4.7826, 20.71: 4.7803, 20.72: 4.778, 20.73: 4.7757, 20.74: 4.7734, 20.75: 4.7711, 20.76: 4.7688, 20.77: 4.7665, 20.78: 4.7642, 20.79: 4.7619, 20.8: 4.7596, 20.81: 4.7573, 20.82: 4.755, 20.83: 4.7528, 20.84: 4.7505, 20.85: 4.7482, 20.86: 4.7459, 20.87: 4.7437, 20.88: 4.7414, 20.89: 4.7391, 20.9: 4.7368, 20.91: 4.7346, 20.92: 4.7323, 20.93: 4.7301, 20.94: 4.7278, 20.95: 4.7255, 20.96: 4.7233, 20.97: 4.721, 20.98: 4.7188, 20.99: 4.7165, 21.00: 4.7143, 21.01: 4.712, 21.02: 4.7098, 21.03: 4.7076, 21.04: 4.7053, 21.05: 4.7031, 21.06: 4.7009, 21.07: 4.6986, 21.08: 4.6964, 21.09: 4.6942, 21.1: 4.6919, 21.11: 4.6897, 21.12: 4.6875, 21.13: 4.6853, 21.14: 4.6831, 21.15: 4.6809, 21.16: 4.6786, 21.17: 4.6764, 21.18: 4.6742, 21.19: 4.672, 21.2: 4.6698, 21.21: 4.6676, 21.22: 4.6654, 21.23: 4.6632, 21.24: 4.661, 21.25: 4.6588, 21.26: 4.6566, 21.27: 4.6544, 21.28: 4.6523, 21.29: 4.6501, 21.3: 4.6479, 21.31: 4.6457, 21.32: 4.6435, 21.33: 4.6414, 21.34: 4.6392, 21.35: 4.637, 21.36: 4.6348, 21.37: 4.6327, 21.38: 4.6305, 21.39: 4.6283, 21.4: 4.6262, 21.41: 4.624, 21.42: 4.6218, 21.43: 4.6197, 21.44: 4.6175, 21.45: 4.6154, 21.46: 4.6132, 21.47: 4.6111, 21.48: 4.6089, 21.49: 4.6068, 21.5: 4.6047, 21.51: 4.6025, 21.52: 4.6004, 21.53: 4.5982, 21.54: 4.5961, 21.55: 4.594, 21.56: 4.5918, 21.57: 4.5897, 21.58: 4.5876, 21.59: 4.5855, 21.6: 4.5833, 21.61: 4.5812, 21.62: 4.5791, 21.63: 4.577, 21.64: 4.5749, 21.65: 4.5727, 21.66: 4.5706, 21.67: 4.5685, 21.68: 4.5664, 21.69: 4.5643, 21.7: 4.5622, 21.71: 4.5601, 21.72: 4.558, 21.73: 4.5559, 21.74: 4.5538, 21.75: 4.5517, 21.76: 4.5496, 21.77: 4.5475, 21.78: 4.5455, 21.79: 4.5434, 21.8: 4.5413, 21.81: 4.5392, 21.82: 4.5371, 21.83: 4.535, 21.84: 4.533, 21.85: 4.5309, 21.86: 4.5288, 21.87: 4.5267, 21.88: 4.5247, 21.89: 4.5226, 21.9: 4.5205, 21.91: 4.5185, 21.92: 4.5164, 21.93: 4.5144, 21.94: 4.5123, 21.95: 4.5103, 21.96: 4.5082, 21.97: 4.5061, 21.98: 4.5041, 21.99: 4.502, 22.00: 4.5, 22.01: 4.498, 22.02: 4.4959, 22.03: 4.4939, 22.04: 4.4918, 22.05: 4.4898, 22.06: 4.4878, 22.07: 4.4857, 22.08: 4.4837, 22.09: 4.4817, 22.1: 4.4796, 22.11: 4.4776, 22.12: 4.4756, 22.13: 4.4736, 22.14: 4.4715, 22.15: 4.4695, 22.16: 4.4675, 22.17: 4.4655, 22.18: 4.4635, 22.19: 4.4615, 22.2: 4.4595, 22.21: 4.4575, 22.22: 4.4554, 22.23: 4.4534, 22.24: 4.4514, 22.25: 4.4494, 22.26: 4.4474, 22.27: 4.4454, 22.28: 4.4434, 22.29: 4.4415, 22.3: 4.4395, 22.31: 4.4375, 22.32: 4.4355, 22.33: 4.4335, 22.34: 4.4315, 22.35: 4.4295, 22.36: 4.4275, 22.37: 4.4256, 22.38: 4.4236, 22.39: 4.4216, 22.4: 4.4196, 22.41: 4.4177, 22.42: 4.4157, 22.43: 4.4137, 22.44: 4.4118, 22.45: 4.4098, 22.46: 4.4078, 22.47: 4.4059, 22.48: 4.4039, 22.49: 4.402, 22.5: 4.4, 22.51: 4.398, 22.52: 4.3961, 22.53: 4.3941, 22.54: 4.3922, 22.55: 4.3902, 22.56: 4.3883, 22.57: 4.3864, 22.58: 4.3844, 22.59: 4.3825, 22.6: 4.3805, 22.61: 4.3786, 22.62: 4.3767, 22.63: 4.3747, 22.64: 4.3728, 22.65: 4.3709, 22.66: 4.3689, 22.67: 4.367, 22.68: 4.3651, 22.69: 4.3632, 22.7: 4.3612, 22.71: 4.3593, 22.72: 4.3574, 22.73: 4.3555, 22.74: 4.3536, 22.75: 4.3516, 22.76: 4.3497, 22.77: 4.3478, 22.78: 4.3459, 22.79: 4.344, 22.8: 4.3421, 22.81: 4.3402, 22.82: 4.3383, 22.83: 4.3364, 22.84: 4.3345, 22.85: 4.3326, 22.86: 4.3307, 22.87: 4.3288, 22.88: 4.3269, 22.89: 4.325, 22.9: 4.3231, 22.91: 4.3213, 22.92: 4.3194, 22.93: 4.3175, 22.94: 4.3156, 22.95: 4.3137, 22.96: 4.3118, 22.97: 4.31, 22.98: 4.3081, 22.99: 4.3062, 23.00: 4.3043, 23.01: 4.3025, 23.02: 4.3006, 23.03: 4.2987, 23.04: 4.2969, 23.05: 4.295, 23.06: 4.2931, 23.07: 4.2913, 23.08: 4.2894, 23.09: 4.2876, 23.1: 4.2857, 23.11: 4.2839, 23.12: 4.282, 23.13: 4.2802, 23.14: 4.2783, 23.15: 4.2765, 23.16: 4.2746, 23.17: 4.2728, 23.18: 4.2709, 23.19: 4.2691, 23.2: 4.2672, 23.21: 4.2654, 23.22: 4.2636, 23.23: 4.2617, 23.24: 4.2599, 23.25: 4.2581, 23.26: 4.2562, 23.27: 4.2544, 23.28: 4.2526, 23.29: 4.2508, 23.3: 4.2489, 23.31: 4.2471, 23.32: 4.2453, 23.33: 4.2435, 23.34: 4.2416, 23.35: 4.2398, 23.36: 4.238, 23.37: 4.2362, 23.38: 4.2344, 23.39: 4.2326, 23.4: 4.2308, 23.41: 4.229, 23.42: 4.2272, 23.43: 4.2254, 23.44: 4.2235, 23.45: 4.2217, 23.46: 4.2199, 23.47: 4.2182, 23.48: 4.2164, 23.49: 4.2146, 23.5: 4.2128, 23.51: 4.211, 23.52: 4.2092, 23.53: 4.2074, 23.54: 4.2056, 23.55: 4.2038, 23.56: 4.202, 23.57: 4.2003, 23.58: 4.1985, 23.59: 4.1967, 23.6: 4.1949, 23.61: 4.1931, 23.62: 4.1914, 23.63: 4.1896, 23.64: 4.1878, 23.65: 4.186, 23.66: 4.1843, 23.67: 4.1825, 23.68: 4.1807, 23.69: 4.179, 23.7: 4.1772, 23.71: 4.1755, 23.72: 4.1737, 23.73: 4.1719, 23.74: 4.1702, 23.75: 4.1684, 23.76: 4.1667, 23.77: 4.1649, 23.78: 4.1632, 23.79: 4.1614, 23.8: 4.1597, 23.81: 4.1579, 23.82: 4.1562, 23.83: 4.1544, 23.84: 4.1527, 23.85: 4.1509, 23.86: 4.1492, 23.87: 4.1475, 23.88: 4.1457, 23.89: 4.144, 23.9: 4.1423, 23.91: 4.1405, 23.92: 4.1388, 23.93: 4.1371, 23.94: 4.1353, 23.95: 4.1336, 23.96: 4.1319, 23.97: 4.1302, 23.98: 4.1284, 23.99: 4.1267, 24.00: 4.125, 24.01: 4.1233, 24.02: 4.1216, 24.03: 4.1199, 24.04: 4.1181, 24.05: 4.1164, 24.06: 4.1147, 24.07: 4.113, 24.08: 4.1113, 24.09: 4.1096, 24.1: 4.1079, 24.11: 4.1062, 24.12: 4.1045, 24.13: 4.1028, 24.14: 4.1011, 24.15: 4.0994, 24.16: 4.0977, 24.17: 4.096, 24.18: 4.0943, 24.19: 4.0926, 24.2: 4.0909, 24.21: 4.0892, 24.22: 4.0875, 24.23: 4.0858, 24.24: 4.0842, 24.25: 4.0825, 24.26: 4.0808, 24.27: 4.0791, 24.28: 4.0774, 24.29: 4.0758, 24.3: 4.0741, 24.31: 4.0724, 24.32: 4.0707, 24.33: 4.0691, 24.34: 4.0674, 24.35: 4.0657, 24.36: 4.064, 24.37: 4.0624, 24.38: 4.0607, 24.39: 4.059, 24.4: 4.0574, 24.41: 4.0557, 24.42: 4.0541, 24.43: 4.0524, 24.44: 4.0507, 24.45: 4.0491, 24.46: 4.0474, 24.47: 4.0458, 24.48: 4.0441, 24.49: 4.0425, 24.5: 4.0408, 24.51: 4.0392, 24.52: 4.0375, 24.53: 4.0359, 24.54: 4.0342, 24.55: 4.0326, 24.56: 4.0309, 24.57: 4.0293, 24.58: 4.0277, 24.59: 4.026, 24.6: 4.0244, 24.61: 4.0228, 24.62: 4.0211, 24.63: 4.0195, 24.64: 4.0179, 24.65: 4.0162, 24.66: 4.0146, 24.67: 4.013, 24.68: 4.0113, 24.69: 4.0097, 24.7: 4.0081, 24.71: 4.0065, 24.72: 4.0049, 24.73: 4.0032, 24.74: 4.0016, 24.75: 4.0, 24.76: 3.9984, 24.77: 3.9968, 24.78: 3.9952, 24.79: 3.9935, 24.8: 3.9919, 24.81: 3.9903, 24.82: 3.9887, 24.83: 3.9871, 24.84: 3.9855, 24.85: 3.9839, 24.86: 3.9823, 24.87: 3.9807, 24.88: 3.9791, 24.89: 3.9775, 24.9: 3.9759, 24.91: 3.9743, 24.92: 3.9727, 24.93: 3.9711, 24.94: 3.9695, 24.95: 3.9679, 24.96: 3.9663, 24.97: 3.9648, 24.98: 3.9632, 24.99: 3.9616, 25.00: 3.96, 25.01: 3.9584, 25.02: 3.9568, 25.03: 3.9553, 25.04: 3.9537, 25.05: 3.9521, 25.06: 3.9505, 25.07: 3.9489, 25.08: 3.9474, 25.09: 3.9458, 25.1: 3.9442, 25.11: 3.9427, 25.12: 3.9411, 25.13: 3.9395, 25.14: 3.9379, 25.15: 3.9364, 25.16: 3.9348, 25.17: 3.9333, 25.18: 3.9317, 25.19: 3.9301, 25.2: 3.9286, 25.21: 3.927, 25.22: 3.9255, 25.23: 3.9239, 25.24: 3.9223, 25.25: 3.9208, 25.26: 3.9192, 25.27: 3.9177, 25.28: 3.9161, 25.29: 3.9146, 25.3: 3.913, 25.31: 3.9115, 25.32: 3.91, 25.33: 3.9084, 25.34: 3.9069, 25.35: 3.9053, 25.36: 3.9038, 25.37: 3.9022, 25.38: 3.9007, 25.39: 3.8992, 25.4: 3.8976, 25.41: 3.8961, 25.42: 3.8946, 25.43: 3.893, 25.44: 3.8915, 25.45: 3.89, 25.46: 3.8885, 25.47: 3.8869, 25.48: 3.8854, 25.49: 3.8839, 25.5: 3.8824, 25.51: 3.8808, 25.52: 3.8793, 25.53: 3.8778, 25.54: 3.8763, 25.55: 3.8748, 25.56: 3.8732, 25.57: 3.8717, 25.58: 3.8702, 25.59: 3.8687, 25.6: 3.8672, 25.61: 3.8657, 25.62: 3.8642, 25.63: 3.8627, 25.64: 3.8612, 25.65: 3.8596, 25.66: 3.8581, 25.67: 3.8566, 25.68: 3.8551, 25.69: 3.8536, 25.7: 3.8521, 25.71: 3.8506, 25.72: 3.8491, 25.73: 3.8476, 25.74: 3.8462, 25.75: 3.8447, 25.76: 3.8432, 25.77: 3.8417, 25.78: 3.8402, 25.79: 3.8387, 25.8: 3.8372, 25.81: 3.8357, 25.82: 3.8342, 25.83: 3.8328, 25.84: 3.8313, 25.85: 3.8298, 25.86: 3.8283, 25.87: 3.8268, 25.88: 3.8253, 25.89: 3.8239, 25.9: 3.8224, 25.91: 3.8209, 25.92: 3.8194, 25.93: 3.818, 25.94: 3.8165, 25.95: 3.815, 25.96: 3.8136, 25.97: 3.8121, 25.98: 3.8106, 25.99: 3.8092, 26.00: 3.8077, 26.01: 3.8062, 26.02: 3.8048, 26.03: 3.8033, 26.04: 3.8018, 26.05: 3.8004, 26.06: 3.7989, 26.07: 3.7975, 26.08: 3.796, 26.09: 3.7946, 26.1: 3.7931, 26.11: 3.7917, 26.12: 3.7902, 26.13: 3.7887, 26.14: 3.7873, 26.15: 3.7859, 26.16: 3.7844, 26.17: 3.783, 26.18: 3.7815, 26.19: 3.7801, 26.2: 3.7786, 26.21: 3.7772, 26.22: 3.7757, 26.23: 3.7743, 26.24: 3.7729, 26.25: 3.7714, 26.26: 3.77, 26.27: 3.7686, 26.28: 3.7671, 26.29: 3.7657, 26.3: 3.7643, 26.31: 3.7628, 26.32: 3.7614, 26.33: 3.76, 26.34: 3.7585, 26.35: 3.7571, 26.36: 3.7557, 26.37: 3.7543, 26.38: 3.7528, 26.39: 3.7514, 26.4: 3.75, 26.41: 3.7486, 26.42: 3.7472, 26.43: 3.7457, 26.44: 3.7443, 26.45: 3.7429, 26.46: 3.7415, 26.47: 3.7401, 26.48: 3.7387, 26.49: 3.7373, 26.5: 3.7358, 26.51: 3.7344, 26.52: 3.733, 26.53: 3.7316, 26.54: 3.7302, 26.55: 3.7288, 26.56: 3.7274, 26.57: 3.726, 26.58: 3.7246, 26.59: 3.7232, 26.6: 3.7218, 26.61: 3.7204, 26.62: 3.719, 26.63: 3.7176, 26.64: 3.7162, 26.65: 3.7148, 26.66: 3.7134, 26.67: 3.712, 26.68: 3.7106, 26.69: 3.7093, 26.7: 3.7079, 26.71: 3.7065, 26.72: 3.7051, 26.73: 3.7037, 26.74: 3.7023, 26.75: 3.7009, 26.76: 3.6996, 26.77: 3.6982, 26.78: 3.6968, 26.79: 3.6954, 26.8: 3.694, 26.81: 3.6927, 26.82: 3.6913, 26.83: 3.6899, 26.84: 3.6885, 26.85: 3.6872, 26.86: 3.6858, 26.87: 3.6844, 26.88: 3.683, 26.89: 3.6817, 26.9: 3.6803, 26.91: 3.6789, 26.92: 3.6776, 26.93: 3.6762, 26.94: 3.6748, 26.95: 3.6735, 26.96: 3.6721, 26.97: 3.6707, 26.98: 3.6694, 26.99: 3.668, 27.00: 3.6667, 27.01: 3.6653, 27.02: 3.664, 27.03: 3.6626, 27.04: 3.6612, 27.05: 3.6599, 27.06: 3.6585, 27.07: 3.6572, 27.08: 3.6558, 27.09: 3.6545, 27.1: 3.6531, 27.11: 3.6518, 27.12: 3.6504, 27.13: 3.6491, 27.14: 3.6478, 27.15: 3.6464, 27.16: 3.6451, 27.17: 3.6437, 27.18: 3.6424, 27.19: 3.641, 27.2: 3.6397, 27.21: 3.6384, 27.22: 3.637, 27.23: 3.6357, 27.24: 3.6344, 27.25: 3.633, 27.26: 3.6317, 27.27: 3.6304, 27.28: 3.629, 27.29: 3.6277, 27.3: 3.6264, 27.31: 3.625, 27.32: 3.6237, 27.33: 3.6224, 27.34: 3.6211, 27.35: 3.6197, 27.36: 3.6184, 27.37: 3.6171, 27.38: 3.6158, 27.39: 3.6145, 27.4: 3.6131, 27.41: 3.6118, 27.42: 3.6105, 27.43: 3.6092, 27.44: 3.6079, 27.45: 3.6066, 27.46: 3.6052, 27.47: 3.6039, 27.48: 3.6026, 27.49: 3.6013, 27.5: 3.6, 27.51: 3.5987, 27.52: 3.5974, 27.53: 3.5961, 27.54: 3.5948, 27.55: 3.5935, 27.56: 3.5922, 27.57: 3.5909, 27.58: 3.5896, 27.59: 3.5883, 27.6: 3.587, 27.61: 3.5857, 27.62: 3.5844, 27.63: 3.5831, 27.64: 3.5818, 27.65: 3.5805, 27.66: 3.5792, 27.67: 3.5779, 27.68: 3.5766, 27.69: 3.5753, 27.7: 3.574, 27.71: 3.5727, 27.72: 3.5714, 27.73: 3.5701, 27.74: 3.5689, 27.75: 3.5676, 27.76: 3.5663, 27.77: 3.565, 27.78: 3.5637, 27.79: 3.5624, 27.8: 3.5612, 27.81: 3.5599, 27.82: 3.5586, 27.83: 3.5573, 27.84: 3.556, 27.85: 3.5548, 27.86: 3.5535, 27.87: 3.5522, 27.88: 3.5509, 27.89: 3.5497, 27.9: 3.5484, 27.91: 3.5471, 27.92: 3.5458, 27.93: 3.5446, 27.94: 3.5433, 27.95: 3.542, 27.96: 3.5408, 27.97: 3.5395, 27.98: 3.5382, 27.99: 3.537, 28.00: 3.5357, 28.01: 3.5345, 28.02: 3.5332, 28.03: 3.5319, 28.04: 3.5307, 28.05: 3.5294, 28.06: 3.5282, 28.07: 3.5269, 28.08: 3.5256, 28.09: 3.5244, 28.1: 3.5231, 28.11: 3.5219, 28.12: 3.5206, 28.13: 3.5194, 28.14: 3.5181, 28.15: 3.5169, 28.16: 3.5156, 28.17: 3.5144, 28.18: 3.5131, 28.19: 3.5119, 28.2: 3.5106, 28.21: 3.5094, 28.22: 3.5082, 28.23: 3.5069, 28.24: 3.5057, 28.25: 3.5044, 28.26: 3.5032, 28.27: 3.5019, 28.28: 3.5007, 28.29: 3.4995, 28.3: 3.4982, 28.31: 3.497, 28.32: 3.4958, 28.33: 3.4945, 28.34: 3.4933, 28.35: 3.4921, 28.36: 3.4908, 28.37: 3.4896, 28.38: 3.4884, 28.39: 3.4871, 28.4: 3.4859, 28.41: 3.4847, 28.42: 3.4835, 28.43: 3.4822, 28.44: 3.481, 28.45: 3.4798, 28.46: 3.4786, 28.47: 3.4773, 28.48: 3.4761, 28.49: 3.4749, 28.5: 3.4737, 28.51: 3.4725, 28.52: 3.4712, 28.53: 3.47, 28.54: 3.4688, 28.55: 3.4676, 28.56: 3.4664, 28.57: 3.4652, 28.58: 3.464, 28.59: 3.4627, 28.6: 3.4615, 28.61: 3.4603, 28.62: 3.4591, 28.63: 3.4579, 28.64: 3.4567, 28.65: 3.4555, 28.66: 3.4543, 28.67: 3.4531, 28.68: 3.4519, 28.69: 3.4507, 28.7: 3.4495, 28.71: 3.4483, 28.72: 3.4471, 28.73: 3.4459, 28.74: 3.4447, 28.75: 3.4435, 28.76: 3.4423, 28.77: 3.4411, 28.78: 3.4399, 28.79: 3.4387, 28.8: 3.4375, 28.81: 3.4363, 28.82: 3.4351, 28.83: 3.4339, 28.84: 3.4327, 28.85: 3.4315, 28.86: 3.4304, 28.87: 3.4292, 28.88: 3.428, 28.89: 3.4268, 28.9: 3.4256, 28.91: 3.4244, 28.92: 3.4232, 28.93: 3.4221, 28.94: 3.4209, 28.95: 3.4197, 28.96: 3.4185, 28.97: 3.4173, 28.98: 3.4161, 28.99: 3.415, 29.00: 3.4138, 29.01: 3.4126, 29.02: 3.4114, 29.03: 3.4103, 29.04: 3.4091, 29.05: 3.4079, 29.06: 3.4067, 29.07: 3.4056, 29.08: 3.4044, 29.09: 3.4032, 29.1: 3.4021, 29.11: 3.4009, 29.12: 3.3997, 29.13: 3.3986, 29.14: 3.3974, 29.15: 3.3962, 29.16: 3.3951, 29.17: 3.3939, 29.18: 3.3927, 29.19: 3.3916, 29.2: 3.3904, 29.21: 3.3893, 29.22: 3.3881, 29.23: 3.3869, 29.24: 3.3858, 29.25: 3.3846, 29.26: 3.3835, 29.27: 3.3823, 29.28: 3.3811, 29.29: 3.38, 29.3: 3.3788, 29.31: 3.3777, 29.32: 3.3765, 29.33: 3.3754, 29.34: 3.3742, 29.35: 3.3731, 29.36: 3.3719, 29.37: 3.3708, 29.38: 3.3696, 29.39: 3.3685, 29.4: 3.3673, 29.41: 3.3662, 29.42: 3.3651, 29.43: 3.3639, 29.44: 3.3628, 29.45: 3.3616, 29.46: 3.3605, 29.47: 3.3593, 29.48: 3.3582, 29.49: 3.3571, 29.5: 3.3559, 29.51: 3.3548, 29.52: 3.3537, 29.53: 3.3525, 29.54: 3.3514, 29.55: 3.3503, 29.56: 3.3491, 29.57: 3.348, 29.58: 3.3469, 29.59: 3.3457, 29.6: 3.3446, 29.61: 3.3435, 29.62: 3.3423, 29.63: 3.3412, 29.64: 3.3401, 29.65: 3.339, 29.66: 3.3378, 29.67: 3.3367, 29.68: 3.3356, 29.69: 3.3345, 29.7: 3.3333, 29.71: 3.3322, 29.72: 3.3311, 29.73: 3.33, 29.74: 3.3289, 29.75: 3.3277, 29.76: 3.3266, 29.77: 3.3255, 29.78: 3.3244, 29.79: 3.3233, 29.8: 3.3221, 29.81: 3.321, 29.82: 3.3199, 29.83: 3.3188, 29.84: 3.3177, 29.85: 3.3166, 29.86: 3.3155, 29.87: 3.3144, 29.88: 3.3133, 29.89: 3.3121, 29.9: 3.311, 29.91: 3.3099, 29.92: 3.3088, 29.93: 3.3077, 29.94: 3.3066, 29.95: 3.3055, 29.96: 3.3044, 29.97: 3.3033, 29.98: 3.3022, 29.99: 3.3011, 30.00: 3.3, 30.01: 3.2989, 30.02: 3.2978, 30.03: 3.2967, 30.04: 3.2956, 30.05: 3.2945, 30.06: 3.2934, 30.07: 3.2923, 30.08: 3.2912, 30.09: 3.2901, 30.1: 3.289, 30.11: 3.2879, 30.12: 3.2869, 30.13: 3.2858, 30.14: 3.2847, 30.15: 3.2836, 30.16: 3.2825, 30.17: 3.2814, 30.18: 3.2803, 30.19: 3.2792, 30.2: 3.2781, 30.21: 3.2771, 30.22: 3.276, 30.23: 3.2749, 30.24: 3.2738, 30.25: 3.2727, 30.26: 3.2716, 30.27: 3.2706, 30.28: 3.2695, 30.29: 3.2684, 30.3: 3.2673, 30.31: 3.2662, 30.32: 3.2652, 30.33: 3.2641, 30.34: 3.263, 30.35: 3.2619, 30.36: 3.2609, 30.37: 3.2598, 30.38: 3.2587, 30.39: 3.2577, 30.4: 3.2566, 30.41: 3.2555, 30.42: 3.2544, 30.43: 3.2534, 30.44: 3.2523, 30.45: 3.2512, 30.46: 3.2502, 30.47: 3.2491, 30.48: 3.248, 30.49: 3.247, 30.5: 3.2459, 30.51: 3.2448, 30.52: 3.2438, 30.53: 3.2427, 30.54: 3.2417, 30.55: 3.2406, 30.56: 3.2395, 30.57: 3.2385, 30.58: 3.2374, 30.59: 3.2364, 30.6: 3.2353, 30.61: 3.2342, 30.62: 3.2332, 30.63: 3.2321, 30.64: 3.2311, 30.65: 3.23, 30.66: 3.229, 30.67: 3.2279, 30.68: 3.2269, 30.69: 3.2258, 30.7: 3.2248, 30.71: 3.2237, 30.72: 3.2227, 30.73: 3.2216, 30.74: 3.2206, 30.75: 3.2195, 30.76: 3.2185, 30.77: 3.2174, 30.78: 3.2164, 30.79: 3.2153, 30.8: 3.2143, 30.81: 3.2132, 30.82: 3.2122, 30.83: 3.2112, 30.84: 3.2101, 30.85: 3.2091, 30.86: 3.208, 30.87: 3.207, 30.88: 3.206, 30.89: 3.2049, 30.9: 3.2039, 30.91: 3.2028, 30.92: 3.2018, 30.93: 3.2008, 30.94: 3.1997, 30.95: 3.1987, 30.96: 3.1977, 30.97: 3.1966, 30.98: 3.1956, 30.99: 3.1946, 31.00: 3.1935, 31.01: 3.1925, 31.02: 3.1915, 31.03: 3.1905, 31.04: 3.1894, 31.05: 3.1884, 31.06: 3.1874, 31.07: 3.1864, 31.08: 3.1853, 31.09: 3.1843, 31.1: 3.1833, 31.11: 3.1823, 31.12: 3.1812, 31.13: 3.1802, 31.14: 3.1792, 31.15: 3.1782, 31.16: 3.1772, 31.17: 3.1761, 31.18: 3.1751, 31.19: 3.1741, 31.2: 3.1731, 31.21: 3.1721, 31.22: 3.171, 31.23: 3.17, 31.24: 3.169, 31.25: 3.168, 31.26: 3.167, 31.27: 3.166, 31.28: 3.165, 31.29: 3.164, 31.3: 3.1629, 31.31: 3.1619, 31.32: 3.1609, 31.33: 3.1599, 31.34: 3.1589, 31.35: 3.1579, 31.36: 3.1569, 31.37: 3.1559, 31.38: 3.1549, 31.39: 3.1539, 31.4: 3.1529, 31.41: 3.1519, 31.42: 3.1509, 31.43: 3.1499, 31.44: 3.1489, 31.45: 3.1479, 31.46: 3.1469, 31.47: 3.1459, 31.48: 3.1449, 31.49: 3.1439, 31.5: 3.1429, 31.51: 3.1419, 31.52: 3.1409, 31.53: 3.1399, 31.54: 3.1389, 31.55: 3.1379, 31.56: 3.1369, 31.57: 3.1359, 31.58: 3.1349, 31.59: 3.1339, 31.6: 3.1329, 31.61: 3.1319, 31.62: 3.1309, 31.63: 3.1299, 31.64: 3.129, 31.65: 3.128, 31.66: 3.127, 31.67: 3.126, 31.68: 3.125, 31.69: 3.124, 31.7: 3.123, 31.71: 3.122, 31.72: 3.1211, 31.73: 3.1201, 31.74: 3.1191, 31.75: 3.1181, 31.76: 3.1171, 31.77: 3.1161, 31.78: 3.1152, 31.79: 3.1142, 31.8: 3.1132, 31.81: 3.1122, 31.82: 3.1113, 31.83: 3.1103, 31.84: 3.1093, 31.85: 3.1083, 31.86: 3.1073, 31.87: 3.1064, 31.88: 3.1054, 31.89: 3.1044, 31.9: 3.1034, 31.91: 3.1025, 31.92: 3.1015, 31.93: 3.1005, 31.94: 3.0996, 31.95: 3.0986, 31.96: 3.0976, 31.97: 3.0967, 31.98: 3.0957, 31.99: 3.0947, 32.00: 3.0938, 32.01: 3.0928, 32.02: 3.0918, 32.03: 3.0909, 32.04: 3.0899, 32.05: 3.0889, 32.06: 3.088, 32.07: 3.087, 32.08: 3.086, 32.09: 3.0851, 32.1: 3.0841, 32.11: 3.0832, 32.12: 3.0822, 32.13: 3.0812, 32.14: 3.0803, 32.15: 3.0793, 32.16: 3.0784, 32.17: 3.0774, 32.18: 3.0764, 32.19: 3.0755, 32.2: 3.0745, 32.21: 3.0736, 32.22: 3.0726, 32.23: 3.0717, 32.24: 3.0707, 32.25: 3.0698, 32.26: 3.0688, 32.27: 3.0679, 32.28: 3.0669, 32.29: 3.066, 32.3: 3.065, 32.31: 3.0641, 32.32: 3.0631, 32.33: 3.0622, 32.34: 3.0612, 32.35: 3.0603, 32.36: 3.0593, 32.37: 3.0584, 32.38: 3.0574, 32.39: 3.0565, 32.4: 3.0556, 32.41: 3.0546, 32.42: 3.0537, 32.43: 3.0527, 32.44: 3.0518, 32.45: 3.0508, 32.46: 3.0499, 32.47: 3.049, 32.48: 3.048, 32.49: 3.0471, 32.5: 3.0462, 32.51: 3.0452, 32.52: 3.0443, 32.53: 3.0433, 32.54: 3.0424, 32.55: 3.0415, 32.56: 3.0405, 32.57: 3.0396, 32.58: 3.0387, 32.59: 3.0377, 32.6: 3.0368, 32.61: 3.0359, 32.62: 3.0349, 32.63: 3.034, 32.64: 3.0331, 32.65: 3.0322, 32.66: 3.0312, 32.67: 3.0303, 32.68: 3.0294, 32.69: 3.0284, 32.7: 3.0275, 32.71: 3.0266, 32.72: 3.0257, 32.73: 3.0247, 32.74: 3.0238, 32.75: 3.0229, 32.76: 3.022, 32.77: 3.0211, 32.78: 3.0201, 32.79: 3.0192, 32.8: 3.0183, 32.81: 3.0174, 32.82: 3.0165, 32.83: 3.0155, 32.84: 3.0146, 32.85: 3.0137, 32.86: 3.0128, 32.87: 3.0119, 32.88: 3.0109, 32.89: 3.01, 32.9: 3.0091, 32.91: 3.0082, 32.92: 3.0073, 32.93: 3.0064, 32.94: 3.0055, 32.95: 3.0046, 32.96: 3.0036, 32.97: 3.0027, 32.98: 3.0018, 32.99: 3.0009, 33.00: 3.0, 33.01: 2.9991, 33.02: 2.9982, 33.03: 2.9973, 33.04: 2.9964, 33.05: 2.9955, 33.06: 2.9946, 33.07: 2.9936, 33.08: 2.9927, 33.09: 2.9918, 33.1: 2.9909, 33.11: 2.99, 33.12: 2.9891, 33.13: 2.9882, 33.14: 2.9873, 33.15: 2.9864, 33.16: 2.9855, 33.17: 2.9846, 33.18: 2.9837, 33.19: 2.9828, 33.2: 2.9819, 33.21: 2.981, 33.22: 2.9801, 33.23: 2.9792, 33.24: 2.9783, 33.25: 2.9774, 33.26: 2.9765, 33.27: 2.9757, 33.28: 2.9748, 33.29: 2.9739, 33.3: 2.973, 33.31: 2.9721, 33.32: 2.9712, 33.33: 2.9703, 33.34: 2.9694, 33.35: 2.9685, 33.36: 2.9676, 33.37: 2.9667, 33.38: 2.9658, 33.39: 2.965, 33.4: 2.9641, 33.41: 2.9632, 33.42: 2.9623, 33.43: 2.9614, 33.44: 2.9605, 33.45: 2.9596, 33.46: 2.9588, 33.47: 2.9579, 33.48: 2.957, 33.49: 2.9561, 33.5: 2.9552, 33.51: 2.9543, 33.52: 2.9535, 33.53: 2.9526, 33.54: 2.9517, 33.55: 2.9508, 33.56: 2.9499, 33.57: 2.9491, 33.58: 2.9482, 33.59: 2.9473, 33.6: 2.9464, 33.61: 2.9456, 33.62: 2.9447, 33.63: 2.9438, 33.64: 2.9429, 33.65: 2.9421, 33.66: 2.9412, 33.67: 2.9403, 33.68: 2.9394, 33.69: 2.9386, 33.7: 2.9377, 33.71: 2.9368, 33.72: 2.9359, 33.73: 2.9351, 33.74: 2.9342, 33.75: 2.9333, 33.76: 2.9325, 33.77: 2.9316, 33.78: 2.9307, 33.79: 2.9299, 33.8: 2.929, 33.81: 2.9281, 33.82: 2.9273, 33.83: 2.9264, 33.84: 2.9255, 33.85: 2.9247, 33.86: 2.9238, 33.87: 2.9229, 33.88: 2.9221, 33.89: 2.9212, 33.9: 2.9204, 33.91: 2.9195, 33.92: 2.9186, 33.93: 2.9178, 33.94: 2.9169, 33.95: 2.9161, 33.96: 2.9152, 33.97: 2.9143, 33.98: 2.9135, 33.99: 2.9126, 34.00: 2.9118, 34.01: 2.9109, 34.02: 2.9101, 34.03: 2.9092, 34.04: 2.9083, 34.05: 2.9075, 34.06: 2.9066, 34.07: 2.9058, 34.08: 2.9049, 34.09: 2.9041, 34.1: 2.9032, 34.11: 2.9024, 34.12: 2.9015, 34.13: 2.9007, 34.14: 2.8998, 34.15: 2.899, 34.16: 2.8981, 34.17: 2.8973, 34.18: 2.8964, 34.19: 2.8956, 34.2: 2.8947, 34.21: 2.8939, 34.22: 2.893, 34.23: 2.8922, 34.24: 2.8914, 34.25: 2.8905, 34.26: 2.8897, 34.27: 2.8888, 34.28: 2.888, 34.29: 2.8871, 34.3: 2.8863, 34.31: 2.8855, 34.32: 2.8846, 34.33: 2.8838, 34.34: 2.8829, 34.35: 2.8821, 34.36: 2.8813, 34.37: 2.8804, 34.38: 2.8796, 34.39: 2.8787, 34.4: 2.8779, 34.41: 2.8771, 34.42: 2.8762, 34.43: 2.8754, 34.44: 2.8746, 34.45: 2.8737, 34.46: 2.8729, 34.47: 2.8721, 34.48: 2.8712, 34.49: 2.8704, 34.5: 2.8696, 34.51: 2.8687, 34.52: 2.8679, 34.53: 2.8671, 34.54: 2.8662, 34.55: 2.8654, 34.56: 2.8646, 34.57: 2.8638, 34.58: 2.8629, 34.59: 2.8621, 34.6: 2.8613, 34.61: 2.8604, 34.62: 2.8596, 34.63: 2.8588, 34.64: 2.858, 34.65: 2.8571, 34.66: 2.8563, 34.67: 2.8555, 34.68: 2.8547, 34.69: 2.8538, 34.7: 2.853, 34.71: 2.8522, 34.72: 2.8514, 34.73: 2.8506, 34.74: 2.8497, 34.75: 2.8489, 34.76: 2.8481, 34.77: 2.8473, 34.78: 2.8465, 34.79: 2.8456, 34.8: 2.8448, 34.81: 2.844, 34.82: 2.8432, 34.83: 2.8424, 34.84: 2.8416, 34.85: 2.8407, 34.86: 2.8399, 34.87: 2.8391, 34.88: 2.8383, 34.89: 2.8375, 34.9: 2.8367, 34.91: 2.8359, 34.92: 2.8351, 34.93: 2.8342, 34.94: 2.8334, 34.95: 2.8326, 34.96: 2.8318, 34.97: 2.831, 34.98: 2.8302, 34.99: 2.8294, 35.00: 2.8286, 35.01: 2.8278, 35.02: 2.827, 35.03: 2.8261, 35.04: 2.8253, 35.05: 2.8245, 35.06: 2.8237, 35.07: 2.8229, 35.08: 2.8221, 35.09: 2.8213, 35.1: 2.8205, 35.11: 2.8197, 35.12: 2.8189, 35.13: 2.8181, 35.14: 2.8173, 35.15: 2.8165, 35.16: 2.8157, 35.17: 2.8149, 35.18: 2.8141, 35.19: 2.8133, 35.2: 2.8125, 35.21: 2.8117, 35.22: 2.8109, 35.23: 2.8101, 35.24: 2.8093, 35.25: 2.8085, 35.26: 2.8077, 35.27: 2.8069, 35.28: 2.8061, 35.29: 2.8053, 35.3: 2.8045, 35.31: 2.8037, 35.32: 2.8029, 35.33: 2.8022, 35.34: 2.8014, 35.35: 2.8006, 35.36: 2.7998, 35.37: 2.799, 35.38: 2.7982, 35.39: 2.7974, 35.4: 2.7966, 35.41: 2.7958, 35.42: 2.795, 35.43: 2.7942, 35.44: 2.7935, 35.45: 2.7927, 35.46: 2.7919, 35.47: 2.7911, 35.48: 2.7903, 35.49: 2.7895, 35.5: 2.7887, 35.51: 2.7879, 35.52: 2.7872, 35.53: 2.7864, 35.54: 2.7856, 35.55: 2.7848, 35.56: 2.784, 35.57: 2.7832, 35.58: 2.7825, 35.59: 2.7817, 35.6: 2.7809, 35.61: 2.7801, 35.62: 2.7793, 35.63: 2.7786, 35.64: 2.7778, 35.65: 2.777, 35.66: 2.7762, 35.67: 2.7754, 35.68: 2.7747, 35.69: 2.7739, 35.7: 2.7731, 35.71: 2.7723, 35.72: 2.7716, 35.73: 2.7708, 35.74: 2.77, 35.75: 2.7692, 35.76: 2.7685, 35.77: 2.7677, 35.78: 2.7669, 35.79: 2.7661, 35.8: 2.7654, 35.81: 2.7646, 35.82: 2.7638, 35.83: 2.763, 35.84: 2.7623, 35.85: 2.7615, 35.86: 2.7607, 35.87: 2.76, 35.88: 2.7592, 35.89: 2.7584, 35.9: 2.7577, 35.91: 2.7569, 35.92: 2.7561, 35.93: 2.7554, 35.94: 2.7546, 35.95: 2.7538, 35.96: 2.7531, 35.97: 2.7523, 35.98: 2.7515, 35.99: 2.7508, 36.00: 2.75, 36.01: 2.7492, 36.02: 2.7485, 36.03: 2.7477, 36.04: 2.7469, 36.05: 2.7462, 36.06: 2.7454, 36.07: 2.7447, 36.08: 2.7439, 36.09: 2.7431, 36.1: 2.7424, 36.11: 2.7416, 36.12: 2.7409, 36.13: 2.7401, 36.14: 2.7393, 36.15: 2.7386, 36.16: 2.7378, 36.17: 2.7371, 36.18: 2.7363, 36.19: 2.7356, 36.2: 2.7348, 36.21: 2.7341, 36.22: 2.7333, 36.23: 2.7325, 36.24: 2.7318, 36.25: 2.731, 36.26: 2.7303, 36.27: 2.7295, 36.28: 2.7288, 36.29: 2.728, 36.3: 2.7273, 36.31: 2.7265, 36.32: 2.7258, 36.33: 2.725, 36.34: 2.7243, 36.35: 2.7235, 36.36: 2.7228, 36.37: 2.722, 36.38: 2.7213, 36.39: 2.7205, 36.4: 2.7198, 36.41: 2.719, 36.42: 2.7183, 36.43: 2.7175, 36.44: 2.7168, 36.45: 2.716, 36.46: 2.7153, 36.47: 2.7146, 36.48: 2.7138, 36.49: 2.7131, 36.5: 2.7123, 36.51: 2.7116, 36.52: 2.7108, 36.53: 2.7101, 36.54: 2.7094, 36.55: 2.7086, 36.56: 2.7079, 36.57: 2.7071, 36.58: 2.7064, 36.59: 2.7057, 36.6: 2.7049, 36.61: 2.7042, 36.62: 2.7034, 36.63: 2.7027, 36.64: 2.702, 36.65: 2.7012, 36.66: 2.7005, 36.67: 2.6998, 36.68: 2.699, 36.69: 2.6983, 36.7: 2.6975, 36.71: 2.6968, 36.72: 2.6961, 36.73: 2.6953, 36.74: 2.6946, 36.75: 2.6939, 36.76: 2.6931, 36.77: 2.6924, 36.78: 2.6917, 36.79: 2.6909, 36.8: 2.6902, 36.81: 2.6895, 36.82: 2.6888, 36.83: 2.688, 36.84: 2.6873, 36.85: 2.6866, 36.86: 2.6858, 36.87: 2.6851, 36.88: 2.6844, 36.89: 2.6837, 36.9: 2.6829, 36.91: 2.6822, 36.92: 2.6815, 36.93: 2.6807, 36.94: 2.68, 36.95: 2.6793, 36.96: 2.6786, 36.97: 2.6778, 36.98: 2.6771, 36.99: 2.6764, 37.00: 2.6757, 37.01: 2.675, 37.02: 2.6742, 37.03: 2.6735, 37.04: 2.6728, 37.05: 2.6721, 37.06: 2.6713, 37.07: 2.6706, 37.08: 2.6699, 37.09: 2.6692, 37.1: 2.6685, 37.11: 2.6677, 37.12: 2.667, 37.13: 2.6663, 37.14: 2.6656, 37.15: 2.6649, 37.16: 2.6642, 37.17: 2.6634, 37.18: 2.6627, 37.19: 2.662, 37.2: 2.6613, 37.21: 2.6606, 37.22: 2.6599, 37.23: 2.6591, 37.24: 2.6584, 37.25: 2.6577, 37.26: 2.657, 37.27: 2.6563, 37.28: 2.6556, 37.29: 2.6549, 37.3: 2.6542, 37.31: 2.6534, 37.32: 2.6527, 37.33: 2.652, 37.34: 2.6513, 37.35: 2.6506, 37.36: 2.6499, 37.37: 2.6492, 37.38: 2.6485, 37.39: 2.6478, 37.4: 2.6471, 37.41: 2.6464, 37.42: 2.6456, 37.43: 2.6449, 37.44: 2.6442, 37.45: 2.6435, 37.46: 2.6428, 37.47: 2.6421, 37.48: 2.6414, 37.49: 2.6407, 37.5: 2.64, 37.51: 2.6393, 37.52: 2.6386, 37.53: 2.6379, 37.54: 2.6372, 37.55: 2.6365, 37.56: 2.6358, 37.57: 2.6351, 37.58: 2.6344, 37.59: 2.6337, 37.6: 2.633, 37.61: 2.6323, 37.62: 2.6316, 37.63: 2.6309, 37.64: 2.6302, 37.65: 2.6295, 37.66: 2.6288, 37.67: 2.6281, 37.68: 2.6274, 37.69: 2.6267, 37.7: 2.626, 37.71: 2.6253, 37.72: 2.6246, 37.73: 2.6239, 37.74: 2.6232, 37.75: 2.6225, 37.76: 2.6218, 37.77: 2.6211, 37.78: 2.6204, 37.79: 2.6197, 37.8: 2.619, 37.81: 2.6184, 37.82: 2.6177, 37.83: 2.617, 37.84: 2.6163, 37.85: 2.6156, 37.86: 2.6149, 37.87: 2.6142, 37.88: 2.6135, 37.89: 2.6128, 37.9: 2.6121, 37.91: 2.6114, 37.92: 2.6108, 37.93: 2.6101, 37.94: 2.6094, 37.95: 2.6087, 37.96: 2.608, 37.97: 2.6073, 37.98: 2.6066, 37.99: 2.6059, 38.00: 2.6053, 38.01: 2.6046, 38.02: 2.6039, 38.03: 2.6032, 38.04: 2.6025, 38.05: 2.6018, 38.06: 2.6012, 38.07: 2.6005, 38.08: 2.5998, 38.09: 2.5991, 38.1: 2.5984, 38.11: 2.5977, 38.12: 2.5971, 38.13: 2.5964, 38.14: 2.5957, 38.15: 2.595, 38.16: 2.5943, 38.17: 2.5937, 38.18: 2.593, 38.19: 2.5923, 38.2: 2.5916, 38.21: 2.5909, 38.22: 2.5903, 38.23: 2.5896, 38.24: 2.5889, 38.25: 2.5882, 38.26: 2.5876, 38.27: 2.5869, 38.28: 2.5862, 38.29: 2.5855, 38.3: 2.5849, 38.31: 2.5842, 38.32: 2.5835, 38.33: 2.5828, 38.34: 2.5822, 38.35: 2.5815, 38.36: 2.5808, 38.37: 2.5801, 38.38: 2.5795, 38.39: 2.5788, 38.4: 2.5781, 38.41: 2.5775, 38.42: 2.5768, 38.43: 2.5761, 38.44: 2.5754, 38.45: 2.5748, 38.46: 2.5741, 38.47: 2.5734, 38.48: 2.5728, 38.49: 2.5721, 38.5: 2.5714, 38.51: 2.5708, 38.52: 2.5701, 38.53: 2.5694, 38.54: 2.5688, 38.55: 2.5681, 38.56: 2.5674, 38.57: 2.5668, 38.58: 2.5661, 38.59: 2.5654, 38.6: 2.5648, 38.61: 2.5641, 38.62: 2.5634, 38.63: 2.5628, 38.64: 2.5621, 38.65: 2.5614, 38.66: 2.5608, 38.67: 2.5601, 38.68: 2.5595, 38.69: 2.5588, 38.7: 2.5581, 38.71: 2.5575, 38.72: 2.5568, 38.73: 2.5562, 38.74: 2.5555, 38.75: 2.5548, 38.76: 2.5542, 38.77: 2.5535, 38.78: 2.5529, 38.79: 2.5522, 38.8: 2.5515, 38.81: 2.5509, 38.82: 2.5502, 38.83: 2.5496, 38.84: 2.5489, 38.85: 2.5483, 38.86: 2.5476, 38.87: 2.547, 38.88: 2.5463, 38.89: 2.5456, 38.9: 2.545, 38.91: 2.5443, 38.92: 2.5437, 38.93: 2.543, 38.94: 2.5424, 38.95: 2.5417, 38.96: 2.5411, 38.97: 2.5404, 38.98: 2.5398, 38.99: 2.5391, 39.00: 2.5385, 39.01: 2.5378, 39.02: 2.5372, 39.03: 2.5365, 39.04: 2.5359, 39.05: 2.5352, 39.06: 2.5346, 39.07: 2.5339, 39.08: 2.5333, 39.09: 2.5326, 39.1: 2.532, 39.11: 2.5313, 39.12: 2.5307, 39.13: 2.53, 39.14: 2.5294, 39.15: 2.5287, 39.16: 2.5281, 39.17: 2.5274, 39.18: 2.5268, 39.19: 2.5262, 39.2: 2.5255, 39.21: 2.5249, 39.22: 2.5242, 39.23: 2.5236, 39.24: 2.5229, 39.25: 2.5223, 39.26: 2.5217, 39.27: 2.521, 39.28: 2.5204, 39.29: 2.5197, 39.3: 2.5191, 39.31: 2.5184, 39.32: 2.5178, 39.33: 2.5172, 39.34: 2.5165, 39.35: 2.5159, 39.36: 2.5152, 39.37: 2.5146, 39.38: 2.514, 39.39: 2.5133, 39.4: 2.5127, 39.41: 2.5121, 39.42: 2.5114, 39.43: 2.5108, 39.44: 2.5101, 39.45: 2.5095, 39.46: 2.5089, 39.47: 2.5082, 39.48: 2.5076, 39.49: 2.507, 39.5: 2.5063, 39.51: 2.5057, 39.52: 2.5051, 39.53: 2.5044, 39.54: 2.5038, 39.55: 2.5032, 39.56: 2.5025, 39.57: 2.5019, 39.58: 2.5013, 39.59: 2.5006, 39.6: 2.5, 39.61: 2.4994, 39.62: 2.4987, 39.63: 2.4981, 39.64: 2.4975, 39.65: 2.4968, 39.66: 2.4962, 39.67: 2.4956, 39.68: 2.495, 39.69: 2.4943, 39.7: 2.4937, 39.71: 2.4931, 39.72: 2.4924, 39.73: 2.4918, 39.74: 2.4912, 39.75: 2.4906, 39.76: 2.4899, 39.77: 2.4893, 39.78: 2.4887, 39.79: 2.4881, 39.8: 2.4874, 39.81: 2.4868, 39.82: 2.4862, 39.83: 2.4856, 39.84: 2.4849, 39.85: 2.4843, 39.86: 2.4837, 39.87: 2.4831, 39.88: 2.4824, 39.89: 2.4818, 39.9: 2.4812, 39.91: 2.4806, 39.92: 2.48, 39.93: 2.4793, 39.94: 2.4787, 39.95: 2.4781, 39.96: 2.4775, 39.97: 2.4769, 39.98: 2.4762, 39.99: 2.4756, 40.00: 2.475, 40.01: 2.4744, 40.02: 2.4738, 40.03: 2.4731, 40.04: 2.4725, 40.05: 2.4719, 40.06: 2.4713, 40.07: 2.4707, 40.08: 2.4701, 40.09: 2.4694, 40.1: 2.4688, 40.11: 2.4682, 40.12: 2.4676, 40.13: 2.467, 40.14: 2.4664, 40.15: 2.4658, 40.16: 2.4651, 40.17: 2.4645, 40.18: 2.4639, 40.19: 2.4633, 40.2: 2.4627, 40.21: 2.4621, 40.22: 2.4615, 40.23: 2.4609, 40.24: 2.4602, 40.25: 2.4596, 40.26: 2.459, 40.27: 2.4584, 40.28: 2.4578, 40.29: 2.4572, 40.3: 2.4566, 40.31: 2.456, 40.32: 2.4554, 40.33: 2.4547, 40.34: 2.4541, 40.35: 2.4535, 40.36: 2.4529, 40.37: 2.4523, 40.38: 2.4517, 40.39: 2.4511, 40.4: 2.4505, 40.41: 2.4499, 40.42: 2.4493, 40.43: 2.4487, 40.44: 2.4481, 40.45: 2.4475, 40.46: 2.4469, 40.47: 2.4463, 40.48: 2.4457, 40.49: 2.445, 40.5: 2.4444, 40.51: 2.4438, 40.52: 2.4432, 40.53: 2.4426, 40.54: 2.442, 40.55: 2.4414, 40.56: 2.4408, 40.57: 2.4402, 40.58: 2.4396, 40.59: 2.439, 40.6: 2.4384, 40.61: 2.4378, 40.62: 2.4372, 40.63: 2.4366, 40.64: 2.436, 40.65: 2.4354, 40.66: 2.4348, 40.67: 2.4342, 40.68: 2.4336, 40.69: 2.433, 40.7: 2.4324, 40.71: 2.4318, 40.72: 2.4312, 40.73: 2.4306, 40.74: 2.43, 40.75: 2.4294, 40.76: 2.4289, 40.77: 2.4283, 40.78: 2.4277, 40.79: 2.4271, 40.8: 2.4265, 40.81: 2.4259, 40.82: 2.4253, 40.83: 2.4247, 40.84: 2.4241, 40.85: 2.4235, 40.86: 2.4229, 40.87: 2.4223, 40.88: 2.4217, 40.89: 2.4211, 40.9: 2.4205, 40.91: 2.4199, 40.92: 2.4194, 40.93: 2.4188, 40.94: 2.4182, 40.95: 2.4176, 40.96: 2.417, 40.97: 2.4164, 40.98: 2.4158, 40.99: 2.4152, 41.00: 2.4146, 41.01: 2.414, 41.02: 2.4135, 41.03: 2.4129, 41.04: 2.4123, 41.05: 2.4117, 41.06: 2.4111, 41.07: 2.4105, 41.08: 2.4099, 41.09: 2.4093, 41.1: 2.4088, 41.11: 2.4082, 41.12: 2.4076, 41.13: 2.407, 41.14: 2.4064, 41.15: 2.4058, 41.16: 2.4052, 41.17: 2.4047, 41.18: 2.4041, 41.19: 2.4035, 41.2: 2.4029, 41.21: 2.4023, 41.22: 2.4017, 41.23: 2.4012, 41.24: 2.4006, 41.25: 2.4, 41.26: 2.3994, 41.27: 2.3988, 41.28: 2.3983, 41.29: 2.3977, 41.3: 2.3971, 41.31: 2.3965, 41.32: 2.3959, 41.33: 2.3954, 41.34: 2.3948, 41.35: 2.3942, 41.36: 2.3936, 41.37: 2.393, 41.38: 2.3925, 41.39: 2.3919, 41.4: 2.3913, 41.41: 2.3907, 41.42: 2.3901, 41.43: 2.3896, 41.44: 2.389, 41.45: 2.3884, 41.46: 2.3878, 41.47: 2.3873, 41.48: 2.3867, 41.49: 2.3861, 41.5: 2.3855, 41.51: 2.385, 41.52: 2.3844, 41.53: 2.3838, 41.54: 2.3832, 41.55: 2.3827, 41.56: 2.3821, 41.57: 2.3815, 41.58: 2.381, 41.59: 2.3804, 41.6: 2.3798, 41.61: 2.3792, 41.62: 2.3787, 41.63: 2.3781, 41.64: 2.3775, 41.65: 2.377, 41.66: 2.3764, 41.67: 2.3758, 41.68: 2.3752, 41.69: 2.3747, 41.7: 2.3741, 41.71: 2.3735, 41.72: 2.373, 41.73: 2.3724, 41.74: 2.3718, 41.75: 2.3713, 41.76: 2.3707, 41.77: 2.3701, 41.78: 2.3696, 41.79: 2.369, 41.8: 2.3684, 41.81: 2.3679, 41.82: 2.3673, 41.83: 2.3667, 41.84: 2.3662, 41.85: 2.3656, 41.86: 2.365, 41.87: 2.3645, 41.88: 2.3639, 41.89: 2.3633, 41.9: 2.3628, 41.91: 2.3622, 41.92: 2.3616, 41.93: 2.3611, 41.94: 2.3605, 41.95: 2.36, 41.96: 2.3594, 41.97: 2.3588, 41.98: 2.3583, 41.99: 2.3577, 42.00: 2.3571, 42.01: 2.3566, 42.02: 2.356, 42.03: 2.3555, 42.04: 2.3549, 42.05: 2.3543, 42.06: 2.3538, 42.07: 2.3532, 42.08: 2.3527, 42.09: 2.3521, 42.1: 2.3515, 42.11: 2.351, 42.12: 2.3504, 42.13: 2.3499, 42.14: 2.3493, 42.15: 2.3488, 42.16: 2.3482, 42.17: 2.3476, 42.18: 2.3471, 42.19: 2.3465, 42.2: 2.346, 42.21: 2.3454, 42.22: 2.3449, 42.23: 2.3443, 42.24: 2.3438, 42.25: 2.3432, 42.26: 2.3426, 42.27: 2.3421, 42.28: 2.3415, 42.29: 2.341, 42.3: 2.3404, 42.31: 2.3399, 42.32: 2.3393, 42.33: 2.3388, 42.34: 2.3382, 42.35: 2.3377, 42.36: 2.3371, 42.37: 2.3366, 42.38: 2.336, 42.39: 2.3355, 42.4: 2.3349, 42.41: 2.3344, 42.42: 2.3338, 42.43: 2.3333, 42.44: 2.3327, 42.45: 2.3322, 42.46: 2.3316, 42.47: 2.3311, 42.48: 2.3305, 42.49: 2.33, 42.5: 2.3294, 42.51: 2.3289, 42.52: 2.3283, 42.53: 2.3278, 42.54: 2.3272, 42.55: 2.3267, 42.56: 2.3261, 42.57: 2.3256, 42.58: 2.325, 42.59: 2.3245, 42.6: 2.3239, 42.61: 2.3234, 42.62: 2.3229, 42.63: 2.3223, 42.64: 2.3218, 42.65: 2.3212, 42.66: 2.3207, 42.67: 2.3201, 42.68: 2.3196, 42.69: 2.319, 42.7: 2.3185, 42.71: 2.318, 42.72: 2.3174, 42.73: 2.3169, 42.74: 2.3163, 42.75: 2.3158, 42.76: 2.3152, 42.77: 2.3147, 42.78: 2.3142, 42.79: 2.3136, 42.8: 2.3131, 42.81: 2.3125, 42.82: 2.312, 42.83: 2.3115, 42.84: 2.3109, 42.85: 2.3104, 42.86: 2.3098, 42.87: 2.3093, 42.88: 2.3088, 42.89: 2.3082, 42.9: 2.3077, 42.91: 2.3072, 42.92: 2.3066, 42.93: 2.3061, 42.94: 2.3055, 42.95: 2.305, 42.96: 2.3045, 42.97: 2.3039, 42.98: 2.3034, 42.99: 2.3029, 43.00: 2.3023, 43.01: 2.3018, 43.02: 2.3013, 43.03: 2.3007, 43.04: 2.3002, 43.05: 2.2997, 43.06: 2.2991, 43.07: 2.2986, 43.08: 2.2981, 43.09: 2.2975, 43.1: 2.297, 43.11: 2.2965, 43.12: 2.2959, 43.13: 2.2954, 43.14: 2.2949, 43.15: 2.2943, 43.16: 2.2938, 43.17: 2.2933, 43.18: 2.2927, 43.19: 2.2922, 43.2: 2.2917, 43.21: 2.2911, 43.22: 2.2906, 43.23: 2.2901, 43.24: 2.2895, 43.25: 2.289, 43.26: 2.2885, 43.27: 2.288, 43.28: 2.2874, 43.29: 2.2869, 43.3: 2.2864, 43.31: 2.2858, 43.32: 2.2853, 43.33: 2.2848, 43.34: 2.2843, 43.35: 2.2837, 43.36: 2.2832, 43.37: 2.2827, 43.38: 2.2822, 43.39: 2.2816, 43.4: 2.2811, 43.41: 2.2806, 43.42: 2.2801, 43.43: 2.2795, 43.44: 2.279, 43.45: 2.2785, 43.46: 2.278, 43.47: 2.2774, 43.48: 2.2769, 43.49: 2.2764, 43.5: 2.2759, 43.51: 2.2753, 43.52: 2.2748, 43.53: 2.2743, 43.54: 2.2738, 43.55: 2.2732, 43.56: 2.2727, 43.57: 2.2722, 43.58: 2.2717, 43.59: 2.2712, 43.6: 2.2706, 43.61: 2.2701, 43.62: 2.2696, 43.63: 2.2691, 43.64: 2.2686, 43.65: 2.268, 43.66: 2.2675, 43.67: 2.267, 43.68: 2.2665, 43.69: 2.266, 43.7: 2.2654, 43.71: 2.2649, 43.72: 2.2644, 43.73: 2.2639, 43.74: 2.2634, 43.75: 2.2629, 43.76: 2.2623, 43.77: 2.2618, 43.78: 2.2613, 43.79: 2.2608, 43.8: 2.2603, 43.81: 2.2598, 43.82: 2.2592, 43.83: 2.2587, 43.84: 2.2582, 43.85: 2.2577, 43.86: 2.2572, 43.87: 2.2567, 43.88: 2.2562, 43.89: 2.2556, 43.9: 2.2551, 43.91: 2.2546, 43.92: 2.2541, 43.93: 2.2536, 43.94: 2.2531, 43.95: 2.2526, 43.96: 2.252, 43.97: 2.2515, 43.98: 2.251, 43.99: 2.2505, 44.00: 2.25, 44.01: 2.2495, 44.02: 2.249, 44.03: 2.2485, 44.04: 2.248, 44.05: 2.2474, 44.06: 2.2469, 44.07: 2.2464, 44.08: 2.2459, 44.09: 2.2454, 44.1: 2.2449, 44.11: 2.2444, 44.12: 2.2439, 44.13: 2.2434, 44.14: 2.2429, 44.15: 2.2424, 44.16: 2.2418, 44.17: 2.2413, 44.18: 2.2408, 44.19: 2.2403, 44.2: 2.2398, 44.21: 2.2393, 44.22: 2.2388, 44.23: 2.2383, 44.24: 2.2378, 44.25: 2.2373, 44.26: 2.2368, 44.27: 2.2363, 44.28: 2.2358, 44.29: 2.2353, 44.3: 2.2348, 44.31: 2.2343, 44.32: 2.2338, 44.33: 2.2333, 44.34: 2.2327, 44.35: 2.2322, 44.36: 2.2317, 44.37: 2.2312, 44.38: 2.2307, 44.39: 2.2302, 44.4: 2.2297, 44.41: 2.2292, 44.42: 2.2287, 44.43: 2.2282, 44.44: 2.2277, 44.45: 2.2272, 44.46: 2.2267, 44.47: 2.2262, 44.48: 2.2257, 44.49: 2.2252, 44.5: 2.2247, 44.51: 2.2242, 44.52: 2.2237, 44.53: 2.2232, 44.54: 2.2227, 44.55: 2.2222, 44.56: 2.2217, 44.57: 2.2212, 44.58: 2.2207, 44.59: 2.2202, 44.6: 2.2197, 44.61: 2.2192, 44.62: 2.2187, 44.63: 2.2182, 44.64: 2.2177, 44.65: 2.2172, 44.66: 2.2167, 44.67: 2.2163, 44.68: 2.2158, 44.69: 2.2153, 44.7: 2.2148, 44.71: 2.2143, 44.72: 2.2138, 44.73: 2.2133, 44.74: 2.2128, 44.75: 2.2123, 44.76: 2.2118, 44.77: 2.2113, 44.78: 2.2108, 44.79: 2.2103, 44.8: 2.2098, 44.81: 2.2093, 44.82: 2.2088, 44.83: 2.2083, 44.84: 2.2079, 44.85: 2.2074, 44.86: 2.2069, 44.87: 2.2064, 44.88: 2.2059, 44.89: 2.2054, 44.9: 2.2049, 44.91: 2.2044, 44.92: 2.2039, 44.93: 2.2034, 44.94: 2.2029, 44.95: 2.2024, 44.96: 2.202, 44.97: 2.2015, 44.98: 2.201, 44.99: 2.2005, 45.00: 2.2, 45.01: 2.1995, 45.02: 2.199, 45.03: 2.1985, 45.04: 2.198, 45.05: 2.1976, 45.06: 2.1971, 45.07: 2.1966, 45.08: 2.1961, 45.09: 2.1956, 45.1: 2.1951, 45.11: 2.1946, 45.12: 2.1941, 45.13: 2.1937, 45.14: 2.1932, 45.15: 2.1927, 45.16: 2.1922, 45.17: 2.1917, 45.18: 2.1912, 45.19: 2.1908, 45.2: 2.1903, 45.21: 2.1898, 45.22: 2.1893, 45.23: 2.1888, 45.24: 2.1883, 45.25: 2.1878, 45.26: 2.1874, 45.27: 2.1869, 45.28: 2.1864, 45.29: 2.1859, 45.3: 2.1854, 45.31: 2.1849, 45.32: 2.1845, 45.33: 2.184, 45.34: 2.1835, 45.35: 2.183, 45.36: 2.1825, 45.37: 2.1821, 45.38: 2.1816, 45.39: 2.1811, 45.4: 2.1806, 45.41: 2.1801, 45.42: 2.1797, 45.43: 2.1792, 45.44: 2.1787, 45.45: 2.1782, 45.46: 2.1777, 45.47: 2.1773, 45.48: 2.1768, 45.49: 2.1763, 45.5: 2.1758, 45.51: 2.1753, 45.52: 2.1749, 45.53: 2.1744, 45.54: 2.1739, 45.55: 2.1734, 45.56: 2.173, 45.57: 2.1725, 45.58: 2.172, 45.59: 2.1715, 45.6: 2.1711, 45.61: 2.1706, 45.62: 2.1701, 45.63: 2.1696, 45.64: 2.1691, 45.65: 2.1687, 45.66: 2.1682, 45.67: 2.1677, 45.68: 2.1673, 45.69: 2.1668, 45.7: 2.1663, 45.71: 2.1658, 45.72: 2.1654, 45.73: 2.1649, 45.74: 2.1644, 45.75: 2.1639, 45.76: 2.1635, 45.77: 2.163, 45.78: 2.1625, 45.79: 2.162, 45.8: 2.1616, 45.81: 2.1611, 45.82: 2.1606, 45.83: 2.1602, 45.84: 2.1597, 45.85: 2.1592, 45.86: 2.1587, 45.87: 2.1583, 45.88: 2.1578, 45.89: 2.1573, 45.9: 2.1569, 45.91: 2.1564, 45.92: 2.1559, 45.93: 2.1555, 45.94: 2.155, 45.95: 2.1545, 45.96: 2.154, 45.97: 2.1536, 45.98: 2.1531, 45.99: 2.1526, 46.00: 2.1522, 46.01: 2.1517, 46.02: 2.1512, 46.03: 2.1508, 46.04: 2.1503, 46.05: 2.1498, 46.06: 2.1494, 46.07: 2.1489, 46.08: 2.1484, 46.09: 2.148, 46.1: 2.1475, 46.11: 2.147, 46.12: 2.1466, 46.13: 2.1461, 46.14: 2.1456, 46.15: 2.1452, 46.16: 2.1447, 46.17: 2.1442, 46.18: 2.1438, 46.19: 2.1433, 46.2: 2.1429, 46.21: 2.1424, 46.22: 2.1419, 46.23: 2.1415, 46.24: 2.141, 46.25: 2.1405, 46.26: 2.1401, 46.27: 2.1396, 46.28: 2.1392, 46.29: 2.1387, 46.3: 2.1382, 46.31: 2.1378, 46.32: 2.1373, 46.33: 2.1368, 46.34: 2.1364, 46.35: 2.1359, 46.36: 2.1355, 46.37: 2.135, 46.38: 2.1345, 46.39: 2.1341, 46.4: 2.1336, 46.41: 2.1332, 46.42: 2.1327, 46.43: 2.1322, 46.44: 2.1318, 46.45: 2.1313, 46.46: 2.1309, 46.47: 2.1304, 46.48: 2.1299, 46.49: 2.1295, 46.5: 2.129, 46.51: 2.1286, 46.52: 2.1281, 46.53: 2.1277, 46.54: 2.1272, 46.55: 2.1267, 46.56: 2.1263, 46.57: 2.1258, 46.58: 2.1254, 46.59: 2.1249, 46.6: 2.1245, 46.61: 2.124, 46.62: 2.1236, 46.63: 2.1231, 46.64: 2.1226, 46.65: 2.1222, 46.66: 2.1217, 46.67: 2.1213, 46.68: 2.1208, 46.69: 2.1204, 46.7: 2.1199, 46.71: 2.1195, 46.72: 2.119, 46.73: 2.1186, 46.74: 2.1181, 46.75: 2.1176, 46.76: 2.1172, 46.77: 2.1167, 46.78: 2.1163, 46.79: 2.1158, 46.8: 2.1154, 46.81: 2.1149, 46.82: 2.1145, 46.83: 2.114, 46.84: 2.1136, 46.85: 2.1131, 46.86: 2.1127, 46.87: 2.1122, 46.88: 2.1118, 46.89: 2.1113, 46.9: 2.1109, 46.91: 2.1104, 46.92: 2.11, 46.93: 2.1095, 46.94: 2.1091, 46.95: 2.1086, 46.96: 2.1082, 46.97: 2.1077, 46.98: 2.1073, 46.99: 2.1068, 47.00: 2.1064, 47.01: 2.1059, 47.02: 2.1055, 47.03: 2.105, 47.04: 2.1046, 47.05: 2.1041, 47.06: 2.1037, 47.07: 2.1033, 47.08: 2.1028, 47.09: 2.1024, 47.1: 2.1019, 47.11: 2.1015, 47.12: 2.101, 47.13: 2.1006, 47.14: 2.1001, 47.15: 2.0997, 47.16: 2.0992, 47.17: 2.0988, 47.18: 2.0983, 47.19: 2.0979, 47.2: 2.0975, 47.21: 2.097, 47.22: 2.0966, 47.23: 2.0961, 47.24: 2.0957, 47.25: 2.0952, 47.26: 2.0948, 47.27: 2.0944, 47.28: 2.0939, 47.29: 2.0935, 47.3: 2.093, 47.31: 2.0926, 47.32: 2.0921, 47.33: 2.0917, 47.34: 2.0913, 47.35: 2.0908, 47.36: 2.0904, 47.37: 2.0899, 47.38: 2.0895, 47.39: 2.089, 47.4: 2.0886, 47.41: 2.0882, 47.42: 2.0877, 47.43: 2.0873, 47.44: 2.0868, 47.45: 2.0864, 47.46: 2.086, 47.47: 2.0855, 47.48: 2.0851, 47.49: 2.0846, 47.5: 2.0842, 47.51: 2.0838, 47.52: 2.0833, 47.53: 2.0829, 47.54: 2.0825, 47.55: 2.082, 47.56: 2.0816, 47.57: 2.0811, 47.58: 2.0807, 47.59: 2.0803, 47.6: 2.0798, 47.61: 2.0794, 47.62: 2.079, 47.63: 2.0785, 47.64: 2.0781, 47.65: 2.0776, 47.66: 2.0772, 47.67: 2.0768, 47.68: 2.0763, 47.69: 2.0759, 47.7: 2.0755, 47.71: 2.075, 47.72: 2.0746, 47.73: 2.0742, 47.74: 2.0737, 47.75: 2.0733, 47.76: 2.0729, 47.77: 2.0724, 47.78: 2.072, 47.79: 2.0716, 47.8: 2.0711, 47.81: 2.0707, 47.82: 2.0703, 47.83: 2.0698, 47.84: 2.0694, 47.85: 2.069, 47.86: 2.0685, 47.87: 2.0681, 47.88: 2.0677, 47.89: 2.0672, 47.9: 2.0668, 47.91: 2.0664, 47.92: 2.0659, 47.93: 2.0655, 47.94: 2.0651, 47.95: 2.0647, 47.96: 2.0642, 47.97: 2.0638, 47.98: 2.0634, 47.99: 2.0629, 48.00: 2.0625, 48.01: 2.0621, 48.02: 2.0616, 48.03: 2.0612, 48.04: 2.0608, 48.05: 2.0604, 48.06: 2.0599, 48.07: 2.0595, 48.08: 2.0591, 48.09: 2.0586, 48.1: 2.0582, 48.11: 2.0578, 48.12: 2.0574, 48.13: 2.0569, 48.14: 2.0565, 48.15: 2.0561, 48.16: 2.0556, 48.17: 2.0552, 48.18: 2.0548, 48.19: 2.0544, 48.2: 2.0539, 48.21: 2.0535, 48.22: 2.0531, 48.23: 2.0527, 48.24: 2.0522, 48.25: 2.0518, 48.26: 2.0514, 48.27: 2.051, 48.28: 2.0505, 48.29: 2.0501, 48.3: 2.0497, 48.31: 2.0493, 48.32: 2.0488, 48.33: 2.0484, 48.34: 2.048, 48.35: 2.0476, 48.36: 2.0471, 48.37: 2.0467, 48.38: 2.0463, 48.39: 2.0459, 48.4: 2.0455, 48.41: 2.045, 48.42: 2.0446, 48.43: 2.0442, 48.44: 2.0438, 48.45: 2.0433, 48.46: 2.0429, 48.47: 2.0425, 48.48: 2.0421, 48.49: 2.0417, 48.5: 2.0412, 48.51: 2.0408, 48.52: 2.0404, 48.53: 2.04, 48.54: 2.0396, 48.55: 2.0391, 48.56: 2.0387, 48.57: 2.0383, 48.58: 2.0379, 48.59: 2.0375, 48.6: 2.037, 48.61: 2.0366, 48.62: 2.0362, 48.63: 2.0358, 48.64: 2.0354, 48.65: 2.0349, 48.66: 2.0345, 48.67: 2.0341, 48.68: 2.0337, 48.69: 2.0333, 48.7: 2.0329, 48.71: 2.0324, 48.72: 2.032, 48.73: 2.0316, 48.74: 2.0312, 48.75: 2.0308, 48.76: 2.0304, 48.77: 2.0299, 48.78: 2.0295, 48.79: 2.0291, 48.8: 2.0287, 48.81: 2.0283, 48.82: 2.0279, 48.83: 2.0274, 48.84: 2.027, 48.85: 2.0266, 48.86: 2.0262, 48.87: 2.0258, 48.88: 2.0254, 48.89: 2.025, 48.9: 2.0245, 48.91: 2.0241, 48.92: 2.0237, 48.93: 2.0233, 48.94: 2.0229, 48.95: 2.0225, 48.96: 2.0221, 48.97: 2.0216, 48.98: 2.0212, 48.99: 2.0208, 49.00: 2.0204, 49.01: 2.02, 49.02: 2.0196, 49.03: 2.0192, 49.04: 2.0188, 49.05: 2.0183, 49.06: 2.0179, 49.07: 2.0175, 49.08: 2.0171, 49.09: 2.0167, 49.1: 2.0163, 49.11: 2.0159, 49.12: 2.0155, 49.13: 2.0151, 49.14: 2.0147, 49.15: 2.0142, 49.16: 2.0138, 49.17: 2.0134, 49.18: 2.013, 49.19: 2.0126, 49.2: 2.0122, 49.21: 2.0118, 49.22: 2.0114, 49.23: 2.011, 49.24: 2.0106, 49.25: 2.0102, 49.26: 2.0097, 49.27: 2.0093, 49.28: 2.0089, 49.29: 2.0085, 49.3: 2.0081, 49.31: 2.0077, 49.32: 2.0073, 49.33: 2.0069, 49.34: 2.0065, 49.35: 2.0061, 49.36: 2.0057, 49.37: 2.0053, 49.38: 2.0049, 49.39: 2.0045, 49.4: 2.004, 49.41: 2.0036, 49.42: 2.0032, 49.43: 2.0028, 49.44: 2.0024, 49.45: 2.002, 49.46: 2.0016, 49.47: 2.0012, 49.48: 2.0008, 49.49: 2.0004, 49.5: 2.0, 49.51: 1.9996, 49.52: 1.9992, 49.53: 1.9988, 49.54: 1.9984, 49.55: 1.998, 49.56: 1.9976, 49.57: 1.9972, 49.58: 1.9968, 49.59: 1.9964, 49.6: 1.996, 49.61: 1.9956, 49.62: 1.9952, 49.63: 1.9948, 49.64: 1.9944, 49.65: 1.994, 49.66: 1.9936, 49.67: 1.9932, 49.68: 1.9928, 49.69: 1.9924, 49.7: 1.992, 49.71: 1.9916, 49.72: 1.9912, 49.73: 1.9908, 49.74: 1.9903, 49.75: 1.9899, 49.76: 1.9895, 49.77: 1.9892, 49.78: 1.9888, 49.79: 1.9884, 49.8: 1.988, 49.81: 1.9876, 49.82: 1.9872, 49.83: 1.9868, 49.84: 1.9864, 49.85: 1.986, 49.86: 1.9856, 49.87: 1.9852, 49.88: 1.9848, 49.89: 1.9844, 49.9: 1.984, 49.91: 1.9836, 49.92: 1.9832, 49.93: 1.9828, 49.94: 1.9824, 49.95: 1.982, 49.96: 1.9816, 49.97: 1.9812, 49.98: 1.9808, 49.99: 1.9804, 50.00: 1.98, 50.01: 1.9796, 50.02: 1.9792, 50.03: 1.9788, 50.04: 1.9784, 50.05: 1.978, 50.06: 1.9776, 50.07: 1.9772, 50.08: 1.9768, 50.09: 1.9764, 50.1: 1.976, 50.11: 1.9757, 50.12: 1.9753, 50.13: 1.9749, 50.14: 1.9745, 50.15: 1.9741, 50.16: 1.9737, 50.17: 1.9733, 50.18: 1.9729, 50.19: 1.9725, 50.2: 1.9721, 50.21: 1.9717, 50.22: 1.9713, 50.23: 1.9709, 50.24: 1.9705, 50.25: 1.9701, 50.26: 1.9698, 50.27: 1.9694, 50.28: 1.969, 50.29: 1.9686, 50.3: 1.9682, 50.31: 1.9678, 50.32: 1.9674, 50.33: 1.967, 50.34: 1.9666, 50.35: 1.9662, 50.36: 1.9658, 50.37: 1.9655, 50.38: 1.9651, 50.39: 1.9647, 50.4: 1.9643, 50.41: 1.9639, 50.42: 1.9635, 50.43: 1.9631, 50.44: 1.9627, 50.45: 1.9623, 50.46: 1.962, 50.47: 1.9616, 50.48: 1.9612, 50.49: 1.9608, 50.5: 1.9604, 50.51: 1.96, 50.52: 1.9596, 50.53: 1.9592, 50.54: 1.9588, 50.55: 1.9585, 50.56: 1.9581, 50.57: 1.9577, 50.58: 1.9573, 50.59: 1.9569, 50.6: 1.9565, 50.61: 1.9561, 50.62: 1.9557, 50.63: 1.9554, 50.64: 1.955, 50.65: 1.9546, 50.66: 1.9542, 50.67: 1.9538, 50.68: 1.9534, 50.69: 1.953, 50.7: 1.9527, 50.71: 1.9523, 50.72: 1.9519, 50.73: 1.9515, 50.74: 1.9511, 50.75: 1.9507, 50.76: 1.9504, 50.77: 1.95, 50.78: 1.9496, 50.79: 1.9492, 50.8: 1.9488, 50.81: 1.9484, 50.82: 1.9481, 50.83: 1.9477, 50.84: 1.9473, 50.85: 1.9469, 50.86: 1.9465, 50.87: 1.9461, 50.88: 1.9458, 50.89: 1.9454, 50.9: 1.945, 50.91: 1.9446, 50.92: 1.9442, 50.93: 1.9438, 50.94: 1.9435, 50.95: 1.9431, 50.96: 1.9427, 50.97: 1.9423, 50.98: 1.9419, 50.99: 1.9416, 51.00: 1.9412, 51.01: 1.9408, 51.02: 1.9404, 51.03: 1.94, 51.04: 1.9397, 51.05: 1.9393, 51.06: 1.9389, 51.07: 1.9385, 51.08: 1.9381, 51.09: 1.9378, 51.1: 1.9374, 51.11: 1.937, 51.12: 1.9366, 51.13: 1.9362, 51.14: 1.9359, 51.15: 1.9355, 51.16: 1.9351, 51.17: 1.9347, 51.18: 1.9343, 51.19: 1.934, 51.2: 1.9336, 51.21: 1.9332, 51.22: 1.9328, 51.23: 1.9325, 51.24: 1.9321, 51.25: 1.9317, 51.26: 1.9313, 51.27: 1.931, 51.28: 1.9306, 51.29: 1.9302, 51.3: 1.9298, 51.31: 1.9294, 51.32: 1.9291, 51.33: 1.9287, 51.34: 1.9283, 51.35: 1.9279, 51.36: 1.9276, 51.37: 1.9272, 51.38: 1.9268, 51.39: 1.9264, 51.4: 1.9261, 51.41: 1.9257, 51.42: 1.9253, 51.43: 1.9249, 51.44: 1.9246, 51.45: 1.9242, 51.46: 1.9238, 51.47: 1.9235, 51.48: 1.9231, 51.49: 1.9227, 51.5: 1.9223, 51.51: 1.922, 51.52: 1.9216, 51.53: 1.9212, 51.54: 1.9208, 51.55: 1.9205, 51.56: 1.9201, 51.57: 1.9197, 51.58: 1.9193, 51.59: 1.919, 51.6: 1.9186, 51.61: 1.9182, 51.62: 1.9179, 51.63: 1.9175, 51.64: 1.9171, 51.65: 1.9167, 51.66: 1.9164, 51.67: 1.916, 51.68: 1.9156, 51.69: 1.9153, 51.7: 1.9149, 51.71: 1.9145, 51.72: 1.9142, 51.73: 1.9138, 51.74: 1.9134, 51.75: 1.913, 51.76: 1.9127, 51.77: 1.9123, 51.78: 1.9119, 51.79: 1.9116, 51.8: 1.9112, 51.81: 1.9108, 51.82: 1.9105, 51.83: 1.9101, 51.84: 1.9097, 51.85: 1.9094, 51.86: 1.909, 51.87: 1.9086, 51.88: 1.9082, 51.89: 1.9079, 51.9: 1.9075, 51.91: 1.9071, 51.92: 1.9068, 51.93: 1.9064, 51.94: 1.906, 51.95: 1.9057, 51.96: 1.9053, 51.97: 1.9049, 51.98: 1.9046, 51.99: 1.9042, 52.00: 1.9038, 52.01: 1.9035, 52.02: 1.9031, 52.03: 1.9027, 52.04: 1.9024, 52.05: 1.902, 52.06: 1.9017, 52.07: 1.9013, 52.08: 1.9009, 52.09: 1.9006, 52.1: 1.9002, 52.11: 1.8998, 52.12: 1.8995, 52.13: 1.8991, 52.14: 1.8987, 52.15: 1.8984, 52.16: 1.898, 52.17: 1.8976, 52.18: 1.8973, 52.19: 1.8969, 52.2: 1.8966, 52.21: 1.8962, 52.22: 1.8958, 52.23: 1.8955, 52.24: 1.8951, 52.25: 1.8947, 52.26: 1.8944, 52.27: 1.894, 52.28: 1.8936, 52.29: 1.8933, 52.3: 1.8929, 52.31: 1.8926, 52.32: 1.8922, 52.33: 1.8918, 52.34: 1.8915, 52.35: 1.8911, 52.36: 1.8908, 52.37: 1.8904, 52.38: 1.89, 52.39: 1.8897, 52.4: 1.8893, 52.41: 1.889, 52.42: 1.8886, 52.43: 1.8882, 52.44: 1.8879, 52.45: 1.8875, 52.46: 1.8872, 52.47: 1.8868, 52.48: 1.8864, 52.49: 1.8861, 52.5: 1.8857, 52.51: 1.8854, 52.52: 1.885, 52.53: 1.8846, 52.54: 1.8843, 52.55: 1.8839, 52.56: 1.8836, 52.57: 1.8832, 52.58: 1.8828, 52.59: 1.8825, 52.6: 1.8821, 52.61: 1.8818, 52.62: 1.8814, 52.63: 1.8811, 52.64: 1.8807, 52.65: 1.8803, 52.66: 1.88, 52.67: 1.8796, 52.68: 1.8793, 52.69: 1.8789, 52.7: 1.8786, 52.71: 1.8782, 52.72: 1.8778, 52.73: 1.8775, 52.74: 1.8771, 52.75: 1.8768, 52.76: 1.8764, 52.77: 1.8761, 52.78: 1.8757, 52.79: 1.8754, 52.8: 1.875, 52.81: 1.8746, 52.82: 1.8743, 52.83: 1.8739, 52.84: 1.8736, 52.85: 1.8732, 52.86: 1.8729, 52.87: 1.8725, 52.88: 1.8722, 52.89: 1.8718, 52.9: 1.8715, 52.91: 1.8711, 52.92: 1.8707, 52.93: 1.8704, 52.94: 1.87, 52.95: 1.8697, 52.96: 1.8693, 52.97: 1.869, 52.98: 1.8686, 52.99: 1.8683, 53.00: 1.8679, 53.01: 1.8676, 53.02: 1.8672, 53.03: 1.8669, 53.04: 1.8665, 53.05: 1.8662, 53.06: 1.8658, 53.07: 1.8655, 53.08: 1.8651, 53.09: 1.8648, 53.1: 1.8644, 53.11: 1.8641, 53.12: 1.8637, 53.13: 1.8634, 53.14: 1.863, 53.15: 1.8627, 53.16: 1.8623, 53.17: 1.862, 53.18: 1.8616, 53.19: 1.8613, 53.2: 1.8609, 53.21: 1.8606, 53.22: 1.8602, 53.23: 1.8599, 53.24: 1.8595, 53.25: 1.8592, 53.26: 1.8588, 53.27: 1.8585, 53.28: 1.8581, 53.29: 1.8578, 53.3: 1.8574, 53.31: 1.8571, 53.32: 1.8567, 53.33: 1.8564, 53.34: 1.856, 53.35: 1.8557, 53.36: 1.8553, 53.37: 1.855, 53.38: 1.8546, 53.39: 1.8543, 53.4: 1.8539, 53.41: 1.8536, 53.42: 1.8532, 53.43: 1.8529, 53.44: 1.8525, 53.45: 1.8522, 53.46: 1.8519, 53.47: 1.8515, 53.48: 1.8512, 53.49: 1.8508, 53.5: 1.8505, 53.51: 1.8501, 53.52: 1.8498, 53.53: 1.8494, 53.54: 1.8491, 53.55: 1.8487, 53.56: 1.8484, 53.57: 1.848, 53.58: 1.8477, 53.59: 1.8474, 53.6: 1.847, 53.61: 1.8467, 53.62: 1.8463, 53.63: 1.846, 53.64: 1.8456, 53.65: 1.8453, 53.66: 1.8449, 53.67: 1.8446, 53.68: 1.8443, 53.69: 1.8439, 53.7: 1.8436, 53.71: 1.8432, 53.72: 1.8429, 53.73: 1.8425, 53.74: 1.8422, 53.75: 1.8419, 53.76: 1.8415, 53.77: 1.8412, 53.78: 1.8408, 53.79: 1.8405, 53.8: 1.8401, 53.81: 1.8398, 53.82: 1.8395, 53.83: 1.8391, 53.84: 1.8388, 53.85: 1.8384, 53.86: 1.8381, 53.87: 1.8378, 53.88: 1.8374, 53.89: 1.8371, 53.9: 1.8367, 53.91: 1.8364, 53.92: 1.8361, 53.93: 1.8357, 53.94: 1.8354, 53.95: 1.835, 53.96: 1.8347, 53.97: 1.8344, 53.98: 1.834, 53.99: 1.8337, 54.00: 1.8333, 54.01: 1.833, 54.02: 1.8327, 54.03: 1.8323, 54.04: 1.832, 54.05: 1.8316, 54.06: 1.8313, 54.07: 1.831, 54.08: 1.8306, 54.09: 1.8303, 54.1: 1.8299, 54.11: 1.8296, 54.12: 1.8293, 54.13: 1.8289, 54.14: 1.8286, 54.15: 1.8283, 54.16: 1.8279, 54.17: 1.8276, 54.18: 1.8272, 54.19: 1.8269, 54.2: 1.8266, 54.21: 1.8262, 54.22: 1.8259, 54.23: 1.8256, 54.24: 1.8252, 54.25: 1.8249, 54.26: 1.8245, 54.27: 1.8242, 54.28: 1.8239, 54.29: 1.8235, 54.3: 1.8232, 54.31: 1.8229, 54.32: 1.8225, 54.33: 1.8222, 54.34: 1.8219, 54.35: 1.8215, 54.36: 1.8212, 54.37: 1.8209, 54.38: 1.8205, 54.39: 1.8202, 54.4: 1.8199, 54.41: 1.8195, 54.42: 1.8192, 54.43: 1.8188, 54.44: 1.8185, 54.45: 1.8182, 54.46: 1.8178, 54.47: 1.8175, 54.48: 1.8172, 54.49: 1.8168, 54.5: 1.8165, 54.51: 1.8162, 54.52: 1.8158, 54.53: 1.8155, 54.54: 1.8152, 54.55: 1.8148, 54.56: 1.8145, 54.57: 1.8142, 54.58: 1.8139, 54.59: 1.8135, 54.6: 1.8132, 54.61: 1.8129, 54.62: 1.8125, 54.63: 1.8122, 54.64: 1.8119, 54.65: 1.8115, 54.66: 1.8112, 54.67: 1.8109, 54.68: 1.8105, 54.69: 1.8102, 54.7: 1.8099, 54.71: 1.8095, 54.72: 1.8092, 54.73: 1.8089, 54.74: 1.8085, 54.75: 1.8082, 54.76: 1.8079, 54.77: 1.8076, 54.78: 1.8072, 54.79: 1.8069, 54.8: 1.8066, 54.81: 1.8062, 54.82: 1.8059, 54.83: 1.8056, 54.84: 1.8053, 54.85: 1.8049, 54.86: 1.8046, 54.87: 1.8043, 54.88: 1.8039, 54.89: 1.8036, 54.9: 1.8033, 54.91: 1.803, 54.92: 1.8026, 54.93: 1.8023, 54.94: 1.802, 54.95: 1.8016, 54.96: 1.8013, 54.97: 1.801, 54.98: 1.8007, 54.99: 1.8003, 55.00: 1.8, 55.01: 1.7997, 55.02: 1.7993, 55.03: 1.799, 55.04: 1.7987, 55.05: 1.7984, 55.06: 1.798, 55.07: 1.7977, 55.08: 1.7974, 55.09: 1.7971, 55.1: 1.7967, 55.11: 1.7964, 55.12: 1.7961, 55.13: 1.7958, 55.14: 1.7954, 55.15: 1.7951, 55.16: 1.7948, 55.17: 1.7945, 55.18: 1.7941, 55.19: 1.7938, 55.2: 1.7935, 55.21: 1.7932, 55.22: 1.7928, 55.23: 1.7925, 55.24: 1.7922, 55.25: 1.7919, 55.26: 1.7915, 55.27: 1.7912, 55.28: 1.7909, 55.29: 1.7906, 55.3: 1.7902, 55.31: 1.7899, 55.32: 1.7896, 55.33: 1.7893, 55.34: 1.7889, 55.35: 1.7886, 55.36: 1.7883, 55.37: 1.788, 55.38: 1.7876, 55.39: 1.7873, 55.4: 1.787, 55.41: 1.7867, 55.42: 1.7864, 55.43: 1.786, 55.44: 1.7857, 55.45: 1.7854, 55.46: 1.7851, 55.47: 1.7847, 55.48: 1.7844, 55.49: 1.7841, 55.5: 1.7838, 55.51: 1.7835, 55.52: 1.7831, 55.53: 1.7828, 55.54: 1.7825, 55.55: 1.7822, 55.56: 1.7819, 55.57: 1.7815, 55.58: 1.7812, 55.59: 1.7809, 55.6: 1.7806, 55.61: 1.7803, 55.62: 1.7799, 55.63: 1.7796, 55.64: 1.7793, 55.65: 1.779, 55.66: 1.7787, 55.67: 1.7783, 55.68: 1.778, 55.69: 1.7777, 55.7: 1.7774, 55.71: 1.7771, 55.72: 1.7767, 55.73: 1.7764, 55.74: 1.7761, 55.75: 1.7758, 55.76: 1.7755, 55.77: 1.7751, 55.78: 1.7748, 55.79: 1.7745, 55.8: 1.7742, 55.81: 1.7739, 55.82: 1.7736, 55.83: 1.7732, 55.84: 1.7729, 55.85: 1.7726, 55.86: 1.7723, 55.87: 1.772, 55.88: 1.7717, 55.89: 1.7713, 55.9: 1.771, 55.91: 1.7707, 55.92: 1.7704, 55.93: 1.7701, 55.94: 1.7698, 55.95: 1.7694, 55.96: 1.7691, 55.97: 1.7688, 55.98: 1.7685, 55.99: 1.7682, 56.00: 1.7679, 56.01: 1.7675, 56.02: 1.7672, 56.03: 1.7669, 56.04: 1.7666, 56.05: 1.7663, 56.06: 1.766, 56.07: 1.7657, 56.08: 1.7653, 56.09: 1.765, 56.1: 1.7647, 56.11: 1.7644, 56.12: 1.7641, 56.13: 1.7638, 56.14: 1.7634, 56.15: 1.7631, 56.16: 1.7628, 56.17: 1.7625, 56.18: 1.7622, 56.19: 1.7619, 56.2: 1.7616, 56.21: 1.7613, 56.22: 1.7609, 56.23: 1.7606, 56.24: 1.7603, 56.25: 1.76, 56.26: 1.7597, 56.27: 1.7594, 56.28: 1.7591, 56.29: 1.7587, 56.3: 1.7584, 56.31: 1.7581, 56.32: 1.7578, 56.33: 1.7575, 56.34: 1.7572, 56.35: 1.7569, 56.36: 1.7566, 56.37: 1.7563, 56.38: 1.7559, 56.39: 1.7556, 56.4: 1.7553, 56.41: 1.755, 56.42: 1.7547, 56.43: 1.7544, 56.44: 1.7541, 56.45: 1.7538, 56.46: 1.7535, 56.47: 1.7531, 56.48: 1.7528, 56.49: 1.7525, 56.5: 1.7522, 56.51: 1.7519, 56.52: 1.7516, 56.53: 1.7513, 56.54: 1.751, 56.55: 1.7507, 56.56: 1.7504, 56.57: 1.75, 56.58: 1.7497, 56.59: 1.7494, 56.6: 1.7491, 56.61: 1.7488, 56.62: 1.7485, 56.63: 1.7482, 56.64: 1.7479, 56.65: 1.7476, 56.66: 1.7473, 56.67: 1.747, 56.68: 1.7466, 56.69: 1.7463, 56.7: 1.746, 56.71: 1.7457, 56.72: 1.7454, 56.73: 1.7451, 56.74: 1.7448, 56.75: 1.7445, 56.76: 1.7442, 56.77: 1.7439, 56.78: 1.7436, 56.79: 1.7433, 56.8: 1.743, 56.81: 1.7427, 56.82: 1.7423, 56.83: 1.742, 56.84: 1.7417, 56.85: 1.7414, 56.86: 1.7411, 56.87: 1.7408, 56.88: 1.7405, 56.89: 1.7402, 56.9: 1.7399, 56.91: 1.7396, 56.92: 1.7393, 56.93: 1.739, 56.94: 1.7387, 56.95: 1.7384, 56.96: 1.7381, 56.97: 1.7378, 56.98: 1.7375, 56.99: 1.7371, 57.00: 1.7368, 57.01: 1.7365, 57.02: 1.7362, 57.03: 1.7359, 57.04: 1.7356, 57.05: 1.7353, 57.06: 1.735, 57.07: 1.7347, 57.08: 1.7344, 57.09: 1.7341, 57.1: 1.7338, 57.11: 1.7335, 57.12: 1.7332, 57.13: 1.7329, 57.14: 1.7326, 57.15: 1.7323, 57.16: 1.732, 57.17: 1.7317, 57.18: 1.7314, 57.19: 1.7311, 57.2: 1.7308, 57.21: 1.7305, 57.22: 1.7302, 57.23: 1.7299, 57.24: 1.7296, 57.25: 1.7293, 57.26: 1.729, 57.27: 1.7287, 57.28: 1.7284, 57.29: 1.7281, 57.3: 1.7277, 57.31: 1.7274, 57.32: 1.7271, 57.33: 1.7268, 57.34: 1.7265, 57.35: 1.7262, 57.36: 1.7259, 57.37: 1.7256, 57.38: 1.7253, 57.39: 1.725, 57.4: 1.7247, 57.41: 1.7244, 57.42: 1.7241, 57.43: 1.7238, 57.44: 1.7235, 57.45: 1.7232, 57.46: 1.7229, 57.47: 1.7226, 57.48: 1.7223, 57.49: 1.722, 57.5: 1.7217, 57.51: 1.7214, 57.52: 1.7211, 57.53: 1.7208, 57.54: 1.7205, 57.55: 1.7202, 57.56: 1.7199, 57.57: 1.7196, 57.58: 1.7193, 57.59: 1.719, 57.6: 1.7188, 57.61: 1.7185, 57.62: 1.7182, 57.63: 1.7179, 57.64: 1.7176, 57.65: 1.7173, 57.66: 1.717, 57.67: 1.7167, 57.68: 1.7164, 57.69: 1.7161, 57.7: 1.7158, 57.71: 1.7155, 57.72: 1.7152, 57.73: 1.7149, 57.74: 1.7146, 57.75: 1.7143, 57.76: 1.714, 57.77: 1.7137, 57.78: 1.7134, 57.79: 1.7131, 57.8: 1.7128, 57.81: 1.7125, 57.82: 1.7122, 57.83: 1.7119, 57.84: 1.7116, 57.85: 1.7113, 57.86: 1.711, 57.87: 1.7107, 57.88: 1.7104, 57.89: 1.7101, 57.9: 1.7098, 57.91: 1.7095, 57.92: 1.7093, 57.93: 1.709, 57.94: 1.7087, 57.95: 1.7084, 57.96: 1.7081, 57.97: 1.7078, 57.98: 1.7075, 57.99: 1.7072, 58.00: 1.7069, 58.01: 1.7066, 58.02: 1.7063, 58.03: 1.706, 58.04: 1.7057, 58.05: 1.7054, 58.06: 1.7051, 58.07: 1.7048, 58.08: 1.7045, 58.09: 1.7043, 58.1: 1.704, 58.11: 1.7037, 58.12: 1.7034, 58.13: 1.7031, 58.14: 1.7028, 58.15: 1.7025, 58.16: 1.7022, 58.17: 1.7019, 58.18: 1.7016, 58.19: 1.7013, 58.2: 1.701, 58.21: 1.7007, 58.22: 1.7004, 58.23: 1.7002, 58.24: 1.6999, 58.25: 1.6996, 58.26: 1.6993, 58.27: 1.699, 58.28: 1.6987, 58.29: 1.6984, 58.3: 1.6981, 58.31: 1.6978, 58.32: 1.6975, 58.33: 1.6972, 58.34: 1.6969, 58.35: 1.6967, 58.36: 1.6964, 58.37: 1.6961, 58.38: 1.6958, 58.39: 1.6955, 58.4: 1.6952, 58.41: 1.6949, 58.42: 1.6946, 58.43: 1.6943, 58.44: 1.694, 58.45: 1.6938, 58.46: 1.6935, 58.47: 1.6932, 58.48: 1.6929, 58.49: 1.6926, 58.5: 1.6923, 58.51: 1.692, 58.52: 1.6917, 58.53: 1.6914, 58.54: 1.6912, 58.55: 1.6909, 58.56: 1.6906, 58.57: 1.6903, 58.58: 1.69, 58.59: 1.6897, 58.6: 1.6894, 58.61: 1.6891, 58.62: 1.6888, 58.63: 1.6886, 58.64: 1.6883, 58.65: 1.688, 58.66: 1.6877, 58.67: 1.6874, 58.68: 1.6871, 58.69: 1.6868, 58.7: 1.6865, 58.71: 1.6863, 58.72: 1.686, 58.73: 1.6857, 58.74: 1.6854, 58.75: 1.6851, 58.76: 1.6848, 58.77: 1.6845, 58.78: 1.6842, 58.79: 1.684, 58.8: 1.6837, 58.81: 1.6834, 58.82: 1.6831, 58.83: 1.6828, 58.84: 1.6825, 58.85: 1.6822, 58.86: 1.682, 58.87: 1.6817, 58.88: 1.6814, 58.89: 1.6811, 58.9: 1.6808, 58.91: 1.6805, 58.92: 1.6802, 58.93: 1.68, 58.94: 1.6797, 58.95: 1.6794, 58.96: 1.6791, 58.97: 1.6788, 58.98: 1.6785, 58.99: 1.6783, 59.00: 1.678, 59.01: 1.6777, 59.02: 1.6774, 59.03: 1.6771, 59.04: 1.6768, 59.05: 1.6765, 59.06: 1.6763, 59.07: 1.676, 59.08: 1.6757, 59.09: 1.6754, 59.1: 1.6751, 59.11: 1.6748, 59.12: 1.6746, 59.13: 1.6743, 59.14: 1.674, 59.15: 1.6737, 59.16: 1.6734, 59.17: 1.6731, 59.18: 1.6729, 59.19: 1.6726, 59.2: 1.6723, 59.21: 1.672, 59.22: 1.6717, 59.23: 1.6715, 59.24: 1.6712, 59.25: 1.6709, 59.26: 1.6706, 59.27: 1.6703, 59.28: 1.67, 59.29: 1.6698, 59.3: 1.6695, 59.31: 1.6692, 59.32: 1.6689, 59.33: 1.6686, 59.34: 1.6684, 59.35: 1.6681, 59.36: 1.6678, 59.37: 1.6675, 59.38: 1.6672, 59.39: 1.6669, 59.4: 1.6667, 59.41: 1.6664, 59.42: 1.6661, 59.43: 1.6658, 59.44: 1.6655, 59.45: 1.6653, 59.46: 1.665, 59.47: 1.6647, 59.48: 1.6644, 59.49: 1.6641, 59.5: 1.6639, 59.51: 1.6636, 59.52: 1.6633, 59.53: 1.663, 59.54: 1.6627, 59.55: 1.6625, 59.56: 1.6622, 59.57: 1.6619, 59.58: 1.6616, 59.59: 1.6614, 59.6: 1.6611, 59.61: 1.6608, 59.62: 1.6605, 59.63: 1.6602, 59.64: 1.66, 59.65: 1.6597, 59.66: 1.6594, 59.67: 1.6591, 59.68: 1.6588, 59.69: 1.6586, 59.7: 1.6583, 59.71: 1.658, 59.72: 1.6577, 59.73: 1.6575, 59.74: 1.6572, 59.75: 1.6569, 59.76: 1.6566, 59.77: 1.6563, 59.78: 1.6561, 59.79: 1.6558, 59.8: 1.6555, 59.81: 1.6552, 59.82: 1.655, 59.83: 1.6547, 59.84: 1.6544, 59.85: 1.6541, 59.86: 1.6539, 59.87: 1.6536, 59.88: 1.6533, 59.89: 1.653, 59.9: 1.6528, 59.91: 1.6525, 59.92: 1.6522, 59.93: 1.6519, 59.94: 1.6517, 59.95: 1.6514, 59.96: 1.6511, 59.97: 1.6508, 59.98: 1.6506, 59.99: 1.6503, 60.00: 1.65, 60.01: 1.6497, 60.02: 1.6495, 60.03: 1.6492, 60.04: 1.6489, 60.05: 1.6486, 60.06: 1.6484, 60.07: 1.6481, 60.08: 1.6478, 60.09: 1.6475, 60.1: 1.6473, 60.11: 1.647, 60.12: 1.6467, 60.13: 1.6464, 60.14: 1.6462, 60.15: 1.6459, 60.16: 1.6456, 60.17: 1.6453, 60.18: 1.6451, 60.19: 1.6448, 60.2: 1.6445, 60.21: 1.6442, 60.22: 1.644, 60.23: 1.6437, 60.24: 1.6434, 60.25: 1.6432, 60.26: 1.6429, 60.27: 1.6426, 60.28: 1.6423, 60.29: 1.6421, 60.3: 1.6418, 60.31: 1.6415, 60.32: 1.6412, 60.33: 1.641, 60.34: 1.6407, 60.35: 1.6404, 60.36: 1.6402, 60.37: 1.6399, 60.38: 1.6396, 60.39: 1.6393, 60.4: 1.6391, 60.41: 1.6388, 60.42: 1.6385, 60.43: 1.6383, 60.44: 1.638, 60.45: 1.6377, 60.46: 1.6374, 60.47: 1.6372, 60.48: 1.6369, 60.49: 1.6366, 60.5: 1.6364, 60.51: 1.6361, 60.52: 1.6358, 60.53: 1.6356, 60.54: 1.6353, 60.55: 1.635, 60.56: 1.6347, 60.57: 1.6345, 60.58: 1.6342, 60.59: 1.6339, 60.6: 1.6337, 60.61: 1.6334, 60.62: 1.6331, 60.63: 1.6329, 60.64: 1.6326, 60.65: 1.6323, 60.66: 1.632, 60.67: 1.6318, 60.68: 1.6315, 60.69: 1.6312, 60.7: 1.631, 60.71: 1.6307, 60.72: 1.6304, 60.73: 1.6302, 60.74: 1.6299, 60.75: 1.6296, 60.76: 1.6294, 60.77: 1.6291, 60.78: 1.6288, 60.79: 1.6286, 60.8: 1.6283, 60.81: 1.628, 60.82: 1.6278, 60.83: 1.6275, 60.84: 1.6272, 60.85: 1.627, 60.86: 1.6267, 60.87: 1.6264, 60.88: 1.6261, 60.89: 1.6259, 60.9: 1.6256, 60.91: 1.6253, 60.92: 1.6251, 60.93: 1.6248, 60.94: 1.6245, 60.95: 1.6243, 60.96: 1.624, 60.97: 1.6237, 60.98: 1.6235, 60.99: 1.6232, 61.00: 1.623, 61.01: 1.6227, 61.02: 1.6224, 61.03: 1.6222, 61.04: 1.6219, 61.05: 1.6216, 61.06: 1.6214, 61.07: 1.6211, 61.08: 1.6208, 61.09: 1.6206, 61.1: 1.6203, 61.11: 1.62, 61.12: 1.6198, 61.13: 1.6195, 61.14: 1.6192, 61.15: 1.619, 61.16: 1.6187, 61.17: 1.6184, 61.18: 1.6182, 61.19: 1.6179, 61.2: 1.6176, 61.21: 1.6174, 61.22: 1.6171, 61.23: 1.6169, 61.24: 1.6166, 61.25: 1.6163, 61.26: 1.6161, 61.27: 1.6158, 61.28: 1.6155, 61.29: 1.6153, 61.3: 1.615, 61.31: 1.6147, 61.32: 1.6145, 61.33: 1.6142, 61.34: 1.614, 61.35: 1.6137, 61.36: 1.6134, 61.37: 1.6132, 61.38: 1.6129, 61.39: 1.6126, 61.4: 1.6124, 61.41: 1.6121, 61.42: 1.6119, 61.43: 1.6116, 61.44: 1.6113, 61.45: 1.6111, 61.46: 1.6108, 61.47: 1.6105, 61.48: 1.6103, 61.49: 1.61, 61.5: 1.6098, 61.51: 1.6095, 61.52: 1.6092, 61.53: 1.609, 61.54: 1.6087, 61.55: 1.6084, 61.56: 1.6082, 61.57: 1.6079, 61.58: 1.6077, 61.59: 1.6074, 61.6: 1.6071, 61.61: 1.6069, 61.62: 1.6066, 61.63: 1.6064, 61.64: 1.6061, 61.65: 1.6058, 61.66: 1.6056, 61.67: 1.6053, 61.68: 1.6051, 61.69: 1.6048, 61.7: 1.6045, 61.71: 1.6043, 61.72: 1.604, 61.73: 1.6038, 61.74: 1.6035, 61.75: 1.6032, 61.76: 1.603, 61.77: 1.6027, 61.78: 1.6025, 61.79: 1.6022, 61.8: 1.6019, 61.81: 1.6017, 61.82: 1.6014, 61.83: 1.6012, 61.84: 1.6009, 61.85: 1.6006, 61.86: 1.6004, 61.87: 1.6001, 61.88: 1.5999, 61.89: 1.5996, 61.9: 1.5994, 61.91: 1.5991, 61.92: 1.5988, 61.93: 1.5986, 61.94: 1.5983, 61.95: 1.5981, 61.96: 1.5978, 61.97: 1.5975, 61.98: 1.5973, 61.99: 1.597, 62.00: 1.5968, 62.01: 1.5965, 62.02: 1.5963, 62.03: 1.596, 62.04: 1.5957, 62.05: 1.5955, 62.06: 1.5952, 62.07: 1.595, 62.08: 1.5947, 62.09: 1.5945, 62.1: 1.5942, 62.11: 1.5939, 62.12: 1.5937, 62.13: 1.5934, 62.14: 1.5932, 62.15: 1.5929, 62.16: 1.5927, 62.17: 1.5924, 62.18: 1.5922, 62.19: 1.5919, 62.2: 1.5916, 62.21: 1.5914, 62.22: 1.5911, 62.23: 1.5909, 62.24: 1.5906, 62.25: 1.5904, 62.26: 1.5901, 62.27: 1.5899, 62.28: 1.5896, 62.29: 1.5893, 62.3: 1.5891, 62.31: 1.5888, 62.32: 1.5886, 62.33: 1.5883, 62.34: 1.5881, 62.35: 1.5878, 62.36: 1.5876, 62.37: 1.5873, 62.38: 1.587, 62.39: 1.5868, 62.4: 1.5865, 62.41: 1.5863, 62.42: 1.586, 62.43: 1.5858, 62.44: 1.5855, 62.45: 1.5853, 62.46: 1.585, 62.47: 1.5848, 62.48: 1.5845, 62.49: 1.5843, 62.5: 1.584, 62.51: 1.5837, 62.52: 1.5835, 62.53: 1.5832, 62.54: 1.583, 62.55: 1.5827, 62.56: 1.5825, 62.57: 1.5822, 62.58: 1.582, 62.59: 1.5817, 62.6: 1.5815, 62.61: 1.5812, 62.62: 1.581, 62.63: 1.5807, 62.64: 1.5805, 62.65: 1.5802, 62.66: 1.58, 62.67: 1.5797, 62.68: 1.5795, 62.69: 1.5792, 62.7: 1.5789, 62.71: 1.5787, 62.72: 1.5784, 62.73: 1.5782, 62.74: 1.5779, 62.75: 1.5777, 62.76: 1.5774, 62.77: 1.5772, 62.78: 1.5769, 62.79: 1.5767, 62.8: 1.5764, 62.81: 1.5762, 62.82: 1.5759, 62.83: 1.5757, 62.84: 1.5754, 62.85: 1.5752, 62.86: 1.5749, 62.87: 1.5747, 62.88: 1.5744, 62.89: 1.5742, 62.9: 1.5739, 62.91: 1.5737, 62.92: 1.5734, 62.93: 1.5732, 62.94: 1.5729, 62.95: 1.5727, 62.96: 1.5724, 62.97: 1.5722, 62.98: 1.5719, 62.99: 1.5717, 63.00: 1.5714, 63.01: 1.5712, 63.02: 1.5709, 63.03: 1.5707, 63.04: 1.5704, 63.05: 1.5702, 63.06: 1.5699, 63.07: 1.5697, 63.08: 1.5694, 63.09: 1.5692, 63.1: 1.5689, 63.11: 1.5687, 63.12: 1.5684, 63.13: 1.5682, 63.14: 1.5679, 63.15: 1.5677, 63.16: 1.5674, 63.17: 1.5672, 63.18: 1.567, 63.19: 1.5667, 63.2: 1.5665, 63.21: 1.5662, 63.22: 1.566, 63.23: 1.5657, 63.24: 1.5655, 63.25: 1.5652, 63.26: 1.565, 63.27: 1.5647, 63.28: 1.5645, 63.29: 1.5642, 63.3: 1.564, 63.31: 1.5637, 63.32: 1.5635, 63.33: 1.5632, 63.34: 1.563, 63.35: 1.5627, 63.36: 1.5625, 63.37: 1.5623, 63.38: 1.562, 63.39: 1.5618, 63.4: 1.5615, 63.41: 1.5613, 63.42: 1.561, 63.43: 1.5608, 63.44: 1.5605, 63.45: 1.5603, 63.46: 1.56, 63.47: 1.5598, 63.48: 1.5595, 63.49: 1.5593, 63.5: 1.5591, 63.51: 1.5588, 63.52: 1.5586, 63.53: 1.5583, 63.54: 1.5581, 63.55: 1.5578, 63.56: 1.5576, 63.57: 1.5573, 63.58: 1.5571, 63.59: 1.5568, 63.6: 1.5566, 63.61: 1.5564, 63.62: 1.5561, 63.63: 1.5559, 63.64: 1.5556, 63.65: 1.5554, 63.66: 1.5551, 63.67: 1.5549, 63.68: 1.5546, 63.69: 1.5544, 63.7: 1.5542, 63.71: 1.5539, 63.72: 1.5537, 63.73: 1.5534, 63.74: 1.5532, 63.75: 1.5529, 63.76: 1.5527, 63.77: 1.5525, 63.78: 1.5522, 63.79: 1.552, 63.8: 1.5517, 63.81: 1.5515, 63.82: 1.5512, 63.83: 1.551, 63.84: 1.5508, 63.85: 1.5505, 63.86: 1.5503, 63.87: 1.55, 63.88: 1.5498, 63.89: 1.5495, 63.9: 1.5493, 63.91: 1.5491, 63.92: 1.5488, 63.93: 1.5486, 63.94: 1.5483, 63.95: 1.5481, 63.96: 1.5478, 63.97: 1.5476, 63.98: 1.5474, 63.99: 1.5471, 64.00: 1.5469, 64.01: 1.5466, 64.02: 1.5464, 64.03: 1.5462, 64.04: 1.5459, 64.05: 1.5457, 64.06: 1.5454, 64.07: 1.5452, 64.08: 1.5449, 64.09: 1.5447, 64.1: 1.5445, 64.11: 1.5442, 64.12: 1.544, 64.13: 1.5437, 64.14: 1.5435, 64.15: 1.5433, 64.16: 1.543, 64.17: 1.5428, 64.18: 1.5425, 64.19: 1.5423, 64.2: 1.5421, 64.21: 1.5418, 64.22: 1.5416, 64.23: 1.5413, 64.24: 1.5411, 64.25: 1.5409, 64.26: 1.5406, 64.27: 1.5404, 64.28: 1.5401, 64.29: 1.5399, 64.3: 1.5397, 64.31: 1.5394, 64.32: 1.5392, 64.33: 1.5389, 64.34: 1.5387, 64.35: 1.5385, 64.36: 1.5382, 64.37: 1.538, 64.38: 1.5377, 64.39: 1.5375, 64.4: 1.5373, 64.41: 1.537, 64.42: 1.5368, 64.43: 1.5366, 64.44: 1.5363, 64.45: 1.5361, 64.46: 1.5358, 64.47: 1.5356, 64.48: 1.5354, 64.49: 1.5351, 64.5: 1.5349, 64.51: 1.5346, 64.52: 1.5344, 64.53: 1.5342, 64.54: 1.5339, 64.55: 1.5337, 64.56: 1.5335, 64.57: 1.5332, 64.58: 1.533, 64.59: 1.5327, 64.6: 1.5325, 64.61: 1.5323, 64.62: 1.532, 64.63: 1.5318, 64.64: 1.5316, 64.65: 1.5313, 64.66: 1.5311, 64.67: 1.5308, 64.68: 1.5306, 64.69: 1.5304, 64.7: 1.5301, 64.71: 1.5299, 64.72: 1.5297, 64.73: 1.5294, 64.74: 1.5292, 64.75: 1.529, 64.76: 1.5287, 64.77: 1.5285, 64.78: 1.5282, 64.79: 1.528, 64.8: 1.5278, 64.81: 1.5275, 64.82: 1.5273, 64.83: 1.5271, 64.84: 1.5268, 64.85: 1.5266, 64.86: 1.5264, 64.87: 1.5261, 64.88: 1.5259, 64.89: 1.5257, 64.9: 1.5254, 64.91: 1.5252, 64.92: 1.525, 64.93: 1.5247, 64.94: 1.5245, 64.95: 1.5242, 64.96: 1.524, 64.97: 1.5238, 64.98: 1.5235, 64.99: 1.5233, 65.00: 1.5231, 65.01: 1.5228, 65.02: 1.5226, 65.03: 1.5224, 65.04: 1.5221, 65.05: 1.5219, 65.06: 1.5217, 65.07: 1.5214, 65.08: 1.5212, 65.09: 1.521, 65.1: 1.5207, 65.11: 1.5205, 65.12: 1.5203, 65.13: 1.52, 65.14: 1.5198, 65.15: 1.5196, 65.16: 1.5193, 65.17: 1.5191, 65.18: 1.5189, 65.19: 1.5186, 65.2: 1.5184, 65.21: 1.5182, 65.22: 1.5179, 65.23: 1.5177, 65.24: 1.5175, 65.25: 1.5172, 65.26: 1.517, 65.27: 1.5168, 65.28: 1.5165, 65.29: 1.5163, 65.3: 1.5161, 65.31: 1.5158, 65.32: 1.5156, 65.33: 1.5154, 65.34: 1.5152, 65.35: 1.5149, 65.36: 1.5147, 65.37: 1.5145, 65.38: 1.5142, 65.39: 1.514, 65.4: 1.5138, 65.41: 1.5135, 65.42: 1.5133, 65.43: 1.5131, 65.44: 1.5128, 65.45: 1.5126, 65.46: 1.5124, 65.47: 1.5121, 65.48: 1.5119, 65.49: 1.5117, 65.5: 1.5115, 65.51: 1.5112, 65.52: 1.511, 65.53: 1.5108, 65.54: 1.5105, 65.55: 1.5103, 65.56: 1.5101, 65.57: 1.5098, 65.58: 1.5096, 65.59: 1.5094, 65.6: 1.5091, 65.61: 1.5089, 65.62: 1.5087, 65.63: 1.5085, 65.64: 1.5082, 65.65: 1.508, 65.66: 1.5078, 65.67: 1.5075, 65.68: 1.5073, 65.69: 1.5071, 65.7: 1.5068, 65.71: 1.5066, 65.72: 1.5064, 65.73: 1.5062, 65.74: 1.5059, 65.75: 1.5057, 65.76: 1.5055, 65.77: 1.5052, 65.78: 1.505, 65.79: 1.5048, 65.8: 1.5046, 65.81: 1.5043, 65.82: 1.5041, 65.83: 1.5039, 65.84: 1.5036, 65.85: 1.5034, 65.86: 1.5032, 65.87: 1.503, 65.88: 1.5027, 65.89: 1.5025, 65.9: 1.5023, 65.91: 1.502, 65.92: 1.5018, 65.93: 1.5016, 65.94: 1.5014, 65.95: 1.5011, 65.96: 1.5009, 65.97: 1.5007, 65.98: 1.5005, 65.99: 1.5002, 66.00: 1.5, 66.01: 1.4998, 66.02: 1.4995, 66.03: 1.4993, 66.04: 1.4991, 66.05: 1.4989, 66.06: 1.4986, 66.07: 1.4984, 66.08: 1.4982, 66.09: 1.498, 66.1: 1.4977, 66.11: 1.4975, 66.12: 1.4973, 66.13: 1.4971, 66.14: 1.4968, 66.15: 1.4966, 66.16: 1.4964, 66.17: 1.4961, 66.18: 1.4959, 66.19: 1.4957, 66.2: 1.4955, 66.21: 1.4952, 66.22: 1.495, 66.23: 1.4948, 66.24: 1.4946, 66.25: 1.4943, 66.26: 1.4941, 66.27: 1.4939, 66.28: 1.4937, 66.29: 1.4934, 66.3: 1.4932, 66.31: 1.493, 66.32: 1.4928, 66.33: 1.4925, 66.34: 1.4923, 66.35: 1.4921, 66.36: 1.4919, 66.37: 1.4916, 66.38: 1.4914, 66.39: 1.4912, 66.4: 1.491, 66.41: 1.4907, 66.42: 1.4905, 66.43: 1.4903, 66.44: 1.4901, 66.45: 1.4898, 66.46: 1.4896, 66.47: 1.4894, 66.48: 1.4892, 66.49: 1.4889, 66.5: 1.4887, 66.51: 1.4885, 66.52: 1.4883, 66.53: 1.4881, 66.54: 1.4878, 66.55: 1.4876, 66.56: 1.4874, 66.57: 1.4872, 66.58: 1.4869, 66.59: 1.4867, 66.6: 1.4865, 66.61: 1.4863, 66.62: 1.486, 66.63: 1.4858, 66.64: 1.4856, 66.65: 1.4854, 66.66: 1.4851, 66.67: 1.4849, 66.68: 1.4847, 66.69: 1.4845, 66.7: 1.4843, 66.71: 1.484, 66.72: 1.4838, 66.73: 1.4836, 66.74: 1.4834, 66.75: 1.4831, 66.76: 1.4829, 66.77: 1.4827, 66.78: 1.4825, 66.79: 1.4823, 66.8: 1.482, 66.81: 1.4818, 66.82: 1.4816, 66.83: 1.4814, 66.84: 1.4811, 66.85: 1.4809, 66.86: 1.4807, 66.87: 1.4805, 66.88: 1.4803, 66.89: 1.48, 66.9: 1.4798, 66.91: 1.4796, 66.92: 1.4794, 66.93: 1.4792, 66.94: 1.4789, 66.95: 1.4787, 66.96: 1.4785, 66.97: 1.4783, 66.98: 1.4781, 66.99: 1.4778, 67.00: 1.4776, 67.01: 1.4774, 67.02: 1.4772, 67.03: 1.477, 67.04: 1.4767, 67.05: 1.4765, 67.06: 1.4763, 67.07: 1.4761, 67.08: 1.4758, 67.09: 1.4756, 67.1: 1.4754, 67.11: 1.4752, 67.12: 1.475, 67.13: 1.4748, 67.14: 1.4745, 67.15: 1.4743, 67.16: 1.4741, 67.17: 1.4739, 67.18: 1.4737, 67.19: 1.4734, 67.2: 1.4732, 67.21: 1.473, 67.22: 1.4728, 67.23: 1.4726, 67.24: 1.4723, 67.25: 1.4721, 67.26: 1.4719, 67.27: 1.4717, 67.28: 1.4715, 67.29: 1.4712, 67.3: 1.471, 67.31: 1.4708, 67.32: 1.4706, 67.33: 1.4704, 67.34: 1.4702, 67.35: 1.4699, 67.36: 1.4697, 67.37: 1.4695, 67.38: 1.4693, 67.39: 1.4691, 67.4: 1.4688, 67.41: 1.4686, 67.42: 1.4684, 67.43: 1.4682, 67.44: 1.468, 67.45: 1.4678, 67.46: 1.4675, 67.47: 1.4673, 67.48: 1.4671, 67.49: 1.4669, 67.5: 1.4667, 67.51: 1.4664, 67.52: 1.4662, 67.53: 1.466, 67.54: 1.4658, 67.55: 1.4656, 67.56: 1.4654, 67.57: 1.4651, 67.58: 1.4649, 67.59: 1.4647, 67.6: 1.4645, 67.61: 1.4643, 67.62: 1.4641, 67.63: 1.4638, 67.64: 1.4636, 67.65: 1.4634, 67.66: 1.4632, 67.67: 1.463, 67.68: 1.4628, 67.69: 1.4625, 67.7: 1.4623, 67.71: 1.4621, 67.72: 1.4619, 67.73: 1.4617, 67.74: 1.4615, 67.75: 1.4613, 67.76: 1.461, 67.77: 1.4608, 67.78: 1.4606, 67.79: 1.4604, 67.8: 1.4602, 67.81: 1.46, 67.82: 1.4597, 67.83: 1.4595, 67.84: 1.4593, 67.85: 1.4591, 67.86: 1.4589, 67.87: 1.4587, 67.88: 1.4585, 67.89: 1.4582, 67.9: 1.458, 67.91: 1.4578, 67.92: 1.4576, 67.93: 1.4574, 67.94: 1.4572, 67.95: 1.457, 67.96: 1.4567, 67.97: 1.4565, 67.98: 1.4563, 67.99: 1.4561, 68.00: 1.4559, 68.01: 1.4557, 68.02: 1.4555, 68.03: 1.4552, 68.04: 1.455, 68.05: 1.4548, 68.06: 1.4546, 68.07: 1.4544, 68.08: 1.4542, 68.09: 1.454, 68.1: 1.4537, 68.11: 1.4535, 68.12: 1.4533, 68.13: 1.4531, 68.14: 1.4529, 68.15: 1.4527, 68.16: 1.4525, 68.17: 1.4523, 68.18: 1.452, 68.19: 1.4518, 68.2: 1.4516, 68.21: 1.4514, 68.22: 1.4512, 68.23: 1.451, 68.24: 1.4508, 68.25: 1.4505, 68.26: 1.4503, 68.27: 1.4501, 68.28: 1.4499, 68.29: 1.4497, 68.3: 1.4495, 68.31: 1.4493, 68.32: 1.4491, 68.33: 1.4489, 68.34: 1.4486, 68.35: 1.4484, 68.36: 1.4482, 68.37: 1.448, 68.38: 1.4478, 68.39: 1.4476, 68.4: 1.4474, 68.41: 1.4472, 68.42: 1.4469, 68.43: 1.4467, 68.44: 1.4465, 68.45: 1.4463, 68.46: 1.4461, 68.47: 1.4459, 68.48: 1.4457, 68.49: 1.4455, 68.5: 1.4453, 68.51: 1.445, 68.52: 1.4448, 68.53: 1.4446, 68.54: 1.4444, 68.55: 1.4442, 68.56: 1.444, 68.57: 1.4438, 68.58: 1.4436, 68.59: 1.4434, 68.6: 1.4431, 68.61: 1.4429, 68.62: 1.4427, 68.63: 1.4425, 68.64: 1.4423, 68.65: 1.4421, 68.66: 1.4419, 68.67: 1.4417, 68.68: 1.4415, 68.69: 1.4413, 68.7: 1.441, 68.71: 1.4408, 68.72: 1.4406, 68.73: 1.4404, 68.74: 1.4402, 68.75: 1.44, 68.76: 1.4398, 68.77: 1.4396, 68.78: 1.4394, 68.79: 1.4392, 68.8: 1.439, 68.81: 1.4387, 68.82: 1.4385, 68.83: 1.4383, 68.84: 1.4381, 68.85: 1.4379, 68.86: 1.4377, 68.87: 1.4375, 68.88: 1.4373, 68.89: 1.4371, 68.9: 1.4369, 68.91: 1.4367, 68.92: 1.4364, 68.93: 1.4362, 68.94: 1.436, 68.95: 1.4358, 68.96: 1.4356, 68.97: 1.4354, 68.98: 1.4352, 68.99: 1.435, 69.00: 1.4348, 69.01: 1.4346, 69.02: 1.4344, 69.03: 1.4342, 69.04: 1.434, 69.05: 1.4337, 69.06: 1.4335, 69.07: 1.4333, 69.08: 1.4331, 69.09: 1.4329, 69.1: 1.4327, 69.11: 1.4325, 69.12: 1.4323, 69.13: 1.4321, 69.14: 1.4319, 69.15: 1.4317, 69.16: 1.4315, 69.17: 1.4313, 69.18: 1.431, 69.19: 1.4308, 69.2: 1.4306, 69.21: 1.4304, 69.22: 1.4302, 69.23: 1.43, 69.24: 1.4298, 69.25: 1.4296, 69.26: 1.4294, 69.27: 1.4292, 69.28: 1.429, 69.29: 1.4288, 69.3: 1.4286, 69.31: 1.4284, 69.32: 1.4282, 69.33: 1.428, 69.34: 1.4277, 69.35: 1.4275, 69.36: 1.4273, 69.37: 1.4271, 69.38: 1.4269, 69.39: 1.4267, 69.4: 1.4265, 69.41: 1.4263, 69.42: 1.4261, 69.43: 1.4259, 69.44: 1.4257, 69.45: 1.4255, 69.46: 1.4253, 69.47: 1.4251, 69.48: 1.4249, 69.49: 1.4247, 69.5: 1.4245, 69.51: 1.4243, 69.52: 1.4241, 69.53: 1.4238, 69.54: 1.4236, 69.55: 1.4234, 69.56: 1.4232, 69.57: 1.423, 69.58: 1.4228, 69.59: 1.4226, 69.6: 1.4224, 69.61: 1.4222, 69.62: 1.422, 69.63: 1.4218, 69.64: 1.4216, 69.65: 1.4214, 69.66: 1.4212, 69.67: 1.421, 69.68: 1.4208, 69.69: 1.4206, 69.7: 1.4204, 69.71: 1.4202, 69.72: 1.42, 69.73: 1.4198, 69.74: 1.4196, 69.75: 1.4194, 69.76: 1.4192, 69.77: 1.4189, 69.78: 1.4187, 69.79: 1.4185, 69.8: 1.4183, 69.81: 1.4181, 69.82: 1.4179, 69.83: 1.4177, 69.84: 1.4175, 69.85: 1.4173, 69.86: 1.4171, 69.87: 1.4169, 69.88: 1.4167, 69.89: 1.4165, 69.9: 1.4163, 69.91: 1.4161, 69.92: 1.4159, 69.93: 1.4157, 69.94: 1.4155, 69.95: 1.4153, 69.96: 1.4151, 69.97: 1.4149, 69.98: 1.4147, 69.99: 1.4145, 70.00: 1.4143, 70.01: 1.4141, 70.02: 1.4139, 70.03: 1.4137, 70.04: 1.4135, 70.05: 1.4133, 70.06: 1.4131, 70.07: 1.4129, 70.08: 1.4127, 70.09: 1.4125, 70.1: 1.4123, 70.11: 1.4121, 70.12: 1.4119, 70.13: 1.4117, 70.14: 1.4115, 70.15: 1.4113, 70.16: 1.4111, 70.17: 1.4109, 70.18: 1.4107, 70.19: 1.4105, 70.2: 1.4103, 70.21: 1.4101, 70.22: 1.4099, 70.23: 1.4097, 70.24: 1.4095, 70.25: 1.4093, 70.26: 1.4091, 70.27: 1.4089, 70.28: 1.4087, 70.29: 1.4085, 70.3: 1.4083, 70.31: 1.4081, 70.32: 1.4078, 70.33: 1.4076, 70.34: 1.4074, 70.35: 1.4072, 70.36: 1.407, 70.37: 1.4068, 70.38: 1.4066, 70.39: 1.4064, 70.4: 1.4062, 70.41: 1.4061, 70.42: 1.4059, 70.43: 1.4057, 70.44: 1.4055, 70.45: 1.4053, 70.46: 1.4051, 70.47: 1.4049, 70.48: 1.4047, 70.49: 1.4045, 70.5: 1.4043, 70.51: 1.4041, 70.52: 1.4039, 70.53: 1.4037, 70.54: 1.4035, 70.55: 1.4033, 70.56: 1.4031, 70.57: 1.4029, 70.58: 1.4027, 70.59: 1.4025, 70.6: 1.4023, 70.61: 1.4021, 70.62: 1.4019, 70.63: 1.4017, 70.64: 1.4015, 70.65: 1.4013, 70.66: 1.4011, 70.67: 1.4009, 70.68: 1.4007, 70.69: 1.4005, 70.7: 1.4003, 70.71: 1.4001, 70.72: 1.3999, 70.73: 1.3997, 70.74: 1.3995, 70.75: 1.3993, 70.76: 1.3991, 70.77: 1.3989, 70.78: 1.3987, 70.79: 1.3985, 70.8: 1.3983, 70.81: 1.3981, 70.82: 1.3979, 70.83: 1.3977, 70.84: 1.3975, 70.85: 1.3973, 70.86: 1.3971, 70.87: 1.3969, 70.88: 1.3967, 70.89: 1.3965, 70.9: 1.3963, 70.91: 1.3961, 70.92: 1.3959, 70.93: 1.3957, 70.94: 1.3955, 70.95: 1.3953, 70.96: 1.3952, 70.97: 1.395, 70.98: 1.3948, 70.99: 1.3946, 71.00: 1.3944, 71.01: 1.3942, 71.02: 1.394, 71.03: 1.3938, 71.04: 1.3936, 71.05: 1.3934, 71.06: 1.3932, 71.07: 1.393, 71.08: 1.3928, 71.09: 1.3926, 71.1: 1.3924, 71.11: 1.3922, 71.12: 1.392, 71.13: 1.3918, 71.14: 1.3916, 71.15: 1.3914, 71.16: 1.3912, 71.17: 1.391, 71.18: 1.3908, 71.19: 1.3906, 71.2: 1.3904, 71.21: 1.3903, 71.22: 1.3901, 71.23: 1.3899, 71.24: 1.3897, 71.25: 1.3895, 71.26: 1.3893, 71.27: 1.3891, 71.28: 1.3889, 71.29: 1.3887, 71.3: 1.3885, 71.31: 1.3883, 71.32: 1.3881, 71.33: 1.3879, 71.34: 1.3877, 71.35: 1.3875, 71.36: 1.3873, 71.37: 1.3871, 71.38: 1.3869, 71.39: 1.3867, 71.4: 1.3866, 71.41: 1.3864, 71.42: 1.3862, 71.43: 1.386, 71.44: 1.3858, 71.45: 1.3856, 71.46: 1.3854, 71.47: 1.3852, 71.48: 1.385, 71.49: 1.3848, 71.5: 1.3846, 71.51: 1.3844, 71.52: 1.3842, 71.53: 1.384, 71.54: 1.3838, 71.55: 1.3836, 71.56: 1.3835, 71.57: 1.3833, 71.58: 1.3831, 71.59: 1.3829, 71.6: 1.3827, 71.61: 1.3825, 71.62: 1.3823, 71.63: 1.3821, 71.64: 1.3819, 71.65: 1.3817, 71.66: 1.3815, 71.67: 1.3813, 71.68: 1.3811, 71.69: 1.3809, 71.7: 1.3808, 71.71: 1.3806, 71.72: 1.3804, 71.73: 1.3802, 71.74: 1.38, 71.75: 1.3798, 71.76: 1.3796, 71.77: 1.3794, 71.78: 1.3792, 71.79: 1.379, 71.8: 1.3788, 71.81: 1.3786, 71.82: 1.3784, 71.83: 1.3783, 71.84: 1.3781, 71.85: 1.3779, 71.86: 1.3777, 71.87: 1.3775, 71.88: 1.3773, 71.89: 1.3771, 71.9: 1.3769, 71.91: 1.3767, 71.92: 1.3765, 71.93: 1.3763, 71.94: 1.3761, 71.95: 1.376, 71.96: 1.3758, 71.97: 1.3756, 71.98: 1.3754, 71.99: 1.3752, 72.00: 1.375, 72.01: 1.3748, 72.02: 1.3746, 72.03: 1.3744, 72.04: 1.3742, 72.05: 1.374, 72.06: 1.3739, 72.07: 1.3737, 72.08: 1.3735, 72.09: 1.3733, 72.1: 1.3731, 72.11: 1.3729, 72.12: 1.3727, 72.13: 1.3725, 72.14: 1.3723, 72.15: 1.3721, 72.16: 1.372, 72.17: 1.3718, 72.18: 1.3716, 72.19: 1.3714, 72.2: 1.3712, 72.21: 1.371, 72.22: 1.3708, 72.23: 1.3706, 72.24: 1.3704, 72.25: 1.3702, 72.26: 1.3701, 72.27: 1.3699, 72.28: 1.3697, 72.29: 1.3695, 72.3: 1.3693, 72.31: 1.3691, 72.32: 1.3689, 72.33: 1.3687, 72.34: 1.3685, 72.35: 1.3683, 72.36: 1.3682, 72.37: 1.368, 72.38: 1.3678, 72.39: 1.3676, 72.4: 1.3674, 72.41: 1.3672, 72.42: 1.367, 72.43: 1.3668, 72.44: 1.3666, 72.45: 1.3665, 72.46: 1.3663, 72.47: 1.3661, 72.48: 1.3659, 72.49: 1.3657, 72.5: 1.3655, 72.51: 1.3653, 72.52: 1.3651, 72.53: 1.365, 72.54: 1.3648, 72.55: 1.3646, 72.56: 1.3644, 72.57: 1.3642, 72.58: 1.364, 72.59: 1.3638, 72.6: 1.3636, 72.61: 1.3634, 72.62: 1.3633, 72.63: 1.3631, 72.64: 1.3629, 72.65: 1.3627, 72.66: 1.3625, 72.67: 1.3623, 72.68: 1.3621, 72.69: 1.3619, 72.7: 1.3618, 72.71: 1.3616, 72.72: 1.3614, 72.73: 1.3612, 72.74: 1.361, 72.75: 1.3608, 72.76: 1.3606, 72.77: 1.3605, 72.78: 1.3603, 72.79: 1.3601, 72.8: 1.3599, 72.81: 1.3597, 72.82: 1.3595, 72.83: 1.3593, 72.84: 1.3591, 72.85: 1.359, 72.86: 1.3588, 72.87: 1.3586, 72.88: 1.3584, 72.89: 1.3582, 72.9: 1.358, 72.91: 1.3578, 72.92: 1.3577, 72.93: 1.3575, 72.94: 1.3573, 72.95: 1.3571, 72.96: 1.3569, 72.97: 1.3567, 72.98: 1.3565, 72.99: 1.3564, 73.00: 1.3562, 73.01: 1.356, 73.02: 1.3558, 73.03: 1.3556, 73.04: 1.3554, 73.05: 1.3552, 73.06: 1.3551, 73.07: 1.3549, 73.08: 1.3547, 73.09: 1.3545, 73.1: 1.3543, 73.11: 1.3541, 73.12: 1.3539, 73.13: 1.3538, 73.14: 1.3536, 73.15: 1.3534, 73.16: 1.3532, 73.17: 1.353, 73.18: 1.3528, 73.19: 1.3526, 73.2: 1.3525, 73.21: 1.3523, 73.22: 1.3521, 73.23: 1.3519, 73.24: 1.3517, 73.25: 1.3515, 73.26: 1.3514, 73.27: 1.3512, 73.28: 1.351, 73.29: 1.3508, 73.3: 1.3506, 73.31: 1.3504, 73.32: 1.3502, 73.33: 1.3501, 73.34: 1.3499, 73.35: 1.3497, 73.36: 1.3495, 73.37: 1.3493, 73.38: 1.3491, 73.39: 1.349, 73.4: 1.3488, 73.41: 1.3486, 73.42: 1.3484, 73.43: 1.3482, 73.44: 1.348, 73.45: 1.3479, 73.46: 1.3477, 73.47: 1.3475, 73.48: 1.3473, 73.49: 1.3471, 73.5: 1.3469, 73.51: 1.3468, 73.52: 1.3466, 73.53: 1.3464, 73.54: 1.3462, 73.55: 1.346, 73.56: 1.3458, 73.57: 1.3457, 73.58: 1.3455, 73.59: 1.3453, 73.6: 1.3451, 73.61: 1.3449, 73.62: 1.3447, 73.63: 1.3446, 73.64: 1.3444, 73.65: 1.3442, 73.66: 1.344, 73.67: 1.3438, 73.68: 1.3436, 73.69: 1.3435, 73.7: 1.3433, 73.71: 1.3431, 73.72: 1.3429, 73.73: 1.3427, 73.74: 1.3426, 73.75: 1.3424, 73.76: 1.3422, 73.77: 1.342, 73.78: 1.3418, 73.79: 1.3416, 73.8: 1.3415, 73.81: 1.3413, 73.82: 1.3411, 73.83: 1.3409, 73.84: 1.3407, 73.85: 1.3406, 73.86: 1.3404, 73.87: 1.3402, 73.88: 1.34, 73.89: 1.3398, 73.9: 1.3396, 73.91: 1.3395, 73.92: 1.3393, 73.93: 1.3391, 73.94: 1.3389, 73.95: 1.3387, 73.96: 1.3386, 73.97: 1.3384, 73.98: 1.3382, 73.99: 1.338, 74.00: 1.3378, 74.01: 1.3377, 74.02: 1.3375, 74.03: 1.3373, 74.04: 1.3371, 74.05: 1.3369, 74.06: 1.3368, 74.07: 1.3366, 74.08: 1.3364, 74.09: 1.3362, 74.1: 1.336, 74.11: 1.3359, 74.12: 1.3357, 74.13: 1.3355, 74.14: 1.3353, 74.15: 1.3351, 74.16: 1.335, 74.17: 1.3348, 74.18: 1.3346, 74.19: 1.3344, 74.2: 1.3342, 74.21: 1.3341, 74.22: 1.3339, 74.23: 1.3337, 74.24: 1.3335, 74.25: 1.3333, 74.26: 1.3332, 74.27: 1.333, 74.28: 1.3328, 74.29: 1.3326, 74.3: 1.3324, 74.31: 1.3323, 74.32: 1.3321, 74.33: 1.3319, 74.34: 1.3317, 74.35: 1.3315, 74.36: 1.3314, 74.37: 1.3312, 74.38: 1.331, 74.39: 1.3308, 74.4: 1.3306, 74.41: 1.3305, 74.42: 1.3303, 74.43: 1.3301, 74.44: 1.3299, 74.45: 1.3298, 74.46: 1.3296, 74.47: 1.3294, 74.48: 1.3292, 74.49: 1.329, 74.5: 1.3289, 74.51: 1.3287, 74.52: 1.3285, 74.53: 1.3283, 74.54: 1.3281, 74.55: 1.328, 74.56: 1.3278, 74.57: 1.3276, 74.58: 1.3274, 74.59: 1.3273, 74.6: 1.3271, 74.61: 1.3269, 74.62: 1.3267, 74.63: 1.3265, 74.64: 1.3264, 74.65: 1.3262, 74.66: 1.326, 74.67: 1.3258, 74.68: 1.3257, 74.69: 1.3255, 74.7: 1.3253, 74.71: 1.3251, 74.72: 1.3249, 74.73: 1.3248, 74.74: 1.3246, 74.75: 1.3244, 74.76: 1.3242, 74.77: 1.3241, 74.78: 1.3239, 74.79: 1.3237, 74.8: 1.3235, 74.81: 1.3234, 74.82: 1.3232, 74.83: 1.323, 74.84: 1.3228, 74.85: 1.3226, 74.86: 1.3225, 74.87: 1.3223, 74.88: 1.3221, 74.89: 1.3219, 74.9: 1.3218, 74.91: 1.3216, 74.92: 1.3214, 74.93: 1.3212, 74.94: 1.3211, 74.95: 1.3209, 74.96: 1.3207, 74.97: 1.3205, 74.98: 1.3204, 74.99: 1.3202, 75.00: 1.32, 75.01: 1.3198, 75.02: 1.3196, 75.03: 1.3195, 75.04: 1.3193, 75.05: 1.3191, 75.06: 1.3189, 75.07: 1.3188, 75.08: 1.3186, 75.09: 1.3184, 75.1: 1.3182, 75.11: 1.3181, 75.12: 1.3179, 75.13: 1.3177, 75.14: 1.3175, 75.15: 1.3174, 75.16: 1.3172, 75.17: 1.317, 75.18: 1.3168, 75.19: 1.3167, 75.2: 1.3165, 75.21: 1.3163, 75.22: 1.3161, 75.23: 1.316, 75.24: 1.3158, 75.25: 1.3156, 75.26: 1.3154, 75.27: 1.3153, 75.28: 1.3151, 75.29: 1.3149, 75.3: 1.3147, 75.31: 1.3146, 75.32: 1.3144, 75.33: 1.3142, 75.34: 1.314, 75.35: 1.3139, 75.36: 1.3137, 75.37: 1.3135, 75.38: 1.3133, 75.39: 1.3132, 75.4: 1.313, 75.41: 1.3128, 75.42: 1.3126, 75.43: 1.3125, 75.44: 1.3123, 75.45: 1.3121, 75.46: 1.312, 75.47: 1.3118, 75.48: 1.3116, 75.49: 1.3114, 75.5: 1.3113, 75.51: 1.3111, 75.52: 1.3109, 75.53: 1.3107, 75.54: 1.3106, 75.55: 1.3104, 75.56: 1.3102, 75.57: 1.31, 75.58: 1.3099, 75.59: 1.3097, 75.6: 1.3095, 75.61: 1.3094, 75.62: 1.3092, 75.63: 1.309, 75.64: 1.3088, 75.65: 1.3087, 75.66: 1.3085, 75.67: 1.3083, 75.68: 1.3081, 75.69: 1.308, 75.7: 1.3078, 75.71: 1.3076, 75.72: 1.3074, 75.73: 1.3073, 75.74: 1.3071, 75.75: 1.3069, 75.76: 1.3068, 75.77: 1.3066, 75.78: 1.3064, 75.79: 1.3062, 75.8: 1.3061, 75.81: 1.3059, 75.82: 1.3057, 75.83: 1.3056, 75.84: 1.3054, 75.85: 1.3052, 75.86: 1.305, 75.87: 1.3049, 75.88: 1.3047, 75.89: 1.3045, 75.9: 1.3043, 75.91: 1.3042, 75.92: 1.304, 75.93: 1.3038, 75.94: 1.3037, 75.95: 1.3035, 75.96: 1.3033, 75.97: 1.3031, 75.98: 1.303, 75.99: 1.3028, 76.00: 1.3026, 76.01: 1.3025, 76.02: 1.3023, 76.03: 1.3021, 76.04: 1.3019, 76.05: 1.3018, 76.06: 1.3016, 76.07: 1.3014, 76.08: 1.3013, 76.09: 1.3011, 76.1: 1.3009, 76.11: 1.3007, 76.12: 1.3006, 76.13: 1.3004, 76.14: 1.3002, 76.15: 1.3001, 76.16: 1.2999, 76.17: 1.2997, 76.18: 1.2996, 76.19: 1.2994, 76.2: 1.2992, 76.21: 1.299, 76.22: 1.2989, 76.23: 1.2987, 76.24: 1.2985, 76.25: 1.2984, 76.26: 1.2982, 76.27: 1.298, 76.28: 1.2979, 76.29: 1.2977, 76.3: 1.2975, 76.31: 1.2973, 76.32: 1.2972, 76.33: 1.297, 76.34: 1.2968, 76.35: 1.2967, 76.36: 1.2965, 76.37: 1.2963, 76.38: 1.2962, 76.39: 1.296, 76.4: 1.2958, 76.41: 1.2956, 76.42: 1.2955, 76.43: 1.2953, 76.44: 1.2951, 76.45: 1.295, 76.46: 1.2948, 76.47: 1.2946, 76.48: 1.2945, 76.49: 1.2943, 76.5: 1.2941, 76.51: 1.2939, 76.52: 1.2938, 76.53: 1.2936, 76.54: 1.2934, 76.55: 1.2933, 76.56: 1.2931, 76.57: 1.2929, 76.58: 1.2928, 76.59: 1.2926, 76.6: 1.2924, 76.61: 1.2923, 76.62: 1.2921, 76.63: 1.2919, 76.64: 1.2918, 76.65: 1.2916, 76.66: 1.2914, 76.67: 1.2912, 76.68: 1.2911, 76.69: 1.2909, 76.7: 1.2907, 76.71: 1.2906, 76.72: 1.2904, 76.73: 1.2902, 76.74: 1.2901, 76.75: 1.2899, 76.76: 1.2897, 76.77: 1.2896, 76.78: 1.2894, 76.79: 1.2892, 76.8: 1.2891, 76.81: 1.2889, 76.82: 1.2887, 76.83: 1.2886, 76.84: 1.2884, 76.85: 1.2882, 76.86: 1.2881, 76.87: 1.2879, 76.88: 1.2877, 76.89: 1.2876, 76.9: 1.2874, 76.91: 1.2872, 76.92: 1.2871, 76.93: 1.2869, 76.94: 1.2867, 76.95: 1.2865, 76.96: 1.2864, 76.97: 1.2862, 76.98: 1.286, 76.99: 1.2859, 77.00: 1.2857, 77.01: 1.2855, 77.02: 1.2854, 77.03: 1.2852, 77.04: 1.285, 77.05: 1.2849, 77.06: 1.2847, 77.07: 1.2845, 77.08: 1.2844, 77.09: 1.2842, 77.1: 1.284, 77.11: 1.2839, 77.12: 1.2837, 77.13: 1.2835, 77.14: 1.2834, 77.15: 1.2832, 77.16: 1.283, 77.17: 1.2829, 77.18: 1.2827, 77.19: 1.2825, 77.2: 1.2824, 77.21: 1.2822, 77.22: 1.2821, 77.23: 1.2819, 77.24: 1.2817, 77.25: 1.2816, 77.26: 1.2814, 77.27: 1.2812, 77.28: 1.2811, 77.29: 1.2809, 77.3: 1.2807, 77.31: 1.2806, 77.32: 1.2804, 77.33: 1.2802, 77.34: 1.2801, 77.35: 1.2799, 77.36: 1.2797, 77.37: 1.2796, 77.38: 1.2794, 77.39: 1.2792, 77.4: 1.2791, 77.41: 1.2789, 77.42: 1.2787, 77.43: 1.2786, 77.44: 1.2784, 77.45: 1.2782, 77.46: 1.2781, 77.47: 1.2779, 77.48: 1.2777, 77.49: 1.2776, 77.5: 1.2774, 77.51: 1.2773, 77.52: 1.2771, 77.53: 1.2769, 77.54: 1.2768, 77.55: 1.2766, 77.56: 1.2764, 77.57: 1.2763, 77.58: 1.2761, 77.59: 1.2759, 77.6: 1.2758, 77.61: 1.2756, 77.62: 1.2754, 77.63: 1.2753, 77.64: 1.2751, 77.65: 1.275, 77.66: 1.2748, 77.67: 1.2746, 77.68: 1.2745, 77.69: 1.2743, 77.7: 1.2741, 77.71: 1.274, 77.72: 1.2738, 77.73: 1.2736, 77.74: 1.2735, 77.75: 1.2733, 77.76: 1.2731, 77.77: 1.273, 77.78: 1.2728, 77.79: 1.2727, 77.8: 1.2725, 77.81: 1.2723, 77.82: 1.2722, 77.83: 1.272, 77.84: 1.2718, 77.85: 1.2717, 77.86: 1.2715, 77.87: 1.2713, 77.88: 1.2712, 77.89: 1.271, 77.9: 1.2709, 77.91: 1.2707, 77.92: 1.2705, 77.93: 1.2704, 77.94: 1.2702, 77.95: 1.27, 77.96: 1.2699, 77.97: 1.2697, 77.98: 1.2696, 77.99: 1.2694, 78.00: 1.2692, 78.01: 1.2691, 78.02: 1.2689, 78.03: 1.2687, 78.04: 1.2686, 78.05: 1.2684, 78.06: 1.2683, 78.07: 1.2681, 78.08: 1.2679, 78.09: 1.2678, 78.1: 1.2676, 78.11: 1.2674, 78.12: 1.2673, 78.13: 1.2671, 78.14: 1.267, 78.15: 1.2668, 78.16: 1.2666, 78.17: 1.2665, 78.18: 1.2663, 78.19: 1.2661, 78.2: 1.266, 78.21: 1.2658, 78.22: 1.2657, 78.23: 1.2655, 78.24: 1.2653, 78.25: 1.2652, 78.26: 1.265, 78.27: 1.2649, 78.28: 1.2647, 78.29: 1.2645, 78.3: 1.2644, 78.31: 1.2642, 78.32: 1.264, 78.33: 1.2639, 78.34: 1.2637, 78.35: 1.2636, 78.36: 1.2634, 78.37: 1.2632, 78.38: 1.2631, 78.39: 1.2629, 78.4: 1.2628, 78.41: 1.2626, 78.42: 1.2624, 78.43: 1.2623, 78.44: 1.2621, 78.45: 1.262, 78.46: 1.2618, 78.47: 1.2616, 78.48: 1.2615, 78.49: 1.2613, 78.5: 1.2611, 78.51: 1.261, 78.52: 1.2608, 78.53: 1.2607, 78.54: 1.2605, 78.55: 1.2603, 78.56: 1.2602, 78.57: 1.26, 78.58: 1.2599, 78.59: 1.2597, 78.6: 1.2595, 78.61: 1.2594, 78.62: 1.2592, 78.63: 1.2591, 78.64: 1.2589, 78.65: 1.2587, 78.66: 1.2586, 78.67: 1.2584, 78.68: 1.2583, 78.69: 1.2581, 78.7: 1.2579, 78.71: 1.2578, 78.72: 1.2576, 78.73: 1.2575, 78.74: 1.2573, 78.75: 1.2571, 78.76: 1.257, 78.77: 1.2568, 78.78: 1.2567, 78.79: 1.2565, 78.8: 1.2563, 78.81: 1.2562, 78.82: 1.256, 78.83: 1.2559, 78.84: 1.2557, 78.85: 1.2555, 78.86: 1.2554, 78.87: 1.2552, 78.88: 1.2551, 78.89: 1.2549, 78.9: 1.2548, 78.91: 1.2546, 78.92: 1.2544, 78.93: 1.2543, 78.94: 1.2541, 78.95: 1.254, 78.96: 1.2538, 78.97: 1.2536, 78.98: 1.2535, 78.99: 1.2533, 79.00: 1.2532, 79.01: 1.253, 79.02: 1.2528, 79.03: 1.2527, 79.04: 1.2525, 79.05: 1.2524, 79.06: 1.2522, 79.07: 1.2521, 79.08: 1.2519, 79.09: 1.2517, 79.1: 1.2516, 79.11: 1.2514, 79.12: 1.2513, 79.13: 1.2511, 79.14: 1.2509, 79.15: 1.2508, 79.16: 1.2506, 79.17: 1.2505, 79.18: 1.2503, 79.19: 1.2502, 79.2: 1.25, 79.21: 1.2498, 79.22: 1.2497, 79.23: 1.2495, 79.24: 1.2494, 79.25: 1.2492, 79.26: 1.2491, 79.27: 1.2489, 79.28: 1.2487, 79.29: 1.2486, 79.3: 1.2484, 79.31: 1.2483, 79.32: 1.2481, 79.33: 1.248, 79.34: 1.2478, 79.35: 1.2476, 79.36: 1.2475, 79.37: 1.2473, 79.38: 1.2472, 79.39: 1.247, 79.4: 1.2469, 79.41: 1.2467, 79.42: 1.2465, 79.43: 1.2464, 79.44: 1.2462, 79.45: 1.2461, 79.46: 1.2459, 79.47: 1.2458, 79.48: 1.2456, 79.49: 1.2454, 79.5: 1.2453, 79.51: 1.2451, 79.52: 1.245, 79.53: 1.2448, 79.54: 1.2447, 79.55: 1.2445, 79.56: 1.2443, 79.57: 1.2442, 79.58: 1.244, 79.59: 1.2439, 79.6: 1.2437, 79.61: 1.2436, 79.62: 1.2434, 79.63: 1.2433, 79.64: 1.2431, 79.65: 1.2429, 79.66: 1.2428, 79.67: 1.2426, 79.68: 1.2425, 79.69: 1.2423, 79.7: 1.2422, 79.71: 1.242, 79.72: 1.2418, 79.73: 1.2417, 79.74: 1.2415, 79.75: 1.2414, 79.76: 1.2412, 79.77: 1.2411, 79.78: 1.2409, 79.79: 1.2408, 79.8: 1.2406, 79.81: 1.2404, 79.82: 1.2403, 79.83: 1.2401, 79.84: 1.24, 79.85: 1.2398, 79.86: 1.2397, 79.87: 1.2395, 79.88: 1.2394, 79.89: 1.2392, 79.9: 1.239, 79.91: 1.2389, 79.92: 1.2387, 79.93: 1.2386, 79.94: 1.2384, 79.95: 1.2383, 79.96: 1.2381, 79.97: 1.238, 79.98: 1.2378, 79.99: 1.2377, 80.00: 1.2375, 80.01: 1.2373, 80.02: 1.2372, 80.03: 1.237, 80.04: 1.2369, 80.05: 1.2367, 80.06: 1.2366, 80.07: 1.2364, 80.08: 1.2363, 80.09: 1.2361, 80.1: 1.236, 80.11: 1.2358, 80.12: 1.2356, 80.13: 1.2355, 80.14: 1.2353, 80.15: 1.2352, 80.16: 1.235, 80.17: 1.2349, 80.18: 1.2347, 80.19: 1.2346, 80.2: 1.2344, 80.21: 1.2343, 80.22: 1.2341, 80.23: 1.234, 80.24: 1.2338, 80.25: 1.2336, 80.26: 1.2335, 80.27: 1.2333, 80.28: 1.2332, 80.29: 1.233, 80.3: 1.2329, 80.31: 1.2327, 80.32: 1.2326, 80.33: 1.2324, 80.34: 1.2323, 80.35: 1.2321, 80.36: 1.232, 80.37: 1.2318, 80.38: 1.2316, 80.39: 1.2315, 80.4: 1.2313, 80.41: 1.2312, 80.42: 1.231, 80.43: 1.2309, 80.44: 1.2307, 80.45: 1.2306, 80.46: 1.2304, 80.47: 1.2303, 80.48: 1.2301, 80.49: 1.23, 80.5: 1.2298, 80.51: 1.2297, 80.52: 1.2295, 80.53: 1.2294, 80.54: 1.2292, 80.55: 1.2291, 80.56: 1.2289, 80.57: 1.2287, 80.58: 1.2286, 80.59: 1.2284, 80.6: 1.2283, 80.61: 1.2281, 80.62: 1.228, 80.63: 1.2278, 80.64: 1.2277, 80.65: 1.2275, 80.66: 1.2274, 80.67: 1.2272, 80.68: 1.2271, 80.69: 1.2269, 80.7: 1.2268, 80.71: 1.2266, 80.72: 1.2265, 80.73: 1.2263, 80.74: 1.2262, 80.75: 1.226, 80.76: 1.2259, 80.77: 1.2257, 80.78: 1.2256, 80.79: 1.2254, 80.8: 1.2252, 80.81: 1.2251, 80.82: 1.2249, 80.83: 1.2248, 80.84: 1.2246, 80.85: 1.2245, 80.86: 1.2243, 80.87: 1.2242, 80.88: 1.224, 80.89: 1.2239, 80.9: 1.2237, 80.91: 1.2236, 80.92: 1.2234, 80.93: 1.2233, 80.94: 1.2231, 80.95: 1.223, 80.96: 1.2228, 80.97: 1.2227, 80.98: 1.2225, 80.99: 1.2224, 81.00: 1.2222, 81.01: 1.2221, 81.02: 1.2219, 81.03: 1.2218, 81.04: 1.2216, 81.05: 1.2215, 81.06: 1.2213, 81.07: 1.2212, 81.08: 1.221, 81.09: 1.2209, 81.1: 1.2207, 81.11: 1.2206, 81.12: 1.2204, 81.13: 1.2203, 81.14: 1.2201, 81.15: 1.22, 81.16: 1.2198, 81.17: 1.2197, 81.18: 1.2195, 81.19: 1.2194, 81.2: 1.2192, 81.21: 1.2191, 81.22: 1.2189, 81.23: 1.2188, 81.24: 1.2186, 81.25: 1.2185, 81.26: 1.2183, 81.27: 1.2182, 81.28: 1.218, 81.29: 1.2179, 81.3: 1.2177, 81.31: 1.2176, 81.32: 1.2174, 81.33: 1.2173, 81.34: 1.2171, 81.35: 1.217, 81.36: 1.2168, 81.37: 1.2167, 81.38: 1.2165, 81.39: 1.2164, 81.4: 1.2162, 81.41: 1.2161, 81.42: 1.2159, 81.43: 1.2158, 81.44: 1.2156, 81.45: 1.2155, 81.46: 1.2153, 81.47: 1.2152, 81.48: 1.215, 81.49: 1.2149, 81.5: 1.2147, 81.51: 1.2146, 81.52: 1.2144, 81.53: 1.2143, 81.54: 1.2141, 81.55: 1.214, 81.56: 1.2138, 81.57: 1.2137, 81.58: 1.2135, 81.59: 1.2134, 81.6: 1.2132, 81.61: 1.2131, 81.62: 1.2129, 81.63: 1.2128, 81.64: 1.2126, 81.65: 1.2125, 81.66: 1.2123, 81.67: 1.2122, 81.68: 1.212, 81.69: 1.2119, 81.7: 1.2118, 81.71: 1.2116, 81.72: 1.2115, 81.73: 1.2113, 81.74: 1.2112, 81.75: 1.211, 81.76: 1.2109, 81.77: 1.2107, 81.78: 1.2106, 81.79: 1.2104, 81.8: 1.2103, 81.81: 1.2101, 81.82: 1.21, 81.83: 1.2098, 81.84: 1.2097, 81.85: 1.2095, 81.86: 1.2094, 81.87: 1.2092, 81.88: 1.2091, 81.89: 1.2089, 81.9: 1.2088, 81.91: 1.2086, 81.92: 1.2085, 81.93: 1.2083, 81.94: 1.2082, 81.95: 1.2081, 81.96: 1.2079, 81.97: 1.2078, 81.98: 1.2076, 81.99: 1.2075, 82.00: 1.2073, 82.01: 1.2072, 82.02: 1.207, 82.03: 1.2069, 82.04: 1.2067, 82.05: 1.2066, 82.06: 1.2064, 82.07: 1.2063, 82.08: 1.2061, 82.09: 1.206, 82.1: 1.2058, 82.11: 1.2057, 82.12: 1.2056, 82.13: 1.2054, 82.14: 1.2053, 82.15: 1.2051, 82.16: 1.205, 82.17: 1.2048, 82.18: 1.2047, 82.19: 1.2045, 82.2: 1.2044, 82.21: 1.2042, 82.22: 1.2041, 82.23: 1.2039, 82.24: 1.2038, 82.25: 1.2036, 82.26: 1.2035, 82.27: 1.2034, 82.28: 1.2032, 82.29: 1.2031, 82.3: 1.2029, 82.31: 1.2028, 82.32: 1.2026, 82.33: 1.2025, 82.34: 1.2023, 82.35: 1.2022, 82.36: 1.202, 82.37: 1.2019, 82.38: 1.2017, 82.39: 1.2016, 82.4: 1.2015, 82.41: 1.2013, 82.42: 1.2012, 82.43: 1.201, 82.44: 1.2009, 82.45: 1.2007, 82.46: 1.2006, 82.47: 1.2004, 82.48: 1.2003, 82.49: 1.2001, 82.5: 1.2, 82.51: 1.1999, 82.52: 1.1997, 82.53: 1.1996, 82.54: 1.1994, 82.55: 1.1993, 82.56: 1.1991, 82.57: 1.199, 82.58: 1.1988, 82.59: 1.1987, 82.6: 1.1985, 82.61: 1.1984, 82.62: 1.1983, 82.63: 1.1981, 82.64: 1.198, 82.65: 1.1978, 82.66: 1.1977, 82.67: 1.1975, 82.68: 1.1974, 82.69: 1.1972, 82.7: 1.1971, 82.71: 1.197, 82.72: 1.1968, 82.73: 1.1967, 82.74: 1.1965, 82.75: 1.1964, 82.76: 1.1962, 82.77: 1.1961, 82.78: 1.1959, 82.79: 1.1958, 82.8: 1.1957, 82.81: 1.1955, 82.82: 1.1954, 82.83: 1.1952, 82.84: 1.1951, 82.85: 1.1949, 82.86: 1.1948, 82.87: 1.1946, 82.88: 1.1945, 82.89: 1.1944, 82.9: 1.1942, 82.91: 1.1941, 82.92: 1.1939, 82.93: 1.1938, 82.94: 1.1936, 82.95: 1.1935, 82.96: 1.1933, 82.97: 1.1932, 82.98: 1.1931, 82.99: 1.1929, 83.00: 1.1928, 83.01: 1.1926, 83.02: 1.1925, 83.03: 1.1923, 83.04: 1.1922, 83.05: 1.1921, 83.06: 1.1919, 83.07: 1.1918, 83.08: 1.1916, 83.09: 1.1915, 83.1: 1.1913, 83.11: 1.1912, 83.12: 1.191, 83.13: 1.1909, 83.14: 1.1908, 83.15: 1.1906, 83.16: 1.1905, 83.17: 1.1903, 83.18: 1.1902, 83.19: 1.19, 83.2: 1.1899, 83.21: 1.1898, 83.22: 1.1896, 83.23: 1.1895, 83.24: 1.1893, 83.25: 1.1892, 83.26: 1.189, 83.27: 1.1889, 83.28: 1.1888, 83.29: 1.1886, 83.3: 1.1885, 83.31: 1.1883, 83.32: 1.1882, 83.33: 1.188, 83.34: 1.1879, 83.35: 1.1878, 83.36: 1.1876, 83.37: 1.1875, 83.38: 1.1873, 83.39: 1.1872, 83.4: 1.1871, 83.41: 1.1869, 83.42: 1.1868, 83.43: 1.1866, 83.44: 1.1865, 83.45: 1.1863, 83.46: 1.1862, 83.47: 1.1861, 83.48: 1.1859, 83.49: 1.1858, 83.5: 1.1856, 83.51: 1.1855, 83.52: 1.1853, 83.53: 1.1852, 83.54: 1.1851, 83.55: 1.1849, 83.56: 1.1848, 83.57: 1.1846, 83.58: 1.1845, 83.59: 1.1844, 83.6: 1.1842, 83.61: 1.1841, 83.62: 1.1839, 83.63: 1.1838, 83.64: 1.1836, 83.65: 1.1835, 83.66: 1.1834, 83.67: 1.1832, 83.68: 1.1831, 83.69: 1.1829, 83.7: 1.1828, 83.71: 1.1827, 83.72: 1.1825, 83.73: 1.1824, 83.74: 1.1822, 83.75: 1.1821, 83.76: 1.1819, 83.77: 1.1818, 83.78: 1.1817, 83.79: 1.1815, 83.8: 1.1814, 83.81: 1.1812, 83.82: 1.1811, 83.83: 1.181, 83.84: 1.1808, 83.85: 1.1807, 83.86: 1.1805, 83.87: 1.1804, 83.88: 1.1803, 83.89: 1.1801, 83.9: 1.18, 83.91: 1.1798, 83.92: 1.1797, 83.93: 1.1796, 83.94: 1.1794, 83.95: 1.1793, 83.96: 1.1791, 83.97: 1.179, 83.98: 1.1789, 83.99: 1.1787, 84.00: 1.1786, 84.01: 1.1784, 84.02: 1.1783, 84.03: 1.1782, 84.04: 1.178, 84.05: 1.1779, 84.06: 1.1777, 84.07: 1.1776, 84.08: 1.1775, 84.09: 1.1773, 84.1: 1.1772, 84.11: 1.177, 84.12: 1.1769, 84.13: 1.1768, 84.14: 1.1766, 84.15: 1.1765, 84.16: 1.1763, 84.17: 1.1762, 84.18: 1.1761, 84.19: 1.1759, 84.2: 1.1758, 84.21: 1.1756, 84.22: 1.1755, 84.23: 1.1754, 84.24: 1.1752, 84.25: 1.1751, 84.26: 1.1749, 84.27: 1.1748, 84.28: 1.1747, 84.29: 1.1745, 84.3: 1.1744, 84.31: 1.1742, 84.32: 1.1741, 84.33: 1.174, 84.34: 1.1738, 84.35: 1.1737, 84.36: 1.1735, 84.37: 1.1734, 84.38: 1.1733, 84.39: 1.1731, 84.4: 1.173, 84.41: 1.1728, 84.42: 1.1727, 84.43: 1.1726, 84.44: 1.1724, 84.45: 1.1723, 84.46: 1.1722, 84.47: 1.172, 84.48: 1.1719, 84.49: 1.1717, 84.5: 1.1716, 84.51: 1.1715, 84.52: 1.1713, 84.53: 1.1712, 84.54: 1.171, 84.55: 1.1709, 84.56: 1.1708, 84.57: 1.1706, 84.58: 1.1705, 84.59: 1.1704, 84.6: 1.1702, 84.61: 1.1701, 84.62: 1.1699, 84.63: 1.1698, 84.64: 1.1697, 84.65: 1.1695, 84.66: 1.1694, 84.67: 1.1692, 84.68: 1.1691, 84.69: 1.169, 84.7: 1.1688, 84.71: 1.1687, 84.72: 1.1686, 84.73: 1.1684, 84.74: 1.1683, 84.75: 1.1681, 84.76: 1.168, 84.77: 1.1679, 84.78: 1.1677, 84.79: 1.1676, 84.8: 1.1675, 84.81: 1.1673, 84.82: 1.1672, 84.83: 1.167, 84.84: 1.1669, 84.85: 1.1668, 84.86: 1.1666, 84.87: 1.1665, 84.88: 1.1664, 84.89: 1.1662, 84.9: 1.1661, 84.91: 1.1659, 84.92: 1.1658, 84.93: 1.1657, 84.94: 1.1655, 84.95: 1.1654, 84.96: 1.1653, 84.97: 1.1651, 84.98: 1.165, 84.99: 1.1648, 85.00: 1.1647, 85.01: 1.1646, 85.02: 1.1644, 85.03: 1.1643, 85.04: 1.1642, 85.05: 1.164, 85.06: 1.1639, 85.07: 1.1637, 85.08: 1.1636, 85.09: 1.1635, 85.1: 1.1633, 85.11: 1.1632, 85.12: 1.1631, 85.13: 1.1629, 85.14: 1.1628, 85.15: 1.1627, 85.16: 1.1625, 85.17: 1.1624, 85.18: 1.1622, 85.19: 1.1621, 85.2: 1.162, 85.21: 1.1618, 85.22: 1.1617, 85.23: 1.1616, 85.24: 1.1614, 85.25: 1.1613, 85.26: 1.1612, 85.27: 1.161, 85.28: 1.1609, 85.29: 1.1607, 85.3: 1.1606, 85.31: 1.1605, 85.32: 1.1603, 85.33: 1.1602, 85.34: 1.1601, 85.35: 1.1599, 85.36: 1.1598, 85.37: 1.1597, 85.38: 1.1595, 85.39: 1.1594, 85.4: 1.1593, 85.41: 1.1591, 85.42: 1.159, 85.43: 1.1588, 85.44: 1.1587, 85.45: 1.1586, 85.46: 1.1584, 85.47: 1.1583, 85.48: 1.1582, 85.49: 1.158, 85.5: 1.1579, 85.51: 1.1578, 85.52: 1.1576, 85.53: 1.1575, 85.54: 1.1574, 85.55: 1.1572, 85.56: 1.1571, 85.57: 1.1569, 85.58: 1.1568, 85.59: 1.1567, 85.6: 1.1565, 85.61: 1.1564, 85.62: 1.1563, 85.63: 1.1561, 85.64: 1.156, 85.65: 1.1559, 85.66: 1.1557, 85.67: 1.1556, 85.68: 1.1555, 85.69: 1.1553, 85.7: 1.1552, 85.71: 1.1551, 85.72: 1.1549, 85.73: 1.1548, 85.74: 1.1547, 85.75: 1.1545, 85.76: 1.1544, 85.77: 1.1542, 85.78: 1.1541, 85.79: 1.154, 85.8: 1.1538, 85.81: 1.1537, 85.82: 1.1536, 85.83: 1.1534, 85.84: 1.1533, 85.85: 1.1532, 85.86: 1.153, 85.87: 1.1529, 85.88: 1.1528, 85.89: 1.1526, 85.9: 1.1525, 85.91: 1.1524, 85.92: 1.1522, 85.93: 1.1521, 85.94: 1.152, 85.95: 1.1518, 85.96: 1.1517, 85.97: 1.1516, 85.98: 1.1514, 85.99: 1.1513, 86.00: 1.1512, 86.01: 1.151, 86.02: 1.1509, 86.03: 1.1508, 86.04: 1.1506, 86.05: 1.1505, 86.06: 1.1504, 86.07: 1.1502, 86.08: 1.1501, 86.09: 1.15, 86.1: 1.1498, 86.11: 1.1497, 86.12: 1.1496, 86.13: 1.1494, 86.14: 1.1493, 86.15: 1.1492, 86.16: 1.149, 86.17: 1.1489, 86.18: 1.1488, 86.19: 1.1486, 86.2: 1.1485, 86.21: 1.1484, 86.22: 1.1482, 86.23: 1.1481, 86.24: 1.148, 86.25: 1.1478, 86.26: 1.1477, 86.27: 1.1476, 86.28: 1.1474, 86.29: 1.1473, 86.3: 1.1472, 86.31: 1.147, 86.32: 1.1469, 86.33: 1.1468, 86.34: 1.1466, 86.35: 1.1465, 86.36: 1.1464, 86.37: 1.1462, 86.38: 1.1461, 86.39: 1.146, 86.4: 1.1458, 86.41: 1.1457, 86.42: 1.1456, 86.43: 1.1454, 86.44: 1.1453, 86.45: 1.1452, 86.46: 1.145, 86.47: 1.1449, 86.48: 1.1448, 86.49: 1.1446, 86.5: 1.1445, 86.51: 1.1444, 86.52: 1.1442, 86.53: 1.1441, 86.54: 1.144, 86.55: 1.1438, 86.56: 1.1437, 86.57: 1.1436, 86.58: 1.1435, 86.59: 1.1433, 86.6: 1.1432, 86.61: 1.1431, 86.62: 1.1429, 86.63: 1.1428, 86.64: 1.1427, 86.65: 1.1425, 86.66: 1.1424, 86.67: 1.1423, 86.68: 1.1421, 86.69: 1.142, 86.7: 1.1419, 86.71: 1.1417, 86.72: 1.1416, 86.73: 1.1415, 86.74: 1.1413, 86.75: 1.1412, 86.76: 1.1411, 86.77: 1.1409, 86.78: 1.1408, 86.79: 1.1407, 86.8: 1.1406, 86.81: 1.1404, 86.82: 1.1403, 86.83: 1.1402, 86.84: 1.14, 86.85: 1.1399, 86.86: 1.1398, 86.87: 1.1396, 86.88: 1.1395, 86.89: 1.1394, 86.9: 1.1392, 86.91: 1.1391, 86.92: 1.139, 86.93: 1.1388, 86.94: 1.1387, 86.95: 1.1386, 86.96: 1.1385, 86.97: 1.1383, 86.98: 1.1382, 86.99: 1.1381, 87.00: 1.1379, 87.01: 1.1378, 87.02: 1.1377, 87.03: 1.1375, 87.04: 1.1374, 87.05: 1.1373, 87.06: 1.1371, 87.07: 1.137, 87.08: 1.1369, 87.09: 1.1368, 87.1: 1.1366, 87.11: 1.1365, 87.12: 1.1364, 87.13: 1.1362, 87.14: 1.1361, 87.15: 1.136, 87.16: 1.1358, 87.17: 1.1357, 87.18: 1.1356, 87.19: 1.1355, 87.2: 1.1353, 87.21: 1.1352, 87.22: 1.1351, 87.23: 1.1349, 87.24: 1.1348, 87.25: 1.1347, 87.26: 1.1345, 87.27: 1.1344, 87.28: 1.1343, 87.29: 1.1342, 87.3: 1.134, 87.31: 1.1339, 87.32: 1.1338, 87.33: 1.1336, 87.34: 1.1335, 87.35: 1.1334, 87.36: 1.1332, 87.37: 1.1331, 87.38: 1.133, 87.39: 1.1329, 87.4: 1.1327, 87.41: 1.1326, 87.42: 1.1325, 87.43: 1.1323, 87.44: 1.1322, 87.45: 1.1321, 87.46: 1.1319, 87.47: 1.1318, 87.48: 1.1317, 87.49: 1.1316, 87.5: 1.1314, 87.51: 1.1313, 87.52: 1.1312, 87.53: 1.131, 87.54: 1.1309, 87.55: 1.1308, 87.56: 1.1307, 87.57: 1.1305, 87.58: 1.1304, 87.59: 1.1303, 87.6: 1.1301, 87.61: 1.13, 87.62: 1.1299, 87.63: 1.1298, 87.64: 1.1296, 87.65: 1.1295, 87.66: 1.1294, 87.67: 1.1292, 87.68: 1.1291, 87.69: 1.129, 87.7: 1.1288, 87.71: 1.1287, 87.72: 1.1286, 87.73: 1.1285, 87.74: 1.1283, 87.75: 1.1282, 87.76: 1.1281, 87.77: 1.1279, 87.78: 1.1278, 87.79: 1.1277, 87.8: 1.1276, 87.81: 1.1274, 87.82: 1.1273, 87.83: 1.1272, 87.84: 1.127, 87.85: 1.1269, 87.86: 1.1268, 87.87: 1.1267, 87.88: 1.1265, 87.89: 1.1264, 87.9: 1.1263, 87.91: 1.1262, 87.92: 1.126, 87.93: 1.1259, 87.94: 1.1258, 87.95: 1.1256, 87.96: 1.1255, 87.97: 1.1254, 87.98: 1.1253, 87.99: 1.1251, 88.00: 1.125, 88.01: 1.1249, 88.02: 1.1247, 88.03: 1.1246, 88.04: 1.1245, 88.05: 1.1244, 88.06: 1.1242, 88.07: 1.1241, 88.08: 1.124, 88.09: 1.1239, 88.1: 1.1237, 88.11: 1.1236, 88.12: 1.1235, 88.13: 1.1233, 88.14: 1.1232, 88.15: 1.1231, 88.16: 1.123, 88.17: 1.1228, 88.18: 1.1227, 88.19: 1.1226, 88.2: 1.1224, 88.21: 1.1223, 88.22: 1.1222, 88.23: 1.1221, 88.24: 1.1219, 88.25: 1.1218, 88.26: 1.1217, 88.27: 1.1216, 88.28: 1.1214, 88.29: 1.1213, 88.3: 1.1212, 88.31: 1.1211, 88.32: 1.1209, 88.33: 1.1208, 88.34: 1.1207, 88.35: 1.1205, 88.36: 1.1204, 88.37: 1.1203, 88.38: 1.1202, 88.39: 1.12, 88.4: 1.1199, 88.41: 1.1198, 88.42: 1.1197, 88.43: 1.1195, 88.44: 1.1194, 88.45: 1.1193, 88.46: 1.1191, 88.47: 1.119, 88.48: 1.1189, 88.49: 1.1188, 88.5: 1.1186, 88.51: 1.1185, 88.52: 1.1184, 88.53: 1.1183, 88.54: 1.1181, 88.55: 1.118, 88.56: 1.1179, 88.57: 1.1178, 88.58: 1.1176, 88.59: 1.1175, 88.6: 1.1174, 88.61: 1.1173, 88.62: 1.1171, 88.63: 1.117, 88.64: 1.1169, 88.65: 1.1168, 88.66: 1.1166, 88.67: 1.1165, 88.68: 1.1164, 88.69: 1.1162, 88.7: 1.1161, 88.71: 1.116, 88.72: 1.1159, 88.73: 1.1157, 88.74: 1.1156, 88.75: 1.1155, 88.76: 1.1154, 88.77: 1.1152, 88.78: 1.1151, 88.79: 1.115, 88.8: 1.1149, 88.81: 1.1147, 88.82: 1.1146, 88.83: 1.1145, 88.84: 1.1144, 88.85: 1.1142, 88.86: 1.1141, 88.87: 1.114, 88.88: 1.1139, 88.89: 1.1137, 88.9: 1.1136, 88.91: 1.1135, 88.92: 1.1134, 88.93: 1.1132, 88.94: 1.1131, 88.95: 1.113, 88.96: 1.1129, 88.97: 1.1127, 88.98: 1.1126, 88.99: 1.1125, 89.00: 1.1124, 89.01: 1.1122, 89.02: 1.1121, 89.03: 1.112, 89.04: 1.1119, 89.05: 1.1117, 89.06: 1.1116, 89.07: 1.1115, 89.08: 1.1114, 89.09: 1.1112, 89.1: 1.1111, 89.11: 1.111, 89.12: 1.1109, 89.13: 1.1107, 89.14: 1.1106, 89.15: 1.1105, 89.16: 1.1104, 89.17: 1.1102, 89.18: 1.1101, 89.19: 1.11, 89.2: 1.1099, 89.21: 1.1097, 89.22: 1.1096, 89.23: 1.1095, 89.24: 1.1094, 89.25: 1.1092, 89.26: 1.1091, 89.27: 1.109, 89.28: 1.1089, 89.29: 1.1087, 89.3: 1.1086, 89.31: 1.1085, 89.32: 1.1084, 89.33: 1.1083, 89.34: 1.1081, 89.35: 1.108, 89.36: 1.1079, 89.37: 1.1078, 89.38: 1.1076, 89.39: 1.1075, 89.4: 1.1074, 89.41: 1.1073, 89.42: 1.1071, 89.43: 1.107, 89.44: 1.1069, 89.45: 1.1068, 89.46: 1.1066, 89.47: 1.1065, 89.48: 1.1064, 89.49: 1.1063, 89.5: 1.1061, 89.51: 1.106, 89.52: 1.1059, 89.53: 1.1058, 89.54: 1.1057, 89.55: 1.1055, 89.56: 1.1054, 89.57: 1.1053, 89.58: 1.1052, 89.59: 1.105, 89.6: 1.1049, 89.61: 1.1048, 89.62: 1.1047, 89.63: 1.1045, 89.64: 1.1044, 89.65: 1.1043, 89.66: 1.1042, 89.67: 1.104, 89.68: 1.1039, 89.69: 1.1038, 89.7: 1.1037, 89.71: 1.1036, 89.72: 1.1034, 89.73: 1.1033, 89.74: 1.1032, 89.75: 1.1031, 89.76: 1.1029, 89.77: 1.1028, 89.78: 1.1027, 89.79: 1.1026, 89.8: 1.1024, 89.81: 1.1023, 89.82: 1.1022, 89.83: 1.1021, 89.84: 1.102, 89.85: 1.1018, 89.86: 1.1017, 89.87: 1.1016, 89.88: 1.1015, 89.89: 1.1013, 89.9: 1.1012, 89.91: 1.1011, 89.92: 1.101, 89.93: 1.1009, 89.94: 1.1007, 89.95: 1.1006, 89.96: 1.1005, 89.97: 1.1004, 89.98: 1.1002, 89.99: 1.1001, 90.00: 1.1, 90.01: 1.0999, 90.02: 1.0998, 90.03: 1.0996, 90.04: 1.0995, 90.05: 1.0994, 90.06: 1.0993, 90.07: 1.0991, 90.08: 1.099, 90.09: 1.0989, 90.1: 1.0988, 90.11: 1.0987, 90.12: 1.0985, 90.13: 1.0984, 90.14: 1.0983, 90.15: 1.0982, 90.16: 1.098, 90.17: 1.0979, 90.18: 1.0978, 90.19: 1.0977, 90.2: 1.0976, 90.21: 1.0974, 90.22: 1.0973, 90.23: 1.0972, 90.24: 1.0971, 90.25: 1.097, 90.26: 1.0968, 90.27: 1.0967, 90.28: 1.0966, 90.29: 1.0965, 90.3: 1.0963, 90.31: 1.0962, 90.32: 1.0961, 90.33: 1.096, 90.34: 1.0959, 90.35: 1.0957, 90.36: 1.0956, 90.37: 1.0955, 90.38: 1.0954, 90.39: 1.0953, 90.4: 1.0951, 90.41: 1.095, 90.42: 1.0949, 90.43: 1.0948, 90.44: 1.0946, 90.45: 1.0945, 90.46: 1.0944, 90.47: 1.0943, 90.48: 1.0942, 90.49: 1.094, 90.5: 1.0939, 90.51: 1.0938, 90.52: 1.0937, 90.53: 1.0936, 90.54: 1.0934, 90.55: 1.0933, 90.56: 1.0932, 90.57: 1.0931, 90.58: 1.093, 90.59: 1.0928, 90.6: 1.0927, 90.61: 1.0926, 90.62: 1.0925, 90.63: 1.0924, 90.64: 1.0922, 90.65: 1.0921, 90.66: 1.092, 90.67: 1.0919, 90.68: 1.0918, 90.69: 1.0916, 90.7: 1.0915, 90.71: 1.0914, 90.72: 1.0913, 90.73: 1.0911, 90.74: 1.091, 90.75: 1.0909, 90.76: 1.0908, 90.77: 1.0907, 90.78: 1.0905, 90.79: 1.0904, 90.8: 1.0903, 90.81: 1.0902, 90.82: 1.0901, 90.83: 1.0899, 90.84: 1.0898, 90.85: 1.0897, 90.86: 1.0896, 90.87: 1.0895, 90.88: 1.0893, 90.89: 1.0892, 90.9: 1.0891, 90.91: 1.089, 90.92: 1.0889, 90.93: 1.0887, 90.94: 1.0886, 90.95: 1.0885, 90.96: 1.0884, 90.97: 1.0883, 90.98: 1.0882, 90.99: 1.088, 91.00: 1.0879, 91.01: 1.0878, 91.02: 1.0877, 91.03: 1.0876, 91.04: 1.0874, 91.05: 1.0873, 91.06: 1.0872, 91.07: 1.0871, 91.08: 1.087, 91.09: 1.0868, 91.1: 1.0867, 91.11: 1.0866, 91.12: 1.0865, 91.13: 1.0864, 91.14: 1.0862, 91.15: 1.0861, 91.16: 1.086, 91.17: 1.0859, 91.18: 1.0858, 91.19: 1.0856, 91.2: 1.0855, 91.21: 1.0854, 91.22: 1.0853, 91.23: 1.0852, 91.24: 1.0851, 91.25: 1.0849, 91.26: 1.0848, 91.27: 1.0847, 91.28: 1.0846, 91.29: 1.0845, 91.3: 1.0843, 91.31: 1.0842, 91.32: 1.0841, 91.33: 1.084, 91.34: 1.0839, 91.35: 1.0837, 91.36: 1.0836, 91.37: 1.0835, 91.38: 1.0834, 91.39: 1.0833, 91.4: 1.0832, 91.41: 1.083, 91.42: 1.0829, 91.43: 1.0828, 91.44: 1.0827, 91.45: 1.0826, 91.46: 1.0824, 91.47: 1.0823, 91.48: 1.0822, 91.49: 1.0821, 91.5: 1.082, 91.51: 1.0818, 91.52: 1.0817, 91.53: 1.0816, 91.54: 1.0815, 91.55: 1.0814, 91.56: 1.0813, 91.57: 1.0811, 91.58: 1.081, 91.59: 1.0809, 91.6: 1.0808, 91.61: 1.0807, 91.62: 1.0806, 91.63: 1.0804, 91.64: 1.0803, 91.65: 1.0802, 91.66: 1.0801, 91.67: 1.08, 91.68: 1.0798, 91.69: 1.0797, 91.7: 1.0796, 91.71: 1.0795, 91.72: 1.0794, 91.73: 1.0793, 91.74: 1.0791, 91.75: 1.079, 91.76: 1.0789, 91.77: 1.0788, 91.78: 1.0787, 91.79: 1.0785, 91.8: 1.0784, 91.81: 1.0783, 91.82: 1.0782, 91.83: 1.0781, 91.84: 1.078, 91.85: 1.0778, 91.86: 1.0777, 91.87: 1.0776, 91.88: 1.0775, 91.89: 1.0774, 91.9: 1.0773, 91.91: 1.0771, 91.92: 1.077, 91.93: 1.0769, 91.94: 1.0768, 91.95: 1.0767, 91.96: 1.0766, 91.97: 1.0764, 91.98: 1.0763, 91.99: 1.0762, 92.00: 1.0761, 92.01: 1.076, 92.02: 1.0759, 92.03: 1.0757, 92.04: 1.0756, 92.05: 1.0755, 92.06: 1.0754, 92.07: 1.0753, 92.08: 1.0752, 92.09: 1.075, 92.1: 1.0749, 92.11: 1.0748, 92.12: 1.0747, 92.13: 1.0746, 92.14: 1.0745, 92.15: 1.0743, 92.16: 1.0742, 92.17: 1.0741, 92.18: 1.074, 92.19: 1.0739, 92.2: 1.0738, 92.21: 1.0736, 92.22: 1.0735, 92.23: 1.0734, 92.24: 1.0733, 92.25: 1.0732, 92.26: 1.0731, 92.27: 1.0729, 92.28: 1.0728, 92.29: 1.0727, 92.3: 1.0726, 92.31: 1.0725, 92.32: 1.0724, 92.33: 1.0722, 92.34: 1.0721, 92.35: 1.072, 92.36: 1.0719, 92.37: 1.0718, 92.38: 1.0717, 92.39: 1.0715, 92.4: 1.0714, 92.41: 1.0713, 92.42: 1.0712, 92.43: 1.0711, 92.44: 1.071, 92.45: 1.0708, 92.46: 1.0707, 92.47: 1.0706, 92.48: 1.0705, 92.49: 1.0704, 92.5: 1.0703, 92.51: 1.0702, 92.52: 1.07, 92.53: 1.0699, 92.54: 1.0698, 92.55: 1.0697, 92.56: 1.0696, 92.57: 1.0695, 92.58: 1.0693, 92.59: 1.0692, 92.6: 1.0691, 92.61: 1.069, 92.62: 1.0689, 92.63: 1.0688, 92.64: 1.0687, 92.65: 1.0685, 92.66: 1.0684, 92.67: 1.0683, 92.68: 1.0682, 92.69: 1.0681, 92.7: 1.068, 92.71: 1.0678, 92.72: 1.0677, 92.73: 1.0676, 92.74: 1.0675, 92.75: 1.0674, 92.76: 1.0673, 92.77: 1.0672, 92.78: 1.067, 92.79: 1.0669, 92.8: 1.0668, 92.81: 1.0667, 92.82: 1.0666, 92.83: 1.0665, 92.84: 1.0664, 92.85: 1.0662, 92.86: 1.0661, 92.87: 1.066, 92.88: 1.0659, 92.89: 1.0658, 92.9: 1.0657, 92.91: 1.0655, 92.92: 1.0654, 92.93: 1.0653, 92.94: 1.0652, 92.95: 1.0651, 92.96: 1.065, 92.97: 1.0649, 92.98: 1.0647, 92.99: 1.0646, 93.00: 1.0645, 93.01: 1.0644, 93.02: 1.0643, 93.03: 1.0642, 93.04: 1.0641, 93.05: 1.0639, 93.06: 1.0638, 93.07: 1.0637, 93.08: 1.0636, 93.09: 1.0635, 93.1: 1.0634, 93.11: 1.0633, 93.12: 1.0631, 93.13: 1.063, 93.14: 1.0629, 93.15: 1.0628, 93.16: 1.0627, 93.17: 1.0626, 93.18: 1.0625, 93.19: 1.0623, 93.2: 1.0622, 93.21: 1.0621, 93.22: 1.062, 93.23: 1.0619, 93.24: 1.0618, 93.25: 1.0617, 93.26: 1.0615, 93.27: 1.0614, 93.28: 1.0613, 93.29: 1.0612, 93.3: 1.0611, 93.31: 1.061, 93.32: 1.0609, 93.33: 1.0608, 93.34: 1.0606, 93.35: 1.0605, 93.36: 1.0604, 93.37: 1.0603, 93.38: 1.0602, 93.39: 1.0601, 93.4: 1.06, 93.41: 1.0598, 93.42: 1.0597, 93.43: 1.0596, 93.44: 1.0595, 93.45: 1.0594, 93.46: 1.0593, 93.47: 1.0592, 93.48: 1.0591, 93.49: 1.0589, 93.5: 1.0588, 93.51: 1.0587, 93.52: 1.0586, 93.53: 1.0585, 93.54: 1.0584, 93.55: 1.0583, 93.56: 1.0581, 93.57: 1.058, 93.58: 1.0579, 93.59: 1.0578, 93.6: 1.0577, 93.61: 1.0576, 93.62: 1.0575, 93.63: 1.0574, 93.64: 1.0572, 93.65: 1.0571, 93.66: 1.057, 93.67: 1.0569, 93.68: 1.0568, 93.69: 1.0567, 93.7: 1.0566, 93.71: 1.0565, 93.72: 1.0563, 93.73: 1.0562, 93.74: 1.0561, 93.75: 1.056, 93.76: 1.0559, 93.77: 1.0558, 93.78: 1.0557, 93.79: 1.0555, 93.8: 1.0554, 93.81: 1.0553, 93.82: 1.0552, 93.83: 1.0551, 93.84: 1.055, 93.85: 1.0549, 93.86: 1.0548, 93.87: 1.0547, 93.88: 1.0545, 93.89: 1.0544, 93.9: 1.0543, 93.91: 1.0542, 93.92: 1.0541, 93.93: 1.054, 93.94: 1.0539, 93.95: 1.0538, 93.96: 1.0536, 93.97: 1.0535, 93.98: 1.0534, 93.99: 1.0533, 94.00: 1.0532, 94.01: 1.0531, 94.02: 1.053, 94.03: 1.0529, 94.04: 1.0527, 94.05: 1.0526, 94.06: 1.0525, 94.07: 1.0524, 94.08: 1.0523, 94.09: 1.0522, 94.1: 1.0521, 94.11: 1.052, 94.12: 1.0518, 94.13: 1.0517, 94.14: 1.0516, 94.15: 1.0515, 94.16: 1.0514, 94.17: 1.0513, 94.18: 1.0512, 94.19: 1.0511, 94.2: 1.051, 94.21: 1.0508, 94.22: 1.0507, 94.23: 1.0506, 94.24: 1.0505, 94.25: 1.0504, 94.26: 1.0503, 94.27: 1.0502, 94.28: 1.0501, 94.29: 1.05, 94.3: 1.0498, 94.31: 1.0497, 94.32: 1.0496, 94.33: 1.0495, 94.34: 1.0494, 94.35: 1.0493, 94.36: 1.0492, 94.37: 1.0491, 94.38: 1.049, 94.39: 1.0488, 94.4: 1.0487, 94.41: 1.0486, 94.42: 1.0485, 94.43: 1.0484, 94.44: 1.0483, 94.45: 1.0482, 94.46: 1.0481, 94.47: 1.048, 94.48: 1.0478, 94.49: 1.0477, 94.5: 1.0476, 94.51: 1.0475, 94.52: 1.0474, 94.53: 1.0473, 94.54: 1.0472, 94.55: 1.0471, 94.56: 1.047, 94.57: 1.0468, 94.58: 1.0467, 94.59: 1.0466, 94.6: 1.0465, 94.61: 1.0464, 94.62: 1.0463, 94.63: 1.0462, 94.64: 1.0461, 94.65: 1.046, 94.66: 1.0458, 94.67: 1.0457, 94.68: 1.0456, 94.69: 1.0455, 94.7: 1.0454, 94.71: 1.0453, 94.72: 1.0452, 94.73: 1.0451, 94.74: 1.045, 94.75: 1.0449, 94.76: 1.0447, 94.77: 1.0446, 94.78: 1.0445, 94.79: 1.0444, 94.8: 1.0443, 94.81: 1.0442, 94.82: 1.0441, 94.83: 1.044, 94.84: 1.0439, 94.85: 1.0438, 94.86: 1.0436, 94.87: 1.0435, 94.88: 1.0434, 94.89: 1.0433, 94.9: 1.0432, 94.91: 1.0431, 94.92: 1.043, 94.93: 1.0429, 94.94: 1.0428, 94.95: 1.0427, 94.96: 1.0425, 94.97: 1.0424, 94.98: 1.0423, 94.99: 1.0422, 95.00: 1.0421, 95.01: 1.042, 95.02: 1.0419, 95.03: 1.0418, 95.04: 1.0417, 95.05: 1.0416, 95.06: 1.0414, 95.07: 1.0413, 95.08: 1.0412, 95.09: 1.0411, 95.1: 1.041, 95.11: 1.0409, 95.12: 1.0408, 95.13: 1.0407, 95.14: 1.0406, 95.15: 1.0405, 95.16: 1.0404, 95.17: 1.0402, 95.18: 1.0401, 95.19: 1.04, 95.2: 1.0399, 95.21: 1.0398, 95.22: 1.0397, 95.23: 1.0396, 95.24: 1.0395, 95.25: 1.0394, 95.26: 1.0393, 95.27: 1.0392, 95.28: 1.039, 95.29: 1.0389, 95.3: 1.0388, 95.31: 1.0387, 95.32: 1.0386, 95.33: 1.0385, 95.34: 1.0384, 95.35: 1.0383, 95.36: 1.0382, 95.37: 1.0381, 95.38: 1.038, 95.39: 1.0378, 95.4: 1.0377, 95.41: 1.0376, 95.42: 1.0375, 95.43: 1.0374, 95.44: 1.0373, 95.45: 1.0372, 95.46: 1.0371, 95.47: 1.037, 95.48: 1.0369, 95.49: 1.0368, 95.5: 1.0366, 95.51: 1.0365, 95.52: 1.0364, 95.53: 1.0363, 95.54: 1.0362, 95.55: 1.0361, 95.56: 1.036, 95.57: 1.0359, 95.58: 1.0358, 95.59: 1.0357, 95.6: 1.0356, 95.61: 1.0355, 95.62: 1.0353, 95.63: 1.0352, 95.64: 1.0351, 95.65: 1.035, 95.66: 1.0349, 95.67: 1.0348, 95.68: 1.0347, 95.69: 1.0346, 95.7: 1.0345, 95.71: 1.0344, 95.72: 1.0343, 95.73: 1.0342, 95.74: 1.0341, 95.75: 1.0339, 95.76: 1.0338, 95.77: 1.0337, 95.78: 1.0336, 95.79: 1.0335, 95.8: 1.0334, 95.81: 1.0333, 95.82: 1.0332, 95.83: 1.0331, 95.84: 1.033, 95.85: 1.0329, 95.86: 1.0328, 95.87: 1.0326, 95.88: 1.0325, 95.89: 1.0324, 95.9: 1.0323, 95.91: 1.0322, 95.92: 1.0321, 95.93: 1.032, 95.94: 1.0319, 95.95: 1.0318, 95.96: 1.0317, 95.97: 1.0316, 95.98: 1.0315, 95.99: 1.0314, 96.00: 1.0312, 96.01: 1.0311, 96.02: 1.031, 96.03: 1.0309, 96.04: 1.0308, 96.05: 1.0307, 96.06: 1.0306, 96.07: 1.0305, 96.08: 1.0304, 96.09: 1.0303, 96.1: 1.0302, 96.11: 1.0301, 96.12: 1.03, 96.13: 1.0299, 96.14: 1.0297, 96.15: 1.0296, 96.16: 1.0295, 96.17: 1.0294, 96.18: 1.0293, 96.19: 1.0292, 96.2: 1.0291, 96.21: 1.029, 96.22: 1.0289, 96.23: 1.0288, 96.24: 1.0287, 96.25: 1.0286, 96.26: 1.0285, 96.27: 1.0284, 96.28: 1.0283, 96.29: 1.0281, 96.3: 1.028, 96.31: 1.0279, 96.32: 1.0278, 96.33: 1.0277, 96.34: 1.0276, 96.35: 1.0275, 96.36: 1.0274, 96.37: 1.0273, 96.38: 1.0272, 96.39: 1.0271, 96.4: 1.027, 96.41: 1.0269, 96.42: 1.0268, 96.43: 1.0267, 96.44: 1.0265, 96.45: 1.0264, 96.46: 1.0263, 96.47: 1.0262, 96.48: 1.0261, 96.49: 1.026, 96.5: 1.0259, 96.51: 1.0258, 96.52: 1.0257, 96.53: 1.0256, 96.54: 1.0255, 96.55: 1.0254, 96.56: 1.0253, 96.57: 1.0252, 96.58: 1.0251, 96.59: 1.025, 96.6: 1.0248, 96.61: 1.0247, 96.62: 1.0246, 96.63: 1.0245, 96.64: 1.0244, 96.65: 1.0243, 96.66: 1.0242, 96.67: 1.0241, 96.68: 1.024, 96.69: 1.0239, 96.7: 1.0238, 96.71: 1.0237, 96.72: 1.0236, 96.73: 1.0235, 96.74: 1.0234, 96.75: 1.0233, 96.76: 1.0232, 96.77: 1.023, 96.78: 1.0229, 96.79: 1.0228, 96.8: 1.0227, 96.81: 1.0226, 96.82: 1.0225, 96.83: 1.0224, 96.84: 1.0223, 96.85: 1.0222, 96.86: 1.0221, 96.87: 1.022, 96.88: 1.0219, 96.89: 1.0218, 96.9: 1.0217, 96.91: 1.0216, 96.92: 1.0215, 96.93: 1.0214, 96.94: 1.0213, 96.95: 1.0211, 96.96: 1.021, 96.97: 1.0209, 96.98: 1.0208, 96.99: 1.0207, 97.00: 1.0206, 97.01: 1.0205, 97.02: 1.0204, 97.03: 1.0203, 97.04: 1.0202, 97.05: 1.0201, 97.06: 1.02, 97.07: 1.0199, 97.08: 1.0198, 97.09: 1.0197, 97.1: 1.0196, 97.11: 1.0195, 97.12: 1.0194, 97.13: 1.0193, 97.14: 1.0191, 97.15: 1.019, 97.16: 1.0189, 97.17: 1.0188, 97.18: 1.0187, 97.19: 1.0186, 97.2: 1.0185, 97.21: 1.0184, 97.22: 1.0183, 97.23: 1.0182, 97.24: 1.0181, 97.25: 1.018, 97.26: 1.0179, 97.27: 1.0178, 97.28: 1.0177, 97.29: 1.0176, 97.3: 1.0175, 97.31: 1.0174, 97.32: 1.0173, 97.33: 1.0172, 97.34: 1.0171, 97.35: 1.0169, 97.36: 1.0168, 97.37: 1.0167, 97.38: 1.0166, 97.39: 1.0165, 97.4: 1.0164, 97.41: 1.0163, 97.42: 1.0162, 97.43: 1.0161, 97.44: 1.016, 97.45: 1.0159, 97.46: 1.0158, 97.47: 1.0157, 97.48: 1.0156, 97.49: 1.0155, 97.5: 1.0154, 97.51: 1.0153, 97.52: 1.0152, 97.53: 1.0151, 97.54: 1.015, 97.55: 1.0149, 97.56: 1.0148, 97.57: 1.0147, 97.58: 1.0146, 97.59: 1.0144, 97.6: 1.0143, 97.61: 1.0142, 97.62: 1.0141, 97.63: 1.014, 97.64: 1.0139, 97.65: 1.0138, 97.66: 1.0137, 97.67: 1.0136, 97.68: 1.0135, 97.69: 1.0134, 97.7: 1.0133, 97.71: 1.0132, 97.72: 1.0131, 97.73: 1.013, 97.74: 1.0129, 97.75: 1.0128, 97.76: 1.0127, 97.77: 1.0126, 97.78: 1.0125, 97.79: 1.0124, 97.8: 1.0123, 97.81: 1.0122, 97.82: 1.0121, 97.83: 1.012, 97.84: 1.0119, 97.85: 1.0118, 97.86: 1.0116, 97.87: 1.0115, 97.88: 1.0114, 97.89: 1.0113, 97.9: 1.0112, 97.91: 1.0111, 97.92: 1.011, 97.93: 1.0109, 97.94: 1.0108, 97.95: 1.0107, 97.96: 1.0106, 97.97: 1.0105, 97.98: 1.0104, 97.99: 1.0103, 98.00: 1.0102}}
+import numpy as np
+
+# Win chances are counted in hundredths of a percent, so a threshold of 50.50 is index 5050
+WIN_CHANCE_STEPS:int = 10_000
+MINIMUM_WIN_CHANCE:int = 1
+MAXIMUM_WIN_CHANCE:int = 9_800
+RETURN_TO_PLAYER:int = 99
+
+def compile_dice_multipliers() -> np.ndarray:
+    """
+    Multiplier for every win chance from 0.00% to 100.00% in steps of 0.01%, NaN where no bet is offered.
+
+    The multiplier is 99 divided by the win chance, to 4 decimal places with ties to even. It is worked
+    out on integers, so the float stored for each entry is the one a 4 decimal literal parses to.
+    """
+    chances:np.ndarray = np.arange(WIN_CHANCE_STEPS+1,dtype=np.int64)
+    quotients,remainders = np.divmod(RETURN_TO_PLAYER*WIN_CHANCE_STEPS*100,np.maximum(chances,1))
+    quotients += (2*remainders > chances) | ((2*remainders == chances) & (quotients % 2 == 1))
+    offered:np.ndarray = (chances >= MINIMUM_WIN_CHANCE) & (chances <= MAXIMUM_WIN_CHANCE)
+    return np.where(offered,quotients/10_000,np.nan)
+
+WIN_CHANCE_MULTIPLIERS:np.ndarray = compile_dice_multipliers()
+
+# Indexed by threshold*100. Over wins above the threshold, so its win chance is 100 minus the threshold
+dice_multiplier_tables:dict[str,np.ndarray] = {
+    "Over": WIN_CHANCE_MULTIPLIERS[::-1],
+    "Under": WIN_CHANCE_MULTIPLIERS,
+}
+
+def dice_multiplier(over_under:str,threshold:float) -> float:
+    """
+    Looks up the winning multiplier of a bet. Resolve it once per run rather than once per win.
+
+    Args:
+        over_under: "Over" or "Under".
+        threshold: Threshold of the bet, rounded to 2 decimal places like the game does.
+
+    Returns:
+        float: Winning multiplier.
+
+    Raises:
+        KeyError: When there is no bet at that threshold.
+    """
+    index:int = round(float(f"{threshold:.2f}")*100)
+    table:np.ndarray = dice_multiplier_tables[over_under]
+    if((index < 0) or (index > WIN_CHANCE_STEPS) or np.isnan(table[index])):
+        raise KeyError(f"No Dice {over_under} bet at threshold {threshold:.2f}")
+    return float(table[index])
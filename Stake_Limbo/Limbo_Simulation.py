@@ -1,142 +1,44 @@
 import os
 import sys
-import hmac
 import json
 import random
 import string
-import shutil
-import hashlib
+import argparse
 import traceback
 import matplotlib.pyplot as plt
-import xml.etree.ElementTree as ET
 from typing import Any
 from io import BytesIO
 from math import floor
-from pandas import DataFrame
+from pandas import DataFrame,RangeIndex
+from collections import Counter
 from fpdf import FPDF,XPos,YPos
-from numpy import mean,median,quantile
-from datetime import datetime, timedelta
+from numpy import arange,argmax,argmin,array,asarray,bincount,empty,float64,int64,searchsorted,sqrt,where
 from matplotlib.ticker import FuncFormatter
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Provably_Fair import Byte_Cursor,sha256_encrypt
+from Provably_Fair.Bet_Progression import running_total
+from Provably_Fair.Buffered_Log import get_buffered_log
+from Provably_Fair.Plot_Series import Plot_Series
+from Provably_Fair.Result_Writer import write_result_frames
+from Provably_Fair.Run_Fingerprint import Run_Fingerprint,loaded_source_paths
+from Provably_Fair.Shard_Runner import Shard_Summary,parse_workers,streak_statistics
+from Provably_Fair.Shared_Columns import RESULT_COLUMNS,Shared_Result_Columns,run_sharded_columns
+from Provably_Fair.Outcome_Stream import decode_block,parse_digest_options
+from Provably_Fair.Sweep import target_sweep
 
 LOG_FILE = "Limbo_Simulation_Log.xml"
-ARCHIVE_FOLDER = "archive"
-LOG_RETENTION_DAYS = 30  
 BASE_DIR:str = os.path.dirname(os.path.abspath(__file__))
-
-def save_variable_info(locals_dict:dict[str,Any]) -> None:
-    # Get the current global and local variables
-    globals_dict:dict[str,Any] = globals()
-    
-    # Combine them, prioritizing locals (to avoid duplicates)
-    all_vars:dict[str,Any] = {**globals_dict, **locals_dict}
-    
-    # Filter out modules, functions, and built-ins
-    variable_info:list[dict[str,str|int|float|list|set|dict|bytes]] = []
-    for name, value in all_vars.items():
-        # Skip special variables, modules, and callables
-        if name.startswith('__') and name.endswith('__'):
-            continue
-        if callable(value):
-            continue
-        if isinstance(value, type(sys)):  # Skip modules
-            continue
-            
-        # Get variable details
-        var_type:str = type(value).__name__
-        try:
-            var_hash:str = hashlib.sha256(str(value).encode('utf-8')).hexdigest()
-        except Exception:
-            var_hash:str = "Unhashable"
-        
-        var_size:int = sys.getsizeof(value)
-        
-        variable_info.append({
-            "Variable Name": name,
-            "Type": var_type,
-            "Hash": var_hash,
-            "Size (bytes)": var_size
-        })
-    
-    # Convert to a DataFrame for nice tabular output
-    df:DataFrame = DataFrame(variable_info)
-    df.to_json(os.path.join(BASE_DIR,"Boilerplate_Prediction_End_Variables.json"),orient='table',indent=4)
-
-def get_current_log_filename(basepath:str) -> str:
-    """Generates a log filename based on the current date."""
-    return f"{basepath}/{LOG_FILE}_{datetime.now().strftime('%Y%m%d')}.xml"
-
-def rotate_logs():
-    """Checks if the log file date has changed and archives it if needed."""
-    current_date = datetime.now().strftime("%Y%m%d")
-    
-    # Get the last modified date of the existing log file
-    if os.path.exists(LOG_FILE):
-        modified_time = datetime.fromtimestamp(os.path.getmtime(LOG_FILE)).strftime("%Y%m%d")
-
-        if modified_time != current_date:  # If the log is from a previous day, archive it
-            # Ensure archive folder exists
-            if not os.path.exists(ARCHIVE_FOLDER):
-                os.makedirs(ARCHIVE_FOLDER)
-
-            # Move the old log file to archive with a date-based name
-            archive_filename = f"{ARCHIVE_FOLDER}/{LOG_FILE}_{modified_time}.xml"
-            shutil.move(LOG_FILE, archive_filename)
-
-            # Perform cleanup of old logs
-            delete_old_logs()
-
-def delete_old_logs():
-    """Deletes logs that are older than LOG_RETENTION_DAYS."""
-    cutoff_date:datetime = datetime.now() - timedelta(days=LOG_RETENTION_DAYS)
-
-    if not os.path.exists(ARCHIVE_FOLDER):
-        return  # No logs to delete
-
-    for filename in os.listdir(ARCHIVE_FOLDER):
-        if filename.startswith(f"{LOG_FILE}") and filename.endswith(".xml"):
-            try:
-                # Extract date from filename
-                date_str:str = filename.replace(f"{LOG_FILE}", "").replace(".xml", "")
-                log_date:datetime = datetime.strptime(date_str, "%Y%m%d")
-
-                # Delete files older than retention period
-                if log_date < cutoff_date:
-                    file_path:str = os.path.join(ARCHIVE_FOLDER, filename)
-                    os.remove(file_path)
-
-            except ValueError:
-                # Ignore files that don't match the expected date format
-                pass
+BLOCK_SIZE:int = 1_000_000
+# Writing a block's JSON takes several times the block's own size, so streaming uses smaller blocks
+STREAM_BLOCK_SIZE:int = 100_000
+RESULT_FRAME_COLUMNS:list[str] = ["Server Seed","Server Seed (Hashed)","Client Seed","Nonce","Target","Result","Win","Bet Size","Money Won (Round)","Total Money Wagered","Total Gross Winnings"]
 
 def log_to_xml(message:str, status="INFO", basepath=os.path.dirname(os.path.realpath(__file__))):
     """
-    Logs a message to an XML file, ensuring daily log rotation and old log cleanup.
+    Queues a message for the day's XML log. A background thread appends queued messages to the file
+    and handles daily rotation and old log cleanup, so logging never rereads the log.
     """
-    rotate_logs()  # Check if the date has changed and archive if necessary
-
-    # Get the correct filename for today's log
-    current_log_file = get_current_log_filename(basepath=basepath)
-
-    # Create file if it does not exist
-    if not os.path.exists(current_log_file):
-        root = ET.Element("logs")
-        tree = ET.ElementTree(root)
-        tree.write(current_log_file)
-
-    # Load existing XML file
-    tree = ET.parse(current_log_file)
-    root = tree.getroot()
-
-    # Create log entry
-    log_entry = ET.SubElement(root, "log")
-    log_entry.set("timestamp", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    log_entry.set("status", status)
-
-    message_element = ET.SubElement(log_entry, "message")
-    message_element.text = message
-
-    # Write changes back to the file
-    tree.write(current_log_file)
+    get_buffered_log(basepath,LOG_FILE).log(message,status)
 
 def generate_server_seed():
     possible_characters:str = string.hexdigits
@@ -148,44 +50,25 @@ def generate_client_seed():
     seed:str = "".join([random.choice(possible_characters) for _ in range(20)])
     return seed
 
-def sha256_encrypt(input_string: str) -> str:
-    # Create a sha256 hash object
-    sha256_hash = hashlib.sha256()
-    
-    # Update the hash object with the bytes of the input string
-    sha256_hash.update(input_string.encode('utf-8'))
-    
-    # Return the hexadecimal representation of the hash
-    return sha256_hash.hexdigest()
-
-def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(1)]
-    hmac_objs:list[hmac.HMAC] = [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256) for message in messages]
-    return [hmac_obj.hexdigest() for hmac_obj in hmac_objs]
-
-def hexadecimal_to_bytes(hexadecimal:str) -> list[int]:
-    return list(bytes.fromhex(hexadecimal))
-
-def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float =  (
-                        (float(bytes_list[0]) / float(256**1)) +
-                        (float(bytes_list[1]) / float(256**2)) +
-                        (float(bytes_list[2]) / float(256**3)) +
-                        (float(bytes_list[3]) / float(256**4))
-                    )
-    number = number*multiplier
-    return floor(number)
-
 def seeds_to_results(server_seed:str,client_seed:str,nonce:int) -> str:
-    hexs = seeds_to_hexadecimals(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
-    bytes_lists:list[list[int]] = [hexadecimal_to_bytes(current_hex) for current_hex in hexs]
-    row:list[list[int]] = []
-    for bytes_list in bytes_lists:
-        for index in range(0,len(bytes_list),4):
-            row.append(bytes_to_number(bytes_list[index:index+4],16777216))
-            if(len(row)==1):
-                return floor(((16777216)/(row[0]+1)*(1-0.01))*100)/100
+    cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+    return floor(((16777216)/(cursor.next_number(16777216)+1)*(1-0.01))*100)/100
+
+def simulate_nonce_range(columns:dict[str,Any],server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,target_multiplier:int|float,bet_size:int|float,cache:bool=False,lane:bool=False) -> Shard_Summary:
+    # Decodes a block of nonces at once and fills the rows with array operations instead of one game at a time
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    winning_payout:int|float = bet_size*target_multiplier
+    for low in range(minimum_nonce,maximum_nonce+1,BLOCK_SIZE):
+        high:int = min(low+BLOCK_SIZE-1,maximum_nonce)
+        rows:slice = slice(low-minimum_nonce,high-minimum_nonce+1)
+        outcomes = decode_block("Limbo",server_seed,client_seed,low,high,cache=cache,lane=lane)
+        wins = outcomes >= target_multiplier
+        columns["nonce"][rows] = arange(low,high+1)
+        columns["outcome"][rows] = outcomes
+        columns["bet"][rows] = bet_size
+        columns["payout"][rows] = where(wins,winning_payout,0)
+        summary = summary.merge(Shard_Summary.from_wins(low,wins))
+    return summary
 
 def thousands_formatter(x, pos):
     return f"{x:,.0f}"
@@ -238,9 +121,12 @@ def plot_occurrences(occurrence_dict: dict) -> BytesIO:
 
 def plot_accumulation(cumulative_games:list[int],cumulative_item_1:list[int],label_1:str,color_1:str,title:str,ylabel:str):
     plt.figure(figsize=(10, 6))
+    # Works on lists and on the shared NumPy columns alike; argmax/argmin pick the first extreme like list.index
+    maximum_index:int = int(argmax(asarray(cumulative_item_1)))
+    minimum_index:int = int(argmin(asarray(cumulative_item_1)))
     # Plot the max point as a red dot
-    plt.scatter(cumulative_games[cumulative_item_1.index(max(cumulative_item_1))], max(cumulative_item_1), color='black', s=50, label=f'Max: ({cumulative_games[cumulative_item_1.index(max(cumulative_item_1))]:,.0f}, ${max(cumulative_item_1):,.2f})',zorder=2)
-    plt.scatter(cumulative_games[cumulative_item_1.index(min(cumulative_item_1))], min(cumulative_item_1), color='blue', s=50, label=f'Min: ({cumulative_games[cumulative_item_1.index(min(cumulative_item_1))]:,.0f}, ${min(cumulative_item_1):,.2f})',zorder=3)
+    plt.scatter(cumulative_games[maximum_index], cumulative_item_1[maximum_index], color='black', s=50, label=f'Max: ({cumulative_games[maximum_index]:,.0f}, ${cumulative_item_1[maximum_index]:,.2f})',zorder=2)
+    plt.scatter(cumulative_games[minimum_index], cumulative_item_1[minimum_index], color='blue', s=50, label=f'Min: ({cumulative_games[minimum_index]:,.0f}, ${cumulative_item_1[minimum_index]:,.2f})',zorder=3)
     plt.plot(cumulative_games, cumulative_item_1, label=label_1, color=color_1, linewidth=1, zorder=1)
     plt.xlabel("Total Games Played")
     plt.ylabel(ylabel)
@@ -358,15 +244,26 @@ def load_configuration() -> dict[str,str|int]:
         return None
     return configuration
 
-def get_configuration_variables(configuration:dict[str,str|int]) -> tuple[str,str,str,list[int],str|int|float,str|float|int]:
+def get_configuration_variables(configuration:dict[str,str|int]) -> tuple[str,str,str,range,str|int|float,str|float|int]:
     server:str = configuration["ServerSeed"]
     server_hashed:str = sha256_encrypt(server)
     client:str = configuration["ClientSeed"]
-    nonces:list[int] = list(range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1))
+    # A range indexes like a list without holding every nonce, which --stream relies on for long audits
+    nonces:range = range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1)
     target_multiplier:str|int|float = configuration["TargetMultiplier"]
     bet_size:str|int|float = configuration["BetSize"]
     return server,server_hashed,client,nonces,target_multiplier,bet_size
 
+def parse_sweep_targets() -> list[float]|None:
+    parser:argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--sweep",nargs="*",type=float,default=None,help="Tabulate these targets, or every milestone multiplier when none are given, instead of playing TargetMultiplier")
+    return parser.parse_known_args()[0].sweep
+
+def parse_stream() -> bool:
+    parser:argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--stream",action="store_true",help="Write rows to disk a block at a time and keep memory bounded, for very long nonce ranges")
+    return parser.parse_known_args()[0].stream
+
 def _initialize_milestone_multipliers(target_multiplier:int) -> dict[int,int]:
     milestone_multiplier:dict[int,int] = {
             1_000_000:0,
@@ -394,6 +291,8 @@ def _initialize_milestone_multipliers(target_multiplier:int) -> dict[int,int]:
 
 def _get_analysis_data(local_variables:dict):
     try:
+        winning_streaks:dict[str,float] = streak_statistics(local_variables['winning_streak_sizes'])
+        losing_streaks:dict[str,float] = streak_statistics(local_variables['losing_streak_sizes'])
         analysis_data:dict[str,int|float|str] = {
             "summary":f"""Server Seed: {local_variables["server"]}
 Server Seed (Hashed): {local_variables['server_hashed']}
@@ -419,43 +318,42 @@ Return to Player (RTP): {(local_variables['money_won']/local_variables['total_mo
 
         "winning_losing_streaks":f"""Biggest Winning Streak: {local_variables['biggest_winning_streak'][1]:,.0f}
 Starting Nonce of Biggest Winning Streak: {local_variables['biggest_winning_streak'][0]:,.0f}
-Mean Winning Streak: {mean(local_variables['winning_streaks']):,.3f}
-Median Winning Streak: {median(local_variables['winning_streaks']):,.1f}
+Mean Winning Streak: {winning_streaks['Mean']:,.3f}
+Median Winning Streak: {winning_streaks['Median']:,.1f}
 Statistical Summary of Winning Streaks:
 \tMin\t\t|\t\t25%\t\t|\t\t50%\t\t|\t\t75%\t\t|\t\t95%\t\t|\t\t99%\t\t|\t\tMax
-\t{min(local_variables['winning_streaks']) if len(local_variables['winning_streaks'])>0 else 0:,.0f}\t\t|\t\t{quantile(local_variables['winning_streaks'],0.25) if len(local_variables['winning_streaks'])>0 else 0:,.0f}\t\t|\t\t{median(local_variables['winning_streaks']) if len(local_variables['winning_streaks'])>0 else 0:,.0f}\t\t|\t\t{quantile(local_variables['winning_streaks'],0.75) if len(local_variables['winning_streaks'])>0 else 0:,.0f}\t\t|\t\t{quantile(local_variables['winning_streaks'],0.95) if len(local_variables['winning_streaks'])>0 else 0:,.0f}\t\t|\t\t{quantile(local_variables['winning_streaks'],0.99) if len(local_variables['winning_streaks'])>0 else 0:,.0f}\t\t|\t\t{max(local_variables['winning_streaks']) if len(local_variables['winning_streaks'])>0 else 0:,.0f}
+\t{winning_streaks['Min']:,.0f}\t\t|\t\t{winning_streaks['25%']:,.0f}\t\t|\t\t{winning_streaks['50%']:,.0f}\t\t|\t\t{winning_streaks['75%']:,.0f}\t\t|\t\t{winning_streaks['95%']:,.0f}\t\t|\t\t{winning_streaks['99%']:,.0f}\t\t|\t\t{winning_streaks['Max']:,.0f}
 {'-'*120}
 Biggest Losing Streak: {local_variables['biggest_losing_streak'][1]:,.0f}
 Starting Nonce of Biggest Losing Streak: {local_variables['biggest_losing_streak'][0]:,.0f}
-Mean Losing Streak: {mean(local_variables['losing_streaks']):,.3f}
-Median Losing Streak: {median(local_variables['losing_streaks']):,.1f}
+Mean Losing Streak: {losing_streaks['Mean']:,.3f}
+Median Losing Streak: {losing_streaks['Median']:,.1f}
 Statistical Summary of Losing Streaks:
 \tMin\t\t|\t\t25%\t\t|\t\t50%\t\t|\t\t75%\t\t|\t\t95%\t\t|\t\t99%\t\t|\t\tMax
-\t{min(local_variables['losing_streaks']) if len(local_variables['losing_streaks'])>0 else 0:,.0f}\t\t|\t\t{quantile(local_variables['losing_streaks'],0.25) if len(local_variables['losing_streaks'])>0 else 0:,.0f}\t\t|\t\t{median(local_variables['losing_streaks']) if len(local_variables['losing_streaks'])>0 else 0:,.0f}\t\t|\t\t{quantile(local_variables['losing_streaks'],0.75) if len(local_variables['losing_streaks'])>0 else 0:,.0f}\t\t|\t\t{quantile(local_variables['losing_streaks'],0.95) if len(local_variables['losing_streaks'])>0 else 0:,.0f}\t\t|\t\t{quantile(local_variables['losing_streaks'],0.99) if len(local_variables['losing_streaks'])>0 else 0:,.0f}\t\t|\t\t{max(local_variables['losing_streaks']) if len(local_variables['losing_streaks'])>0 else 0:,.0f}""",
+\t{losing_streaks['Min']:,.0f}\t\t|\t\t{losing_streaks['25%']:,.0f}\t\t|\t\t{losing_streaks['50%']:,.0f}\t\t|\t\t{losing_streaks['75%']:,.0f}\t\t|\t\t{losing_streaks['95%']:,.0f}\t\t|\t\t{losing_streaks['99%']:,.0f}\t\t|\t\t{losing_streaks['Max']:,.0f}""",
         }
         return analysis_data
     except Exception as e:
         log_to_xml(message=f"Error getting analysis data. Official error: {traceback.format_exc()}",status="CRITICAL")
 
 class Limbo_Simulation_Tracker:
-    def __init__(self):
+    def __init__(self,workers:int=1,digest_options:dict[str,bool]|None=None):
         self.configuration:dict[str,str|int] = load_configuration()
         if self.configuration is None:
             return
         self.server,self.server_hashed,self.client,self.nonces,self.target_multiplier,self.bet_size = get_configuration_variables(configuration=self.configuration)
+        self.workers:int = workers
+        self.digest_options:dict[str,bool] = digest_options or {}
 
-        self.results:list[list[float|int]] = []
-        self.current_result:list[int] = []
+        self.result_columns:Shared_Result_Columns|None = None
         self.cumulative_profit:list[float] = []
 
         self.biggest_winning_streak:tuple[int,int] = (0,0)
         self.biggest_losing_streak:tuple[int,int] = (0,0)
 
-        self.current_winning_streak:int = 0
-        self.current_losing_streak:int = 0
-
-        self.winning_streaks:list[int] = []
-        self.losing_streaks:list[int] = []
+        # Streaks are kept as counts of each length, which is all the report needs
+        self.winning_streak_sizes:Counter = Counter()
+        self.losing_streak_sizes:Counter = Counter()
 
         self.total_number_of_wins:int = 0
         self.total_number_of_losses:int = 0
@@ -471,61 +369,164 @@ class Limbo_Simulation_Tracker:
 
     def run_simulation(self):
         try:
-            for nonce in self.nonces:
-                self.total_games_played += 1
-                self.cumulative_games.append(self.total_games_played)
-                self.total_money_bet += self.bet_size
-                self.current_result = [self.server,self.server_hashed,self.client,nonce]
-                seed_result = seeds_to_results(server_seed=self.server,client_seed=self.client,nonce=nonce)
-                for key,item in self.milestone_multiplier.items():
-                    if(seed_result>key):
-                        self.milestone_multiplier[key] += 1
-                        break
-                if(seed_result < self.target_multiplier):
-                    if(self.current_winning_streak > self.biggest_winning_streak[1]):
-                        self.biggest_winning_streak = (nonce-self.current_winning_streak,self.current_winning_streak)
-                    if(self.current_winning_streak>0):
-                        self.winning_streaks.append(self.current_winning_streak)
-                    self.current_winning_streak = 0
-                    self.current_losing_streak += 1
-                    self.total_number_of_losses +=1
-                    self.current_result.extend([self.target_multiplier,seed_result,"NO",self.bet_size,0,round(self.total_money_bet,2),round(self.money_won,2)])
-                else:
-                    if(self.current_losing_streak > self.biggest_losing_streak[1]):
-                        self.biggest_losing_streak = (nonce-self.current_losing_streak,self.current_losing_streak)
-                    if(self.current_losing_streak>0):
-                        self.losing_streaks.append(self.current_losing_streak)
-                    self.current_losing_streak = 0
-                    self.current_winning_streak += 1
-                    self.total_number_of_wins += 1
-                    self.money_won += (self.bet_size*self.target_multiplier)
-                    self.current_result.extend([self.target_multiplier,round(seed_result,2),"YES",self.bet_size,round(self.bet_size*self.target_multiplier,2),round(self.total_money_bet,2),round(self.money_won,2)])
-                self.results.append(self.current_result)
-                self.cumulative_profit.append(self.money_won-self.total_money_bet) 
+            # Workers write their rows straight into shared memory; only the streak summaries are pickled
+            self.result_columns = Shared_Result_Columns(self.nonces[0],self.nonces[-1])
+            summary:Shard_Summary = run_sharded_columns(
+                simulate_nonce_range,self.result_columns,workers=self.workers,
+                server_seed=self.server,client_seed=self.client,target_multiplier=self.target_multiplier,bet_size=self.bet_size,**self.digest_options
+            )
+            self._record_summary(summary)
+            self.total_money_bet = self.result_columns["total_bet"][-1].item()
+            self.money_won = self.result_columns["total_won"][-1].item()
+            self.cumulative_games = arange(1,self.total_games_played+1)
+            self.cumulative_profit = self.result_columns["balance"]
+            self._count_milestone_multipliers(self.result_columns["outcome"])
             self._save_raw_data()
         except Exception as e:
             log_to_xml(message=f"Error running simulation. Official error thrown: {traceback.format_exc()}")
 
+    def run_streaming_simulation(self):
+        """
+        run_simulation in memory bounded by one STREAM_BLOCK_SIZE block of nonces, for audits too long to hold every row.
+
+        Rows are written to disk a block at a time, the profit series is kept at plot resolution with its
+        extremes intact, and streaks only ever exist as counts of each length.
+        """
+        try:
+            profit_series:Plot_Series = Plot_Series(len(self.nonces))
+            summary:Shard_Summary = Shard_Summary(self.nonces[0])
+            totals:dict[str,float] = {"total_bet":0,"total_won":0}
+
+            def frames():
+                nonlocal summary
+                for low in range(self.nonces[0],self.nonces[-1]+1,STREAM_BLOCK_SIZE):
+                    high:int = min(low+STREAM_BLOCK_SIZE-1,self.nonces[-1])
+                    columns:dict[str,Any] = {name:empty(high-low+1,dtype=dtype) for name,dtype in RESULT_COLUMNS.items()}
+                    summary = summary.merge(simulate_nonce_range(columns,self.server,self.client,low,high,self.target_multiplier,self.bet_size,**self.digest_options))
+                    # Running totals carry over from the previous block, adding one game at a time as in the whole-range columns
+                    columns["total_bet"] = running_total(totals["total_bet"],columns["bet"])
+                    columns["total_won"] = running_total(totals["total_won"],columns["payout"])
+                    columns["balance"] = columns["total_won"]-columns["total_bet"]
+                    totals["total_bet"],totals["total_won"] = columns["total_bet"][-1].item(),columns["total_won"][-1].item()
+                    profit_series.add(columns["nonce"]-self.nonces[0]+1,columns["balance"])
+                    self._count_milestone_multipliers(columns["outcome"])
+                    yield self._result_frame(columns,first_row=low-self.nonces[0])
+
+            fingerprint:Run_Fingerprint = Run_Fingerprint(self.configuration,loaded_source_paths(__file__))
+            write_result_frames(frames(),*self._raw_data_paths(),RESULT_FRAME_COLUMNS,csv_index=False,fingerprint=fingerprint)
+            fingerprint.save(self._fingerprint_path())
+            self._record_summary(summary.finish())
+            self.total_money_bet = totals["total_bet"]
+            self.money_won = totals["total_won"]
+            self.cumulative_games,self.cumulative_profit = profit_series.points()
+        except Exception as e:
+            log_to_xml(message=f"Error running streaming simulation. Official error thrown: {traceback.format_exc()}")
+
+    def _record_summary(self,summary:Shard_Summary):
+        self.total_games_played = summary.games
+        self.total_number_of_wins = summary.wins
+        self.total_number_of_losses = summary.losses
+        self.biggest_winning_streak = summary.biggest_streaks[True]
+        self.biggest_losing_streak = summary.biggest_streaks[False]
+        self.winning_streak_sizes = summary.streak_sizes[True]
+        self.losing_streak_sizes = summary.streak_sizes[False]
+
+    def run_sweep(self,targets:list[float]):
+        """
+        Writes wins, RTP and biggest losing streak for every target to one table, from a single pass over the results.
+        """
+        try:
+            results = empty(len(self.nonces))
+            for low in range(0,len(self.nonces),BLOCK_SIZE):
+                high:int = min(low+BLOCK_SIZE,len(self.nonces))
+                results[low:high] = decode_block("Limbo",self.server,self.client,self.nonces[low],self.nonces[high-1],**self.digest_options)
+            targets = sorted(targets or self.milestone_multiplier)
+            sweep = target_sweep(results,targets)
+            target_array = array(targets,dtype=float64)
+            theoretical_wins = (len(results)/target_array)*0.99
+            DataFrame({
+                "Target":targets,
+                "Win Chance":(99/target_array).round(6),
+                "Theoretical Number of Wins":theoretical_wins,
+                "Actual Number of Wins":sweep["wins"],
+                "Deviation":sweep["wins"]-theoretical_wins,
+                "Deviation (Standard Deviations)":(sweep["wins"]-theoretical_wins)/sqrt(theoretical_wins*(1-0.99/target_array)),
+                "Return to Player (RTP)":(sweep["wins"]*target_array/len(results))*100,
+                "Biggest Losing Streak":sweep["biggest_losing_streaks"],
+            }).to_csv(os.path.join(BASE_DIR,f"LIMBO_SWEEP_{self.server}_{self.client}_{self.nonces[0]}_to_{self.nonces[-1]}.csv"),index=False)
+        except Exception as e:
+            log_to_xml(message=f"Error running sweep. Official error thrown: {traceback.format_exc()}")
+
+    def _count_milestone_multipliers(self,outcomes):
+        # Each result counts towards the largest milestone it is strictly above
+        milestones:list[int|float] = sorted(self.milestone_multiplier)
+        buckets = searchsorted(array(milestones,dtype=float64),outcomes,side='left')-1
+        counts = bincount(buckets[buckets >= 0],minlength=len(milestones))
+        for milestone,count in zip(milestones,counts.tolist()):
+            self.milestone_multiplier[milestone] += count
+
+    def _raw_data_paths(self) -> tuple[str,str]:
+        name:str = f"LIMBO_RESULTS_{self.server}_{self.client}_{self.nonces[0]}_to_{self.nonces[-1]}"
+        return os.path.join(BASE_DIR,f"{name}.csv"),os.path.join(BASE_DIR,f"{name}.json")
+
+    def _fingerprint_path(self) -> str:
+        return os.path.join(BASE_DIR,f"LIMBO_FINGERPRINT_{self.server}_{self.client}_{self.nonces[0]}_to_{self.nonces[-1]}.json")
+
+    def _result_frame(self,columns:dict[str,Any],first_row:int=0) -> DataFrame:
+        wins = columns["payout"] != 0
+        # Whole-number bets and targets keep whole-number money columns, as the per-game loop produced
+        money_type = int64 if isinstance(self.bet_size*self.target_multiplier,int) else float64
+        return DataFrame({
+            "Server Seed":self.server,
+            "Server Seed (Hashed)":self.server_hashed,
+            "Client Seed":self.client,
+            "Nonce":columns["nonce"],
+            "Target":self.target_multiplier,
+            "Result":columns["outcome"],
+            "Win":where(wins,"YES","NO"),
+            "Bet Size":self.bet_size,
+            "Money Won (Round)":columns["payout"].round(2).astype(money_type),
+            "Total Money Wagered":columns["total_bet"].round(2).astype(int64 if isinstance(self.bet_size,int) else float64),
+            "Total Gross Winnings":columns["total_won"].round(2).astype(money_type),
+        },index=RangeIndex(first_row,first_row+len(columns["nonce"])))
+
     def _save_raw_data(self):
         try:
-            df:DataFrame = DataFrame(self.results,columns=["Server Seed","Server Seed (Hashed)","Client Seed","Nonce","Target","Result","Win","Bet Size","Money Won (Round)","Total Money Wagered","Total Gross Winnings"])
-            df.to_csv(os.path.join(BASE_DIR,f"LIMBO_RESULTS_{self.server}_{self.client}_{self.nonces[0]}_to_{self.nonces[-1]}.csv"),index=False)
-            df.to_json(os.path.join(BASE_DIR,f"LIMBO_RESULTS_{self.server}_{self.client}_{self.nonces[0]}_to_{self.nonces[-1]}.json"),orient='table',indent=4)    
+            # The result files are hashed as they are written, so proving a run reproduces never rereads them
+            fingerprint:Run_Fingerprint = Run_Fingerprint(self.configuration,loaded_source_paths(__file__))
+            write_result_frames([self._result_frame(self.result_columns.columns)],*self._raw_data_paths(),RESULT_FRAME_COLUMNS,csv_index=False,fingerprint=fingerprint)
+            fingerprint.save(self._fingerprint_path())
         except Exception as e:
             log_to_xml(f"Error saving raw data. Official error thrown: {traceback.format_exc()}")
 
+    def close(self):
+        if self.result_columns is not None:
+            self.cumulative_profit = []
+            self.result_columns.close()
+            self.result_columns = None
+
 def main():
-    tracker:Limbo_Simulation_Tracker = Limbo_Simulation_Tracker()
+    tracker:Limbo_Simulation_Tracker = Limbo_Simulation_Tracker(workers=parse_workers(),digest_options=parse_digest_options())
     if tracker.configuration  is None:
         return
-    tracker.run_simulation()
-    analysis_data:dict[str,int|float|str] = _get_analysis_data(local_variables=tracker.__dict__)
-    generate_analysis_pdf(
-                analysis_data,os.path.join(BASE_DIR,"LIMBO_ANALYSIS.pdf"),[
-                plot_occurrences(tracker.milestone_multiplier),
-                plot_accumulation(tracker.cumulative_games,tracker.cumulative_profit,'Net Profit','Red','Cumulative Net Profit Over Time','Net Profit')
-            ]
-        )
+    sweep_targets:list[float]|None = parse_sweep_targets()
+    if sweep_targets is not None:
+        tracker.run_sweep(sweep_targets)
+        return
+    try:
+        if parse_stream():
+            tracker.run_streaming_simulation()
+        else:
+            tracker.run_simulation()
+        analysis_data:dict[str,int|float|str] = _get_analysis_data(local_variables=tracker.__dict__)
+        generate_analysis_pdf(
+                    analysis_data,os.path.join(BASE_DIR,"LIMBO_ANALYSIS.pdf"),[
+                    plot_occurrences(tracker.milestone_multiplier),
+                    plot_accumulation(tracker.cumulative_games,tracker.cumulative_profit,'Net Profit','Red','Cumulative Net Profit Over Time','Net Profit')
+                ]
+            )
+    finally:
+        tracker.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,5 @@
 import os
-import hmac
-import hashlib
+import sys
 import random
 import secrets
 import string
@@ -8,65 +7,18 @@ from math import floor
 from pandas import DataFrame
 import json
 from Multipliers import mines_multipliers
-
-def sha256_encrypt(input_string: str) -> str:
-    # Create a sha256 hash object
-    sha256_hash = hashlib.sha256()
-    
-    # Update the hash object with the bytes of the input string
-    sha256_hash.update(input_string.encode('utf-8'))
-    
-    # Return the hexadecimal representation of the hash
-    return sha256_hash.hexdigest()
-
-def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(3)]
-    hmac_objs:list[hmac.HMAC] = [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256) for message in messages]
-    return [hmac_obj.hexdigest() for hmac_obj in hmac_objs]
-
-def hexadecimal_to_bytes(hexadecimal:str) -> list[int]:
-    return list(bytes.fromhex(hexadecimal))
-
-def bytes_to_basic_number(bytes_list: list[int]) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float = ((float(bytes_list[0]) / float(256**1)) +
-              (float(bytes_list[1]) / float(256**2)) +
-              (float(bytes_list[2]) / float(256**3)) +
-              (float(bytes_list[3]) / float(256**4)))
-    return number
-
-def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float =  (
-                        (float(bytes_list[0]) / float(256**1)) +
-                        (float(bytes_list[1]) / float(256**2)) +
-                        (float(bytes_list[2]) / float(256**3)) +
-                        (float(bytes_list[3]) / float(256**4))
-                    )
-    
-    number:int = floor(number*multiplier)
-    return number
-
-def number_to_shuffle(number:int,row:list[int]):
-    return row[number]
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from numpy import array,ndarray,where
+from Provably_Fair import Byte_Cursor,sha256_encrypt
+from Provably_Fair.Bet_Progression import compile_streak_stakes,losing_streak_lengths,running_total
+from Provably_Fair.Checkpoint import Checkpoint,parse_resume,run_checkpointed
+from Provably_Fair.Shard_Runner import Shard_Summary,parse_workers
 
 def seeds_to_results(server_seed:str,client_seed:str,nonce:int,num_mines:str,prediction_configuration:list[list[int]],bet_size:float) -> tuple[float,list[list[str]],list[list[str]]]:
     shuffle:list[int] = list(range(25))
-    hexs = seeds_to_hexadecimals(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
-    bytes_lists:list[list[int]] = [hexadecimal_to_bytes(current_hex) for current_hex in hexs]
-    row:list[list[int]] = []
-    final_shuffle:list[int] = []
-    multiplier:int = 25
-    for bytes_list in bytes_lists:
-        for index in range(0,len(bytes_list),4):
-            row.append(bytes_to_number(bytes_list[index:index+4],(multiplier)))
-            multiplier -= 1
-
-    for index,number in enumerate(row):
-        final_shuffle.append(shuffle[number])
-        shuffle.remove(shuffle[number])
-    final_shuffle.append(shuffle[0])
-    mines_locations:list[int] = final_shuffle[:num_mines]
+    cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+    # Only the first num_mines picks of the shuffle place mines, so only those words are drawn
+    mines_locations:list[int] = [shuffle.pop(cursor.next_number(multiplier)) for multiplier in range(25,25-num_mines,-1)]
     final_mines_coordinates:list[tuple[int,int]] = []
     for location in mines_locations:
         final_mines_coordinates.append(((location%5)+1,5-floor(location/5)))
@@ -105,6 +57,15 @@ def seeds_to_results(server_seed:str,client_seed:str,nonce:int,num_mines:str,pre
         row_reverse += 1
     return payout_multiplier,final_grid,final_clicks_grid
 
+def simulate_nonce_range(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,num_mines:int,prediction_configuration:list[list[int]],bet_size:float) -> Shard_Summary:
+    # Wins do not depend on the bet, so the shard plays the base bet and the main loop replays the bet sizes
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    for nonce in range(minimum_nonce,maximum_nonce+1):
+        current_winnings,seed_result,clicks_results = seeds_to_results(server_seed=server_seed,client_seed=client_seed,nonce=nonce,num_mines=num_mines,prediction_configuration=prediction_configuration,bet_size=bet_size)
+        summary.add(nonce=nonce,win=current_winnings != 0)
+        summary.rows.append([server_seed,client_seed,nonce,current_winnings != 0,seed_result_to_string(seed_result),seed_result_to_string(clicks_results)])
+    return summary
+
 def generate_server_seed():
     possible_characters:str = string.ascii_lowercase+string.digits
     seed:str = "".join([random.choice(possible_characters) for _ in range(64)])
@@ -122,6 +83,48 @@ def seed_result_to_string(results:list[list[str]]) -> str:
     final_string += f"\t\t\t{'|'.join(results[-1])}"
     return final_string
 
+def next_stake(losing_streak:int,stake:float) -> float:
+    # The bet grows by half after every loss and goes back to BetSize after a win
+    return stake*1.5
+
+def write_result_rows(output,rows:list[list],carry:dict) -> dict:
+    """
+    Replays the bet sizes over one step of rows and appends their entries to the results file.
+
+    The carry holds the BetSize, winning multiplier and hashed server seed, and carries the losing
+    streak and money totals from one step to the next.
+    """
+    if(output.tell() == 0):
+        output.write("[\n".encode("utf-8"))
+    # The bet only depends on the losing streak, so every stake comes from one table
+    wins:ndarray = array([row[3] for row in rows],dtype=bool)
+    losing_streaks:ndarray = losing_streak_lengths(wins,carry["losing_streak"])
+    stake_table:ndarray = compile_streak_stakes(int(losing_streaks.max())+1,carry["base_bet"],next_stake)
+    winnings_table:list[float] = [round(stake*carry["winning_multiplier"],2) for stake in stake_table.tolist()]
+    winnings:ndarray = where(wins,array(winnings_table)[losing_streaks],0)
+    carry["money_bet"] = running_total(carry["money_bet"],stake_table[losing_streaks])[-1]
+    carry["money_won"] = running_total(carry["money_won"],winnings)[-1]
+    carry["losing_streak"] = 0 if wins[-1] else int(losing_streaks[-1])+1
+
+    entries:list[str] = []
+    for (server_seed,client_seed,nonce,win,mine_configuration,clicks_configuration),losing_streak in zip(rows,losing_streaks.tolist()):
+        current_winnings:float = winnings_table[losing_streak] if win else 0
+        entries.append(\
+f"""\t{{
+        Server Seed: {server_seed},
+        Server Seed (Hashed): {carry["server_hashed"]}
+        Client Seed: {client_seed},
+        Nonce: {nonce},
+        Amount Won: {current_winnings},
+        Mine Configuration: 
+{mine_configuration}
+        Clicks Results:
+{clicks_configuration}
+\t}},
+""")
+    output.write("".join(entries).encode("utf-8"))
+    return carry
+
 if __name__ == "__main__":
     # Get the path to the folder this script is in
     BASE_DIR:str = os.path.dirname(os.path.abspath(__file__))
@@ -134,64 +137,31 @@ if __name__ == "__main__":
     server:str = configuration["ServerSeed"]
     server_hashed:str = sha256_encrypt(server)
     client:str = configuration["ClientSeed"]
-    nonces:list[int] = list(range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1)) 
+    nonces:range = range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1)
     num_mines:int = configuration["NumberOfMines"]
     prediction_configuration:list[list[int]] = configuration["BoxesToClick"]
     bet_size:float = configuration["BetSize"]
     winning_multiplier:float = mines_multipliers[num_mines][sum(1 for sublist in prediction_configuration for item in sublist if item == 1)-1]
 
-    results:list[str] = []
-    current_result:list[int] = []
-
-    biggest_winning_streak:tuple[int,int] = (0,0)
-    biggest_losing_streak:tuple[int,int] = (0,0)
-    current_winning_streak:int = 0
-    current_losing_streak:int = 0
-    total_number_of_wins:int = 0
-    total_number_of_losses:int = 0
-    total_games_played:int = 0
-    money_bet:float = 0
-    money_won:float = 0
-
-    for nonce in nonces:
-        total_games_played += 1
-        money_bet += bet_size
-        current_result = [server,client,nonce]
-        current_winnings,seed_result,clicks_results = seeds_to_results(server_seed=server,client_seed=client,nonce=nonce,num_mines=num_mines,prediction_configuration=prediction_configuration,bet_size=bet_size)
-        money_won += current_winnings
-        if(current_winnings == 0):
-            if(current_winning_streak > biggest_winning_streak[1]):
-                biggest_winning_streak = (nonce-current_winning_streak,current_winning_streak)
-            current_winning_streak = 0
-            current_losing_streak += 1
-            total_number_of_losses += 1
-            bet_size *= 1.5
-        else:
-            if(current_losing_streak > biggest_losing_streak[1]):
-                biggest_losing_streak = (nonce-current_losing_streak,current_losing_streak)
-            current_losing_streak = 0
-            current_winning_streak += 1
-            total_number_of_wins += 1
-            bet_size = configuration["BetSize"]
-        current_result.extend([current_winnings,seed_result_to_string(seed_result),seed_result_to_string(clicks_results)])
-        results.append(current_result.copy())
-    with open(os.path.join(BASE_DIR,f"MINES_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.txt"),"w",encoding='utf-8') as file:
-        file.write("[\n")
-        for result in results:
-            file.write("\t{\n")
-            file.write(\
-f"""        Server Seed: {result[0]},
-        Server Seed (Hashed): {server_hashed}
-        Client Seed: {result[1]},
-        Nonce: {result[2]},
-        Amount Won: {result[3]},
-        Mine Configuration: 
-{result[4]}
-        Clicks Results:
-{result[5]}""")
-            file.write("\n\t},\n")
+    results_path:str = os.path.join(BASE_DIR,f"MINES_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.txt")
+    checkpoint:Checkpoint = Checkpoint(os.path.join(BASE_DIR,f"MINES_CHECKPOINT_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.pkl"),configuration)
+    # Wins do not depend on the bet, so the shards play the base bet and write_result_rows replays the bet sizes
+    summary,carry = run_checkpointed(
+        simulate_nonce_range,nonces[0],nonces[-1],checkpoint,results_path,write_result_rows,
+        carry={"base_bet":bet_size,"winning_multiplier":winning_multiplier,"server_hashed":server_hashed,"losing_streak":0,"money_bet":0,"money_won":0},
+        resume=parse_resume(),workers=parse_workers(),server_seed=server,client_seed=client,num_mines=num_mines,prediction_configuration=prediction_configuration,bet_size=bet_size
+    )
+    with open(results_path,"a",encoding='utf-8') as file:
         file.write("]")
-            
+    biggest_winning_streak:tuple[int,int] = summary.biggest_streaks[True]
+    biggest_losing_streak:tuple[int,int] = summary.biggest_streaks[False]
+    total_number_of_wins:int = summary.wins
+    total_number_of_losses:int = summary.losses
+    total_games_played:int = summary.games
+    money_bet:float = carry["money_bet"]
+    money_won:float = carry["money_won"]
+    bet_size = float(compile_streak_stakes(carry["losing_streak"],bet_size,next_stake)[-1])
+
     # DataFrame(results,columns=["Server Seed","Client Seed","Nonce","Amount Won","Mine Configuration","Clicks Results"]).to_excel(f"MINES_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.xlsx",index=False)
     with open(os.path.join(BASE_DIR,f"MINES_RESULTS_ANALYSIS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.txt"),"w",encoding='utf-8') as file:
         file.write(f"""MINES {num_mines} MINES ANALYSIS
@@ -1,12 +1,20 @@
 import os
-import hmac
-import hashlib
+import sys
 import random
 import string
-from math import floor
 import json
 from pandas import DataFrame
+from numpy import bincount,flatnonzero,ndarray
 from Multipliers import plinko_multipliers
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Provably_Fair import Byte_Cursor,sha256_encrypt
+from Provably_Fair.Checkpoint import Checkpoint,parse_resume,run_checkpointed
+from Provably_Fair.Outcome_Stream import parse_digest_options
+from Provably_Fair.Plinko_Engine import PRIZE_TIERS,Plinko_Engine
+from Provably_Fair.Shard_Runner import Shard_Summary,parse_workers
+
+BLOCK_SIZE:int = 100_000
+RESULT_COLUMNS:list[str] = ["Server Seed","Client Seed","Nonce","Prize Index","Multiplier"]
 
 def generate_server_seed():
     possible_characters:str = string.hexdigits
@@ -18,52 +26,45 @@ def generate_client_seed():
     seed:str = "".join([random.choice(possible_characters) for _ in range(20)])
     return seed
 
-def sha256_encrypt(input_string: str) -> str:
-    # Create a sha256 hash object
-    sha256_hash = hashlib.sha256()
-    
-    # Update the hash object with the bytes of the input string
-    sha256_hash.update(input_string.encode('utf-8'))
-    
-    # Return the hexadecimal representation of the hash
-    return sha256_hash.hexdigest()
-
-def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(3)]
-    hmac_objs:list[hmac.HMAC] = [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256) for message in messages]
-    return [hmac_obj.hexdigest() for hmac_obj in hmac_objs]
-
-def hexadecimal_to_bytes(hexadecimal:str) -> list[int]:
-    return list(bytes.fromhex(hexadecimal))
+def seeds_to_results(server_seed:str,client_seed:str,nonce:int,risk:str,rows:int) -> tuple[int,int|float]:
+    cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+    prize_index:int = sum([cursor.next_number(2) for _ in range(rows)])
+    return [prize_index,plinko_multipliers[f"{risk}{rows}"][prize_index]]
 
-def bytes_to_basic_number(bytes_list: list[int]) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float = ((float(bytes_list[0]) / float(256**1)) +
-              (float(bytes_list[1]) / float(256**2)) +
-              (float(bytes_list[2]) / float(256**3)) +
-              (float(bytes_list[3]) / float(256**4)))
-    return number
+def simulate_nonce_range(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,risk:str,rows:int,cache:bool=False,lane:bool=False) -> Shard_Summary:
+    # Decodes a block of nonces at once, so each game is only lookups by prize index
+    engine:Plinko_Engine = Plinko_Engine(plinko_multipliers[f"{risk}{rows}"])
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    for low in range(minimum_nonce,maximum_nonce+1,BLOCK_SIZE):
+        high:int = min(low+BLOCK_SIZE-1,maximum_nonce)
+        prize_indexes,multipliers = engine.play(server_seed,client_seed,low,high,cache,lane)
+        block:Shard_Summary = Shard_Summary.from_wins(low,engine.wins[prize_indexes])
+        for payout,count in zip(engine.multiplier_vector.tolist(),bincount(prize_indexes,minlength=engine.rows+1).tolist()):
+            if(payout != 0):
+                block.add_payouts(payout,count)
+        tiers:ndarray = engine.prize_tiers[prize_indexes]
+        for tier,name in enumerate(PRIZE_TIERS):
+            block.nonce_lists[name].extend(f"{nonce:,.0f}" for nonce in (flatnonzero(tiers == tier)+low).tolist())
+        block.rows = [[server_seed,client_seed,nonce,prize_index,multiplier] for nonce,prize_index,multiplier in zip(range(low,high+1),prize_indexes.tolist(),multipliers.tolist())]
+        summary = summary.merge(block)
+    return summary
 
-def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float =  (
-                        (float(bytes_list[0]) / float(256**1)) +
-                        (float(bytes_list[1]) / float(256**2)) +
-                        (float(bytes_list[2]) / float(256**3)) +
-                        (float(bytes_list[3]) / float(256**4))
-                    )
-    number = number*multiplier
-    return floor(number)
+def write_result_rows(output,rows:list[list],carry:dict,last:bool=False) -> dict:
+    """
+    Appends rows to the results CSV, formatted as one DataFrame of every row would write them.
 
-def seeds_to_results(server_seed:str,client_seed:str,nonce:int,risk:str,rows:int) -> tuple[int,int|float]:
-    hexs = seeds_to_hexadecimals(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
-    bytes_lists:list[list[int]] = [hexadecimal_to_bytes(current_hex) for current_hex in hexs]
-    row:list[list[int]] = []
-    for bytes_list in bytes_lists:
-        for index in range(0,len(bytes_list),4):
-            row.append(bytes_to_number(bytes_list[index:index+4],2))
-            if(len(row)==rows):
-                return [sum(row),plinko_multipliers[f"{risk}{rows}"][sum(row)]]
+    That DataFrame's Multiplier column only turns float once a fractional multiplier comes up, so rows are
+    held back in the carry until one has, or until the run ends.
+    """
+    carry["pending"].extend(rows)
+    carry["floats"] = carry["floats"] or any(isinstance(row[4],float) for row in rows)
+    if(carry["floats"] or last):
+        frame:DataFrame = DataFrame(carry["pending"],columns=RESULT_COLUMNS)
+        if(carry["floats"]):
+            frame = frame.astype({"Multiplier":float})
+        output.write(frame.to_csv(index=False,header=output.tell() == 0).encode("utf-8"))
+        carry["pending"] = []
+    return carry
 
 if __name__ == "__main__":
     # Get the path to the folder this script is in
@@ -77,52 +78,31 @@ if __name__ == "__main__":
     server:str = configuration["ServerSeed"]
     server_hashed:str = sha256_encrypt(server)
     client:str = configuration["ClientSeed"]
-    nonces:list[int] = list(range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1))
+    nonces:range = range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1)
     risk:str = configuration["Risk"]
     num_rows:int = configuration["Rows"]
     bet_size:float = configuration["BetSize"]
 
-    results:list[list[float|int]] = []
-    current_result:list[int] = []
-
-    biggest_winning_streak:tuple[int,int] = (0,0)
-    biggest_losing_streak:tuple[int,int] = (0,0)
-    current_winning_streak:int = 0
-    current_losing_streak:int = 0
-    total_number_of_wins:int = 0
-    total_number_of_losses:int = 0
-    total_games_played:int = 0
-    money_won:float = 0
-    nonces_with_largest_prize:list[int] = []
-    nonces_with_second_largest_prize:list[int] = []
-    nonces_with_third_largest_prize:list[int] = []
+    results_path:str = f"PLINKO_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv"
+    checkpoint:Checkpoint = Checkpoint(f"PLINKO_CHECKPOINT_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.pkl",configuration)
+    # Rows go to the CSV as each step finishes, so a resumed run only replays the steps after the last checkpoint
+    summary,carry = run_checkpointed(
+        simulate_nonce_range,nonces[0],nonces[-1],checkpoint,results_path,write_result_rows,carry={"pending":[],"floats":False},
+        resume=parse_resume(),workers=parse_workers(),server_seed=server,client_seed=client,risk=risk,rows=num_rows,**parse_digest_options()
+    )
+    if(carry["pending"] or (os.path.getsize(results_path) == 0)):
+        with open(results_path,"ab") as file:
+            write_result_rows(file,[],carry,last=True)
+    biggest_winning_streak:tuple[int,int] = summary.biggest_streaks[True]
+    biggest_losing_streak:tuple[int,int] = summary.biggest_streaks[False]
+    total_number_of_wins:int = summary.wins
+    total_number_of_losses:int = summary.losses
+    total_games_played:int = summary.games
+    money_won:float = summary.money_won(bet_size)
+    nonces_with_largest_prize:list[str] = summary.nonce_lists["largest_prize"]
+    nonces_with_second_largest_prize:list[str] = summary.nonce_lists["second_largest_prize"]
+    nonces_with_third_largest_prize:list[str] = summary.nonce_lists["third_largest_prize"]
 
-    for nonce in nonces:
-        total_games_played += 1
-        current_result = [server,client,nonce]
-        seed_result = seeds_to_results(server_seed=server,client_seed=client,nonce=nonce,risk=risk,rows=num_rows)
-        money_won += (bet_size*seed_result[1])
-        if(seed_result[1] < 1):
-            if(current_winning_streak > biggest_winning_streak[1]):
-                biggest_winning_streak = (nonce-current_winning_streak,current_winning_streak)
-            current_winning_streak = 0
-            current_losing_streak += 1
-            total_number_of_losses +=1
-        else:
-            if(current_losing_streak > biggest_losing_streak[1]):
-                biggest_losing_streak = (nonce-current_losing_streak,current_losing_streak)
-            current_losing_streak = 0
-            current_winning_streak += 1
-            total_number_of_wins += 1
-        if(seed_result[0] in [0,num_rows+1]):
-            nonces_with_largest_prize.append(f"{nonce:,.0f}")
-        elif(seed_result[0] in [1,num_rows]):
-            nonces_with_second_largest_prize.append(f"{nonce:,.0f}")
-        elif(seed_result[0] in [2,num_rows-1]):
-            nonces_with_third_largest_prize.append(f"{nonce:,.0f}")
-        current_result.extend(seed_result)
-        results.append(current_result)
-    DataFrame(results,columns=["Server Seed","Client Seed","Nonce","Prize Index","Multiplier"]).to_csv(f"PLINKO_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv",index=False)
     with open(f"PLINKO_RESULTS_ANALYSIS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.txt","w") as file:
         file.write(f"""PLINKO BALL {risk.upper()} RISK {num_rows} ROWS ANALYSIS
 Server Seed: {server}
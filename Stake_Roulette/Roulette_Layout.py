@@ -0,0 +1,185 @@
+from numpy import arange,array,bincount,column_stack,cumsum,float64,int64,maximum,ndarray,vstack,zeros
+from Provably_Fair.Shard_Runner import Shard_Summary
+
+# Gross payout of a bet covering n pockets is 36//n times the stake, so 36x on a single number down to 2x on 1-18
+TABLE_PAYOUT:int = 36
+
+# Payouts gathered per block when comparing layouts, 32 MB of float64 however many layouts there are
+COMPARISON_CELLS:int = 4_000_000
+
+# Configuration keys of the inside bets, keyed by the numbers they cover joined with "/", e.g. "17/20"
+INSIDE_BET_SIZES:dict[str,int] = {"SplitBets":2,"StreetBets":3,"CornerBets":4,"SixLineBets":6}
+
+ONE_TO_ONE_NUMBERS:dict[str,list[int]] = {
+    "1-18":list(range(1,19)),
+    "19-36":list(range(19,37)),
+    "Even":list(range(2,37,2)),
+    "Odd":list(range(1,37,2)),
+}
+DOZEN_NUMBERS:dict[str,list[int]] = {"1-12":list(range(1,13)),"13-24":list(range(13,25)),"25-36":list(range(25,37))}
+
+def legal_inside_bets() -> dict[int,set[frozenset[int]]]:
+    """
+    Every way to place a split, street, corner or six-line on the table, keyed by how many numbers it covers.
+
+    Streets also take the 0-1-2 and 0-2-3 trios and corners the 0-1-2-3 first four.
+    """
+    splits:set[frozenset[int]] = {frozenset((0,number)) for number in (1,2,3)}
+    splits |= {frozenset((number,number+1)) for number in range(1,36) if number%3 != 0}
+    splits |= {frozenset((number,number+3)) for number in range(1,34)}
+    streets:set[frozenset[int]] = {frozenset((0,1,2)),frozenset((0,2,3))}
+    streets |= {frozenset(range(row,row+3)) for row in range(1,37,3)}
+    corners:set[frozenset[int]] = {frozenset((0,1,2,3))}
+    corners |= {frozenset((number,number+1,number+3,number+4)) for number in range(1,33) if number%3 != 0}
+    six_lines:set[frozenset[int]] = {frozenset(range(row,row+6)) for row in range(1,32,3)}
+    return {2:splits,3:streets,4:corners,6:six_lines}
+
+LEGAL_INSIDE_BETS:dict[int,set[frozenset[int]]] = legal_inside_bets()
+
+class Roulette_Layout:
+    """
+    A set of bets on the table, compiled once into the gross amount it pays back on each of the 37 pockets.
+
+    A spin then costs one lookup into payouts, and whether it is a win, a partial loss or a total loss
+    is fixed per pocket too. Bets are kept in groups in the order of Configuration.json, and stakes and
+    payouts are added up group by group in that order, so the totals are the exact floats a round
+    played bet by bet would give.
+    """
+    def __init__(self,bet_groups:dict[str,list[tuple[list[int],float]]]):
+        self.bet_groups:dict[str,list[tuple[list[int],float]]] = bet_groups
+        self.round_bettings:float = 0
+        for bets in bet_groups.values():
+            self.round_bettings += sum([stake for _,stake in bets])
+
+        # Python numbers rather than an array, so whole-number layouts keep whole-number payouts
+        self.payouts:list[float] = []
+        for pocket in range(37):
+            payout:float = 0
+            for bets in bet_groups.values():
+                for numbers,stake in bets:
+                    if(pocket in numbers):
+                        payout += stake*(TABLE_PAYOUT//len(numbers))
+            self.payouts.append(payout)
+        self.payout_vector:ndarray = array(self.payouts,dtype=float64)
+        self.wins:ndarray = self.payout_vector > self.round_bettings
+        self.partial_losses:ndarray = (~self.wins)&(self.payout_vector > 0)
+
+    def return_to_player(self) -> float:
+        # Every pocket is equally likely, so the expected payout is the mean of the vector
+        return float(self.payout_vector.mean()/self.round_bettings)
+
+def parse_inside_bet(key:str,size:int) -> list[int]:
+    numbers:list[int] = sorted(int(number) for number in key.split("/"))
+    if((len(numbers) != size) or (frozenset(numbers) not in LEGAL_INSIDE_BETS[size])):
+        raise ValueError(f"{key} is not a bet covering {size} neighbouring numbers on the table")
+    return numbers
+
+def compile_layout(configuration:dict) -> Roulette_Layout:
+    """
+    Compiles the bets of a Roulette Configuration.json into a Roulette_Layout.
+
+    Args:
+        configuration: Holds RouletteColors and any of SingleNumberBets, VerticalColumnBets, DozenBets, OnetoOneBets,
+            SplitBets, StreetBets, CornerBets and SixLineBets. A missing group places no bets.
+
+    Raises:
+        ValueError: When an inside bet does not cover neighbouring numbers on the table.
+    """
+    colors:dict[str,str] = configuration["RouletteColors"]
+    bet_groups:dict[str,list[tuple[list[int],float]]] = {
+        "SingleNumberBets":[([int(number)],stake) for number,stake in configuration.get("SingleNumberBets",{}).items()],
+        # Column "0" holds the multiples of 3
+        "VerticalColumnBets":[([number for number in range(1,37) if number%3 == int(column)],stake) for column,stake in configuration.get("VerticalColumnBets",{}).items()],
+        "DozenBets":[(DOZEN_NUMBERS[dozen],stake) for dozen,stake in configuration.get("DozenBets",{}).items()],
+        "OnetoOneBets":[
+            (ONE_TO_ONE_NUMBERS[name] if name in ONE_TO_ONE_NUMBERS else [number for number in range(1,37) if colors[str(number)] == name],stake)
+            for name,stake in configuration.get("OnetoOneBets",{}).items()
+        ],
+    }
+    for group,size in INSIDE_BET_SIZES.items():
+        bet_groups[group] = [(parse_inside_bet(key,size),stake) for key,stake in configuration.get(group,{}).items()]
+    return Roulette_Layout(bet_groups)
+
+def compile_layouts(configuration:dict,entries:list[dict]) -> tuple[list[str],list[Roulette_Layout]]:
+    """
+    Compiles a list of layouts to compare, each holding bet groups as in Configuration.json and an optional "Name".
+
+    Args:
+        configuration: Supplies the RouletteColors every layout is played on.
+        entries: One dictionary of bet groups per layout.
+
+    Returns:
+        tuple[list[str],list[Roulette_Layout]]: Name and compiled layout of every entry, in order.
+
+    Raises:
+        ValueError: When a layout places no bets or an inside bet is not on the table.
+    """
+    names:list[str] = []
+    compiled:list[Roulette_Layout] = []
+    for number,entry in enumerate(entries,start=1):
+        name:str = entry.get("Name",f"Layout {number}")
+        layout:Roulette_Layout = compile_layout({**entry,"RouletteColors":configuration["RouletteColors"]})
+        if(layout.round_bettings <= 0):
+            raise ValueError(f"{name} places no bets")
+        names.append(name)
+        compiled.append(layout)
+    return names,compiled
+
+def payout_matrix(layouts:list[Roulette_Layout]) -> ndarray:
+    # One row per pocket and one column per layout, so a block of spins gathers every layout's payouts at once
+    return column_stack([layout.payout_vector for layout in layouts])
+
+def compare_layouts(layouts:list[Roulette_Layout],pockets:ndarray,minimum_nonce:int) -> dict[str,ndarray]:
+    """
+    Plays every layout against the same spins, one gather from the payout matrix per block.
+
+    The net result of a layout after each spin is its winnings so far less its stake times the spins
+    played, and its max drawdown is the biggest fall of that net result from its highest point so far,
+    counting the 0 it starts from. Streaks follow Shard_Summary, so the run still open at the end is not counted.
+
+    Args:
+        layouts: Layouts to compare.
+        pockets: Pocket of every spin, in nonce order.
+        minimum_nonce: Nonce of the first spin.
+
+    Returns:
+        dict: "wagered", "won", "wins", "partial_losses", "total_losses", "biggest_winning_streaks",
+        "biggest_losing_streaks" and "max_drawdowns", one entry per layout.
+    """
+    payouts:ndarray = payout_matrix(layouts)
+    stakes:ndarray = array([layout.round_bettings for layout in layouts],dtype=float64)
+    games:int = len(pockets)
+    won:ndarray = zeros(len(layouts))
+    peaks:ndarray = zeros(len(layouts))
+    max_drawdowns:ndarray = zeros(len(layouts))
+    summaries:list[Shard_Summary] = [Shard_Summary(minimum_nonce) for _ in layouts]
+    block_size:int = max(1,COMPARISON_CELLS//len(layouts))
+    for low in range(0,games,block_size):
+        high:int = min(low+block_size,games)
+        block_payouts:ndarray = payouts[pockets[low:high].astype(int64)]
+        # Adding the carried winnings as the first row keeps the sums in the same order as spin by spin
+        cumulative_won:ndarray = cumsum(vstack((won,block_payouts)),axis=0)[1:]
+        net_results:ndarray = cumulative_won-arange(low+1,high+1)[:,None]*stakes
+        running_peaks:ndarray = maximum(peaks,maximum.accumulate(net_results,axis=0))
+        max_drawdowns = maximum(max_drawdowns,(running_peaks-net_results).max(axis=0))
+        peaks,won = running_peaks[-1],cumulative_won[-1]
+        block_wins:ndarray = block_payouts > stakes
+        for index,summary in enumerate(summaries):
+            summaries[index] = summary.merge(Shard_Summary.from_wins(minimum_nonce+low,block_wins[:,index]))
+    for summary in summaries:
+        summary.finish()
+
+    # Whether a spin wins, partly loses or loses everything depends only on the pocket
+    pocket_counts:ndarray = bincount(pockets,minlength=37)
+    wins:ndarray = pocket_counts@array([layout.wins for layout in layouts]).T
+    partial_losses:ndarray = pocket_counts@array([layout.partial_losses for layout in layouts]).T
+    return {
+        "wagered":stakes*games,
+        "won":won,
+        "wins":wins,
+        "partial_losses":partial_losses,
+        "total_losses":games-wins-partial_losses,
+        "biggest_winning_streaks":array([summary.biggest_streaks[True][1] for summary in summaries],dtype=int64),
+        "biggest_losing_streaks":array([summary.biggest_streaks[False][1] for summary in summaries],dtype=int64),
+        "max_drawdowns":max_drawdowns,
+    }
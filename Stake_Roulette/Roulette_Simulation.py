@@ -1,17 +1,29 @@
 import os
-import hmac
-import hashlib
+import sys
 import random
+import argparse
 import string
 from io import BytesIO
-from math import floor
 import json
-from pandas import DataFrame
+from pandas import DataFrame,RangeIndex
 from fpdf import FPDF,XPos,YPos
 import matplotlib.pyplot as plt
 from matplotlib.container import BarContainer
 from matplotlib.ticker import FuncFormatter
-from numpy import mean,median,quantile
+from numpy import arange,array,bincount,dtype,empty,flatnonzero,float64,full,int8,int64,ndarray
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Provably_Fair import Byte_Cursor,sha256_encrypt
+from Provably_Fair.Bet_Progression import running_total
+from Provably_Fair.Category_Table import Category_Table
+from Provably_Fair.Outcome_Stream import decode_block,parse_digest_options
+from Provably_Fair.Plot_Series import Plot_Series
+from Provably_Fair.Result_Writer import write_result_frames
+from Provably_Fair.Shard_Runner import Shard_Summary,parse_workers,streak_statistics
+from Provably_Fair.Shared_Columns import Shared_Result_Columns,run_sharded_columns
+from Roulette_Layout import Roulette_Layout,compare_layouts,compile_layout,compile_layouts
+
+BLOCK_SIZE:int = 1_000_000
+RESULT_COLUMNS:list[str] = ["Server Seed","Client Seed","Nonce","Result","Balance","Total Wager (Round)","Gross Winnings (Round)","Color"]
 
 def generate_server_seed():
     possible_characters:str = string.hexdigits
@@ -23,52 +35,24 @@ def generate_client_seed():
     seed:str = "".join([random.choice(possible_characters) for _ in range(20)])
     return seed
 
-def sha256_encrypt(input_string: str) -> str:
-    # Create a sha256 hash object
-    sha256_hash = hashlib.sha256()
-    
-    # Update the hash object with the bytes of the input string
-    sha256_hash.update(input_string.encode('utf-8'))
-    
-    # Return the hexadecimal representation of the hash
-    return sha256_hash.hexdigest()
-
-def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(1)]
-    hmac_objs:list[hmac.HMAC] = [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256) for message in messages]
-    return [hmac_obj.hexdigest() for hmac_obj in hmac_objs]
-
-def hexadecimal_to_bytes(hexadecimal:str) -> list[int]:
-    return list(bytes.fromhex(hexadecimal))
-
-def bytes_to_basic_number(bytes_list: list[int]) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float = ((float(bytes_list[0]) / float(256**1)) +
-              (float(bytes_list[1]) / float(256**2)) +
-              (float(bytes_list[2]) / float(256**3)) +
-              (float(bytes_list[3]) / float(256**4)))
-    return number
-
-def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float =  (
-                        (float(bytes_list[0]) / float(256**1)) +
-                        (float(bytes_list[1]) / float(256**2)) +
-                        (float(bytes_list[2]) / float(256**3)) +
-                        (float(bytes_list[3]) / float(256**4))
-                    )
-    number = number*multiplier
-    return floor(number)
-
 def seeds_to_results(server_seed:str,client_seed:str,nonce:int) -> str:
-    hexs = seeds_to_hexadecimals(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
-    bytes_lists:list[list[int]] = [hexadecimal_to_bytes(current_hex) for current_hex in hexs]
-    row:list[list[int]] = []
-    for bytes_list in bytes_lists:
-        for index in range(0,len(bytes_list),4):
-            row.append(bytes_to_number(bytes_list[index:index+4],37))
-            if(len(row)==1):
-                return row[0]
+    cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+    return cursor.next_number(37)
+
+def simulate_nonce_range(columns:dict[str,ndarray],server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,wins_table:ndarray,cache:bool=False,lane:bool=False) -> Shard_Summary:
+    """
+    Spins minimum_nonce..maximum_nonce into columns["outcome"] one block at a time.
+
+    Returns:
+        Shard_Summary: Wins and streaks of the range, where wins_table says which pockets win.
+    """
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    for low in range(minimum_nonce,maximum_nonce+1,BLOCK_SIZE):
+        high:int = min(low+BLOCK_SIZE-1,maximum_nonce)
+        pockets:ndarray = decode_block("Roulette",server_seed,client_seed,low,high,cache=cache,lane=lane)
+        columns["outcome"][low-minimum_nonce:high-minimum_nonce+1] = pockets
+        summary = summary.merge(Shard_Summary.from_wins(low,wins_table[pockets]))
+    return summary
 
 def generate_analysis_pdf(analysis_data:dict[str,str], filename:str, img_buffers:list[BytesIO]):
     pdf = FPDF()
@@ -279,7 +263,7 @@ def plot_one_to_one_accumulation(cumulative_games:list[int],cumulative_one_to_on
     plt.figure(figsize=(10, 6))
     plt.plot(cumulative_games, cumulative_one_to_one_1, label=label_1, color=color_1, linewidth=2)
     plt.plot(cumulative_games, cumulative_one_to_one_2, label=label_2, color=color_2, linewidth=2)
-    if(cumulative_0):
+    if(cumulative_0 is not None):
         plt.plot(cumulative_games, cumulative_0, label='Zeros', color='green', linewidth=2)
     plt.xlabel("Total Games Played")
     plt.ylabel("Cumulative Count")
@@ -318,6 +302,54 @@ def plot_dozen_accumulation(cumulative_games:list[int],cumulative_dozen_1:list[i
     img_buffer.seek(0)  # Rewind buffer to start
     return img_buffer
 
+def roulette_category_groups(roulette_numbers_colors:dict[str,str]) -> dict[str,dict[str,list[int]]]:
+    # 0 belongs to no column, dozen, half, parity or color, so it never breaks a streak of those
+    numbers:range = range(1,37)
+    return {
+        "Columns":{
+            "Column 1":[number for number in numbers if number%3 == 1],
+            "Column 2":[number for number in numbers if number%3 == 2],
+            "Column 3":[number for number in numbers if number%3 == 0],
+        },
+        "Dozens":{"1-12":list(range(1,13)),"13-24":list(range(13,25)),"25-36":list(range(25,37))},
+        "Halves":{"1-18":list(range(1,19)),"19-36":list(range(19,37))},
+        "Parity":{"Even":[number for number in numbers if number%2 == 0],"Odd":[number for number in numbers if number%2 == 1]},
+        "Colors":{
+            "Red":[number for number in range(37) if roulette_numbers_colors[str(number)] == "Red"],
+            "Black":[number for number in range(37) if roulette_numbers_colors[str(number)] == "Black"],
+        },
+        "Zeros":{"0":[0],"1-36":list(numbers)},
+    }
+
+# Cumulative counts drawn in the trend plots, in the order their columns are kept
+PLOTTED_CATEGORIES:list[str] = ["Red","Black","0","1-18","19-36","Even","Odd","1-12","13-24","25-36","Column 1","Column 2","Column 3"]
+
+def layout_comparison_table(names:list[str],layouts:list[Roulette_Layout],pockets:ndarray,minimum_nonce:int) -> DataFrame:
+    """
+    RTP, net result, round outcomes, biggest streaks and max drawdown of every layout, all played on the same spins.
+    """
+    comparison:dict[str,ndarray] = compare_layouts(layouts,pockets,minimum_nonce)
+    return DataFrame({
+        "Layout":names,
+        "Total Wager (Round)":[layout.round_bettings for layout in layouts],
+        "Theoretical Return to Player (RTP)":[layout.return_to_player()*100 for layout in layouts],
+        "Return to Player (RTP)":comparison["won"]/comparison["wagered"]*100,
+        "Total Money Wagered":comparison["wagered"],
+        "Gross Winnings":comparison["won"],
+        "Net Result":comparison["won"]-comparison["wagered"],
+        "Wins":comparison["wins"],
+        "Partial Losses":comparison["partial_losses"],
+        "Total Losses":comparison["total_losses"],
+        "Biggest Winning Streak":comparison["biggest_winning_streaks"],
+        "Biggest Losing Streak":comparison["biggest_losing_streaks"],
+        "Max Drawdown":comparison["max_drawdowns"],
+    })
+
+def parse_layouts() -> str|None:
+    parser:argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--layouts",default=None,help="JSON file with a list of bet layouts to compare on the same spins instead of playing the Configuration.json bets")
+    return parser.parse_known_args()[0].layouts
+
 def main():
     # Get the path to the folder this script is in
     BASE_DIR:str = os.path.dirname(os.path.abspath(__file__))
@@ -332,328 +364,125 @@ def main():
         server:str = configuration["ServerSeed"]
         server_hashed:str = sha256_encrypt(server)
         client:str = configuration["ClientSeed"]
-        nonces:list[int] = list(range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1))
+        nonces:range = range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1)
         single_number_bets:dict[str,float|int] = configuration["SingleNumberBets"]
         vertical_column_bets:dict[str,float|int] = configuration["VerticalColumnBets"]
         dozen_bets:dict[str,float|int] = configuration["DozenBets"]
         one_to_one_bets:dict[str,float|int] = configuration["OnetoOneBets"]
         roulette_numbers_colors:dict[str,str] = configuration["RouletteColors"]
         balance:float = 1_000_000
-        cumulative_balance:list[float] = []
-
-        results:list[list[float|int]] = []
-        current_result:list[int] = []
-
-        biggest_winning_streak:tuple[int,int] = (0,0)
-        biggest_losing_streak:tuple[int,int] = (0,0)
 
-        current_winning_streak:int = 0
-        current_losing_streak:int = 0
+        # A round only depends on the pocket it lands on, so the whole layout is worked out once per pocket
+        layout:Roulette_Layout = compile_layout(configuration)
+        round_bettings:float = layout.round_bettings
+        pocket_winnings:list[float] = layout.payouts
+        winnings_table:ndarray = layout.payout_vector
+        wins_table:ndarray = layout.wins
+        colors_table:ndarray = array([roulette_numbers_colors[str(pocket)] for pocket in range(37)],dtype=object)
+        categories:Category_Table = Category_Table(roulette_category_groups(roulette_numbers_colors),37)
+        plotted_columns:list[int] = [categories.names.index(name) for name in PLOTTED_CATEGORIES]
+
+        # Layouts to compare are compiled before any spin is decoded, so a bad layout is refused straight away
+        layouts_path:str|None = parse_layouts()
+        if(layouts_path is not None):
+            with open(layouts_path,"rb") as file:
+                names,layouts = compile_layouts(configuration,json.load(file))
+
+        # Every pocket is decoded up front, one byte per spin, because whether the money columns hold
+        # whole numbers depends on which pockets come up anywhere in the range
+        with Shared_Result_Columns(nonces[0],nonces[-1],dtypes={"outcome":dtype(int8)}) as result_columns:
+            summary:Shard_Summary = run_sharded_columns(
+                simulate_nonce_range,result_columns,workers=parse_workers(),
+                server_seed=server,client_seed=client,wins_table=wins_table,**parse_digest_options()
+            )
+            pockets:ndarray = result_columns["outcome"].copy()
+        if(layouts_path is not None):
+            layout_comparison_table(names,layouts,pockets,nonces[0]).to_csv(os.path.join(BASE_DIR,f"ROULETTE_LAYOUTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv"),index=False)
+            sys.exit(0)
+        pocket_counts:ndarray = bincount(pockets,minlength=37)
+        whole_winnings:bool = not any(isinstance(pocket_winnings[pocket],float) for pocket in flatnonzero(pocket_counts).tolist())
+        winnings_type = int64 if whole_winnings else float64
+        balance_type = int64 if whole_winnings and not isinstance(round_bettings,float) else float64
 
-        winning_streaks:list[int] = []
-        losing_streaks:list[int] = []
-
-        total_number_of_wins:int = 0
-        total_number_of_losses:int = 0
-
-        total_games_played:int = 0
         total_money_bet:float = 0
-        cumulative_games:list[int] = []
-
         money_won:float = 0
-        round_winnings:float = 0
-        round_bettings:float = 0
-        num_games_with_net_profit:int = 0
-        num_games_without_total_loss:int = 0
-        num_games_with_total_loss:int = 0
-
-        num_0:int = 0
-        biggest_0_streak:int = 0
-        current_0_streak:int = 0
-        cumulative_0:list[int] = []
-
-        num_1_to_12:int = 0
-        biggest_1_to_12_streak:int = 0
-        current_1_to_12_streak:int = 0
-        cumulative_1_to_12:list[int] = []
-
-        num_13_to_24:int = 0
-        biggest_13_to_24_streak:int = 0
-        current_13_to_24_streak:int = 0
-        cumulative_13_to_24:list[int] = []
-        
-        num_25_to_36:int = 0
-        biggest_25_to_36_streak:int = 0
-        current_25_to_36_streak:int = 0
-        cumulative_25_to_36:list[int] = []
-
-        num_column_1:int = 0
-        biggest_column_1_streak:int = 0
-        current_column_1_streak:int = 0
-        cumulative_column_1:list[int] = []
-
-        num_column_2:int = 0
-        biggest_column_2_streak:int = 0
-        current_column_2_streak:int = 0
-        cumulative_column_2:list[int] = []
-
-        num_column_3:int = 0
-        biggest_column_3_streak:int = 0
-        current_column_3_streak:int = 0
-        cumulative_column_3:list[int] = []
-
-        num_1_to_18:int = 0
-        biggest_1_to_18_streak:int = 0
-        current_1_to_18_streak:int = 0
-        cumulative_1_to_18:list[int] = []
-
-        num_19_to_36:int = 0
-        biggest_19_to_36_streak:int = 0
-        current_19_to_36_streak:int = 0
-        cumulative_19_to_36:list[int] = []
-
-        num_evens:int = 0
-        biggest_even_streak:int = 0
-        current_even_streak:int = 0
-        cumulative_evens:list[int] = []
-
-        num_odds:int = 0
-        biggest_odd_streak:int = 0
-        current_odd_streak:int = 0
-        cumulative_odds:list[int] = []
-
-        num_red:int = 0
-        biggest_red_streak:int = 0
-        current_red_streak:int = 0
-        num_black:int = 0
-        cumulative_reds:list[int] = []
-
-        biggest_black_streak:int = 0
-        current_black_streak:int = 0
-        cumulative_blacks:list[int] = []
-
-        num_single_number_bets_hit:int = 0
-        single_number_occurrences:dict[int,int] = {}
-        for key in range(37):
-            single_number_occurrences[key] = 0
-
-        nonces_with_result_0:list[int] = []
-
-    for nonce in nonces:
-        total_games_played += 1
-        cumulative_games.append(total_games_played)
-        current_result = [server,client,nonce]
-        seed_result = seeds_to_results(server_seed=server,client_seed=client,nonce=nonce)
-        single_number_occurrences[seed_result] += 1
-        
-        round_winnings:float = 0
-        round_bettings:float = 0
-        round_bettings += sum(list(single_number_bets.values()))
-        round_bettings += sum(list(vertical_column_bets.values()))
-        round_bettings += sum(list(dozen_bets.values()))
-        round_bettings += sum(list(one_to_one_bets.values()))
-        total_money_bet += round_bettings
-        balance -= round_bettings
-
-        # Declaring which column of the roulette table the result lies (Zero Excluded)
-        if(seed_result%3==1):
-            num_column_1 += 1
-            current_column_1_streak += 1
-            if(current_column_2_streak > biggest_column_2_streak):
-                biggest_column_2_streak = current_column_2_streak
-            current_column_2_streak = 0
-            if(current_column_3_streak > biggest_column_3_streak):
-                biggest_column_3_streak = current_column_3_streak
-            current_column_3_streak = 0
-        elif(seed_result%3==2):
-            num_column_2 += 1
-            current_column_2_streak += 1
-            if(current_column_1_streak > biggest_column_1_streak):
-                biggest_column_1_streak = current_column_1_streak
-            current_column_1_streak = 0
-            if(current_column_3_streak > biggest_column_3_streak):
-                biggest_column_3_streak = current_column_3_streak
-            current_column_3_streak = 0
-        elif((seed_result%3==0)and(seed_result>0)):
-            num_column_3 += 1
-            current_column_3_streak += 1
-            if(current_column_2_streak > biggest_column_2_streak):
-                biggest_column_2_streak = current_column_2_streak
-            current_column_2_streak = 0
-            if(current_column_1_streak > biggest_column_1_streak):
-                biggest_column_1_streak = current_column_1_streak
-            current_column_1_streak = 0
-        cumulative_column_1.append(num_column_1)
-        cumulative_column_2.append(num_column_2)
-        cumulative_column_3.append(num_column_3)
-
-        # Declare which dozen the result lies (Zero Excluded)
-        if(seed_result>=1 and seed_result<=12):
-            num_1_to_12 += 1
-            current_1_to_12_streak += 1
-            if(current_13_to_24_streak > biggest_13_to_24_streak):
-                biggest_13_to_24_streak = current_13_to_24_streak
-            current_13_to_24_streak = 0
-            if(current_25_to_36_streak > biggest_25_to_36_streak):
-                biggest_25_to_36_streak = current_25_to_36_streak
-            current_25_to_36_streak = 0
-        elif(seed_result>=13 and seed_result<=24):
-            num_13_to_24 += 1
-            current_13_to_24_streak += 1
-            if(current_1_to_12_streak > biggest_1_to_12_streak):
-                biggest_1_to_12_streak = current_1_to_12_streak
-            current_1_to_12_streak = 0
-            if(current_25_to_36_streak > biggest_25_to_36_streak):
-                biggest_25_to_36_streak = current_25_to_36_streak
-            current_25_to_36_streak = 0
-        elif(seed_result>=25 and seed_result<=36):
-            num_25_to_36 += 1
-            current_25_to_36_streak += 1
-            if(current_13_to_24_streak > biggest_13_to_24_streak):
-                biggest_13_to_24_streak = current_13_to_24_streak
-            current_13_to_24_streak = 0
-            if(current_1_to_12_streak > biggest_1_to_12_streak):
-                biggest_1_to_12_streak = current_1_to_12_streak
-            current_1_to_12_streak = 0
-        cumulative_1_to_12.append(num_1_to_12)
-        cumulative_13_to_24.append(num_13_to_24)
-        cumulative_25_to_36.append(num_25_to_36)
-
-        # Declare which half of numbers the result lies (Zero excluded)
-        if(seed_result>=1 and seed_result<=18):
-            num_1_to_18 += 1
-            current_1_to_18_streak += 1
-            if(current_19_to_36_streak > biggest_19_to_36_streak):
-                biggest_19_to_36_streak = current_19_to_36_streak
-            current_19_to_36_streak = 0
-        elif(seed_result>=19 and seed_result<=36):
-            num_19_to_36 += 1
-            current_19_to_36_streak += 1
-            if(current_1_to_18_streak > biggest_1_to_18_streak):
-                biggest_1_to_18_streak = current_1_to_18_streak
-            current_1_to_18_streak = 0
-        cumulative_1_to_18.append(num_1_to_18)
-        cumulative_19_to_36.append(num_19_to_36)
-
-        # Declare if the result is even or odd (Zero is excluded)
-        if((seed_result>0)and(seed_result%2==0)):
-            num_evens += 1
-            current_even_streak += 1
-            if(current_odd_streak > biggest_odd_streak):
-                biggest_odd_streak = current_odd_streak
-            current_odd_streak = 0
-        elif(seed_result%2==1):
-            num_odds += 1
-            current_odd_streak += 1
-            if(current_even_streak > biggest_even_streak):
-                biggest_even_streak = current_even_streak
-            current_even_streak = 0
-        cumulative_evens.append(num_evens)
-        cumulative_odds.append(num_odds)
-
-        # Declare which color the result is (Green Zero Excluded)
-        if(roulette_numbers_colors[str(seed_result)]=='Black'):
-            num_black += 1
-            current_black_streak += 1
-            if(current_red_streak > biggest_red_streak):
-                biggest_red_streak = current_red_streak
-            current_red_streak = 0
-        elif(roulette_numbers_colors[str(seed_result)]=="Red"):
-            num_red += 1
-            current_red_streak += 1
-            if(current_black_streak > biggest_black_streak):
-                biggest_black_streak = current_black_streak
-            current_black_streak = 0
-        cumulative_blacks.append(num_black)
-        cumulative_reds.append(num_red)
-        
-        # Checking if result is 0 and adding it to analysis statistics
-        if(seed_result==0):
-            num_0 += 1
-            current_0_streak += 1
-            nonces_with_result_0.append(f"{nonce:,.0f}")
-        else:
-            if(current_0_streak > biggest_0_streak):
-                biggest_0_streak = current_0_streak
-            current_0_streak = 0
-        cumulative_0.append(num_0)
-
-        # Check if a single number bet was placed and won
-        round_winnings += single_number_bets[str(seed_result)]*36 # Multiplier is 36 since initial bet is deducted from the balance and then reimbursed. Net gains is still x35 bet size. Same rule applies to all future bets and multipliers below
-        if(round_winnings>0):
-            num_single_number_bets_hit += 1
-
-        # Run conditions and add winnings for any result that is not zero
-        if(seed_result > 0):
-            # Add winnings for betting on the column the result lies
-            round_winnings += vertical_column_bets[str(seed_result%3)]*3
-
-            # Add winnings for betting on the correct dozen the result lies
-            if((seed_result >= 1)and(seed_result <= 12)):
-                round_winnings += dozen_bets["1-12"]*3
-            elif((seed_result >= 13)and(seed_result <= 25)):
-                round_winnings += dozen_bets["13-24"]*3
-            else:
-                round_winnings += dozen_bets["25-36"]*3
-
-            # Add winnings for betting 1-18 or 19-36 and winning
-            if(seed_result<=18):
-                round_winnings += one_to_one_bets["1-18"]*2
-            else:
-                round_winnings += one_to_one_bets["19-36"]*2
-
-            # Add winnings for betting even or odd and winning
-            if(seed_result%2==0):
-                round_winnings += one_to_one_bets["Even"]*2
-            else:
-                round_winnings += one_to_one_bets["Odd"]*2
-
-            # Add winnings for betting red or black and winning. "Else" works because we checked at the top if the result is greater than 0
-            if(roulette_numbers_colors[str(seed_result)]=='Red'):
-                round_winnings += one_to_one_bets["Red"]*2
-            else:
-                round_winnings += one_to_one_bets["Black"]*2
-
-        # Begin analyzing this round's winnings
-        # Check if player won more than they bet on the table
-        if(round_winnings > round_bettings):
-            num_games_with_net_profit += 1
-            total_number_of_wins += 1
-            current_winning_streak += 1
-            if(current_losing_streak > biggest_losing_streak[1]):
-                biggest_losing_streak = (nonce-current_losing_streak,current_losing_streak)
-            if(current_losing_streak>0):
-                losing_streaks.append(current_losing_streak)
-            current_losing_streak = 0
-        # Check if player lost some money on the table, but not everything
-        elif((round_bettings >= round_winnings) and (round_winnings>0)):
-            num_games_without_total_loss += 1
-            total_number_of_losses += 1
-            current_losing_streak += 1
-            if(current_winning_streak > biggest_winning_streak[1]):
-                biggest_winning_streak = (nonce-current_winning_streak,current_winning_streak)
-            if(current_winning_streak>0):
-                winning_streaks.append(current_winning_streak)
-            current_winning_streak = 0
-        # Player did not win any of their bets placed
-        else:
-            current_losing_streak += 1
-            num_games_with_total_loss += 1
-            total_number_of_losses += 1
-            if(current_winning_streak > biggest_winning_streak[1]):
-                biggest_winning_streak = (nonce-current_winning_streak,current_winning_streak)
-            if(current_winning_streak>0):
-                winning_streaks.append(current_winning_streak)
-            current_winning_streak = 0
-        
-        money_won += round_winnings
-        balance += round_winnings
-
-        cumulative_balance.append(balance)
-        current_result.extend([seed_result,balance,round_bettings,round_winnings,roulette_numbers_colors[str(seed_result)]])
-        results.append(current_result)
-    DataFrame(results,columns=["Server Seed","Client Seed","Nonce","Result","Balance","Total Wager (Round)","Gross Winnings (Round)","Color"]).to_csv(os.path.join(BASE_DIR,f"ROULETTE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv"),index=False)
-    DataFrame(results,columns=["Server Seed","Client Seed","Nonce","Result","Balance","Total Wager (Round)","Gross Winnings (Round)","Color"]).to_json(os.path.join(BASE_DIR,f"ROULETTE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.json"),orient='table',indent=4)
+        nonces_with_result_0:list[str] = []
+        category_series:Plot_Series = Plot_Series(len(nonces))
+        balance_series:Plot_Series = Plot_Series(len(nonces))
+
+    def frames():
+        nonlocal total_money_bet,money_won,balance
+        for low in range(0,len(nonces),BLOCK_SIZE):
+            high:int = min(low+BLOCK_SIZE,len(nonces))
+            block_pockets:ndarray = pockets[low:high].astype(int64)
+            block_nonces:ndarray = arange(nonces[low],nonces[high-1]+1)
+            games:ndarray = arange(low+1,high+1)
+            round_winnings:ndarray = winnings_table[block_pockets].astype(winnings_type)
+
+            # Each round takes the bets off the balance, then pays the winnings, one after the other as in a loop
+            balance_changes:ndarray = empty(2*len(block_pockets),dtype=balance_type)
+            balance_changes[0::2] = -round_bettings
+            balance_changes[1::2] = round_winnings
+            balances:ndarray = running_total(balance,balance_changes)[1::2]
+            balance = balances[-1].item()
+            total_money_bet = running_total(total_money_bet,full(len(block_pockets),round_bettings))[-1].item()
+            money_won = running_total(money_won,round_winnings)[-1].item()
+
+            category_series.add(games,categories.add(block_pockets)[:,plotted_columns])
+            balance_series.add(games,balances)
+            nonces_with_result_0.extend(f"{nonce:,.0f}" for nonce in block_nonces[block_pockets == 0][:10-len(nonces_with_result_0)].tolist())
+            yield DataFrame({
+                "Server Seed":server,
+                "Client Seed":client,
+                "Nonce":block_nonces,
+                "Result":block_pockets,
+                "Balance":balances,
+                "Total Wager (Round)":round_bettings,
+                "Gross Winnings (Round)":round_winnings,
+                "Color":colors_table[block_pockets],
+            },index=RangeIndex(low,high))
+
+    write_result_frames(
+        frames(),
+        os.path.join(BASE_DIR,f"ROULETTE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv"),
+        os.path.join(BASE_DIR,f"ROULETTE_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.json"),
+        RESULT_COLUMNS,csv_index=False
+    )
+
+    if(True):
+        total_games_played:int = summary.games
+        total_number_of_wins:int = summary.wins
+        total_number_of_losses:int = summary.losses
+        biggest_winning_streak:tuple[int,int] = summary.biggest_streaks[True]
+        biggest_losing_streak:tuple[int,int] = summary.biggest_streaks[False]
+        winning_streaks:dict[str,float] = streak_statistics(summary.streak_sizes[True])
+        losing_streaks:dict[str,float] = streak_statistics(summary.streak_sizes[False])
+
+        # Round outcomes and single number hits come straight from how often each pocket came up
+        num_games_without_total_loss:int = int(pocket_counts[layout.partial_losses].sum())
+        num_games_with_total_loss:int = total_number_of_losses-num_games_without_total_loss
+        num_single_number_bets_hit:int = int(pocket_counts[[single_number_bets[str(pocket)]*36 > 0 for pocket in range(37)]].sum())
+        single_number_occurrences:dict[int,int] = {pocket:count for pocket,count in enumerate(pocket_counts.tolist())}
+
+        num_0,biggest_0_streak = categories.count("0"),categories.biggest_streak("0")
+        num_1_to_12,biggest_1_to_12_streak = categories.count("1-12"),categories.biggest_streak("1-12")
+        num_13_to_24,biggest_13_to_24_streak = categories.count("13-24"),categories.biggest_streak("13-24")
+        num_25_to_36,biggest_25_to_36_streak = categories.count("25-36"),categories.biggest_streak("25-36")
+        num_column_1,biggest_column_1_streak = categories.count("Column 1"),categories.biggest_streak("Column 1")
+        num_column_2,biggest_column_2_streak = categories.count("Column 2"),categories.biggest_streak("Column 2")
+        num_column_3,biggest_column_3_streak = categories.count("Column 3"),categories.biggest_streak("Column 3")
+        num_1_to_18,biggest_1_to_18_streak = categories.count("1-18"),categories.biggest_streak("1-18")
+        num_19_to_36,biggest_19_to_36_streak = categories.count("19-36"),categories.biggest_streak("19-36")
+        num_evens,biggest_even_streak = categories.count("Even"),categories.biggest_streak("Even")
+        num_odds,biggest_odd_streak = categories.count("Odd"),categories.biggest_streak("Odd")
+        num_red,biggest_red_streak = categories.count("Red"),categories.biggest_streak("Red")
+        num_black,biggest_black_streak = categories.count("Black"),categories.biggest_streak("Black")
+
+        cumulative_games,cumulative_counts = category_series.points()
+        (cumulative_reds,cumulative_blacks,cumulative_0,cumulative_1_to_18,cumulative_19_to_36,cumulative_evens,cumulative_odds,
+            cumulative_1_to_12,cumulative_13_to_24,cumulative_25_to_36,cumulative_column_1,cumulative_column_2,cumulative_column_3) = cumulative_counts.T
+        balance_games,cumulative_balance = balance_series.points()
+
     analysis_data:dict[str,int|float|str] = {
         "summary":f"""Server Seed: {server}
 Server Seed (Hashed): {server_hashed}
@@ -666,26 +495,26 @@ Number of Total Losses: {num_games_with_total_loss:,.0f}
 Total Money Wagered: ${total_money_bet:,.2f}
 Gross Winnings: ${money_won:,.2f}
 Net Winnings: ${abs(total_money_bet-money_won):,.2f} {"won" if money_won-total_money_bet>0 else "lost"}
-Theoretical House Edge: 2.70%
-Theoretical Return to Player (RTP): 97.30%
+Theoretical House Edge: {(1-layout.return_to_player())*100:,.2f}%
+Theoretical Return to Player (RTP): {layout.return_to_player()*100:,.2f}%
 Actual House Edge: {(1-(money_won/total_money_bet))*100:,.2f}%
 Return to Player (RTP): {(money_won/total_money_bet)*100:,.2f}%""",
 
         "winning_losing_streaks":f"""Biggest Winning Streak: {biggest_winning_streak[1]:,.0f}
 Starting Nonce of Biggest Winning Streak: {biggest_winning_streak[0]:,.0f}
-Mean Winning Streak: {mean(winning_streaks):,.3f}
-Median Winning Streak: {median(winning_streaks):,.1f}
+Mean Winning Streak: {winning_streaks['Mean']:,.3f}
+Median Winning Streak: {winning_streaks['Median']:,.1f}
 Statistical Summary of Winning Streaks:
 \tMin\t\t|\t\t25%\t\t|\t\t50%\t\t|\t\t75%\t\t|\t\t95%\t\t|\t\t99%\t\t|\t\tMax
-\t{min(winning_streaks):,.0f}\t\t|\t\t{quantile(winning_streaks,0.25):,.0f}\t\t|\t\t{median(winning_streaks):,.0f}\t\t|\t\t{quantile(winning_streaks,0.75):,.0f}\t\t|\t\t{quantile(winning_streaks,0.95):,.0f}\t\t|\t\t{quantile(winning_streaks,0.99):,.0f}\t\t|\t\t{max(winning_streaks):,.0f}
+\t{winning_streaks['Min']:,.0f}\t\t|\t\t{winning_streaks['25%']:,.0f}\t\t|\t\t{winning_streaks['50%']:,.0f}\t\t|\t\t{winning_streaks['75%']:,.0f}\t\t|\t\t{winning_streaks['95%']:,.0f}\t\t|\t\t{winning_streaks['99%']:,.0f}\t\t|\t\t{winning_streaks['Max']:,.0f}
 {'-'*120}
 Biggest Losing Streak: {biggest_losing_streak[1]:,.0f}
 Starting Nonce of Biggest Losing Streak: {biggest_losing_streak[0]:,.0f}
-Mean Losing Streak: {mean(losing_streaks):,.3f}
-Median Losing Streak: {median(losing_streaks):,.1f}
+Mean Losing Streak: {losing_streaks['Mean']:,.3f}
+Median Losing Streak: {losing_streaks['Median']:,.1f}
 Statistical Summary of Losing Streaks:
 \tMin\t\t|\t\t25%\t\t|\t\t50%\t\t|\t\t75%\t\t|\t\t95%\t\t|\t\t99%\t\t|\t\tMax
-\t{min(losing_streaks):,.0f}\t\t|\t\t{quantile(losing_streaks,0.25):,.0f}\t\t|\t\t{median(losing_streaks):,.0f}\t\t|\t\t{quantile(losing_streaks,0.75):,.0f}\t\t|\t\t{quantile(losing_streaks,0.95):,.0f}\t\t|\t\t{quantile(losing_streaks,0.99):,.0f}\t\t|\t\t{max(losing_streaks):,.0f}""",
+\t{losing_streaks['Min']:,.0f}\t\t|\t\t{losing_streaks['25%']:,.0f}\t\t|\t\t{losing_streaks['50%']:,.0f}\t\t|\t\t{losing_streaks['75%']:,.0f}\t\t|\t\t{losing_streaks['95%']:,.0f}\t\t|\t\t{losing_streaks['99%']:,.0f}\t\t|\t\t{losing_streaks['Max']:,.0f}""",
 
         "single_bets":f"""Number of Single Bets Won: {num_single_number_bets_hit:,.0f}""",
 
@@ -818,7 +647,7 @@ Largest Streak of Zeros: {biggest_0_streak:,.0f}
 Money Wagered on Zeros: ${single_number_bets['0']*total_games_played:,.2f}
 Gross Winnings on Zeros: ${single_number_bets['0']*num_0*36:,.2f}
 Net Winnings on Zeros: ${abs((single_number_bets['0']*total_games_played)-(single_number_bets['0']*num_0*36)):,.2f} {"won" if (single_number_bets['0']*num_0*36)-(single_number_bets['0']*total_games_played)>0 else "lost"}
-Number of 0's: {len(nonces_with_result_0):,.0f}
+Number of 0's: {num_0:,.0f}
 First 10 Nonces Resulting in 0: {"|".join(nonces_with_result_0[:10])}"""
     }
 
@@ -829,7 +658,7 @@ First 10 Nonces Resulting in 0: {"|".join(nonces_with_result_0[:10])}"""
     img_buffer_vertical_columns:BytesIO = plot_dozen_accumulation(cumulative_games,cumulative_column_1,cumulative_column_2,cumulative_column_3,'Column 1','Column 2','Column 3','pink','blue','green',title='Vertical Outcomes Over Time')
     if(True): # Cumulative Balance Over Time
         plt.figure(figsize=(10, 6))
-        plt.plot(cumulative_games, cumulative_balance, label="Balance", color="blue", linewidth=2)
+        plt.plot(balance_games, cumulative_balance, label="Balance", color="blue", linewidth=2)
         plt.xlabel("Total Games Played")
         plt.ylabel("Cumulative Balance")
         plt.title("Cumulative Balance Over Time")
@@ -1,12 +1,13 @@
 import os
-import hmac
-import hashlib
+import sys
 import random
 import string
-from math import floor
 import json
 from pandas import DataFrame
 from Multipliers import wheel_multipliers
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Provably_Fair import Byte_Cursor,sha256_encrypt
+from Provably_Fair.Shard_Runner import Shard_Summary,parse_workers,run_sharded
 
 def generate_server_seed():
     possible_characters:str = string.hexdigits
@@ -18,53 +19,21 @@ def generate_client_seed():
     seed:str = "".join([random.choice(possible_characters) for _ in range(20)])
     return seed
 
-def sha256_encrypt(input_string: str) -> str:
-    # Create a sha256 hash object
-    sha256_hash = hashlib.sha256()
-    
-    # Update the hash object with the bytes of the input string
-    sha256_hash.update(input_string.encode('utf-8'))
-    
-    # Return the hexadecimal representation of the hash
-    return sha256_hash.hexdigest()
-
-def seeds_to_hexadecimals(server_seed:str,client_seed:str,nonce:int) -> list[str]:
-    messages:list[str] = [f"{client_seed}:{nonce}:{x}" for x in range(1)]
-    hmac_objs:list[hmac.HMAC] = [hmac.new(server_seed.encode(),message.encode(),hashlib.sha256) for message in messages]
-    return [hmac_obj.hexdigest() for hmac_obj in hmac_objs]
-
-def hexadecimal_to_bytes(hexadecimal:str) -> list[int]:
-    return list(bytes.fromhex(hexadecimal))
-
-def bytes_to_basic_number(bytes_list: list[int]) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float = ((float(bytes_list[0]) / float(256**1)) +
-              (float(bytes_list[1]) / float(256**2)) +
-              (float(bytes_list[2]) / float(256**3)) +
-              (float(bytes_list[3]) / float(256**4)))
-    return number
-
-def bytes_to_number(bytes_list: list[int],multiplier:int) -> int:
-    # Calculate a weighted index based on the first four bytes
-    number:float =  (
-                        (float(bytes_list[0]) / float(256**1)) +
-                        (float(bytes_list[1]) / float(256**2)) +
-                        (float(bytes_list[2]) / float(256**3)) +
-                        (float(bytes_list[3]) / float(256**4))
-                    )
-    number = number*multiplier
-    return floor(number)
-
 def seeds_to_results(server_seed:str,client_seed:str,nonce:int,risk:str,segments:int) -> float:
-    hexs = seeds_to_hexadecimals(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
-    bytes_lists:list[list[int]] = [hexadecimal_to_bytes(current_hex) for current_hex in hexs]
-    row:list[list[int]] = []
-    for bytes_list in bytes_lists:
-        for index in range(0,len(bytes_list),4):
-            row.append(bytes_to_number(bytes_list[index:index+4],segments))
-            if(len(row)==1):
-                prize_index:int = floor(row[0])
-                return wheel_multipliers[f"{risk}{segments}"][prize_index]
+    cursor:Byte_Cursor = Byte_Cursor(server_seed=server_seed,client_seed=client_seed,nonce=nonce)
+    prize_index:int = cursor.next_number(segments)
+    return wheel_multipliers[f"{risk}{segments}"][prize_index]
+
+def simulate_nonce_range(server_seed:str,client_seed:str,minimum_nonce:int,maximum_nonce:int,risk:str,segments:int) -> Shard_Summary:
+    summary:Shard_Summary = Shard_Summary(minimum_nonce)
+    for nonce in range(minimum_nonce,maximum_nonce+1):
+        seed_result = seeds_to_results(server_seed=server_seed,client_seed=client_seed,nonce=nonce,risk=risk,segments=segments)
+        if(seed_result < 1):
+            summary.add(nonce=nonce,win=False)
+        else:
+            summary.add(nonce=nonce,win=True,payout=seed_result)
+            summary.nonce_lists["winning_nonces"].append(f"{nonce:,.0f}")
+    return summary
 
 if __name__ == "__main__":
     # Get the path to the folder this script is in
@@ -78,50 +47,23 @@ if __name__ == "__main__":
     server:str = configuration["ServerSeed"]
     server_hashed:str = sha256_encrypt(server)
     client:str = configuration["ClientSeed"]
-    nonces:list[int] = list(range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1))
+    nonces:range = range(configuration["MinimumNonce"],configuration["MaximumNonce"]+1)
     risk:str = configuration["Risk"]
     num_segments:int = configuration["Segments"]
     bet_size:float = configuration["BetSize"]
 
-    results:list[list[float|int]] = []
-    current_result:list[int] = []
+    summary:Shard_Summary = run_sharded(simulate_nonce_range,nonces[0],nonces[-1],workers=parse_workers(),server_seed=server,client_seed=client,risk=risk,segments=num_segments)
     losing_streaks:dict[int,int] = {}
     for streak in range(1,1000):
-        losing_streaks[streak] = 0
-
-    biggest_winning_streak:tuple[int,int] = (0,0)
-    biggest_losing_streak:tuple[int,int] = (0,0)
-    current_winning_streak:int = 0
-    current_losing_streak:int = 0
-    total_number_of_wins:int = 0
-    total_number_of_losses:int = 0
-    total_games_played:int = 0
-    money_won:float = 0
-    winning_nonces:list[int] = []
+        losing_streaks[streak] = summary.streak_sizes[False][streak]
 
-    for nonce in nonces:
-        total_games_played += 1
-        current_result = [server,client,nonce]
-        seed_result = seeds_to_results(server_seed=server,client_seed=client,nonce=nonce,risk=risk,segments=num_segments)
-        if(seed_result < 1):
-            if(current_winning_streak > biggest_winning_streak[1]):
-                biggest_winning_streak = (nonce-current_winning_streak,current_winning_streak)
-            current_winning_streak = 0
-            current_losing_streak += 1
-            total_number_of_losses +=1
-            current_result.extend([seed_result,"NO"])
-        else:
-            if(current_losing_streak > biggest_losing_streak[1]):
-                biggest_losing_streak = (nonce-current_losing_streak,current_losing_streak)
-            if(current_losing_streak>0):
-                losing_streaks[current_losing_streak] += 1
-            current_losing_streak = 0
-            current_winning_streak += 1
-            total_number_of_wins += 1
-            money_won += (bet_size*seed_result)
-            current_result.extend([seed_result,"YES"])
-            winning_nonces.append(f"{nonce:,.0f}")
-        results.append(current_result)
+    biggest_winning_streak:tuple[int,int] = summary.biggest_streaks[True]
+    biggest_losing_streak:tuple[int,int] = summary.biggest_streaks[False]
+    total_number_of_wins:int = summary.wins
+    total_number_of_losses:int = summary.losses
+    total_games_played:int = summary.games
+    money_won:float = summary.money_won(bet_size)
+    winning_nonces:list[str] = summary.nonce_lists["winning_nonces"]
     # DataFrame(results,columns=["Server Seed","Client Seed","Nonce","Result","Win"]).to_csv(f"WHEEL_RESULTS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.csv",index=False)
     with open(f"WHEEL_RESULTS_ANALYSIS_{server}_{client}_{nonces[0]}_to_{nonces[-1]}.txt","w") as file:
         losing_streaks_string:str = ""